@@ -1,7 +1,11 @@
 """Advanced PCB analysis using KiCad 9's native functionality."""
 import logging
-import math
+import os
+import pickle
+import numpy as np
 import pcbnew
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
@@ -10,10 +14,13 @@ from ..core.base.base_manager import BaseManager
 from ..core.base.results.manager_result import ManagerResult, ManagerOperation, ManagerStatus
 from ..config.analysis_manager_config import AnalysisManagerConfig
 from ..audio.analysis.advanced_audio_analyzer import AdvancedAudioAnalyzer
+from ..core.board.snapshot import BoardSnapshot
+from ..core.board.spatial_index import ITEM_FOOTPRINT
 
 if TYPE_CHECKING:
     from ..core.base.results.analysis_result import AnalysisResult as BaseAnalysisResult
 
+
 class AnalysisType(Enum):
     """Types of PCB analysis."""
     SIGNAL_INTEGRITY = "signal_integrity"
@@ -23,6 +30,7 @@ class AnalysisType(Enum):
     AUDIO_PERFORMANCE = "audio_performance"
     ADVANCED_AUDIO = "advanced_audio"
 
+
 @dataclass
 class AnalysisResult:
     """Results from PCB analysis."""
@@ -34,6 +42,39 @@ class AnalysisResult:
     value: Optional[float] = None
     unit: Optional[str] = None
 
+
+# Snapshot-based analysis families and the methods that run them. They only
+# read the board snapshot and the config sections, so they can run in worker
+# processes.
+ANALYSIS_FAMILIES = {
+    AnalysisType.SIGNAL_INTEGRITY: "analyze_signal_integrity",
+    AnalysisType.THERMAL: "analyze_thermal",
+    AnalysisType.EMI: "analyze_emi",
+    AnalysisType.POWER_DISTRIBUTION: "analyze_power_distribution",
+    AnalysisType.AUDIO_PERFORMANCE: "analyze_audio_performance"
+}
+
+_CONFIG_ATTRIBUTES = (
+    "signal_config", "thermal_config", "emi_config",
+    "power_config", "audio_config", "units_config"
+)
+
+# Per-process manager used by analysis workers
+_worker_manager: Optional["AnalysisManager"] = None
+
+
+def _init_analysis_worker(payload: bytes) -> None:
+    """Unpickle the shared snapshot and configs once per worker process."""
+    global _worker_manager
+    snapshot, configs = pickle.loads(payload)
+    _worker_manager = AnalysisManager._for_snapshot(snapshot, configs)
+
+
+def _run_analysis_family(analysis_type: AnalysisType) -> List[AnalysisResult]:
+    """Run one analysis family in a worker process."""
+    return getattr(_worker_manager, ANALYSIS_FAMILIES[analysis_type])()
+
+
 class AnalysisManager(BaseManager[AnalysisResult]):
     """Manages PCB analysis using KiCad 9's native functionality."""
     
@@ -59,13 +100,8 @@ class AnalysisManager(BaseManager[AnalysisResult]):
         self.audio_config = self.config.get_audio_performance_config() or None
         self.units_config = self.config.get_units_config() or None
         
-        # Performance optimization: Cache board data
-        self._cached_tracks = None
-        self._cached_footprints = None
-        self._cached_tracks_by_layer = None
-        self._cached_power_tracks = None
-        self._cached_audio_tracks = None
-        self._cache_timestamp = 0
+        # Performance optimization: Extract board data once into arrays
+        self._snapshot: Optional[BoardSnapshot] = None
         
         # Advanced analyzer is optional to prevent KiCad import errors in headless CI
         try:
@@ -81,61 +117,32 @@ class AnalysisManager(BaseManager[AnalysisResult]):
             raise RuntimeError(f"This module requires KiCad 9.x, but found version {version}")
         self.logger.info(f"Running with KiCad version: {version}")
     
-    def _get_cached_tracks(self) -> List:
-        """Get cached tracks or fetch from board if cache is invalid."""
-        if self._cached_tracks is None:
-            self._cached_tracks = self.board.GetTracks()
-        return self._cached_tracks
-    
-    def _get_cached_footprints(self) -> List:
-        """Get cached footprints or fetch from board if cache is invalid."""
-        if self._cached_footprints is None:
-            self._cached_footprints = self.board.GetFootprints()
-        return self._cached_footprints
-    
-    def _get_cached_tracks_by_layer(self) -> Dict:
-        """Get cached tracks grouped by layer or create if not cached."""
-        if self._cached_tracks_by_layer is None:
-            tracks = self._get_cached_tracks()
-            self._cached_tracks_by_layer = {}
-            for track in tracks:
-                layer = track.GetLayer()
-                if layer not in self._cached_tracks_by_layer:
-                    self._cached_tracks_by_layer[layer] = []
-                self._cached_tracks_by_layer[layer].append(track)
-        return self._cached_tracks_by_layer
-    
-    def _get_cached_power_tracks(self) -> List:
-        """Get cached power tracks or filter if not cached."""
-        if self._cached_power_tracks is None:
-            tracks = self._get_cached_tracks()
-            self._cached_power_tracks = []
-            for track in tracks:
-                net_name = track.GetNet().GetNetname()
-                if net_name.startswith(("VCC", "VDD", "VSS", "GND")):
-                    self._cached_power_tracks.append(track)
-        return self._cached_power_tracks
-    
-    def _get_cached_audio_tracks(self) -> List:
-        """Get cached audio tracks or filter if not cached."""
-        if self._cached_audio_tracks is None:
-            tracks = self._get_cached_tracks()
-            self._cached_audio_tracks = []
-            for track in tracks:
-                net_name = track.GetNet().GetNetname()
-                if net_name.startswith(("AUDIO", "IN", "OUT")):
-                    self._cached_audio_tracks.append(track)
-        return self._cached_audio_tracks
+    @classmethod
+    def _for_snapshot(cls, snapshot: BoardSnapshot, configs: Dict[str, Any]) -> "AnalysisManager":
+        """Create a board-less manager that analyzes a snapshot (used by workers).
+        
+        Args:
+            snapshot: Board snapshot to analyze
+            configs: Config sections keyed by attribute name
+            
+        Returns:
+            Analysis manager without a live board
+        """
+        manager = cls.__new__(cls)
+        manager.board = None
+        manager.logger = logging.getLogger(__name__)
+        manager._analysis_results = []
+        manager._snapshot = snapshot
+        manager._advanced_analyzer = None
+        for name, value in configs.items():
+            setattr(manager, name, value)
+        return manager
     
-    def _clear_cache(self) -> None:
-        """Clear all caches when board data changes."""
-        self._cached_tracks = None
-        self._cached_footprints = None
-        self._cached_tracks_by_layer = None
-        self._cached_power_tracks = None
-        self._cached_audio_tracks = None
-        self._cache_timestamp = 0
-        super()._clear_cache()
+    def _get_snapshot(self) -> BoardSnapshot:
+        """Get the cached board snapshot or extract it if the cache is invalid."""
+        if self._snapshot is None:
+            self._snapshot = BoardSnapshot.from_board(self.board)
+        return self._snapshot
     
     def analyze_signal_integrity(self) -> List[AnalysisResult]:
         """Analyze signal integrity of the PCB.
@@ -146,52 +153,49 @@ class AnalysisManager(BaseManager[AnalysisResult]):
         results = []
         
         try:
-            # Get all tracks once
-            tracks = self._get_cached_tracks()
+            # Evaluate every rule on the whole track array at once
+            tracks = self._get_snapshot().tracks
+            widths = tracks.width / 1e6  # Convert to mm
+            lengths = tracks.length / 1e6  # Convert to mm
+            angles = self._get_snapshot().track_angles_deg()
+            
+            narrow = widths < self.signal_config.min_width
+            too_long = lengths > self.signal_config.max_length
+            # Sharp angles only apply to straight tracks
+            sharp = ~tracks.is_arc & (angles > self.signal_config.max_angle)
             
-            # Analyze each track with cached properties
-            for track in tracks:
-                # Cache track properties to avoid repeated API calls
-                width = track.GetWidth() / 1e6  # Convert to mm
-                length = track.GetLength() / 1e6  # Convert to mm
-                start_pos = track.GetStart()
-                start_x, start_y = start_pos.x / 1e6, start_pos.y / 1e6
+            for i in np.flatnonzero(narrow | too_long | sharp):
+                location = (tracks.start_x[i] / 1e6, tracks.start_y[i] / 1e6)
                 
-                # Check track width
-                if width < self.signal_config.min_width:
+                if narrow[i]:
                     results.append(AnalysisResult(
                         type=AnalysisType.SIGNAL_INTEGRITY,
                         severity="warning",
-                        message=f"Track width {width:.2f}mm is below recommended minimum",
-                        location=(start_x, start_y),
-                        value=width,
+                        message=f"Track width {widths[i]:.2f}mm is below recommended minimum",
+                        location=location,
+                        value=float(widths[i]),
                         unit="mm"
                     ))
                 
-                # Check track length
-                if length > self.signal_config.max_length:
+                if too_long[i]:
                     results.append(AnalysisResult(
                         type=AnalysisType.SIGNAL_INTEGRITY,
                         severity="warning",
-                        message=f"Track length {length:.2f}mm exceeds recommended maximum",
-                        location=(start_x, start_y),
-                        value=length,
+                        message=f"Track length {lengths[i]:.2f}mm exceeds recommended maximum",
+                        location=location,
+                        value=float(lengths[i]),
                         unit="mm"
                     ))
                 
-                # Check for sharp angles (only for straight tracks)
-                if track.GetShape() == pcbnew.SEG:
-                    end_pos = track.GetEnd()
-                    angle = abs(math.atan2(end_pos.y - start_pos.y, end_pos.x - start_pos.x) * 180 / math.pi)
-                    if angle > self.signal_config.max_angle:
-                        results.append(AnalysisResult(
-                            type=AnalysisType.SIGNAL_INTEGRITY,
-                            severity="warning",
-                            message=f"Track has sharp angle of {angle:.1f} degrees",
-                            location=(start_x, start_y),
-                            value=angle,
-                            unit="degrees"
-                        ))
+                if sharp[i]:
+                    results.append(AnalysisResult(
+                        type=AnalysisType.SIGNAL_INTEGRITY,
+                        severity="warning",
+                        message=f"Track has sharp angle of {angles[i]:.1f} degrees",
+                        location=location,
+                        value=float(angles[i]),
+                        unit="degrees"
+                    ))
             
         except (AttributeError, TypeError) as e:
             self.logger.error(f"Error accessing track properties: {str(e)}")
@@ -226,64 +230,39 @@ class AnalysisManager(BaseManager[AnalysisResult]):
         results = []
         
         try:
-            # Get all footprints once
-            footprints = self._get_cached_footprints()
+            snapshot = self._get_snapshot()
+            footprints = snapshot.footprints
+            has_thermal_pad = snapshot.footprint_pad_max_size() >= 2e6  # 2mm thermal pad
+            footprint_index = snapshot.spatial_index(kinds=(ITEM_FOOTPRINT,), cell_size=5.0)
+            search_radius = 5.0  # 5mm radius
             
-            # Pre-calculate footprint positions for spatial analysis
-            footprint_positions = []
-            for footprint in footprints:
-                pos = footprint.GetPosition()
-                footprint_positions.append({
-                    'footprint': footprint,
-                    'x': pos.x / 1e6,
-                    'y': pos.y / 1e6,
-                    'ref': footprint.GetReference()
-                })
-            
-            # Analyze each component with optimized spatial queries
-            for fp_data in footprint_positions:
-                footprint = fp_data['footprint']
-                
-                # Check for thermal pads (cached pad analysis)
-                has_thermal_pad = False
-                for pad in footprint.Pads():
-                    if pad.GetSize().x >= 2e6:  # 2mm thermal pad
-                        has_thermal_pad = True
-                        break
+            for i, ref in enumerate(footprints.reference):
+                location = (footprints.x[i] / 1e6, footprints.y[i] / 1e6)
                 
-                if not has_thermal_pad and footprint.GetReference().startswith(("U", "Q", "VR")):
+                if not has_thermal_pad[i] and ref.startswith(("U", "Q", "VR")):
                     results.append(AnalysisResult(
                         type=AnalysisType.THERMAL,
                         severity="warning",
-                        message=f"Component {footprint.GetReference()} may need thermal pad",
-                        location=(fp_data['x'], fp_data['y']),
-                        component=footprint.GetReference()
+                        message=f"Component {ref} may need thermal pad",
+                        location=location,
+                        component=ref
                     ))
                 
-                # Optimized component density check using spatial indexing
-                nearby_components = 0
-                search_radius = 5.0  # 5mm radius
-                search_radius_sq = search_radius * search_radius
-                
-                for other_fp_data in footprint_positions:
-                    if other_fp_data['footprint'] == footprint:
-                        continue
-                    
-                    # Use squared distance to avoid square root calculation
-                    dx = fp_data['x'] - other_fp_data['x']
-                    dy = fp_data['y'] - other_fp_data['y']
-                    distance_sq = dx * dx + dy * dy
-                    
-                    if distance_sq < search_radius_sq:
-                        nearby_components += 1
+                # Component density from the spatial index
+                nearby_components = sum(
+                    1 for item, distance in footprint_index.query_point(
+                        location[0], location[1], search_radius, kinds=(ITEM_FOOTPRINT,)
+                    )
+                    if item.row != i and distance < search_radius
+                )
                 
                 if nearby_components > 3:
                     results.append(AnalysisResult(
                         type=AnalysisType.THERMAL,
                         severity="warning",
-                        message=f"High component density around {footprint.GetReference()}",
-                        location=(fp_data['x'], fp_data['y']),
-                        component=footprint.GetReference(),
+                        message=f"High component density around {ref}",
+                        location=location,
+                        component=ref,
                         value=nearby_components,
                         unit="components"
                     ))
@@ -321,55 +300,38 @@ class AnalysisManager(BaseManager[AnalysisResult]):
         results = []
         
         try:
-            # Get cached tracks by layer for efficient parallel detection
-            tracks_by_layer = self._get_cached_tracks_by_layer()
-            tracks = self._get_cached_tracks()
+            snapshot = self._get_snapshot()
+            tracks = snapshot.tracks
+            lengths = snapshot.track_lengths_mm()
+            angles = snapshot.track_angles_deg()
             
-            # Analyze each track with optimized parallel detection
-            for track in tracks:
-                # Cache track properties
-                length = track.GetLength() / 1e6  # Convert to mm
-                start_pos = track.GetStart()
-                start_x, start_y = start_pos.x / 1e6, start_pos.y / 1e6
-                layer = track.GetLayer()
+            # Long parallel tracks, compared only against long tracks on the same layer
+            has_parallel = self._find_parallel_tracks(snapshot, min_length=50.0, min_other_length=25.0)
+            # Sharp corners only apply to straight tracks
+            sharp = ~tracks.is_arc & (angles > 45)  # Maximum angle for good EMI
+            
+            for i in np.flatnonzero(has_parallel | sharp):
+                location = (tracks.start_x[i] / 1e6, tracks.start_y[i] / 1e6)
                 
-                # Check for long parallel tracks (only check tracks on same layer)
-                if length > 50:  # Only check if track is long enough to be problematic
-                    parallel_tracks = 0
-                    layer_tracks = tracks_by_layer.get(layer, [])
-                    
-                    for other_track in layer_tracks:
-                        if other_track == track:
-                            continue
-                        
-                        # Quick check: only analyze if other track is also long
-                        if other_track.GetLength() / 1e6 > 25:  # Minimum length for parallel analysis
-                            if track.IsParallel(other_track):
-                                parallel_tracks += 1
-                    
-                    if parallel_tracks > 0:
-                        results.append(AnalysisResult(
-                            type=AnalysisType.EMI,
-                            severity="warning",
-                            message=f"Long parallel tracks may cause EMI issues",
-                            location=(start_x, start_y),
-                            value=length,
-                            unit="mm"
-                        ))
+                if has_parallel[i]:
+                    results.append(AnalysisResult(
+                        type=AnalysisType.EMI,
+                        severity="warning",
+                        message=f"Long parallel tracks may cause EMI issues",
+                        location=location,
+                        value=float(lengths[i]),
+                        unit="mm"
+                    ))
                 
-                # Check for sharp corners (only for straight tracks)
-                if track.GetShape() == pcbnew.SEG:
-                    end_pos = track.GetEnd()
-                    angle = abs(math.atan2(end_pos.y - start_pos.y, end_pos.x - start_pos.x) * 180 / math.pi)
-                    if angle > 45:  # Maximum angle for good EMI
-                        results.append(AnalysisResult(
-                            type=AnalysisType.EMI,
-                            severity="warning",
-                            message=f"Sharp corner may cause EMI issues",
-                            location=(start_x, start_y),
-                            value=angle,
-                            unit="degrees"
-                        ))
+                if sharp[i]:
+                    results.append(AnalysisResult(
+                        type=AnalysisType.EMI,
+                        severity="warning",
+                        message=f"Sharp corner may cause EMI issues",
+                        location=location,
+                        value=float(angles[i]),
+                        unit="degrees"
+                    ))
             
         except (AttributeError, TypeError) as e:
             self.logger.error(f"Error accessing track properties during EMI analysis: {str(e)}")
@@ -395,6 +357,41 @@ class AnalysisManager(BaseManager[AnalysisResult]):
         
         return results
     
+    @staticmethod
+    def _find_parallel_tracks(snapshot: BoardSnapshot, min_length: float,
+                              min_other_length: float, tolerance: float = 1e-3) -> np.ndarray:
+        """Flag tracks that run parallel to another track on the same layer.
+        
+        Args:
+            snapshot: Board snapshot
+            min_length: Minimum length in mm of a flagged track
+            min_other_length: Minimum length in mm of the track it runs parallel to
+            tolerance: Maximum sine of the angle between parallel directions
+            
+        Returns:
+            Boolean mask over the snapshot tracks
+        """
+        tracks = snapshot.tracks
+        lengths = snapshot.track_lengths_mm()
+        result = np.zeros(len(tracks), dtype=bool)
+        
+        dx = (tracks.end_x - tracks.start_x).astype(np.float64)
+        dy = (tracks.end_y - tracks.start_y).astype(np.float64)
+        norm = np.hypot(dx, dy)
+        norm[norm == 0] = 1.0
+        ux, uy = dx / norm, dy / norm
+        
+        for layer in np.unique(tracks.layer[lengths > min_length]):
+            on_layer = tracks.layer == layer
+            subjects = np.flatnonzero(on_layer & (lengths > min_length))
+            others = np.flatnonzero(on_layer & (lengths > min_other_length))
+            cross = np.abs(np.outer(ux[subjects], uy[others]) - np.outer(uy[subjects], ux[others]))
+            parallel = cross <= tolerance
+            parallel &= subjects[:, None] != others[None, :]
+            result[subjects] = parallel.any(axis=1)
+        
+        return result
+    
     def analyze_power_distribution(self) -> List[AnalysisResult]:
         """Analyze power distribution of the PCB.
         
@@ -404,36 +401,36 @@ class AnalysisManager(BaseManager[AnalysisResult]):
         results = []
         
         try:
-            # Get cached power tracks for efficiency
-            power_tracks = self._get_cached_power_tracks()
+            # Select power tracks by interned net id
+            snapshot = self._get_snapshot()
+            tracks = snapshot.tracks
+            power = np.isin(tracks.net, snapshot.net_ids_with_prefix(("VCC", "VDD", "VSS", "GND")))
+            widths = tracks.width / 1e6  # Convert to mm
+            lengths = tracks.length / 1e6  # Convert to mm
             
-            # Analyze power tracks with cached properties
-            for track in power_tracks:
-                # Cache track properties
-                width = track.GetWidth() / 1e6  # Convert to mm
-                length = track.GetLength() / 1e6  # Convert to mm
-                start_pos = track.GetStart()
-                start_x, start_y = start_pos.x / 1e6, start_pos.y / 1e6
+            narrow = power & (widths < self.power_config.min_width)
+            too_long = power & (lengths > self.power_config.max_length)
+            
+            for i in np.flatnonzero(narrow | too_long):
+                location = (tracks.start_x[i] / 1e6, tracks.start_y[i] / 1e6)
                 
-                # Check track width
-                if width < self.power_config.min_width:
+                if narrow[i]:
                     results.append(AnalysisResult(
                         type=AnalysisType.POWER_DISTRIBUTION,
                         severity="warning",
-                        message=f"Power track width {width:.2f}mm is below recommended minimum",
-                        location=(start_x, start_y),
-                        value=width,
+                        message=f"Power track width {widths[i]:.2f}mm is below recommended minimum",
+                        location=location,
+                        value=float(widths[i]),
                         unit="mm"
                     ))
                 
-                # Check track length
-                if length > self.power_config.max_length:
+                if too_long[i]:
                     results.append(AnalysisResult(
                         type=AnalysisType.POWER_DISTRIBUTION,
                         severity="warning",
-                        message=f"Power track length {length:.2f}mm exceeds recommended maximum",
-                        location=(start_x, start_y),
-                        value=length,
+                        message=f"Power track length {lengths[i]:.2f}mm exceeds recommended maximum",
+                        location=location,
+                        value=float(lengths[i]),
                         unit="mm"
                     ))
             
@@ -470,52 +467,51 @@ class AnalysisManager(BaseManager[AnalysisResult]):
         results = []
         
         try:
-            # Get cached audio tracks for efficiency
-            audio_tracks = self._get_cached_audio_tracks()
+            # Select audio tracks by interned net id
+            snapshot = self._get_snapshot()
+            tracks = snapshot.tracks
+            audio = np.isin(tracks.net, snapshot.net_ids_with_prefix(("AUDIO", "IN", "OUT")))
+            widths = tracks.width / 1e6  # Convert to mm
+            lengths = tracks.length / 1e6  # Convert to mm
+            angles = snapshot.track_angles_deg()
+            
+            narrow = audio & (widths < self.audio_config.min_width)
+            too_long = audio & (lengths > self.audio_config.max_length)
+            # Sharp corners only apply to straight tracks
+            sharp = audio & ~tracks.is_arc & (angles > self.audio_config.max_angle)
             
-            # Analyze audio tracks with cached properties
-            for track in audio_tracks:
-                # Cache track properties to avoid repeated API calls
-                width = track.GetWidth() / 1e6  # Convert to mm
-                length = track.GetLength() / 1e6  # Convert to mm
-                start_pos = track.GetStart()
-                start_x, start_y = start_pos.x / 1e6, start_pos.y / 1e6
+            for i in np.flatnonzero(narrow | too_long | sharp):
+                location = (tracks.start_x[i] / 1e6, tracks.start_y[i] / 1e6)
                 
-                # Check track width
-                if width < self.audio_config.min_width:
+                if narrow[i]:
                     results.append(AnalysisResult(
                         type=AnalysisType.AUDIO_PERFORMANCE,
                         severity="warning",
-                        message=f"Audio track width {width:.2f}mm is below recommended minimum",
-                        location=(start_x, start_y),
-                        value=width,
+                        message=f"Audio track width {widths[i]:.2f}mm is below recommended minimum",
+                        location=location,
+                        value=float(widths[i]),
                         unit="mm"
                     ))
                 
-                # Check track length
-                if length > self.audio_config.max_length:
+                if too_long[i]:
                     results.append(AnalysisResult(
                         type=AnalysisType.AUDIO_PERFORMANCE,
                         severity="warning",
-                        message=f"Audio track length {length:.2f}mm exceeds recommended maximum",
-                        location=(start_x, start_y),
-                        value=length,
+                        message=f"Audio track length {lengths[i]:.2f}mm exceeds recommended maximum",
+                        location=location,
+                        value=float(lengths[i]),
                         unit="mm"
                     ))
                 
-                # Check for sharp corners (only for straight tracks)
-                if track.GetShape() == pcbnew.SEG:
-                    end_pos = track.GetEnd()
-                    angle = abs(math.atan2(end_pos.y - start_pos.y, end_pos.x - start_pos.x) * 180 / math.pi)
-                    if angle > self.audio_config.max_angle:
-                        results.append(AnalysisResult(
-                            type=AnalysisType.AUDIO_PERFORMANCE,
-                            severity="warning",
-                            message=f"Sharp corner may affect audio performance",
-                            location=(start_x, start_y),
-                            value=angle,
-                            unit="degrees"
-                        ))
+                if sharp[i]:
+                    results.append(AnalysisResult(
+                        type=AnalysisType.AUDIO_PERFORMANCE,
+                        severity="warning",
+                        message=f"Sharp corner may affect audio performance",
+                        location=location,
+                        value=float(angles[i]),
+                        unit="degrees"
+                    ))
             
         except (AttributeError, TypeError) as e:
             self.logger.error(f"Error accessing track properties during audio analysis: {str(e)}")
@@ -541,74 +537,125 @@ class AnalysisManager(BaseManager[AnalysisResult]):
         
         return results
     
-    def run_all_analysis(self) -> Dict[AnalysisType, List[AnalysisResult]]:
+    def run_all_analysis(
+        self,
+        parallel: bool = False,
+        max_workers: Optional[int] = None
+    ) -> Dict[AnalysisType, List[AnalysisResult]]:
         """Run all analysis types.
         
+        Args:
+            parallel: Fan the snapshot-based analysis families out to worker
+                processes; the advanced audio analysis needs the live board
+                and runs in this process meanwhile
+            max_workers: Maximum number of worker processes (defaults to the
+                CPU count, capped at the number of families)
+        
         Returns:
             Dictionary of analysis results by type
         """
-        results: Dict[AnalysisType, List[AnalysisResult]] = {
-            AnalysisType.SIGNAL_INTEGRITY: self.analyze_signal_integrity(),
-            AnalysisType.THERMAL: self.analyze_thermal(),
-            AnalysisType.EMI: self.analyze_emi(),
-            AnalysisType.POWER_DISTRIBUTION: self.analyze_power_distribution(),
-            AnalysisType.AUDIO_PERFORMANCE: self.analyze_audio_performance()
-        }
-        
-        # Append advanced audio metrics as pseudo-analysis results for unified reporting
-        if self._advanced_analyzer is not None:
-            adv = self._advanced_analyzer.run_all_advanced()
-
-            # Flatten into AnalysisResult stubs for consistency
-            results[AnalysisType.ADVANCED_AUDIO] = [
-                AnalysisResult(
-                    type=AnalysisType.ADVANCED_AUDIO,
-                    severity="info",
-                    message="THD+N estimate",
-                    value=adv["thd_plus_n"].thd_plus_n,
-                    unit="%",
-                ),
-                AnalysisResult(
-                    type=AnalysisType.ADVANCED_AUDIO,
-                    severity="info",
-                    message="Frequency response deviation",
-                    value=adv["frequency_response"].deviation_db,
-                    unit="dB",
-                ),
-                AnalysisResult(
-                    type=AnalysisType.ADVANCED_AUDIO,
-                    severity="info",
-                    message="Microphonic coupling score",
-                    value=adv["microphonic_coupling"].coupling_score,
-                    unit="score",
-                    component=adv["microphonic_coupling"].worst_offender_ref,
-                ),
-                AnalysisResult(
-                    type=AnalysisType.ADVANCED_AUDIO,
-                    severity="info",
-                    message="Group delay variation",
-                    value=adv["group_delay"].group_delay_variation,
-                    unit="μs",
-                ),
-                AnalysisResult(
-                    type=AnalysisType.ADVANCED_AUDIO,
-                    severity="info",
-                    message="Intermodulation distortion",
-                    value=adv["intermodulation_distortion"].imd_total,
-                    unit="%",
-                ),
-                AnalysisResult(
-                    type=AnalysisType.ADVANCED_AUDIO,
-                    severity="info",
-                    message="Dynamic range",
-                    value=adv["dynamic_range"].dynamic_range,
-                    unit="dB",
-                ),
-            ]
+        results: Optional[Dict[AnalysisType, List[AnalysisResult]]] = None
+        advanced: Optional[List[AnalysisResult]] = None
+        
+        payload: Optional[bytes] = None
+        if parallel:
+            # Serialize the snapshot once; each worker unpickles it a single time
+            try:
+                configs = {name: getattr(self, name) for name in _CONFIG_ATTRIBUTES}
+                payload = pickle.dumps((self._get_snapshot(), configs),
+                                       protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                self.logger.warning(
+                    f"Could not serialize board snapshot, running serially: {str(e)}")
+        
+        if payload is not None:
+            workers = max(1, min(max_workers or os.cpu_count() or 1, len(ANALYSIS_FAMILIES)))
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_analysis_worker,
+                                         initargs=(payload,)) as pool:
+                    futures = {
+                        analysis_type: pool.submit(_run_analysis_family, analysis_type)
+                        for analysis_type in ANALYSIS_FAMILIES
+                    }
+                    advanced = self._run_advanced_audio_analysis()
+                    results = {analysis_type: future.result()
+                               for analysis_type, future in futures.items()}
+            except (BrokenProcessPool, OSError) as e:
+                self.logger.warning(f"Parallel analysis unavailable, running serially: {str(e)}")
+                results = None
+        
+        if results is None:
+            results = {
+                analysis_type: getattr(self, method)()
+                for analysis_type, method in ANALYSIS_FAMILIES.items()
+            }
+        if advanced is None:
+            advanced = self._run_advanced_audio_analysis()
+        if advanced is not None:
+            results[AnalysisType.ADVANCED_AUDIO] = advanced
         
         self._analysis_results = [r for results_list in results.values() for r in results_list]
         return results
     
+    def _run_advanced_audio_analysis(self) -> Optional[List[AnalysisResult]]:
+        """Run the advanced audio analyzer and flatten its metrics.
+        
+        Returns:
+            Advanced audio metrics as pseudo-analysis results for unified
+            reporting, or None if the analyzer is unavailable
+        """
+        if self._advanced_analyzer is None:
+            return None
+        
+        adv = self._advanced_analyzer.run_all_advanced()
+        
+        # Flatten into AnalysisResult stubs for consistency
+        return [
+            AnalysisResult(
+                type=AnalysisType.ADVANCED_AUDIO,
+                severity="info",
+                message="THD+N estimate",
+                value=adv["thd_plus_n"].thd_plus_n,
+                unit="%",
+            ),
+            AnalysisResult(
+                type=AnalysisType.ADVANCED_AUDIO,
+                severity="info",
+                message="Frequency response deviation",
+                value=adv["frequency_response"].deviation_db,
+                unit="dB",
+            ),
+            AnalysisResult(
+                type=AnalysisType.ADVANCED_AUDIO,
+                severity="info",
+                message="Microphonic coupling score",
+                value=adv["microphonic_coupling"].coupling_score,
+                unit="score",
+                component=adv["microphonic_coupling"].worst_offender_ref,
+            ),
+            AnalysisResult(
+                type=AnalysisType.ADVANCED_AUDIO,
+                severity="info",
+                message="Group delay variation",
+                value=adv["group_delay"].group_delay_variation,
+                unit="μs",
+            ),
+            AnalysisResult(
+                type=AnalysisType.ADVANCED_AUDIO,
+                severity="info",
+                message="Intermodulation distortion",
+                value=adv["intermodulation_distortion"].imd_total,
+                unit="%",
+            ),
+            AnalysisResult(
+                type=AnalysisType.ADVANCED_AUDIO,
+                severity="info",
+                message="Dynamic range",
+                value=adv["dynamic_range"].dynamic_range,
+                unit="dB",
+            ),
+        ]
+    
     def _validate_data(self, data: AnalysisResult) -> ManagerResult:
         """Validate data before storage.
         
@@ -675,6 +722,7 @@ class AnalysisManager(BaseManager[AnalysisResult]):
     def _clear_cache(self) -> None:
         """Clear cache after data changes."""
         # Clear the cache and update analysis results
+        self._snapshot = None
         super()._clear_cache()
         # Update the analysis results list with current items
         self._analysis_results = list(self._items.values()) 
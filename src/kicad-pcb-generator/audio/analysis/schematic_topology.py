@@ -1,5 +1,7 @@
 """Schematic topology analysis for audio circuits."""
 import logging
+import re
+from collections import deque
 from typing import Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass
 from enum import Enum
@@ -9,6 +11,16 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Nets that carry supply or reference potentials rather than signals. Names
+# are matched whole (after any sheet path), so CV-IN or SV+ stay signals.
+GROUND_NET_TOKENS = frozenset(("GND", "AGND", "DGND", "PGND", "GNDA", "GNDD", "GNDPWR", "GROUND", "EARTH"))
+_RAIL_NET_PATTERN = re.compile(r"^(?:[+-]?V(?:CC|DD|EE|SS)(?:_?[A-Z0-9]+)?|V[+-])$")
+_SUPPLY_NET_PATTERN = re.compile(r"^[+-]?\d+(V\d*|\.\d+V)$")
+
+# Connector net/reference/value tokens that mark signal inputs and outputs
+_INPUT_TOKEN = re.compile(r"^(IN|INPUT)\d*$")
+_OUTPUT_TOKEN = re.compile(r"^(OUT|OUTPUT)\d*$")
+
 @dataclass
 class ComponentNode:
     """Represents a component in the schematic topology."""
@@ -340,78 +352,121 @@ class SchematicTopologyAnalyzer:
         else:
             return ComponentType.OPAMP  # Default for unknown components
 
-    def _build_signal_flow_graph(self, components: Dict[str, ComponentNode]) -> nx.DiGraph:
-        """Build signal flow graph from components."""
-        graph = nx.DiGraph()
+    def _build_signal_flow_graph(self, components: Dict[str, ComponentNode]) -> nx.Graph:
+        """Build the bipartite component-net graph of signal connections.
+        
+        Component nodes are keyed by reference and net nodes by ``("net", name)``.
+        Power and ground nets are left out: they reach almost every part without
+        carrying a signal, and would connect everything to everything.
+        """
+        graph = nx.Graph()
         
         try:
-            # Add nodes
             for ref, component in components.items():
-                graph.add_node(ref, component=component)
-            
-            # Add edges based on net connections
-            net_connections = {}
+                graph.add_node(ref, bipartite=0, component=component)
             
             for ref, component in components.items():
                 for net in component.nets:
-                    if net not in net_connections:
-                        net_connections[net] = []
-                    net_connections[net].append(ref)
-            
-            # Create edges for components sharing nets
-            for net, connected_components in net_connections.items():
-                if len(connected_components) > 1:
-                    # Create edges between all components sharing this net
-                    for i, comp1 in enumerate(connected_components):
-                        for comp2 in connected_components[i+1:]:
-                            graph.add_edge(comp1, comp2, net=net)
-                            graph.add_edge(comp2, comp1, net=net)
+                    if not net or self._is_power_net(net):
+                        continue
+                    node = ("net", net)
+                    if node not in graph:
+                        graph.add_node(node, bipartite=1, net=net)
+                    graph.add_edge(ref, node)
             
             return graph
             
         except (ValueError, KeyError, AttributeError) as e:
             logger.error("Error building signal flow graph: %s", e)
-            return nx.DiGraph()
+            return nx.Graph()
+
+    def _is_power_net(self, net: str) -> bool:
+        """Whether a net is a supply or ground net."""
+        upper = net.upper().rsplit("/", 1)[-1]
+        if _RAIL_NET_PATTERN.match(upper) or _SUPPLY_NET_PATTERN.match(upper):
+            return True
+        return any(token in GROUND_NET_TOKENS for token in re.split(r"[^A-Z0-9]+", upper))
 
-    def _analyze_signal_paths(self, graph: nx.DiGraph, components: Dict[str, ComponentNode]) -> List[SignalPath]:
-        """Analyze signal paths in the circuit."""
+    def _classify_signal_endpoints(self, components: Dict[str, ComponentNode]) -> Tuple[List[str], List[str]]:
+        """Split connectors into signal inputs and outputs.
+        
+        A connector is an input or output when a token of its signal net names,
+        reference or value reads ``IN``/``INPUT`` or ``OUT``/``OUTPUT``. Connectors
+        marked as neither (or both) count as both.
+        """
+        inputs = []
+        outputs = []
+        
+        for ref, component in components.items():
+            if component.component_type != ComponentType.CONNECTOR.value:
+                continue
+            names = [net for net in component.nets if net and not self._is_power_net(net)]
+            tokens = {token for name in names + [ref, component.value] for token in re.split(r"[^A-Z0-9]+", name.upper())}
+            is_input = any(_INPUT_TOKEN.match(token) for token in tokens)
+            is_output = any(_OUTPUT_TOKEN.match(token) for token in tokens)
+            if is_input or not is_output:
+                inputs.append(ref)
+            if is_output or not is_input:
+                outputs.append(ref)
+        
+        return inputs, outputs
+
+    def _analyze_signal_paths(self, graph: nx.Graph, components: Dict[str, ComponentNode]) -> List[SignalPath]:
+        """Trace signal paths from input connectors to output connectors.
+        
+        A single BFS is seeded with every input and labels each state with the
+        input it came from, so each component is expanded at most once per input
+        and the cost is O(inputs * (V + E)) instead of a search per component
+        pair. Paths do not pass through other connectors.
+        """
         signal_paths = []
         
         try:
-            # Find all pairs of components
-            component_refs = list(components.keys())
-            
-            for i, start_comp in enumerate(component_refs):
-                for end_comp in component_refs[i+1:]:
-                    # Find shortest path between components
-                    try:
-                        path = nx.shortest_path(graph, start_comp, end_comp)
-                        if len(path) > 1:  # Only consider actual paths
-                            # Calculate path properties
-                            path_length = self._calculate_path_length(path, components)
-                            path_impedance = self._calculate_path_impedance(path, components)
-                            signal_type = self._determine_signal_type(path, components)
-                            
-                            # Get nets involved in this path
-                            path_nets = []
-                            for j in range(len(path) - 1):
-                                edge_data = graph.get_edge_data(path[j], path[j+1])
-                                if edge_data and 'net' in edge_data:
-                                    path_nets.append(edge_data['net'])
-                            
-                            signal_path = SignalPath(
-                                start_component=start_comp,
-                                end_component=end_comp,
-                                path_components=path,
-                                path_nets=path_nets,
-                                length=path_length,
-                                impedance=path_impedance,
-                                signal_type=signal_type
-                            )
-                            signal_paths.append(signal_path)
-                    except nx.NetworkXNoPath:
-                        # No path exists between these components
+            inputs, outputs = self._classify_signal_endpoints(components)
+            inputs = [ref for ref in inputs if ref in graph]
+            outputs = [ref for ref in outputs if ref in graph]
+            if not inputs or not outputs:
+                return []
+            
+            endpoints = set(inputs) | set(outputs)
+            adjacency = graph.adj
+            parents: Dict[Tuple[Any, str], Any] = {(source, source): None for source in inputs}
+            queue = deque((source, source) for source in inputs)
+            
+            while queue:
+                node, source = queue.popleft()
+                if node in endpoints and node != source:
+                    continue  # Paths end at the first connector they reach
+                for neighbour in adjacency[node]:
+                    state = (neighbour, source)
+                    if state not in parents:
+                        parents[state] = node
+                        queue.append(state)
+            
+            for source in inputs:
+                for sink in outputs:
+                    if sink == source or (sink, source) not in parents:
                         continue
+                    
+                    # Walk the parents back; nodes alternate component, net, component
+                    chain = []
+                    node = sink
+                    while node is not None:
+                        chain.append(node)
+                        node = parents[(node, source)]
+                    chain.reverse()
+                    path = chain[0::2]
+                    path_nets = [net for _, net in chain[1::2]]
+                    
+                    signal_paths.append(SignalPath(
+                        start_component=source,
+                        end_component=sink,
+                        path_components=path,
+                        path_nets=path_nets,
+                        length=self._calculate_path_length(path, components),
+                        impedance=self._calculate_path_impedance(path, components),
+                        signal_type=self._determine_signal_type(path, components)
+                    ))
             
             return signal_paths
             
@@ -506,14 +561,19 @@ class SchematicTopologyAnalyzer:
             logger.error("Error analyzing noise sources: %s", e)
             return []
 
-    def _analyze_component_dependencies(self, graph: nx.DiGraph) -> Dict[str, List[str]]:
+    def _analyze_component_dependencies(self, graph: nx.Graph) -> Dict[str, List[str]]:
         """Analyze component dependencies based on signal flow."""
         dependencies = {}
         
         try:
-            for node in graph.nodes():
-                # Find components that depend on this one (incoming edges)
-                dependencies[node] = list(graph.predecessors(node))
+            adjacency = graph.adj
+            for node, data in graph.nodes(data=True):
+                if data.get("bipartite") != 0:
+                    continue
+                # Components sharing a signal net with this one
+                dependencies[node] = list(dict.fromkeys(
+                    other for net in adjacency[node] for other in adjacency[net] if other != node
+                ))
             
             return dependencies
             
@@ -636,10 +696,12 @@ class SchematicTopologyAnalyzer:
     def _determine_signal_type(self, path: List[str], components: Dict[str, ComponentNode]) -> str:
         """Determine the type of signal flowing through a path."""
         try:
-            # Check for power supply components
+            # Check for power supply components; connectors at the ends of a
+            # path are its signal input and output
             for comp_ref in path:
                 component = components[comp_ref]
-                if component.component_type in ["regulator", "connector"]:
+                if component.component_type == "regulator" or (
+                        component.component_type == "connector" and comp_ref not in (path[0], path[-1])):
                     return "power"
             
             # Check for digital components
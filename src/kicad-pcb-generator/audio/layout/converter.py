@@ -7,6 +7,8 @@ from ..validation.audio_validator import AudioPCBValidator
 from ..validation.schematic.validator import AudioSchematicValidator
 from ..components.stability import StabilityManager, FilterType, FilterSpec
 from .modular_synth_layout_rules import ModularSynthLayoutRules
+from ..routing.maze_router import MazeRouter, RoutingGrid
+from ...core.board.snapshot import BoardSnapshot
 import logging
 import math
 
@@ -20,6 +22,14 @@ class LayoutResult:
     errors: List[str] = None
     warnings: List[str] = None
 
+@dataclass
+class AudioTrackRules:
+    """Width, clearance and layer preference of maze-routed audio tracks."""
+    min_width: float
+    min_clearance: float
+    preferred_layer: Optional[int] = None
+    avoid_layers: Tuple[int, ...] = ()
+
 @dataclass
 class StarGroundResult:
     """Result of star grounding implementation."""
@@ -54,6 +64,13 @@ class AudioLayoutConverter:
         self.analog_digital_separation_distance = 10.0  # mm - min separation
         self.audio_component_spacing = 5.0  # mm - min spacing between audio components
         self.power_decoupling_distance = 3.0  # mm - max distance for decoupling caps
+        self.audio_track_width = 0.3  # mm - maze routing width for audio nets
+        self.audio_track_clearance = 0.3  # mm - maze routing clearance for audio nets
+        
+        # Maze router of the board being routed, built on first use
+        self._maze_router: Optional[MazeRouter] = None
+        self._maze_router_board: Optional[pcbnew.BOARD] = None
+        self._maze_router_snapshot: Optional[BoardSnapshot] = None
     
     def convert_schematic(self, schematic: Any) -> LayoutResult:
         """Convert a schematic to a PCB layout.
@@ -332,10 +349,35 @@ class AudioLayoutConverter:
                     break
         return connected
     
-    def _calculate_audio_path(self, start: Any, end: Any, board: pcbnew.BOARD) -> List[pcbnew.VECTOR2I]:
-        """Calculate a curved path for audio signals."""
-        start_pos = start.GetPosition()
-        end_pos = end.GetPosition()
+    def _calculate_audio_path(self, start: Any, end: Any, board: pcbnew.BOARD,
+                              net: Any = None) -> List[pcbnew.VECTOR2I]:
+        """Calculate a path for audio signals.
+        
+        The path runs between the pads of ``net`` on the two footprints and
+        is searched around existing copper with the maze router; the pads'
+        own copper is not an obstacle. If no path is found a curved path
+        between the end points is used.
+        """
+        net_name = net.GetNetname() if net is not None else None
+        start_pos = self._get_pad_position(start, net_name)
+        end_pos = self._get_pad_position(end, net_name)
+        
+        try:
+            router = self._get_maze_router(board)
+            rules = AudioTrackRules(self.audio_track_width, self.audio_track_clearance, pcbnew.F_Cu)
+            net_id = max(0, self._maze_router_snapshot.net_id(net_name)) if net_name else 0
+            path = router.route_connection(
+                (start_pos.x / 1e6, start_pos.y / 1e6),
+                (end_pos.x / 1e6, end_pos.y / 1e6),
+                rules,
+                name=net_name or "",
+                net_id=net_id,
+                layers=[pcbnew.F_Cu]
+            )
+            if path is not None:
+                return [pcbnew.VECTOR2I(int(x * 1e6), int(y * 1e6)) for x, y, _ in path.points]
+        except Exception as e:
+            logger.warning(f"Maze routing failed, using curved path: {str(e)}")
         
         # Calculate midpoint
         mid_x = (start_pos.x + end_pos.x) // 2
@@ -351,6 +393,24 @@ class AudioLayoutConverter:
             end_pos
         ]
     
+    def _get_pad_position(self, footprint: Any, net_name: Optional[str]) -> pcbnew.VECTOR2I:
+        """Get the position of a footprint's pad on a net, or its anchor if it has none."""
+        if net_name:
+            for pad in footprint.GetPads():
+                if pad.GetNetname() == net_name:
+                    return pad.GetPosition()
+        return footprint.GetPosition()
+    
+    def _get_maze_router(self, board: pcbnew.BOARD) -> MazeRouter:
+        """Get the maze router for a board, rasterizing it on first use."""
+        if self._maze_router is None or self._maze_router_board is not board:
+            snapshot = BoardSnapshot.from_board(board)
+            grid = RoutingGrid.from_snapshot(snapshot, layers=[pcbnew.F_Cu, pcbnew.B_Cu])
+            self._maze_router = MazeRouter(grid)
+            self._maze_router_board = board
+            self._maze_router_snapshot = snapshot
+        return self._maze_router
+    
     def _calculate_digital_path(self, start: Any, end: Any, board: pcbnew.BOARD) -> List[pcbnew.VECTOR2I]:
         """Calculate a path for digital signals, routing around the center."""
         start_pos = start.GetPosition()
@@ -419,7 +479,7 @@ class AudioLayoutConverter:
                 
                 # Calculate path based on net type
                 if "AUDIO" in net.GetNetname():
-                    path = self._calculate_audio_path(start, end, board)
+                    path = self._calculate_audio_path(start, end, board, net)
                 else:
                     path = self._calculate_digital_path(start, end, board)
                 
@@ -11,6 +11,7 @@ from pathlib import Path
 
 from ...core.base.base_optimizer import BaseOptimizer
 from ...core.base.results.optimization_result import OptimizationResult, OptimizationType, OptimizationStrategy
+from ...core.board.intersections import find_loops, segment_intersections
 
 if TYPE_CHECKING:
     from ...core.base.results.optimization_result import OptimizationResult as BaseOptimizationResult
@@ -577,15 +578,15 @@ class AdvancedCircuitOptimizer(BaseOptimizer[CircuitOptimizationItem]):
                     })
             
             # Find crossing tracks
-            for i, track1 in enumerate(tracks):
-                for track2 in tracks[i+1:]:
-                    if self._tracks_cross(track1, track2):
-                        analysis["crossing_tracks"].append({
-                            "track1": track1,
-                            "track2": track2,
-                            "net1": track1.GetNetname(),
-                            "net2": track2.GetNetname()
-                        })
+            track_tracks = [t for t in tracks if t.IsTrack()]
+            for i, j in self._find_crossing_pairs(track_tracks):
+                track1, track2 = track_tracks[i], track_tracks[j]
+                analysis["crossing_tracks"].append({
+                    "track1": track1,
+                    "track2": track2,
+                    "net1": track1.GetNetname(),
+                    "net2": track2.GetNetname()
+                })
             
             return analysis
             
@@ -1513,41 +1514,42 @@ class AdvancedCircuitOptimizer(BaseOptimizer[CircuitOptimizationItem]):
                 return True
         return False
     
-    def _detect_ground_loops(self, ground_tracks: List[pcbnew.TRACK]) -> bool:
-        """Detect ground loops in the design."""
-        # A simple graph-based approach to detect cycles in the ground net
-        if not ground_tracks:
+    def _detect_ground_loops(self, ground_tracks: List[pcbnew.TRACK],
+                             ground_vias: Optional[List[pcbnew.VIA]] = None,
+                             ground_zones: Optional[List[pcbnew.ZONE]] = None) -> bool:
+        """Detect ground loops in the design.
+        
+        Args:
+            ground_tracks: Tracks of the ground net
+            ground_vias: Vias of the ground net
+            ground_zones: Zones of the ground net
+            
+        Returns:
+            True if the ground copper contains a cycle
+        """
+        try:
+            if not ground_tracks:
+                return False
+            
+            tracks = []
+            for track in ground_tracks:
+                start, end = track.GetStart(), track.GetEnd()
+                tracks.append((start.x, start.y, end.x, end.y, track.GetLayer()))
+            vias = [(via.GetPosition().x, via.GetPosition().y, via.GetWidth() // 2)
+                    for via in ground_vias or []]
+            zones = []
+            for zone in ground_zones or []:
+                box = zone.GetBoundingBox()
+                zones.append((zone.GetLayer(), box.GetX(), box.GetY(), box.GetRight(), box.GetBottom()))
+            
+            report = find_loops(tracks, vias, zones)
+            for kind, _, x, y in report.closing_edges:
+                self.logger.debug(f"Ground loop closed by {kind} at ({x:.2f}, {y:.2f}) mm")
+            return report.loop_count > 0
+            
+        except Exception as e:
+            self.logger.error(f"Error detecting ground loops: {str(e)}")
             return False
-
-        adj = {}
-        nodes = set()
-
-        for track in ground_tracks:
-            start_node = tuple(track.GetStart())
-            end_node = tuple(track.GetEnd())
-            nodes.add(start_node)
-            nodes.add(end_node)
-            if start_node not in adj: adj[start_node] = []
-            if end_node not in adj: adj[end_node] = []
-            adj[start_node].append(end_node)
-            adj[end_node].append(start_node)
-
-        visited = set()
-        for node in nodes:
-            if node not in visited:
-                if self._is_cyclic(node, visited, -1, adj):
-                    return True
-        return False
-
-    def _is_cyclic(self, u, visited, parent, adj):
-        visited.add(u)
-        for v in adj.get(u, []):
-            if v not in visited:
-                if self._is_cyclic(v, visited, u, adj):
-                    return True
-            elif v != parent:
-                return True
-        return False
     
     def _add_component_shielding(self, component_ref: str) -> None:
         """Add shielding (placeholder).
@@ -2501,23 +2503,41 @@ class AdvancedCircuitOptimizer(BaseOptimizer[CircuitOptimizationItem]):
             Number of track crossings
         """
         try:
-            crossings = 0
             track_tracks = [t for t in tracks if t.IsTrack()]
-            
-            for i, track1 in enumerate(track_tracks):
-                for track2 in track_tracks[i+1:]:
-                    if self._tracks_cross(track1, track2):
-                        crossings += 1
-            
-            return crossings
+            return len(self._find_crossing_pairs(track_tracks))
             
         except Exception as e:
             self.logger.error(f"Error counting track crossings: {str(e)}")
             return 0
     
+    def _find_crossing_pairs(self, tracks: List[pcbnew.TRACK]) -> List[Tuple[int, int]]:
+        """Find pairs of tracks of different nets that cross on the same layer.
+        
+        Args:
+            tracks: List of tracks to analyze
+            
+        Returns:
+            Index pairs into ``tracks``
+        """
+        if len(tracks) < 2:
+            return []
+        coords = np.empty((len(tracks), 5), dtype=np.int64)
+        net_ids: Dict[str, int] = {"": 0}
+        nets = np.empty(len(tracks), dtype=np.int64)
+        for i, track in enumerate(tracks):
+            start, end = track.GetStart(), track.GetEnd()
+            coords[i] = (start.x, start.y, end.x, end.y, track.GetLayer())
+            nets[i] = net_ids.setdefault(track.GetNetname(), len(net_ids))
+        pairs = segment_intersections(coords[:, 0], coords[:, 1], coords[:, 2], coords[:, 3],
+                                      layers=coords[:, 4], nets=nets)
+        return [(int(i), int(j)) for i, j in pairs]
+    
     def _tracks_cross(self, track1: pcbnew.TRACK, track2: pcbnew.TRACK) -> bool:
         """Check if two tracks cross.
         
+        Tracks cross if their centrelines on the same layer share a point
+        other than a common endpoint.
+        
         Args:
             track1: First track
             track2: Second track
@@ -2526,21 +2546,13 @@ class AdvancedCircuitOptimizer(BaseOptimizer[CircuitOptimizationItem]):
             True if tracks cross
         """
         try:
-            # Simplified crossing detection
-            # In a real implementation, this would use proper line intersection
-            start1 = track1.GetStart()
-            end1 = track1.GetEnd()
-            start2 = track2.GetStart()
-            end2 = track2.GetEnd()
-            
-            # Check if bounding boxes overlap
-            min_x1, max_x1 = min(start1.x, end1.x), max(start1.x, end1.x)
-            min_y1, max_y1 = min(start1.y, end1.y), max(start1.y, end1.y)
-            min_x2, max_x2 = min(start2.x, end2.x), max(start2.x, end2.x)
-            min_y2, max_y2 = min(start2.y, end2.y), max(start2.y, end2.y)
-            
-            return (min_x1 <= max_x2 and max_x1 >= min_x2 and 
-                   min_y1 <= max_y2 and max_y1 >= min_y2)
+            if track1.GetLayer() != track2.GetLayer():
+                return False
+            start1, end1 = track1.GetStart(), track1.GetEnd()
+            start2, end2 = track2.GetStart(), track2.GetEnd()
+            a = (start1.x, start1.y, end1.x, end1.y)
+            b = (start2.x, start2.y, end2.x, end2.y)
+            return len(segment_intersections(*zip(a, b))) > 0
             
         except Exception as e:
             self.logger.error(f"Error checking track crossing: {str(e)}")
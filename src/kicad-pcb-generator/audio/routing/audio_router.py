@@ -20,6 +20,8 @@ from ...config.audio_routing_config import (
     AudioRoutingConfig, OptimizationItem, RoutingConstraintItem, 
     SignalType, ValidationItem
 )
+from ...core.board.snapshot import BoardSnapshot
+from .maze_router import MazeRouter, RoutedPath, RoutingGrid, RoutingNet, RoutingPin
 
 
 @dataclass
@@ -89,6 +91,13 @@ class AudioRouter:
             serpentine_spacing=0.5,   # 0.5mm serpentine spacing
             serpentine_amplitude=2.0   # 2.0mm serpentine amplitude
         )
+        
+        # Maze router over the board's occupancy grid, built on first use
+        self._maze_router: Optional[MazeRouter] = None
+        self._routing_snapshot: Optional[BoardSnapshot] = None
+        self._grid_pitch = 0.1  # mm
+        self._via_diameter = 0.6  # mm
+        self._via_drill = 0.3  # mm
     
     def _validate_kicad_version(self) -> None:
         """Validate KiCad version compatibility."""
@@ -781,13 +790,19 @@ class AudioRouter:
             )
 
     def route_audio_signal(self, start: Tuple[float, float], end: Tuple[float, float], 
-                          signal_type: SignalType = SignalType.AUDIO) -> bool:
-        """Route an audio signal using KiCad's native router.
+                          signal_type: SignalType = SignalType.AUDIO,
+                          net_name: Optional[str] = None) -> bool:
+        """Route a signal between two points around existing copper.
+        
+        The connection is searched with A* on the board's occupancy grid,
+        using the width, clearance and layer preferences of the signal type,
+        and added to the board as tracks and vias.
         
         Args:
             start: Start position (x, y) in mm
             end: End position (x, y) in mm
             signal_type: Type of signal to route
+            net_name: Net the new tracks belong to
             
         Returns:
             True if routing was successful
@@ -795,38 +810,190 @@ class AudioRouter:
         try:
             # Get routing constraints
             constraints = self._routing_constraints[signal_type]
+            router = self._get_maze_router()
+            net_id = max(0, self._routing_snapshot.net_id(net_name)) if net_name else 0
             
-            # Convert positions to KiCad units (nm)
-            start_nm = (int(start[0] * 1e6), int(start[1] * 1e6))
-            end_nm = (int(end[0] * 1e6), int(end[1] * 1e6))
+            path = router.route_connection(start, end, constraints, name=net_name or "", net_id=net_id)
             
-            # Create routing points
-            start_point = pcbnew.VECTOR2I(start_nm[0], start_nm[1])
-            end_point = pcbnew.VECTOR2I(end_nm[0], end_nm[1])
+            if path is None:
+                self.logger.warning(f"Failed to route {signal_type.value} signal from {start} to {end}")
+                return False
             
-            # Get router
-            router = pcbnew.ROUTER()
-            router.SetBoard(self.board)
+            self._add_routed_path(path, constraints, net_name)
+            self.logger.info(f"Successfully routed {signal_type.value} signal from {start} to {end}")
+            return True
             
-            # Set routing parameters from configuration
-            router.SetMode(pcbnew.ROUTER_MODE_WALK)
-            router.SetLayer(constraints.preferred_layer)
-            router.SetWidth(int(constraints.min_width * 1e6))  # Convert to nm
-            router.SetClearance(int(constraints.min_clearance * 1e6))  # Convert to nm
+        except Exception as e:
+            self.logger.error(f"Error routing audio signal: {str(e)}")
+            return False
+    
+    def route_nets(self, net_names: Optional[List[str]] = None,
+                   parallel: bool = True,
+                   max_workers: Optional[int] = None) -> RoutingResult:
+        """Route unrouted nets with negotiated-congestion rip-up and reroute.
+        
+        Args:
+            net_names: Nets to route; all nets with two or more pads if None
+            parallel: Route nets with disjoint search windows in worker
+                processes
+            max_workers: Maximum number of worker processes
             
-            # Route the track
-            success = router.Route(start_point, end_point)
+        Returns:
+            Routing result with the created tracks
+        """
+        try:
+            router = self._get_maze_router(rebuild=True)
+            router.max_workers = max_workers
+            nets = self._collect_routing_nets(self._routing_snapshot, net_names)
             
-            if success:
-                self.logger.info(f"Successfully routed {signal_type.value} signal from {start} to {end}")
-            else:
-                self.logger.warning(f"Failed to route {signal_type.value} signal from {start} to {end}")
+            result = router.route_nets(nets, parallel=parallel)
             
-            return success
+            tracks = []
+            for net in nets:
+                route = result.routes[net.name]
+                if not route.success or route.conflict:
+                    continue
+                for path in route.paths:
+                    tracks.extend(self._add_routed_path(path, net.rules, net.name))
+            if tracks:
+                self.board.BuildConnectivity()
+            
+            warnings = [f"Net {name} still conflicts with another net" for name in result.conflicting]
+            errors = [f"Net {name} could not be routed" for name in result.failed]
+            return RoutingResult(
+                success=result.success,
+                message=f"Routed {len(nets) - len(result.failed) - len(result.conflicting)} of {len(nets)} nets",
+                routed_tracks=tracks,
+                warnings=warnings,
+                errors=errors,
+                metrics={
+                    "iterations": result.iterations,
+                    "seconds": result.seconds,
+                    "length": sum(route.length for route in result.routes.values()),
+                    "vias": sum(route.via_count for route in result.routes.values())
+                }
+            )
             
         except Exception as e:
-            self.logger.error(f"Error routing audio signal: {str(e)}")
-            return False
+            error_msg = f"Error routing nets: {str(e)}"
+            self.logger.error(error_msg)
+            return RoutingResult(
+                success=False,
+                message=error_msg,
+                routed_tracks=[],
+                warnings=[],
+                errors=[error_msg]
+            )
+    
+    def _get_maze_router(self, rebuild: bool = False) -> MazeRouter:
+        """Get the maze router, rasterizing the board on first use.
+        
+        Args:
+            rebuild: Re-read the board, e.g. after tracks were edited elsewhere
+            
+        Returns:
+            Maze router
+        """
+        if self._maze_router is None or rebuild:
+            snapshot = BoardSnapshot.from_board(self.board)
+            grid = RoutingGrid.from_snapshot(snapshot, layers=self._copper_layers(snapshot),
+                                             pitch=self._grid_pitch)
+            opt_settings = self.config.get_optimization_settings()
+            max_iterations = 1 + (opt_settings.max_reroute_attempts if opt_settings else 7)
+            self._maze_router = MazeRouter(grid, via_diameter=self._via_diameter,
+                                           max_iterations=max_iterations)
+            self._routing_snapshot = snapshot
+        return self._maze_router
+    
+    def _copper_layers(self, snapshot: BoardSnapshot) -> List[int]:
+        """Copper layer ids to route on, from the outer layers inwards."""
+        count = max(2, snapshot.copper_layer_count)
+        layers = [pcbnew.F_Cu]
+        layers.extend(getattr(pcbnew, f"In{i}_Cu") for i in range(1, count - 1) if hasattr(pcbnew, f"In{i}_Cu"))
+        layers.append(pcbnew.B_Cu)
+        return layers
+    
+    def _collect_routing_nets(self, snapshot: BoardSnapshot,
+                              net_names: Optional[List[str]] = None) -> List[RoutingNet]:
+        """Build routing nets from the pads of a board snapshot.
+        
+        Args:
+            snapshot: Board snapshot
+            net_names: Nets to include; all nets if None
+            
+        Returns:
+            Nets with two or more pads
+        """
+        wanted = set(net_names) if net_names is not None else None
+        pads = snapshot.pads
+        footprints = snapshot.footprints
+        pad_layer = {}
+        for i in range(len(footprints)):
+            for pad in range(footprints.pad_offset[i], footprints.pad_offset[i + 1]):
+                pad_layer[pad] = int(footprints.layer[i])
+        
+        pins_by_net: Dict[int, List[RoutingPin]] = {}
+        for i in range(len(pads)):
+            net_id = int(pads.net[i])
+            name = snapshot.net_names[net_id]
+            if not net_id or (wanted is not None and name not in wanted):
+                continue
+            layers = (pcbnew.F_Cu, pcbnew.B_Cu) if pads.is_pth[i] else (pad_layer.get(i, pcbnew.F_Cu),)
+            pins_by_net.setdefault(net_id, []).append(RoutingPin(
+                x=pads.x[i] / 1e6,
+                y=pads.y[i] / 1e6,
+                layers=layers,
+                half_width=pads.size_x[i] / 2e6,
+                half_height=pads.size_y[i] / 2e6
+            ))
+        
+        nets = []
+        for net_id, pins in pins_by_net.items():
+            if len(pins) < 2:
+                continue
+            name = snapshot.net_names[net_id]
+            signal_type = self._determine_signal_type(name, 0.0)
+            constraints = self._routing_constraints.get(signal_type)
+            if constraints is None:
+                continue
+            nets.append(RoutingNet(name=name, pins=pins, rules=constraints, net_id=net_id))
+        return nets
+    
+    def _add_routed_path(self, path: RoutedPath, constraints: RoutingConstraints,
+                         net_name: Optional[str] = None) -> List[pcbnew.TRACK]:
+        """Add a routed path to the board as tracks and vias.
+        
+        Args:
+            path: Routed path in mm
+            constraints: Routing constraints of the net
+            net_name: Net of the new items
+            
+        Returns:
+            Created tracks and vias
+        """
+        net_code = self.board.GetNetcodeFromNetname(net_name) if net_name else None
+        items = []
+        for (x1, y1), (x2, y2), layer in path.segments():
+            track = pcbnew.TRACK(self.board)
+            track.SetStart(pcbnew.VECTOR2I(int(x1 * 1e6), int(y1 * 1e6)))
+            track.SetEnd(pcbnew.VECTOR2I(int(x2 * 1e6), int(y2 * 1e6)))
+            track.SetWidth(int(constraints.min_width * 1e6))
+            track.SetLayer(layer)
+            if net_code is not None:
+                track.SetNetCode(net_code)
+            self.board.Add(track)
+            items.append(track)
+        for x, y in path.vias:
+            via = pcbnew.VIA(self.board)
+            via.SetPosition(pcbnew.VECTOR2I(int(x * 1e6), int(y * 1e6)))
+            via.SetDrill(int(self._via_drill * 1e6))
+            via.SetWidth(int(self._via_diameter * 1e6))
+            via.SetLayerPair(pcbnew.F_Cu, pcbnew.B_Cu)
+            if net_code is not None:
+                via.SetNetCode(net_code)
+            self.board.Add(via)
+            items.append(via)
+        return items
 
     def optimize_audio_routing(self) -> None:
         """Optimize audio signal routing using configuration settings."""
@@ -872,7 +1039,8 @@ class AudioRouter:
                         if self.route_audio_signal(
                             (start.x/1e6, start.y/1e6),
                             (end.x/1e6, end.y/1e6),
-                            SignalType.AUDIO
+                            SignalType.AUDIO,
+                            net_name=track.GetNetname()
                         ):
                             break
                         else:
@@ -887,7 +1055,8 @@ class AudioRouter:
                         if self.route_audio_signal(
                             (start.x/1e6, start.y/1e6),
                             (end.x/1e6, end.y/1e6),
-                            SignalType.POWER
+                            SignalType.POWER,
+                            net_name=track.GetNetname()
                         ):
                             break
                         else:
@@ -902,7 +1071,8 @@ class AudioRouter:
                         if self.route_audio_signal(
                             (start.x/1e6, start.y/1e6),
                             (end.x/1e6, end.y/1e6),
-                            SignalType.GROUND
+                            SignalType.GROUND,
+                            net_name=track.GetNetname()
                         ):
                             break
                         else:
@@ -0,0 +1,880 @@
+"""
+Grid-based multi-layer maze router.
+
+``RoutingGrid`` rasterizes the board onto a compact occupancy grid with one
+NumPy plane per copper layer: fixed copper (pads, existing tracks and vias)
+is stored by net id, routed copper as a per-cell usage count, and a history
+plane remembers cells that were congested in earlier passes.
+
+``MazeRouter`` connects multi-pin nets with A* searches on that grid. The
+cell cost combines wirelength, a layer factor taken from the net's routing
+constraints (preferred, other and avoided layers), a via penalty, and
+negotiated-congestion terms: nets may temporarily share cells at a price
+that grows with every rip-up-and-reroute pass, and cells that stay
+contested accumulate history cost until every net finds its own path.
+
+Clearances are enforced by dilating other nets' copper by the net's half
+width plus its clearance (the largest clearance in use, so rules hold in
+both directions). Nets whose search windows do not overlap are routed
+concurrently in worker processes.
+
+All lengths at the public API are in mm.
+"""
+
+import heapq
+import logging
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from scipy.ndimage import maximum_filter
+
+logger = logging.getLogger(__name__)
+
+Rect = Tuple[float, float, float, float]  # (min_x, min_y, max_x, max_y) in mm
+
+# Values of the fixed-copper plane besides positive net ids
+FREE = 0
+BLOCKED = -1
+
+_NM_PER_MM = 1e6
+_SQRT2 = math.sqrt(2.0)
+
+# (d_row, d_col, step length in cells)
+_PLANAR_MOVES = (
+    (-1, 0, 1.0), (1, 0, 1.0), (0, -1, 1.0), (0, 1, 1.0),
+    (-1, -1, _SQRT2), (-1, 1, _SQRT2), (1, -1, _SQRT2), (1, 1, _SQRT2)
+)
+
+
+@dataclass
+class RoutingPin:
+    """A pad (or free point) a net must connect. Lengths in mm."""
+    x: float
+    y: float
+    layers: Tuple[int, ...]
+    half_width: float = 0.0
+    half_height: float = 0.0
+
+
+@dataclass
+class RoutingNet:
+    """A net to route.
+
+    ``rules`` is any object with ``min_width``, ``min_clearance``,
+    ``preferred_layer`` and ``avoid_layers`` attributes, e.g. the audio
+    router's ``RoutingConstraints``.
+    """
+    name: str
+    pins: List[RoutingPin]
+    rules: Any
+    net_id: int = 0
+
+
+@dataclass
+class RoutedPath:
+    """One routed connection as a polyline with layer changes."""
+    points: List[Tuple[float, float, int]]  # (x, y, layer) per vertex
+    vias: List[Tuple[float, float]] = field(default_factory=list)
+    length: float = 0.0
+
+    def segments(self) -> Iterator[Tuple[Tuple[float, float], Tuple[float, float], int]]:
+        """Yield ((x1, y1), (x2, y2), layer) for every track segment."""
+        for (x1, y1, l1), (x2, y2, l2) in zip(self.points, self.points[1:]):
+            if l1 == l2 and (x1 != x2 or y1 != y2):
+                yield (x1, y1), (x2, y2), l1
+
+
+@dataclass
+class NetRoute:
+    """Routing outcome of one net."""
+    net: str
+    paths: List[RoutedPath] = field(default_factory=list)
+    success: bool = False
+    conflict: bool = False
+
+    @property
+    def length(self) -> float:
+        return sum(path.length for path in self.paths)
+
+    @property
+    def via_count(self) -> int:
+        return sum(len(path.vias) for path in self.paths)
+
+
+@dataclass
+class MazeRoutingResult:
+    """Outcome of a multi-net routing run."""
+    routes: Dict[str, NetRoute]
+    iterations: int = 0
+    seconds: float = 0.0
+
+    @property
+    def failed(self) -> List[str]:
+        """Nets that could not be connected."""
+        return [name for name, route in self.routes.items() if not route.success]
+
+    @property
+    def conflicting(self) -> List[str]:
+        """Nets still sharing space with another net after the last pass."""
+        return [name for name, route in self.routes.items() if route.conflict]
+
+    @property
+    def success(self) -> bool:
+        return not self.failed and not self.conflicting
+
+
+class RoutingGrid:
+    """Occupancy grid with one plane per copper layer."""
+
+    def __init__(self,
+                 bounds: Rect,
+                 layers: Sequence[int],
+                 pitch: float = 0.1,
+                 max_cells: int = 8_000_000,
+                 edge_clearance: float = 0.3):
+        """Initialize an empty grid.
+
+        Args:
+            bounds: Routable area in mm
+            layers: Copper layer ids, top to bottom
+            pitch: Cell size in mm; coarsened to stay below ``max_cells``
+            max_cells: Upper bound on cells over all layers
+            edge_clearance: Band along the board edge kept free of copper
+        """
+        self.bounds = bounds
+        self.layers = list(layers)
+        width = max(bounds[2] - bounds[0], pitch)
+        height = max(bounds[3] - bounds[1], pitch)
+        pitch = max(pitch, math.sqrt(width * height * len(self.layers) / max_cells))
+        self.pitch = pitch
+        self.cols = max(1, int(math.ceil(width / pitch)))
+        self.rows = max(1, int(math.ceil(height / pitch)))
+        shape = (len(self.layers), self.rows, self.cols)
+
+        self.fixed = np.zeros(shape, dtype=np.int32)
+        self.usage = np.zeros(shape, dtype=np.uint16)
+        self.history = np.zeros(shape, dtype=np.float32)
+        self._layer_index = {layer: i for i, layer in enumerate(self.layers)}
+
+        band = int(math.ceil(edge_clearance / pitch))
+        if band > 0:
+            self.fixed[:, :band, :] = BLOCKED
+            self.fixed[:, -band:, :] = BLOCKED
+            self.fixed[:, :, :band] = BLOCKED
+            self.fixed[:, :, -band:] = BLOCKED
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return self.fixed.shape
+
+    def layer_index(self, layer: int) -> Optional[int]:
+        """Plane index of a layer id, or None if the layer is not routed."""
+        return self._layer_index.get(layer)
+
+    def to_cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Cell (row, col) containing a point, clamped to the grid."""
+        col = int((x - self.bounds[0]) / self.pitch)
+        row = int((y - self.bounds[1]) / self.pitch)
+        return min(max(row, 0), self.rows - 1), min(max(col, 0), self.cols - 1)
+
+    def to_point(self, row: int, col: int) -> Tuple[float, float]:
+        """Center of a cell in mm."""
+        return (self.bounds[0] + (col + 0.5) * self.pitch,
+                self.bounds[1] + (row + 0.5) * self.pitch)
+
+    def rect_cells(self, rect: Rect) -> Tuple[int, int, int, int]:
+        """Cell range (r0, r1, c0, c1) whose centers lie inside a rectangle."""
+        c0 = int(math.ceil((rect[0] - self.bounds[0]) / self.pitch - 0.5))
+        r0 = int(math.ceil((rect[1] - self.bounds[1]) / self.pitch - 0.5))
+        c1 = int(math.floor((rect[2] - self.bounds[0]) / self.pitch - 0.5)) + 1
+        r1 = int(math.floor((rect[3] - self.bounds[1]) / self.pitch - 0.5)) + 1
+        return (min(max(r0, 0), self.rows), min(max(r1, 0), self.rows),
+                min(max(c0, 0), self.cols), min(max(c1, 0), self.cols))
+
+    def add_rect(self, rect: Rect, layers: Optional[Iterable[int]] = None,
+                 net_id: int = BLOCKED) -> None:
+        """Mark fixed copper (or an obstacle) covering a rectangle.
+
+        Args:
+            rect: Rectangle in mm
+            layers: Layer ids; all layers if None
+            net_id: Owning net id, or ``BLOCKED`` for an obstacle
+        """
+        r0, r1, c0, c1 = self.rect_cells(rect)
+        if r1 <= r0 or c1 <= c0:
+            # Smaller than a cell: mark the cell holding its center
+            r0, c0 = self.to_cell((rect[0] + rect[2]) / 2, (rect[1] + rect[3]) / 2)
+            r1, c1 = r0 + 1, c0 + 1
+        for index in self._layer_indices(layers):
+            self._mark_fixed(self.fixed[index, r0:r1, c0:c1], net_id)
+
+    def add_segment(self, x1: float, y1: float, x2: float, y2: float, half_width: float,
+                    layer: int, net_id: int = BLOCKED) -> None:
+        """Mark fixed copper of a track segment.
+
+        Args:
+            x1, y1, x2, y2: End points in mm
+            half_width: Half the track width in mm
+            layer: Layer id
+            net_id: Owning net id
+        """
+        index = self.layer_index(layer)
+        if index is None:
+            return
+        margin = half_width + self.pitch
+        r0, r1, c0, c1 = self.rect_cells((min(x1, x2) - margin, min(y1, y2) - margin,
+                                          max(x1, x2) + margin, max(y1, y2) + margin))
+        if r1 <= r0 or c1 <= c0:
+            return
+        xs = self.bounds[0] + (np.arange(c0, c1) + 0.5) * self.pitch
+        ys = self.bounds[1] + (np.arange(r0, r1) + 0.5) * self.pitch
+        px, py = np.meshgrid(xs, ys)
+        dx, dy = x2 - x1, y2 - y1
+        length_sq = dx * dx + dy * dy
+        if length_sq > 0:
+            t = np.clip(((px - x1) * dx + (py - y1) * dy) / length_sq, 0.0, 1.0)
+        else:
+            t = 0.0
+        distance = np.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
+        mask = distance <= half_width + self.pitch / 2
+        window = self.fixed[index, r0:r1, c0:c1]
+        self._mark_fixed(window, net_id, mask)
+
+    def add_via(self, x: float, y: float, radius: float, net_id: int = BLOCKED) -> None:
+        """Mark fixed copper of a through via on all layers."""
+        for layer in self.layers:
+            self.add_segment(x, y, x, y, radius, layer, net_id)
+
+    @classmethod
+    def from_snapshot(cls,
+                      snapshot: Any,
+                      layers: Optional[Sequence[int]] = None,
+                      pitch: float = 0.1,
+                      max_cells: int = 8_000_000,
+                      edge_clearance: float = 0.3) -> "RoutingGrid":
+        """Rasterize a ``BoardSnapshot``.
+
+        Pads, tracks and vias become fixed copper of their net; unconnected
+        pads are obstacles. Pad ids are the snapshot's interned net ids.
+
+        Args:
+            snapshot: Board snapshot
+            layers: Copper layer ids to route on; defaults to the layers
+                used by tracks and footprints
+            pitch: Cell size in mm
+            max_cells: Upper bound on cells over all layers
+            edge_clearance: Band along the board edge kept free of copper
+
+        Returns:
+            Populated grid
+        """
+        left, top, right, bottom = (v / _NM_PER_MM for v in snapshot.board_box)
+        if right <= left or bottom <= top:
+            xs = np.concatenate([snapshot.pads.x, snapshot.tracks.start_x,
+                                 snapshot.tracks.end_x]) / _NM_PER_MM
+            ys = np.concatenate([snapshot.pads.y, snapshot.tracks.start_y,
+                                 snapshot.tracks.end_y]) / _NM_PER_MM
+            if xs.size:
+                left, top, right, bottom = xs.min() - 5, ys.min() - 5, xs.max() + 5, ys.max() + 5
+            else:
+                left, top, right, bottom = 0.0, 0.0, 100.0, 100.0
+        if layers is None:
+            used = set(snapshot.tracks.layer.tolist()) | set(snapshot.footprints.layer.tolist())
+            layers = sorted(used) or [0]
+        grid = cls((left, top, right, bottom), layers, pitch=pitch, max_cells=max_cells,
+                   edge_clearance=edge_clearance)
+
+        pads = snapshot.pads
+        footprints = snapshot.footprints
+        pad_layers = np.zeros(len(pads), dtype=np.int64)
+        pad_orientation = np.zeros(len(pads))
+        for i in range(len(footprints)):
+            start, end = footprints.pad_offset[i], footprints.pad_offset[i + 1]
+            pad_layers[start:end] = footprints.layer[i]
+            pad_orientation[start:end] = footprints.orientation[i]
+        for i in range(len(pads)):
+            x, y = pads.x[i] / _NM_PER_MM, pads.y[i] / _NM_PER_MM
+            half_w, half_h = _pad_half_size(pads.size_x[i] / _NM_PER_MM,
+                                            pads.size_y[i] / _NM_PER_MM, pad_orientation[i])
+            net_id = int(pads.net[i]) or BLOCKED
+            on_layers = None if pads.is_pth[i] else [int(pad_layers[i])]
+            grid.add_rect((x - half_w, y - half_h, x + half_w, y + half_h), on_layers, net_id)
+
+        tracks = snapshot.tracks
+        for i in range(len(tracks)):
+            grid.add_segment(tracks.start_x[i] / _NM_PER_MM, tracks.start_y[i] / _NM_PER_MM,
+                             tracks.end_x[i] / _NM_PER_MM, tracks.end_y[i] / _NM_PER_MM,
+                             tracks.width[i] / _NM_PER_MM / 2, int(tracks.layer[i]),
+                             int(tracks.net[i]) or BLOCKED)
+
+        vias = snapshot.vias
+        for i in range(len(vias)):
+            grid.add_via(vias.x[i] / _NM_PER_MM, vias.y[i] / _NM_PER_MM,
+                         vias.width[i] / _NM_PER_MM / 2, int(vias.net[i]) or BLOCKED)
+        return grid
+
+    def _layer_indices(self, layers: Optional[Iterable[int]]) -> List[int]:
+        if layers is None:
+            return list(range(len(self.layers)))
+        return [i for i in (self.layer_index(layer) for layer in layers) if i is not None]
+
+    @staticmethod
+    def _mark_fixed(window: np.ndarray, net_id: int, mask: Optional[np.ndarray] = None) -> None:
+        """Write a net id into free cells; cells claimed by two nets become obstacles."""
+        if mask is None:
+            mask = np.ones(window.shape, dtype=bool)
+        window[mask & (window == FREE)] = net_id
+        window[mask & (window != net_id) & (window != FREE)] = BLOCKED
+
+
+class MazeRouter:
+    """A* maze router with negotiated-congestion rip-up and reroute."""
+
+    def __init__(self,
+                 grid: RoutingGrid,
+                 via_cost: float = 2.0,
+                 via_diameter: float = 0.6,
+                 other_layer_factor: float = 1.5,
+                 avoid_layer_factor: float = 10.0,
+                 present_factor: float = 0.5,
+                 present_growth: float = 1.8,
+                 history_increment: float = 1.0,
+                 max_iterations: int = 8,
+                 window_margin: float = 5.0,
+                 max_workers: Optional[int] = None,
+                 min_parallel_cells: int = 500_000):
+        """Initialize the router.
+
+        Args:
+            grid: Occupancy grid; routed copper is recorded in it
+            via_cost: Cost of a via as an equivalent track length in mm
+            via_diameter: Via pad diameter in mm
+            other_layer_factor: Cost factor for layers other than the
+                preferred one
+            avoid_layer_factor: Cost factor for a net's avoided layers
+            present_factor: Initial price of sharing a cell with another net
+            present_growth: Growth of that price per rip-up pass
+            history_increment: History cost added to contested cells per pass
+            max_iterations: Maximum number of routing passes
+            window_margin: Margin around a net's pins that bounds its search
+            max_workers: Worker processes for nets with disjoint windows
+            min_parallel_cells: Smallest batch (in search cells) worth
+                sending to worker processes
+        """
+        self.grid = grid
+        self.via_cost = via_cost
+        self.via_diameter = via_diameter
+        self.other_layer_factor = other_layer_factor
+        self.avoid_layer_factor = avoid_layer_factor
+        self.present_factor = present_factor
+        self.present_growth = present_growth
+        self.history_increment = history_increment
+        self.max_iterations = max_iterations
+        self.window_margin = window_margin
+        self.max_workers = max_workers
+        self.min_parallel_cells = min_parallel_cells
+        self._clearance = 0.0
+        self._net_cells: Dict[str, np.ndarray] = {}
+        self._net_paths: Dict[str, List[np.ndarray]] = {}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def route_nets(self, nets: Sequence[RoutingNet], parallel: bool = True) -> MazeRoutingResult:
+        """Route nets with rip-up and reroute until no cell is shared.
+
+        Args:
+            nets: Nets to route
+            parallel: Route nets with disjoint search windows in worker
+                processes
+
+        Returns:
+            Routing result
+        """
+        start = time.perf_counter()
+        nets = sorted((net for net in nets if len(net.pins) >= 2), key=_pin_span)
+        routes = {net.name: NetRoute(net=net.name) for net in nets}
+        self._clearance = max([self._clearance] + [float(net.rules.min_clearance) for net in nets])
+        present = self.present_factor
+        pending = list(nets)
+        iterations = 0
+
+        executor: Optional[ProcessPoolExecutor] = None
+        workers = max(1, self.max_workers or os.cpu_count() or 1)
+        try:
+            while pending and iterations < self.max_iterations:
+                iterations += 1
+                for batch in self._batches(pending):
+                    for net in batch:
+                        self.rip_up(net.name)
+                    tasks = [self._build_task(net, present) for net in batch]
+                    # Small batches are cheaper to search here than to ship to workers
+                    cells = sum(task["cost"].size for task in tasks)
+                    fan_out = (parallel and workers > 1 and len(batch) > 1
+                               and cells >= self.min_parallel_cells)
+                    if fan_out and executor is None:
+                        try:
+                            executor = ProcessPoolExecutor(max_workers=workers)
+                        except (OSError, ValueError) as e:
+                            logger.warning(
+                                f"Parallel routing unavailable, routing serially: {str(e)}"
+                            )
+                            parallel = fan_out = False
+                    outcomes = self._search(tasks, executor if fan_out else None)
+                    for net, task, (paths, complete) in zip(batch, tasks, outcomes):
+                        self._commit(net, task, paths)
+                        routes[net.name].success = complete
+                        routes[net.name].paths = [
+                            self._to_routed_path(path) for path in self._net_paths[net.name]
+                        ]
+
+                conflicts = self._find_conflicts(nets)
+                for net in nets:
+                    routes[net.name].conflict = net.name in conflicts
+                if not conflicts:
+                    break
+                for cells in conflicts.values():
+                    self.grid.history.flat[cells] += self.history_increment
+                present *= self.present_growth
+                pending = [net for net in nets if net.name in conflicts]
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        result = MazeRoutingResult(routes=routes, iterations=iterations,
+                                   seconds=time.perf_counter() - start)
+        logger.info(
+            f"Routed {len(nets) - len(result.failed)}/{len(nets)} nets in {iterations} passes "
+            f"({len(result.conflicting)} still conflicting, {result.seconds:.2f}s)"
+        )
+        return result
+
+    def route_connection(self,
+                         start: Tuple[float, float],
+                         end: Tuple[float, float],
+                         rules: Any,
+                         name: str = "",
+                         net_id: int = 0,
+                         layers: Optional[Sequence[int]] = None) -> Optional[RoutedPath]:
+        """Route and commit a single two-point connection.
+
+        Args:
+            start: Start point (x, y) in mm
+            end: End point (x, y) in mm
+            rules: Routing constraints (see ``RoutingNet``)
+            name: Net name under which the copper is recorded
+            net_id: Grid net id of the connection's fixed copper, if any
+            layers: Layers the end points may be on; all layers if None
+
+        Returns:
+            Routed path, or None if no path exists
+        """
+        layers = tuple(self.grid.layers if layers is None else layers)
+        net = RoutingNet(
+            name=name or f"connection-{len(self._net_cells)}",
+            pins=[RoutingPin(start[0], start[1], layers), RoutingPin(end[0], end[1], layers)],
+            rules=rules,
+            net_id=net_id
+        )
+        self._clearance = max(self._clearance, float(rules.min_clearance))
+        task = self._build_task(net, self.present_factor)
+        paths, complete = _route_tree(task)
+        if not complete:
+            return None
+        self._commit(net, task, paths, append=True)
+        return self._to_routed_path(self._net_paths[net.name][-1])
+
+    def rip_up(self, name: str) -> None:
+        """Remove the routed copper of a net from the grid."""
+        cells = self._net_cells.pop(name, None)
+        if cells is not None and cells.size:
+            np.subtract.at(self.grid.usage.reshape(-1), cells, 1)
+        self._net_paths.pop(name, None)
+
+    # ------------------------------------------------------------------
+    # Search tasks
+    # ------------------------------------------------------------------
+
+    def _radius(self, rules: Any) -> int:
+        """Dilation in cells that keeps a net's centerline clear of other copper."""
+        clearance = max(float(rules.min_clearance), self._clearance)
+        return int(math.ceil((float(rules.min_width) / 2 + clearance) / self.grid.pitch))
+
+    def _window(self, net: RoutingNet) -> Tuple[int, int, int, int]:
+        """Cell window (r0, r1, c0, c1) around a net's pins."""
+        xs = [pin.x for pin in net.pins]
+        ys = [pin.y for pin in net.pins]
+        margin = self.window_margin
+        grid = self.grid
+        r0, c0 = grid.to_cell(min(xs) - margin, min(ys) - margin)
+        r1, c1 = grid.to_cell(max(xs) + margin, max(ys) + margin)
+        return r0, r1 + 1, c0, c1 + 1
+
+    def _batches(self, nets: Sequence[RoutingNet]) -> List[List[RoutingNet]]:
+        """Group nets into batches whose (dilated) windows do not overlap."""
+        batches: List[Tuple[List[RoutingNet], List[Tuple[int, int, int, int]]]] = []
+        for net in nets:
+            r0, r1, c0, c1 = self._window(net)
+            pad = self._radius(net.rules) + 1
+            box = (r0 - pad, r1 + pad, c0 - pad, c1 + pad)
+            for members, boxes in batches:
+                if not any(_boxes_overlap(box, other) for other in boxes):
+                    members.append(net)
+                    boxes.append(box)
+                    break
+            else:
+                batches.append(([net], [box]))
+        return [members for members, _ in batches]
+
+    def _build_task(self, net: RoutingNet, present: float) -> Dict[str, Any]:
+        """Build the cost planes of one net's search window."""
+        grid = self.grid
+        r0, r1, c0, c1 = self._window(net)
+        radius = self._radius(net.rules)
+        size = (1, 2 * radius + 1, 2 * radius + 1)
+
+        fixed = grid.fixed[:, r0:r1, c0:c1]
+        own_fixed = fixed == net.net_id if net.net_id > 0 else np.zeros(fixed.shape, dtype=bool)
+        other_fixed = (fixed != FREE) & ~own_fixed
+        hard = maximum_filter(other_fixed, size=size, mode="nearest") & ~own_fixed
+        soft = maximum_filter(grid.usage[:, r0:r1, c0:c1], size=size,
+                              mode="nearest").astype(np.float32)
+
+        via_clearance = max(float(net.rules.min_clearance), self._clearance)
+        via_radius = int(math.ceil((self.via_diameter / 2 + via_clearance) / grid.pitch))
+        via_size = (2 * via_radius + 1, 2 * via_radius + 1)
+        via_blocked = maximum_filter(other_fixed.any(axis=0), size=via_size, mode="nearest")
+
+        factors = np.array([self._layer_factor(layer, net.rules) for layer in grid.layers],
+                           dtype=np.float32)
+        cost = (factors[:, None, None] * (1.0 + grid.history[:, r0:r1, c0:c1])
+                * (1.0 + present * soft))
+        cost[hard] = np.inf
+        via_cost = self.via_cost * (1.0 + present * soft.max(axis=0))
+        via_cost[via_blocked] = np.inf
+
+        pins = []
+        for pin in net.pins:
+            cells = self._pin_cells(pin, r0, r1, c0, c1)
+            # A pin may sit inside another net's clearance halo; its own
+            # cells stay enterable so the search can leave it
+            for index in cells:
+                if not np.isfinite(cost.flat[index]):
+                    cost.flat[index] = factors[index // ((r1 - r0) * (c1 - c0))]
+            pins.append(cells)
+
+        return {
+            "shape": cost.shape,
+            "cost": cost,
+            "via_cost": via_cost,
+            "pins": pins,
+            "pitch": grid.pitch,
+            "min_factor": float(factors.min()),
+            "origin": (r0, c0),
+            "radius": radius
+        }
+
+    def _layer_factor(self, layer: int, rules: Any) -> float:
+        if layer == getattr(rules, "preferred_layer", None):
+            return 1.0
+        if layer in (getattr(rules, "avoid_layers", None) or ()):
+            return self.avoid_layer_factor
+        return self.other_layer_factor
+
+    def _pin_cells(self, pin: RoutingPin, r0: int, r1: int, c0: int, c1: int) -> List[int]:
+        """Flat window indices of the cells covered by a pin."""
+        grid = self.grid
+        rows, cols = r1 - r0, c1 - c0
+        pr0, pr1, pc0, pc1 = grid.rect_cells((pin.x - pin.half_width, pin.y - pin.half_height,
+                                              pin.x + pin.half_width, pin.y + pin.half_height))
+        if pr1 <= pr0 or pc1 <= pc0:
+            pr0, pc0 = grid.to_cell(pin.x, pin.y)
+            pr1, pc1 = pr0 + 1, pc0 + 1
+        pr0, pr1 = max(pr0, r0), min(pr1, r1)
+        pc0, pc1 = max(pc0, c0), min(pc1, c1)
+        cells = []
+        for layer in pin.layers:
+            index = grid.layer_index(layer)
+            if index is None:
+                continue
+            for row in range(pr0, pr1):
+                base = (index * rows + row - r0) * cols - c0
+                cells.extend(base + col for col in range(pc0, pc1))
+        return cells
+
+    def _search(self, tasks: List[Dict[str, Any]],
+                executor: Optional[ProcessPoolExecutor]) -> List[Tuple[List[List[int]], bool]]:
+        """Run the A* searches of a batch, in worker processes if possible."""
+        if executor is not None:
+            try:
+                return list(executor.map(_route_tree, tasks))
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Parallel routing failed, routing serially: {str(e)}")
+        return [_route_tree(task) for task in tasks]
+
+    # ------------------------------------------------------------------
+    # Committing and conflicts
+    # ------------------------------------------------------------------
+
+    def _commit(self, net: RoutingNet, task: Dict[str, Any], paths: List[List[int]],
+                append: bool = False) -> None:
+        """Record a net's routed copper in the usage plane.
+
+        Args:
+            net: Routed net
+            task: The net's search task
+            paths: Paths as flat window indices
+            append: Add to the net's existing copper instead of replacing it
+        """
+        grid = self.grid
+        _, rows, cols = task["shape"]
+        r0, c0 = task["origin"]
+        track_radius = int(round(float(net.rules.min_width) / 2 / grid.pitch))
+        via_radius = int(round(self.via_diameter / 2 / grid.pitch))
+
+        # Rasterize into the search window grown by the copper radius
+        grow = max(track_radius, via_radius)
+        w_r0, w_c0 = max(0, r0 - grow), max(0, c0 - grow)
+        w_r1, w_c1 = min(grid.rows, r0 + rows + grow), min(grid.cols, c0 + cols + grow)
+        copper = np.zeros((len(grid.layers), w_r1 - w_r0, w_c1 - w_c0), dtype=bool)
+        global_paths = []
+        for path in paths:
+            layer, rest = np.divmod(np.asarray(path, dtype=np.int64), rows * cols)
+            row, col = np.divmod(rest, cols)
+            row += r0
+            col += c0
+            global_paths.append(np.ravel_multi_index((layer, row, col), grid.shape))
+            copper[layer, row - w_r0, col - w_c0] = True
+            for i in np.nonzero(np.diff(layer))[0]:
+                self._mark_disc(copper, None, int(row[i]) - w_r0, int(col[i]) - w_c0, via_radius)
+        if track_radius > 0:
+            copper = maximum_filter(copper, size=(1, 2 * track_radius + 1, 2 * track_radius + 1))
+        layer, row, col = np.nonzero(copper)
+        cells = np.ravel_multi_index((layer, row + w_r0, col + w_c0), grid.shape)
+        np.add.at(grid.usage.reshape(-1), cells, 1)
+
+        if append and net.name in self._net_cells:
+            cells = np.concatenate((self._net_cells[net.name], cells))
+            global_paths = self._net_paths.get(net.name, []) + global_paths
+        self._net_cells[net.name] = cells
+        self._net_paths[net.name] = global_paths
+
+    @staticmethod
+    def _mark_disc(plane: np.ndarray, layer: Optional[int], row: int, col: int,
+                   radius: int) -> None:
+        rows, cols = plane.shape[1], plane.shape[2]
+        rs = slice(max(0, row - radius), min(rows, row + radius + 1))
+        cs = slice(max(0, col - radius), min(cols, col + radius + 1))
+        if layer is None:
+            plane[:, rs, cs] = True
+        else:
+            plane[layer, rs, cs] = True
+
+    def _find_conflicts(self, nets: Sequence[RoutingNet]) -> Dict[str, np.ndarray]:
+        """Centerline cells of every net that lie within another net's clearance."""
+        grid = self.grid
+        conflicts: Dict[str, np.ndarray] = {}
+        for net in nets:
+            paths = self._net_paths.get(net.name)
+            if not paths:
+                continue
+            centerline = np.unique(np.concatenate(paths))
+            layer, row, col = np.unravel_index(centerline, grid.shape)
+            radius = self._radius(net.rules)
+            r0, r1 = max(0, int(row.min()) - radius), min(grid.rows, int(row.max()) + radius + 1)
+            c0, c1 = max(0, int(col.min()) - radius), min(grid.cols, int(col.max()) + radius + 1)
+            others = grid.usage[:, r0:r1, c0:c1].astype(np.int32)
+            own_layer, own_row, own_col = np.unravel_index(self._net_cells[net.name], grid.shape)
+            inside = (own_row >= r0) & (own_row < r1) & (own_col >= c0) & (own_col < c1)
+            np.subtract.at(others,
+                           (own_layer[inside], own_row[inside] - r0, own_col[inside] - c0), 1)
+            near = maximum_filter(others, size=(1, 2 * radius + 1, 2 * radius + 1), mode="nearest")
+            hit = near[layer, row - r0, col - c0] > 0
+            if hit.any():
+                conflicts[net.name] = centerline[hit]
+        return conflicts
+
+    def _to_routed_path(self, cells: np.ndarray) -> RoutedPath:
+        """Turn a chain of grid cells into a polyline, merging straight runs."""
+        grid = self.grid
+        layer, row, col = np.unravel_index(np.asarray(cells), grid.shape)
+        points: List[Tuple[float, float, int]] = []
+        vias: List[Tuple[float, float]] = []
+        length = 0.0
+        direction = None
+        for i in range(len(cells)):
+            x, y = grid.to_point(int(row[i]), int(col[i]))
+            layer_id = grid.layers[int(layer[i])]
+            if i == 0:
+                points.append((x, y, layer_id))
+                continue
+            if layer[i] != layer[i - 1]:
+                vias.append((x, y))
+                points.append((x, y, layer_id))
+                direction = None
+                continue
+            step = (int(row[i] - row[i - 1]), int(col[i] - col[i - 1]))
+            length += grid.pitch * math.hypot(*step)
+            if step == direction:
+                points[-1] = (x, y, layer_id)
+            else:
+                points.append((x, y, layer_id))
+                direction = step
+        return RoutedPath(points=points, vias=vias, length=length)
+
+
+# ----------------------------------------------------------------------
+# A* search (module level so it can run in worker processes)
+# ----------------------------------------------------------------------
+
+def _route_tree(task: Dict[str, Any]) -> Tuple[List[List[int]], bool]:
+    """Connect all pins of a net, growing a tree one pin at a time.
+
+    Args:
+        task: Search window built by ``MazeRouter._build_task``
+
+    Returns:
+        (paths as lists of flat window indices, whether every pin connected)
+    """
+    layers, rows, cols = task["shape"]
+    plane = rows * cols
+    pins = [pin for pin in task["pins"] if pin]
+    complete = len(pins) == len(task["pins"])
+    if len(pins) < 2:
+        return [], complete
+
+    cost = task["cost"].ravel().tolist()
+    via_cost = task["via_cost"].ravel().tolist()
+    pitch = task["pitch"]
+    min_factor = task["min_factor"] * pitch
+
+    def center(cells: List[int]) -> Tuple[float, float]:
+        rs = [(c % plane) // cols for c in cells]
+        cs = [c % cols for c in cells]
+        return sum(rs) / len(rs), sum(cs) / len(cs)
+
+    centers = [center(pin) for pin in pins]
+    tree: Set[int] = set(pins[0])
+    tree_centers = [centers[0]]
+    remaining = list(range(1, len(pins)))
+    paths: List[List[int]] = []
+
+    while remaining:
+        target = min(remaining, key=lambda p: min(
+            abs(centers[p][0] - r) + abs(centers[p][1] - c) for r, c in tree_centers))
+        remaining.remove(target)
+        path = _astar(tree, set(pins[target]), cost, via_cost, layers, rows, cols, pitch,
+                      min_factor)
+        if path is None:
+            complete = False
+            continue
+        paths.append(path)
+        tree.update(path)
+        tree.update(pins[target])
+        tree_centers.append(centers[target])
+    return paths, complete
+
+
+def _astar(sources: Set[int], targets: Set[int], cost: List[float], via_cost: List[float],
+           layers: int, rows: int, cols: int, pitch: float,
+           min_factor: float) -> Optional[List[int]]:
+    """Cheapest path from any source cell to any target cell."""
+    plane = rows * cols
+    t_rows = [(t % plane) // cols for t in targets]
+    t_cols = [t % cols for t in targets]
+    tr0, tr1, tc0, tc1 = min(t_rows), max(t_rows), min(t_cols), max(t_cols)
+
+    def heuristic(index: int) -> float:
+        rest = index % plane
+        row, col = divmod(rest, cols)
+        dr = tr0 - row if row < tr0 else (row - tr1 if row > tr1 else 0)
+        dc = tc0 - col if col < tc0 else (col - tc1 if col > tc1 else 0)
+        low, high = (dr, dc) if dr < dc else (dc, dr)
+        return (high - low + _SQRT2 * low) * min_factor
+
+    inf = math.inf
+    best: Dict[int, float] = {}
+    parent: Dict[int, int] = {}
+    heap: List[Tuple[float, float, int]] = []
+    for source in sources:
+        if cost[source] < inf:
+            best[source] = 0.0
+            parent[source] = -1
+            heapq.heappush(heap, (heuristic(source), 0.0, source))
+
+    while heap:
+        _, g, index = heapq.heappop(heap)
+        if g > best.get(index, inf):
+            continue
+        if index in targets:
+            path = [index]
+            while parent[path[-1]] >= 0:
+                path.append(parent[path[-1]])
+            path.reverse()
+            return path
+
+        layer, rest = divmod(index, plane)
+        row, col = divmod(rest, cols)
+        base = layer * plane
+        for d_row, d_col, step in _PLANAR_MOVES:
+            nr, nc = row + d_row, col + d_col
+            if nr < 0 or nr >= rows or nc < 0 or nc >= cols:
+                continue
+            neighbour = base + nr * cols + nc
+            cell_cost = cost[neighbour]
+            if cell_cost == inf:
+                continue
+            if d_row and d_col and (cost[base + nr * cols + col] == inf
+                                    or cost[base + row * cols + nc] == inf):
+                continue  # Do not cut corners past obstacles
+
+            candidate = g + step * pitch * cell_cost
+            if candidate < best.get(neighbour, inf):
+                best[neighbour] = candidate
+                parent[neighbour] = index
+                heapq.heappush(heap, (candidate + heuristic(neighbour), candidate, neighbour))
+
+        penalty = via_cost[rest]
+        if penalty == inf:
+            continue
+        for other in range(layers):
+            if other == layer:
+                continue
+            neighbour = other * plane + rest
+            if cost[neighbour] == inf:
+                continue
+            candidate = g + penalty
+            if candidate < best.get(neighbour, inf):
+                best[neighbour] = candidate
+                parent[neighbour] = index
+                heapq.heappush(heap, (candidate + heuristic(neighbour), candidate, neighbour))
+    return None
+
+
+def _pad_half_size(size_x: float, size_y: float, orientation: float) -> Tuple[float, float]:
+    """Half extents of a pad's axis-aligned bounding box."""
+    turn = orientation % 180.0
+    if turn == 0.0:
+        return size_x / 2, size_y / 2
+    if turn == 90.0:
+        return size_y / 2, size_x / 2
+    half = math.hypot(size_x, size_y) / 2
+    return half, half
+
+
+def _pin_span(net: RoutingNet) -> float:
+    """Half-perimeter of a net's pins; short nets are routed first."""
+    xs = [pin.x for pin in net.pins]
+    ys = [pin.y for pin in net.pins]
+    return max(xs) - min(xs) + max(ys) - min(ys)
+
+
+def _boxes_overlap(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> bool:
+    return a[0] < b[1] and b[0] < a[1] and a[2] < b[3] and b[2] < a[3]
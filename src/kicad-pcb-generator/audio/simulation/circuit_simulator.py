@@ -2,7 +2,8 @@
 Circuit simulator for audio circuits.
 """
 import numpy as np
-from typing import Dict, Any, List, Optional, Callable
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from enum import Enum
 from dataclasses import dataclass
 import logging
@@ -10,9 +11,21 @@ import pcbnew
 import math
 
 from ...core.validation.base_validator import BaseValidator
+from ...core.board.snapshot import BoardSnapshot
+from .mna import MNASystem, build_system, resolve_input_net
+from .sweep import Distribution, SweepResult, run_sweep
+from .transient import DEFAULT_CHUNK_SIZE, TRAPEZOIDAL, TransientEngine, input_waveform, sampled_waveform
+from .result_cache import (
+    SimulationCache, content_key, decode_value, encode_value, DEFAULT_MAX_ENTRIES, DEFAULT_MAX_BYTES
+)
 
 logger = logging.getLogger(__name__)
 
+# Stamped MNA systems and transient engines kept with their factorizations;
+# the least recently used are dropped first
+MAX_MNA_SYSTEMS = 16
+MAX_TRANSIENT_ENGINES = 8
+
 class SimulationType(Enum):
     """Types of circuit simulation."""
     DC = "dc"
@@ -46,21 +59,56 @@ class SimulationResult:
     def type(self, value: SimulationType) -> None:  # pragma: no cover
         self.simulation_type = value
 
+def _encode_result(result: SimulationResult) -> Dict[str, Any]:
+    """Encode a simulation result for the result cache."""
+    return {
+        "simulation_type": result.simulation_type.value,
+        "data": encode_value(result.data),
+        "metadata": encode_value(result.metadata),
+        "success": result.success,
+        "error_message": result.error_message
+    }
+
+def _decode_result(data: Dict[str, Any]) -> SimulationResult:
+    """Rebuild a simulation result read from the result cache."""
+    return SimulationResult(
+        simulation_type=SimulationType(data["simulation_type"]),
+        data=decode_value(data["data"]),
+        metadata=decode_value(data["metadata"]),
+        success=data["success"],
+        error_message=data.get("error_message")
+    )
+
 class CircuitSimulator(BaseValidator):
     """Circuit simulator for audio circuits."""
     
-    def __init__(self, board: Optional[pcbnew.BOARD] = None):
+    def __init__(self, board: Optional[pcbnew.BOARD] = None,
+                 cache_entries: int = DEFAULT_MAX_ENTRIES,
+                 cache_bytes: int = DEFAULT_MAX_BYTES,
+                 cache_dir: Optional[str] = None):
         """Initialize the circuit simulator.
 
         Args:
             board: Optional KiCad BOARD object (mocked in unit-tests).  When
                    *None*, the simulator falls back to ``pcbnew.GetBoard()`` at
                    runtime.
+            cache_entries: Maximum number of results kept in memory
+            cache_bytes: Maximum encoded size of the results kept in memory
+            cache_dir: Optional directory for persisting results on disk
         """
         super().__init__()
         self.board: Optional[pcbnew.BOARD] = board
         self.callbacks: List[Callable] = []
-        self.results_cache: Dict[str, SimulationResult] = {}
+        self.results_cache = SimulationCache(
+            max_entries=cache_entries,
+            max_bytes=cache_bytes,
+            cache_dir=cache_dir,
+            encode=_encode_result,
+            decode=_decode_result
+        )
+        # Stamped MNA systems keep their DC and sweep factorizations between runs
+        self._mna_systems: "OrderedDict[Any, MNASystem]" = OrderedDict()
+        self._transient_engines: "OrderedDict[Any, TransientEngine]" = OrderedDict()
         
     def add_simulation_callback(self, callback: Callable) -> None:
         """Add a callback to be called after simulation.
@@ -80,16 +128,16 @@ class CircuitSimulator(BaseValidator):
         Returns:
             Simulation result
         """
-        # Create cache key
-        cache_key = f"{simulation_type.value}_{hash(str(kwargs))}"
+        # Create circuit; the cache key covers its content, so board edits
+        # never return stale results
+        circuit = self._create_circuit()
+        cache_key = content_key(simulation_type.value, circuit, kwargs)
         
         # Check cache first
-        if cache_key in self.results_cache:
-            logger.debug(f"Using cached result for {cache_key}")
-            return self.results_cache[cache_key]
-        
-        # Create circuit
-        circuit = self._create_circuit()
+        cached = self.results_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached result for {cache_key[:12]}")
+            return cached
         
         # Run simulation based on type
         if simulation_type == SimulationType.DC:
@@ -112,7 +160,7 @@ class CircuitSimulator(BaseValidator):
             )
         
         # Cache result
-        self.results_cache[cache_key] = result
+        self.results_cache.put(cache_key, result)
         
         # Call callbacks
         for callback in self.callbacks:
@@ -123,6 +171,87 @@ class CircuitSimulator(BaseValidator):
         
         return result
     
+    def run_sweep(self, simulation_type: SimulationType = SimulationType.AC,
+                  param_grid: Optional[Dict[str, List[Any]]] = None,
+                  distributions: Optional[Dict[str, Distribution]] = None,
+                  n_samples: int = 1000,
+                  specs: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+                  seed: Optional[int] = None,
+                  processes: Optional[int] = None,
+                  **kwargs) -> SweepResult:
+        """Run a parameter sweep or Monte-Carlo tolerance analysis.
+        
+        The circuit is extracted and stamped once; samples perturb component
+        values in array form and are solved in batches. DC sweeps measure
+        ``V(net)``, AC sweeps ``gain_db(net)`` at ``reference_frequency``
+        and ``bandwidth(net)``.
+        
+        Args:
+            simulation_type: DC or AC
+            param_grid: Component reference to swept values, e.g.
+                ``{"R2": ["10k", "22k"]}``
+            distributions: Component reference to tolerance, e.g.
+                ``{"R1": 0.01, "C1": ("uniform", 0.1)}``
+            n_samples: Monte-Carlo samples per grid point
+            specs: Metric name to (low, high) limits for the yield
+            seed: Random seed
+            processes: Worker processes; None evaluates in this process
+            **kwargs: Analysis parameters as for ``run_simulation`` plus
+                ``nets`` and ``reference_frequency``
+            
+        Returns:
+            Sweep result with per-sample metrics and statistical summaries
+        """
+        try:
+            if simulation_type not in (SimulationType.DC, SimulationType.AC):
+                raise ValueError(f"Sweeps support DC and AC simulation, not {simulation_type.value}")
+            circuit = self._create_circuit()
+            if not circuit or not circuit.get("components"):
+                raise ValueError("No circuit data available for sweep")
+            
+            frequencies = None
+            if simulation_type == SimulationType.AC:
+                system = self._get_mna_system(
+                    circuit, kwargs.get("voltage_sources"), kwargs.get("current_sources"),
+                    ac_source=resolve_input_net(circuit, kwargs.get("ac_source")),
+                    ac_amplitude=kwargs.get("ac_amplitude", 1.0)
+                )
+                frequencies = self._generate_audio_frequency_points(
+                    kwargs.get("start_frequency", 20.0), kwargs.get("stop_frequency", 80000.0),
+                    kwargs.get("num_points", 200), kwargs.get("high_precision", True)
+                )
+            else:
+                system = self._get_mna_system(circuit, kwargs.get("voltage_sources"), kwargs.get("current_sources"))
+            
+            nets = [
+                net_name for net_name in kwargs.get("nets", circuit.get("nets", {}))
+                if net_name in system.node_index
+            ]
+            result = run_sweep(
+                system, simulation_type.value, nets,
+                param_grid=param_grid,
+                distributions=distributions,
+                n_samples=n_samples,
+                specs=specs,
+                frequencies=frequencies,
+                reference_frequency=kwargs.get("reference_frequency", 1000.0),
+                seed=seed,
+                processes=processes
+            )
+            logger.info(f"Sweep completed for {result.n_samples} samples")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error in sweep: {str(e)}")
+            return SweepResult(
+                parameters=[],
+                values=np.zeros((0, 0)),
+                metrics={},
+                nominal={},
+                success=False,
+                error_message=f"Sweep failed: {str(e)}"
+            )
+    
     def _create_circuit(self) -> Dict[str, Any]:
         """Create a circuit for simulation.
         
@@ -136,7 +265,11 @@ class CircuitSimulator(BaseValidator):
                 logger.error("No board available for circuit creation")
                 return {}
             
-            # Extract circuit components and connections
+            # Extract the board once into arrays instead of walking SWIG objects
+            snapshot = BoardSnapshot.from_board(board)
+            names = snapshot.net_names
+            layer_names = snapshot.layer_names
+            
             circuit_data = {
                 "components": {},
                 "nets": {},
@@ -148,76 +281,79 @@ class CircuitSimulator(BaseValidator):
                 }
             }
             
-            # Extract components
-            for footprint in board.GetFootprints():
-                component_data = {
-                    "reference": footprint.GetReference(),
-                    "value": footprint.GetValue(),
-                    "position": (footprint.GetPosition().x, footprint.GetPosition().y),
-                    "orientation": footprint.GetOrientationDegrees(),
-                    "layer": footprint.GetLayerName(),
-                    "pads": []
+            # Extract components with their pads
+            footprints = snapshot.footprints
+            pads = snapshot.pads
+            pad_x, pad_y = pads.x.tolist(), pads.y.tolist()
+            pad_sx, pad_sy = pads.size_x.tolist(), pads.size_y.tolist()
+            pad_net, pad_shape = pads.net.tolist(), pads.shape.tolist()
+            offsets = footprints.pad_offset.tolist()
+            for i, ref in enumerate(footprints.reference):
+                circuit_data["components"][ref] = {
+                    "reference": ref,
+                    "value": footprints.value[i],
+                    "position": (int(footprints.x[i]), int(footprints.y[i])),
+                    "orientation": float(footprints.orientation[i]),
+                    "layer": layer_names.get(int(footprints.layer[i]), ""),
+                    "pads": [
+                        {
+                            "number": pads.number[p],
+                            "position": (pad_x[p], pad_y[p]),
+                            "net": names[pad_net[p]],
+                            "shape": str(pad_shape[p]),
+                            "size": (pad_sx[p], pad_sy[p])
+                        }
+                        for p in range(offsets[i], offsets[i + 1])
+                    ]
                 }
-                
-                # Extract pad information
-                for pad in footprint.Pads():
-                    pad_data = {
-                        "number": pad.GetNumber(),
-                        "position": (pad.GetPosition().x, pad.GetPosition().y),
-                        "net": pad.GetNetname() if pad.GetNet() else "",
-                        "shape": str(pad.GetShape()),
-                        "size": (pad.GetSize().x, pad.GetSize().y)
-                    }
-                    component_data["pads"].append(pad_data)
-                
-                circuit_data["components"][footprint.GetReference()] = component_data
             
-            # Extract nets and connections
-            for net in board.GetNetsByNetcode().values():
-                net_data = {
-                    "name": net.GetNetname(),
-                    "code": net.GetNetCode(),
+            # Extract nets; the code is the snapshot's interned net id
+            for code, name in enumerate(names):
+                circuit_data["nets"][name] = {
+                    "name": name,
+                    "code": code,
                     "tracks": [],
                     "vias": []
                 }
-                
-                # Extract tracks
-                for track in net.GetTracks():
-                    track_data = {
-                        "start": (track.GetStart().x, track.GetStart().y),
-                        "end": (track.GetEnd().x, track.GetEnd().y),
-                        "width": track.GetWidth(),
-                        "layer": track.GetLayerName()
-                    }
-                    net_data["tracks"].append(track_data)
-                
-                # Extract vias
-                for via in net.GetVias():
-                    via_data = {
-                        "position": (via.GetPosition().x, via.GetPosition().y),
-                        "diameter": via.GetDrill(),
-                        "layers": [via.GetLayerName()]
-                    }
-                    net_data["vias"].append(via_data)
-                
-                circuit_data["nets"][net.GetNetname()] = net_data
+            
+            t = snapshot.tracks
+            for net, layer, width, sx, sy, ex, ey in zip(
+                t.net.tolist(), t.layer.tolist(), t.width.tolist(),
+                t.start_x.tolist(), t.start_y.tolist(), t.end_x.tolist(), t.end_y.tolist()
+            ):
+                circuit_data["nets"][names[net]]["tracks"].append({
+                    "start": (sx, sy),
+                    "end": (ex, ey),
+                    "width": width,
+                    "layer": layer_names.get(layer, "")
+                })
+            
+            v = snapshot.vias
+            for net, layer, x, y, drill in zip(
+                v.net.tolist(), v.layer.tolist(), v.x.tolist(), v.y.tolist(), v.drill.tolist()
+            ):
+                circuit_data["nets"][names[net]]["vias"].append({
+                    "position": (x, y),
+                    "diameter": drill,
+                    "layers": [layer_names.get(layer, "")]
+                })
             
             # Extract board information
-            board_box = board.GetBoardBoundingBox()
+            width, height = snapshot.board_size
             circuit_data["board_info"]["dimensions"] = {
-                "width": board_box.GetWidth() / 1e6,  # Convert to mm
-                "height": board_box.GetHeight() / 1e6,
-                "area": (board_box.GetWidth() * board_box.GetHeight()) / 1e12  # Convert to mm²
+                "width": width,
+                "height": height,
+                "area": width * height
             }
             
             # Extract layer information
-            for layer_id in range(board.GetCopperLayerCount()):
-                layer_name = board.GetLayerName(layer_id)
+            for layer_id in range(snapshot.copper_layer_count):
+                layer_name = layer_names.get(layer_id)
                 if layer_name:
                     circuit_data["board_info"]["layers"].append({
                         "id": layer_id,
                         "name": layer_name,
-                        "type": "copper" if layer_id < board.GetCopperLayerCount() else "other"
+                        "type": "copper"
                     })
             
             logger.info(f"Created circuit with {len(circuit_data['components'])} components and {len(circuit_data['nets'])} nets")
@@ -227,6 +363,46 @@ class CircuitSimulator(BaseValidator):
             logger.error(f"Error creating circuit: {str(e)}")
             return {}
     
+    def _get_mna_system(self, circuit: Dict[str, Any],
+                        voltage_sources: Optional[Dict[str, float]] = None,
+                        current_sources: Optional[Dict[str, float]] = None,
+                        ac_source: Optional[str] = None,
+                        ac_amplitude: float = 1.0) -> MNASystem:
+        """Get the MNA system for a circuit, reusing an already factorized one.
+        
+        Args:
+            circuit: Circuit data
+            voltage_sources: Net name to DC voltage
+            current_sources: Net name to injected DC current
+            ac_source: Net driven by the AC excitation
+            ac_amplitude: AC excitation amplitude in V
+            
+        Returns:
+            Stamped MNA system
+        """
+        components = tuple(
+            (ref, str(data.get("value", "")),
+             tuple((str(pad.get("number", "")), pad.get("net", "")) for pad in data.get("pads", [])))
+            for ref, data in sorted(circuit.get("components", {}).items())
+        )
+        key = (
+            components,
+            tuple(circuit.get("nets", {})),
+            tuple(sorted((voltage_sources or {}).items())),
+            tuple(sorted((current_sources or {}).items())),
+            ac_source,
+            ac_amplitude
+        )
+        system = self._mna_systems.get(key)
+        if system is None:
+            system = build_system(circuit, voltage_sources, current_sources, ac_source, ac_amplitude)
+            self._mna_systems[key] = system
+            while len(self._mna_systems) > MAX_MNA_SYSTEMS:
+                self._mna_systems.popitem(last=False)
+        else:
+            self._mna_systems.move_to_end(key)
+        return system
+    
     def _run_dc_simulation(self, circuit: Dict[str, Any], **kwargs) -> SimulationResult:
         """Run DC simulation.
         
@@ -262,33 +438,41 @@ class CircuitSimulator(BaseValidator):
                 "iterations": 0
             }
             
-            # Calculate node voltages (simplified DC analysis)
-            for net_name, net_data in circuit.get("nets", {}).items():
-                if net_name in voltage_sources:
-                    # Voltage source node
-                    dc_results["node_voltages"][net_name] = voltage_sources[net_name]
-                elif net_name.startswith(("VCC", "VDD", "+")):
-                    # Power supply node
-                    dc_results["node_voltages"][net_name] = 5.0  # Default 5V
-                elif net_name.startswith(("GND", "VSS", "-")):
-                    # Ground node
-                    dc_results["node_voltages"][net_name] = 0.0
-                else:
-                    # Signal node - calculate based on connected components
-                    dc_results["node_voltages"][net_name] = self._calculate_node_voltage(net_name, net_data, voltage_sources)
-            
-            # Calculate branch currents
-            for net_name, net_data in circuit.get("nets", {}).items():
+            # Solve the operating point with the sparse MNA engine
+            system = self._get_mna_system(circuit, voltage_sources, current_sources)
+            x = system.solve_dc()
+            
+            for net_name in circuit.get("nets", {}):
+                dc_results["node_voltages"][net_name] = float(np.real(system.voltage(x, net_name)))
+            
+            # Branch currents: current delivered by a net's source, otherwise the
+            # current passing through the net's resistors
+            resistor_currents = system.resistor_currents(x)
+            throughput: Dict[str, float] = {}
+            for resistor, current in zip(system.resistors, resistor_currents):
+                for node in resistor.nodes:
+                    throughput[node] = throughput.get(node, 0.0) + 0.5 * abs(float(current))
+            branches = system.branch_values(x)
+            for net_name in circuit.get("nets", {}):
                 if net_name in current_sources:
                     dc_results["branch_currents"][net_name] = current_sources[net_name]
+                elif f"V_{net_name}" in branches:
+                    dc_results["branch_currents"][net_name] = -float(branches[f"V_{net_name}"])
                 else:
-                    # Calculate current based on connected components
-                    dc_results["branch_currents"][net_name] = self._calculate_branch_current(net_name, net_data)
+                    dc_results["branch_currents"][net_name] = throughput.get(net_name, 0.0)
+            dc_results["iterations"] = 1
             
             # Calculate power dissipation
+            resistor_power = {
+                resistor.name: float(current ** 2 * resistor.value)
+                for resistor, current in zip(system.resistors, resistor_currents)
+            }
             for component_ref, component_data in circuit.get("components", {}).items():
-                power = self._calculate_component_power(component_ref, component_data, dc_results)
-                dc_results["power_dissipation"][component_ref] = power
+                if component_ref in resistor_power:
+                    dc_results["power_dissipation"][component_ref] = resistor_power[component_ref]
+                else:
+                    power = self._calculate_component_power(component_ref, component_data, dc_results)
+                    dc_results["power_dissipation"][component_ref] = power
             
             # Add metadata
             metadata = {
@@ -302,7 +486,8 @@ class CircuitSimulator(BaseValidator):
                 "circuit_stats": {
                     "components": len(circuit.get("components", {})),
                     "nets": len(circuit.get("nets", {})),
-                    "nodes": len(dc_results["node_voltages"])
+                    "nodes": len(dc_results["node_voltages"]),
+                    "mna_size": system.size
                 }
             }
             
@@ -348,7 +533,7 @@ class CircuitSimulator(BaseValidator):
             start_freq = kwargs.get("start_frequency", 20.0)  # Hz - audio minimum
             stop_freq = kwargs.get("stop_frequency", 80000.0)  # Hz - extended audio bandwidth
             num_points = kwargs.get("num_points", 200)  # Increased for better precision
-            ac_source = kwargs.get("ac_source", "V1")
+            ac_source = resolve_input_net(circuit, kwargs.get("ac_source"))
             ac_amplitude = kwargs.get("ac_amplitude", 1.0)   # V
             high_precision = kwargs.get("high_precision", True)  # Enable high-precision mode
             
@@ -366,62 +551,57 @@ class CircuitSimulator(BaseValidator):
                 "precision_metrics": {}
             }
             
-            # Calculate frequency response for each net
-            for net_name, net_data in circuit.get("nets", {}).items():
-                if net_name.startswith(("GND", "VSS", "-")):
-                    continue  # Skip ground nets
-                
-                magnitude = []
-                phase = []
-                impedance = []
-                
-                for freq in frequencies:
-                    # Calculate magnitude response with enhanced precision
-                    mag = self._calculate_magnitude_response_high_precision(net_name, net_data, freq, ac_amplitude)
-                    magnitude.append(mag)
-                    
-                    # Calculate phase response with enhanced precision
-                    ph = self._calculate_phase_response_high_precision(net_name, net_data, freq)
-                    phase.append(ph)
-                    
-                    # Calculate impedance with enhanced precision
-                    imp = self._calculate_impedance_high_precision(net_name, net_data, freq)
-                    impedance.append(imp)
-                
-                ac_results["magnitude_response"][net_name] = magnitude
-                ac_results["phase_response"][net_name] = phase
-                ac_results["impedance"][net_name] = impedance
-                
-                # Calculate bandwidth analysis for this net
-                ac_results["bandwidth_analysis"][net_name] = self._analyze_bandwidth_characteristics(
-                    frequencies, magnitude, phase, high_precision
+            # Solve every frequency point in one batched sparse solve
+            system = self._get_mna_system(circuit, ac_source=ac_source, ac_amplitude=ac_amplitude)
+            solution = system.solve_ac(frequencies)
+            
+            net_names = [
+                net_name for net_name in circuit.get("nets", {})
+                if not net_name.startswith(("GND", "VSS", "-"))  # Skip ground nets
+            ]
+            impedance_nets = kwargs.get("impedance_nets")
+            impedance_nets = [
+                net_name for net_name in (net_names if impedance_nets is None else impedance_nets)
+                if net_name in system.node_index
+            ]
+            impedance = system.node_impedance(frequencies, nodes=impedance_nets)
+            impedance_column = {net_name: i for i, net_name in enumerate(impedance_nets)}
+            
+            # (nets x frequencies) responses and every derived metric as array operations
+            frequency_array = np.asarray(frequencies, dtype=float)
+            responses = system.voltages(solution, net_names).reshape(len(net_names), len(frequencies))
+            magnitudes = np.abs(responses)
+            phases = np.degrees(np.angle(responses))
+            impedance_magnitudes = np.abs(impedance)
+            bandwidth = self._analyze_bandwidth_arrays(frequency_array, magnitudes, phases, high_precision)
+            
+            for row, net_name in enumerate(net_names):
+                ac_results["magnitude_response"][net_name] = magnitudes[row].tolist()
+                ac_results["phase_response"][net_name] = phases[row].tolist()
+                column = impedance_column.get(net_name)
+                ac_results["impedance"][net_name] = (
+                    impedance_magnitudes[:, column].tolist() if column is not None else []
                 )
-            
-            # Calculate transfer functions with enhanced precision
-            for net_name in ac_results["magnitude_response"]:
-                if net_name != ac_source:
-                    transfer_mag = []
-                    transfer_phase = []
-                    
-                    for i, freq in enumerate(frequencies):
-                        # Calculate transfer function magnitude with high precision
-                        input_mag = ac_results["magnitude_response"].get(ac_source, [1.0])[i] if ac_source in ac_results["magnitude_response"] else 1.0
-                        output_mag = ac_results["magnitude_response"][net_name][i]
-                        transfer_mag.append(output_mag / input_mag if input_mag > 0 else 0.0)
-                        
-                        # Calculate transfer function phase with high precision
-                        input_phase = ac_results["phase_response"].get(ac_source, [0.0])[i] if ac_source in ac_results["phase_response"] else 0.0
-                        output_phase = ac_results["phase_response"][net_name][i]
-                        transfer_phase.append(output_phase - input_phase)
-                    
-                    ac_results["transfer_functions"][f"{ac_source}_to_{net_name}"] = {
-                        "magnitude": transfer_mag,
-                        "phase": transfer_phase
-                    }
+                ac_results["bandwidth_analysis"][net_name] = bandwidth[row]
+            
+            # Transfer functions from the AC source to every net
+            source_row = net_names.index(ac_source) if ac_source in net_names else None
+            source_response = responses[source_row] if source_row is not None else np.ones(len(frequencies), dtype=complex)
+            source_magnitude = np.abs(source_response)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                transfer_mag = np.where(source_magnitude > 0, magnitudes / source_magnitude, 0.0)
+            transfer_phase = phases - np.degrees(np.angle(source_response))
+            for row, net_name in enumerate(net_names):
+                if row == source_row:
+                    continue
+                ac_results["transfer_functions"][f"{ac_source}_to_{net_name}"] = {
+                    "magnitude": transfer_mag[row].tolist(),
+                    "phase": transfer_phase[row].tolist()
+                }
             
             # Calculate precision metrics
             ac_results["precision_metrics"] = self._calculate_precision_metrics(
-                frequencies, ac_results, high_precision
+                frequencies, ac_results, high_precision, magnitudes=magnitudes
             )
             
             # Add metadata
@@ -439,7 +619,8 @@ class CircuitSimulator(BaseValidator):
                 "circuit_stats": {
                     "components": len(circuit.get("components", {})),
                     "nets": len(circuit.get("nets", {})),
-                    "frequencies": len(frequencies)
+                    "frequencies": len(frequencies),
+                    "mna_size": system.size
                 },
                 "precision_info": {
                     "frequency_resolution": (stop_freq - start_freq) / num_points,
@@ -493,52 +674,64 @@ class CircuitSimulator(BaseValidator):
             time_step = kwargs.get("time_step", 1e-6)       # s
             input_signal = kwargs.get("input_signal", "step")
             input_amplitude = kwargs.get("input_amplitude", 1.0)  # V
-            
-            # Generate time points
-            time_points = []
-            current_time = start_time
-            while current_time <= stop_time:
-                time_points.append(current_time)
-                current_time += time_step
-            
-            # Perform transient analysis
+            input_source = resolve_input_net(circuit, kwargs.get("input_source", kwargs.get("ac_source")))
+            voltage_sources = kwargs.get("voltage_sources", {})
+            current_sources = kwargs.get("current_sources", {})
+            method = kwargs.get("method", TRAPEZOIDAL)
+            adaptive = kwargs.get("adaptive", False)
+            max_step = kwargs.get("max_step")               # s
+            rtol = kwargs.get("rtol", 1e-3)
+            atol = kwargs.get("atol", 1e-6)
+            output_file = kwargs.get("output_file")
+            chunk_size = kwargs.get("chunk_size", DEFAULT_CHUNK_SIZE)
+            
+            # The input net is driven by a unit source scaled by the input signal
+            system = self._get_mna_system(circuit, voltage_sources, current_sources,
+                                          ac_source=input_source, ac_amplitude=1.0)
+            engine = self._get_transient_engine(system, method, rtol, atol)
+            waveform = self._input_waveform(input_signal, input_amplitude, start_time, time_step)
+            
+            net_names = [
+                net_name for net_name in circuit.get("nets", {})
+                if not net_name.startswith(("GND", "VSS", "-"))  # Skip ground nets
+                and net_name in system.node_index
+            ]
+            branch_names = sorted(system.branches, key=system.branches.get)
+            outputs = [system.node_index[net_name] for net_name in net_names]
+            outputs.extend(system.branches[name] for name in branch_names)
+            
+            run = engine.run(stop_time, time_step, start_time=start_time, input_signal=waveform,
+                             adaptive=adaptive, max_step=max_step, outputs=outputs,
+                             output_file=output_file, chunk_size=chunk_size)
+            time_points = run.time
+            
+            # Waveforms stay NumPy arrays; long runs would be slow and huge as lists
             transient_results = {
                 "time": time_points,
                 "voltages": {},
                 "currents": {},
                 "power": {},
-                "signals": {}
+                "signals": {"input": np.asarray(waveform(time_points), dtype=float)}
             }
-            
-            # Generate input signal
-            input_signal_data = self._generate_input_signal(time_points, input_signal, input_amplitude)
-            transient_results["signals"]["input"] = input_signal_data
-            
-            # Calculate transient response for each net
-            for net_name, net_data in circuit.get("nets", {}).items():
-                if net_name.startswith(("GND", "VSS", "-")):
-                    continue  # Skip ground nets
-                
-                voltages = []
-                currents = []
-                power = []
-                
-                for t in time_points:
-                    # Calculate voltage response (simplified)
-                    voltage = self._calculate_transient_voltage(net_name, net_data, t, input_signal_data)
-                    voltages.append(voltage)
-                    
-                    # Calculate current response (simplified)
-                    current = self._calculate_transient_current(net_name, net_data, t, voltage)
-                    currents.append(current)
-                    
-                    # Calculate power (simplified)
-                    power_val = voltage * current
-                    power.append(power_val)
+            if output_file:
+                # Long runs stay on disk; the file holds one column per net and branch
+                transient_results["output_file"] = output_file
+                transient_results["columns"] = run.columns
+            else:
+                voltages = run.values[:, :len(net_names)]
+                currents = run.values[:, len(net_names):]
+                for column, net_name in enumerate(net_names):
+                    transient_results["voltages"][net_name] = voltages[:, column]
                 
-                transient_results["voltages"][net_name] = voltages
-                transient_results["currents"][net_name] = currents
-                transient_results["power"][net_name] = power
+                # Power delivered to each branch element: voltage across it times its current
+                padded = np.concatenate([voltages, np.zeros((len(time_points), 1))], axis=1)
+                net_column = {net_name: i for i, net_name in enumerate(net_names)}
+                elements = {element.name: element for element in system.elements}
+                for column, name in enumerate(branch_names):
+                    nodes = elements[name].nodes
+                    across = padded[:, net_column.get(nodes[0], -1)] - padded[:, net_column.get(nodes[1], -1)]
+                    transient_results["currents"][name] = currents[:, column]
+                    transient_results["power"][name] = across * currents[:, column]
             
             # Add metadata
             metadata = {
@@ -547,13 +740,22 @@ class CircuitSimulator(BaseValidator):
                     "start_time": start_time,
                     "stop_time": stop_time,
                     "time_step": time_step,
-                    "input_signal": input_signal,
-                    "input_amplitude": input_amplitude
+                    "input_signal": input_signal if isinstance(input_signal, str) else "custom",
+                    "input_amplitude": input_amplitude,
+                    "input_source": input_source,
+                    "method": method,
+                    "adaptive": adaptive
                 },
                 "circuit_stats": {
                     "components": len(circuit.get("components", {})),
                     "nets": len(circuit.get("nets", {})),
-                    "time_points": len(time_points)
+                    "time_points": len(time_points),
+                    "mna_size": system.size
+                },
+                "solver_stats": {
+                    "steps": run.steps,
+                    "rejected_steps": run.rejected_steps,
+                    "factorizations": run.factorizations
                 }
             }
             
@@ -619,63 +821,51 @@ class CircuitSimulator(BaseValidator):
                 "noise_spectrum_analysis": {}
             }
             
-            # Calculate noise for each net
-            for net_name, net_data in circuit.get("nets", {}).items():
-                if net_name.startswith(("GND", "VSS", "-")):
-                    continue  # Skip ground nets
-                
-                thermal = []
-                shot = []
-                flicker = []
-                total = []
-                nf = []
-                snr = []
-                hf_noise = []
-                
-                for freq in frequencies:
-                    # Calculate thermal noise with high precision
-                    thermal_noise = self._calculate_thermal_noise_high_precision(net_name, net_data, freq, temperature)
-                    thermal.append(thermal_noise)
-                    
-                    # Calculate shot noise with high precision
-                    shot_noise = self._calculate_shot_noise_high_precision(net_name, net_data, freq)
-                    shot.append(shot_noise)
-                    
-                    # Calculate flicker noise with high precision
-                    flicker_noise = self._calculate_flicker_noise_high_precision(net_name, net_data, freq)
-                    flicker.append(flicker_noise)
-                    
-                    # Calculate high-frequency noise components
-                    if freq > 20000.0:
-                        hf_component = self._calculate_high_frequency_noise(net_name, net_data, freq, temperature)
-                        hf_noise.append(hf_component)
-                    else:
-                        hf_noise.append(0.0)
-                    
-                    # Calculate total noise with enhanced precision
-                    total_noise = (thermal_noise**2 + shot_noise**2 + flicker_noise**2 + hf_noise[-1]**2)**0.5
-                    total.append(total_noise)
-                    
-                    # Calculate noise figure with high precision
-                    noise_figure = self._calculate_noise_figure_high_precision(net_name, net_data, freq, total_noise, reference_impedance)
-                    nf.append(noise_figure)
-                    
-                    # Calculate signal-to-noise ratio with high precision
-                    signal_level = self._estimate_signal_level_high_precision(net_name, net_data, freq)
-                    snr_val = 20 * math.log10(signal_level / total_noise) if total_noise > 0 else 100
-                    snr.append(snr_val)
-                
-                noise_results["thermal_noise"][net_name] = thermal
-                noise_results["shot_noise"][net_name] = shot
-                noise_results["flicker_noise"][net_name] = flicker
-                noise_results["total_noise"][net_name] = total
-                noise_results["noise_figure"][net_name] = nf
-                noise_results["snr"][net_name] = snr
-                noise_results["high_frequency_noise"][net_name] = hf_noise
+            net_names = [
+                net_name for net_name in circuit.get("nets", {})
+                if not net_name.startswith(("GND", "VSS", "-"))  # Skip ground nets
+            ]
+            
+            # (nets x frequencies) noise densities as array operations
+            frequency_array = np.asarray(frequencies, dtype=float)
+            impedance = np.array([self._net_impedance(net_name) for net_name in net_names])[:, None]
+            thermal = self._thermal_noise_array(frequency_array, impedance, temperature)
+            
+            # Resistor thermal noise at every node from the factorized MNA sweep
+            system = self._get_mna_system(circuit)
+            if system.resistors:
+                mna_rows = [
+                    row for row, net_name in enumerate(net_names) if net_name in system.node_index
+                ]
+                mna_thermal = system.thermal_noise(
+                    frequencies, temperature, nodes=[net_names[row] for row in mna_rows]
+                )
+                thermal[mna_rows] = mna_thermal.T
+            
+            signal_level = self._signal_level_array(frequency_array)
+            shot = self._shot_noise_array(frequency_array, impedance, signal_level)
+            flicker = np.broadcast_to(self._flicker_noise_array(frequency_array), thermal.shape)
+            hf_noise = np.broadcast_to(
+                self._high_frequency_noise_array(frequency_array, temperature), thermal.shape
+            )
+            total = np.sqrt(thermal**2 + shot**2 + flicker**2 + hf_noise**2)
+            nf = self._noise_figure_array(frequency_array, total, reference_impedance)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                snr = np.where(total > 0, 20 * np.log10(signal_level / total), 100.0)
+            
+            for row, net_name in enumerate(net_names):
+                noise_results["thermal_noise"][net_name] = thermal[row].tolist()
+                noise_results["shot_noise"][net_name] = shot[row].tolist()
+                noise_results["flicker_noise"][net_name] = flicker[row].tolist()
+                noise_results["total_noise"][net_name] = total[row].tolist()
+                noise_results["noise_figure"][net_name] = nf[row].tolist()
+                noise_results["snr"][net_name] = snr[row].tolist()
+                noise_results["high_frequency_noise"][net_name] = hf_noise[row].tolist()
                 
                 # Calculate noise spectrum analysis for this net
                 noise_results["noise_spectrum_analysis"][net_name] = self._analyze_noise_spectrum(
-                    frequencies, thermal, shot, flicker, hf_noise, high_precision
+                    frequency_array, thermal[row], shot[row], flicker[row], hf_noise[row],
+                    high_precision
                 )
             
             # Add metadata
@@ -832,9 +1022,15 @@ class CircuitSimulator(BaseValidator):
                 error_message=f"Fourier analysis failed: {str(e)}"
             )
     
-    def clear_cache(self) -> None:
-        """Clear the results cache."""
-        self.results_cache.clear()
+    def clear_cache(self, disk: bool = False) -> None:
+        """Clear the results cache.
+        
+        Args:
+            disk: Also delete results persisted on disk
+        """
+        self.results_cache.clear(disk=disk)
+        self._mna_systems.clear()
+        self._transient_engines.clear()
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get simulation metrics.
@@ -853,9 +1049,18 @@ class CircuitSimulator(BaseValidator):
                 "memory_usage": 0.0
             }
             
+            cache_stats = self.results_cache.stats()
+            metrics.update({
+                "cache_hits": cache_stats["hits"] + cache_stats["disk_hits"],
+                "cache_disk_hits": cache_stats["disk_hits"],
+                "cache_misses": cache_stats["misses"],
+                "cache_evictions": cache_stats["evictions"],
+                "cache_hit_rate": cache_stats["hit_rate"]
+            })
+            
             # Calculate metrics from cached results
             total_time = 0.0
-            for cache_key, result in self.results_cache.items():
+            for result in self.results_cache.values():
                 if result.success:
                     metrics["successful_simulations"] += 1
                 else:
@@ -873,8 +1078,8 @@ class CircuitSimulator(BaseValidator):
             if metrics["total_simulations"] > 0:
                 metrics["average_execution_time"] = total_time / metrics["total_simulations"]
             
-            # Estimate memory usage (rough calculation)
-            metrics["memory_usage"] = len(self.results_cache) * 1024  # 1KB per result estimate
+            # Memory usage of the cached results (encoded size)
+            metrics["memory_usage"] = cache_stats["bytes"]
             
             logger.info(f"Retrieved simulation metrics: {metrics['successful_simulations']} successful, {metrics['failed_simulations']} failed")
             return metrics
@@ -921,53 +1126,6 @@ class CircuitSimulator(BaseValidator):
     
     # Helper methods for simulation calculations
     
-    def _calculate_node_voltage(self, net_name: str, net_data: Dict[str, Any], voltage_sources: Dict[str, float]) -> float:
-        """Calculate node voltage for a net.
-        
-        Args:
-            net_name: Name of the net
-            net_data: Net data
-            voltage_sources: Dictionary of voltage sources
-            
-        Returns:
-            Calculated voltage
-        """
-        # Simplified voltage calculation based on connected components
-        if net_name in voltage_sources:
-            return voltage_sources[net_name]
-        
-        # Calculate based on connected components
-        total_voltage = 0.0
-        total_weight = 0.0
-        
-        for track in net_data.get("tracks", []):
-            # Simple voltage drop calculation
-            length = math.sqrt((track["end"][0] - track["start"][0])**2 + (track["end"][1] - track["start"][1])**2)
-            resistance = length * 0.1  # 0.1 ohm per unit length (simplified)
-            voltage_drop = 0.1  # Simplified voltage drop
-            total_voltage += voltage_drop
-            total_weight += 1.0
-        
-        return total_voltage / total_weight if total_weight > 0 else 0.0
-    
-    def _calculate_branch_current(self, net_name: str, net_data: Dict[str, Any]) -> float:
-        """Calculate branch current for a net.
-        
-        Args:
-            net_name: Name of the net
-            net_data: Net data
-            
-        Returns:
-            Calculated current
-        """
-        # Simplified current calculation
-        if net_name.startswith(("VCC", "VDD", "+")):
-            return 0.1  # 100mA typical for power nets
-        elif net_name.startswith(("GND", "VSS", "-")):
-            return 0.0  # Ground nets have no current
-        else:
-            return 0.01  # 10mA typical for signal nets
-    
     def _calculate_component_power(self, component_ref: str, component_data: Dict[str, Any], dc_results: Dict[str, Any]) -> float:
         """Calculate power dissipation for a component.
         
@@ -993,53 +1151,11 @@ class CircuitSimulator(BaseValidator):
         else:
             return 0.05  # 50mW default
     
-    def _calculate_magnitude_response_high_precision(self, net_name: str, net_data: Dict[str, Any], frequency: float, amplitude: float) -> float:
-        """Calculate magnitude response for a net with high-precision support.
-        
-        Args:
-            net_name: Name of the net
-            net_data: Net data
-            frequency: Frequency in Hz
-            amplitude: Input amplitude
-            
-        Returns:
-            Magnitude response
-        """
-        # Simplified frequency response calculation
-        # This would normally involve complex impedance calculations
-        
-        # Simple low-pass filter response
-        cutoff_freq = 1e6  # 1MHz cutoff
-        if frequency < cutoff_freq:
-            return amplitude
-        else:
-            return amplitude / (1 + (frequency / cutoff_freq)**2)**0.5
-    
-    def _calculate_phase_response_high_precision(self, net_name: str, net_data: Dict[str, Any], frequency: float) -> float:
-        """Calculate phase response for a net with high-precision support.
-        
-        Args:
-            net_name: Name of the net
-            net_data: Net data
-            frequency: Frequency in Hz
-            
-        Returns:
-            Phase response in degrees
-        """
-        # Simplified phase response calculation
-        cutoff_freq = 1e6  # 1MHz cutoff
-        if frequency < cutoff_freq:
-            return 0.0
-        else:
-            return -45.0 * math.log10(frequency / cutoff_freq)
-    
-    def _calculate_impedance_high_precision(self, net_name: str, net_data: Dict[str, Any], frequency: float) -> float:
-        """Calculate impedance for a net with high-precision support.
+    def _net_impedance(self, net_name: str) -> float:
+        """Estimate the impedance of a net from its name.
         
         Args:
             net_name: Name of the net
-            net_data: Net data
-            frequency: Frequency in Hz
             
         Returns:
             Impedance in ohms
@@ -1052,330 +1168,178 @@ class CircuitSimulator(BaseValidator):
         else:
             return 50.0  # 50 ohm typical for signal nets
     
-    def _generate_input_signal(self, time_points: List[float], signal_type: str, amplitude: float) -> List[float]:
-        """Generate input signal for transient simulation.
+    def _input_waveform(self, input_signal: Any, amplitude: float, start_time: float,
+                        time_step: float) -> Callable[[np.ndarray], np.ndarray]:
+        """Vectorized input waveform for a transient run.
         
         Args:
-            time_points: List of time points
-            signal_type: Type of signal (step, sine, square, etc.)
-            amplitude: Signal amplitude
+            input_signal: Signal type name, callable of time, or samples spaced
+                by ``time_step`` from ``start_time``
+            amplitude: Amplitude applied to named signal types
+            start_time: Time of the first sample
+            time_step: Time between samples
             
         Returns:
-            List of signal values
+            Function mapping an array of times to input values
         """
-        signal_values = []
-        
-        for t in time_points:
-            if signal_type == "step":
-                signal_values.append(amplitude if t > 0 else 0.0)
-            elif signal_type == "sine":
-                freq = 1e3  # 1kHz
-                signal_values.append(amplitude * math.sin(2 * math.pi * freq * t))
-            elif signal_type == "square":
-                freq = 1e3  # 1kHz
-                signal_values.append(amplitude if math.sin(2 * math.pi * freq * t) > 0 else -amplitude)
-            else:
-                signal_values.append(0.0)
-        
-        return signal_values
+        if isinstance(input_signal, str):
+            return input_waveform(input_signal, amplitude)
+        if callable(input_signal):
+            return input_signal
+        return sampled_waveform(input_signal, start_time, time_step)
     
-    def _calculate_transient_voltage(self, net_name: str, net_data: Dict[str, Any], time: float, input_signal: List[float]) -> float:
-        """Calculate transient voltage for a net.
+    def _get_transient_engine(self, system: MNASystem, method: str, rtol: float,
+                              atol: float) -> TransientEngine:
+        """Get the transient engine of an MNA system, keeping its step factorizations.
         
         Args:
-            net_name: Name of the net
-            net_data: Net data
-            time: Time point
-            input_signal: Input signal values
+            system: Stamped MNA system
+            method: Integration method
+            rtol: Relative tolerance of adaptive stepping
+            atol: Absolute tolerance of adaptive stepping
             
         Returns:
-            Calculated voltage
+            Transient engine
         """
-        # Simplified transient response calculation
-        # This would normally involve solving differential equations
-        
-        # Simple RC response
-        tau = 1e-6  # 1μs time constant
-        input_index = min(int(time * 1e6), len(input_signal) - 1)  # Convert to microseconds
-        input_val = input_signal[input_index] if input_index < len(input_signal) else 0.0
-        
-        return input_val * (1 - math.exp(-time / tau))
+        # The engine references its system, so the id cannot be reused while cached
+        key = (id(system), method, rtol, atol)
+        engine = self._transient_engines.get(key)
+        if engine is None:
+            engine = TransientEngine(system, method=method, rtol=rtol, atol=atol)
+            self._transient_engines[key] = engine
+            while len(self._transient_engines) > MAX_TRANSIENT_ENGINES:
+                self._transient_engines.popitem(last=False)
+        else:
+            self._transient_engines.move_to_end(key)
+        return engine
     
-    def _calculate_transient_current(self, net_name: str, net_data: Dict[str, Any], time: float, voltage: float) -> float:
-        """Calculate transient current for a net.
-        
-        Args:
-            net_name: Name of the net
-            net_data: Net data
-            time: Time point
-            voltage: Voltage at this time
-            
-        Returns:
-            Calculated current
-        """
-        # Simplified current calculation
-        impedance = self._calculate_impedance_high_precision(net_name, net_data, 1e3)  # Use 1kHz for transient
-        return voltage / impedance if impedance > 0 else 0.0
+    def _noise_bandwidth(self, frequencies: np.ndarray) -> np.ndarray:
+        """Noise bandwidth per frequency point: 1MHz for audio, 2MHz above 20kHz."""
+        return np.where(frequencies > 20000.0, 2e6, 1e6)
     
-    def _calculate_thermal_noise_high_precision(self, net_name: str, net_data: Dict[str, Any], frequency: float, temperature: float) -> float:
-        """Calculate thermal noise with high precision for extended audio bandwidth.
+    def _thermal_noise_array(self, frequencies: np.ndarray, impedance: np.ndarray,
+                             temperature: float) -> np.ndarray:
+        """Estimated thermal noise for nets without a resistor model.
         
         Args:
-            net_name: Net name
-            net_data: Net data
-            frequency: Frequency in Hz
+            frequencies: Frequency points in Hz, shape (frequencies,)
+            impedance: Net impedances in ohms, shape (nets, 1)
             temperature: Temperature in K
             
         Returns:
-            Thermal noise voltage in V/√Hz
+            Thermal noise in V/√Hz, shape (nets, frequencies)
         """
-        try:
-            k = 1.38e-23  # Boltzmann constant
-            resistance = self._calculate_impedance_high_precision(net_name, net_data, frequency)
-            
-            # Enhanced bandwidth calculation for extended audio range
-            if frequency > 20000.0:
-                # Higher bandwidth for extended frequencies
-                bandwidth = 2e6  # 2MHz for extended analysis
-            else:
-                bandwidth = 1e6  # 1MHz for standard audio
-            
-            # Calculate thermal noise with frequency-dependent resistance
-            thermal_noise = math.sqrt(4 * k * temperature * resistance * bandwidth)
-            
-            # Add frequency-dependent effects for high frequencies
-            if frequency > 20000.0:
-                # Skin effect and dielectric losses at high frequencies
-                skin_effect_factor = math.sqrt(frequency / 20000.0)
-                thermal_noise *= skin_effect_factor
-            
-            return thermal_noise
-            
-        except Exception as e:
-            logger.error(f"Error calculating high-precision thermal noise: {e}")
-            return 1e-9  # 1nV/√Hz default
+        k = 1.38e-23  # Boltzmann constant
+        bandwidth = self._noise_bandwidth(frequencies)
+        thermal_noise = np.sqrt(4 * k * temperature * impedance * bandwidth)
+        
+        # Skin effect and dielectric losses at high frequencies
+        skin_effect_factor = np.sqrt(np.maximum(frequencies / 20000.0, 1.0))
+        return thermal_noise * skin_effect_factor
     
-    def _calculate_shot_noise_high_precision(self, net_name: str, net_data: Dict[str, Any], frequency: float) -> float:
-        """Calculate shot noise with high precision for extended audio bandwidth.
+    def _shot_noise_array(self, frequencies: np.ndarray, impedance: np.ndarray,
+                          signal_level: np.ndarray) -> np.ndarray:
+        """Shot noise of the current each net's signal level drives into its impedance.
         
         Args:
-            net_name: Net name
-            net_data: Net data
-            frequency: Frequency in Hz
+            frequencies: Frequency points in Hz, shape (frequencies,)
+            impedance: Net impedances in ohms, shape (nets, 1)
+            signal_level: Signal level in V, shape (frequencies,)
             
         Returns:
-            Shot noise voltage in V/√Hz
+            Shot noise voltage in V/√Hz, shape (nets, frequencies)
         """
-        try:
-            q = 1.602e-19  # Elementary charge
-            current = self._estimate_current_level(net_name, net_data, frequency)
-            
-            # Enhanced bandwidth calculation
-            if frequency > 20000.0:
-                bandwidth = 2e6  # 2MHz for extended analysis
-            else:
-                bandwidth = 1e6  # 1MHz for standard audio
-            
-            shot_current = math.sqrt(2 * q * current * bandwidth)
-            impedance = self._calculate_impedance_high_precision(net_name, net_data, frequency)
-            
-            # Add frequency-dependent effects
-            if frequency > 20000.0:
-                # High-frequency effects on shot noise
-                hf_factor = 1.0 + 0.1 * math.log10(frequency / 20000.0)
-                shot_current *= hf_factor
-            
-            return shot_current * impedance
-            
-        except Exception as e:
-            logger.error(f"Error calculating high-precision shot noise: {e}")
-            return 1e-9  # 1nV/√Hz default
+        q = 1.602e-19  # Elementary charge
+        current = signal_level / impedance
+        shot_current = np.sqrt(2 * q * current * self._noise_bandwidth(frequencies))
+        
+        # High-frequency effects on shot noise
+        hf_factor = 1.0 + 0.1 * np.log10(np.maximum(frequencies / 20000.0, 1.0))
+        return shot_current * hf_factor * impedance
     
-    def _calculate_flicker_noise_high_precision(self, net_name: str, net_data: Dict[str, Any], frequency: float) -> float:
-        """Calculate flicker noise with high precision for extended audio bandwidth.
+    def _flicker_noise_array(self, frequencies: np.ndarray) -> np.ndarray:
+        """1/f noise with a 1kHz corner and a decaying component above 20kHz.
         
         Args:
-            net_name: Net name
-            net_data: Net data
-            frequency: Frequency in Hz
+            frequencies: Frequency points in Hz
             
         Returns:
             Flicker noise voltage in V/√Hz
         """
-        try:
-            # Base flicker noise (1/f noise)
-            base_noise = 1e-9 / math.sqrt(frequency)  # 1nV/√Hz at 1Hz
-            
-            # Enhanced flicker noise model for extended bandwidth
-            if frequency > 20000.0:
-                # Flicker noise typically decreases at high frequencies
-                # but some components may show different behavior
-                flicker_corner = 1000.0  # 1kHz corner frequency
-                if frequency > flicker_corner:
-                    # Above corner frequency, flicker noise decreases
-                    flicker_factor = math.sqrt(flicker_corner / frequency)
-                else:
-                    flicker_factor = 1.0
-                
-                # Add high-frequency flicker noise components
-                hf_flicker = base_noise * 0.1 * math.exp(-frequency / 50000.0)  # Exponential decay
-                base_noise = base_noise * flicker_factor + hf_flicker
-            
-            return base_noise
-            
-        except Exception as e:
-            logger.error(f"Error calculating high-precision flicker noise: {e}")
-            return 1e-9  # 1nV/√Hz default
+        base_noise = 1e-9 / np.sqrt(frequencies)  # 1nV/√Hz at 1Hz
+        
+        # Above the corner frequency flicker noise decreases, plus an
+        # exponentially decaying high-frequency component
+        flicker_corner = 1000.0  # 1kHz corner frequency
+        extended = (base_noise * np.sqrt(flicker_corner / frequencies)
+                    + base_noise * 0.1 * np.exp(-frequencies / 50000.0))
+        return np.where(frequencies > 20000.0, extended, base_noise)
     
-    def _calculate_high_frequency_noise(self, net_name: str, net_data: Dict[str, Any], frequency: float, temperature: float) -> float:
-        """Calculate high-frequency noise components for frequencies above 20kHz.
+    def _high_frequency_noise_array(self, frequencies: np.ndarray,
+                                    temperature: float) -> np.ndarray:
+        """High-frequency noise components, zero up to 20kHz.
         
         Args:
-            net_name: Net name
-            net_data: Net data
-            frequency: Frequency in Hz (should be > 20kHz)
+            frequencies: Frequency points in Hz
             temperature: Temperature in K
             
         Returns:
             High-frequency noise voltage in V/√Hz
         """
-        try:
-            if frequency <= 20000.0:
-                return 0.0
-            
-            # High-frequency noise sources
-            hf_noise = 0.0
-            
-            # 1. Dielectric losses in PCB substrate
-            dielectric_loss = 1e-10 * math.sqrt(frequency / 20000.0)  # Frequency-dependent dielectric loss
-            
-            # 2. Skin effect in conductors
-            skin_effect_noise = 5e-11 * math.sqrt(frequency / 20000.0)  # Skin effect contribution
-            
-            # 3. Radiation losses at high frequencies
-            radiation_loss = 1e-11 * (frequency / 20000.0)  # Radiation loss increases with frequency
-            
-            # 4. Component parasitics (capacitance, inductance)
-            parasitic_noise = 2e-11 * math.sqrt(frequency / 20000.0)  # Parasitic effects
-            
-            # Combine high-frequency noise components
-            hf_noise = math.sqrt(dielectric_loss**2 + skin_effect_noise**2 + 
-                               radiation_loss**2 + parasitic_noise**2)
-            
-            # Temperature dependence
-            hf_noise *= math.sqrt(temperature / 300.0)
-            
-            return hf_noise
-            
-        except Exception as e:
-            logger.error(f"Error calculating high-frequency noise: {e}")
-            return 0.0
+        ratio = frequencies / 20000.0
+        dielectric_loss = 1e-10 * np.sqrt(ratio)  # Dielectric losses in PCB substrate
+        skin_effect_noise = 5e-11 * np.sqrt(ratio)  # Skin effect in conductors
+        radiation_loss = 1e-11 * ratio  # Radiation loss increases with frequency
+        parasitic_noise = 2e-11 * np.sqrt(ratio)  # Component parasitics
+        
+        hf_noise = np.sqrt(dielectric_loss**2 + skin_effect_noise**2
+                           + radiation_loss**2 + parasitic_noise**2)
+        hf_noise *= math.sqrt(temperature / 300.0)
+        return np.where(frequencies > 20000.0, hf_noise, 0.0)
     
-    def _calculate_noise_figure_high_precision(self, net_name: str, net_data: Dict[str, Any], frequency: float, total_noise: float, reference_impedance: float) -> float:
-        """Calculate noise figure with high precision for extended audio bandwidth.
+    def _noise_figure_array(self, frequencies: np.ndarray, total_noise: np.ndarray,
+                            reference_impedance: float) -> np.ndarray:
+        """Noise figure against the thermal noise of the reference impedance at 290K.
         
         Args:
-            net_name: Net name
-            net_data: Net data
-            frequency: Frequency in Hz
-            total_noise: Total noise voltage
+            frequencies: Frequency points in Hz, shape (frequencies,)
+            total_noise: Total noise voltage, shape (nets, frequencies)
             reference_impedance: Reference impedance in Ω
             
         Returns:
-            Noise figure in dB
-        """
-        try:
-            # Calculate available noise power
-            available_noise_power = total_noise**2 / (4 * reference_impedance)
-            
-            # Calculate thermal noise power at reference temperature
-            k = 1.38e-23  # Boltzmann constant
-            T0 = 290.0  # Reference temperature (K)
-            
-            if frequency > 20000.0:
-                bandwidth = 2e6  # 2MHz for extended analysis
-            else:
-                bandwidth = 1e6  # 1MHz for standard audio
-            
-            thermal_noise_power = k * T0 * bandwidth
-            
-            # Calculate noise figure
-            if thermal_noise_power > 0:
-                noise_figure = 10 * math.log10(available_noise_power / thermal_noise_power)
-            else:
-                noise_figure = 0.0
-            
-            # Add frequency-dependent corrections for high frequencies
-            if frequency > 20000.0:
-                # High-frequency noise figure corrections
-                hf_correction = 0.5 * math.log10(frequency / 20000.0)
-                noise_figure += hf_correction
-            
-            return noise_figure
-            
-        except Exception as e:
-            logger.error(f"Error calculating high-precision noise figure: {e}")
-            return 0.0
-    
-    def _estimate_signal_level_high_precision(self, net_name: str, net_data: Dict[str, Any], frequency: float) -> float:
-        """Estimate signal level with high precision for extended audio bandwidth.
-        
-        Args:
-            net_name: Net name
-            net_data: Net data
-            frequency: Frequency in Hz
-            
-        Returns:
-            Estimated signal level in V
+            Noise figure in dB, 0 where there is no noise
         """
-        try:
-            # Base signal level estimation
-            base_level = self._estimate_signal_level(net_name, net_data, frequency)
-            
-            # Enhanced estimation for high frequencies
-            if frequency > 20000.0:
-                # High-frequency signal level adjustments
-                # Signals may have different characteristics at high frequencies
-                hf_factor = 1.0 - 0.1 * math.log10(frequency / 20000.0)  # Slight rolloff
-                base_level *= max(0.1, hf_factor)  # Minimum 10% of base level
-            
-            return base_level
-            
-        except Exception as e:
-            logger.error(f"Error estimating high-precision signal level: {e}")
-            return 1.0  # 1V default
+        k = 1.38e-23  # Boltzmann constant
+        T0 = 290.0  # Reference temperature (K)
+        available_noise_power = total_noise**2 / (4 * reference_impedance)
+        thermal_noise_power = k * T0 * self._noise_bandwidth(frequencies)
+        
+        # High-frequency noise figure corrections
+        hf_correction = 0.5 * np.log10(np.maximum(frequencies / 20000.0, 1.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            noise_figure = (10 * np.log10(available_noise_power / thermal_noise_power)
+                            + hf_correction)
+        return np.where(available_noise_power > 0, noise_figure, 0.0)
     
-    def _estimate_current_level(self, net_name: str, net_data: Dict[str, Any], frequency: float) -> float:
-        """Estimate current level for noise calculations.
+    def _signal_level_array(self, frequencies: np.ndarray) -> np.ndarray:
+        """Estimated signal level: 1V with a slight rolloff above 20kHz.
         
         Args:
-            net_name: Net name
-            net_data: Net data
-            frequency: Frequency in Hz
+            frequencies: Frequency points in Hz
             
         Returns:
-            Estimated current level in A
+            Estimated signal level in V, at least 10% of the base level
         """
-        try:
-            # Estimate current based on net characteristics
-            signal_level = self._estimate_signal_level_high_precision(net_name, net_data, frequency)
-            impedance = self._calculate_impedance_high_precision(net_name, net_data, frequency)
-            
-            if impedance > 0:
-                return signal_level / impedance
-            else:
-                return 1e-3  # 1mA default
-                
-        except Exception as e:
-            logger.error(f"Error estimating current level: {e}")
-            return 1e-3  # 1mA default
+        rolloff = 1.0 - 0.1 * np.log10(np.maximum(frequencies / 20000.0, 1.0))
+        return np.maximum(0.1, rolloff)
     
-    def _analyze_noise_spectrum(self, frequencies: List[float], thermal: List[float], shot: List[float], 
-                               flicker: List[float], hf_noise: List[float], high_precision: bool) -> Dict[str, Any]:
+    def _analyze_noise_spectrum(self, frequencies: np.ndarray, thermal: np.ndarray,
+                                shot: np.ndarray, flicker: np.ndarray, hf_noise: np.ndarray,
+                                high_precision: bool) -> Dict[str, Any]:
         """Analyze noise spectrum characteristics for high-precision audio analysis.
         
         Args:
-            frequencies: List of frequency points
+            frequencies: Ascending frequency points
             thermal: Thermal noise values
             shot: Shot noise values
             flicker: Flicker noise values
@@ -1386,63 +1350,67 @@ class CircuitSimulator(BaseValidator):
             Dictionary containing noise spectrum analysis
         """
         try:
-            if not frequencies or len(frequencies) != len(thermal):
+            if not frequencies.size or frequencies.size != thermal.size:
                 return {}
             
             # Calculate total noise spectrum
-            total_noise = [(t**2 + s**2 + f**2 + h**2)**0.5 
-                          for t, s, f, h in zip(thermal, shot, flicker, hf_noise)]
+            total_noise = np.sqrt(thermal**2 + shot**2 + flicker**2 + hf_noise**2)
             
             # Find dominant noise source at different frequency ranges
-            low_freq_range = [i for i, f in enumerate(frequencies) if f <= 1000.0]
-            mid_freq_range = [i for i, f in enumerate(frequencies) if 1000.0 < f <= 20000.0]
-            high_freq_range = [i for i, f in enumerate(frequencies) if f > 20000.0]
+            low_freq_range = frequencies <= 1000.0
+            mid_freq_range = (frequencies > 1000.0) & (frequencies <= 20000.0)
+            high_freq_range = frequencies > 20000.0
             
             # Analyze dominant noise sources
             dominant_sources = {}
-            if low_freq_range:
-                low_freq_thermal = sum(thermal[i] for i in low_freq_range) / len(low_freq_range)
-                low_freq_flicker = sum(flicker[i] for i in low_freq_range) / len(low_freq_range)
+            if low_freq_range.any():
+                low_freq_thermal = thermal[low_freq_range].mean()
+                low_freq_flicker = flicker[low_freq_range].mean()
                 dominant_sources["low_frequency"] = "flicker" if low_freq_flicker > low_freq_thermal else "thermal"
             
-            if mid_freq_range:
-                mid_freq_thermal = sum(thermal[i] for i in mid_freq_range) / len(mid_freq_range)
-                mid_freq_shot = sum(shot[i] for i in mid_freq_range) / len(mid_freq_range)
+            if mid_freq_range.any():
+                mid_freq_thermal = thermal[mid_freq_range].mean()
+                mid_freq_shot = shot[mid_freq_range].mean()
                 dominant_sources["mid_frequency"] = "shot" if mid_freq_shot > mid_freq_thermal else "thermal"
             
-            if high_freq_range:
-                high_freq_thermal = sum(thermal[i] for i in high_freq_range) / len(high_freq_range)
-                high_freq_hf = sum(hf_noise[i] for i in high_freq_range) / len(high_freq_range)
+            if high_freq_range.any():
+                high_freq_thermal = thermal[high_freq_range].mean()
+                high_freq_hf = hf_noise[high_freq_range].mean()
                 dominant_sources["high_frequency"] = "high_frequency" if high_freq_hf > high_freq_thermal else "thermal"
             
             # Calculate noise metrics
+            noise_floor = float(total_noise.min())
+            peak_noise = float(total_noise.max())
             noise_metrics = {
-                "total_noise_rms": math.sqrt(sum(n**2 for n in total_noise) / len(total_noise)),
-                "peak_noise": max(total_noise),
-                "noise_floor": min(total_noise),
-                "noise_dynamic_range": max(total_noise) / min(total_noise) if min(total_noise) > 0 else float('inf'),
-                "average_noise": sum(total_noise) / len(total_noise)
+                "total_noise_rms": float(np.sqrt(np.mean(total_noise**2))),
+                "peak_noise": peak_noise,
+                "noise_floor": noise_floor,
+                "noise_dynamic_range": (
+                    peak_noise / noise_floor if noise_floor > 0 else float('inf')
+                ),
+                "average_noise": float(total_noise.mean())
             }
             
             # High-precision analysis
             precision_analysis = {}
             if high_precision:
                 # Calculate noise slope analysis
-                noise_slopes = []
-                for i in range(1, len(frequencies)):
-                    if frequencies[i] > frequencies[i-1]:
-                        slope = (total_noise[i] - total_noise[i-1]) / (frequencies[i] - frequencies[i-1])
-                        noise_slopes.append(slope)
+                freq_diff = np.diff(frequencies)
+                rising = freq_diff > 0
+                noise_slopes = np.diff(total_noise)[rising] / freq_diff[rising]
                 
-                if noise_slopes:
-                    precision_analysis["average_noise_slope"] = sum(noise_slopes) / len(noise_slopes)
-                    precision_analysis["noise_slope_variation"] = max(noise_slopes) - min(noise_slopes)
+                if noise_slopes.size:
+                    precision_analysis["average_noise_slope"] = float(noise_slopes.mean())
+                    precision_analysis["noise_slope_variation"] = float(
+                        noise_slopes.max() - noise_slopes.min()
+                    )
                 
                 # Calculate frequency-dependent noise characteristics
                 precision_analysis["frequency_dependent_analysis"] = {
-                    "low_freq_noise": sum(total_noise[i] for i in low_freq_range) / len(low_freq_range) if low_freq_range else 0,
-                    "mid_freq_noise": sum(total_noise[i] for i in mid_freq_range) / len(mid_freq_range) if mid_freq_range else 0,
-                    "high_freq_noise": sum(total_noise[i] for i in high_freq_range) / len(high_freq_range) if high_freq_range else 0
+                    name: float(total_noise[band].mean()) if band.any() else 0
+                    for name, band in (("low_freq_noise", low_freq_range),
+                                       ("mid_freq_noise", mid_freq_range),
+                                       ("high_freq_noise", high_freq_range))
                 }
             
             return {
@@ -1450,9 +1418,9 @@ class CircuitSimulator(BaseValidator):
                 "noise_metrics": noise_metrics,
                 "precision_analysis": precision_analysis,
                 "frequency_ranges": {
-                    "low_frequency": len(low_freq_range),
-                    "mid_frequency": len(mid_freq_range),
-                    "high_frequency": len(high_freq_range)
+                    "low_frequency": int(low_freq_range.sum()),
+                    "mid_frequency": int(mid_freq_range.sum()),
+                    "high_frequency": int(high_freq_range.sum())
                 }
             }
             
@@ -1514,161 +1482,123 @@ class CircuitSimulator(BaseValidator):
         Returns:
             List of frequency points optimized for audio analysis
         """
-        frequencies = []
-        
         if high_precision:
-            # Use logarithmic distribution with higher density in critical audio ranges
-            # More points in 20Hz-1kHz (low frequency detail)
-            # More points in 1kHz-20kHz (mid frequency detail)
-            # More points in 20kHz-80kHz (high frequency detail)
-            
-            # Calculate distribution weights
-            low_freq_weight = 0.3   # 30% of points for 20Hz-1kHz
-            mid_freq_weight = 0.4   # 40% of points for 1kHz-20kHz
-            high_freq_weight = 0.3  # 30% of points for 20kHz-80kHz
-            
-            # Generate low frequency points (20Hz - 1kHz)
-            low_freq_points = int(num_points * low_freq_weight)
-            for i in range(low_freq_points):
-                freq = start_freq * (1000.0 / start_freq) ** (i / (low_freq_points - 1))
-                frequencies.append(freq)
-            
-            # Generate mid frequency points (1kHz - 20kHz)
-            mid_freq_points = int(num_points * mid_freq_weight)
-            for i in range(mid_freq_points):
-                freq = 1000.0 * (20000.0 / 1000.0) ** (i / (mid_freq_points - 1))
-                frequencies.append(freq)
-            
-            # Generate high frequency points (20kHz - 80kHz)
-            high_freq_points = num_points - len(frequencies)
-            for i in range(high_freq_points):
-                freq = 20000.0 * (stop_freq / 20000.0) ** (i / (high_freq_points - 1))
-                frequencies.append(freq)
+            # Logarithmic distribution with higher density in critical audio ranges:
+            # 30% of points for 20Hz-1kHz, 40% for 1kHz-20kHz, 30% for 20kHz-80kHz
+            low_freq_points = int(num_points * 0.3)
+            mid_freq_points = int(num_points * 0.4)
+            high_freq_points = num_points - low_freq_points - mid_freq_points
+            
+            bands = [
+                start_freq * (1000.0 / start_freq) ** np.linspace(0.0, 1.0, low_freq_points),
+                1000.0 * (20000.0 / 1000.0) ** np.linspace(0.0, 1.0, mid_freq_points),
+                20000.0 * (stop_freq / 20000.0) ** np.linspace(0.0, 1.0, high_freq_points)
+            ]
             
             # Sort and remove duplicates
-            frequencies = sorted(list(set(frequencies)))
-            
-        else:
-            # Standard logarithmic distribution
-            for i in range(num_points):
-                if num_points == 1:
-                    freq = start_freq
-                else:
-                    freq = start_freq * (stop_freq / start_freq) ** (i / (num_points - 1))
-                frequencies.append(freq)
+            return np.unique(np.concatenate(bands)).tolist()
         
-        return frequencies
+        # Standard logarithmic distribution
+        return (start_freq * (stop_freq / start_freq) ** np.linspace(0.0, 1.0, num_points)).tolist()
     
-    def _analyze_bandwidth_characteristics(self, frequencies: List[float], magnitude: List[float], phase: List[float], high_precision: bool) -> Dict[str, Any]:
-        """Analyze bandwidth characteristics for high-precision audio analysis.
+    def _analyze_bandwidth_arrays(self, frequencies: np.ndarray, magnitude: np.ndarray,
+                                  phase: np.ndarray, high_precision: bool) -> List[Dict[str, Any]]:
+        """Analyze the bandwidth characteristics of several responses at once.
         
         Args:
-            frequencies: List of frequency points
-            magnitude: Magnitude response
-            phase: Phase response
+            frequencies: Ascending frequency points, shape (frequencies,)
+            magnitude: Magnitude responses, shape (nets, frequencies)
+            phase: Phase responses in degrees, shape (nets, frequencies)
             high_precision: High-precision mode flag
             
         Returns:
-            Dictionary containing bandwidth analysis results
+            Bandwidth analysis per response row
         """
         try:
-            if not frequencies or not magnitude or len(frequencies) != len(magnitude):
-                return {}
-            
-            # Find -3dB bandwidth
-            max_magnitude = max(magnitude)
-            threshold = max_magnitude / math.sqrt(2)  # -3dB point
-            
-            # Find low frequency -3dB point
-            low_freq_3db = frequencies[0]
-            for i, mag in enumerate(magnitude):
-                if mag >= threshold:
-                    low_freq_3db = frequencies[i]
-                    break
-            
-            # Find high frequency -3dB point
-            high_freq_3db = frequencies[-1]
-            for i in range(len(magnitude) - 1, -1, -1):
-                if magnitude[i] >= threshold:
-                    high_freq_3db = frequencies[i]
-                    break
-            
-            # Calculate bandwidth
+            count = magnitude.shape[0]
+            if not count or not frequencies.size or magnitude.shape[1] != frequencies.size:
+                return [{} for _ in range(count)]
+            
+            # -3dB points: first and last frequency at or above max / sqrt(2)
+            threshold = magnitude.max(axis=1) / math.sqrt(2)
+            above = magnitude >= threshold[:, None]
+            low_freq_3db = frequencies[np.argmax(above, axis=1)]
+            high_freq_3db = frequencies[frequencies.size - 1 - np.argmax(above[:, ::-1], axis=1)]
             bandwidth = high_freq_3db - low_freq_3db
             
-            # Calculate flatness (variation in passband)
-            passband_magnitudes = [mag for freq, mag in zip(frequencies, magnitude) 
-                                 if low_freq_3db <= freq <= high_freq_3db]
-            if passband_magnitudes:
-                flatness = min(passband_magnitudes) / max(passband_magnitudes)
-            else:
-                flatness = 1.0
-            
-            # Calculate phase variation
-            passband_phases = [ph for freq, ph in zip(frequencies, phase) 
-                             if low_freq_3db <= freq <= high_freq_3db]
-            if passband_phases:
-                phase_variation = max(passband_phases) - min(passband_phases)
-            else:
-                phase_variation = 0.0
+            # Flatness and phase variation in the passband
+            passband = (frequencies >= low_freq_3db[:, None]) & (frequencies <= high_freq_3db[:, None])
+            band_min = np.where(passband, magnitude, np.inf).min(axis=1)
+            band_max = np.where(passband, magnitude, -np.inf).max(axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                flatness = np.where(band_max > 0, band_min / band_max, 1.0)
+            phase_variation = (np.where(passband, phase, -np.inf).max(axis=1) -
+                               np.where(passband, phase, np.inf).min(axis=1))
             
             # High-precision metrics
-            precision_metrics = {}
             if high_precision:
-                # Calculate group delay
-                group_delay = self._calculate_group_delay(frequencies, phase)
-                precision_metrics["group_delay"] = group_delay
-                
-                # Calculate phase linearity
-                phase_linearity = self._calculate_phase_linearity(frequencies, phase)
-                precision_metrics["phase_linearity"] = phase_linearity
-                
-                # Calculate frequency resolution
-                freq_resolution = (frequencies[-1] - frequencies[0]) / len(frequencies)
-                precision_metrics["frequency_resolution"] = freq_resolution
-            
-            return {
-                "low_freq_3db": low_freq_3db,
-                "high_freq_3db": high_freq_3db,
-                "bandwidth": bandwidth,
-                "flatness": flatness,
-                "phase_variation": phase_variation,
-                "max_frequency": max(frequencies),
-                "extended_bandwidth": max(frequencies) > 20000.0,
-                "precision_metrics": precision_metrics
-            }
+                group_delay = self._group_delay_array(frequencies, phase)
+                phase_linearity = self._phase_linearity_array(frequencies, phase)
+                freq_resolution = float((frequencies[-1] - frequencies[0]) / frequencies.size)
+            
+            max_frequency = float(frequencies.max())
+            results = []
+            for row in range(count):
+                precision_metrics = {}
+                if high_precision:
+                    precision_metrics = {
+                        "group_delay": group_delay[row].tolist(),
+                        "phase_linearity": float(phase_linearity[row]),
+                        "frequency_resolution": freq_resolution
+                    }
+                results.append({
+                    "low_freq_3db": float(low_freq_3db[row]),
+                    "high_freq_3db": float(high_freq_3db[row]),
+                    "bandwidth": float(bandwidth[row]),
+                    "flatness": float(flatness[row]),
+                    "phase_variation": float(phase_variation[row]),
+                    "max_frequency": max_frequency,
+                    "extended_bandwidth": max_frequency > 20000.0,
+                    "precision_metrics": precision_metrics
+                })
+            return results
             
         except Exception as e:
             logger.error(f"Error analyzing bandwidth characteristics: {e}")
-            return {}
+            return [{} for _ in range(magnitude.shape[0])]
     
-    def _calculate_precision_metrics(self, frequencies: List[float], ac_results: Dict[str, Any], high_precision: bool) -> Dict[str, Any]:
+    def _calculate_precision_metrics(self, frequencies: List[float], ac_results: Dict[str, Any], high_precision: bool,
+                                     magnitudes: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Calculate precision metrics for high-precision audio analysis.
         
         Args:
             frequencies: List of frequency points
             ac_results: AC simulation results
             high_precision: High-precision mode flag
+            magnitudes: Magnitude responses of shape (nets, frequencies);
+                read from ``ac_results`` if None
             
         Returns:
             Dictionary containing precision metrics
         """
         try:
+            min_frequency = min(frequencies)
+            max_frequency = max(frequencies)
             metrics = {
                 "frequency_range": {
-                    "min": min(frequencies),
-                    "max": max(frequencies),
-                    "span": max(frequencies) - min(frequencies)
+                    "min": min_frequency,
+                    "max": max_frequency,
+                    "span": max_frequency - min_frequency
                 },
                 "resolution": {
                     "points": len(frequencies),
-                    "average_step": (max(frequencies) - min(frequencies)) / len(frequencies),
+                    "average_step": (max_frequency - min_frequency) / len(frequencies),
                     "logarithmic": True
                 },
                 "bandwidth_coverage": {
-                    "audio_bandwidth": max(frequencies) >= 20000.0,
-                    "extended_bandwidth": max(frequencies) >= 80000.0,
-                    "ultra_high_frequency": max(frequencies) > 100000.0
+                    "audio_bandwidth": max_frequency >= 20000.0,
+                    "extended_bandwidth": max_frequency >= 80000.0,
+                    "ultra_high_frequency": max_frequency > 100000.0
                 }
             }
             
@@ -1682,17 +1612,19 @@ class CircuitSimulator(BaseValidator):
                 }
                 
                 # Calculate signal quality metrics
-                if "magnitude_response" in ac_results:
-                    all_magnitudes = []
-                    for net_magnitudes in ac_results["magnitude_response"].values():
-                        all_magnitudes.extend(net_magnitudes)
-                    
-                    if all_magnitudes:
-                        metrics["signal_quality"] = {
-                            "dynamic_range": max(all_magnitudes) / min(all_magnitudes) if min(all_magnitudes) > 0 else float('inf'),
-                            "average_magnitude": sum(all_magnitudes) / len(all_magnitudes),
-                            "magnitude_variation": max(all_magnitudes) - min(all_magnitudes)
-                        }
+                if magnitudes is None:
+                    responses = list(ac_results.get("magnitude_response", {}).values())
+                    magnitudes = np.concatenate([np.asarray(m, dtype=float) for m in responses]) if responses else np.zeros(0)
+                all_magnitudes = np.asarray(magnitudes, dtype=float).ravel()
+                
+                if all_magnitudes.size:
+                    smallest = float(all_magnitudes.min())
+                    largest = float(all_magnitudes.max())
+                    metrics["signal_quality"] = {
+                        "dynamic_range": largest / smallest if smallest > 0 else float('inf'),
+                        "average_magnitude": float(all_magnitudes.mean()),
+                        "magnitude_variation": largest - smallest
+                    }
             
             return metrics
             
@@ -1700,84 +1632,56 @@ class CircuitSimulator(BaseValidator):
             logger.error(f"Error calculating precision metrics: {e}")
             return {}
     
-    def _calculate_group_delay(self, frequencies: List[float], phase: List[float]) -> List[float]:
-        """Calculate group delay from phase response.
+    def _group_delay_array(self, frequencies: np.ndarray, phase: np.ndarray) -> np.ndarray:
+        """Group delay of one or more phase responses.
+        
+        The phase is unwrapped first so that +/-180 degree wraps do not show
+        up as delay spikes.
         
         Args:
-            frequencies: List of frequency points
-            phase: Phase response in degrees
+            frequencies: Ascending frequency points, shape (frequencies,)
+            phase: Phase in degrees, shape (..., frequencies)
             
         Returns:
-            List of group delay values in seconds
+            Group delay in seconds with the same shape as ``phase``; the first
+            point repeats the second
         """
-        try:
-            if len(frequencies) < 2 or len(phase) < 2:
-                return []
-            
-            group_delay = []
-            for i in range(1, len(frequencies)):
-                # Calculate group delay as negative derivative of phase
-                phase_diff = (phase[i] - phase[i-1]) * math.pi / 180.0  # Convert to radians
-                freq_diff = frequencies[i] - frequencies[i-1]
-                
-                if freq_diff > 0:
-                    delay = -phase_diff / (2 * math.pi * freq_diff)
-                    group_delay.append(delay)
-                else:
-                    group_delay.append(0.0)
-            
-            # Add first point (extrapolate)
-            if group_delay:
-                group_delay.insert(0, group_delay[0])
-            
-            return group_delay
-            
-        except Exception as e:
-            logger.error(f"Error calculating group delay: {e}")
-            return []
+        if frequencies.size < 2:
+            return np.zeros_like(phase)
+        phase_diff = np.diff(np.unwrap(np.radians(phase), axis=-1), axis=-1)
+        freq_diff = np.diff(frequencies)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delay = np.where(freq_diff > 0, -phase_diff / (2 * math.pi * freq_diff), 0.0)
+        return np.concatenate([delay[..., :1], delay], axis=-1)
     
-    def _calculate_phase_linearity(self, frequencies: List[float], phase: List[float]) -> float:
-        """Calculate phase linearity as a measure of phase distortion.
+    def _phase_linearity_array(self, frequencies: np.ndarray, phase: np.ndarray) -> np.ndarray:
+        """Phase linearity score of several phase responses.
         
         Args:
-            frequencies: List of frequency points
-            phase: Phase response in degrees
+            frequencies: Frequency points, shape (frequencies,)
+            phase: Phase in degrees, shape (nets, frequencies)
             
         Returns:
-            Phase linearity score (0-1, higher is better)
+            Score per row (0-1, higher is better)
         """
-        try:
-            if len(frequencies) < 3 or len(phase) < 3:
-                return 1.0
-            
-            # Fit linear trend to phase vs frequency
-            # Calculate deviation from linearity
-            phase_normalized = [p - phase[0] for p in phase]
-            freq_normalized = [f - frequencies[0] for f in frequencies]
-            
-            # Simple linear fit
-            if max(freq_normalized) > 0:
-                slope = max(phase_normalized) / max(freq_normalized)
-                linear_phase = [slope * f for f in freq_normalized]
-                
-                # Calculate RMS deviation
-                deviations = [abs(p - lp) for p, lp in zip(phase_normalized, linear_phase)]
-                rms_deviation = math.sqrt(sum(d*d for d in deviations) / len(deviations))
-                
-                # Convert to linearity score (0-1)
-                max_phase_range = max(phase_normalized) - min(phase_normalized)
-                if max_phase_range > 0:
-                    linearity = max(0, 1 - rms_deviation / max_phase_range)
-                else:
-                    linearity = 1.0
-                
-                return linearity
-            
-            return 1.0
-            
-        except Exception as e:
-            logger.error(f"Error calculating phase linearity: {e}")
-            return 1.0
+        if frequencies.size < 3:
+            return np.ones(phase.shape[0])
+        
+        # Deviation from a straight line through the first point
+        phase_normalized = phase - phase[:, :1]
+        freq_normalized = frequencies - frequencies[0]
+        freq_span = freq_normalized.max()
+        if freq_span <= 0:
+            return np.ones(phase.shape[0])
+        
+        slope = phase_normalized.max(axis=1) / freq_span
+        deviation = phase_normalized - slope[:, None] * freq_normalized
+        rms_deviation = np.sqrt(np.mean(deviation * deviation, axis=1))
+        
+        phase_range = phase_normalized.max(axis=1) - phase_normalized.min(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            linearity = np.where(phase_range > 0, np.maximum(0.0, 1.0 - rms_deviation / phase_range), 1.0)
+        return linearity
     
     # Plotting helper methods
     
@@ -1848,7 +1752,7 @@ class CircuitSimulator(BaseValidator):
         data = result.data
         time_points = data.get("time", [])
         
-        if not time_points:
+        if len(time_points) == 0:
             return
         
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
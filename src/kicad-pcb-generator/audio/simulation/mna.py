@@ -0,0 +1,656 @@
+"""
+Sparse Modified Nodal Analysis (MNA) engine.
+
+Circuits are stamped into two sparse matrices so that the system at complex
+frequency ``s`` is ``(G + s*C) x = b``. ``x`` holds node voltages followed by
+branch currents of voltage sources, inductors and op-amp outputs. DC analysis
+factorizes ``G`` once; an AC sweep assembles one block-diagonal system for
+all frequency points and factorizes it in a single call. Impedance and
+noise analyses factorize each frequency point separately and solve one
+point at a time, the noise analysis through transposed (adjoint) solves.
+"""
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.sparse import coo_matrix, csc_matrix
+from scipy.sparse.linalg import splu
+
+logger = logging.getLogger(__name__)
+
+BOLTZMANN = 1.380649e-23  # J/K
+
+GROUND_PREFIXES = ("GND", "VSS", "AGND", "DGND")
+DEFAULT_SUPPLY_VOLTAGE = 5.0
+
+# Single-pole op-amp macro model
+OPAMP_OPEN_LOOP_GAIN = 1e5
+OPAMP_GAIN_BANDWIDTH = 1e6  # Hz
+
+# (output, inverting, non-inverting) pads per op-amp channel. Singles have
+# the output on pin 6 (1/5/8 are offset trim); duals and quads share the
+# first two channels.
+OPAMP_SINGLE_PADS = (("6", "2", "3"),)
+OPAMP_CHANNEL_PADS = (("1", "2", "3"), ("7", "6", "5"), ("8", "9", "10"), ("14", "13", "12"))
+OPAMP_VALUE_PATTERN = re.compile(
+    r"(OPA|TL0[6-8]|NE55|LM358|LM324|LM833|LM4562|LME49|AD8[0-9]|OP[0-9]|MC33|RC4558|NJM)",
+    re.IGNORECASE
+)
+OPAMP_SINGLE_PATTERN = re.compile(
+    r"^(OPA[0-9]{3}(?![0-9])|OPA16[0-9]1|TL0[6-8]1|NE5534|LM741|LME49[0-9]10|AD797|AD8[0-9]10"
+    r"|OP[0-9]{2}(?![0-9]))",
+    re.IGNORECASE
+)
+
+_SI_PREFIXES = {
+    "f": 1e-15, "p": 1e-12, "n": 1e-9, "u": 1e-6, "µ": 1e-6, "μ": 1e-6,
+    "m": 1e-3, "k": 1e3, "K": 1e3, "M": 1e6, "G": 1e9, "R": 1.0, "r": 1.0,
+}
+_VALUE_PATTERN = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*(meg|Meg|MEG|[fpnuµμmkKMGRr])?([0-9]*)")
+_SUPPLY_PATTERN = re.compile(r"^([+-])?(\d+)(?:[Vv.](\d+))?V?$")
+_RAIL_PATTERN = re.compile(r"^\+?(?:(VCC|VDD|VEE)(?:_?[A-Z0-9]+)?|(V[+-]))$")
+
+# Nets such as IN, AUDIO_IN, INPUT_L or /CV_IN1 that carry a circuit input
+INPUT_NET_PATTERN = re.compile(r"^(?:[A-Z0-9]+_)*IN(?:PUT)?(?:[_-][A-Z0-9]+|[0-9]+|[LR])?$")
+CONNECTOR_PREFIXES = ("J", "P", "CN")
+
+
+def parse_value(value: str) -> Optional[float]:
+    """Parse a component value such as ``10k``, ``4.7uF``, ``2k2`` or ``1Meg``.
+
+    Args:
+        value: Component value string
+
+    Returns:
+        Value in base units, or None if the string is not numeric
+    """
+    if value is None:
+        return None
+    match = _VALUE_PATTERN.match(str(value))
+    if not match:
+        return None
+    number, prefix, fraction = match.groups()
+    if prefix and prefix.lower() == "meg":
+        scale = 1e6
+    else:
+        scale = _SI_PREFIXES.get(prefix, 1.0) if prefix else 1.0
+    text = number
+    # "2k2" style: the prefix doubles as the decimal point
+    if prefix and fraction and "." not in number:
+        text = f"{number}.{fraction}"
+    return float(text) * scale
+
+
+def is_ground_net(net_name: str) -> bool:
+    """Whether a net is treated as the reference node."""
+    return net_name in ("0", "") or net_name.upper().startswith(GROUND_PREFIXES)
+
+
+def supply_voltage(net_name: str) -> Optional[float]:
+    """Infer the voltage of a supply net from its name.
+
+    ``+15V`` → 15, ``-15V`` → -15, ``+3V3`` → 3.3; ``VCC``/``VDD``/``V+``
+    and ``VEE``/``V-`` → plus or minus the default supply voltage. Returns
+    None for every other net, including signals such as ``+IN``.
+    """
+    match = _SUPPLY_PATTERN.match(net_name)
+    if match and (match.group(1) or net_name.upper().endswith("V")):
+        sign, whole, frac = match.groups()
+        voltage = float(f"{whole}.{frac}" if frac else whole)
+        return -voltage if sign == "-" else voltage
+    rail = _RAIL_PATTERN.match(net_name.rsplit("/", 1)[-1].upper())
+    if rail:
+        negative = (rail.group(1) or rail.group(2)) in ("VEE", "V-")
+        return -DEFAULT_SUPPLY_VOLTAGE if negative else DEFAULT_SUPPLY_VOLTAGE
+    return None
+
+
+def resolve_input_net(circuit: Dict[str, Any], requested: Optional[str] = None) -> str:
+    """Net that the AC or transient excitation drives.
+
+    Without a requested net the first input-like net (``IN``, ``AUDIO_IN``,
+    ...) is used, then the first signal net on a connector pad.
+
+    Args:
+        circuit: Circuit dictionary
+        requested: Net name given by the caller
+
+    Returns:
+        Name of the input net
+
+    Raises:
+        ValueError: If the requested net is not in the circuit, or no input
+            net can be found
+    """
+    nets = [name for name in circuit.get("nets", {}) if not is_ground_net(name)]
+    if requested is not None:
+        if requested not in nets:
+            raise ValueError(f"Input net {requested!r} is not a net of the circuit")
+        return requested
+
+    signal_nets = [name for name in nets if supply_voltage(name) is None]
+    for name in signal_nets:
+        if INPUT_NET_PATTERN.match(name.rsplit("/", 1)[-1].upper()):
+            return name
+
+    available = set(signal_nets)
+    for ref, data in sorted(circuit.get("components", {}).items()):
+        prefix = re.match(r"^[A-Za-z]+", ref or "")
+        if not prefix or prefix.group(0).upper() not in CONNECTOR_PREFIXES:
+            continue
+        pads = sorted(data.get("pads", []), key=lambda pad: _pad_sort_key(str(pad.get("number", ""))))
+        for pad in pads:
+            if pad.get("net") in available:
+                return pad["net"]
+    raise ValueError("No input net found in the circuit; pass ac_source or input_source")
+
+
+def stamped_quantity(kind: str, value: Any) -> Any:
+    """Quantity an element's value enters the MNA matrices as.
+
+    Resistors are stamped by conductance, every other element by value.
+    """
+    return 1.0 / value if kind == "R" else value
+
+
+@dataclass
+class Element:
+    """A circuit element for MNA stamping.
+
+    ``kind`` is one of ``R``, ``C``, ``L``, ``V``, ``I`` or ``OPAMP``. Two-terminal
+    elements use ``nodes = (positive, negative)``; op-amps use
+    ``(output, inverting, non_inverting)``.
+    """
+    kind: str
+    name: str
+    nodes: Tuple[str, ...]
+    value: float = 0.0
+    ac: complex = 0.0
+    params: Dict[str, float] = field(default_factory=dict)
+
+
+def elements_from_parts(parts: Iterable[Tuple[str, str, Dict[str, str]]]) -> List[Element]:
+    """Build elements from (reference, value, pad→net) tuples.
+
+    Parts that are not R/C/L/V/I or a recognised op-amp are skipped, as are
+    parts (or op-amp channels) with unconnected pins.
+
+    Args:
+        parts: Iterable of (reference, value, pad number → net name)
+
+    Returns:
+        List of elements
+    """
+    elements: List[Element] = []
+    for ref, value, pads in parts:
+        prefix = re.match(r"^[A-Za-z]+", ref or "")
+        prefix = prefix.group(0).upper() if prefix else ""
+
+        if prefix in ("R", "C", "L", "V", "I"):
+            nets = [pads[number] for number in sorted(pads, key=_pad_sort_key)][:2]
+            parsed = parse_value(value)
+            if (len(nets) < 2 or not all(nets) or parsed is None
+                    or (prefix in ("R", "L", "C") and parsed <= 0)):
+                logger.debug(f"Skipping {ref} ({value}) in MNA circuit")
+                continue
+            elements.append(Element(kind=prefix, name=ref, nodes=(nets[0], nets[1]), value=parsed))
+
+        elif prefix in ("U", "IC") and OPAMP_VALUE_PATTERN.search(value or ""):
+            for channel, (out, inv, non_inv) in enumerate(opamp_channel_pads(value)):
+                # Channels with an unconnected pin are unused
+                if pads.get(out) and pads.get(inv) and pads.get(non_inv):
+                    elements.append(Element(
+                        kind="OPAMP", name=f"{ref}{chr(ord('A') + channel)}",
+                        nodes=(pads[out], pads[inv], pads[non_inv]),
+                        params={"gain": OPAMP_OPEN_LOOP_GAIN, "gbw": OPAMP_GAIN_BANDWIDTH}
+                    ))
+    return elements
+
+
+def opamp_channel_pads(value: str) -> Tuple[Tuple[str, str, str], ...]:
+    """(output, inverting, non-inverting) pads of each channel of an op-amp.
+
+    Args:
+        value: Part value, e.g. ``OPA134`` (single) or ``OPA2134`` (dual)
+
+    Returns:
+        The single-channel pinout for known single op-amps, otherwise the
+        dual/quad channel table
+    """
+    if OPAMP_SINGLE_PATTERN.match(str(value).strip()):
+        return OPAMP_SINGLE_PADS
+    return OPAMP_CHANNEL_PADS
+
+
+def elements_from_circuit(circuit: Dict[str, Any]) -> List[Element]:
+    """Build elements from a ``CircuitSimulator`` circuit dictionary."""
+    return elements_from_parts(
+        (ref, str(data.get("value", "")),
+         {str(pad.get("number", "")): pad.get("net", "") for pad in data.get("pads", [])})
+        for ref, data in circuit.get("components", {}).items()
+    )
+
+
+def elements_from_netlist(netlist: Any) -> List[Element]:
+    """Build elements from a ``core.netlist.parser.Netlist``."""
+    return elements_from_parts(
+        (fp.ref, fp.value, {pc.pad_name: pc.net_name for pc in fp.pad_connections})
+        for fp in netlist.footprints
+    )
+
+
+def _pad_sort_key(number: str) -> Tuple[int, Any]:
+    return (0, int(number)) if str(number).isdigit() else (1, str(number))
+
+
+class MNASystem:
+    """Sparse MNA system ``(G + s*C) x = b`` for a set of elements."""
+
+    def __init__(self, elements: Sequence[Element], nets: Iterable[str] = (),
+                 gmin: float = 1e-12):
+        """Stamp the elements.
+
+        Args:
+            elements: Circuit elements
+            nets: Additional nets to include as nodes even if unconnected
+            gmin: Conductance from every node to ground so floating nodes
+                keep the matrix non-singular
+        """
+        self.elements = list(elements)
+        node_names: Dict[str, int] = {}
+        for name in list(nets) + [n for e in self.elements for n in e.nodes]:
+            if not is_ground_net(name) and name not in node_names:
+                node_names[name] = len(node_names)
+        self.nodes: List[str] = list(node_names)
+        self.node_index = node_names
+        self.num_nodes = len(self.nodes)
+
+        # Branch variables follow the node voltages
+        self.branches: Dict[str, int] = {}
+        for element in self.elements:
+            if element.kind in ("V", "L", "OPAMP"):
+                self.branches[element.name] = self.num_nodes + len(self.branches)
+        self.size = self.num_nodes + len(self.branches)
+
+        self.resistors = [e for e in self.elements if e.kind == "R"]
+        self._stamp(gmin)
+        self._dc_lu = None
+        self._ac_key: Optional[bytes] = None
+        self._ac_lu = None
+        self._point_key: Optional[bytes] = None
+        self._point_lus: List[Any] = []
+
+    # ------------------------------------------------------------------
+    # Stamping
+    # ------------------------------------------------------------------
+    def _index(self, net: str) -> int:
+        return -1 if is_ground_net(net) else self.node_index[net]
+
+    def _stamp(self, gmin: float) -> None:
+        g_rows: List[int] = []
+        g_cols: List[int] = []
+        g_vals: List[float] = []
+        c_rows: List[int] = []
+        c_cols: List[int] = []
+        c_vals: List[float] = []
+        self.b_dc = np.zeros(self.size)
+        self.b_ac = np.zeros(self.size, dtype=complex)
+
+        def add(rows, cols, vals, r, c, v):
+            if r >= 0 and c >= 0:
+                rows.append(r)
+                cols.append(c)
+                vals.append(v)
+
+        def admittance(rows, cols, vals, a, b, y):
+            add(rows, cols, vals, a, a, y)
+            add(rows, cols, vals, b, b, y)
+            add(rows, cols, vals, a, b, -y)
+            add(rows, cols, vals, b, a, -y)
+
+        def incidence(a, b, k):
+            add(g_rows, g_cols, g_vals, a, k, 1.0)
+            add(g_rows, g_cols, g_vals, b, k, -1.0)
+            add(g_rows, g_cols, g_vals, k, a, 1.0)
+            add(g_rows, g_cols, g_vals, k, b, -1.0)
+
+        for element in self.elements:
+            nodes = [self._index(n) for n in element.nodes]
+            if element.kind == "R":
+                admittance(g_rows, g_cols, g_vals, nodes[0], nodes[1], 1.0 / element.value)
+            elif element.kind == "C":
+                admittance(c_rows, c_cols, c_vals, nodes[0], nodes[1], element.value)
+            elif element.kind == "L":
+                k = self.branches[element.name]
+                incidence(nodes[0], nodes[1], k)
+                add(c_rows, c_cols, c_vals, k, k, -element.value)
+            elif element.kind == "V":
+                k = self.branches[element.name]
+                incidence(nodes[0], nodes[1], k)
+                self.b_dc[k] = element.value
+                self.b_ac[k] = element.ac
+            elif element.kind == "I":
+                # Current flows from the positive node through the source
+                if nodes[0] >= 0:
+                    self.b_dc[nodes[0]] -= element.value
+                    self.b_ac[nodes[0]] -= element.ac
+                if nodes[1] >= 0:
+                    self.b_dc[nodes[1]] += element.value
+                    self.b_ac[nodes[1]] += element.ac
+            elif element.kind == "OPAMP":
+                # (1 + s/wp) V(out) - A0 (V(+) - V(-)) = 0, output current in branch k
+                k = self.branches[element.name]
+                out, inv, non_inv = nodes
+                gain = element.params.get("gain", OPAMP_OPEN_LOOP_GAIN)
+                pole = 2 * np.pi * element.params.get("gbw", OPAMP_GAIN_BANDWIDTH) / gain
+                add(g_rows, g_cols, g_vals, out, k, 1.0)
+                add(g_rows, g_cols, g_vals, k, out, 1.0)
+                add(g_rows, g_cols, g_vals, k, non_inv, -gain)
+                add(g_rows, g_cols, g_vals, k, inv, gain)
+                add(c_rows, c_cols, c_vals, k, out, 1.0 / pole)
+
+        for i in range(self.num_nodes):
+            add(g_rows, g_cols, g_vals, i, i, gmin)
+
+        shape = (self.size, self.size)
+        self.G = coo_matrix((g_vals, (g_rows, g_cols)), shape=shape).tocsc()
+        self.C = coo_matrix((c_vals, (c_rows, c_cols)), shape=shape).tocsc()
+
+    def value_stamp(self, name: str) -> Tuple[csc_matrix, csc_matrix, np.ndarray]:
+        """Sensitivity of the stamped matrices to one element's value.
+
+        ``G``, ``C`` and ``b_dc`` are linear in the stamped quantity of an
+        R (its conductance), C, L, V or I element, so a changed value ``v``
+        adds ``(stamped_quantity(v) - stamped_quantity(v0))`` times these.
+
+        Args:
+            name: Element name
+
+        Returns:
+            (dG, dC, db_dc) per unit of the stamped quantity
+        """
+        element = next(e for e in self.elements if e.name == name)
+        if element.kind not in ("R", "C", "L", "V", "I"):
+            raise ValueError(f"Element {name} has no scalar value")
+        pos, neg = (self._index(n) for n in element.nodes)
+        rows: List[int] = []
+        cols: List[int] = []
+        vals: List[float] = []
+        b = np.zeros(self.size)
+
+        def add(r, c, v):
+            if r >= 0 and c >= 0:
+                rows.append(r)
+                cols.append(c)
+                vals.append(v)
+
+        if element.kind in ("R", "C"):
+            for r, c, v in ((pos, pos, 1.0), (neg, neg, 1.0), (pos, neg, -1.0), (neg, pos, -1.0)):
+                add(r, c, v)
+        elif element.kind == "L":
+            k = self.branches[name]
+            add(k, k, -1.0)
+        elif element.kind == "V":
+            b[self.branches[name]] = 1.0
+        else:
+            if pos >= 0:
+                b[pos] -= 1.0
+            if neg >= 0:
+                b[neg] += 1.0
+
+        shape = (self.size, self.size)
+        matrix = coo_matrix((vals, (rows, cols)), shape=shape).tocsc()
+        empty = csc_matrix(shape)
+        return (matrix if element.kind == "R" else empty,
+                matrix if element.kind in ("C", "L") else empty,
+                b)
+
+    # ------------------------------------------------------------------
+    # DC
+    # ------------------------------------------------------------------
+    def solve_dc(self, b: Optional[np.ndarray] = None) -> np.ndarray:
+        """Solve the DC operating point, reusing the factorization of G.
+
+        Args:
+            b: Optional right-hand side(s); defaults to the DC sources
+
+        Returns:
+            Solution vector (or matrix for several right-hand sides)
+        """
+        if self.size == 0:
+            return np.zeros(0)
+        if self._dc_lu is None:
+            self._dc_lu = splu(self.G)
+        return self._dc_lu.solve(self.b_dc if b is None else b)
+
+    # ------------------------------------------------------------------
+    # AC
+    # ------------------------------------------------------------------
+    def _factorize_sweep(self, frequencies: np.ndarray):
+        """Factorize the block-diagonal system of all frequency points once."""
+        key = frequencies.tobytes()
+        if self._ac_key == key:
+            return self._ac_lu
+
+        n = self.size
+        count = len(frequencies)
+        s = 2j * np.pi * frequencies
+        g = self.G.tocoo()
+        c = self.C.tocoo()
+        offsets = (np.arange(count) * n)[:, None]
+        rows = np.concatenate([(offsets + g.row).ravel(), (offsets + c.row).ravel()])
+        cols = np.concatenate([(offsets + g.col).ravel(), (offsets + c.col).ravel()])
+        vals = np.concatenate([np.tile(g.data.astype(complex), count), np.outer(s, c.data).ravel()])
+        system = csc_matrix((vals, (rows, cols)), shape=(n * count, n * count))
+
+        self._ac_lu = splu(system)
+        self._ac_key = key
+        return self._ac_lu
+
+    def solve_ac(self, frequencies: Sequence[float], b: Optional[np.ndarray] = None) -> np.ndarray:
+        """Solve every frequency point of an AC sweep in one batched solve.
+
+        Args:
+            frequencies: Frequency points in Hz
+            b: Optional excitation vector; defaults to the AC sources
+
+        Returns:
+            Complex array of shape (len(frequencies), size)
+        """
+        frequencies = np.asarray(frequencies, dtype=float)
+        if self.size == 0:
+            return np.zeros((len(frequencies), 0), dtype=complex)
+        lu = self._factorize_sweep(frequencies)
+        rhs = np.tile(self.b_ac if b is None else b, len(frequencies))
+        return lu.solve(rhs).reshape(len(frequencies), self.size)
+
+    def _node_indices(self, nodes: Optional[Iterable[str]]) -> np.ndarray:
+        if nodes is None:
+            return np.arange(self.num_nodes)
+        return np.array([self.node_index[n] for n in nodes if n in self.node_index], dtype=int)
+
+    def _factorize_points(self, frequencies: np.ndarray) -> List[Any]:
+        """Factorize ``G + s*C`` separately at each frequency point."""
+        key = frequencies.tobytes()
+        if self._point_key != key:
+            g = self.G.astype(complex)
+            c = self.C.astype(complex)
+            self._point_lus = [splu(csc_matrix(g + 2j * np.pi * f * c)) for f in frequencies]
+            self._point_key = key
+        return self._point_lus
+
+    def _unit_solves(self, frequencies: np.ndarray, indices: np.ndarray, chunk: int,
+                     trans: str = "N") -> Iterable[Tuple[int, int, np.ndarray, np.ndarray]]:
+        """Solve with unit excitations at ``indices``, one frequency point at a time.
+
+        The right-hand side is at most (size, chunk), however long the sweep.
+
+        Yields:
+            (frequency index, offset of the chunk in ``indices``, chunk of
+            indices, solutions of shape (size, len(chunk)))
+        """
+        n = self.size
+        for point, lu in enumerate(self._factorize_points(frequencies)):
+            for start in range(0, len(indices), chunk):
+                part = indices[start:start + chunk]
+                rhs = np.zeros((n, len(part)), dtype=complex)
+                rhs[part, np.arange(len(part))] = 1.0
+                yield point, start, part, lu.solve(rhs, trans=trans)
+
+    def node_impedance(self, frequencies: Sequence[float], nodes: Optional[Iterable[str]] = None,
+                       chunk: int = 32) -> np.ndarray:
+        """Driving-point impedance from nodes to ground.
+
+        Each node costs one extra solve per frequency point, so pass
+        ``nodes`` when only a few nets are of interest.
+
+        Args:
+            frequencies: Frequency points in Hz
+            nodes: Net names; defaults to every node
+            chunk: Number of nodes solved per batch
+
+        Returns:
+            Complex array of shape (len(frequencies), len(nodes))
+        """
+        frequencies = np.asarray(frequencies, dtype=float)
+        indices = self._node_indices(nodes)
+        result = np.zeros((len(frequencies), len(indices)), dtype=complex)
+        for point, start, part, solution in self._unit_solves(frequencies, indices, chunk):
+            result[point, start:start + len(part)] = solution[part, np.arange(len(part))]
+        return result
+
+    # ------------------------------------------------------------------
+    # Noise
+    # ------------------------------------------------------------------
+    def thermal_noise(self, frequencies: Sequence[float], temperature: float = 300.0,
+                      nodes: Optional[Iterable[str]] = None, chunk: int = 32) -> np.ndarray:
+        """Thermal noise density at nodes.
+
+        Each resistor contributes a current noise ``4kT/R`` between its
+        terminals. Transfer impedances from every resistor to a node come from
+        one adjoint (transposed) solve per node at each frequency point.
+
+        Args:
+            frequencies: Frequency points in Hz
+            temperature: Temperature in K
+            nodes: Net names; defaults to every node
+            chunk: Number of nodes solved per batch
+
+        Returns:
+            Array of shape (len(frequencies), len(nodes)) in V/√Hz
+        """
+        frequencies = np.asarray(frequencies, dtype=float)
+        indices = self._node_indices(nodes)
+        result = np.zeros((len(frequencies), len(indices)))
+        if not self.resistors or not len(indices):
+            return result
+
+        a = np.array([self._index(r.nodes[0]) for r in self.resistors])
+        b = np.array([self._index(r.nodes[1]) for r in self.resistors])
+        current_psd = 4 * BOLTZMANN * temperature / np.array([r.value for r in self.resistors])
+
+        for point, start, part, adjoint in self._unit_solves(frequencies, indices, chunk,
+                                                             trans="T"):
+            # adjoint[j, k] is row part[k] of the inverse at this frequency
+            za = np.where((a >= 0)[:, None], adjoint[np.maximum(a, 0), :], 0.0)
+            zb = np.where((b >= 0)[:, None], adjoint[np.maximum(b, 0), :], 0.0)
+            transfer = np.abs(za - zb) ** 2  # (resistors, nodes)
+            result[point, start:start + len(part)] = np.sqrt(current_psd @ transfer)
+        return result
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+    def node_values(self, x: np.ndarray) -> Dict[str, Any]:
+        """Map a solution vector to node names."""
+        return {name: x[i] for i, name in enumerate(self.nodes)}
+
+    def branch_values(self, x: np.ndarray) -> Dict[str, Any]:
+        """Map a solution vector to branch element names."""
+        return {name: x[k] for name, k in self.branches.items()}
+
+    def voltage(self, x: np.ndarray, net: str) -> Any:
+        """Voltage of a net in a solution vector (0 for ground)."""
+        index = self._index(net)
+        return 0.0 if index < 0 else x[..., index]
+
+    def voltages(self, x: np.ndarray, nets: Sequence[str]) -> np.ndarray:
+        """Voltages of several nets (0 for ground).
+
+        Args:
+            x: Solution vector, or a sweep of shape (points, size)
+            nets: Net names
+
+        Returns:
+            Array of shape (len(nets),) or (len(nets), points)
+        """
+        indices = np.array([self._index(net) for net in nets], dtype=int)
+        padded = np.concatenate([x, np.zeros(x.shape[:-1] + (1,), dtype=x.dtype)], axis=-1)
+        return np.moveaxis(padded[..., indices], -1, 0)
+
+    def resistor_currents(self, x: np.ndarray) -> np.ndarray:
+        """Current through every resistor (positive from first to second node)."""
+        if not self.resistors:
+            return np.zeros(0)
+        padded = np.append(x, 0.0)  # index -1 maps to ground
+        a = np.array([self._index(r.nodes[0]) for r in self.resistors])
+        b = np.array([self._index(r.nodes[1]) for r in self.resistors])
+        values = np.array([r.value for r in self.resistors])
+        return (padded[a] - padded[b]) / values
+
+
+def build_system(circuit: Dict[str, Any], voltage_sources: Optional[Dict[str, float]] = None,
+                 current_sources: Optional[Dict[str, float]] = None,
+                 ac_source: Optional[str] = None, ac_amplitude: float = 1.0) -> MNASystem:
+    """Build an MNA system from a ``CircuitSimulator`` circuit dictionary.
+
+    Supply nets (``VCC``, ``+15V``, ...) and nets listed in ``voltage_sources``
+    are driven by ideal DC sources to ground. ``current_sources`` inject a DC
+    current into a net. ``ac_source`` is driven with the AC amplitude (on top
+    of its DC source, if any).
+
+    Args:
+        circuit: Circuit dictionary
+        voltage_sources: Net name → DC voltage
+        current_sources: Net name → injected DC current
+        ac_source: Net driven by the AC excitation
+        ac_amplitude: AC excitation amplitude in V
+
+    Returns:
+        Stamped MNA system
+
+    Raises:
+        ValueError: If ``ac_source`` is ground or neither a net nor a source
+    """
+    elements = elements_from_circuit(circuit)
+    nets = [name for name in circuit.get("nets", {}) if not is_ground_net(name)]
+    voltage_sources = dict(voltage_sources or {})
+
+    sources: Dict[str, float] = {}
+    for net in nets:
+        voltage = voltage_sources.get(net, supply_voltage(net))
+        if voltage is not None:
+            sources[net] = float(voltage)
+    for net, voltage in voltage_sources.items():
+        sources.setdefault(net, float(voltage))
+    if ac_source and (is_ground_net(ac_source) or (ac_source not in nets and ac_source not in sources)):
+        raise ValueError(f"AC source net {ac_source!r} is not in the circuit")
+
+    driven = {n for e in elements if e.kind == "V" for n in e.nodes}
+    for net, voltage in sources.items():
+        if net in driven or is_ground_net(net):
+            continue
+        elements.append(Element(kind="V", name=f"V_{net}", nodes=(net, "GND"), value=voltage,
+                                ac=ac_amplitude if net == ac_source else 0.0))
+
+    if ac_source and ac_source not in sources:
+        elements.append(Element(kind="V", name=f"VAC_{ac_source}", nodes=(ac_source, "GND"),
+                                value=0.0, ac=ac_amplitude))
+
+    for net, current in (current_sources or {}).items():
+        elements.append(Element(kind="I", name=f"I_{net}", nodes=("GND", net),
+                                value=float(current)))
+
+    return MNASystem(elements, nets=nets)
@@ -0,0 +1,396 @@
+"""Bounded, content-addressed cache for simulation results.
+
+Keys are SHA-256 digests of the extracted circuit and the normalized
+simulation parameters, so editing the board invalidates results naturally
+and optimizer loops that re-simulate an unchanged circuit get real hits.
+The in-memory tier is an LRU bounded by entry count and by estimated encoded
+size; an optional on-disk tier keeps JSON-encoded results between sessions.
+"""
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+
+def canonicalize(obj: Any, normalize_numbers: bool = False) -> Any:
+    """Convert an object into plain JSON-compatible data.
+
+    Args:
+        obj: Object to convert (dicts, sequences, numpy data, enums, ...)
+        normalize_numbers: Represent every int and float as float so that
+            ``100`` and ``100.0`` produce the same key
+
+    Returns:
+        JSON-compatible data
+    """
+    if isinstance(obj, dict):
+        return {str(k): canonicalize(v, normalize_numbers) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [canonicalize(v, normalize_numbers) for v in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted((canonicalize(v, normalize_numbers) for v in obj), key=repr)
+    if isinstance(obj, np.ndarray):
+        return canonicalize(obj.tolist(), normalize_numbers)
+    if isinstance(obj, np.generic):
+        return canonicalize(obj.item(), normalize_numbers)
+    if isinstance(obj, Enum):
+        return canonicalize(obj.value, normalize_numbers)
+    if isinstance(obj, complex):
+        return {"re": canonicalize(obj.real, normalize_numbers),
+                "im": canonicalize(obj.imag, normalize_numbers)}
+    if isinstance(obj, bool) or obj is None or isinstance(obj, str):
+        return obj
+    if isinstance(obj, (int, float)):
+        return float(obj) if normalize_numbers else obj
+    return str(obj)
+
+
+def content_key(*parts: Any) -> str:
+    """Compute a stable SHA-256 key for canonicalized parts."""
+    payload = json.dumps(canonicalize(parts, normalize_numbers=True), sort_keys=True,
+                         separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def encode_value(obj: Any) -> Any:
+    """Convert an object into JSON-compatible data that ``decode_value`` restores.
+
+    Unlike ``canonicalize``, arrays keep their dtype and shape (stored as
+    base64), and tuples, complex numbers and non-string dict keys survive
+    the round trip. Enums are stored by value.
+
+    Args:
+        obj: Object to convert
+
+    Returns:
+        JSON-compatible data
+    """
+    if isinstance(obj, dict):
+        if all(isinstance(k, str) for k in obj):
+            return {k: encode_value(v) for k, v in obj.items()}
+        return {"__items__": [[encode_value(k), encode_value(v)] for k, v in obj.items()]}
+    if isinstance(obj, tuple):
+        return {"__tuple__": [encode_value(v) for v in obj]}
+    if isinstance(obj, list):
+        return [encode_value(v) for v in obj]
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            return {"__ndarray__": encode_value(obj.tolist()), "shape": list(obj.shape)}
+        data = np.ascontiguousarray(obj)
+        return {
+            "__ndarray__": base64.b64encode(data.tobytes()).decode("ascii"),
+            "dtype": data.dtype.str,
+            "shape": list(data.shape)
+        }
+    if isinstance(obj, np.generic):
+        return encode_value(obj.item())
+    if isinstance(obj, complex):
+        return {"__complex__": [obj.real, obj.imag]}
+    return canonicalize(obj)
+
+
+def decode_value(data: Any) -> Any:
+    """Rebuild an object from data produced by ``encode_value``."""
+    if isinstance(data, list):
+        return [decode_value(v) for v in data]
+    if not isinstance(data, dict):
+        return data
+    if "__ndarray__" in data:
+        shape = tuple(data["shape"])
+        if "dtype" not in data:
+            return np.array(decode_value(data["__ndarray__"]), dtype=object).reshape(shape)
+        raw = base64.b64decode(data["__ndarray__"])
+        return np.frombuffer(raw, dtype=np.dtype(data["dtype"])).reshape(shape).copy()
+    if "__tuple__" in data:
+        return tuple(decode_value(v) for v in data["__tuple__"])
+    if "__complex__" in data:
+        return complex(*data["__complex__"])
+    if "__items__" in data:
+        return {decode_value(k): decode_value(v) for k, v in data["__items__"]}
+    return {k: decode_value(v) for k, v in data.items()}
+
+
+def estimate_size(obj: Any) -> int:
+    """Estimate the size in bytes of ``json.dumps(encode_value(obj))``.
+
+    Arrays are costed from ``nbytes`` without being converted, so results
+    too large to cache are rejected before any encoding work is done.
+    """
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            return 32 + 24 * obj.size
+        return 64 + (obj.nbytes + 2) // 3 * 4
+    if isinstance(obj, dict):
+        return 2 + sum(estimate_size(k) + estimate_size(v) + 2 for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return 2 + sum(estimate_size(v) + 1 for v in obj)
+    if isinstance(obj, str):
+        return len(obj) + 2
+    if isinstance(obj, (bool, int, float, complex, np.generic)) or obj is None:
+        return 24
+    if hasattr(obj, "__dict__"):
+        return estimate_size(vars(obj))
+    return len(str(obj)) + 2
+
+
+class SimulationCache:
+    """LRU cache bounded by entry count and bytes, with an optional disk tier."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 cache_dir: Optional[str] = None, max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+                 encode: Optional[Callable[[Any], Dict[str, Any]]] = None,
+                 decode: Optional[Callable[[Dict[str, Any]], Any]] = None):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results kept in memory
+            max_bytes: Maximum encoded size of the results kept in memory
+            cache_dir: Directory for the on-disk tier; None disables it
+            max_disk_bytes: Maximum total size of the on-disk tier
+            encode: Converts a value into JSON-compatible data; defaults to
+                ``encode_value``
+            decode: Rebuilds a value from data produced by ``encode``;
+                defaults to ``decode_value``
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._encode = encode or encode_value
+        self._decode = decode or decode_value
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        if cache_dir:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+            except OSError as e:
+                logger.error(f"Error creating simulation cache directory {cache_dir}: {e}")
+                self.cache_dir = None
+            else:
+                self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def values(self) -> Iterator[Any]:
+        """Iterate over the values held in memory."""
+        with self._lock:
+            return iter([value for value, _ in self._entries.values()])
+
+    @property
+    def size_bytes(self) -> int:
+        """Encoded size of the values held in memory."""
+        return self._bytes
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a value, falling back to the disk tier.
+
+        Args:
+            key: Content key
+
+        Returns:
+            Cached value or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[0]
+
+        payload = self._read_disk(key)
+        if payload is not None:
+            try:
+                value = self._decode(json.loads(payload))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Discarding unreadable simulation cache entry {key}: {e}")
+                self._remove_disk(key)
+            else:
+                with self._lock:
+                    self._stats["disk_hits"] += 1
+                    self._insert(key, value, len(payload))
+                return value
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value in memory and, if enabled, on disk.
+
+        The encoded size is estimated first; values too large for both tiers
+        are never encoded, and the memory tier needs no encoding at all.
+
+        Args:
+            key: Content key
+            value: Value to store
+        """
+        size = estimate_size(value)
+        with self._lock:
+            self._insert(key, value, size)
+        if not self.cache_dir or size > self.max_disk_bytes:
+            if size > self.max_bytes:
+                logger.debug(f"Not caching simulation result {key[:12]} of ~{size} bytes")
+            return
+
+        try:
+            payload = json.dumps(self._encode(value), separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            logger.error(f"Error encoding simulation result for cache: {e}")
+            return
+        self._write_disk(key, payload)
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop the in-memory tier and reset counters.
+
+        Args:
+            disk: Also delete the on-disk tier
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        if disk and self.cache_dir:
+            for _, _, name in self._scan_disk():
+                self._remove_disk(name[:-len(".json")])
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and occupancy."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["disk_hits"] + self._stats["misses"]
+            hits = self._stats["hits"] + self._stats["disk_hits"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hit_rate": hits / lookups if lookups else 0.0
+            }
+
+    def _insert(self, key: str, value: Any, size: int) -> None:
+        """Insert into the memory tier and evict least recently used entries."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[1]
+        if size > self.max_bytes:
+            return  # Too large for memory; the disk tier may still hold it
+
+        self._entries[key] = (value, size)
+        self._bytes += size
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or self._bytes > self.max_bytes):
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self._stats["evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _scan_disk(self) -> List[Tuple[float, int, str]]:
+        """List (mtime, size, file name) of the entries in the disk tier."""
+        try:
+            names = [name for name in os.listdir(self.cache_dir) if name.endswith(".json")]
+        except OSError:
+            return []
+        files = []
+        for name in names:
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, name))
+        return files
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                payload = f.read()
+            os.utime(path)  # Keep recently used files out of pruning
+            return payload
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Error reading simulation cache entry {key}: {e}")
+            return None
+
+    def _write_disk(self, key: str, payload: bytes) -> None:
+        if not self.cache_dir or len(payload) > self.max_disk_bytes:
+            return
+        path = self._path(key)
+        replaced = self._file_size(path)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Error writing simulation cache entry {key}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._disk_bytes += len(payload) - replaced
+            over_budget = self._disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self._prune_disk()
+
+    def _file_size(self, path: str) -> int:
+        try:
+            return os.stat(path).st_size
+        except OSError:
+            return 0
+
+    def _remove_disk(self, key: str) -> None:
+        path = self._path(key)
+        size = self._file_size(path)
+        try:
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            self._disk_bytes -= size
+
+    def _prune_disk(self) -> None:
+        """Delete least recently used files until the disk tier fits its budget.
+
+        Only runs once the running total exceeds the budget; the directory
+        scan also corrects the total for files written by other processes.
+        """
+        files = self._scan_disk()
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            self._remove_disk(name[:-len(".json")])
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
@@ -0,0 +1,438 @@
+"""
+Parameter sweeps and Monte-Carlo tolerance analysis on an MNA system.
+
+The circuit is stamped once. ``G``, ``C`` and the DC sources are linear in
+each element's stamped quantity (conductance for resistors, value otherwise),
+so a sample only adds ``delta_q * dG`` for the perturbed elements. Small
+systems are then solved for a whole batch of samples at once with dense,
+stacked LAPACK solves; larger ones fall back to one sparse system per sample.
+Batches can be spread over worker processes.
+"""
+import itertools
+import logging
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .mna import MNASystem, parse_value, stamped_quantity
+
+logger = logging.getLogger(__name__)
+
+# Systems up to this size are solved as dense batches
+DEFAULT_DENSE_LIMIT = 120
+# Upper bound on the stacked matrices of one dense batch
+BATCH_BYTES = 64 * 1024 * 1024
+
+PERCENTILES = (1, 5, 50, 95, 99)
+
+Distribution = Union[float, Tuple[str, float], Callable[[np.random.Generator, int], np.ndarray]]
+
+
+def sample_multipliers(distribution: Distribution, n_samples: int,
+                       rng: np.random.Generator) -> np.ndarray:
+    """Draw value multipliers for one component.
+
+    Args:
+        distribution: A relative tolerance (normal with the tolerance at
+            3 sigma, clipped to the tolerance), ``("normal", tol)``,
+            ``("uniform", tol)``, or a callable ``(rng, n) -> multipliers``
+        n_samples: Number of samples
+        rng: Random generator
+
+    Returns:
+        Array of multipliers around 1.0
+    """
+    if callable(distribution):
+        return np.asarray(distribution(rng, n_samples), dtype=float)
+    kind, tolerance = ("normal", distribution) if np.isscalar(distribution) else distribution
+    tolerance = float(tolerance)
+    if kind == "uniform":
+        return 1.0 + rng.uniform(-tolerance, tolerance, n_samples)
+    if kind in ("normal", "gaussian"):
+        return 1.0 + np.clip(rng.normal(0.0, tolerance / 3.0, n_samples), -tolerance, tolerance)
+    raise ValueError(f"Unknown distribution: {kind}")
+
+
+@dataclass
+class SweepResult:
+    """Result of a parameter sweep or Monte-Carlo run.
+
+    ``values`` holds the component values of every sample (one column per
+    entry of ``parameters``); ``metrics`` holds one array over the samples
+    per measured quantity.
+    """
+    parameters: List[str]
+    values: np.ndarray
+    metrics: Dict[str, np.ndarray]
+    nominal: Dict[str, float]
+    summary: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    passed: Optional[np.ndarray] = None
+    yield_fraction: Optional[float] = None
+    success: bool = True
+    error_message: Optional[str] = None
+
+    @property
+    def n_samples(self) -> int:
+        return int(self.values.shape[0])
+
+
+class SweepEngine:
+    """Batched evaluation of an MNA system over perturbed component values."""
+
+    def __init__(self, system: MNASystem, parameters: Sequence[str],
+                 dense_limit: int = DEFAULT_DENSE_LIMIT):
+        """Initialize the engine.
+
+        Args:
+            system: Stamped nominal system
+            parameters: Names of the R/C/L/V/I elements that are varied
+            dense_limit: Largest system size solved as dense batches
+        """
+        self.system = system
+        self.parameters = list(parameters)
+        elements = {element.name: element for element in system.elements}
+        missing = [name for name in self.parameters if name not in elements]
+        if missing:
+            raise KeyError(f"Unknown components: {', '.join(missing)}")
+        self.kinds = [elements[name].kind for name in self.parameters]
+        self.nominal_values = np.array([elements[name].value for name in self.parameters],
+                                       dtype=float)
+        self.dense = system.size <= dense_limit
+        if self.dense:
+            stamps = [system.value_stamp(name) for name in self.parameters]
+            size = system.size
+            self._g0 = system.G.toarray()
+            self._c0 = system.C.toarray()
+            self._dg = np.array([s[0].toarray() for s in stamps]).reshape(len(stamps), size, size)
+            self._dc = np.array([s[1].toarray() for s in stamps]).reshape(len(stamps), size, size)
+            self._db = np.array([s[2] for s in stamps]).reshape(len(stamps), size)
+
+    def _quantity_deltas(self, values: np.ndarray) -> np.ndarray:
+        deltas = np.empty_like(values, dtype=float)
+        for j, kind in enumerate(self.kinds):
+            deltas[:, j] = (stamped_quantity(kind, values[:, j])
+                            - stamped_quantity(kind, self.nominal_values[j]))
+        return deltas
+
+    def solve_dc(self, values: np.ndarray) -> np.ndarray:
+        """DC solutions of a batch of samples.
+
+        Args:
+            values: Component values, shape (samples, parameters)
+
+        Returns:
+            Solutions, shape (samples, size)
+        """
+        values = np.atleast_2d(np.asarray(values, dtype=float))
+        if not self.dense:
+            return np.array([self._sample_system(row).solve_dc() for row in values])
+        deltas = self._quantity_deltas(values)
+        g = self._g0 + np.tensordot(deltas, self._dg, axes=1)
+        b = self.system.b_dc + deltas @ self._db
+        return np.linalg.solve(g, b[..., None])[..., 0]
+
+    def solve_ac(self, values: np.ndarray, frequencies: Sequence[float]) -> np.ndarray:
+        """AC solutions of a batch of samples.
+
+        Args:
+            values: Component values, shape (samples, parameters)
+            frequencies: Frequencies in Hz
+
+        Returns:
+            Solutions, shape (samples, frequencies, size)
+        """
+        values = np.atleast_2d(np.asarray(values, dtype=float))
+        frequencies = np.asarray(frequencies, dtype=float)
+        if not self.dense:
+            return np.array([self._sample_system(row).solve_ac(frequencies) for row in values])
+        deltas = self._quantity_deltas(values)
+        g = self._g0 + np.tensordot(deltas, self._dg, axes=1)
+        c = self._c0 + np.tensordot(deltas, self._dc, axes=1)
+        s = 2j * np.pi * frequencies
+        a = g[:, None] + s[None, :, None, None] * c[:, None]
+        b = np.broadcast_to(self.system.b_ac, a.shape[:-1])
+        return np.linalg.solve(a, b[..., None])[..., 0]
+
+    def batch_size(self, n_frequencies: int = 1) -> int:
+        """Samples per dense batch that keep the stacked matrices bounded."""
+        per_sample = 16 * max(1, n_frequencies) * self.system.size ** 2
+        return max(1, BATCH_BYTES // max(1, per_sample))
+
+    def _sample_system(self, values: np.ndarray) -> MNASystem:
+        changed = dict(zip(self.parameters, values.tolist()))
+        elements = [
+            replace(element, value=changed[element.name]) if element.name in changed else element
+            for element in self.system.elements
+        ]
+        return MNASystem(elements, nets=self.system.nodes)
+
+
+# ----------------------------------------------------------------------
+# Measurements
+# ----------------------------------------------------------------------
+def measure_dc(system: MNASystem, solutions: np.ndarray,
+               nets: Sequence[str]) -> Dict[str, np.ndarray]:
+    """Node voltages ``V(net)`` of a batch of DC solutions."""
+    voltages = system.voltages(solutions, nets)
+    return {f"V({net})": np.real(voltages[i]) for i, net in enumerate(nets)}
+
+
+def measure_ac(system: MNASystem, solutions: np.ndarray, nets: Sequence[str],
+               frequencies: Sequence[float], reference_frequency: float) -> Dict[str, np.ndarray]:
+    """Gain and -3 dB bandwidth of a batch of AC solutions.
+
+    ``gain_db(net)`` is the response at the frequency point closest to
+    ``reference_frequency``; ``bandwidth(net)`` is the first frequency above
+    it where the response has dropped 3 dB, interpolated on a log scale and
+    clipped to the sweep range.
+    """
+    frequencies = np.asarray(frequencies, dtype=float)
+    reference = int(np.argmin(np.abs(np.log(frequencies / reference_frequency))))
+    log_f = np.log(frequencies)
+    magnitudes = np.abs(system.voltages(solutions, nets))  # (nets, samples, frequencies)
+    metrics: Dict[str, np.ndarray] = {}
+    for i, net in enumerate(nets):
+        magnitude = magnitudes[i]
+        gain = magnitude[:, reference]
+        with np.errstate(divide="ignore"):
+            metrics[f"gain_db({net})"] = 20 * np.log10(gain)
+        below = magnitude[:, reference:] < gain[:, None] / np.sqrt(2)
+        hit = below.any(axis=1)
+        first = reference + np.argmax(below, axis=1)
+        bandwidth = np.full(magnitude.shape[0], frequencies[-1])
+        rows = np.nonzero(hit & (first > reference))[0]
+        if rows.size:
+            upper, lower = first[rows], first[rows] - 1
+            target = np.log(gain[rows] / np.sqrt(2))
+            m_lo = np.log(magnitude[rows, lower])
+            m_hi = np.log(magnitude[rows, upper])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                fraction = np.where(m_hi != m_lo, (target - m_lo) / (m_hi - m_lo), 0.0)
+            bandwidth[rows] = np.exp(log_f[lower] + fraction * (log_f[upper] - log_f[lower]))
+        metrics[f"bandwidth({net})"] = bandwidth
+    return metrics
+
+
+def summarize(metrics: Dict[str, np.ndarray], nominal: Dict[str, float], values: np.ndarray,
+              parameters: Sequence[str],
+              specs: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None
+              ) -> Tuple[Dict[str, Dict[str, Any]], Optional[np.ndarray]]:
+    """Statistics, worst cases and spec yield of sweep metrics.
+
+    Args:
+        metrics: Metric name to values over the samples
+        nominal: Metric values of the nominal circuit
+        values: Component values of the samples
+        parameters: Component names of the ``values`` columns
+        specs: Metric name to (low, high) limits; None leaves a side open
+
+    Returns:
+        (summary per metric, per-sample pass mask or None without specs)
+    """
+    summary: Dict[str, Dict[str, Any]] = {}
+    for name, data in metrics.items():
+        finite = data[np.isfinite(data)]
+        stats: Dict[str, Any] = {"nominal": nominal.get(name)}
+        if finite.size:
+            percentiles = np.percentile(finite, PERCENTILES)
+            stats.update({
+                "mean": float(finite.mean()),
+                "std": float(finite.std()),
+                "min": float(finite.min()),
+                "max": float(finite.max()),
+                "percentiles": {f"p{p}": float(v) for p, v in zip(PERCENTILES, percentiles)}
+            })
+            reference = nominal.get(name, float(np.median(finite)))
+            deviation = np.where(np.isfinite(data), np.abs(data - reference), -np.inf)
+            worst = int(np.argmax(deviation))
+            stats["worst_case"] = {
+                "sample": worst,
+                "value": float(data[worst]),
+                "components": dict(zip(parameters, values[worst].tolist()))
+            }
+        summary[name] = stats
+
+    if not specs:
+        return summary, None
+    passed = np.ones(values.shape[0], dtype=bool)
+    for name, (low, high) in specs.items():
+        if name not in metrics:
+            logger.warning(f"Spec for unknown metric {name} ignored")
+            continue
+        ok = np.isfinite(metrics[name])
+        if low is not None:
+            ok &= metrics[name] >= low
+        if high is not None:
+            ok &= metrics[name] <= high
+        summary[name]["yield"] = float(ok.mean())
+        passed &= ok
+    return summary, passed
+
+
+# ----------------------------------------------------------------------
+# Sample generation and evaluation
+# ----------------------------------------------------------------------
+def build_samples(nominal_values: Dict[str, float],
+                  param_grid: Optional[Dict[str, Sequence[Any]]] = None,
+                  distributions: Optional[Dict[str, Distribution]] = None,
+                  n_samples: int = 1000,
+                  seed: Optional[int] = None) -> Tuple[List[str], np.ndarray]:
+    """Component values of every sample.
+
+    Grid points are the Cartesian product of ``param_grid``. With
+    ``distributions``, every grid point (or the nominal circuit) gets
+    ``n_samples`` Monte-Carlo draws.
+
+    Args:
+        nominal_values: Nominal value of every variable component
+        param_grid: Component name to values (numbers or strings like ``10k``)
+        distributions: Component name to distribution, see ``sample_multipliers``
+        n_samples: Monte-Carlo samples per grid point
+        seed: Random seed
+
+    Returns:
+        (component names, values of shape (samples, components))
+    """
+    param_grid = param_grid or {}
+    distributions = distributions or {}
+    parameters = list(dict.fromkeys(list(param_grid) + list(distributions)))
+    missing = [name for name in parameters if name not in nominal_values]
+    if missing:
+        raise KeyError(f"Unknown components: {', '.join(missing)}")
+    nominal = np.array([nominal_values[name] for name in parameters], dtype=float)
+
+    grid_names = list(param_grid)
+    grid_columns = [parameters.index(name) for name in grid_names]
+    points = [
+        [v if isinstance(v, (int, float)) else parse_value(v) for v in param_grid[name]]
+        for name in grid_names
+    ]
+    base = np.tile(nominal, (max(1, int(np.prod([len(p) for p in points]))), 1))
+    for row, combination in enumerate(itertools.product(*points)):
+        base[row, grid_columns] = combination
+
+    if not distributions:
+        return parameters, base
+    rng = np.random.default_rng(seed)
+    values = np.repeat(base, n_samples, axis=0)
+    for name, distribution in distributions.items():
+        column = parameters.index(name)
+        values[:, column] *= sample_multipliers(distribution, values.shape[0], rng)
+    return parameters, values
+
+
+def evaluate(engine: SweepEngine, values: np.ndarray, analysis: str,
+             nets: Sequence[str], frequencies: Optional[Sequence[float]] = None,
+             reference_frequency: float = 1000.0) -> Dict[str, np.ndarray]:
+    """Metrics of a set of samples, solved in memory-bounded batches.
+
+    Args:
+        engine: Sweep engine
+        values: Component values, shape (samples, parameters)
+        analysis: ``"dc"`` or ``"ac"``
+        nets: Nets to measure
+        frequencies: AC frequencies in Hz
+        reference_frequency: Frequency of the AC gain measurement
+
+    Returns:
+        Metric name to values over the samples
+    """
+    if analysis not in ("dc", "ac"):
+        raise ValueError(f"Sweeps support DC and AC analysis, not {analysis}")
+    batch = engine.batch_size(len(frequencies) if analysis == "ac" else 1)
+    parts: List[Dict[str, np.ndarray]] = []
+    for start in range(0, values.shape[0], batch):
+        chunk = values[start:start + batch]
+        if analysis == "dc":
+            parts.append(measure_dc(engine.system, engine.solve_dc(chunk), nets))
+        else:
+            parts.append(measure_ac(engine.system, engine.solve_ac(chunk, frequencies), nets,
+                                    frequencies, reference_frequency))
+    if not parts:
+        return {}
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+
+# Per-process sweep engine used by sweep workers
+_worker_engine: Optional[SweepEngine] = None
+_worker_options: Dict[str, Any] = {}
+
+
+def _init_sweep_worker(payload: bytes) -> None:
+    """Unpickle the nominal circuit and sweep options once per worker process."""
+    global _worker_engine, _worker_options
+    elements, nodes, parameters, _worker_options = pickle.loads(payload)
+    _worker_engine = SweepEngine(MNASystem(elements, nets=nodes), parameters)
+
+
+def _evaluate_chunk(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """Evaluate one chunk of samples in a worker process."""
+    return evaluate(_worker_engine, values, **_worker_options)
+
+
+def run_sweep(system: MNASystem, analysis: str, nets: Sequence[str],
+              param_grid: Optional[Dict[str, Sequence[Any]]] = None,
+              distributions: Optional[Dict[str, Distribution]] = None,
+              n_samples: int = 1000,
+              specs: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+              frequencies: Optional[Sequence[float]] = None,
+              reference_frequency: float = 1000.0,
+              seed: Optional[int] = None,
+              processes: Optional[int] = None) -> SweepResult:
+    """Sweep or Monte-Carlo analysis of a stamped circuit.
+
+    Args:
+        system: Stamped nominal system
+        analysis: ``"dc"`` or ``"ac"``
+        nets: Nets to measure
+        param_grid: Component name to swept values
+        distributions: Component name to tolerance distribution
+        n_samples: Monte-Carlo samples per grid point
+        specs: Metric name to (low, high) limits for the yield
+        frequencies: AC frequencies in Hz
+        reference_frequency: Frequency of the AC gain measurement
+        seed: Random seed
+        processes: Worker processes; 0 or None evaluates in this process
+
+    Returns:
+        Sweep result
+    """
+    elements = {element.name: element.value for element in system.elements}
+    parameters, values = build_samples(elements, param_grid, distributions, n_samples, seed)
+    engine = SweepEngine(system, parameters)
+    options = {"analysis": analysis, "nets": list(nets), "frequencies": frequencies,
+               "reference_frequency": reference_frequency}
+
+    nominal_metrics = evaluate(engine, engine.nominal_values[None, :], **options)
+    nominal = {name: float(data[0]) for name, data in nominal_metrics.items()}
+
+    metrics = None
+    if processes and values.shape[0] > 1:
+        workers = max(1, min(processes, os.cpu_count() or 1))
+        chunks = np.array_split(values, min(values.shape[0], workers * 4))
+        payload = pickle.dumps((system.elements, system.nodes, parameters, options))
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker,
+                                     initargs=(payload,)) as pool:
+                parts = list(pool.map(_evaluate_chunk, chunks))
+            metrics = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"Parallel sweep unavailable, running serially: {str(e)}")
+    if metrics is None:
+        metrics = evaluate(engine, values, **options)
+
+    summary, passed = summarize(metrics, nominal, values, parameters, specs)
+    return SweepResult(
+        parameters=parameters,
+        values=values,
+        metrics=metrics,
+        nominal=nominal,
+        summary=summary,
+        passed=passed,
+        yield_fraction=float(passed.mean()) if passed is not None else None
+    )
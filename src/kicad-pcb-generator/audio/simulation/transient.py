@@ -0,0 +1,391 @@
+"""
+Transient analysis on a stamped MNA system.
+
+The circuit ``C x' + G x = b_dc + d u(t)`` is integrated with the
+trapezoidal rule or Gear-2 (BDF2). Every step size gets one factorization
+that is reused for all steps taken with it: small systems keep a dense
+inverse so a step is a matrix-vector product, larger ones keep a sparse LU.
+Adaptive stepping estimates the local truncation error against a quadratic
+predictor and only halves or doubles the step, so the set of factorizations
+stays small.
+
+Results are written into a preallocated array on the requested output grid,
+in chunks; with an output file the array is a ``.npy`` memory map and long
+runs never hold the whole waveform in memory.
+"""
+import logging
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from numpy.lib.format import open_memmap
+from scipy.sparse.linalg import splu
+
+from .mna import MNASystem
+
+logger = logging.getLogger(__name__)
+
+TRAPEZOIDAL = "trapezoidal"
+GEAR2 = "gear2"
+METHODS = (TRAPEZOIDAL, GEAR2)
+
+# Systems up to this size keep dense step operators
+DEFAULT_DENSE_LIMIT = 400
+DEFAULT_CHUNK_SIZE = 8192
+
+# Local truncation error constants (error = K h^3 x''')
+_LTE_CONSTANT = {TRAPEZOIDAL: 1.0 / 12.0, GEAR2: 2.0 / 9.0}
+
+InputSignal = Union[str, Sequence[float], np.ndarray, Callable[[np.ndarray], np.ndarray]]
+
+
+def input_waveform(kind: str, amplitude: float = 1.0,
+                   frequency: float = 1e3) -> Callable[[np.ndarray], np.ndarray]:
+    """Vectorized input waveform.
+
+    Args:
+        kind: ``"step"``, ``"sine"`` or ``"square"``; anything else is zero
+        amplitude: Peak amplitude
+        frequency: Frequency of periodic waveforms in Hz
+
+    Returns:
+        Function mapping an array of times to input values
+    """
+    omega = 2 * math.pi * frequency
+    if kind == "step":
+        return lambda t: np.where(np.asarray(t) > 0, amplitude, 0.0)
+    if kind == "sine":
+        return lambda t: amplitude * np.sin(omega * np.asarray(t))
+    if kind == "square":
+        return lambda t: np.where(np.sin(omega * np.asarray(t)) > 0, amplitude, -amplitude)
+    return lambda t: np.zeros(np.shape(t))
+
+
+def sampled_waveform(samples: Sequence[float], start_time: float,
+                     sample_step: float) -> Callable[[np.ndarray], np.ndarray]:
+    """Input waveform from equally spaced samples, linearly interpolated.
+
+    Args:
+        samples: Sample values
+        start_time: Time of the first sample
+        sample_step: Time between samples
+
+    Returns:
+        Function mapping an array of times to input values
+    """
+    samples = np.asarray(samples, dtype=float)
+    times = start_time + sample_step * np.arange(samples.size)
+    return lambda t: np.interp(t, times, samples)
+
+
+@dataclass
+class TransientResult:
+    """Output of a transient run.
+
+    ``values`` has one row per output time and one column per entry of
+    ``columns``; it is a memory map when the run was streamed to a file.
+    """
+    time: np.ndarray
+    values: np.ndarray
+    columns: List[str]
+    steps: int
+    rejected_steps: int
+    factorizations: int
+    output_file: Optional[str] = None
+
+    def column(self, name: str) -> np.ndarray:
+        """Values of one output column."""
+        return self.values[:, self.columns.index(name)]
+
+
+class _StepOperator:
+    """One factorized step ``A x_{n+1} = rhs`` for a fixed method and step size."""
+
+    def __init__(self, system: MNASystem, direction: np.ndarray, method: str, h: float,
+                 omega: float, dense: bool):
+        G, C = system.G, system.C
+        self.method = method
+        if method == TRAPEZOIDAL:
+            # (2C/h + G) x1 = (2C/h - G) x0 + b0 + b1
+            a = (2.0 / h) * C + G
+            self.b_matrix = (2.0 / h) * C - G
+        else:
+            # Variable-step BDF2 with step ratio omega = h_n / h_{n-1}:
+            # (a0 C/h + G) x1 = b1 - C (a1 x0 + a2 x_{-1}) / h
+            a0 = (1 + 2 * omega) / (1 + omega)
+            self.a1 = -(1 + omega)
+            self.a2 = omega * omega / (1 + omega)
+            a = (a0 / h) * C + G
+            self.c_over_h = C / h
+        self.dense = dense
+        if dense:
+            inverse = np.linalg.inv(a.toarray())
+            self.k_dc = inverse @ system.b_dc
+            self.k_input = inverse @ direction
+            if method == TRAPEZOIDAL:
+                self.m0 = inverse @ self.b_matrix.toarray()
+            else:
+                c_h = inverse @ self.c_over_h.toarray()
+                self.m0 = -self.a1 * c_h
+                self.m1 = -self.a2 * c_h
+        else:
+            self.lu = splu(a.tocsc())
+            self.b_dc = system.b_dc
+            self.direction = direction
+
+    def step(self, x0: np.ndarray, x_prev: Optional[np.ndarray], u0: float,
+             u1: float) -> np.ndarray:
+        if self.dense:
+            if self.method == TRAPEZOIDAL:
+                return self.m0 @ x0 + 2.0 * self.k_dc + (u0 + u1) * self.k_input
+            return self.m0 @ x0 + self.m1 @ x_prev + self.k_dc + u1 * self.k_input
+        if self.method == TRAPEZOIDAL:
+            rhs = self.b_matrix @ x0 + 2.0 * self.b_dc + (u0 + u1) * self.direction
+        else:
+            rhs = (self.b_dc + u1 * self.direction
+                   - self.c_over_h @ (self.a1 * x0 + self.a2 * x_prev))
+        return self.lu.solve(rhs)
+
+
+class TransientEngine:
+    """Fixed-step and adaptive transient integration of an MNA system."""
+
+    def __init__(self, system: MNASystem,
+                 method: str = TRAPEZOIDAL,
+                 direction: Optional[np.ndarray] = None,
+                 rtol: float = 1e-3,
+                 atol: float = 1e-6,
+                 dense_limit: int = DEFAULT_DENSE_LIMIT):
+        """Initialize the engine.
+
+        Args:
+            system: Stamped MNA system
+            method: ``"trapezoidal"`` or ``"gear2"``
+            direction: Right-hand side driven by the input signal; defaults
+                to the real part of the system's AC excitation
+            rtol: Relative tolerance of the adaptive error control
+            atol: Absolute tolerance (V or A) of the adaptive error control
+            dense_limit: Largest system size kept as dense step operators
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown integration method: {method}")
+        self.system = system
+        self.method = method
+        if direction is None:
+            self.direction = np.real(system.b_ac).astype(float)
+        else:
+            self.direction = np.asarray(direction, dtype=float)
+        self.rtol = rtol
+        self.atol = atol
+        self.dense = system.size <= dense_limit
+        self._operators: Dict[Tuple[str, float, float], _StepOperator] = {}
+
+    def columns(self) -> List[str]:
+        """Names of the solution entries: node voltages, then branch currents."""
+        names = list(self.system.nodes)
+        names.extend(sorted(self.system.branches, key=self.system.branches.get))
+        return names
+
+    def operating_point(self, u: float = 0.0) -> np.ndarray:
+        """DC solution with the input held at ``u``."""
+        if self.system.size == 0:
+            return np.zeros(0)
+        return self.system.solve_dc(self.system.b_dc + u * self.direction)
+
+    def run(self, stop_time: float, output_step: float,
+            start_time: float = 0.0,
+            input_signal: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+            adaptive: bool = False,
+            max_step: Optional[float] = None,
+            min_step: Optional[float] = None,
+            outputs: Optional[Sequence[int]] = None,
+            output_file: Optional[str] = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE) -> TransientResult:
+        """Integrate from the operating point at ``start_time`` to ``stop_time``.
+
+        Args:
+            stop_time: End time in s
+            output_step: Spacing of the output grid in s; also the step size
+                of fixed-step runs
+            start_time: Start time in s
+            input_signal: Input waveform ``u(t)``; zero if None
+            adaptive: Control the step size from the local truncation error
+            max_step: Largest adaptive step; defaults to ``output_step``
+            min_step: Smallest adaptive step; defaults to ``output_step / 1024``
+            outputs: Solution indices to record (see ``columns``); all if None
+            output_file: ``.npy`` file the output is streamed to
+            chunk_size: Output rows buffered between writes
+
+        Returns:
+            Transient result
+        """
+        if output_step <= 0 or stop_time < start_time:
+            raise ValueError("Invalid transient time range")
+        count = int(math.floor((stop_time - start_time) / output_step + 1e-9)) + 1
+        times = start_time + output_step * np.arange(count)
+        signal = input_signal or (lambda t: np.zeros(np.shape(t)))
+
+        names = self.columns()
+        selected = np.arange(len(names)) if outputs is None else np.asarray(outputs, dtype=int)
+        columns = [names[i] for i in selected]
+        if output_file:
+            values = open_memmap(output_file, mode="w+", dtype=np.float64,
+                                 shape=(count, len(columns)))
+        else:
+            values = np.empty((count, len(columns)))
+        sink = _ChunkedWriter(values, selected, chunk_size)
+
+        x = self.operating_point(float(signal(np.array([start_time]))[0]))
+        sink.write(x)
+        before = len(self._operators)
+        if count > 1 and self.system.size:
+            if adaptive:
+                steps, rejected = self._run_adaptive(x, times, signal, sink,
+                                                     max_step or output_step,
+                                                     min_step or output_step / 1024.0)
+            else:
+                steps, rejected = self._run_fixed(x, times, signal, sink, output_step), 0
+        else:
+            for _ in range(count - 1):
+                sink.write(x)
+            steps, rejected = 0, 0
+        sink.flush()
+        if output_file:
+            values.flush()
+
+        return TransientResult(
+            time=times,
+            values=values,
+            columns=columns,
+            steps=steps,
+            rejected_steps=rejected,
+            factorizations=len(self._operators) - before,
+            output_file=output_file
+        )
+
+    # ------------------------------------------------------------------
+    # Integration loops
+    # ------------------------------------------------------------------
+    def _operator(self, method: str, h: float, omega: float = 1.0) -> _StepOperator:
+        key = (method, h, omega if method == GEAR2 else 1.0)
+        operator = self._operators.get(key)
+        if operator is None:
+            operator = _StepOperator(self.system, self.direction, method, h, key[2], self.dense)
+            self._operators[key] = operator
+        return operator
+
+    def _run_fixed(self, x: np.ndarray, times: np.ndarray, signal: Callable, sink: "_ChunkedWriter",
+                   h: float) -> int:
+        u = np.asarray(signal(times), dtype=float)
+        trapezoidal = self._operator(TRAPEZOIDAL, h)
+        # Gear-2 needs two previous points; its first step is trapezoidal
+        operator = self._operator(GEAR2, h) if self.method == GEAR2 else trapezoidal
+        x_prev = x
+        x = trapezoidal.step(x, None, u[0], u[1])
+        sink.write(x)
+        for n in range(1, times.size - 1):
+            x, x_prev = operator.step(x, x_prev, u[n], u[n + 1]), x
+            sink.write(x)
+        return times.size - 1
+
+    def _run_adaptive(self, x: np.ndarray, times: np.ndarray, signal: Callable,
+                      sink: "_ChunkedWriter", max_step: float, min_step: float) -> Tuple[int, int]:
+        stop = times[-1]
+        # Step sizes are max_step / 2**k so that factorizations are reused
+        max_level = max(0, int(math.ceil(math.log2(max_step / min_step))))
+        level = max_level // 2
+        history: List[Tuple[float, np.ndarray]] = [(times[0], x)]
+        t = times[0]
+        u_t = float(signal(np.array([t]))[0])
+        next_output = 1
+        steps = rejected = 0
+        eps = 1e-12 * max(1.0, abs(stop))
+
+        while t < stop - eps:
+            h = max_step / (1 << level)
+            clipped = t + h > stop - eps
+            if clipped:
+                h = stop - t
+            u_next = float(signal(np.array([t + h]))[0])
+
+            use_gear = self.method == GEAR2 and len(history) >= 2
+            if use_gear:
+                omega = h / (t - history[-2][0])
+                x_new = self._operator(GEAR2, h, omega).step(x, history[-2][1], u_t, u_next)
+            else:
+                x_new = self._operator(TRAPEZOIDAL, h).step(x, None, u_t, u_next)
+
+            error = 0.0
+            if len(history) >= 3:
+                constant = _LTE_CONSTANT[GEAR2 if use_gear else TRAPEZOIDAL]
+                error = self._error_norm(history, t + h, x_new, constant)
+                if error > 1.0 and level < max_level:
+                    level += 1
+                    rejected += 1
+                    continue
+
+            # Accept the step and fill the output points it covers
+            t_new = t + h
+            while next_output < times.size and times[next_output] <= t_new + eps:
+                fraction = (times[next_output] - t) / h
+                sink.write(x + fraction * (x_new - x))
+                next_output += 1
+            t, x, u_t = t_new, x_new, u_next
+            history.append((t, x))
+            if len(history) > 3:
+                history.pop(0)
+            steps += 1
+            if not clipped and error < 0.1 and level > 0:
+                level -= 1
+        while next_output < times.size:
+            sink.write(x)
+            next_output += 1
+        return steps, rejected
+
+    def _error_norm(self, history: List[Tuple[float, np.ndarray]], t_new: float,
+                    x_new: np.ndarray, lte: float) -> float:
+        """Weighted RMS local truncation error of a step.
+
+        A quadratic through the last three accepted points predicts
+        ``x(t_new)``; its error is ``x''' / 6 * prod(t_new - t_i)`` against
+        the corrector's ``lte * h^3 * x'''``, which gives the corrector error
+        from the predictor-corrector difference.
+        """
+        (t0, x0), (t1, x1), (t2, x2) = history[-3:]
+        # Lagrange extrapolation to t_new
+        l0 = (t_new - t1) * (t_new - t2) / ((t0 - t1) * (t0 - t2))
+        l1 = (t_new - t0) * (t_new - t2) / ((t1 - t0) * (t1 - t2))
+        l2 = (t_new - t0) * (t_new - t1) / ((t2 - t0) * (t2 - t1))
+        predicted = l0 * x0 + l1 * x1 + l2 * x2
+        h = t_new - t2
+        corrector = lte * h ** 3
+        predictor = (t_new - t0) * (t_new - t1) * (t_new - t2) / 6.0
+        estimate = corrector / (corrector + predictor) * np.abs(x_new - predicted)
+        scale = self.atol + self.rtol * np.maximum(np.abs(x_new), np.abs(x2))
+        return float(np.sqrt(np.mean((estimate / scale) ** 2)))
+
+
+class _ChunkedWriter:
+    """Buffers selected solution entries and writes them to the output in chunks."""
+
+    def __init__(self, target: np.ndarray, selected: np.ndarray, chunk_size: int):
+        self.target = target
+        self.selected = selected
+        self.buffer = np.empty((max(1, min(chunk_size, target.shape[0])), target.shape[1]))
+        self.row = 0
+        self.filled = 0
+
+    def write(self, x: np.ndarray) -> None:
+        if self.row + self.filled >= self.target.shape[0]:
+            return
+        self.buffer[self.filled] = x[self.selected] if x.size else 0.0
+        self.filled += 1
+        if self.filled == self.buffer.shape[0]:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.filled:
+            self.target[self.row:self.row + self.filled] = self.buffer[:self.filled]
+            self.row += self.filled
+            self.filled = 0
@@ -15,6 +15,8 @@ from .core.pcb import PCBGenerator, PCBGenerationConfig
 from .core.netlist.parser import parse_schematic, parse_json_netlist, Netlist
 from .core.falstad_importer import FalstadImporter, FalstadImportError
 from .core.templates.board_presets import board_preset_registry, BoardProfile
+from .core.base.analysis_cache import configure_analysis_cache, default_cache_dir
+from .core.performance.profiling import profiler
 from .design_library import list_designs, filter_designs_by_tag, get_design, ensure_placeholders
 
 # Set up logging
@@ -340,6 +342,28 @@ def main():
         epilog="For more information, visit: https://github.com/yourusername/kicad-pcb-generator",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
+    parser.add_argument(
+        "--cache-dir",
+        help=f"Directory of the persistent analysis cache (default: {default_cache_dir()})"
+    )
+    parser.add_argument(
+        "--no-analysis-cache",
+        action="store_true",
+        help="Re-run board analyses instead of reusing cached results"
+    )
+    parser.add_argument(
+        "--trace",
+        help="Write a Chrome trace (chrome://tracing, Perfetto) of the pipeline stages to this file"
+    )
+    parser.add_argument(
+        "--flamegraph",
+        help="Write collapsed stacks for flamegraph.pl or speedscope to this file"
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        help="Also sample Python stacks every SECONDS while profiling (e.g. 0.005)"
+    )
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # Create project command
@@ -466,7 +490,20 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    args.func(args)
+    configure_analysis_cache(args.cache_dir, enabled=not args.no_analysis_cache)
+    if not (args.trace or args.flamegraph):
+        args.func(args)
+        return
+
+    profiler.start(sample_interval=args.sample_interval)
+    try:
+        args.func(args)
+    finally:
+        profiler.stop()
+        if args.trace:
+            profiler.write_chrome_trace(args.trace)
+        if args.flamegraph:
+            profiler.write_flamegraph(args.flamegraph)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -9,10 +9,13 @@ from .mutual_inductance import MutualInductanceAnalyzer
 from .capacitive_coupling import CapacitiveCouplingAnalyzer
 from .high_frequency_coupling import HighFrequencyCouplingAnalyzer
 from .thermal_coupling import ThermalCouplingAnalyzer
+from .coupling_engine import CouplingMatrixEngine, FootprintGeometry
 
 __all__ = [
     'MutualInductanceAnalyzer',
     'CapacitiveCouplingAnalyzer', 
     'HighFrequencyCouplingAnalyzer',
-    'ThermalCouplingAnalyzer'
+    'ThermalCouplingAnalyzer',
+    'CouplingMatrixEngine',
+    'FootprintGeometry'
 ] 
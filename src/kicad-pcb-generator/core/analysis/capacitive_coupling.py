@@ -13,8 +13,10 @@ from enum import Enum
 import numpy as np
 
 from ..base.base_analyzer import BaseAnalyzer
+from ..base.analysis_cache import cached_analysis
 from ..base.results.analysis_result import AnalysisResult, AnalysisType, AnalysisSeverity
 from ..base.base_config import BaseConfig
+from .coupling_engine import CouplingMatrixEngine, CouplingPairs, band_center_frequencies
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +77,16 @@ class CapacitiveCouplingAnalysisItem:
 class CapacitiveCouplingAnalyzer(BaseAnalyzer[CapacitiveCouplingAnalysisItem]):
     """Enhanced capacitive coupling analyzer for audio PCB design."""
     
+    # Capacitance change per decade of frequency (relative to 1kHz)
+    FREQUENCY_COEFFICIENTS = {
+        CapacitorType.HIGH_FREQUENCY: 0.05,
+        CapacitorType.AUDIO: 0.01,
+        CapacitorType.PCB_TRACE: 0.1
+    }
+    
+    # Parasitic coupling is only evaluated between footprints closer than this (mm)
+    PARASITIC_CUTOFF = 5.0
+    
     def __init__(self, config: Optional[CapacitiveCouplingConfigItem] = None):
         """Initialize the capacitive coupling analyzer.
         
@@ -90,6 +102,7 @@ class CapacitiveCouplingAnalyzer(BaseAnalyzer[CapacitiveCouplingAnalysisItem]):
         self._trace_models = self._initialize_trace_models()
         self._audio_models = self._initialize_audio_models()
     
+    @cached_analysis(version="1")
     def analyze_capacitive_coupling(self, board: Any) -> AnalysisResult:
         """Analyze capacitive coupling for all components on the board.
         
@@ -192,28 +205,31 @@ class CapacitiveCouplingAnalyzer(BaseAnalyzer[CapacitiveCouplingAnalysisItem]):
         """
         try:
             results = {}
-            
-            for band_name, (f_min, f_max) in enumerate(self.config.audio_frequency_bands):
-                band_key = f"band_{band_name+1}_{f_min:.0f}Hz_{f_max:.0f}Hz"
-                results[band_key] = {}
-                
-                # Analyze at center frequency of each band
-                center_freq = math.sqrt(f_min * f_max)
-                
-                # Get all components
-                components = board.GetFootprints()
-                
-                for component in components:
-                    ref = component.GetReference()
-                    
-                    # Calculate capacitance at center frequency
-                    capacitance_model = self.calculate_component_capacitance(component, center_freq)
-                    
-                    results[band_key][ref] = {
-                        'self_capacitance': capacitance_model.self_capacitance,
-                        'total_parasitic_capacitance': sum(capacitance_model.parasitic_capacitance.values()),
-                        'coupling_factor': self._calculate_coupling_factor(capacitance_model)
+            bands = self.config.audio_frequency_bands
+            
+            # Analyze at the center frequency of each band; the board is read
+            # and the pairwise coupling computed once for all bands
+            engine = CouplingMatrixEngine.from_board(board)
+            center_freqs = band_center_frequencies(bands)
+            types, base = self._component_types_and_base(engine)
+            self_capacitance = base * self._frequency_factors(center_freqs, types)
+            
+            pairs, parasitic = self._parasitic_capacitance_pairs(engine)
+            total_parasitic = engine.sum_by_component(pairs, parasitic)
+            coupling = np.divide(total_parasitic, self_capacitance,
+                                 out=np.zeros_like(self_capacitance), where=self_capacitance != 0)
+            
+            references = engine.geometry.references
+            for band_index, (f_min, f_max) in enumerate(bands):
+                band_key = f"band_{band_index+1}_{f_min:.0f}Hz_{f_max:.0f}Hz"
+                results[band_key] = {
+                    ref: {
+                        'self_capacitance': float(self_capacitance[band_index, k]),
+                        'total_parasitic_capacitance': float(total_parasitic[k]),
+                        'coupling_factor': float(coupling[band_index, k])
                     }
+                    for k, ref in enumerate(references)
+                }
             
             return results
             
@@ -234,29 +250,28 @@ class CapacitiveCouplingAnalyzer(BaseAnalyzer[CapacitiveCouplingAnalysisItem]):
             results = {}
             
             # Analyze at high frequencies (20kHz-80kHz)
-            high_freqs = [20000.0, 40000.0, 60000.0, 80000.0]
+            high_freqs = np.array([20000.0, 40000.0, 60000.0, 80000.0])
             
-            for freq in high_freqs:
+            engine = CouplingMatrixEngine.from_board(board)
+            types, base = self._component_types_and_base(engine)
+            effective_capacitance = base * self._frequency_factors(high_freqs, types)
+            
+            # Calculate high-frequency effects for every frequency at once
+            skin_effect = self._skin_effect_factors(high_freqs, engine.geometry.width)
+            proximity_effect = self._proximity_effect_factors(high_freqs)
+            dielectric_loss = self._dielectric_loss_factors(high_freqs)
+            
+            for f, freq in enumerate(high_freqs):
                 freq_key = f"{freq/1000:.0f}kHz"
-                results[freq_key] = {}
-                
-                components = board.GetFootprints()
-                
-                for component in components:
-                    ref = component.GetReference()
-                    capacitance_model = self.calculate_component_capacitance(component, freq)
-                    
-                    # Calculate high-frequency effects
-                    skin_effect = self._calculate_skin_effect(freq, component)
-                    proximity_effect = self._calculate_proximity_effect(freq, component)
-                    dielectric_loss = self._calculate_dielectric_loss(freq, component)
-                    
-                    results[freq_key][ref] = {
-                        'effective_capacitance': capacitance_model.self_capacitance,
-                        'skin_effect_factor': skin_effect,
-                        'proximity_effect_factor': proximity_effect,
-                        'dielectric_loss_factor': dielectric_loss
+                results[freq_key] = {
+                    ref: {
+                        'effective_capacitance': float(effective_capacitance[f, k]),
+                        'skin_effect_factor': float(skin_effect[f, k]),
+                        'proximity_effect_factor': float(proximity_effect[f]),
+                        'dielectric_loss_factor': float(dielectric_loss[f])
                     }
+                    for k, ref in enumerate(engine.geometry.references)
+                }
             
             return results
             
@@ -442,87 +457,73 @@ class CapacitiveCouplingAnalyzer(BaseAnalyzer[CapacitiveCouplingAnalysisItem]):
     def _calculate_frequency_factor(self, frequency: float, component_type: CapacitorType) -> float:
         """Calculate frequency-dependent factor for capacitance."""
         try:
-            if component_type == CapacitorType.HIGH_FREQUENCY:
-                # High-frequency capacitors have frequency-dependent behavior
-                return 1.0 + 0.05 * math.log10(frequency / 1000.0)
-            elif component_type == CapacitorType.AUDIO:
-                # Audio capacitors have minimal frequency dependence
-                return 1.0 + 0.01 * math.log10(frequency / 1000.0)
-            elif component_type == CapacitorType.PCB_TRACE:
-                # PCB traces have frequency-dependent effects
-                return 1.0 + 0.1 * math.log10(frequency / 1000.0)
-            else:
-                return 1.0
+            # High-frequency capacitors and PCB traces vary with frequency;
+            # audio capacitors have minimal frequency dependence
+            coefficient = self.FREQUENCY_COEFFICIENTS.get(component_type, 0.0)
+            return 1.0 + coefficient * math.log10(frequency / 1000.0)
                 
         except Exception as e:
             self.logger.error(f"Error calculating frequency factor: {str(e)}")
             return 1.0
     
+    def _frequency_factors(self, frequencies: np.ndarray, types: List[CapacitorType]) -> np.ndarray:
+        """Frequency factors of all components at all frequencies, shape (F, N)."""
+        coefficients = np.array([self.FREQUENCY_COEFFICIENTS.get(t, 0.0) for t in types])
+        return 1.0 + coefficients[None, :] * np.log10(np.asarray(frequencies, dtype=float) / 1000.0)[:, None]
+    
+    def _component_types_and_base(self, engine: CouplingMatrixEngine) -> Tuple[List[CapacitorType], np.ndarray]:
+        """Component type and base capacitance of every footprint."""
+        geometry = engine.geometry
+        types = [
+            self._determine_component_type(ref, value, name)
+            for ref, value, name in zip(geometry.references, geometry.values, geometry.footprint_names)
+        ]
+        base = np.array([
+            self._calculate_base_capacitance(component, component_type)
+            for component, component_type in zip(geometry.objects, types)
+        ], dtype=float)
+        return types, base
+    
     def _calculate_parasitic_capacitance(self, component: Any, frequency: float) -> Dict[str, float]:
         """Calculate parasitic capacitance with nearby components."""
         try:
-            parasitic_capacitances = {}
-            
-            # Get all other components
-            all_components = component.GetBoard().GetFootprints()
-            
-            for other_component in all_components:
-                if other_component == component:
-                    continue
-                
-                # Calculate distance between components
-                distance = self._calculate_component_distance(component, other_component)
-                
-                # Only consider nearby components (within 5mm)
-                if distance < 5.0:
-                    # Calculate parasitic capacitance using simplified formula
-                    # C_parasitic = ε₀ * εᵣ * A / d
-                    area = self._calculate_coupling_area(component, other_component)
-                    
-                    # Effective dielectric constant (air + substrate)
-                    epsilon_eff = 2.5  # Simplified value
-                    
-                    # Parasitic capacitance
-                    parasitic_capacitance = 8.85e-12 * epsilon_eff * area / (distance * 1e-3)
-                    parasitic_capacitances[other_component.GetReference()] = parasitic_capacitance
-            
-            return parasitic_capacitances
+            engine = CouplingMatrixEngine.from_board(component.GetBoard())
+            index = engine.index_of(component.GetReference())
+            if index < 0:
+                return {}
+            
+            pairs, parasitic = self._parasitic_capacitance_pairs(engine)
+            mask = pairs.i == index
+            references = engine.geometry.references
+            return {
+                references[j]: value
+                for j, value in zip(pairs.j[mask].tolist(), parasitic[mask].tolist())
+            }
             
         except Exception as e:
             self.logger.error(f"Error calculating parasitic capacitance: {str(e)}")
             return {}
     
-    def _calculate_component_distance(self, comp1: Any, comp2: Any) -> float:
-        """Calculate distance between two components."""
-        try:
-            pos1 = comp1.GetPosition()
-            pos2 = comp2.GetPosition()
-            
-            dx = pos1.x - pos2.x
-            dy = pos1.y - pos2.y
-            
-            return math.sqrt(dx*dx + dy*dy) / 1e6  # Convert to mm
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating component distance: {str(e)}")
-            return float('inf')
-    
-    def _calculate_coupling_area(self, comp1: Any, comp2: Any) -> float:
-        """Calculate coupling area between two components."""
-        try:
-            bbox1 = comp1.GetBoundingBox()
-            bbox2 = comp2.GetBoundingBox()
-            
-            # Simplified coupling area calculation
-            area1 = (bbox1.GetWidth() * bbox1.GetHeight()) / 1e12  # m²
-            area2 = (bbox2.GetWidth() * bbox2.GetHeight()) / 1e12  # m²
-            
-            # Use smaller area as coupling area
-            return min(area1, area2)
+    def _parasitic_capacitance_pairs(self, engine: CouplingMatrixEngine) -> Tuple[CouplingPairs, np.ndarray]:
+        """Parasitic capacitance between every pair of nearby footprints.
+        
+        Uses the simplified parallel-plate formula C = ε₀ * εᵣ * A / d with the
+        smaller bounding box as the coupling area.
+        
+        Args:
+            engine: Coupling engine for the board
             
-        except Exception as e:
-            self.logger.error(f"Error calculating coupling area: {str(e)}")
-            return 1e-6  # Default 1mm²
+        Returns:
+            Footprint pairs and their parasitic capacitance in F
+        """
+        pairs = engine.pairs(self.PARASITIC_CUTOFF, include_coincident=False)
+        area = engine.geometry.area
+        coupling_area = np.minimum(area[pairs.i], area[pairs.j])
+        
+        # Effective dielectric constant (air + substrate)
+        epsilon_eff = 2.5  # Simplified value
+        
+        return pairs, 8.85e-12 * epsilon_eff * coupling_area / (pairs.distance * 1e-3)
     
     def _extract_geometry_params(self, component: Any) -> Dict[str, float]:
         """Extract geometry parameters from component."""
@@ -554,63 +555,59 @@ class CapacitiveCouplingAnalyzer(BaseAnalyzer[CapacitiveCouplingAnalysisItem]):
             self.logger.error(f"Error calculating coupling factor: {str(e)}")
             return 0.0
     
-    def _calculate_skin_effect(self, frequency: float, component: Any) -> float:
-        """Calculate skin effect factor for high-frequency analysis."""
-        try:
-            # Simplified skin effect calculation
-            # Skin depth = sqrt(ρ / (π * μ * f))
-            # For copper: ρ = 1.68e-8 Ω·m, μ = 4πe-7 H/m
-            rho = 1.68e-8  # Copper resistivity
-            mu = 4 * math.pi * 1e-7  # Permeability of free space
-            
-            skin_depth = math.sqrt(rho / (math.pi * mu * frequency))
-            
-            # Get component size
-            bbox = component.GetBoundingBox()
-            width = bbox.GetWidth() / 1e6  # mm
-            
-            # Skin effect factor (simplified)
-            return min(1.0, skin_depth / (width * 1e-3))
+    def _skin_effect_factors(self, frequencies: np.ndarray, widths: np.ndarray) -> np.ndarray:
+        """Calculate skin effect factors for high-frequency analysis.
+        
+        Args:
+            frequencies: Frequencies in Hz
+            widths: Component widths in mm
             
-        except Exception as e:
-            self.logger.error(f"Error calculating skin effect: {str(e)}")
-            return 1.0
+        Returns:
+            Skin effect factors of shape (F, N)
+        """
+        # Simplified skin effect calculation
+        # Skin depth = sqrt(ρ / (π * μ * f))
+        # For copper: ρ = 1.68e-8 Ω·m, μ = 4πe-7 H/m
+        rho = 1.68e-8  # Copper resistivity
+        mu = 4 * math.pi * 1e-7  # Permeability of free space
+        
+        skin_depth = np.sqrt(rho / (math.pi * mu * np.asarray(frequencies, dtype=float)))
+        widths = np.asarray(widths, dtype=float) * 1e-3  # m
+        
+        # Skin effect factor (simplified); zero-width components are unaffected
+        ratio = np.divide(skin_depth[:, None], widths[None, :],
+                          out=np.ones((len(skin_depth), len(widths))), where=widths[None, :] > 0)
+        return np.minimum(1.0, ratio)
     
-    def _calculate_proximity_effect(self, frequency: float, component: Any) -> float:
-        """Calculate proximity effect factor for high-frequency analysis."""
-        try:
-            # Simplified proximity effect calculation
-            # Proximity effect increases with frequency
-            return 1.0 + 0.1 * math.log10(frequency / 1000.0)
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating proximity effect: {str(e)}")
-            return 1.0
+    def _proximity_effect_factors(self, frequencies: np.ndarray) -> np.ndarray:
+        """Calculate proximity effect factors for high-frequency analysis."""
+        # Simplified proximity effect calculation
+        # Proximity effect increases with frequency
+        return 1.0 + 0.1 * np.log10(np.asarray(frequencies, dtype=float) / 1000.0)
     
-    def _calculate_dielectric_loss(self, frequency: float, component: Any) -> float:
-        """Calculate dielectric loss factor for high-frequency analysis."""
-        try:
-            # Simplified dielectric loss calculation
-            # Dielectric loss increases with frequency
-            return 1.0 + 0.05 * math.log10(frequency / 1000.0)
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating dielectric loss: {str(e)}")
-            return 1.0
+    def _dielectric_loss_factors(self, frequencies: np.ndarray) -> np.ndarray:
+        """Calculate dielectric loss factors for high-frequency analysis."""
+        # Simplified dielectric loss calculation
+        # Dielectric loss increases with frequency
+        return 1.0 + 0.05 * np.log10(np.asarray(frequencies, dtype=float) / 1000.0)
     
     def _perform_direct_analysis(self, board: Any) -> AnalysisResult:
         """Perform direct capacitive coupling analysis."""
         try:
-            components = board.GetFootprints()
-            capacitance_data = {}
+            engine = CouplingMatrixEngine.from_board(board)
+            types, base = self._component_types_and_base(engine)
+            self_capacitance = base * self._frequency_factors([1000.0], types)[0]  # 1kHz
             
-            for component in components:
-                ref = component.GetReference()
-                capacitance_model = self.calculate_component_capacitance(component, 1000.0)  # 1kHz
+            pairs, parasitic = self._parasitic_capacitance_pairs(engine)
+            total_parasitic = engine.sum_by_component(pairs, parasitic)
+            neighbours = engine.neighbour_values(pairs, parasitic)
+            
+            capacitance_data = {}
+            for k, ref in enumerate(engine.geometry.references):
                 capacitance_data[ref] = {
-                    'self_capacitance': capacitance_model.self_capacitance,
-                    'parasitic_capacitance': capacitance_model.parasitic_capacitance,
-                    'coupling_factor': self._calculate_coupling_factor(capacitance_model)
+                    'self_capacitance': float(self_capacitance[k]),
+                    'parasitic_capacitance': neighbours[k],
+                    'coupling_factor': float(total_parasitic[k] / self_capacitance[k]) if self_capacitance[k] != 0 else 0.0
                 }
             
             return AnalysisResult(
@@ -0,0 +1,213 @@
+"""
+Shared pairwise coupling engine for the physical coupling analyzers.
+
+The capacitive, mutual-inductance, high-frequency and thermal analyzers all
+need footprint positions, sizes and the distances between nearby footprints.
+``FootprintGeometry`` reads the board once into arrays and
+``CouplingMatrixEngine`` finds every pair within a cutoff radius with a k-d
+tree, so analyzers evaluate their coupling formulas as array operations and
+broadcast frequency-dependent terms over a frequency vector instead of
+walking all footprints for every footprint and every band.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FootprintGeometry:
+    """Footprint data needed by the coupling models. Lengths in mm."""
+    references: List[str] = field(default_factory=list)
+    values: List[str] = field(default_factory=list)
+    footprint_names: List[str] = field(default_factory=list)
+    x: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    y: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    width: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    height: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    objects: List[Any] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.references)
+
+    @property
+    def area(self) -> np.ndarray:
+        """Bounding box area of every footprint.
+
+        Uses the same scaling as the analyzers' ``_extract_geometry_params``
+        (nm² / 1e12), so the coupling models produce unchanged values.
+        """
+        return self.width * self.height
+
+    @classmethod
+    def from_board(cls, board: Any) -> "FootprintGeometry":
+        """Read every footprint of a board once.
+
+        Args:
+            board: KiCad board object
+
+        Returns:
+            Footprint geometry arrays
+        """
+        references, values, names, objects = [], [], [], []
+        coords = []
+        for footprint in board.GetFootprints():
+            try:
+                position = footprint.GetPosition()
+                bbox = footprint.GetBoundingBox()
+                coords.append((position.x, position.y, bbox.GetWidth(), bbox.GetHeight()))
+            except Exception as e:
+                logger.error(f"Error reading footprint geometry: {str(e)}")
+                continue
+            references.append(footprint.GetReference())
+            values.append(footprint.GetValue())
+            try:
+                names.append(str(footprint.GetFPID().GetLibItemName()))
+            except Exception:
+                names.append("")
+            objects.append(footprint)
+
+        data = np.array(coords, dtype=float).reshape(-1, 4) / 1e6  # nm to mm
+        return cls(
+            references=references,
+            values=values,
+            footprint_names=names,
+            x=data[:, 0],
+            y=data[:, 1],
+            width=data[:, 2],
+            height=data[:, 3],
+            objects=objects
+        )
+
+
+@dataclass
+class CouplingPairs:
+    """Ordered footprint pairs (both directions) closer than a cutoff."""
+    i: np.ndarray
+    j: np.ndarray
+    distance: np.ndarray  # mm
+
+    def __len__(self) -> int:
+        return int(self.i.shape[0])
+
+
+class CouplingMatrixEngine:
+    """Pairwise distances and per-component reductions for coupling models."""
+
+    def __init__(self, geometry: FootprintGeometry):
+        """Initialize the engine.
+
+        Args:
+            geometry: Footprint geometry arrays
+        """
+        self.geometry = geometry
+        self._tree: Optional[cKDTree] = None
+        self._pairs: Dict[Tuple[float, bool], CouplingPairs] = {}
+
+    @classmethod
+    def from_board(cls, board: Any) -> "CouplingMatrixEngine":
+        """Create an engine from a KiCad board."""
+        return cls(FootprintGeometry.from_board(board))
+
+    def __len__(self) -> int:
+        return len(self.geometry)
+
+    def index_of(self, reference: str) -> int:
+        """Get the index of a footprint reference, or -1 if it is unknown."""
+        try:
+            return self.geometry.references.index(reference)
+        except ValueError:
+            return -1
+
+    def pairs(self, cutoff: float, include_coincident: bool = True) -> CouplingPairs:
+        """Get all ordered pairs with a center distance below ``cutoff``.
+
+        Args:
+            cutoff: Cutoff radius in mm
+            include_coincident: Keep footprints at the same position; models
+                that divide by the distance should leave them out
+
+        Returns:
+            Pairs with both (a, b) and (b, a) present
+        """
+        key = (cutoff, include_coincident)
+        if key not in self._pairs:
+            n = len(self.geometry)
+            if n < 2:
+                empty = np.zeros(0, dtype=np.intp)
+                self._pairs[key] = CouplingPairs(empty, empty, np.zeros(0))
+            else:
+                if self._tree is None:
+                    self._tree = cKDTree(np.column_stack((self.geometry.x, self.geometry.y)))
+                found = self._tree.query_pairs(cutoff, output_type="ndarray")
+                a, b = found[:, 0], found[:, 1]
+                distance = np.hypot(self.geometry.x[a] - self.geometry.x[b],
+                                    self.geometry.y[a] - self.geometry.y[b])
+                keep = distance < cutoff
+                if not include_coincident:
+                    keep &= distance > 0
+                a, b, distance = a[keep], b[keep], distance[keep]
+                self._pairs[key] = CouplingPairs(
+                    i=np.concatenate((a, b)),
+                    j=np.concatenate((b, a)),
+                    distance=np.concatenate((distance, distance))
+                )
+        return self._pairs[key]
+
+    def sum_by_component(self, pairs: CouplingPairs, values: np.ndarray) -> np.ndarray:
+        """Sum pair values onto their first component.
+
+        Args:
+            pairs: Pairs from ``pairs``
+            values: Pair values of shape (P,) or (F, P)
+
+        Returns:
+            Array of shape (N,) or (F, N)
+        """
+        values = np.asarray(values, dtype=float)
+        out = np.zeros(values.shape[:-1] + (len(self.geometry),))
+        np.add.at(out, (..., pairs.i), values)
+        return out
+
+    def max_by_component(self, pairs: CouplingPairs, values: np.ndarray) -> np.ndarray:
+        """Maximum pair value per first component (0 for components without pairs).
+
+        Args:
+            pairs: Pairs from ``pairs``
+            values: Pair values of shape (P,) or (F, P)
+
+        Returns:
+            Array of shape (N,) or (F, N)
+        """
+        values = np.asarray(values, dtype=float)
+        out = np.full(values.shape[:-1] + (len(self.geometry),), -np.inf)
+        np.maximum.at(out, (..., pairs.i), values)
+        out[np.isneginf(out)] = 0.0
+        return out
+
+    def neighbour_values(self, pairs: CouplingPairs, values: np.ndarray) -> List[Dict[str, float]]:
+        """Per-component dictionaries of neighbour reference to pair value.
+
+        Args:
+            pairs: Pairs from ``pairs``
+            values: Pair values of shape (P,)
+
+        Returns:
+            One dictionary per component
+        """
+        references = self.geometry.references
+        result: List[Dict[str, float]] = [{} for _ in references]
+        for a, b, value in zip(pairs.i.tolist(), pairs.j.tolist(), np.asarray(values).tolist()):
+            result[a][references[b]] = value
+        return result
+
+
+def band_center_frequencies(bands: Sequence[Sequence[float]]) -> np.ndarray:
+    """Geometric center frequency of every (f_min, f_max) band."""
+    bands = np.asarray(bands, dtype=float).reshape(-1, 2)
+    return np.sqrt(bands[:, 0] * bands[:, 1])
@@ -15,6 +15,7 @@ import numpy as np
 from ..base.base_analyzer import BaseAnalyzer
 from ..base.results.analysis_result import AnalysisResult, AnalysisType, AnalysisSeverity
 from ..base.base_config import BaseConfig
+from .coupling_engine import CouplingMatrixEngine, CouplingPairs, band_center_frequencies
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +74,9 @@ class HighFrequencyCouplingAnalysisItem:
 class HighFrequencyCouplingAnalyzer(BaseAnalyzer[HighFrequencyCouplingAnalysisItem]):
     """High-frequency coupling analyzer for audio PCB design."""
     
+    # Proximity effects are only evaluated between footprints closer than this (mm)
+    PROXIMITY_CUTOFF = 3.0
+    
     def __init__(self, config: Optional[HighFrequencyCouplingConfigItem] = None):
         """Initialize the high-frequency coupling analyzer.
         
@@ -125,32 +129,36 @@ class HighFrequencyCouplingAnalyzer(BaseAnalyzer[HighFrequencyCouplingAnalysisIt
                 errors=[str(e)]
             )
     
-    def analyze_proximity_effects(self, board: Any, frequency: float) -> Dict[str, float]:
+    def analyze_proximity_effects(self, board: Any, frequency: float,
+                                  engine: Optional[CouplingMatrixEngine] = None) -> Dict[str, float]:
         """Analyze proximity effects between components at high frequencies.
         
         Args:
             board: KiCad board object
             frequency: Analysis frequency in Hz
+            engine: Optional coupling engine already built for the board
             
         Returns:
             Dictionary with proximity effect data
         """
         try:
             results = {}
-            components = board.GetFootprints()
-            
-            for component in components:
-                ref = component.GetReference()
-                
-                # Calculate proximity effects with nearby components
-                proximity_effects = self._calculate_component_proximity_effects(
-                    component, frequency
-                )
-                
+            engine = engine or CouplingMatrixEngine.from_board(board)
+            
+            # Calculate proximity effects with nearby components
+            pairs, effects = self._proximity_effect_pairs(engine, [frequency])
+            totals = engine.sum_by_component(pairs, effects)[0]
+            maxima = engine.max_by_component(pairs, effects)[0]
+            references = engine.geometry.references
+            affected: List[List[str]] = [[] for _ in references]
+            for i, j in zip(pairs.i.tolist(), pairs.j.tolist()):
+                affected[i].append(references[j])
+            
+            for k, ref in enumerate(references):
                 results[ref] = {
-                    'total_proximity_effect': sum(proximity_effects.values()),
-                    'max_proximity_effect': max(proximity_effects.values()) if proximity_effects else 0.0,
-                    'affected_components': list(proximity_effects.keys())
+                    'total_proximity_effect': float(totals[k]),
+                    'max_proximity_effect': float(maxima[k]),
+                    'affected_components': affected[k]
                 }
             
             return results
@@ -159,6 +167,50 @@ class HighFrequencyCouplingAnalyzer(BaseAnalyzer[HighFrequencyCouplingAnalysisIt
             self.logger.error(f"Error analyzing proximity effects: {str(e)}")
             return {}
     
+    def analyze_high_frequency_effects(self, board: Any) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Analyze proximity, skin and radiation effects across the analysis bands.
+        
+        The board is read and the pairwise distances computed once; the
+        frequency-dependent terms are evaluated for all band center
+        frequencies at once.
+        
+        Args:
+            board: KiCad board object
+            
+        Returns:
+            Dictionary with per-band, per-component high-frequency effects
+        """
+        try:
+            results = {}
+            bands = self.config.analysis_bands
+            center_freqs = band_center_frequencies(bands)
+            
+            engine = CouplingMatrixEngine.from_board(board)
+            geometry = engine.geometry
+            pairs, effects = self._proximity_effect_pairs(engine, center_freqs)
+            totals = engine.sum_by_component(pairs, effects)
+            maxima = engine.max_by_component(pairs, effects)
+            skin = self._skin_effect_factors(center_freqs, geometry.width, geometry.height)
+            radiation = self._radiation_powers(center_freqs, geometry.area)
+            
+            for band_index, (f_min, f_max) in enumerate(bands):
+                band_key = f"band_{band_index+1}_{f_min:.0f}Hz_{f_max:.0f}Hz"
+                results[band_key] = {
+                    ref: {
+                        'total_proximity_effect': float(totals[band_index, k]),
+                        'max_proximity_effect': float(maxima[band_index, k]),
+                        'skin_effect_factor': float(skin[band_index, k]),
+                        'radiation_power': float(radiation[band_index, k])
+                    }
+                    for k, ref in enumerate(geometry.references)
+                }
+            
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error analyzing high-frequency effects: {str(e)}")
+            return {}
+    
     def analyze_enhanced_skin_effects(self, board: Any, frequency: float) -> Dict[str, float]:
         """Analyze enhanced skin effects for audio components at high frequencies.
         
@@ -367,33 +419,73 @@ class HighFrequencyCouplingAnalyzer(BaseAnalyzer[HighFrequencyCouplingAnalysisIt
     def _calculate_component_proximity_effects(self, component: Any, frequency: float) -> Dict[str, float]:
         """Calculate proximity effects between a component and nearby components."""
         try:
-            proximity_effects = {}
-            all_components = component.GetBoard().GetFootprints()
-            
-            for other_component in all_components:
-                if other_component == component:
-                    continue
-                
-                # Calculate distance
-                distance = self._calculate_component_distance(component, other_component)
-                
-                # Only consider nearby components (within 3mm for high-frequency effects)
-                if distance < 3.0:
-                    # Calculate proximity effect using simplified model
-                    # Proximity effect increases with frequency and decreases with distance
-                    base_effect = 0.1  # Base proximity effect
-                    frequency_factor = math.log10(frequency / 20000.0)  # Normalized to 20kHz
-                    distance_factor = math.exp(-distance / 1.0)  # Exponential decay
-                    
-                    proximity_effect = base_effect * frequency_factor * distance_factor
-                    proximity_effects[other_component.GetReference()] = proximity_effect
-            
-            return proximity_effects
+            engine = CouplingMatrixEngine.from_board(component.GetBoard())
+            index = engine.index_of(component.GetReference())
+            if index < 0:
+                return {}
+            
+            pairs, effects = self._proximity_effect_pairs(engine, [frequency])
+            mask = pairs.i == index
+            references = engine.geometry.references
+            return {
+                references[j]: value
+                for j, value in zip(pairs.j[mask].tolist(), effects[0, mask].tolist())
+            }
             
         except Exception as e:
             self.logger.error(f"Error calculating proximity effects: {str(e)}")
             return {}
     
+    def _proximity_effect_pairs(self, engine: CouplingMatrixEngine,
+                                frequencies: Any) -> Tuple[CouplingPairs, np.ndarray]:
+        """Proximity effect between every pair of nearby footprints.
+        
+        The effect increases with frequency and decreases with distance; the
+        frequency term is broadcast over all pairs.
+        
+        Args:
+            engine: Coupling engine for the board
+            frequencies: Analysis frequencies in Hz
+            
+        Returns:
+            Footprint pairs and their proximity effect, shape (F, P)
+        """
+        pairs = engine.pairs(self.PROXIMITY_CUTOFF)
+        base_effect = 0.1  # Base proximity effect
+        frequency_factor = np.log10(np.asarray(frequencies, dtype=float) / 20000.0)  # Normalized to 20kHz
+        distance_factor = np.exp(-pairs.distance / 1.0)  # Exponential decay
+        return pairs, base_effect * frequency_factor[:, None] * distance_factor[None, :]
+    
+    def _skin_effect_factors(self, frequencies: Any, widths: np.ndarray, heights: np.ndarray) -> np.ndarray:
+        """Resistance increase from the skin effect, shape (F, N).
+        
+        Args:
+            frequencies: Frequencies in Hz
+            widths: Component widths in mm
+            heights: Component heights in mm
+            
+        Returns:
+            Ratio of the conductor area to the skin-depth area
+        """
+        # Skin depth = sqrt(ρ / (π * μ * f))
+        rho = 1.68e-8  # Copper resistivity
+        mu = 4 * math.pi * 1e-7  # Permeability of free space
+        skin_depth = np.sqrt(rho / (math.pi * mu * np.asarray(frequencies, dtype=float)))[:, None]
+        
+        effective_area = (widths * heights * 1e-6)[None, :]  # m²
+        skin_area = 2 * math.pi * skin_depth * ((widths + heights) * 1e-3)[None, :]  # m²
+        return np.divide(effective_area, skin_area,
+                         out=np.ones(np.broadcast_shapes(effective_area.shape, skin_area.shape)),
+                         where=skin_area > 0)
+    
+    def _radiation_powers(self, frequencies: Any, areas: np.ndarray) -> np.ndarray:
+        """Radiated power k * f² * A * I² of every component, shape (F, N)."""
+        # Simplified constants
+        k = 1e-12  # Radiation constant
+        current = 0.01  # Assumed current (10mA)
+        frequencies = np.asarray(frequencies, dtype=float)
+        return k * (frequencies ** 2)[:, None] * areas[None, :] * current * current
+    
     def _calculate_enhanced_skin_effect(self, component: Any, frequency: float) -> Dict[str, float]:
         """Calculate enhanced skin effect for a component."""
         try:
@@ -410,13 +502,9 @@ class HighFrequencyCouplingAnalyzer(BaseAnalyzer[HighFrequencyCouplingAnalysisIt
             height = bbox.GetHeight() / 1e6  # mm
             
             # Calculate effective resistance increase
-            effective_area = width * height * 1e-6  # m²
-            skin_area = 2 * math.pi * skin_depth * (width + height) * 1e-3  # m²
-            
-            if skin_area > 0:
-                resistance_factor = effective_area / skin_area
-            else:
-                resistance_factor = 1.0
+            resistance_factor = float(self._skin_effect_factors(
+                [frequency], np.array([width]), np.array([height])
+            )[0, 0])
             
             # Calculate current density
             current_density = 1e6 / (skin_depth * 1e3)  # A/m²
@@ -441,11 +529,7 @@ class HighFrequencyCouplingAnalyzer(BaseAnalyzer[HighFrequencyCouplingAnalysisIt
             bbox = component.GetBoundingBox()
             area = (bbox.GetWidth() * bbox.GetHeight()) / 1e12  # m²
             
-            # Simplified constants
-            k = 1e-12  # Radiation constant
-            current = 0.01  # Assumed current (10mA)
-            
-            radiation_power = k * frequency * frequency * area * current * current
+            radiation_power = float(self._radiation_powers([frequency], np.array([area]))[0, 0])
             
             # Radiation efficiency (simplified)
             efficiency = min(0.01, radiation_power / 1e-6)  # Max 1% efficiency
@@ -545,21 +629,6 @@ class HighFrequencyCouplingAnalyzer(BaseAnalyzer[HighFrequencyCouplingAnalysisIt
             self.logger.error(f"Error calculating power supply coupling: {str(e)}")
             return {'dc': 0.05, 'ac': 0.1, 'noise': 0.02, 'ripple': 0.03}
     
-    def _calculate_component_distance(self, comp1: Any, comp2: Any) -> float:
-        """Calculate distance between two components."""
-        try:
-            pos1 = comp1.GetPosition()
-            pos2 = comp2.GetPosition()
-            
-            dx = pos1.x - pos2.x
-            dy = pos1.y - pos2.y
-            
-            return math.sqrt(dx*dx + dy*dy) / 1e6  # Convert to mm
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating component distance: {str(e)}")
-            return float('inf')
-    
     def _perform_direct_analysis(self, board: Any) -> AnalysisResult:
         """Perform direct high-frequency coupling analysis."""
         try:
@@ -13,8 +13,10 @@ from enum import Enum
 import numpy as np
 
 from ..base.base_analyzer import BaseAnalyzer
+from ..base.analysis_cache import cached_analysis
 from ..base.results.analysis_result import AnalysisResult, AnalysisType, AnalysisSeverity
 from ..base.base_config import BaseConfig
+from .coupling_engine import CouplingMatrixEngine, CouplingPairs, band_center_frequencies
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +77,16 @@ class MutualInductanceAnalysisItem:
 class MutualInductanceAnalyzer(BaseAnalyzer[MutualInductanceAnalysisItem]):
     """Enhanced mutual inductance analyzer for audio PCB design."""
     
+    # Inductance change per decade of frequency (relative to 1kHz)
+    FREQUENCY_COEFFICIENTS = {
+        ComponentType.INDUCTOR: 0.1,
+        ComponentType.TRANSFORMER: 0.05,
+        ComponentType.PCB_TRACE: 0.2
+    }
+    
+    # Mutual inductance is only evaluated between footprints closer than this (mm)
+    MUTUAL_CUTOFF = 10.0
+    
     def __init__(self, config: Optional[MutualInductanceConfigItem] = None):
         """Initialize the mutual inductance analyzer.
         
@@ -90,6 +102,7 @@ class MutualInductanceAnalyzer(BaseAnalyzer[MutualInductanceAnalysisItem]):
         self._transformer_models = self._initialize_transformer_models()
         self._trace_models = self._initialize_trace_models()
     
+    @cached_analysis(version="1")
     def analyze_mutual_inductance(self, board: Any) -> AnalysisResult:
         """Analyze mutual inductance for all components on the board.
         
@@ -192,28 +205,31 @@ class MutualInductanceAnalyzer(BaseAnalyzer[MutualInductanceAnalysisItem]):
         """
         try:
             results = {}
-            
-            for band_name, (f_min, f_max) in enumerate(self.config.audio_frequency_bands):
-                band_key = f"band_{band_name+1}_{f_min:.0f}Hz_{f_max:.0f}Hz"
-                results[band_key] = {}
-                
-                # Analyze at center frequency of each band
-                center_freq = math.sqrt(f_min * f_max)
-                
-                # Get all components
-                components = board.GetFootprints()
-                
-                for component in components:
-                    ref = component.GetReference()
-                    
-                    # Calculate inductance at center frequency
-                    inductance_model = self.calculate_component_inductance(component, center_freq)
-                    
-                    results[band_key][ref] = {
-                        'self_inductance': inductance_model.self_inductance,
-                        'total_mutual_inductance': sum(inductance_model.mutual_inductance.values()),
-                        'coupling_factor': self._calculate_coupling_factor(inductance_model)
+            bands = self.config.audio_frequency_bands
+            
+            # Analyze at the center frequency of each band; the board is read
+            # and the pairwise coupling computed once for all bands
+            engine = CouplingMatrixEngine.from_board(board)
+            center_freqs = band_center_frequencies(bands)
+            types, base = self._component_types_and_base(engine)
+            self_inductance = base * self._frequency_factors(center_freqs, types)
+            
+            pairs, mutual = self._mutual_inductance_pairs(engine)
+            total_mutual = engine.sum_by_component(pairs, mutual)
+            coupling = np.divide(total_mutual, self_inductance,
+                                 out=np.zeros_like(self_inductance), where=self_inductance != 0)
+            
+            references = engine.geometry.references
+            for band_index, (f_min, f_max) in enumerate(bands):
+                band_key = f"band_{band_index+1}_{f_min:.0f}Hz_{f_max:.0f}Hz"
+                results[band_key] = {
+                    ref: {
+                        'self_inductance': float(self_inductance[band_index, k]),
+                        'total_mutual_inductance': float(total_mutual[k]),
+                        'coupling_factor': float(coupling[band_index, k])
                     }
+                    for k, ref in enumerate(references)
+                }
             
             return results
             
@@ -397,70 +413,75 @@ class MutualInductanceAnalyzer(BaseAnalyzer[MutualInductanceAnalysisItem]):
     def _calculate_frequency_factor(self, frequency: float, component_type: ComponentType) -> float:
         """Calculate frequency-dependent factor for inductance."""
         try:
-            if component_type == ComponentType.INDUCTOR:
-                # Inductors have some frequency dependence due to core effects
-                return 1.0 + 0.1 * math.log10(frequency / 1000.0)
-            elif component_type == ComponentType.TRANSFORMER:
-                # Transformers have frequency-dependent coupling
-                return 1.0 + 0.05 * math.log10(frequency / 1000.0)
-            elif component_type == ComponentType.PCB_TRACE:
-                # PCB traces have skin effect and proximity effect
-                return 1.0 + 0.2 * math.log10(frequency / 1000.0)
-            else:
-                return 1.0
+            # Core effects in inductors, frequency-dependent coupling in
+            # transformers, skin and proximity effects in PCB traces
+            coefficient = self.FREQUENCY_COEFFICIENTS.get(component_type, 0.0)
+            return 1.0 + coefficient * math.log10(frequency / 1000.0)
                 
         except Exception as e:
             self.logger.error(f"Error calculating frequency factor: {str(e)}")
             return 1.0
     
+    def _frequency_factors(self, frequencies: np.ndarray, types: List[ComponentType]) -> np.ndarray:
+        """Frequency factors of all components at all frequencies, shape (F, N)."""
+        coefficients = np.array([self.FREQUENCY_COEFFICIENTS.get(t, 0.0) for t in types])
+        return 1.0 + coefficients[None, :] * np.log10(np.asarray(frequencies, dtype=float) / 1000.0)[:, None]
+    
+    def _component_types_and_base(self, engine: CouplingMatrixEngine) -> Tuple[List[ComponentType], np.ndarray]:
+        """Component type and base inductance of every footprint."""
+        geometry = engine.geometry
+        types = [
+            self._determine_component_type(ref, value, name)
+            for ref, value, name in zip(geometry.references, geometry.values, geometry.footprint_names)
+        ]
+        base = np.array([
+            self._calculate_base_inductance(component, component_type)
+            for component, component_type in zip(geometry.objects, types)
+        ], dtype=float)
+        return types, base
+    
     def _calculate_mutual_inductance(self, component: Any, frequency: float) -> Dict[str, float]:
         """Calculate mutual inductance with nearby components."""
         try:
-            mutual_inductances = {}
-            
-            # Get all other components
-            all_components = component.GetBoard().GetFootprints()
-            
-            for other_component in all_components:
-                if other_component == component:
-                    continue
-                
-                # Calculate distance between components
-                distance = self._calculate_component_distance(component, other_component)
-                
-                # Only consider nearby components (within 10mm)
-                if distance < 10.0:
-                    # Calculate mutual inductance using simplified formula
-                    # M = k * sqrt(L1 * L2) where k is coupling coefficient
-                    l1 = self._calculate_base_inductance(component, ComponentType.AUDIO_COMPONENT)
-                    l2 = self._calculate_base_inductance(other_component, ComponentType.AUDIO_COMPONENT)
-                    
-                    # Coupling coefficient decreases with distance
-                    k = 0.1 * math.exp(-distance / 5.0)  # Exponential decay
-                    
-                    mutual_inductance = k * math.sqrt(l1 * l2)
-                    mutual_inductances[other_component.GetReference()] = mutual_inductance
-            
-            return mutual_inductances
+            engine = CouplingMatrixEngine.from_board(component.GetBoard())
+            index = engine.index_of(component.GetReference())
+            if index < 0:
+                return {}
+            
+            pairs, mutual = self._mutual_inductance_pairs(engine)
+            mask = pairs.i == index
+            references = engine.geometry.references
+            return {
+                references[j]: value
+                for j, value in zip(pairs.j[mask].tolist(), mutual[mask].tolist())
+            }
             
         except Exception as e:
             self.logger.error(f"Error calculating mutual inductance: {str(e)}")
             return {}
     
-    def _calculate_component_distance(self, comp1: Any, comp2: Any) -> float:
-        """Calculate distance between two components."""
-        try:
-            pos1 = comp1.GetPosition()
-            pos2 = comp2.GetPosition()
-            
-            dx = pos1.x - pos2.x
-            dy = pos1.y - pos2.y
-            
-            return math.sqrt(dx*dx + dy*dy) / 1e6  # Convert to mm
+    def _mutual_inductance_pairs(self, engine: CouplingMatrixEngine) -> Tuple[CouplingPairs, np.ndarray]:
+        """Mutual inductance between every pair of nearby footprints.
+        
+        Uses the simplified formula M = k * sqrt(L1 * L2), where the coupling
+        coefficient k decays exponentially with distance.
+        
+        Args:
+            engine: Coupling engine for the board
             
-        except Exception as e:
-            self.logger.error(f"Error calculating component distance: {str(e)}")
-            return float('inf')
+        Returns:
+            Footprint pairs and their mutual inductance in H
+        """
+        pairs = engine.pairs(self.MUTUAL_CUTOFF)
+        inductance = np.array([
+            self._calculate_base_inductance(component, ComponentType.AUDIO_COMPONENT)
+            for component in engine.geometry.objects
+        ], dtype=float)
+        
+        # Coupling coefficient decreases with distance
+        k = 0.1 * np.exp(-pairs.distance / 5.0)  # Exponential decay
+        
+        return pairs, k * np.sqrt(inductance[pairs.i] * inductance[pairs.j])
     
     def _extract_geometry_params(self, component: Any) -> Dict[str, float]:
         """Extract geometry parameters from component."""
@@ -495,16 +516,20 @@ class MutualInductanceAnalyzer(BaseAnalyzer[MutualInductanceAnalysisItem]):
     def _perform_direct_analysis(self, board: Any) -> AnalysisResult:
         """Perform direct mutual inductance analysis."""
         try:
-            components = board.GetFootprints()
-            inductance_data = {}
+            engine = CouplingMatrixEngine.from_board(board)
+            types, base = self._component_types_and_base(engine)
+            self_inductance = base * self._frequency_factors([1000.0], types)[0]  # 1kHz
             
-            for component in components:
-                ref = component.GetReference()
-                inductance_model = self.calculate_component_inductance(component, 1000.0)  # 1kHz
+            pairs, mutual = self._mutual_inductance_pairs(engine)
+            total_mutual = engine.sum_by_component(pairs, mutual)
+            neighbours = engine.neighbour_values(pairs, mutual)
+            
+            inductance_data = {}
+            for k, ref in enumerate(engine.geometry.references):
                 inductance_data[ref] = {
-                    'self_inductance': inductance_model.self_inductance,
-                    'mutual_inductance': inductance_model.mutual_inductance,
-                    'coupling_factor': self._calculate_coupling_factor(inductance_model)
+                    'self_inductance': float(self_inductance[k]),
+                    'mutual_inductance': neighbours[k],
+                    'coupling_factor': float(total_mutual[k] / self_inductance[k]) if self_inductance[k] != 0 else 0.0
                 }
             
             return AnalysisResult(
@@ -13,8 +13,10 @@ from enum import Enum
 import numpy as np
 
 from ..base.base_analyzer import BaseAnalyzer
+from ..base.analysis_cache import cached_analysis
 from ..base.results.analysis_result import AnalysisResult, AnalysisType, AnalysisSeverity
 from ..base.base_config import BaseConfig
+from .coupling_engine import FootprintGeometry
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +87,7 @@ class ThermalCouplingAnalyzer(BaseAnalyzer[ThermalCouplingAnalysisItem]):
         self._power_models = self._initialize_power_models()
         self._expansion_models = self._initialize_expansion_models()
     
+    @cached_analysis(version="1")
     def analyze_thermal_coupling(self, board: Any) -> AnalysisResult:
         """Analyze thermal coupling for all components on the board.
         
@@ -230,25 +233,21 @@ class ThermalCouplingAnalyzer(BaseAnalyzer[ThermalCouplingAnalysisItem]):
             Dictionary with thermal gradient data
         """
         try:
-            results = {}
-            components = board.GetFootprints()
-            
             # Calculate board-wide thermal gradients
             gradients = self._calculate_board_thermal_gradients(board)
             
-            for component in components:
-                ref = component.GetReference()
-                
-                # Calculate local thermal gradient effects
-                gradient_effects = self._calculate_local_thermal_gradient(component, gradients)
-                
-                results[ref] = {
-                    'local_gradient': gradient_effects['gradient'],
-                    'temperature_variation': gradient_effects['variation'],
-                    'coupling_variation': gradient_effects['coupling']
-                }
+            # Calculate local thermal gradient effects for all components at once
+            geometry = FootprintGeometry.from_board(board)
+            gradient_effects = self._calculate_local_thermal_gradients(geometry, gradients)
             
-            return results
+            return {
+                ref: {
+                    'local_gradient': float(gradient_effects['gradient'][k]),
+                    'temperature_variation': float(gradient_effects['variation'][k]),
+                    'coupling_variation': float(gradient_effects['coupling'][k])
+                }
+                for k, ref in enumerate(geometry.references)
+            }
             
         except Exception as e:
             self.logger.error(f"Error analyzing thermal gradients: {str(e)}")
@@ -452,32 +451,23 @@ class ThermalCouplingAnalyzer(BaseAnalyzer[ThermalCouplingAnalysisItem]):
             self.logger.error(f"Error calculating board thermal gradients: {str(e)}")
             return {'x_gradient': 0.01, 'y_gradient': 0.01, 'max_gradient': 0.02}
     
-    def _calculate_local_thermal_gradient(self, component: Any, gradients: Dict[str, float]) -> Dict[str, float]:
-        """Calculate local thermal gradient effects for a component."""
-        try:
-            # Get component position
-            pos = component.GetPosition()
-            x = pos.x / 1e6  # mm
-            y = pos.y / 1e6  # mm
-            
-            # Calculate local gradient
-            local_gradient = gradients['x_gradient'] * x + gradients['y_gradient'] * y
-            
-            # Calculate temperature variation
-            temperature_variation = local_gradient * 10.0  # 10mm characteristic length
-            
-            # Calculate coupling variation
-            coupling_variation = temperature_variation * 0.01  # 1% per °C
-            
-            return {
-                'gradient': local_gradient,
-                'variation': temperature_variation,
-                'coupling': coupling_variation
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating local thermal gradient: {str(e)}")
-            return {'gradient': 0.01, 'variation': 0.1, 'coupling': 0.001}
+    def _calculate_local_thermal_gradients(self, geometry: FootprintGeometry,
+                                           gradients: Dict[str, float]) -> Dict[str, np.ndarray]:
+        """Calculate local thermal gradient effects for every component."""
+        # Calculate local gradient from the component positions (mm)
+        local_gradient = gradients['x_gradient'] * geometry.x + gradients['y_gradient'] * geometry.y
+        
+        # Calculate temperature variation
+        temperature_variation = local_gradient * 10.0  # 10mm characteristic length
+        
+        # Calculate coupling variation
+        coupling_variation = temperature_variation * 0.01  # 1% per °C
+        
+        return {
+            'gradient': local_gradient,
+            'variation': temperature_variation,
+            'coupling': coupling_variation
+        }
     
     def _determine_component_type(self, ref: str) -> str:
         """Determine component type based on reference."""
@@ -0,0 +1,419 @@
+"""
+Persistent on-disk cache for analysis results.
+
+Entries are keyed by the content hash of the board snapshot together with
+the analyzer class, a version string, its configuration and the call
+arguments, so an unchanged board is not re-analyzed across CLI runs and GUI
+sessions while any edit, config change or analyzer update misses. Results
+are stored as NumPy ``.npz`` archives without pickle: a JSON header holds
+the plain fields and every array leaf is stored natively. The directory is
+bounded in bytes and evicts the least recently used entries.
+
+Analyzers opt in per method::
+
+    class ThermalCouplingAnalyzer(BaseAnalyzer[...]):
+        @cached_analysis(version="1")
+        def analyze_thermal_coupling(self, board): ...
+"""
+import dataclasses
+import functools
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .results.analysis_result import AnalysisResult
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "KICAD_PCB_GENERATOR_CACHE_DIR"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_HEADER = "__header__"
+_ARRAY = "__ndarray__"
+_DATETIME = "__datetime__"
+_COMPLEX = "__complex__"
+_RESULT = "__analysis_result__"
+
+
+def default_cache_dir() -> str:
+    """Per-user analysis cache directory (``$XDG_CACHE_HOME`` aware)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "kicad-pcb-generator", "analysis")
+
+
+def fingerprint(*parts: Any, strict: bool = False) -> str:
+    """Stable SHA-256 key of configuration-like values.
+
+    Dataclasses, enums, NumPy data, bytes, paths and containers are reduced
+    to plain JSON, and objects with a ``content_hash()`` method (such as
+    ``BoardSnapshot``) contribute that hash. Anything else contributes its
+    ``repr``, or raises ``TypeError`` with ``strict`` since a repr like
+    that of a SWIG proxy names the object, not its content.
+    """
+    def plain(obj: Any) -> Any:
+        if callable(getattr(obj, "content_hash", None)) and not isinstance(obj, type):
+            return {"__type__": type(obj).__qualname__, "content_hash": obj.content_hash()}
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return {"__type__": type(obj).__qualname__,
+                    **{f.name: plain(getattr(obj, f.name)) for f in dataclasses.fields(obj)}}
+        if isinstance(obj, dict):
+            return {str(k): plain(v) for k, v in sorted(obj.items(), key=lambda item: str(item[0]))}
+        if isinstance(obj, (list, tuple)):
+            return [plain(v) for v in obj]
+        if isinstance(obj, (set, frozenset)):
+            return sorted((plain(v) for v in obj), key=repr)
+        if isinstance(obj, np.ndarray):
+            return {"dtype": obj.dtype.str, "shape": list(obj.shape),
+                    "sha256": hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest()}
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, Enum):
+            return plain(obj.value)
+        if isinstance(obj, float):
+            return repr(obj)
+        if isinstance(obj, (bool, int, str)) or obj is None:
+            return obj
+        if isinstance(obj, (bytes, bytearray)):
+            return {"sha256": hashlib.sha256(obj).hexdigest()}
+        if isinstance(obj, (os.PathLike, datetime, complex)):
+            return {"__type__": type(obj).__qualname__, "value": str(obj)}
+        if strict:
+            raise TypeError(f"Cannot fingerprint {type(obj).__name__} values")
+        return repr(obj)
+
+    payload = json.dumps(plain(parts), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def board_content_hash(board: Any) -> str:
+    """Content hash of a board or ``BoardSnapshot``."""
+    from ..board.snapshot import BoardSnapshot
+
+    snapshot = board if isinstance(board, BoardSnapshot) else BoardSnapshot.from_board(board)
+    return snapshot.content_hash()
+
+
+# ----------------------------------------------------------------------
+# Encoding
+# ----------------------------------------------------------------------
+def encode_value(obj: Any, arrays: Dict[str, np.ndarray]) -> Any:
+    """Convert a value to JSON data, moving arrays into ``arrays``.
+
+    Raises:
+        TypeError: If the value holds objects that cannot be restored
+            exactly (class instances other than ``AnalysisResult``)
+    """
+    if isinstance(obj, AnalysisResult):
+        return {_RESULT: {
+            "success": obj.success,
+            "analysis_type": obj.analysis_type.value,
+            "message": obj.message,
+            "errors": encode_value(obj.errors, arrays),
+            "warnings": encode_value(obj.warnings, arrays),
+            "timestamp": obj.timestamp.isoformat(),
+            "data": encode_value(obj.data, arrays),
+            "metrics": encode_value(obj.metrics, arrays),
+            "severity": obj.severity.value,
+            "target_id": obj.target_id,
+            "analysis_duration": obj.analysis_duration,
+            "confidence_score": obj.confidence_score,
+            "recommendations": encode_value(obj.recommendations, arrays)
+        }}
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            raise TypeError("object arrays cannot be cached")
+        name = f"a{len(arrays)}"
+        arrays[name] = obj
+        return {_ARRAY: name}
+    if isinstance(obj, dict):
+        if not all(isinstance(k, str) for k in obj):
+            raise TypeError("only string-keyed dicts can be cached")
+        return {k: encode_value(v, arrays) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [encode_value(v, arrays) for v in obj]
+    if isinstance(obj, np.generic):
+        return encode_value(obj.item(), arrays)
+    if isinstance(obj, complex):
+        return {_COMPLEX: [obj.real, obj.imag]}
+    if isinstance(obj, datetime):
+        return {_DATETIME: obj.isoformat()}
+    if isinstance(obj, (bool, int, float, str)) or obj is None:
+        return obj
+    raise TypeError(f"{type(obj).__name__} values cannot be cached")
+
+
+def decode_value(obj: Any, arrays: Dict[str, np.ndarray]) -> Any:
+    """Rebuild a value produced by ``encode_value``."""
+    if isinstance(obj, list):
+        return [decode_value(v, arrays) for v in obj]
+    if not isinstance(obj, dict):
+        return obj
+    if _ARRAY in obj:
+        return arrays[obj[_ARRAY]]
+    if _COMPLEX in obj:
+        return complex(*obj[_COMPLEX])
+    if _DATETIME in obj:
+        return datetime.fromisoformat(obj[_DATETIME])
+    if _RESULT in obj:
+        fields = obj[_RESULT]
+        result = AnalysisResult.from_dict({
+            **fields,
+            "errors": decode_value(fields["errors"], arrays),
+            "warnings": decode_value(fields["warnings"], arrays),
+            "recommendations": decode_value(fields["recommendations"], arrays)
+        })
+        result.data = decode_value(fields["data"], arrays)
+        result.metrics = decode_value(fields["metrics"], arrays)
+        return result
+    return {k: decode_value(v, arrays) for k, v in obj.items()}
+
+
+class AnalysisCache:
+    """Size-bounded LRU directory of ``.npz`` analysis results."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Cache directory; defaults to ``default_cache_dir()``
+            max_bytes: Maximum total size of the cached files
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                arrays = {name: archive[name] for name in archive.files if name != _HEADER}
+                header = json.loads(str(archive[_HEADER]))
+            value = decode_value(header, arrays)
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding unreadable analysis cache entry {key}: {e}")
+            self._remove(path)
+            self._count("misses")
+            return None
+        self._count("hits")
+        return value
+
+    def put(self, key: str, value: Any) -> bool:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: AnalysisResult or plain data (dicts, lists, numbers,
+                strings, NumPy arrays)
+
+        Returns:
+            True if the value was stored
+        """
+        arrays: Dict[str, np.ndarray] = {}
+        try:
+            header = json.dumps(encode_value(value, arrays), separators=(",", ":"))
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not caching analysis result {key}: {e}")
+            return False
+
+        buffer = io.BytesIO()
+        np.savez(buffer, **{_HEADER: np.array(header)}, **arrays)
+        payload = buffer.getvalue()
+        if len(payload) > self.max_bytes:
+            return False
+
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Error writing analysis cache entry {key}: {e}")
+            self._remove(tmp_path)
+            return False
+        self._count("writes")
+        self._prune()
+        return True
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        for name, _, _ in self._entries():
+            self._remove(os.path.join(self.cache_dir, name))
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and disk usage."""
+        entries = self._entries()
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+                "max_bytes": self.max_bytes
+            }
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _entries(self) -> List[Tuple[str, int, float]]:
+        """(file name, size, last use) of every entry."""
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return []
+        for name in names:
+            if not name.endswith(".npz"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            entries.append((name, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _prune(self) -> None:
+        """Evict least recently used entries beyond the size bound."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        for name, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_bytes:
+                break
+            self._remove(os.path.join(self.cache_dir, name))
+            total -= size
+            self._count("evictions")
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# ----------------------------------------------------------------------
+# Shared cache and decorator
+# ----------------------------------------------------------------------
+_shared_cache: Optional[AnalysisCache] = None
+_shared_configured = False
+
+
+class _NoAnalysisCache:
+    """Type of ``NO_ANALYSIS_CACHE``."""
+
+    def __repr__(self) -> str:
+        return "NO_ANALYSIS_CACHE"
+
+
+# Set an analyzer's ``analysis_cache`` to this to never use a persistent
+# cache, even when the shared one is configured (None means "use shared")
+NO_ANALYSIS_CACHE = _NoAnalysisCache()
+
+
+def configure_analysis_cache(cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                             enabled: bool = True) -> Optional[AnalysisCache]:
+    """Set up the cache shared by all analyzers.
+
+    Args:
+        cache_dir: Cache directory; defaults to ``default_cache_dir()``
+        max_bytes: Maximum total size of the cached files
+        enabled: False disables persistent caching
+
+    Returns:
+        The shared cache, or None if disabled or unavailable
+    """
+    global _shared_cache, _shared_configured
+    _shared_configured = True
+    _shared_cache = None
+    if enabled:
+        try:
+            _shared_cache = AnalysisCache(cache_dir, max_bytes)
+        except OSError as e:
+            logger.error(f"Error creating analysis cache directory: {e}")
+    return _shared_cache
+
+
+def get_analysis_cache() -> Optional[AnalysisCache]:
+    """Get the shared cache.
+
+    Until ``configure_analysis_cache`` is called, the cache is only enabled
+    when ``$KICAD_PCB_GENERATOR_CACHE_DIR`` names a directory.
+    """
+    if not _shared_configured and os.environ.get(CACHE_DIR_ENV):
+        configure_analysis_cache(os.environ[CACHE_DIR_ENV])
+    return _shared_cache
+
+
+def cached_analysis(version: str = "1", config_attr: str = "config") -> Callable:
+    """Cache an analyzer method's results on disk by board content.
+
+    The method's first argument is the board (a KiCad board or
+    ``BoardSnapshot``); methods without one analyze ``self.board``. The key
+    covers the analyzer class, ``version``, ``getattr(self, config_attr)``
+    and the remaining arguments, so bump ``version`` when the analysis
+    changes. Only successful ``AnalysisResult`` values and non-empty plain
+    data are stored. The analyzer's ``analysis_cache`` attribute overrides
+    the shared cache: None uses the shared cache and ``NO_ANALYSIS_CACHE``
+    disables caching for that analyzer.
+
+    Args:
+        version: Analyzer version included in the key
+        config_attr: Attribute holding the analyzer configuration
+
+    Returns:
+        Method decorator
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = getattr(self, "analysis_cache", None)
+            if cache is None:
+                cache = get_analysis_cache()
+            if cache is None or cache is NO_ANALYSIS_CACHE:
+                return method(self, *args, **kwargs)
+            try:
+                board = args[0] if args else getattr(self, "board")
+                key = fingerprint(
+                    type(self).__module__, type(self).__qualname__, method.__name__, version,
+                    getattr(self, config_attr, None), board_content_hash(board), args[1:], kwargs
+                )
+            except Exception as e:
+                logger.debug(f"Analysis cache bypassed for {method.__qualname__}: {e}")
+                return method(self, *args, **kwargs)
+
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            result = method(self, *args, **kwargs)
+            if (result.success if isinstance(result, AnalysisResult) else bool(result)):
+                cache.put(key, result)
+            return result
+        return wrapper
+    return decorator
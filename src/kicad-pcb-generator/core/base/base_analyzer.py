@@ -25,6 +25,9 @@ class BaseAnalyzer(ABC, Generic[T]):
         self._cache: Dict[str, Any] = {}
         self._analysis_history: List[AnalysisResult] = []
         self._enabled_analyses: Dict[str, bool] = {}
+        # Persistent result cache for @cached_analysis methods (None uses the shared one,
+        # NO_ANALYSIS_CACHE disables it)
+        self.analysis_cache = None
         
     def analyze(self, target: T, analysis_type: AnalysisType = AnalysisType.CUSTOM) -> AnalysisResult:
         """Perform analysis on a target.
@@ -2,7 +2,7 @@
 Base manager class for standardizing CRUD operations.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, TypeVar, Generic
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Tuple, TypeVar, Generic, Union
 import logging
 
 from .results.manager_result import ManagerResult, ManagerOperation, ManagerStatus
@@ -18,6 +18,15 @@ class BaseManager(ABC, Generic[T]):
         """Initialize the base manager."""
         self._items: Dict[str, T] = {}
         self._cache: Dict[str, Any] = {}
+        # Bumped on every mutation; cached values from older generations
+        # are dropped when next read rather than eagerly on each write
+        self._generation = 0
+        self._cache_generation = 0
+    
+    @property
+    def generation(self) -> int:
+        """Counter incremented whenever the stored items change."""
+        return self._generation
         
     def create(self, key: str, data: T) -> ManagerResult:
         """Create a new item.
@@ -46,7 +55,7 @@ class BaseManager(ABC, Generic[T]):
             
             # Store item
             self._items[key] = data
-            self._clear_cache()
+            self._invalidate()
             
             logger.info(f"Created item with key '{key}'")
             return ManagerResult(
@@ -137,7 +146,7 @@ class BaseManager(ABC, Generic[T]):
             
             # Update item
             self._items[key] = data
-            self._clear_cache()
+            self._invalidate()
             
             logger.info(f"Updated item with key '{key}'")
             return ManagerResult(
@@ -184,7 +193,7 @@ class BaseManager(ABC, Generic[T]):
             
             # Remove item
             del self._items[key]
-            self._clear_cache()
+            self._invalidate()
             
             logger.info(f"Deleted item with key '{key}'")
             return ManagerResult(
@@ -259,9 +268,160 @@ class BaseManager(ABC, Generic[T]):
     def clear(self) -> None:
         """Clear all items."""
         self._items.clear()
-        self._clear_cache()
+        self._invalidate()
         logger.info("Cleared all items")
     
+    def bulk_create(self, items: Union[Mapping[str, T], Iterable[Tuple[str, T]]]) -> ManagerResult:
+        """Create many items with a single cache invalidation.
+        
+        Invalid or duplicate items are skipped and reported; the rest are
+        stored.
+        
+        Args:
+            items: Mapping or ``(key, data)`` pairs
+            
+        Returns:
+            Manager result; PARTIAL status if some items were rejected
+        """
+        try:
+            pairs = list(items.items()) if isinstance(items, Mapping) else list(items)
+            accepted: Dict[str, T] = {}
+            errors: List[str] = []
+            for key, data in pairs:
+                if key in self._items or key in accepted:
+                    errors.append(f"Duplicate key: {key}")
+                    continue
+                validation_result = self._validate_data(data)
+                if not validation_result.success:
+                    errors.extend(validation_result.errors or [f"Invalid item: {key}"])
+                    continue
+                accepted[key] = data
+            
+            if accepted:
+                self._items.update(accepted)
+                self._invalidate()
+            
+            logger.info(f"Created {len(accepted)} of {len(pairs)} items")
+            return self._bulk_result(ManagerOperation.CREATE, "created", list(accepted), len(pairs), errors)
+            
+        except Exception as e:
+            logger.error(f"Error creating items: {e}")
+            return ManagerResult(
+                success=False,
+                operation=ManagerOperation.CREATE,
+                status=ManagerStatus.FAILED,
+                message=f"Error creating items: {e}",
+                errors=[str(e)]
+            )
+    
+    def bulk_update(self, items: Union[Mapping[str, T], Iterable[Tuple[str, T]]]) -> ManagerResult:
+        """Update many existing items with a single cache invalidation.
+        
+        Args:
+            items: Mapping or ``(key, data)`` pairs
+            
+        Returns:
+            Manager result; PARTIAL status if some items were rejected
+        """
+        try:
+            pairs = list(items.items()) if isinstance(items, Mapping) else list(items)
+            accepted: Dict[str, T] = {}
+            errors: List[str] = []
+            for key, data in pairs:
+                if key not in self._items:
+                    errors.append(f"Key not found: {key}")
+                    continue
+                validation_result = self._validate_data(data)
+                if not validation_result.success:
+                    errors.extend(validation_result.errors or [f"Invalid item: {key}"])
+                    continue
+                accepted[key] = data
+            
+            if accepted:
+                self._items.update(accepted)
+                self._invalidate()
+            
+            logger.info(f"Updated {len(accepted)} of {len(pairs)} items")
+            return self._bulk_result(ManagerOperation.UPDATE, "updated", list(accepted), len(pairs), errors)
+            
+        except Exception as e:
+            logger.error(f"Error updating items: {e}")
+            return ManagerResult(
+                success=False,
+                operation=ManagerOperation.UPDATE,
+                status=ManagerStatus.FAILED,
+                message=f"Error updating items: {e}",
+                errors=[str(e)]
+            )
+    
+    def bulk_delete(self, keys: Iterable[str]) -> ManagerResult:
+        """Delete many items with a single cache invalidation.
+        
+        Args:
+            keys: Keys of the items to delete
+            
+        Returns:
+            Manager result; PARTIAL status if some keys were not found
+        """
+        try:
+            keys = list(keys)
+            deleted: List[str] = []
+            errors: List[str] = []
+            for key in keys:
+                if key not in self._items:
+                    errors.append(f"Key not found: {key}")
+                    continue
+                self._cleanup_item(key)
+                del self._items[key]
+                deleted.append(key)
+            
+            if deleted:
+                self._invalidate()
+            
+            logger.info(f"Deleted {len(deleted)} of {len(keys)} items")
+            return self._bulk_result(ManagerOperation.DELETE, "deleted", deleted, len(keys), errors)
+            
+        except Exception as e:
+            logger.error(f"Error deleting items: {e}")
+            return ManagerResult(
+                success=False,
+                operation=ManagerOperation.DELETE,
+                status=ManagerStatus.FAILED,
+                message=f"Error deleting items: {e}",
+                errors=[str(e)]
+            )
+    
+    def _bulk_result(self, operation: ManagerOperation, verb: str, item_ids: List[str],
+                     total: int, errors: List[str]) -> ManagerResult:
+        """Build the result of a bulk operation.
+        
+        Args:
+            operation: Operation performed
+            verb: Past-tense verb used in the message
+            item_ids: Keys of the items that were changed
+            total: Number of items requested
+            errors: Reasons items were rejected
+            
+        Returns:
+            Manager result
+        """
+        if not errors:
+            status = ManagerStatus.SUCCESS
+        elif item_ids:
+            status = ManagerStatus.PARTIAL
+        else:
+            status = ManagerStatus.FAILED
+        return ManagerResult(
+            success=status != ManagerStatus.FAILED,
+            operation=operation,
+            status=status,
+            message=f"Successfully {verb} {len(item_ids)} of {total} items",
+            errors=errors,
+            affected_items=len(item_ids),
+            total_items=total,
+            item_ids=item_ids
+        )
+    
     @abstractmethod
     def _validate_data(self, data: T) -> ManagerResult:
         """Validate data before storage.
@@ -283,6 +443,15 @@ class BaseManager(ABC, Generic[T]):
         # Override in subclasses if needed
         pass
     
+    def _invalidate(self) -> None:
+        """Record a data change.
+        
+        Bumps the generation so cached values are dropped on their next
+        read, then runs the ``_clear_cache`` hook once.
+        """
+        self._generation += 1
+        self._clear_cache()
+    
     def _clear_cache(self) -> None:
         """Clear cache after data changes."""
         # Override in subclasses if needed
@@ -295,8 +464,11 @@ class BaseManager(ABC, Generic[T]):
             key: Cache key
             
         Returns:
-            Cached value or None
+            Cached value or None if missing or stale
         """
+        if self._cache_generation != self._generation:
+            self._cache.clear()
+            self._cache_generation = self._generation
         return self._cache.get(key)
     
     def set_cache(self, key: str, value: Any) -> None:
@@ -306,4 +478,7 @@ class BaseManager(ABC, Generic[T]):
             key: Cache key
             value: Value to cache
         """
+        if self._cache_generation != self._generation:
+            self._cache.clear()
+            self._cache_generation = self._generation
         self._cache[key] = value 
\ No newline at end of file
@@ -2,7 +2,7 @@
 Standardized manager result structure.
 """
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Generic, List, Optional, TypeVar
 from datetime import datetime
 from enum import Enum
 
@@ -28,9 +28,14 @@ class ManagerStatus(Enum):
     CANCELLED = "cancelled"
     TIMEOUT = "timeout"
 
+T = TypeVar('T')
+
 @dataclass
-class ManagerResult:
-    """Standardized result of a manager operation."""
+class ManagerResult(Generic[T]):
+    """Standardized result of a manager operation.
+    
+    Generic in the type of ``data``, e.g. ``ManagerResult[OptimizationConfig]``.
+    """
     success: bool
     operation: ManagerOperation = ManagerOperation.CUSTOM
     status: ManagerStatus = ManagerStatus.SUCCESS
@@ -38,7 +43,7 @@ class ManagerResult:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.now)
-    data: Optional[Any] = None
+    data: Optional[T] = None
     affected_items: int = 0
     total_items: int = 0
     operation_duration: Optional[float] = None
@@ -9,6 +9,7 @@ import pcbnew
 from ..base.base_manager import BaseManager
 from ..base.results.manager_result import ManagerResult, ManagerOperation, ManagerStatus
 from ..validation.validation_rule import ValidationRule, RuleType, ValidationCategory, ValidationSeverity
+from .spatial_index import BoardSpatialIndex, ITEM_TRACK, ITEM_FOOTPRINT
 
 if TYPE_CHECKING:
     from ..base.results.manager_result import ManagerResult
@@ -86,6 +87,7 @@ class AdvancedDRCManager(BaseManager[DRCRuleItem]):
         self.rules: Dict[str, ValidationRule] = {}
         self.templates: Dict[str, RuleTemplate] = {}
         self.conflicts: List[RuleConflict] = []
+        self._spatial_indexes: Dict[str, BoardSpatialIndex] = {}
         self._init_default_templates()
     
     def _validate_data(self, data: DRCRuleItem) -> ManagerResult:
@@ -516,6 +518,8 @@ class AdvancedDRCManager(BaseManager[DRCRuleItem]):
         
         try:
             results = {}
+            # Rebuild spatial indexes once per validation pass
+            self._spatial_indexes.clear()
             
             # Run DRC
             drc = pcbnew.DRC()
@@ -617,19 +621,14 @@ class AdvancedDRCManager(BaseManager[DRCRuleItem]):
         try:
             # Check component spacing
             if "min_spacing" in rule.parameters:
-                for comp1 in self.board.GetFootprints():
-                    for comp2 in self.board.GetFootprints():
-                        if comp1 != comp2:
-                            distance = self._calculate_distance(
-                                comp1.GetPosition(),
-                                comp2.GetPosition()
-                            )
-                            if distance < rule.parameters["min_spacing"]:
-                                results[rule.category].append(
-                                    f"Components {comp1.GetReference()} and "
-                                    f"{comp2.GetReference()} are too close: "
-                                    f"{distance:.2f}mm < {rule.parameters['min_spacing']}mm"
-                                )
+                min_spacing = rule.parameters["min_spacing"]
+                index = self._get_spatial_index(ITEM_FOOTPRINT)
+                for item1, item2, distance in index.close_pairs(min_spacing, kinds=(ITEM_FOOTPRINT,)):
+                    results[rule.category].append(
+                        f"Components {item1.obj.GetReference()} and "
+                        f"{item2.obj.GetReference()} are too close: "
+                        f"{distance:.2f}mm < {min_spacing}mm"
+                    )
             
             # Check edge clearance
             if "edge_clearance" in rule.parameters:
@@ -855,18 +854,14 @@ class AdvancedDRCManager(BaseManager[DRCRuleItem]):
             
             # Check crosstalk
             if "max_crosstalk" in rule.parameters:
-                for track1 in self.board.GetTracks():
-                    if track1.IsTrack():
-                        for track2 in self.board.GetTracks():
-                            if track2 != track1 and track2.IsTrack():
-                                crosstalk = self._calculate_crosstalk(track1, track2)
-                                if crosstalk > rule.parameters["max_crosstalk"]:
-                                    results[rule.category].append(
-                                        f"Crosstalk {crosstalk:.2f}dB exceeds maximum "
-                                        f"{rule.parameters['max_crosstalk']}dB between tracks at "
-                                        f"({track1.GetStart().x/1e6:.2f}, {track1.GetStart().y/1e6:.2f}) and "
-                                        f"({track2.GetStart().x/1e6:.2f}, {track2.GetStart().y/1e6:.2f})"
-                                    )
+                max_xt = rule.parameters["max_crosstalk"]
+                for track1, track2, crosstalk in self._find_crosstalk_pairs(max_xt):
+                    results[rule.category].append(
+                        f"Crosstalk {crosstalk:.2f}dB exceeds maximum "
+                        f"{max_xt}dB between tracks at "
+                        f"({track1.GetStart().x/1e6:.2f}, {track1.GetStart().y/1e6:.2f}) and "
+                        f"({track2.GetStart().x/1e6:.2f}, {track2.GetStart().y/1e6:.2f})"
+                    )
             
         except Exception as e:
             self.logger.error(f"Error validating signal rules: {str(e)}")
@@ -920,19 +915,12 @@ class AdvancedDRCManager(BaseManager[DRCRuleItem]):
             # Check inter-channel crosstalk
             if "max_crosstalk" in rule.parameters:
                 max_xt = rule.parameters["max_crosstalk"]
-                for track1 in self.board.GetTracks():
-                    if not track1.IsTrack():
-                        continue
-                    for track2 in self.board.GetTracks():
-                        if track2 == track1 or not track2.IsTrack():
-                            continue
-                        crosstalk = self._calculate_crosstalk(track1, track2)
-                        if crosstalk > max_xt:
-                            results[rule.category].append(
-                                f"Crosstalk {crosstalk:.2f}dB exceeds maximum {max_xt}dB between tracks at "
-                                f"({track1.GetStart().x/1e6:.2f}, {track1.GetStart().y/1e6:.2f}) and "
-                                f"({track2.GetStart().x/1e6:.2f}, {track2.GetStart().y/1e6:.2f})"
-                            )
+                for track1, track2, crosstalk in self._find_crosstalk_pairs(max_xt):
+                    results[rule.category].append(
+                        f"Crosstalk {crosstalk:.2f}dB exceeds maximum {max_xt}dB between tracks at "
+                        f"({track1.GetStart().x/1e6:.2f}, {track1.GetStart().y/1e6:.2f}) and "
+                        f"({track2.GetStart().x/1e6:.2f}, {track2.GetStart().y/1e6:.2f})"
+                    )
             
             # ------------------------------------------------------------------
             # EMI / EMC – long parallel segments
@@ -989,6 +977,49 @@ class AdvancedDRCManager(BaseManager[DRCRuleItem]):
             self.logger.error(f"Error validating audio rules: {str(e)}")
             results[rule.category].append(f"Error: {str(e)}")
     
+    def _get_spatial_index(self, kind: str) -> BoardSpatialIndex:
+        """Get the spatial index of one item kind, building it on first use.
+        
+        Args:
+            kind: Item kind to index (``ITEM_TRACK`` or ``ITEM_FOOTPRINT``)
+            
+        Returns:
+            Spatial index for the current board
+        """
+        if kind not in self._spatial_indexes:
+            self._spatial_indexes[kind] = BoardSpatialIndex.from_board(self.board, kinds=(kind,))
+        return self._spatial_indexes[kind]
+    
+    def _find_crosstalk_pairs(self, max_crosstalk: float) -> List[Tuple[pcbnew.TRACK, pcbnew.TRACK, float]]:
+        """Find track pairs whose crosstalk exceeds a limit.
+        
+        Crosstalk falls monotonically with distance, so only pairs within the
+        distance at which it drops to ``max_crosstalk`` are evaluated.
+        
+        Args:
+            max_crosstalk: Maximum allowed crosstalk in dB
+            
+        Returns:
+            List of (track1, track2, crosstalk) tuples
+        """
+        height = 0.035  # Typical substrate height in mm (matches _calculate_crosstalk)
+        ratio = 10 ** (-max_crosstalk / 20) - 1
+        if ratio <= 0:
+            return []
+        radius = height * math.sqrt(ratio)
+        
+        pairs = []
+        for item1, item2, _ in self._get_spatial_index(ITEM_TRACK).close_pairs(
+            radius, kinds=(ITEM_TRACK,), same_layer=False
+        ):
+            track1, track2 = item1.obj, item2.obj
+            if not (track1.IsTrack() and track2.IsTrack()):
+                continue
+            crosstalk = self._calculate_crosstalk(track1, track2)
+            if crosstalk > max_crosstalk:
+                pairs.append((track1, track2, crosstalk))
+        return pairs
+    
     def _calculate_distance(self, pos1: pcbnew.VECTOR2I, pos2: pcbnew.VECTOR2I) -> float:
         """Calculate distance between two points.
         
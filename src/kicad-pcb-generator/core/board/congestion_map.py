@@ -0,0 +1,386 @@
+"""Rasterized routing congestion map.
+
+``CongestionMap`` divides the board into a uniform grid and walks every
+track centreline through it once (a DDA traversal of the cells the segment
+crosses), accumulating per-layer copper occupancy and the number of tracks
+crossing each cell in NumPy arrays. Tracks can be added, removed and
+re-synchronized individually, so the map stays current while a router or
+placer edits the board and can be sampled as a cost field.
+"""
+import logging
+import math
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .spatial_index import _is_via
+
+logger = logging.getLogger(__name__)
+
+_NM_PER_MM = 1e6
+
+
+class CongestionMap:
+    """Per-layer track occupancy and track counts on a uniform grid.
+
+    Arrays are indexed ``[layer_index, row, col]``; ``layers[layer_index]``
+    gives the KiCad layer id. ``occupancy`` holds the copper area (track
+    length times width, in mm^2) inside each cell and ``track_count`` the
+    number of tracks crossing it. Coordinates are in mm.
+    """
+
+    def __init__(self,
+                 bounds: Tuple[float, float, float, float],
+                 cell_size: float = 1.0,
+                 layers: Optional[Sequence[int]] = None):
+        """Initialize an empty map.
+
+        Args:
+            bounds: Area covered by the grid (left, top, right, bottom) in mm
+            cell_size: Grid cell edge length in mm
+            layers: Layer ids to allocate up front; other layers are added
+                when their first track arrives
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        left, top, right, bottom = (float(v) for v in bounds)
+        self.cell_size = float(cell_size)
+        self.left = left
+        self.top = top
+        self.cols = max(1, int(math.ceil((right - left) / self.cell_size)))
+        self.rows = max(1, int(math.ceil((bottom - top) / self.cell_size)))
+        self.layers: List[int] = []
+        self.occupancy = np.zeros((0, self.rows, self.cols), dtype=np.float64)
+        self.track_count = np.zeros((0, self.rows, self.cols), dtype=np.int32)
+        self._layer_index: Dict[int, int] = {}
+        # key -> (geometry, layer index, flat cell indices, copper area per cell)
+        self._tracks: Dict[Hashable, Tuple[Tuple[float, ...], int, np.ndarray, np.ndarray]] = {}
+        for layer in layers or ():
+            self._plane(int(layer))
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_board(cls, board: Any, cell_size: float = 1.0) -> "CongestionMap":
+        """Build a map over a KiCad board's edge bounding box.
+
+        Args:
+            board: KiCad board object
+            cell_size: Grid cell edge length in mm
+
+        Returns:
+            Populated map
+        """
+        box = board.GetBoardEdgesBoundingBox()
+        position = box.GetPosition()
+        end = box.GetEnd()
+        congestion = cls((position.x / _NM_PER_MM, position.y / _NM_PER_MM,
+                          end.x / _NM_PER_MM, end.y / _NM_PER_MM), cell_size)
+        congestion.sync_tracks(board.GetTracks())
+        return congestion
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Any, cell_size: float = 1.0) -> "CongestionMap":
+        """Build a map from a ``BoardSnapshot`` without touching pcbnew.
+
+        Tracks are keyed by their snapshot row.
+
+        Args:
+            snapshot: Board snapshot
+            cell_size: Grid cell edge length in mm
+
+        Returns:
+            Populated map
+        """
+        left, top, right, bottom = (v / _NM_PER_MM for v in snapshot.board_box)
+        congestion = cls((left, top, right, bottom), cell_size)
+        t = snapshot.tracks
+        for i in range(len(t)):
+            congestion.add_segment(i, t.start_x[i] / _NM_PER_MM, t.start_y[i] / _NM_PER_MM,
+                                   t.end_x[i] / _NM_PER_MM, t.end_y[i] / _NM_PER_MM,
+                                   t.width[i] / _NM_PER_MM, int(t.layer[i]))
+        return congestion
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+    def add_segment(self, key: Hashable, x1: float, y1: float, x2: float, y2: float,
+                    width: float, layer: int) -> None:
+        """Rasterize a track segment, replacing any segment with the same key.
+
+        Args:
+            key: Identifier used to update or remove the segment later
+            x1, y1, x2, y2: Segment endpoints in mm
+            width: Track width in mm
+            layer: Layer id
+        """
+        geometry = (float(x1), float(y1), float(x2), float(y2), float(width), int(layer))
+        previous = self._tracks.get(key)
+        if previous is not None:
+            if previous[0] == geometry:
+                return
+            self.remove(key)
+
+        index = self._plane(int(layer))
+        cells, lengths = self._traverse(x1, y1, x2, y2)
+        area = lengths * float(width)
+        if cells.size:
+            self.occupancy[index].reshape(-1)[cells] += area
+            self.track_count[index].reshape(-1)[cells] += 1
+        self._tracks[key] = (geometry, index, cells, area)
+
+    def add_track(self, track: Any) -> bool:
+        """Rasterize a KiCad track, or update it if its geometry changed.
+
+        Args:
+            track: KiCad track object
+
+        Returns:
+            True if the track was added
+        """
+        try:
+            start = track.GetStart()
+            end = track.GetEnd()
+            self.add_segment(_item_key(track),
+                             start.x / _NM_PER_MM, start.y / _NM_PER_MM,
+                             end.x / _NM_PER_MM, end.y / _NM_PER_MM,
+                             track.GetWidth() / _NM_PER_MM, int(track.GetLayer()))
+            return True
+        except (AttributeError, TypeError) as e:
+            logger.debug(f"Skipping track in congestion map: {e}")
+            return False
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove a segment by key.
+
+        Returns:
+            True if the segment was present
+        """
+        entry = self._tracks.pop(key, None)
+        if entry is None:
+            return False
+        _, index, cells, area = entry
+        if cells.size:
+            self.occupancy[index].reshape(-1)[cells] -= area
+            self.track_count[index].reshape(-1)[cells] -= 1
+        return True
+
+    def remove_track(self, track: Any) -> bool:
+        """Remove a KiCad track."""
+        return self.remove(_item_key(track))
+
+    def sync_tracks(self, tracks: Iterable[Any]) -> int:
+        """Bring the map in line with the current track list.
+
+        Tracks that are new or whose geometry changed are rasterized again;
+        tracks no longer present are removed. Vias are ignored.
+
+        Args:
+            tracks: Current tracks of the board
+
+        Returns:
+            Number of segments added, updated or removed
+        """
+        seen = set()
+        changed = 0
+        for track in tracks:
+            if _is_via(track) or not _is_track(track):
+                continue
+            key = _item_key(track)
+            seen.add(key)
+            before = self._tracks.get(key)
+            if self.add_track(track) and self._tracks.get(key) is not before:
+                changed += 1
+        for key in [key for key in self._tracks if key not in seen]:
+            self.remove(key)
+            changed += 1
+        return changed
+
+    def clear(self) -> None:
+        """Remove all segments."""
+        self._tracks.clear()
+        self.occupancy.fill(0.0)
+        self.track_count.fill(0)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def density(self, layer: Optional[int] = None) -> np.ndarray:
+        """Fraction of each cell covered by copper.
+
+        Args:
+            layer: Layer id; the sum over all layers if None
+
+        Returns:
+            ``(rows, cols)`` array
+        """
+        occupancy = self._select(self.occupancy, layer)
+        return occupancy / (self.cell_size * self.cell_size)
+
+    def counts(self, layer: Optional[int] = None) -> np.ndarray:
+        """Number of tracks crossing each cell.
+
+        Args:
+            layer: Layer id; the sum over all layers if None
+
+        Returns:
+            ``(rows, cols)`` array
+        """
+        return self._select(self.track_count, layer)
+
+    def cost_field(self, layer: Optional[int] = None, capacity: float = 0.5) -> np.ndarray:
+        """Congestion cost per cell for routers and placers.
+
+        Args:
+            layer: Layer id; all layers if None
+            capacity: Copper density at which a cell counts as full
+
+        Returns:
+            ``(rows, cols)`` float32 array; 1.0 at capacity, above 1.0 when
+            overfull
+        """
+        return (self.density(layer) / capacity).astype(np.float32)
+
+    def sample(self, xs: Any, ys: Any, layer: Optional[int] = None,
+               capacity: float = 0.5) -> np.ndarray:
+        """Look up the congestion cost at points.
+
+        Args:
+            xs, ys: Point coordinates in mm (scalars or arrays)
+            layer: Layer id; all layers if None
+            capacity: Copper density at which a cell counts as full
+
+        Returns:
+            Cost per point; points outside the grid cost 0
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        cols = np.floor((xs - self.left) / self.cell_size).astype(np.int64)
+        rows = np.floor((ys - self.top) / self.cell_size).astype(np.int64)
+        inside = (cols >= 0) & (cols < self.cols) & (rows >= 0) & (rows < self.rows)
+        field = self.cost_field(layer, capacity)
+        result = np.zeros(np.broadcast(cols, rows).shape, dtype=np.float32)
+        result[inside] = field[rows[inside], cols[inside]]
+        return result
+
+    def hotspots(self, min_tracks: int, layer: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Cells crossed by more than ``min_tracks`` tracks.
+
+        Args:
+            min_tracks: Track count a cell must exceed
+            layer: Layer id; all layers if None
+
+        Returns:
+            Cells with their origin (x, y) in mm, track count and copper
+            density, most congested first
+        """
+        counts = self.counts(layer)
+        density = self.density(layer)
+        rows, cols = np.nonzero(counts > min_tracks)
+        order = np.argsort(-counts[rows, cols], kind="stable")
+        return [
+            {
+                "x": self.left + int(cols[i]) * self.cell_size,
+                "y": self.top + int(rows[i]) * self.cell_size,
+                "track_count": int(counts[rows[i], cols[i]]),
+                "density": float(density[rows[i], cols[i]])
+            }
+            for i in order
+        ]
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _plane(self, layer: int) -> int:
+        """Index of a layer's plane, allocating it on first use."""
+        index = self._layer_index.get(layer)
+        if index is None:
+            index = len(self.layers)
+            self.layers.append(layer)
+            self._layer_index[layer] = index
+            shape = (1, self.rows, self.cols)
+            self.occupancy = np.concatenate(
+                [self.occupancy, np.zeros(shape, dtype=self.occupancy.dtype)])
+            self.track_count = np.concatenate(
+                [self.track_count, np.zeros(shape, dtype=self.track_count.dtype)])
+        return index
+
+    def _select(self, planes: np.ndarray, layer: Optional[int]) -> np.ndarray:
+        if layer is None:
+            return planes.sum(axis=0)
+        index = self._layer_index.get(int(layer))
+        if index is None:
+            return np.zeros((self.rows, self.cols), dtype=planes.dtype)
+        return planes[index]
+
+    def _traverse(self, x1: float, y1: float, x2: float,
+                  y2: float) -> Tuple[np.ndarray, np.ndarray]:
+
+        """Cells crossed by a segment and the segment length inside each.
+
+        The segment is split at every grid line it crosses (the cell
+        boundaries a DDA walk steps over); each piece lies in one cell.
+
+        Returns:
+            Flat cell indices (each cell once) and lengths in mm
+        """
+        gx1 = (x1 - self.left) / self.cell_size
+        gy1 = (y1 - self.top) / self.cell_size
+        dx = (x2 - self.left) / self.cell_size - gx1
+        dy = (y2 - self.top) / self.cell_size - gy1
+        length = math.hypot(x2 - x1, y2 - y1)
+
+        if length == 0.0:
+            col, row = int(math.floor(gx1)), int(math.floor(gy1))
+            if 0 <= col < self.cols and 0 <= row < self.rows:
+                return np.array([row * self.cols + col], dtype=np.int64), np.zeros(1)
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        # Parameters along the segment where it crosses vertical and horizontal grid lines
+        cuts = [np.array([0.0, 1.0])]
+        for start, delta in ((gx1, dx), (gy1, dy)):
+            if delta != 0.0:
+                lo, hi = sorted((start, start + delta))
+                lines = np.arange(math.floor(lo) + 1, math.ceil(hi), dtype=np.float64)
+                cuts.append((lines - start) / delta)
+        t = np.unique(np.concatenate(cuts))
+        pieces = np.diff(t)
+        keep = pieces > 1e-12
+        mid = (t[:-1] + t[1:])[keep] / 2.0
+        pieces = pieces[keep] * length
+
+        cols = np.floor(gx1 + mid * dx).astype(np.int64)
+        rows = np.floor(gy1 + mid * dy).astype(np.int64)
+        inside = (cols >= 0) & (cols < self.cols) & (rows >= 0) & (rows < self.rows)
+        cells = rows[inside] * self.cols + cols[inside]
+        pieces = pieces[inside]
+        # A segment can re-enter a cell only through rounding at a corner
+        cells, inverse = np.unique(cells, return_inverse=True)
+        lengths = np.bincount(inverse, weights=pieces, minlength=cells.size)
+        return cells, lengths
+
+
+def _item_key(item: Any) -> Hashable:
+    """Stable identifier of a board item.
+
+    SWIG returns a new proxy object on every board query, so the item's
+    UUID is used when available.
+    """
+    try:
+        uuid = item.m_Uuid.AsString()
+        if isinstance(uuid, str):
+            return uuid
+    except AttributeError:
+        pass
+    return id(item)
+
+
+def _is_track(item: Any) -> bool:
+    try:
+        return bool(item.IsTrack())
+    except AttributeError:
+        return True
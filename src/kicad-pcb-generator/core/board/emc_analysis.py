@@ -15,6 +15,7 @@ from ..audio.validation.audio_validator import AudioPCBValidator
 from ..validation.safety_validator import SafetyValidator
 from ..base.base_config import BaseConfig
 from ..base.results.config_result import ConfigResult, ConfigStatus, ConfigFormat
+from .spatial_index import BoardSpatialIndex, ITEM_TRACK
 from ...utils.logger import Logger
 
 if TYPE_CHECKING:
@@ -295,6 +296,7 @@ class EMCAnalyzer(BaseAnalyzer[EMCAnalysisItem]):
         self.board = board
         self.config = config or EMCAnalysisConfigItem()
         self.logger = logger or logging.getLogger(__name__)
+        self._track_index: Optional[BoardSpatialIndex] = None
         
         # Initialize validators
         self.audio_validator = AudioPCBValidator()
@@ -651,6 +653,9 @@ class EMCAnalyzer(BaseAnalyzer[EMCAnalysisItem]):
             # Get all tracks
             tracks = self.board.GetTracks()
             
+            # Index the current board state once for all neighbour lookups
+            self._track_index = BoardSpatialIndex.from_board(self.board, kinds=(ITEM_TRACK,))
+            
             # Initialize results
             crosstalk = {}
             reflections = {}
@@ -1051,10 +1056,19 @@ class EMCAnalyzer(BaseAnalyzer[EMCAnalysisItem]):
             List of nearby tracks
         """
         try:
+            if self._track_index is None:
+                self._track_index = BoardSpatialIndex.from_board(self.board, kinds=(ITEM_TRACK,))
+            
             nearby_tracks = []
-            all_tracks = self.board.GetTracks()
+            start = track.GetStart()
+            end = track.GetEnd()
+            candidates = self._track_index.query_segment(
+                start.x / 1e6, start.y / 1e6, end.x / 1e6, end.y / 1e6, 1.0,
+                kinds=(ITEM_TRACK,)
+            )
             
-            for other_track in all_tracks:
+            for item, _ in candidates:
+                other_track = item.obj
                 if other_track == track or other_track.GetType() != pcbnew.PCB_TRACE_T:
                     continue
                 
@@ -0,0 +1,332 @@
+"""Exact segment intersection and copper loop detection.
+
+``segment_intersections`` finds every pair of intersecting track centrelines
+on the same layer. Segments are bucketed into a uniform grid by bounding box
+and only pairs sharing a cell are tested; each pair is reported once, from
+the cell holding the lower-left corner of the two bounding boxes' overlap.
+The orientation tests run on integer nanometre coordinates and are exact.
+The cost is linear in the number of segments plus the number of candidate
+pairs, which stays close to the number of intersections on routed boards.
+
+``find_loops`` builds the connectivity graph of one net (track junctions,
+T-junctions, vias and zones) and finds independent cycles with an iterative
+union-find, so it does not depend on Python's recursion limit.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.union_find import UnionFind
+
+logger = logging.getLogger(__name__)
+
+_NM_PER_MM = 1e6
+
+
+def _as_int64(values: Sequence) -> np.ndarray:
+    return np.rint(np.asarray(values, dtype=np.float64)).astype(np.int64)
+
+
+def _orientation(ax: np.ndarray, ay: np.ndarray, bx: np.ndarray, by: np.ndarray,
+                 cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+    """Sign of the turn a -> b -> c (1 left, -1 right, 0 collinear), exact for nm ints."""
+    return np.sign((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+
+
+def _on_segment(ax: np.ndarray, ay: np.ndarray, bx: np.ndarray, by: np.ndarray,
+                px: np.ndarray, py: np.ndarray) -> np.ndarray:
+    """Whether collinear point p lies within the bounding box of segment ab."""
+    return ((np.minimum(ax, bx) <= px) & (px <= np.maximum(ax, bx))
+            & (np.minimum(ay, by) <= py) & (py <= np.maximum(ay, by)))
+
+
+def segments_intersect(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> bool:
+    """Exact test whether two segments share at least one point.
+
+    Args:
+        a: First segment (x1, y1, x2, y2) in integer nm
+        b: Second segment (x1, y1, x2, y2) in integer nm
+
+    Returns:
+        True if the segments touch, cross or overlap
+    """
+    arrays = [np.array([v], dtype=np.int64) for v in (*a, *b)]
+    return bool(_intersect_mask(*arrays)[0])
+
+
+def _intersect_mask(ax1, ay1, ax2, ay2, bx1, by1, bx2, by2) -> np.ndarray:
+    o1 = _orientation(ax1, ay1, ax2, ay2, bx1, by1)
+    o2 = _orientation(ax1, ay1, ax2, ay2, bx2, by2)
+    o3 = _orientation(bx1, by1, bx2, by2, ax1, ay1)
+    o4 = _orientation(bx1, by1, bx2, by2, ax2, ay2)
+    proper = (o1 * o2 < 0) & (o3 * o4 < 0)
+    touching = (((o1 == 0) & _on_segment(ax1, ay1, ax2, ay2, bx1, by1))
+                | ((o2 == 0) & _on_segment(ax1, ay1, ax2, ay2, bx2, by2))
+                | ((o3 == 0) & _on_segment(bx1, by1, bx2, by2, ax1, ay1))
+                | ((o4 == 0) & _on_segment(bx1, by1, bx2, by2, ax2, ay2)))
+    return proper | touching
+
+
+def _candidate_pairs(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+                     cell_size: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Pairs of segments whose bounding boxes overlap, each pair once."""
+    n = x1.size
+    if n < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    min_x, max_x = np.minimum(x1, x2), np.maximum(x1, x2)
+    min_y, max_y = np.minimum(y1, y2), np.maximum(y1, y2)
+    origin_x, origin_y = min_x.min(), min_y.min()
+    cx0 = ((min_x - origin_x) // cell_size).astype(np.int64)
+    cx1 = ((max_x - origin_x) // cell_size).astype(np.int64)
+    cy0 = ((min_y - origin_y) // cell_size).astype(np.int64)
+    cy1 = ((max_y - origin_y) // cell_size).astype(np.int64)
+    span_x = cx1 - cx0 + 1
+    span_y = cy1 - cy0 + 1
+
+    # One entry per (segment, covered cell)
+    per_segment = span_x * span_y
+    segment = np.repeat(np.arange(n, dtype=np.int64), per_segment)
+    first_entry = np.cumsum(per_segment) - per_segment
+    offset = np.arange(segment.size, dtype=np.int64) - np.repeat(first_entry, per_segment)
+    cell_x = cx0[segment] + offset % span_x[segment]
+    cell_y = cy0[segment] + offset // span_x[segment]
+    columns = int(cx1.max()) + 1
+    cell = cell_y * columns + cell_x
+
+    order = np.argsort(cell, kind="stable")
+    cell = cell[order]
+    segment = segment[order]
+    cell_x = cell_x[order]
+    cell_y = cell_y[order]
+
+    first: List[np.ndarray] = []
+    second: List[np.ndarray] = []
+    distance = 1
+    active = np.arange(segment.size - 1, dtype=np.int64)
+    while active.size:
+        active = active[active + distance < segment.size]
+        active = active[cell[active] == cell[active + distance]]
+        if not active.size:
+            break
+        i = segment[active]
+        j = segment[active + distance]
+        # Bounding boxes must overlap, and the overlap's lower corner must be in this cell
+        overlap_x = np.maximum(min_x[i], min_x[j])
+        overlap_y = np.maximum(min_y[i], min_y[j])
+        keep = ((overlap_x <= np.minimum(max_x[i], max_x[j]))
+                & (overlap_y <= np.minimum(max_y[i], max_y[j]))
+                & (((overlap_x - origin_x) // cell_size).astype(np.int64) == cell_x[active])
+                & (((overlap_y - origin_y) // cell_size).astype(np.int64) == cell_y[active]))
+        first.append(np.minimum(i, j)[keep])
+        second.append(np.maximum(i, j)[keep])
+        distance += 1
+    if not first:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(first), np.concatenate(second)
+
+
+def segment_intersections(x1: Sequence, y1: Sequence, x2: Sequence, y2: Sequence,
+                          layers: Optional[Sequence] = None,
+                          nets: Optional[Sequence] = None,
+                          cell_size: Optional[float] = None,
+                          include_shared_endpoints: bool = False) -> np.ndarray:
+    """Find all intersecting segment pairs on the same layer.
+
+    Args:
+        x1, y1, x2, y2: Segment endpoints in integer nm
+        layers: Layer of each segment; all segments share one layer if None
+        nets: Net id of each segment; pairs on the same non-zero net are
+            connections, not crossings, and are skipped
+        cell_size: Bucket size in nm; defaults to twice the mean segment
+            extent
+        include_shared_endpoints: Also report pairs that only meet at a
+            common endpoint
+
+    Returns:
+        ``(k, 2)`` array of segment index pairs ``(i, j)`` with ``i < j``
+    """
+    x1, y1, x2, y2 = (_as_int64(v) for v in (x1, y1, x2, y2))
+    n = x1.size
+    if n < 2:
+        return np.zeros((0, 2), dtype=np.int64)
+    layer = np.zeros(n, dtype=np.int64) if layers is None else np.asarray(layers, dtype=np.int64)
+    net = None if nets is None else np.asarray(nets, dtype=np.int64)
+
+    pairs: List[np.ndarray] = []
+    for value in np.unique(layer):
+        members = np.nonzero(layer == value)[0]
+        if members.size < 2:
+            continue
+        sx1, sy1, sx2, sy2 = x1[members], y1[members], x2[members], y2[members]
+        size = cell_size
+        if size is None:
+            extent = np.maximum(np.abs(sx2 - sx1), np.abs(sy2 - sy1))
+            size = max(2.0 * float(extent.mean()), 1.0)
+        i, j = _candidate_pairs(sx1, sy1, sx2, sy2, float(size))
+        if net is not None:
+            other_net = (net[members[i]] != net[members[j]]) | (net[members[i]] == 0)
+            i, j = i[other_net], j[other_net]
+        hit = _intersect_mask(sx1[i], sy1[i], sx2[i], sy2[i], sx1[j], sy1[j], sx2[j], sy2[j])
+        if not include_shared_endpoints:
+            hit &= ~_only_shared_endpoint(sx1[i], sy1[i], sx2[i], sy2[i],
+                                          sx1[j], sy1[j], sx2[j], sy2[j])
+        pairs.append(np.stack([members[i[hit]], members[j[hit]]], axis=1))
+
+    if not pairs:
+        return np.zeros((0, 2), dtype=np.int64)
+    result = np.concatenate(pairs)
+    return result[np.lexsort((result[:, 1], result[:, 0]))]
+
+
+def _only_shared_endpoint(ax1, ay1, ax2, ay2, bx1, by1, bx2, by2) -> np.ndarray:
+    """Pairs whose only common point is an endpoint of both segments."""
+    shared = np.zeros(ax1.size, dtype=bool)
+    for (px, py, qx, qy), (rx, ry, sx, sy) in (
+        ((ax1, ay1, ax2, ay2), (bx1, by1, bx2, by2)),
+        ((ax1, ay1, ax2, ay2), (bx2, by2, bx1, by1)),
+        ((ax2, ay2, ax1, ay1), (bx1, by1, bx2, by2)),
+        ((ax2, ay2, ax1, ay1), (bx2, by2, bx1, by1)),
+    ):
+        same = (px == rx) & (py == ry)
+        # Collinear segments continuing in the same direction overlap beyond the shared point
+        dot = (qx - px) * (sx - rx) + (qy - py) * (sy - ry)
+        collinear = _orientation(px, py, qx, qy, sx, sy) == 0
+        shared |= same & ~(collinear & (dot > 0))
+    return shared
+
+
+def _intersection_point(a: Tuple[int, int, int, int],
+                        b: Tuple[int, int, int, int]) -> List[Tuple[int, int]]:
+    """Common points of two intersecting segments, in nm.
+
+    Endpoints lying on the other segment are returned exactly; a proper
+    crossing is rounded to the nearest nm.
+    """
+    ax1, ay1, ax2, ay2 = a
+    bx1, by1, bx2, by2 = b
+    points = []
+    candidates = (((ax1, ay1), b), ((ax2, ay2), b), ((bx1, by1), a), ((bx2, by2), a))
+    for (px, py), (sx1, sy1, sx2, sy2) in candidates:
+        if ((sx2 - sx1) * (py - sy1) - (sy2 - sy1) * (px - sx1) == 0
+                and min(sx1, sx2) <= px <= max(sx1, sx2) and min(sy1, sy2) <= py <= max(sy1, sy2)):
+            points.append((px, py))
+    if points:
+        return points
+    denominator = (ax2 - ax1) * (by2 - by1) - (ay2 - ay1) * (bx2 - bx1)
+    if denominator == 0:
+        return []
+    t = ((bx1 - ax1) * (by2 - by1) - (by1 - ay1) * (bx2 - bx1)) / denominator
+    return [(int(round(ax1 + t * (ax2 - ax1))), int(round(ay1 + t * (ay2 - ay1))))]
+
+
+@dataclass
+class LoopReport:
+    """Independent cycles of a net's copper.
+
+    ``closing_edges`` holds one edge per independent cycle, as
+    ``(kind, index, x, y)`` with ``kind`` one of ``"track"``, ``"via"`` or
+    ``"zone"``, the item's index in the input and the point (mm) where the
+    cycle closes.
+    """
+    node_count: int = 0
+    edge_count: int = 0
+    closing_edges: List[Tuple[str, int, float, float]] = field(default_factory=list)
+
+    @property
+    def loop_count(self) -> int:
+        return len(self.closing_edges)
+
+
+def find_loops(tracks: Sequence[Tuple[int, int, int, int, int]],
+               vias: Sequence[Tuple[int, int, int]] = (),
+               zones: Sequence[Tuple[int, int, int, int, int]] = ()) -> LoopReport:
+    """Find independent cycles in the copper of one net.
+
+    Track endpoints, junctions and T-junctions on a layer are graph nodes;
+    track pieces between them are edges. A via joins every node within its
+    radius on any layer, and a zone joins every node inside its bounding box
+    on its layer.
+
+    Args:
+        tracks: Segments (x1, y1, x2, y2, layer) in integer nm
+        vias: Vias (x, y, radius) in integer nm
+        zones: Zones (layer, left, top, right, bottom) in integer nm
+
+    Returns:
+        Loop report
+    """
+    report = LoopReport()
+    tracks = [tuple(int(v) for v in track) for track in tracks]
+    nodes: Dict[Tuple[int, int, int], int] = {}
+
+    def node(x: int, y: int, layer: int) -> int:
+        key = (layer, x, y)
+        index = nodes.get(key)
+        if index is None:
+            index = nodes[key] = len(nodes)
+        return index
+
+    # Points on each track: its endpoints plus where other tracks touch it
+    points: List[List[Tuple[int, int]]] = [[(t[0], t[1]), (t[2], t[3])] for t in tracks]
+    if len(tracks) > 1:
+        array = np.array(tracks, dtype=np.int64)
+        pairs = segment_intersections(array[:, 0], array[:, 1], array[:, 2], array[:, 3],
+                                      layers=array[:, 4], include_shared_endpoints=True)
+        for i, j in pairs.tolist():
+            for point in _intersection_point(tracks[i][:4], tracks[j][:4]):
+                points[i].append(point)
+                points[j].append(point)
+
+    # (node a, node b, kind, index, x, y)
+    edges: List[Tuple[int, int, str, int, int, int]] = []
+    for index, (x1, y1, x2, y2, layer) in enumerate(tracks):
+        dx, dy = x2 - x1, y2 - y1
+        ordered = sorted(set(points[index]), key=lambda p: (p[0] - x1) * dx + (p[1] - y1) * dy)
+        for (ax, ay), (bx, by) in zip(ordered, ordered[1:]):
+            edges.append((node(ax, ay, layer), node(bx, by, layer), "track", index, bx, by))
+        if len(ordered) == 1:
+            node(x1, y1, layer)
+
+    if vias or zones:
+        keys = list(nodes)
+        node_layer = np.array([k[0] for k in keys], dtype=np.int64)
+        node_x = np.array([k[1] for k in keys], dtype=np.int64)
+        node_y = np.array([k[2] for k in keys], dtype=np.int64)
+        for index, (x, y, radius) in enumerate(vias):
+            via_node = len(nodes)
+            nodes[("via", index, 0)] = via_node
+            near = np.nonzero((node_x - x) ** 2 + (node_y - y) ** 2 <= int(radius) ** 2)[0]
+            for other in near.tolist():
+                edges.append((via_node, other, "via", index, int(x), int(y)))
+        for index, (layer, left, top, right, bottom) in enumerate(zones):
+            zone_node = len(nodes)
+            nodes[("zone", index, 0)] = zone_node
+            inside = np.nonzero((node_layer == layer) & (node_x >= left) & (node_x <= right)
+                                & (node_y >= top) & (node_y <= bottom))[0]
+            for other in inside.tolist():
+                edges.append((zone_node, other, "zone", index,
+                              int(node_x[other]), int(node_y[other])))
+
+        # A via inside a zone connects the zone to every layer
+        for v_index, (x, y, _) in enumerate(vias):
+            for z_index, (layer, left, top, right, bottom) in enumerate(zones):
+                if left <= x <= right and top <= y <= bottom:
+                    edges.append((nodes[("via", v_index, 0)], nodes[("zone", z_index, 0)],
+                                  "via", v_index, int(x), int(y)))
+
+    sets = UnionFind(len(nodes))
+    seen = set()
+    for a, b, kind, index, x, y in edges:
+        if a == b:
+            continue
+        key = (a, b) if a < b else (b, a)
+        if key in seen:
+            continue  # Overlapping copper between the same two points
+        seen.add(key)
+        if not sets.union(a, b):
+            report.closing_edges.append((kind, index, x / _NM_PER_MM, y / _NM_PER_MM))
+    report.node_count = len(nodes)
+    report.edge_count = len(seen)
+    return report
@@ -0,0 +1,634 @@
+"""Pure-Python snapshot of board geometry.
+
+``BoardSnapshot`` extracts tracks, vias, pads, footprints and zones from a
+KiCad board once and stores them as NumPy struct-of-arrays (coordinates in
+nm, widths, layer ids and interned net ids). Analyzers, validators and
+optimizers read from the snapshot instead of calling SWIG accessors inside
+their hot loops, and can be exercised headless by building a snapshot from
+plain objects.
+"""
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NO_NET = 0
+
+
+def _empty_int(dtype: Any = np.int64) -> np.ndarray:
+    return np.zeros(0, dtype=dtype)
+
+
+@dataclass
+class TrackArrays:
+    """Track segments (vias excluded). Coordinates and sizes in nm."""
+    start_x: np.ndarray = field(default_factory=_empty_int)
+    start_y: np.ndarray = field(default_factory=_empty_int)
+    end_x: np.ndarray = field(default_factory=_empty_int)
+    end_y: np.ndarray = field(default_factory=_empty_int)
+    width: np.ndarray = field(default_factory=_empty_int)
+    length: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float64))
+    layer: np.ndarray = field(default_factory=lambda: _empty_int(np.int16))
+    net: np.ndarray = field(default_factory=lambda: _empty_int(np.int32))
+    is_arc: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+    objects: Optional[List[Any]] = None
+
+    def __len__(self) -> int:
+        return int(self.start_x.shape[0])
+
+
+@dataclass
+class ViaArrays:
+    """Vias. Coordinates and sizes in nm."""
+    x: np.ndarray = field(default_factory=_empty_int)
+    y: np.ndarray = field(default_factory=_empty_int)
+    width: np.ndarray = field(default_factory=_empty_int)
+    drill: np.ndarray = field(default_factory=_empty_int)
+    layer: np.ndarray = field(default_factory=lambda: _empty_int(np.int16))
+    net: np.ndarray = field(default_factory=lambda: _empty_int(np.int32))
+    objects: Optional[List[Any]] = None
+
+    def __len__(self) -> int:
+        return int(self.x.shape[0])
+
+
+@dataclass
+class PadArrays:
+    """Pads of all footprints. Coordinates and sizes in nm."""
+    x: np.ndarray = field(default_factory=_empty_int)
+    y: np.ndarray = field(default_factory=_empty_int)
+    size_x: np.ndarray = field(default_factory=_empty_int)
+    size_y: np.ndarray = field(default_factory=_empty_int)
+    net: np.ndarray = field(default_factory=lambda: _empty_int(np.int32))
+    footprint: np.ndarray = field(default_factory=lambda: _empty_int(np.int32))
+    shape: np.ndarray = field(default_factory=lambda: _empty_int(np.int16))
+    is_pth: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=bool))
+    number: List[str] = field(default_factory=list)
+    objects: Optional[List[Any]] = None
+
+    def __len__(self) -> int:
+        return int(self.x.shape[0])
+
+
+@dataclass
+class FootprintArrays:
+    """Footprints. Positions and bounding boxes in nm, orientation in degrees.
+
+    Pads of footprint ``i`` are ``pad_offset[i]:pad_offset[i + 1]`` in
+    ``PadArrays``. The bounding box excludes text; where the board cannot
+    provide one it spans the anchor and the pads.
+    """
+    x: np.ndarray = field(default_factory=_empty_int)
+    y: np.ndarray = field(default_factory=_empty_int)
+    orientation: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float64))
+    layer: np.ndarray = field(default_factory=lambda: _empty_int(np.int16))
+    left: np.ndarray = field(default_factory=_empty_int)
+    top: np.ndarray = field(default_factory=_empty_int)
+    right: np.ndarray = field(default_factory=_empty_int)
+    bottom: np.ndarray = field(default_factory=_empty_int)
+    pad_offset: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int32))
+    reference: List[str] = field(default_factory=list)
+    value: List[str] = field(default_factory=list)
+    fpid: List[str] = field(default_factory=list)
+    objects: Optional[List[Any]] = None
+
+    def __len__(self) -> int:
+        return int(self.x.shape[0])
+
+
+@dataclass
+class ZoneArrays:
+    """Zones by bounding box. Coordinates in nm, area in nm²."""
+    left: np.ndarray = field(default_factory=_empty_int)
+    top: np.ndarray = field(default_factory=_empty_int)
+    right: np.ndarray = field(default_factory=_empty_int)
+    bottom: np.ndarray = field(default_factory=_empty_int)
+    area: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float64))
+    layer: np.ndarray = field(default_factory=lambda: _empty_int(np.int16))
+    net: np.ndarray = field(default_factory=lambda: _empty_int(np.int32))
+    objects: Optional[List[Any]] = None
+
+    def __len__(self) -> int:
+        return int(self.left.shape[0])
+
+
+class BoardSnapshot:
+    """Immutable struct-of-arrays view of a board.
+
+    Net names are interned: every array stores an ``int32`` net id and
+    ``net_names[id]`` gives the name. Id ``0`` is reserved for unconnected
+    items.
+    """
+
+    def __init__(self,
+                 tracks: Optional[TrackArrays] = None,
+                 vias: Optional[ViaArrays] = None,
+                 pads: Optional[PadArrays] = None,
+                 footprints: Optional[FootprintArrays] = None,
+                 zones: Optional[ZoneArrays] = None,
+                 net_names: Optional[List[str]] = None,
+                 layer_names: Optional[Dict[int, str]] = None,
+                 board_box: Tuple[int, int, int, int] = (0, 0, 0, 0),
+                 copper_layer_count: int = 2,
+                 design_rules: Optional[Dict[str, Any]] = None):
+        """Initialize a snapshot from prebuilt arrays.
+
+        Args:
+            tracks: Track arrays
+            vias: Via arrays
+            pads: Pad arrays
+            footprints: Footprint arrays
+            zones: Zone arrays
+            net_names: Interned net names indexed by net id
+            layer_names: Enabled layer ids mapped to their names
+            board_box: Board edge bounding box (left, top, right, bottom) in nm
+            copper_layer_count: Number of copper layers
+            design_rules: Board design settings
+        """
+        self.tracks = tracks or TrackArrays()
+        self.vias = vias or ViaArrays()
+        self.pads = pads or PadArrays()
+        self.footprints = footprints or FootprintArrays()
+        self.zones = zones or ZoneArrays()
+        self.net_names: List[str] = net_names or [""]
+        self._net_ids: Dict[str, int] = {name: i for i, name in enumerate(self.net_names)}
+        self.layer_names: Dict[int, str] = layer_names or {}
+        self.board_box = board_box
+        self.copper_layer_count = copper_layer_count
+        self.design_rules: Dict[str, Any] = design_rules or {}
+        self._spatial_indexes: Dict[Tuple[Tuple[str, ...], float], Any] = {}
+        self._content_hash: Optional[str] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle state for worker processes.
+
+        Board object references cannot cross process boundaries and spatial
+        indexes are cheaper to rebuild than to transfer, so both are dropped.
+        """
+        state = self.__dict__.copy()
+        for kind in ("tracks", "vias", "pads", "footprints", "zones"):
+            state[kind] = replace(state[kind], objects=None)
+        state["design_rules"] = {
+            key: value for key, value in self.design_rules.items()
+            if isinstance(value, (int, float, str, bool, type(None)))
+        }
+        state["_spatial_indexes"] = {}
+        return state
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_board(cls, board: Any, keep_objects: bool = False) -> "BoardSnapshot":
+        """Extract a snapshot from a KiCad board.
+
+        Every SWIG accessor is called once per item.
+
+        Args:
+            board: KiCad board object
+            keep_objects: Keep references to the source board objects so
+                callers can map array rows back to board items
+
+        Returns:
+            Board snapshot
+        """
+        nets = _NetTable()
+        via_type, arc_type, pth_attrib = _pcbnew_constants()
+
+        # Tracks and vias
+        t_cols: Dict[str, list] = {k: [] for k in (
+            "start_x", "start_y", "end_x", "end_y", "width", "length", "layer", "net", "is_arc"
+        )}
+        t_objs: List[Any] = []
+        track_vias: List[Any] = []
+        for track in board.GetTracks():
+            item_type = _safe_call(track.Type)
+            if via_type is not None and item_type == via_type:
+                track_vias.append(track)
+                continue
+            start = track.GetStart()
+            end = track.GetEnd()
+            is_arc = arc_type is not None and item_type == arc_type
+            t_cols["start_x"].append(int(start.x))
+            t_cols["start_y"].append(int(start.y))
+            t_cols["end_x"].append(int(end.x))
+            t_cols["end_y"].append(int(end.y))
+            t_cols["width"].append(_as_int(track.GetWidth()))
+            t_cols["length"].append(float(track.GetLength()) if is_arc else -1.0)
+            t_cols["layer"].append(_as_int(track.GetLayer()))
+            t_cols["net"].append(nets.intern(track.GetNetname()))
+            t_cols["is_arc"].append(is_arc)
+            if keep_objects:
+                t_objs.append(track)
+
+        tracks = TrackArrays(
+            start_x=np.array(t_cols["start_x"], dtype=np.int64),
+            start_y=np.array(t_cols["start_y"], dtype=np.int64),
+            end_x=np.array(t_cols["end_x"], dtype=np.int64),
+            end_y=np.array(t_cols["end_y"], dtype=np.int64),
+            width=np.array(t_cols["width"], dtype=np.int64),
+            length=np.array(t_cols["length"], dtype=np.float64),
+            layer=np.array(t_cols["layer"], dtype=np.int16),
+            net=np.array(t_cols["net"], dtype=np.int32),
+            is_arc=np.array(t_cols["is_arc"], dtype=bool),
+            objects=t_objs if keep_objects else None
+        )
+        # Straight segments: length from coordinates instead of GetLength()
+        straight = tracks.length < 0
+        tracks.length[straight] = np.hypot(
+            (tracks.end_x - tracks.start_x)[straight].astype(np.float64),
+            (tracks.end_y - tracks.start_y)[straight].astype(np.float64)
+        )
+
+        # Vias: prefer the board's own via list, fall back to the track list
+        try:
+            board_vias = list(board.GetVias())
+        except (AttributeError, TypeError):
+            board_vias = track_vias
+        v_cols: Dict[str, list] = {k: [] for k in ("x", "y", "width", "drill", "layer", "net")}
+        for via in board_vias:
+            pos = via.GetPosition()
+            v_cols["x"].append(int(pos.x))
+            v_cols["y"].append(int(pos.y))
+            v_cols["width"].append(_as_int(via.GetWidth()))
+            v_cols["drill"].append(_as_int(via.GetDrill()))
+            v_cols["layer"].append(_as_int(_safe_call(via.GetLayer)))
+            v_cols["net"].append(nets.intern(via.GetNetname()))
+        vias = ViaArrays(
+            x=np.array(v_cols["x"], dtype=np.int64),
+            y=np.array(v_cols["y"], dtype=np.int64),
+            width=np.array(v_cols["width"], dtype=np.int64),
+            drill=np.array(v_cols["drill"], dtype=np.int64),
+            layer=np.array(v_cols["layer"], dtype=np.int16),
+            net=np.array(v_cols["net"], dtype=np.int32),
+            objects=board_vias if keep_objects else None
+        )
+
+        # Footprints and pads
+        f_cols: Dict[str, list] = {k: [] for k in (
+            "x", "y", "orientation", "layer", "left", "top", "right", "bottom"
+        )}
+        refs: List[str] = []
+        values: List[str] = []
+        fpids: List[str] = []
+        pad_offset = [0]
+        p_cols: Dict[str, list] = {k: [] for k in (
+            "x", "y", "size_x", "size_y", "net", "footprint", "shape", "is_pth"
+        )}
+        pad_numbers: List[str] = []
+        f_objs: List[Any] = []
+        p_objs: List[Any] = []
+        for fp_index, footprint in enumerate(board.GetFootprints()):
+            pos = footprint.GetPosition()
+            f_cols["x"].append(int(pos.x))
+            f_cols["y"].append(int(pos.y))
+            f_cols["orientation"].append(_as_float(_safe_call(footprint.GetOrientationDegrees)))
+            f_cols["layer"].append(_as_int(_safe_call(footprint.GetLayer)))
+            refs.append(str(footprint.GetReference()))
+            values.append(str(footprint.GetValue()))
+            fpids.append(_footprint_fpid(footprint))
+            if keep_objects:
+                f_objs.append(footprint)
+            first_pad = len(pad_numbers)
+
+            for pad in footprint.Pads():
+                pad_pos = pad.GetPosition()
+                size = pad.GetSize()
+                p_cols["x"].append(int(pad_pos.x))
+                p_cols["y"].append(int(pad_pos.y))
+                p_cols["size_x"].append(_as_int(size.x))
+                p_cols["size_y"].append(_as_int(size.y))
+                p_cols["net"].append(nets.intern(pad.GetNetname()))
+                p_cols["footprint"].append(fp_index)
+                p_cols["shape"].append(_as_int(_safe_call(pad.GetShape)))
+                p_cols["is_pth"].append(
+                    pth_attrib is not None and _safe_call(pad.GetAttribute) == pth_attrib
+                )
+                pad_numbers.append(str(_safe_call(pad.GetNumber) or ""))
+                if keep_objects:
+                    p_objs.append(pad)
+            pad_offset.append(len(pad_numbers))
+
+            box = _footprint_box(footprint)
+            if box is None:
+                # No usable bounding box: span the anchor and the pads
+                left, top, right, bottom = int(pos.x), int(pos.y), int(pos.x), int(pos.y)
+                for i in range(first_pad, len(pad_numbers)):
+                    half = max(p_cols["size_x"][i], p_cols["size_y"][i]) // 2
+                    left = min(left, p_cols["x"][i] - half)
+                    top = min(top, p_cols["y"][i] - half)
+                    right = max(right, p_cols["x"][i] + half)
+                    bottom = max(bottom, p_cols["y"][i] + half)
+                box = (left, top, right, bottom)
+            for name, edge in zip(("left", "top", "right", "bottom"), box):
+                f_cols[name].append(edge)
+
+        footprints = FootprintArrays(
+            x=np.array(f_cols["x"], dtype=np.int64),
+            y=np.array(f_cols["y"], dtype=np.int64),
+            orientation=np.array(f_cols["orientation"], dtype=np.float64),
+            layer=np.array(f_cols["layer"], dtype=np.int16),
+            left=np.array(f_cols["left"], dtype=np.int64),
+            top=np.array(f_cols["top"], dtype=np.int64),
+            right=np.array(f_cols["right"], dtype=np.int64),
+            bottom=np.array(f_cols["bottom"], dtype=np.int64),
+            pad_offset=np.array(pad_offset, dtype=np.int32),
+            reference=refs,
+            value=values,
+            fpid=fpids,
+            objects=f_objs if keep_objects else None
+        )
+        pads = PadArrays(
+            x=np.array(p_cols["x"], dtype=np.int64),
+            y=np.array(p_cols["y"], dtype=np.int64),
+            size_x=np.array(p_cols["size_x"], dtype=np.int64),
+            size_y=np.array(p_cols["size_y"], dtype=np.int64),
+            net=np.array(p_cols["net"], dtype=np.int32),
+            footprint=np.array(p_cols["footprint"], dtype=np.int32),
+            shape=np.array(p_cols["shape"], dtype=np.int16),
+            is_pth=np.array(p_cols["is_pth"], dtype=bool),
+            number=pad_numbers,
+            objects=p_objs if keep_objects else None
+        )
+
+        # Zones
+        z_cols: Dict[str, list] = {k: [] for k in (
+            "left", "top", "right", "bottom", "area", "layer", "net"
+        )}
+        z_objs: List[Any] = []
+        for zone in _board_items(board, "Zones"):
+            bbox = _safe_call(zone.GetBoundingBox)
+            z_cols["left"].append(_as_int(_safe_call(bbox.GetLeft)) if bbox is not None else 0)
+            z_cols["top"].append(_as_int(_safe_call(bbox.GetTop)) if bbox is not None else 0)
+            z_cols["right"].append(_as_int(_safe_call(bbox.GetRight)) if bbox is not None else 0)
+            z_cols["bottom"].append(_as_int(_safe_call(bbox.GetBottom)) if bbox is not None else 0)
+            z_cols["area"].append(_as_float(_safe_call(zone.GetArea)))
+            z_cols["layer"].append(_as_int(zone.GetLayer()))
+            z_cols["net"].append(nets.intern(zone.GetNetname()))
+            if keep_objects:
+                z_objs.append(zone)
+        zones = ZoneArrays(
+            left=np.array(z_cols["left"], dtype=np.int64),
+            top=np.array(z_cols["top"], dtype=np.int64),
+            right=np.array(z_cols["right"], dtype=np.int64),
+            bottom=np.array(z_cols["bottom"], dtype=np.int64),
+            area=np.array(z_cols["area"], dtype=np.float64),
+            layer=np.array(z_cols["layer"], dtype=np.int16),
+            net=np.array(z_cols["net"], dtype=np.int32),
+            objects=z_objs if keep_objects else None
+        )
+
+        return cls(
+            tracks=tracks,
+            vias=vias,
+            pads=pads,
+            footprints=footprints,
+            zones=zones,
+            net_names=nets.names,
+            layer_names=_extract_layer_names(board),
+            board_box=_extract_board_box(board),
+            copper_layer_count=_as_int(_safe_call(board.GetCopperLayerCount), 2),
+            design_rules=_extract_design_rules(board)
+        )
+
+    # ------------------------------------------------------------------
+    # Nets
+    # ------------------------------------------------------------------
+    def net_id(self, name: str) -> int:
+        """Get the interned id of a net name, or -1 if the net is unknown."""
+        return self._net_ids.get(name, -1)
+
+    def net_name(self, net_id: int) -> str:
+        """Get the net name for an interned id."""
+        return self.net_names[int(net_id)]
+
+    def net_ids_where(self, predicate: Callable[[str], bool]) -> np.ndarray:
+        """Get the ids of all nets whose name satisfies a predicate."""
+        return np.array(
+            [i for i, name in enumerate(self.net_names) if predicate(name)],
+            dtype=np.int32
+        )
+
+    def net_ids_with_prefix(self, prefixes: Sequence[str]) -> np.ndarray:
+        """Get the ids of all nets whose name starts with one of ``prefixes``."""
+        prefixes = tuple(prefixes)
+        return self.net_ids_where(lambda name: name.startswith(prefixes))
+
+    # ------------------------------------------------------------------
+    # Derived views
+    # ------------------------------------------------------------------
+    @property
+    def board_size(self) -> Tuple[float, float]:
+        """Board edge bounding box size (width, height) in mm."""
+        left, top, right, bottom = self.board_box
+        return ((right - left) / 1e6, (bottom - top) / 1e6)
+
+    def track_lengths_mm(self) -> np.ndarray:
+        """Track lengths in mm."""
+        return self.tracks.length / 1e6
+
+    def track_angles_deg(self) -> np.ndarray:
+        """Absolute track direction angles in degrees (0-180)."""
+        dx = (self.tracks.end_x - self.tracks.start_x).astype(np.float64)
+        dy = (self.tracks.end_y - self.tracks.start_y).astype(np.float64)
+        return np.abs(np.degrees(np.arctan2(dy, dx)))
+
+    def footprint_pad_max_size(self) -> np.ndarray:
+        """Largest pad x-size (nm) per footprint; 0 for footprints without pads."""
+        result = np.zeros(len(self.footprints), dtype=np.int64)
+        if len(self.pads):
+            np.maximum.at(result, self.pads.footprint, self.pads.size_x)
+        return result
+
+    def footprint_index(self, reference: str) -> int:
+        """Get the row of a footprint by reference, or -1."""
+        try:
+            return self.footprints.reference.index(reference)
+        except ValueError:
+            return -1
+
+    def spatial_index(self, kinds: Optional[Iterable[str]] = None, cell_size: float = 2.5) -> Any:
+        """Get a spatial index over this snapshot, built once and cached.
+
+        Args:
+            kinds: Item kinds to index; defaults to all kinds
+            cell_size: Grid cell edge length in mm
+
+        Returns:
+            BoardSpatialIndex
+        """
+        from .spatial_index import BoardSpatialIndex
+
+        key = (tuple(sorted(kinds)) if kinds is not None else ("*",), float(cell_size))
+        if key not in self._spatial_indexes:
+            self._spatial_indexes[key] = BoardSpatialIndex.from_snapshot(
+                self, cell_size=cell_size, kinds=kinds
+            )
+        return self._spatial_indexes[key]
+
+    def content_hash(self) -> str:
+        """Stable SHA-256 digest of the board content.
+
+        Covers every geometry array (footprint bounding boxes included), net
+        and layer names, footprint references, values and library ids, the
+        board outline and the design rules, but
+        not the board object references, so two snapshots of an unchanged
+        board hash the same across processes and sessions.
+        """
+        if self._content_hash is None:
+            digest = hashlib.sha256()
+            for kind in ("tracks", "vias", "pads", "footprints", "zones"):
+                arrays = getattr(self, kind)
+                for name, value in sorted(vars(arrays).items()):
+                    if name == "objects":
+                        continue
+                    digest.update(f"{kind}.{name}".encode("utf-8"))
+                    if isinstance(value, np.ndarray):
+                        value = np.ascontiguousarray(value)
+                        digest.update(f"{value.dtype.str}{value.shape}".encode("utf-8"))
+                        digest.update(value.tobytes())
+                    else:
+                        digest.update(json.dumps(value).encode("utf-8"))
+            rules = {
+                key: value for key, value in self.design_rules.items()
+                if isinstance(value, (int, float, str, bool, type(None)))
+            }
+            digest.update(json.dumps([
+                self.net_names,
+                sorted(self.layer_names.items()),
+                list(self.board_box),
+                self.copper_layer_count,
+                rules
+            ], sort_keys=True, default=str).encode("utf-8"))
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+    def __repr__(self) -> str:
+        return (f"BoardSnapshot(tracks={len(self.tracks)}, vias={len(self.vias)}, "
+                f"pads={len(self.pads)}, footprints={len(self.footprints)}, "
+                f"zones={len(self.zones)}, nets={len(self.net_names)})")
+
+
+class _NetTable:
+    """Interns net names to dense integer ids."""
+
+    def __init__(self):
+        self.names: List[str] = [""]
+        self._ids: Dict[str, int] = {"": NO_NET}
+
+    def intern(self, name: Any) -> int:
+        name = name if isinstance(name, str) else ""
+        net_id = self._ids.get(name)
+        if net_id is None:
+            net_id = len(self.names)
+            self._ids[name] = net_id
+            self.names.append(name)
+        return net_id
+
+
+def _pcbnew_constants() -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """Get item type ids from pcbnew when available."""
+    try:
+        import pcbnew
+        return (
+            getattr(pcbnew, "PCB_VIA_T", None),
+            getattr(pcbnew, "PCB_ARC_T", None),
+            getattr(pcbnew, "PAD_ATTRIB_PTH", None)
+        )
+    except ImportError:
+        return (None, None, None)
+
+
+def _extract_layer_names(board: Any) -> Dict[int, str]:
+    names: Dict[int, str] = {}
+    try:
+        import pcbnew
+        layer_count = pcbnew.PCB_LAYER_ID_COUNT
+    except (ImportError, AttributeError):
+        layer_count = _as_int(_safe_call(board.GetCopperLayerCount), 2)
+    for layer_id in range(layer_count):
+        try:
+            if board.IsLayerEnabled(layer_id):
+                names[layer_id] = str(board.GetLayerName(layer_id))
+        except Exception:
+            break
+    return names
+
+
+def _extract_board_box(board: Any) -> Tuple[int, int, int, int]:
+    try:
+        box = board.GetBoardEdgesBoundingBox()
+        left = _as_int(_safe_call(box.GetLeft))
+        top = _as_int(_safe_call(box.GetTop))
+        return (left, top, left + _as_int(box.GetWidth()), top + _as_int(box.GetHeight()))
+    except Exception:
+        return (0, 0, 0, 0)
+
+
+def _extract_design_rules(board: Any) -> Dict[str, Any]:
+    try:
+        settings = board.GetDesignSettings()
+        return {
+            'min_track_width': settings.GetTrackWidth(),
+            'min_clearance': settings.GetMinClearance(),
+            'via_diameter': settings.GetViasDimensions(),
+            'via_drill': settings.GetViasDrill()
+        }
+    except Exception:
+        return {}
+
+
+def _board_items(board: Any, accessor: str) -> List[Any]:
+    """List the items returned by an optional board accessor."""
+    try:
+        return list(getattr(board, accessor)())
+    except (AttributeError, TypeError):
+        return []
+
+
+def _footprint_box(footprint: Any) -> Optional[Tuple[int, int, int, int]]:
+    """Bounding box (left, top, right, bottom) of a footprint without text."""
+    box = _safe_call(lambda: footprint.GetBoundingBox(False, False))
+    if box is None:
+        box = _safe_call(footprint.GetBoundingBox)
+    if box is None:
+        return None
+    edges = [_safe_call(getattr(box, name, None))
+             for name in ("GetLeft", "GetTop", "GetRight", "GetBottom")]
+    if not all(isinstance(edge, (int, float)) and not isinstance(edge, bool) for edge in edges):
+        return None
+    left, top, right, bottom = (int(edge) for edge in edges)
+    return left, top, right, bottom
+
+
+def _footprint_fpid(footprint: Any) -> str:
+    """Library id (``lib:name``) of a footprint, or "" if unavailable."""
+    fpid = _safe_call(footprint.GetFPID) if hasattr(footprint, "GetFPID") else None
+    name = _safe_call(getattr(fpid, "GetUniStringLibId", None)) if fpid is not None else None
+    return name if isinstance(name, str) else ""
+
+
+def _safe_call(getter: Any) -> Any:
+    try:
+        return getter()
+    except Exception:
+        return None
+
+
+def _as_int(value: Any, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _as_float(value: Any, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
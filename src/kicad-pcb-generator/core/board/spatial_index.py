@@ -0,0 +1,612 @@
+"""Spatial index for board geometry.
+
+Provides a uniform-grid index over tracks, vias, pads, footprints and zones,
+bucketed by copper layer, so proximity checks ("items within d mm of X",
+"segment pairs closer than d") no longer need to rescan the whole board for
+every item.
+"""
+import logging
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Pseudo layer used for items that are not bound to a single copper layer
+# (footprints, through-hole vias and pads).
+ALL_LAYERS = -1
+
+ITEM_TRACK = "track"
+ITEM_VIA = "via"
+ITEM_PAD = "pad"
+ITEM_FOOTPRINT = "footprint"
+ITEM_ZONE = "zone"
+
+_NM_PER_MM = 1e6
+
+
+@dataclass
+class SpatialItem:
+    """Geometry of a single indexed board item.
+
+    Coordinates are in mm. Point-like items (vias, pads, footprints) have
+    identical start and end points. ``row`` is the item's row in the
+    ``BoardSnapshot`` arrays it was built from, or -1.
+    """
+    index: int
+    kind: str
+    layer: int
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+    half_width: float = 0.0
+    net: str = ""
+    obj: Any = None
+    row: int = -1
+
+    @property
+    def is_segment(self) -> bool:
+        """Whether the item has a non-zero length."""
+        return self.x1 != self.x2 or self.y1 != self.y2
+
+    @property
+    def bbox(self) -> Tuple[float, float, float, float]:
+        """Bounding box (min_x, min_y, max_x, max_y) including half width."""
+        hw = self.half_width
+        return (
+            min(self.x1, self.x2) - hw,
+            min(self.y1, self.y2) - hw,
+            max(self.x1, self.x2) + hw,
+            max(self.y1, self.y2) + hw,
+        )
+
+
+def point_segment_distance(px: float, py: float,
+                           x1: float, y1: float, x2: float, y2: float) -> float:
+    """Distance from a point to a line segment.
+
+    Args:
+        px, py: Point
+        x1, y1, x2, y2: Segment endpoints
+
+    Returns:
+        Euclidean distance
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    len_sq = dx * dx + dy * dy
+    if len_sq == 0.0:
+        return math.hypot(px - x1, py - y1)
+    t = ((px - x1) * dx + (py - y1) * dy) / len_sq
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    return math.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
+
+
+def _orientation(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def segments_intersect(x1: float, y1: float, x2: float, y2: float,
+                       x3: float, y3: float, x4: float, y4: float) -> bool:
+    """Check whether two segments properly cross or touch."""
+    d1 = _orientation(x3, y3, x4, y4, x1, y1)
+    d2 = _orientation(x3, y3, x4, y4, x2, y2)
+    d3 = _orientation(x1, y1, x2, y2, x3, y3)
+    d4 = _orientation(x1, y1, x2, y2, x4, y4)
+    if ((d1 > 0 > d2) or (d1 < 0 < d2)) and ((d3 > 0 > d4) or (d3 < 0 < d4)):
+        return True
+    return False
+
+
+def segment_distance(x1: float, y1: float, x2: float, y2: float,
+                     x3: float, y3: float, x4: float, y4: float) -> float:
+    """Minimum distance between two line segments.
+
+    Returns:
+        0.0 if the segments cross, otherwise the smallest endpoint-to-segment
+        distance
+    """
+    if segments_intersect(x1, y1, x2, y2, x3, y3, x4, y4):
+        return 0.0
+    return min(
+        point_segment_distance(x1, y1, x3, y3, x4, y4),
+        point_segment_distance(x2, y2, x3, y3, x4, y4),
+        point_segment_distance(x3, y3, x1, y1, x2, y2),
+        point_segment_distance(x4, y4, x1, y1, x2, y2),
+    )
+
+
+def item_distance(a: SpatialItem, b: SpatialItem) -> float:
+    """Centreline distance between two indexed items in mm."""
+    return segment_distance(a.x1, a.y1, a.x2, a.y2, b.x1, b.y1, b.x2, b.y2)
+
+
+class BoardSpatialIndex:
+    """Uniform-grid spatial index over board items, bucketed by layer.
+
+    Items are inserted into every grid cell their bounding box overlaps.
+    Queries only visit the cells covered by the query region, so a
+    proximity lookup costs O(k) in the number of nearby items instead of
+    O(n) in the number of board items.
+
+    Distances are measured between item centrelines in mm; callers that need
+    copper edge-to-edge clearance subtract ``half_width`` of both items.
+    """
+
+    def __init__(self, cell_size: float = 2.5):
+        """Initialize an empty index.
+
+        Args:
+            cell_size: Grid cell edge length in mm
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self.items: List[SpatialItem] = []
+        self._by_object: Dict[int, int] = {}
+        self._max_half_width: Dict[str, float] = {}
+        self._bounds: Optional[List[float]] = None
+        # layer -> (cell_x, cell_y) -> item indices
+        self._grid: Dict[int, Dict[Tuple[int, int], List[int]]] = defaultdict(lambda: defaultdict(list))
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_board(cls, board: Any, cell_size: float = 2.5,
+                   kinds: Optional[Iterable[str]] = None) -> "BoardSpatialIndex":
+        """Build an index from a KiCad board.
+
+        Args:
+            board: KiCad board object
+            cell_size: Grid cell edge length in mm
+            kinds: Item kinds to index; defaults to all kinds
+
+        Returns:
+            Populated index
+        """
+        wanted = set(kinds) if kinds is not None else {
+            ITEM_TRACK, ITEM_VIA, ITEM_PAD, ITEM_FOOTPRINT, ITEM_ZONE
+        }
+        index = cls(cell_size)
+
+        if wanted & {ITEM_TRACK, ITEM_VIA}:
+            for track in board.GetTracks():
+                if _is_via(track):
+                    if ITEM_VIA in wanted:
+                        index.add_via(track)
+                elif ITEM_TRACK in wanted:
+                    index.add_track(track)
+
+        if wanted & {ITEM_FOOTPRINT, ITEM_PAD}:
+            for footprint in board.GetFootprints():
+                if ITEM_FOOTPRINT in wanted:
+                    index.add_footprint(footprint)
+                if ITEM_PAD in wanted:
+                    for pad in footprint.Pads():
+                        index.add_pad(pad)
+
+        if ITEM_ZONE in wanted:
+            for zone in board.Zones():
+                index.add_zone(zone)
+
+        return index
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Any, cell_size: float = 2.5,
+                      kinds: Optional[Iterable[str]] = None) -> "BoardSpatialIndex":
+        """Build an index from a ``BoardSnapshot`` without touching pcbnew.
+
+        Args:
+            snapshot: Board snapshot
+            cell_size: Grid cell edge length in mm
+            kinds: Item kinds to index; defaults to all kinds
+
+        Returns:
+            Populated index
+        """
+        wanted = set(kinds) if kinds is not None else {
+            ITEM_TRACK, ITEM_VIA, ITEM_PAD, ITEM_FOOTPRINT, ITEM_ZONE
+        }
+        index = cls(cell_size)
+        names = snapshot.net_names
+
+        if ITEM_TRACK in wanted:
+            t = snapshot.tracks
+            for i in range(len(t)):
+                index.add(ITEM_TRACK, int(t.layer[i]),
+                          t.start_x[i] / _NM_PER_MM, t.start_y[i] / _NM_PER_MM,
+                          t.end_x[i] / _NM_PER_MM, t.end_y[i] / _NM_PER_MM,
+                          half_width=t.width[i] / _NM_PER_MM / 2.0,
+                          net=names[t.net[i]], obj=_row_object(t, i), row=i)
+
+        if ITEM_VIA in wanted:
+            v = snapshot.vias
+            for i in range(len(v)):
+                x, y = v.x[i] / _NM_PER_MM, v.y[i] / _NM_PER_MM
+                index.add(ITEM_VIA, ALL_LAYERS, x, y, x, y,
+                          half_width=v.width[i] / _NM_PER_MM / 2.0,
+                          net=names[v.net[i]], obj=_row_object(v, i), row=i)
+
+        if ITEM_PAD in wanted:
+            p = snapshot.pads
+            for i in range(len(p)):
+                x, y = p.x[i] / _NM_PER_MM, p.y[i] / _NM_PER_MM
+                radius = math.hypot(float(p.size_x[i]), float(p.size_y[i])) / _NM_PER_MM / 2.0
+                index.add(ITEM_PAD, ALL_LAYERS, x, y, x, y, half_width=radius,
+                          net=names[p.net[i]], obj=_row_object(p, i), row=i)
+
+        if ITEM_FOOTPRINT in wanted:
+            f = snapshot.footprints
+            for i in range(len(f)):
+                x, y = f.x[i] / _NM_PER_MM, f.y[i] / _NM_PER_MM
+                radius = _anchor_radius(
+                    float(f.x[i]), float(f.y[i]), float(f.left[i]), float(f.top[i]),
+                    float(f.right[i]), float(f.bottom[i])
+                ) / _NM_PER_MM
+                index.add(ITEM_FOOTPRINT, ALL_LAYERS, x, y, x, y, half_width=radius,
+                          obj=_row_object(f, i), row=i)
+
+        if ITEM_ZONE in wanted:
+            z = snapshot.zones
+            for i in range(len(z)):
+                left, top = z.left[i] / _NM_PER_MM, z.top[i] / _NM_PER_MM
+                right, bottom = z.right[i] / _NM_PER_MM, z.bottom[i] / _NM_PER_MM
+                cx, cy = (left + right) / 2.0, (top + bottom) / 2.0
+                index.add(ITEM_ZONE, int(z.layer[i]), cx, cy, cx, cy,
+                          half_width=math.hypot(right - left, bottom - top) / 2.0,
+                          net=names[z.net[i]], obj=_row_object(z, i), row=i)
+
+        return index
+
+    def add_track(self, track: Any) -> Optional[SpatialItem]:
+        """Index a track segment."""
+        try:
+            start = track.GetStart()
+            end = track.GetEnd()
+            return self.add(
+                ITEM_TRACK, track.GetLayer(),
+                start.x / _NM_PER_MM, start.y / _NM_PER_MM,
+                end.x / _NM_PER_MM, end.y / _NM_PER_MM,
+                half_width=_safe_float(track.GetWidth) / _NM_PER_MM / 2.0,
+                net=_safe_net(track), obj=track
+            )
+        except (AttributeError, TypeError) as e:
+            logger.debug(f"Skipping track in spatial index: {e}")
+            return None
+
+    def add_via(self, via: Any) -> Optional[SpatialItem]:
+        """Index a via. Vias span all copper layers."""
+        try:
+            pos = via.GetPosition()
+            x, y = pos.x / _NM_PER_MM, pos.y / _NM_PER_MM
+            return self.add(
+                ITEM_VIA, ALL_LAYERS, x, y, x, y,
+                half_width=_safe_float(via.GetWidth) / _NM_PER_MM / 2.0,
+                net=_safe_net(via), obj=via
+            )
+        except (AttributeError, TypeError) as e:
+            logger.debug(f"Skipping via in spatial index: {e}")
+            return None
+
+    def add_pad(self, pad: Any) -> Optional[SpatialItem]:
+        """Index a pad as a point with its circumscribed radius."""
+        try:
+            pos = pad.GetPosition()
+            x, y = pos.x / _NM_PER_MM, pos.y / _NM_PER_MM
+            radius = 0.0
+            try:
+                size = pad.GetSize()
+                radius = math.hypot(float(size.x), float(size.y)) / _NM_PER_MM / 2.0
+            except (AttributeError, TypeError, ValueError):
+                pass
+            return self.add(ITEM_PAD, ALL_LAYERS, x, y, x, y,
+                            half_width=radius, net=_safe_net(pad), obj=pad)
+        except (AttributeError, TypeError) as e:
+            logger.debug(f"Skipping pad in spatial index: {e}")
+            return None
+
+    def add_footprint(self, footprint: Any) -> Optional[SpatialItem]:
+        """Index a footprint as its anchor point with a bounding radius.
+
+        The radius is the distance from the anchor to the farthest corner of
+        the bounding box, so it also covers footprints anchored off-centre
+        (e.g. connectors anchored at pin 1). Footprints are indexed on
+        ``ALL_LAYERS`` because placement checks compare components regardless
+        of side.
+        """
+        try:
+            pos = footprint.GetPosition()
+            x, y = pos.x / _NM_PER_MM, pos.y / _NM_PER_MM
+            radius = 0.0
+            try:
+                bbox = footprint.GetBoundingBox()
+                radius = _anchor_radius(
+                    float(pos.x), float(pos.y), float(bbox.GetLeft()), float(bbox.GetTop()),
+                    float(bbox.GetRight()), float(bbox.GetBottom())
+                ) / _NM_PER_MM
+            except (AttributeError, TypeError, ValueError):
+                pass
+            return self.add(ITEM_FOOTPRINT, ALL_LAYERS, x, y, x, y,
+                            half_width=radius, obj=footprint)
+        except (AttributeError, TypeError) as e:
+            logger.debug(f"Skipping footprint in spatial index: {e}")
+            return None
+
+    def add_zone(self, zone: Any) -> Optional[SpatialItem]:
+        """Index a zone by the diagonal of its bounding box."""
+        try:
+            bbox = zone.GetBoundingBox()
+            left, top = bbox.GetLeft() / _NM_PER_MM, bbox.GetTop() / _NM_PER_MM
+            right, bottom = bbox.GetRight() / _NM_PER_MM, bbox.GetBottom() / _NM_PER_MM
+            half_diag = math.hypot(right - left, bottom - top) / 2.0
+            cx, cy = (left + right) / 2.0, (top + bottom) / 2.0
+            return self.add(ITEM_ZONE, zone.GetLayer(), cx, cy, cx, cy,
+                            half_width=half_diag, net=_safe_net(zone), obj=zone)
+        except (AttributeError, TypeError) as e:
+            logger.debug(f"Skipping zone in spatial index: {e}")
+            return None
+
+    def add(self, kind: str, layer: int, x1: float, y1: float, x2: float, y2: float,
+            half_width: float = 0.0, net: str = "", obj: Any = None,
+            row: int = -1) -> SpatialItem:
+        """Insert raw geometry into the index.
+
+        Args:
+            kind: Item kind (``track``, ``via``, ``pad``, ``footprint``, ``zone``)
+            layer: Layer id, or ``ALL_LAYERS``
+            x1, y1, x2, y2: Endpoints in mm
+            half_width: Half of the item width in mm
+            net: Net name
+            obj: Original board object
+            row: Row in the source snapshot arrays
+
+        Returns:
+            The indexed item
+        """
+        item = SpatialItem(
+            index=len(self.items), kind=kind, layer=int(layer),
+            x1=float(x1), y1=float(y1), x2=float(x2), y2=float(y2),
+            half_width=float(half_width), net=net, obj=obj, row=int(row)
+        )
+        self.items.append(item)
+        if obj is not None:
+            self._by_object[id(obj)] = item.index
+
+        if item.half_width > self._max_half_width.get(kind, 0.0):
+            self._max_half_width[kind] = item.half_width
+
+        bbox = item.bbox
+        if self._bounds is None:
+            self._bounds = list(bbox)
+        else:
+            self._bounds[0] = min(self._bounds[0], bbox[0])
+            self._bounds[1] = min(self._bounds[1], bbox[1])
+            self._bounds[2] = max(self._bounds[2], bbox[2])
+            self._bounds[3] = max(self._bounds[3], bbox[3])
+
+        buckets = self._grid[item.layer]
+        for cell in self._cells_for_box(*bbox):
+            buckets[cell].append(item.index)
+        return item
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def get_item(self, obj: Any) -> Optional[SpatialItem]:
+        """Return the indexed geometry for a board object, if indexed.
+
+        Lookup is by object identity, so ``obj`` must be the same wrapper
+        instance that was added.
+        """
+        idx = self._by_object.get(id(obj))
+        return self.items[idx] if idx is not None else None
+
+    def query_segment(self, x1: float, y1: float, x2: float, y2: float, distance: float,
+                      layer: Optional[int] = None,
+                      kinds: Optional[Sequence[str]] = None) -> List[Tuple[SpatialItem, float]]:
+        """Find items whose centreline lies within ``distance`` of a segment.
+
+        Args:
+            x1, y1, x2, y2: Query segment in mm (use equal endpoints for a point)
+            distance: Search radius in mm
+            layer: Restrict to one layer (items on ``ALL_LAYERS`` always match);
+                None searches every layer
+            kinds: Restrict to these item kinds
+
+        Returns:
+            List of (item, distance) sorted by distance
+        """
+        found: List[Tuple[SpatialItem, float]] = []
+        box = (min(x1, x2) - distance, min(y1, y2) - distance,
+               max(x1, x2) + distance, max(y1, y2) + distance)
+        for idx in self._candidates(box, layer):
+            item = self.items[idx]
+            if kinds is not None and item.kind not in kinds:
+                continue
+            d = segment_distance(x1, y1, x2, y2, item.x1, item.y1, item.x2, item.y2)
+            if d <= distance:
+                found.append((item, d))
+        found.sort(key=lambda pair: pair[1])
+        return found
+
+    def query_point(self, x: float, y: float, distance: float,
+                    layer: Optional[int] = None,
+                    kinds: Optional[Sequence[str]] = None) -> List[Tuple[SpatialItem, float]]:
+        """Find items whose centreline lies within ``distance`` of a point."""
+        return self.query_segment(x, y, x, y, distance, layer=layer, kinds=kinds)
+
+    def query_item(self, obj: Any, distance: float,
+                   kinds: Optional[Sequence[str]] = None,
+                   same_layer: bool = True) -> List[Tuple[SpatialItem, float]]:
+        """Find items near an already indexed board object.
+
+        Args:
+            obj: Board object that was added to the index
+            distance: Search radius in mm
+            kinds: Restrict to these item kinds
+            same_layer: Only return items sharing the object's layer
+
+        Returns:
+            List of (item, distance) excluding the object itself
+        """
+        item = self.get_item(obj)
+        if item is None:
+            return []
+        layer = item.layer if same_layer and item.layer != ALL_LAYERS else None
+        return [
+            (other, d) for other, d in self.query_segment(
+                item.x1, item.y1, item.x2, item.y2, distance, layer=layer, kinds=kinds
+            )
+            if other.index != item.index
+        ]
+
+    def nearest(self, x: float, y: float, kinds: Optional[Sequence[str]] = None,
+                layer: Optional[int] = None,
+                exclude: Optional[Any] = None) -> Optional[Tuple[SpatialItem, float]]:
+        """Find the item closest to a point.
+
+        The search radius starts at one cell and doubles until a match is
+        found or the radius covers every indexed item.
+
+        Args:
+            x, y: Point in mm
+            kinds: Restrict to these item kinds
+            layer: Restrict to one layer; None searches every layer
+            exclude: Board object to skip (typically the query item itself)
+
+        Returns:
+            (item, distance) or None if no item matches
+        """
+        if self._bounds is None:
+            return None
+        min_x, min_y, max_x, max_y = self._bounds
+        limit = math.hypot(max(abs(x - min_x), abs(x - max_x)),
+                           max(abs(y - min_y), abs(y - max_y)))
+        radius = self.cell_size
+        while True:
+            for item, d in self.query_point(x, y, radius, layer=layer, kinds=kinds):
+                if exclude is None or item.obj != exclude:
+                    return item, d
+            if radius > limit:
+                return None
+            radius *= 2.0
+
+    def max_half_width(self, kind: str) -> float:
+        """Largest half width (or bounding radius) of any item of a kind."""
+        return self._max_half_width.get(kind, 0.0)
+
+    def close_pairs(self, distance: float, kinds: Sequence[str] = (ITEM_TRACK,),
+                    layer: Optional[int] = None,
+                    same_layer: bool = True) -> Iterator[Tuple[SpatialItem, SpatialItem, float]]:
+        """Yield every unordered pair of items closer than ``distance``.
+
+        By default pairs are only formed between items on the same layer (or
+        where one item spans ``ALL_LAYERS``). Each pair is reported once,
+        ordered by insertion index.
+
+        Args:
+            distance: Maximum centreline distance in mm
+            kinds: Item kinds to pair up
+            layer: Restrict to one layer; None pairs on every layer
+            same_layer: Only pair items that share a layer
+
+        Yields:
+            (item_a, item_b, distance)
+        """
+        for item in self.items:
+            if item.kind not in kinds:
+                continue
+            if layer is not None and item.layer not in (layer, ALL_LAYERS):
+                continue
+            min_x, min_y, max_x, max_y = item.bbox
+            box = (min_x - distance, min_y - distance, max_x + distance, max_y + distance)
+            search_layer = item.layer if same_layer and item.layer != ALL_LAYERS else None
+            seen: Set[int] = set()
+            for idx in self._candidates(box, search_layer):
+                if idx <= item.index or idx in seen:
+                    continue
+                seen.add(idx)
+                other = self.items[idx]
+                if other.kind not in kinds:
+                    continue
+                d = item_distance(item, other)
+                if d < distance:
+                    yield item, other, d
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size)))
+
+    def _cells_for_box(self, min_x: float, min_y: float,
+                       max_x: float, max_y: float) -> Iterator[Tuple[int, int]]:
+        cx0, cy0 = self._cell(min_x, min_y)
+        cx1, cy1 = self._cell(max_x, max_y)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                yield (cx, cy)
+
+    def _candidates(self, box: Tuple[float, float, float, float],
+                    layer: Optional[int]) -> Iterator[int]:
+        """Yield candidate item indices (deduplicated) overlapping a box."""
+        if layer is None:
+            layers = list(self._grid.keys())
+        else:
+            layers = [layer, ALL_LAYERS] if layer != ALL_LAYERS else [ALL_LAYERS]
+
+        seen: Set[int] = set()
+        cells = list(self._cells_for_box(*box))
+        for lyr in layers:
+            buckets = self._grid.get(lyr)
+            if not buckets:
+                continue
+            for cell in cells:
+                for idx in buckets.get(cell, ()):
+                    if idx not in seen:
+                        seen.add(idx)
+                        yield idx
+
+
+def _is_via(track: Any) -> bool:
+    """Check whether a track-list item is a via."""
+    try:
+        import pcbnew
+        return track.Type() == pcbnew.PCB_VIA_T
+    except Exception:
+        return False
+
+
+def _row_object(arrays: Any, row: int) -> Any:
+    """Board object kept by a snapshot for a row, if any."""
+    objects = getattr(arrays, "objects", None)
+    return objects[row] if objects else None
+
+
+def _anchor_radius(x: float, y: float, left: float, top: float, right: float, bottom: float) -> float:
+    """Distance from an anchor to the farthest corner of a bounding box."""
+    return math.hypot(max(abs(x - left), abs(right - x)), max(abs(y - top), abs(bottom - y)))
+
+
+def _safe_float(getter: Any) -> float:
+    try:
+        return float(getter())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _safe_net(item: Any) -> str:
+    try:
+        name = item.GetNetname()
+        return name if isinstance(name, str) else ""
+    except AttributeError:
+        return ""
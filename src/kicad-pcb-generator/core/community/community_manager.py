@@ -88,6 +88,7 @@ class CommunityManager(BaseManager[ForumPost]):
         """Load community data from storage."""
         try:
             # Load forum posts using BaseManager
+            posts = []
             for post_file in self.forums_path.glob("*.json"):
                 with open(post_file, "r") as f:
                     data = json.load(f)
@@ -104,8 +105,9 @@ class CommunityManager(BaseManager[ForumPost]):
                         data['replies'] = replies
                     
                     post = ForumPost(**data)
-                    # Use BaseManager's create method
-                    self.create(post.id, post)
+                    posts.append((post.id, post))
+            # Use BaseManager's bulk create: one cache invalidation for all posts
+            self.bulk_create(posts)
             
             # Load shared projects
             for project_file in self.projects_path.glob("*.json"):
@@ -203,6 +203,7 @@ class ComponentManager(BaseManager[Union[ComponentData, "AudioComponentData"]]):
         self.base_path.mkdir(parents=True, exist_ok=True)
         
         # Load components
+        self._loading = False
         self._load_components()
     
     def _load_components(self) -> None:
@@ -212,15 +213,23 @@ class ComponentManager(BaseManager[Union[ComponentData, "AudioComponentData"]]):
             if components_file.exists():
                 with open(components_file, "r") as f:
                     data = json.load(f)
-                    for component_data in data:
-                        if "audio_type" in component_data:
-                            # Import locally to avoid circular imports
-                            from .audio_components import AudioComponentData
-                            component = AudioComponentData.from_dict(component_data)
-                        else:
-                            component = ComponentData.from_dict(component_data)
-                        # Use BaseManager's create method
-                        self.create(component.id, component)
+                components = []
+                for component_data in data:
+                    if "audio_type" in component_data:
+                        # Import locally to avoid circular imports
+                        from .audio_components import AudioComponentData
+                        component = AudioComponentData.from_dict(component_data)
+                    else:
+                        component = ComponentData.from_dict(component_data)
+                    components.append((component.id, component))
+                # One validation pass for the whole file; it is already on disk
+                self._loading = True
+                try:
+                    result = self.bulk_create(components)
+                finally:
+                    self._loading = False
+                for error in result.errors:
+                    self.logger.warning(f"Skipped stored component: {error}")
         except Exception as e:
             self.logger.error(f"Error loading components: {e}")
     
@@ -346,6 +355,7 @@ class ComponentManager(BaseManager[Union[ComponentData, "AudioComponentData"]]):
     
     def _clear_cache(self) -> None:
         """Clear cache after data changes."""
-        # Clear the cache and save to disk
+        # Clear the cache and save to disk, unless loading from it
         super()._clear_cache()
-        self._save_components() 
\ No newline at end of file
+        if not self._loading:
+            self._save_components() 
\ No newline at end of file
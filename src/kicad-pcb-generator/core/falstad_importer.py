@@ -16,7 +16,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from .components.footprint_registry import FootprintRegistry
-from .netlist.parser import FootprintData, PadConnection, NetData, Netlist
+from .netlist.parser import FootprintData, PadConnection, Netlist
 
 logger = logging.getLogger(__name__)
 
@@ -198,7 +198,6 @@ class FalstadImporter:
     def to_netlist(self, data: Dict[str, Any], *, strict: bool = True) -> Netlist:
         """Convert Falstad JSON dict to internal Netlist representation."""
         footprints: List[FootprintData] = []
-        nets: Dict[str, NetData] = {}
 
         for idx, elem in enumerate(data.get("elements", [])):
             etype = elem.get("type")
@@ -215,14 +214,9 @@ class FalstadImporter:
             footprint_data = self._create_footprint_data(elem, idx)
             if footprint_data:
                 footprints.append(footprint_data)
-                
-                # Add pad connections to nets
-                for pc in footprint_data.pad_connections:
-                    nets.setdefault(pc.net_name, NetData(name=pc.net_name, connected_pads=[])).connected_pads.append(
-                        f"{footprint_data.ref}-{pc.pad_name}"
-                    )
 
-        return Netlist(footprints=footprints, nets=list(nets.values()))
+        # Nets follow from the pad connections via the netlist index
+        return Netlist.from_footprints(footprints)
 
     def _is_component_supported(self, comp_type: str) -> bool:
         """Check if component type is supported."""
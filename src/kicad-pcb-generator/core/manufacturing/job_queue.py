@@ -0,0 +1,338 @@
+"""
+Persistent batch job queue for manufacturing outputs.
+
+Fabrication packages for many product variants are regenerated in bulk.
+``JobQueue`` runs jobs on a bounded worker pool so that the subprocess based
+steps (KiKit, gerber2blend) of several jobs overlap, reports per-job status
+and progress through a callback, and persists its state as JSON. Completed
+jobs are remembered by fingerprint (input board contents plus configuration)
+so that unchanged outputs are skipped on the next run.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Job states, in the order a job moves through them
+JOB_PENDING = "pending"
+JOB_QUEUED = "queued"
+JOB_PROCESSING = "processing"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_SKIPPED = "skipped"
+
+ACTIVE_STATES = (JOB_QUEUED, JOB_PROCESSING)
+FINISHED_STATES = (JOB_COMPLETED, JOB_FAILED, JOB_SKIPPED)
+
+
+@dataclass
+class JobRecord:
+    """State of one queued job."""
+    job_id: str
+    kind: str
+    fingerprint: Optional[str] = None
+    status: str = JOB_PENDING
+    progress: float = 0.0
+    attempts: int = 0
+    submitted_at: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    duration: float = 0.0
+    error_message: Optional[str] = None
+    result: Dict[str, Any] = field(default_factory=dict)
+
+
+def file_fingerprint(path: str, *extra: Any) -> str:
+    """Fingerprint a file's contents together with extra JSON-compatible data.
+
+    Args:
+        path: File to hash
+        *extra: Additional data (configuration, output paths, ...)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    digest.update(json.dumps(extra, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def config_fingerprint_data(config: Any) -> Dict[str, Any]:
+    """Collect the settings of a configuration object for fingerprinting.
+
+    Args:
+        config: ``BaseConfig`` subclass or plain settings object
+
+    Returns:
+        Dictionary of settings
+    """
+    data: Dict[str, Any] = {}
+    prepare = getattr(config, "_prepare_config_data", None)
+    if callable(prepare):
+        try:
+            data.update(prepare())
+        except Exception as e:
+            logger.warning(f"Error reading configuration data for fingerprint: {str(e)}")
+    for key, value in vars(config).items():
+        if not key.startswith("_") and isinstance(value, (str, int, float, bool, type(None))):
+            data[key] = value
+    return data
+
+
+class JobQueue:
+    """Bounded worker pool with persistent job state and fingerprint skipping."""
+
+    def __init__(self,
+                 state_file: Optional[str] = None,
+                 max_workers: Optional[int] = None,
+                 status_callback: Optional[Callable[[JobRecord], None]] = None):
+        """Initialize the queue.
+
+        Args:
+            state_file: JSON file holding job state between runs; None keeps
+                state in memory only
+            max_workers: Maximum number of jobs running at once
+            status_callback: Called with the job record on every status or
+                progress change
+        """
+        self.state_file = state_file
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.status_callback = status_callback
+        self._jobs: Dict[str, JobRecord] = {}
+        self._completed: Dict[str, Dict[str, Any]] = {}
+        self._futures: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.RLock()
+        self._load_state()
+
+    def submit(self,
+               job_id: str,
+               kind: str,
+               func: Callable[[Callable[[float], None]], Dict[str, Any]],
+               fingerprint: Optional[str] = None,
+               force: bool = False) -> Future:
+        """Queue a job.
+
+        Args:
+            job_id: Job identifier
+            kind: Job type, e.g. ``"output"`` or ``"panelization"``
+            func: Job body; receives a progress reporter taking a fraction in
+                [0, 1] and returns the job result. Raising marks the job failed.
+            fingerprint: Fingerprint of the job inputs; an unchanged
+                fingerprint with intact outputs skips the job
+            force: Run even if the fingerprint is unchanged
+
+        Returns:
+            Future resolving to the finished job record
+        """
+        with self._lock:
+            running = self._futures.get(job_id)
+            if running is not None and not running.done():
+                return running
+
+            record = JobRecord(job_id=job_id, kind=kind, fingerprint=fingerprint,
+                               submitted_at=datetime.now().isoformat())
+            previous = self._jobs.get(job_id)
+            if previous is not None:
+                record.attempts = previous.attempts
+            self._jobs[job_id] = record
+
+            if not force and fingerprint and self.is_up_to_date(fingerprint):
+                record.status = JOB_SKIPPED
+                record.progress = 1.0
+                record.result = dict(self._completed[fingerprint].get("result", {}))
+                record.finished_at = record.submitted_at
+                future: Future = Future()
+                future.set_result(record)
+                self._futures[job_id] = future
+                logger.info(f"Skipping unchanged job {job_id}")
+            else:
+                record.status = JOB_QUEUED
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                        thread_name_prefix="manufacturing-job")
+                future = self._executor.submit(self._run, record, func)
+                self._futures[job_id] = future
+
+        self._notify(record)
+        self._save_state()
+        return future
+
+    def wait(self, job_ids: Optional[Iterable[str]] = None,
+             timeout: Optional[float] = None) -> Dict[str, JobRecord]:
+        """Wait for jobs to finish.
+
+        Args:
+            job_ids: Jobs to wait for; all submitted jobs if None
+            timeout: Maximum total time to wait in seconds
+
+        Returns:
+            Job records by ID
+        """
+        with self._lock:
+            ids = list(self._futures) if job_ids is None else list(job_ids)
+            futures = {job_id: self._futures.get(job_id) for job_id in ids}
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for job_id, future in futures.items():
+            if future is None:
+                continue
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                future.result(timeout=remaining)
+            except Exception as e:
+                logger.warning(f"Job {job_id} did not finish: {str(e)}")
+
+        with self._lock:
+            return {job_id: self._jobs[job_id] for job_id in ids if job_id in self._jobs}
+
+    def get_job(self, job_id: str) -> Optional[JobRecord]:
+        """Get the record of a job."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def get_jobs(self, status: Optional[str] = None) -> List[JobRecord]:
+        """Get job records, optionally filtered by status."""
+        with self._lock:
+            return [record for record in self._jobs.values()
+                    if status is None or record.status == status]
+
+    def interrupted_jobs(self) -> List[JobRecord]:
+        """Jobs that were queued or running when the previous process stopped."""
+        with self._lock:
+            return [record for record in self._jobs.values()
+                    if record.status == JOB_PENDING and record.attempts > 0]
+
+    def is_up_to_date(self, fingerprint: str) -> bool:
+        """Check whether a fingerprint completed before and its files still exist.
+
+        Args:
+            fingerprint: Job fingerprint
+
+        Returns:
+            True if the job can be skipped
+        """
+        with self._lock:
+            entry = self._completed.get(fingerprint)
+        if entry is None:
+            return False
+        files = [path for path in entry.get("result", {}).values() if isinstance(path, str)]
+        return all(Path(path).exists() for path in files)
+
+    def forget(self, fingerprint: Optional[str] = None) -> None:
+        """Forget completed fingerprints so the next run regenerates outputs.
+
+        Args:
+            fingerprint: Fingerprint to forget; all of them if None
+        """
+        with self._lock:
+            if fingerprint is None:
+                self._completed.clear()
+            else:
+                self._completed.pop(fingerprint, None)
+        self._save_state()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _run(self, record: JobRecord, func: Callable[[Callable[[float], None]], Dict[str, Any]]) -> JobRecord:
+        """Run a job body on a worker thread."""
+        start_time = time.perf_counter()
+        with self._lock:
+            record.status = JOB_PROCESSING
+            record.attempts += 1
+            record.started_at = datetime.now().isoformat()
+        self._notify(record)
+        self._save_state()
+
+        def report_progress(fraction: float) -> None:
+            record.progress = min(max(float(fraction), 0.0), 1.0)
+            self._notify(record)
+
+        try:
+            result = func(report_progress) or {}
+            with self._lock:
+                record.result = dict(result)
+                record.status = JOB_COMPLETED
+                record.progress = 1.0
+                record.error_message = None
+                if record.fingerprint:
+                    self._completed[record.fingerprint] = {
+                        "job_id": record.job_id,
+                        "result": record.result,
+                        "finished_at": datetime.now().isoformat()
+                    }
+        except Exception as e:
+            logger.error(f"Error running job {record.job_id}: {str(e)}")
+            with self._lock:
+                record.status = JOB_FAILED
+                record.error_message = str(e)
+        finally:
+            with self._lock:
+                record.duration = time.perf_counter() - start_time
+                record.finished_at = datetime.now().isoformat()
+
+        self._notify(record)
+        self._save_state()
+        return record
+
+    def _notify(self, record: JobRecord) -> None:
+        if self.status_callback is None:
+            return
+        try:
+            self.status_callback(record)
+        except Exception as e:
+            logger.warning(f"Error in job status callback for {record.job_id}: {str(e)}")
+
+    def _load_state(self) -> None:
+        """Restore job records and completed fingerprints from the state file."""
+        if not self.state_file or not Path(self.state_file).exists():
+            return
+        try:
+            with open(self.state_file, "r") as f:
+                state = json.load(f)
+            for job_id, data in state.get("jobs", {}).items():
+                record = JobRecord(**data)
+                if record.status in ACTIVE_STATES:
+                    # The previous process stopped before this job finished
+                    record.status = JOB_PENDING
+                    record.progress = 0.0
+                self._jobs[job_id] = record
+            self._completed = dict(state.get("completed", {}))
+        except Exception as e:
+            logger.error(f"Error loading job queue state from {self.state_file}: {str(e)}")
+
+    def _save_state(self) -> None:
+        """Write job records and completed fingerprints atomically."""
+        if not self.state_file:
+            return
+        with self._lock:
+            state = {
+                "jobs": {job_id: asdict(record) for job_id, record in self._jobs.items()},
+                "completed": self._completed
+            }
+            tmp_path = f"{self.state_file}.{os.getpid()}.tmp"
+            try:
+                Path(self.state_file).parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, "w") as f:
+                    json.dump(state, f, indent=2, default=str)
+                os.replace(tmp_path, self.state_file)
+            except Exception as e:
+                logger.error(f"Error saving job queue state to {self.state_file}: {str(e)}")
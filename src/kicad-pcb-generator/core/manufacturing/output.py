@@ -5,9 +5,12 @@ Handles manufacturing output generation and 3D visualization.
 
 import logging
 import subprocess
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Any, TYPE_CHECKING
 
 import pcbnew
 
@@ -15,6 +18,7 @@ from ..base.base_manager import BaseManager
 from ..base.base_config import BaseConfig
 from ..base.results.manager_result import ManagerResult
 from ..base.results.config_result import ConfigResult, ConfigStatus, ConfigSection
+from .job_queue import JobQueue, JobRecord, config_fingerprint_data, file_fingerprint
 
 if TYPE_CHECKING:
     from ..base.results.manager_result import ManagerResult
@@ -140,12 +144,12 @@ class OutputConfig(BaseConfig[OutputConfigItem]):
             "required": True
         })
         # Add validation rules for all 3D generation options
-        for field in ["generate_3d_step", "generate_3d_gltf", "generate_3d_obj", 
-                     "generate_3d_stl", "generate_3d_wrl", "generate_3d_x3d",
-                     "generate_3d_x3dv", "generate_3d_x3db", "generate_3d_x3dz",
-                     "generate_3d_x3dvz", "generate_3d_x3dbz", "generate_3d_x3dzip",
-                     "generate_3d_x3dvzip", "generate_3d_x3dbzip"]:
-            self.add_validation_rule(field, {
+        for flag in ["generate_3d_step", "generate_3d_gltf", "generate_3d_obj", 
+                    "generate_3d_stl", "generate_3d_wrl", "generate_3d_x3d",
+                    "generate_3d_x3dv", "generate_3d_x3db", "generate_3d_x3dz",
+                    "generate_3d_x3dvz", "generate_3d_x3dbz", "generate_3d_x3dzip",
+                    "generate_3d_x3dvzip", "generate_3d_x3dbzip"]:
+            self.add_validation_rule(flag, {
                 "type": "bool",
                 "required": True
             })
@@ -170,33 +174,35 @@ class OutputConfig(BaseConfig[OutputConfigItem]):
             ]
             
             # Add 3D generation fields
-            for field in ["generate_3d_step", "generate_3d_gltf", "generate_3d_obj", 
-                         "generate_3d_stl", "generate_3d_wrl", "generate_3d_x3d",
-                         "generate_3d_x3dv", "generate_3d_x3db", "generate_3d_x3dz",
-                         "generate_3d_x3dvz", "generate_3d_x3dbz", "generate_3d_x3dzip",
-                         "generate_3d_x3dvzip", "generate_3d_x3dbzip"]:
-                required_fields.append(field)
-            
-            for field in required_fields:
-                if field not in config_data:
-                    errors.append(f"Missing required field: {field}")
+            for flag in ["generate_3d_step", "generate_3d_gltf", "generate_3d_obj", 
+                        "generate_3d_stl", "generate_3d_wrl", "generate_3d_x3d",
+                        "generate_3d_x3dv", "generate_3d_x3db", "generate_3d_x3dz",
+                        "generate_3d_x3dvz", "generate_3d_x3dbz", "generate_3d_x3dzip",
+                        "generate_3d_x3dvzip", "generate_3d_x3dbzip"]:
+                required_fields.append(flag)
+            
+            for field_name in required_fields:
+                if field_name not in config_data:
+                    errors.append(f"Missing required field: {field_name}")
                     continue
                 
-                value = config_data[field]
-                rule = self._validation_rules.get(field, {})
+                value = config_data[field_name]
+                rule = self._validation_rules.get(field_name, {})
                 
                 # Type validation
                 if rule.get("type") == "str" and not isinstance(value, str):
-                    errors.append(f"Field {field} must be a string")
+                    errors.append(f"Field {field_name} must be a string")
                 elif rule.get("type") == "bool" and not isinstance(value, bool):
-                    errors.append(f"Field {field} must be a boolean")
+                    errors.append(f"Field {field_name} must be a boolean")
                 
                 # String validation
                 if rule.get("type") == "str":
                     if rule.get("min_length") and len(value) < rule["min_length"]:
-                        errors.append(f"Field {field} must have minimum length {rule['min_length']}")
+                        errors.append(
+                            f"Field {field_name} must have minimum length {rule['min_length']}"
+                        )
                     if rule.get("allowed_values") and value not in rule["allowed_values"]:
-                        errors.append(f"Field {field} must be one of {rule['allowed_values']}")
+                        errors.append(f"Field {field_name} must be one of {rule['allowed_values']}")
             
             if errors:
                 return ConfigResult(
@@ -371,12 +377,12 @@ class OutputConfig(BaseConfig[OutputConfigItem]):
             }
             
             # Add 3D generation options from kwargs or defaults
-            for field in ["generate_3d_step", "generate_3d_gltf", "generate_3d_obj", 
-                         "generate_3d_stl", "generate_3d_wrl", "generate_3d_x3d",
-                         "generate_3d_x3dv", "generate_3d_x3db", "generate_3d_x3dz",
-                         "generate_3d_x3dvz", "generate_3d_x3dbz", "generate_3d_x3dzip",
-                         "generate_3d_x3dvzip", "generate_3d_x3dbzip"]:
-                config_data[field] = kwargs.get(field, self.get_default(field))
+            for flag in ["generate_3d_step", "generate_3d_gltf", "generate_3d_obj", 
+                        "generate_3d_stl", "generate_3d_wrl", "generate_3d_x3d",
+                        "generate_3d_x3dv", "generate_3d_x3db", "generate_3d_x3dz",
+                        "generate_3d_x3dvz", "generate_3d_x3dbz", "generate_3d_x3dzip",
+                        "generate_3d_x3dvzip", "generate_3d_x3dbzip"]:
+                config_data[flag] = kwargs.get(flag, self.get_default(flag))
             
             # Validate configuration
             validation_result = self._validate_config(config_data)
@@ -402,10 +408,23 @@ class OutputItem:
     input_file: str
     config: OutputConfig
     output_files: Dict[str, str]
-    status: str = "pending"  # pending, processing, completed, failed
+    status: str = "pending"  # pending, queued, processing, completed, failed, skipped
+    progress: float = 0.0
     created_at: Optional[str] = None
     completed_at: Optional[str] = None
     error_message: Optional[str] = None
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+
+# 3D formats produced by gerber2blend: (config flag, output key, file extension)
+VISUALIZATION_FORMATS = [
+    ("generate_3d_step", "step", "step"),
+    ("generate_3d_gltf", "gltf", "gltf"),
+    ("generate_3d_obj", "obj", "obj"),
+    ("generate_3d_stl", "stl", "stl"),
+]
+
+# Outputs generated from the loaded board
+BOARD_STAGES = ("gerber", "drill", "pdf", "bom", "pick_and_place")
 
 class OutputManager(BaseManager[OutputItem]):
     """Manages manufacturing output generation and 3D visualization."""
@@ -413,6 +432,10 @@ class OutputManager(BaseManager[OutputItem]):
     def __init__(self, logger: Optional[logging.Logger] = None):
         """Initialize the output manager."""
         super().__init__(logger=logger or logging.getLogger(__name__))
+        self.last_stage_timings: Dict[str, float] = {}
+        self._job_queue: Optional[JobQueue] = None
+        # pcbnew is not thread-safe; batch jobs take turns on board stages
+        self._board_lock = threading.Lock()
         self._validate_gerber2blend_installation()
     
     def _validate_data(self, item: OutputItem) -> bool:
@@ -489,17 +512,42 @@ class OutputManager(BaseManager[OutputItem]):
     
     def generate_output(self, 
                        input_file: str, 
-                       config: OutputConfig) -> Dict[str, str]:
+                       config: OutputConfig,
+                       board: Optional[Any] = None,
+                       parallel: bool = True,
+                       max_workers: Optional[int] = None,
+                       stage_timings: Optional[Dict[str, float]] = None,
+                       progress_callback: Optional[Callable[[float], None]] = None) -> Dict[str, str]:
         """
         Generate manufacturing output files.
         
+        The board is loaded once and shared by every output that needs it.
+        pcbnew objects are not thread-safe, so the board-based outputs run
+        one after another; the 3D visualization only hands the input file to
+        gerber2blend and runs concurrently with them when ``parallel`` is set.
+        Per-stage wall times are recorded in ``stage_timings`` when given,
+        otherwise in ``last_stage_timings``; callers running jobs concurrently
+        pass their own dictionary so they do not overwrite each other's.
+        
         Args:
             input_file: Path to input KiCad board file
             config: Output configuration
+            board: Already loaded board; loaded from ``input_file`` if None
+            parallel: Run independent outputs concurrently
+            max_workers: Maximum number of concurrent gerber2blend processes
+            stage_timings: Dictionary to record stage timings in
+            progress_callback: Called with the completed fraction after each stage
             
         Returns:
             Dict[str, str]: Dictionary of generated output files
         """
+        start_time = time.perf_counter()
+        if stage_timings is None:
+            timings: Dict[str, float] = {}
+            self.last_stage_timings = timings
+        else:
+            timings = stage_timings
+        executor = None
         try:
             # Validate input file
             if not Path(input_file).exists():
@@ -508,44 +556,135 @@ class OutputManager(BaseManager[OutputItem]):
             
             output_files = {}
             
-            # Generate Gerber files
-            if config.generate_gerber_files:
-                gerber_files = self._generate_gerber_files(input_file, config)
-                output_files.update(gerber_files)
+            # Start the board-independent 3D visualization first so it
+            # overlaps with plotting
+            visualization_future = None
+            if config.generate_3d_visualization and parallel:
+                executor = ThreadPoolExecutor(max_workers=1)
+                visualization_future = executor.submit(
+                    self._timed_stage, timings, "3d_visualization",
+                    self._generate_3d_visualization, input_file, config, max_workers
+                )
             
-            # Generate drill files
+            board_stages = []
+            if config.generate_gerber_files:
+                board_stages.append(("gerber", self._generate_gerber_files))
             if config.generate_drill_files:
-                drill_files = self._generate_drill_files(input_file, config)
-                output_files.update(drill_files)
-            
-            # Generate 3D visualization
-            if config.generate_3d_visualization:
-                visualization_files = self._generate_3d_visualization(input_file, config)
-                output_files.update(visualization_files)
-            
-            # Generate PDF
+                board_stages.append(("drill", self._generate_drill_files))
             if config.generate_pdf:
-                pdf_file = self._generate_pdf(input_file, config)
-                if pdf_file:
-                    output_files["pdf"] = pdf_file
-            
-            # Generate BOM
+                board_stages.append(("pdf", self._generate_pdf))
             if config.generate_bom:
-                bom_file = self._generate_bom(input_file, config)
-                if bom_file:
-                    output_files["bom"] = bom_file
-            
-            # Generate pick and place
+                board_stages.append(("bom", self._generate_bom))
             if config.generate_pick_and_place:
-                pick_and_place_file = self._generate_pick_and_place(input_file, config)
-                if pick_and_place_file:
-                    output_files["pick_and_place"] = pick_and_place_file
+                board_stages.append(("pick_and_place", self._generate_pick_and_place))
+            
+            stage_count = len(board_stages) + (1 if config.generate_3d_visualization else 0)
+            completed_stages = 0
+            
+            def stage_done() -> None:
+                nonlocal completed_stages
+                completed_stages += 1
+                if progress_callback is not None:
+                    progress_callback(completed_stages / stage_count)
+            
+            with self._board_lock:
+                if board_stages and board is None:
+                    board = self._timed_stage(timings, "load_board", self._load_board, input_file)
+                    if board is None:
+                        board_stages = []
+                
+                for name, generator in board_stages:
+                    result = self._timed_stage(timings, name, generator, input_file, config, board)
+                    if isinstance(result, dict):
+                        output_files.update(result)
+                    elif result:
+                        output_files[name] = result
+                    stage_done()
+            
+            # Generate 3D visualization
+            if visualization_future is not None:
+                output_files.update(visualization_future.result())
+                stage_done()
+            elif config.generate_3d_visualization:
+                output_files.update(self._timed_stage(
+                    timings, "3d_visualization",
+                    self._generate_3d_visualization, input_file, config, 1
+                ))
+                stage_done()
             
             return output_files
             
         except Exception as e:
             self.logger.error(f"Error during output generation: {str(e)}")
             return {}
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            timings["total"] = time.perf_counter() - start_time
+            self._log_stage_timings(timings)
+    
+    def get_stage_report(self, timings: Optional[Dict[str, float]] = None) -> Dict[str, Dict[str, float]]:
+        """Compare stage times against loading the board once per stage.
+        
+        Args:
+            timings: Stage timings; defaults to ``last_stage_timings``
+            
+        Returns:
+            Per stage: measured seconds, estimated seconds with a separate
+            board load, and the resulting speedup
+        """
+        timings = self.last_stage_timings if timings is None else timings
+        load_time = timings.get("load_board", 0.0)
+        report = {}
+        for name, seconds in timings.items():
+            if name in ("load_board", "total"):
+                continue
+            # Every board stage used to include its own LoadBoard call
+            separate = seconds + load_time if name in BOARD_STAGES else seconds
+            report[name] = {
+                "seconds": seconds,
+                "separate_load_seconds": separate,
+                "speedup": separate / seconds if seconds > 0 else 1.0
+            }
+        
+        board_stage_count = sum(1 for name in timings if name in BOARD_STAGES)
+        total = timings.get("total", 0.0)
+        separate_total = total + load_time * max(board_stage_count - 1, 0)
+        report["total"] = {
+            "seconds": total,
+            "separate_load_seconds": separate_total,
+            "speedup": separate_total / total if total > 0 else 1.0
+        }
+        return report
+    
+    def _timed_stage(self, timings: Dict[str, float], name: str, func, *args) -> Any:
+        """Run one pipeline stage and record its wall time."""
+        stage_start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            timings[name] = time.perf_counter() - stage_start
+    
+    def _log_stage_timings(self, timings: Dict[str, float]) -> None:
+        """Log per-stage timings and the estimated gain of the shared board load."""
+        try:
+            report = self.get_stage_report(timings)
+            for name, entry in report.items():
+                self.logger.info(
+                    f"Output stage {name}: {entry['seconds']:.3f}s "
+                    f"(separate board loads: {entry['separate_load_seconds']:.3f}s, "
+                    f"speedup {entry['speedup']:.2f}x)"
+                )
+        except Exception as e:
+            self.logger.warning(f"Error reporting output stage timings: {str(e)}")
+    
+    def _load_board(self, input_file: str) -> Optional[Any]:
+        """Load a board for the output pipeline."""
+        try:
+            return pcbnew.LoadBoard(input_file)
+        except Exception as e:
+            self.logger.error(f"Error loading board {input_file}: {str(e)}")
+            return None
     
     def process_output_job(self, output_id: str) -> ManagerResult[OutputItem]:
         """Process an output generation job."""
@@ -566,7 +705,11 @@ class OutputManager(BaseManager[OutputItem]):
             self.update(output_item)
             
             # Generate output files
-            output_files = self.generate_output(output_item.input_file, output_item.config)
+            output_item.stage_timings = {}
+            output_files = self.generate_output(
+                output_item.input_file, output_item.config,
+                stage_timings=output_item.stage_timings
+            )
             
             # Update output item with results
             output_item.output_files = output_files
@@ -589,6 +732,120 @@ class OutputManager(BaseManager[OutputItem]):
                 data=None
             )
     
+    def get_job_queue(self, 
+                      state_file: Optional[str] = None, 
+                      max_workers: Optional[int] = None) -> JobQueue:
+        """Get the batch job queue, creating it on first use.
+        
+        Args:
+            state_file: JSON file that keeps job state and completed
+                fingerprints between runs
+            max_workers: Maximum number of output jobs running at once
+            
+        Returns:
+            JobQueue: The job queue
+        """
+        if self._job_queue is None:
+            self._job_queue = JobQueue(
+                state_file=state_file,
+                max_workers=max_workers,
+                status_callback=self._on_job_status
+            )
+        return self._job_queue
+    
+    def submit_output_jobs(self, 
+                           output_ids: Optional[Iterable[str]] = None, 
+                           force: bool = False) -> Dict[str, Any]:
+        """Queue output jobs on the worker pool.
+        
+        Jobs whose input board and configuration are unchanged since their
+        last successful run, and whose files still exist, are skipped.
+        
+        Args:
+            output_ids: Jobs to queue; all pending and failed jobs if None
+            force: Regenerate even if nothing changed
+            
+        Returns:
+            Dict[str, Future]: Futures resolving to job records, by job ID
+        """
+        queue = self.get_job_queue()
+        if output_ids is None:
+            output_ids = [item_id for item_id, item in self._items.items()
+                          if item.status in ("pending", "failed")]
+        
+        futures = {}
+        for output_id in output_ids:
+            item = self._items.get(output_id)
+            if item is None:
+                self.logger.error(f"Output job not found: {output_id}")
+                continue
+            try:
+                fingerprint = file_fingerprint(
+                    item.input_file, "output", config_fingerprint_data(item.config)
+                )
+            except OSError as e:
+                self.logger.error(f"Error reading input file for output job {output_id}: {str(e)}")
+                item.status = "failed"
+                item.error_message = str(e)
+                continue
+            
+            futures[output_id] = queue.submit(
+                output_id, "output", self._output_job_body(item), fingerprint=fingerprint, force=force
+            )
+        return futures
+    
+    def process_output_jobs(self, 
+                            output_ids: Optional[Iterable[str]] = None, 
+                            force: bool = False, 
+                            timeout: Optional[float] = None) -> Dict[str, OutputItem]:
+        """Run output jobs on the worker pool and wait for them.
+        
+        Args:
+            output_ids: Jobs to run; all pending and failed jobs if None
+            force: Regenerate even if nothing changed
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            Dict[str, OutputItem]: Processed output items by job ID
+        """
+        try:
+            futures = self.submit_output_jobs(output_ids, force=force)
+            self.get_job_queue().wait(futures.keys(), timeout=timeout)
+            return {output_id: self._items[output_id] for output_id in futures}
+        except Exception as e:
+            self.logger.error(f"Error processing output jobs: {str(e)}")
+            return {}
+    
+    def _output_job_body(self, item: OutputItem) -> Callable[[Callable[[float], None]], Dict[str, str]]:
+        """Create the worker function of an output job."""
+        def run(report_progress: Callable[[float], None]) -> Dict[str, str]:
+            item.stage_timings = {}
+            output_files = self.generate_output(
+                item.input_file, 
+                item.config, 
+                stage_timings=item.stage_timings, 
+                progress_callback=report_progress
+            )
+            if not output_files:
+                raise RuntimeError("No output files were generated")
+            return output_files
+        return run
+    
+    def _on_job_status(self, record: JobRecord) -> None:
+        """Mirror job queue state onto the output item."""
+        item = self._items.get(record.job_id)
+        if item is None:
+            return
+        item.status = record.status
+        item.progress = record.progress
+        if record.status in ("completed", "skipped"):
+            item.output_files = dict(record.result)
+            item.completed_at = record.finished_at
+            item.error_message = None
+        elif record.status == "failed":
+            item.completed_at = record.finished_at
+            item.error_message = record.error_message
+    
     def get_output_files(self, output_id: str) -> ManagerResult[Dict[str, str]]:
         """Get output files for a specific job."""
         try:
@@ -630,11 +887,13 @@ class OutputManager(BaseManager[OutputItem]):
     
     def _generate_gerber_files(self, 
                              input_file: str, 
-                             config: OutputConfig) -> Dict[str, str]:
+                             config: OutputConfig,
+                             board: Optional[Any] = None) -> Dict[str, str]:
         """Generate Gerber files."""
         try:
-            # Load board
-            board = pcbnew.LoadBoard(input_file)
+            # Load board unless the pipeline shares one
+            if board is None:
+                board = pcbnew.LoadBoard(input_file)
             
             # Set up plot controller
             plot_controller = pcbnew.PLOT_CONTROLLER(board)
@@ -692,11 +951,13 @@ class OutputManager(BaseManager[OutputItem]):
     
     def _generate_drill_files(self, 
                             input_file: str, 
-                            config: OutputConfig) -> Dict[str, str]:
+                            config: OutputConfig,
+                            board: Optional[Any] = None) -> Dict[str, str]:
         """Generate drill files."""
         try:
-            # Load board
-            board = pcbnew.LoadBoard(input_file)
+            # Load board unless the pipeline shares one
+            if board is None:
+                board = pcbnew.LoadBoard(input_file)
             
             # Set up drill writer
             drill_writer = pcbnew.EXCELLON_WRITER(board)
@@ -716,42 +977,42 @@ class OutputManager(BaseManager[OutputItem]):
     
     def _generate_3d_visualization(self, 
                                  input_file: str, 
-                                 config: OutputConfig) -> Dict[str, str]:
-        """Generate 3D visualization files."""
+                                 config: OutputConfig,
+                                 max_workers: Optional[int] = 1) -> Dict[str, str]:
+        """Generate 3D visualization files.
+        
+        Args:
+            input_file: Path to input KiCad board file
+            config: Output configuration
+            max_workers: Number of gerber2blend processes to run at once;
+                None uses one per requested format
+        """
         try:
             output_files = {}
             
-            # Generate STEP file
-            if config.generate_3d_step:
-                step_file = str(Path(config.output_dir) / "board.step")
-                cmd = ["gerber2blend", "--step", input_file, step_file]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0:
-                    output_files["step"] = step_file
+            requested = [
+                (key, str(Path(config.output_dir) / f"board.{extension}"))
+                for flag, key, extension in VISUALIZATION_FORMATS
+                if getattr(config, flag)
+            ]
+            if not requested:
+                return output_files
             
-            # Generate glTF file
-            if config.generate_3d_gltf:
-                gltf_file = str(Path(config.output_dir) / "board.gltf")
-                cmd = ["gerber2blend", "--gltf", input_file, gltf_file]
+            def convert(key: str, target: str) -> bool:
+                cmd = ["gerber2blend", f"--{key}", input_file, target]
                 result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0:
-                    output_files["gltf"] = gltf_file
+                return result.returncode == 0
             
-            # Generate OBJ file
-            if config.generate_3d_obj:
-                obj_file = str(Path(config.output_dir) / "board.obj")
-                cmd = ["gerber2blend", "--obj", input_file, obj_file]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0:
-                    output_files["obj"] = obj_file
+            workers = len(requested) if max_workers is None else max(1, min(max_workers, len(requested)))
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    succeeded = list(executor.map(lambda item: convert(*item), requested))
+            else:
+                succeeded = [convert(key, target) for key, target in requested]
             
-            # Generate STL file
-            if config.generate_3d_stl:
-                stl_file = str(Path(config.output_dir) / "board.stl")
-                cmd = ["gerber2blend", "--stl", input_file, stl_file]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0:
-                    output_files["stl"] = stl_file
+            for (key, target), ok in zip(requested, succeeded):
+                if ok:
+                    output_files[key] = target
             
             return output_files
             
@@ -761,11 +1022,13 @@ class OutputManager(BaseManager[OutputItem]):
     
     def _generate_pdf(self, 
                      input_file: str, 
-                     config: OutputConfig) -> Optional[str]:
+                     config: OutputConfig,
+                     board: Optional[Any] = None) -> Optional[str]:
         """Generate PDF file."""
         try:
-            # Load board
-            board = pcbnew.LoadBoard(input_file)
+            # Load board unless the pipeline shares one
+            if board is None:
+                board = pcbnew.LoadBoard(input_file)
             
             # Set up plot controller
             plot_controller = pcbnew.PLOT_CONTROLLER(board)
@@ -805,11 +1068,13 @@ class OutputManager(BaseManager[OutputItem]):
     
     def _generate_bom(self, 
                      input_file: str, 
-                     config: OutputConfig) -> Optional[str]:
+                     config: OutputConfig,
+                     board: Optional[Any] = None) -> Optional[str]:
         """Generate BOM file."""
         try:
-            # Load board
-            board = pcbnew.LoadBoard(input_file)
+            # Load board unless the pipeline shares one
+            if board is None:
+                board = pcbnew.LoadBoard(input_file)
             
             # Generate BOM
             bom_file = str(Path(config.output_dir) / "bom.csv")
@@ -835,11 +1100,13 @@ class OutputManager(BaseManager[OutputItem]):
     
     def _generate_pick_and_place(self, 
                                input_file: str, 
-                               config: OutputConfig) -> Optional[str]:
+                               config: OutputConfig,
+                               board: Optional[Any] = None) -> Optional[str]:
         """Generate pick and place file."""
         try:
-            # Load board
-            board = pcbnew.LoadBoard(input_file)
+            # Load board unless the pipeline shares one
+            if board is None:
+                board = pcbnew.LoadBoard(input_file)
             
             # Generate pick and place file
             pick_and_place_file = str(Path(config.output_dir) / "pick_and_place.csv")
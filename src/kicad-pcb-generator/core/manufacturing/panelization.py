@@ -7,7 +7,7 @@ import logging
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Any, TYPE_CHECKING
 
 import pcbnew
 
@@ -15,6 +15,7 @@ from ..base.base_manager import BaseManager
 from ..base.base_config import BaseConfig
 from ..base.results.manager_result import ManagerResult
 from ..base.results.config_result import ConfigResult, ConfigStatus, ConfigSection
+from .job_queue import JobQueue, JobRecord, config_fingerprint_data, file_fingerprint
 
 if TYPE_CHECKING:
     from ..base.results.manager_result import ManagerResult
@@ -419,7 +420,8 @@ class PanelizationItem:
     input_file: str
     output_file: str
     config: PanelizationConfig
-    status: str = "pending"  # pending, processing, completed, failed
+    status: str = "pending"  # pending, queued, processing, completed, failed, skipped
+    progress: float = 0.0
     created_at: Optional[str] = None
     completed_at: Optional[str] = None
     error_message: Optional[str] = None
@@ -431,6 +433,7 @@ class PanelizationManager(BaseManager[PanelizationItem]):
     def __init__(self, logger: Optional[logging.Logger] = None):
         """Initialize the panelization manager."""
         super().__init__(logger=logger or logging.getLogger(__name__))
+        self._job_queue: Optional[JobQueue] = None
         self._validate_kikit_installation()
     
     def _validate_data(self, item: PanelizationItem) -> bool:
@@ -650,6 +653,119 @@ class PanelizationManager(BaseManager[PanelizationItem]):
                 data=None
             )
     
+    def get_job_queue(self, 
+                      state_file: Optional[str] = None, 
+                      max_workers: Optional[int] = None) -> JobQueue:
+        """Get the batch job queue, creating it on first use.
+        
+        Args:
+            state_file: JSON file that keeps job state and completed
+                fingerprints between runs
+            max_workers: Maximum number of KiKit processes running at once
+            
+        Returns:
+            JobQueue: The job queue
+        """
+        if self._job_queue is None:
+            self._job_queue = JobQueue(
+                state_file=state_file,
+                max_workers=max_workers,
+                status_callback=self._on_job_status
+            )
+        return self._job_queue
+    
+    def submit_panelization_jobs(self, 
+                                 panelization_ids: Optional[Iterable[str]] = None, 
+                                 force: bool = False) -> Dict[str, Any]:
+        """Queue panelization jobs on the worker pool.
+        
+        Jobs whose input board, configuration and output file are unchanged
+        since their last successful run are skipped.
+        
+        Args:
+            panelization_ids: Jobs to queue; all pending and failed jobs if None
+            force: Panelize even if nothing changed
+            
+        Returns:
+            Dict[str, Future]: Futures resolving to job records, by job ID
+        """
+        queue = self.get_job_queue()
+        if panelization_ids is None:
+            panelization_ids = [item_id for item_id, item in self._items.items()
+                                if item.status in ("pending", "failed")]
+        
+        futures = {}
+        for panelization_id in panelization_ids:
+            item = self._items.get(panelization_id)
+            if item is None:
+                self.logger.error(f"Panelization job not found: {panelization_id}")
+                continue
+            try:
+                fingerprint = file_fingerprint(
+                    item.input_file, "panelization", item.output_file, config_fingerprint_data(item.config)
+                )
+            except OSError as e:
+                self.logger.error(f"Error reading input file for panelization job {panelization_id}: {str(e)}")
+                item.status = "failed"
+                item.error_message = str(e)
+                continue
+            
+            futures[panelization_id] = queue.submit(
+                panelization_id, "panelization", self._panelization_job_body(item),
+                fingerprint=fingerprint, force=force
+            )
+        return futures
+    
+    def process_panelization_jobs(self, 
+                                  panelization_ids: Optional[Iterable[str]] = None, 
+                                  force: bool = False, 
+                                  timeout: Optional[float] = None) -> Dict[str, PanelizationItem]:
+        """Run panelization jobs on the worker pool and wait for them.
+        
+        Args:
+            panelization_ids: Jobs to run; all pending and failed jobs if None
+            force: Panelize even if nothing changed
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            Dict[str, PanelizationItem]: Processed panelization items by job ID
+        """
+        try:
+            futures = self.submit_panelization_jobs(panelization_ids, force=force)
+            self.get_job_queue().wait(futures.keys(), timeout=timeout)
+            return {panelization_id: self._items[panelization_id] for panelization_id in futures}
+        except Exception as e:
+            self.logger.error(f"Error processing panelization jobs: {str(e)}")
+            return {}
+    
+    def _panelization_job_body(self, item: PanelizationItem) -> Callable[[Callable[[float], None]], Dict[str, str]]:
+        """Create the worker function of a panelization job."""
+        def run(report_progress: Callable[[float], None]) -> Dict[str, str]:
+            validation_errors = self.validate_panelization_config(item.config)
+            item.validation_errors = validation_errors
+            if validation_errors:
+                raise ValueError("Panelization configuration validation failed")
+            report_progress(0.1)
+            
+            if not self.panelize_board(item.input_file, item.output_file, item.config):
+                raise RuntimeError("Panelization process failed")
+            return {"panel": item.output_file}
+        return run
+    
+    def _on_job_status(self, record: JobRecord) -> None:
+        """Mirror job queue state onto the panelization item."""
+        item = self._items.get(record.job_id)
+        if item is None:
+            return
+        item.status = record.status
+        item.progress = record.progress
+        if record.status in ("completed", "skipped"):
+            item.completed_at = record.finished_at
+            item.error_message = None
+        elif record.status == "failed":
+            item.completed_at = record.finished_at
+            item.error_message = record.error_message
+    
     def validate_panelization_config(self, config: PanelizationConfig) -> List[str]:
         """Validate panelization configuration."""
         errors = []
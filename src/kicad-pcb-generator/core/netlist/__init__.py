@@ -10,13 +10,17 @@ from .parser import (
     FootprintData,
     NetData,
     parse_schematic,
+    parse_board_netlist,
     parse_json_netlist,
 )
+from .schematic import SchematicParser
 
 __all__ = [
     "Netlist",
     "FootprintData",
     "NetData",
     "parse_schematic",
+    "parse_board_netlist",
     "parse_json_netlist",
+    "SchematicParser",
 ] 
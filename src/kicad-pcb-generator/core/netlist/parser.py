@@ -4,17 +4,19 @@ This module converts KiCad schematics (or JSON/YAML net-list exports) into a
 Python data structure that downstream generators can consume.
 
 The implementation purposely avoids direct KiCad dependency for schematic
-parsing so that unit-tests can run in headless CI.  When KiCad is available the
-`parse_schematic` function will attempt to import `sexpdata` or leverage KiCad's
-Python API; otherwise it will fall back to a minimal S-expression reader.
+parsing so that unit-tests can run in headless CI.  KiCad files are read with
+the streaming S-expression reader in :mod:`.sexpr`; schematic connectivity is
+resolved in :mod:`.schematic`.
 """
 from __future__ import annotations
 
 import json
 import logging
+import sys
+from array import array
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -58,103 +60,216 @@ class NetData:
         return {"name": self.name, "pads": self.connected_pads}
 
 
+class NetlistIndex:
+    """Lookup tables over a :class:`Netlist`.
+
+    Net names are interned and numbered: nets of ``Netlist.nets`` first, in
+    order, then names that only appear on pad connections. Pad membership is
+    stored CSR-style: the pads of footprint ``i`` are
+    ``pad_offsets[i]:pad_offsets[i + 1]`` in ``pad_names``/``pad_net_ids``,
+    and the pads of net ``n`` are ``net_pad_offsets[n]:net_pad_offsets[n + 1]``
+    in ``net_pads`` (global pad indices). Pad membership is taken from the
+    footprints' pad connections.
+    """
+
+    def __init__(self, footprints: List[FootprintData], nets: List[NetData]):
+        self._footprints = footprints
+        self._nets = nets
+        self._lengths = (len(footprints), len(nets))
+        self.footprint_ids: Dict[str, int] = {}
+        for i, footprint in enumerate(footprints):
+            self.footprint_ids.setdefault(footprint.ref, i)
+
+        self.net_names: List[str] = []
+        self.net_ids: Dict[str, int] = {}
+        self.net_data_ids: Dict[str, int] = {}
+        for i, net in enumerate(nets):
+            self.net_data_ids.setdefault(net.name, i)
+            self.intern(net.name)
+
+        self.pad_offsets = array("l", [0])
+        self.pad_names: List[str] = []
+        self.pad_net_ids = array("l")
+        self._pad_ids: Dict[Tuple[str, str], int] = {}
+        for footprint in footprints:
+            for connection in footprint.pad_connections:
+                self._pad_ids.setdefault((footprint.ref, connection.pad_name), len(self.pad_names))
+                self.pad_names.append(connection.pad_name)
+                self.pad_net_ids.append(self.intern(connection.net_name) if connection.net_name else -1)
+            self.pad_offsets.append(len(self.pad_names))
+
+        # Transpose pad -> net into net -> pads with a counting sort
+        counts = [0] * (len(self.net_names) + 1)
+        for net_id in self.pad_net_ids:
+            if net_id >= 0:
+                counts[net_id + 1] += 1
+        for i in range(1, len(counts)):
+            counts[i] += counts[i - 1]
+        self.net_pad_offsets = array("l", counts)
+        self.net_pads = array("l", [0] * counts[-1])
+        cursor = counts[:-1]
+        for pad_id, net_id in enumerate(self.pad_net_ids):
+            if net_id >= 0:
+                self.net_pads[cursor[net_id]] = pad_id
+                cursor[net_id] += 1
+
+        # Owning footprint of every pad, for net -> (ref, pad) queries
+        self.pad_footprints = array("l", [0] * len(self.pad_names))
+        for i in range(len(footprints)):
+            for pad_id in range(self.pad_offsets[i], self.pad_offsets[i + 1]):
+                self.pad_footprints[pad_id] = i
+
+    def intern(self, name: str) -> int:
+        """Get the id of a net name, assigning the next id to new names."""
+        net_id = self.net_ids.get(name)
+        if net_id is None:
+            net_id = len(self.net_names)
+            name = sys.intern(name)
+            self.net_ids[name] = net_id
+            self.net_names.append(name)
+        return net_id
+
+    def is_current(self, footprints: List[FootprintData], nets: List[NetData]) -> bool:
+        return (footprints is self._footprints and nets is self._nets
+                and self._lengths == (len(footprints), len(nets)))
+
+    def pad_id(self, ref: str, pad_name: str) -> Optional[int]:
+        return self._pad_ids.get((ref, pad_name))
+
+
 @dataclass
 class Netlist:
-    """Aggregate of footprint + net definitions."""
+    """Aggregate of footprint + net definitions.
+
+    Lookups go through a :class:`NetlistIndex` built on first use and
+    rebuilt when ``footprints`` or ``nets`` are replaced or change length.
+    Call :meth:`invalidate_index` after editing items in place (renaming a
+    net, changing pad connections).
+    """
 
     footprints: List[FootprintData] = field(default_factory=list)
     nets: List[NetData] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        self._index: Optional[NetlistIndex] = None
+
+    @classmethod
+    def from_footprints(cls, footprints: List[FootprintData]) -> "Netlist":
+        """Create a netlist whose nets are derived from the pad connections.
+
+        Nets are ordered by first appearance; pads are listed as ``REF-PAD``.
+        """
+        netlist = cls(footprints=list(footprints))
+        index = netlist.index
+        nets = []
+        for net_id, name in enumerate(index.net_names):
+            pads = index.net_pads[index.net_pad_offsets[net_id]:index.net_pad_offsets[net_id + 1]]
+            nets.append(NetData(name=name, connected_pads=[
+                f"{netlist.footprints[index.pad_footprints[pad_id]].ref}-{index.pad_names[pad_id]}"
+                for pad_id in pads
+            ]))
+        netlist.nets = nets
+        return netlist
+
+    @property
+    def index(self) -> NetlistIndex:
+        """Lookup index, rebuilt if the footprint or net lists changed."""
+        if self._index is None or not self._index.is_current(self.footprints, self.nets):
+            self._index = NetlistIndex(self.footprints, self.nets)
+        return self._index
+
+    def invalidate_index(self) -> None:
+        """Drop the lookup index after in-place edits."""
+        self._index = None
+
     def get_net(self, name: str) -> Optional[NetData]:
-        return next((n for n in self.nets if n.name == name), None)
+        net_id = self.index.net_data_ids.get(name)
+        return self.nets[net_id] if net_id is not None else None
 
     # Convenience iterators for generation steps
     def footprint_by_ref(self, ref: str) -> Optional[FootprintData]:
-        return next((f for f in self.footprints if f.ref == ref), None)
+        footprint_id = self.index.footprint_ids.get(ref)
+        return self.footprints[footprint_id] if footprint_id is not None else None
+
+    def net_id(self, name: str) -> Optional[int]:
+        """Interned id of a net name (see :class:`NetlistIndex`)."""
+        return self.index.net_ids.get(name)
+
+    def net_of_pad(self, ref: str, pad_name: str) -> Optional[str]:
+        """Net connected to a footprint pad, or None."""
+        index = self.index
+        pad_id = index.pad_id(ref, pad_name)
+        if pad_id is None or index.pad_net_ids[pad_id] < 0:
+            return None
+        return index.net_names[index.pad_net_ids[pad_id]]
+
+    def pads_of_net(self, name: str) -> List[Tuple[str, str]]:
+        """``(ref, pad)`` pairs connected to a net, without splitting strings."""
+        index = self.index
+        net_id = index.net_ids.get(name)
+        if net_id is None:
+            return []
+        pads = index.net_pads[index.net_pad_offsets[net_id]:index.net_pad_offsets[net_id + 1]]
+        return [(self.footprints[index.pad_footprints[pad_id]].ref, index.pad_names[pad_id]) for pad_id in pads]
 
 
 # ---------------------------------------------------------------------------
-# Parsing helpers (stubs)
+# Parsing helpers
 # ---------------------------------------------------------------------------
 
 def parse_schematic(path: str | Path) -> Netlist:
-    """Parse a KiCad v6/v7+.kicad_sch file and return a Netlist instance.
+    """Parse a KiCad v6/v7+ .kicad_sch file and return a Netlist instance.
 
-    The implementation is deliberately lightweight.  When KiCad is available
-    it uses the official parser; otherwise it performs a best-effort S-expression
-    parse for ref/value/lib_id/pad→net mapping so unit tests can still run.
+    The file and its sub-sheets are streamed through a small S-expression
+    tokenizer (no KiCad dependency), and nets are built from the wires,
+    junctions, labels, power symbols and sheet pins of the whole hierarchy.
+    Use :class:`~.schematic.SchematicParser` directly to re-parse only the
+    sheets that changed between calls.
     """
+    from .schematic import SchematicParser
+
     path = Path(path)
     logger.info("Parsing schematic %s", path)
 
     if not path.exists():
         raise FileNotFoundError(path)
 
-    # VERY-LIGHT parser for KiCad v6/v7 .kicad_sch (S-expression). We avoid heavy
-    # S-exp parsing libs to keep dependencies minimal. The goal is simply to
-    # extract symbol reference/value/footprint and wire pin-nets for simple
-    # unit tests or head-less CI – not to be production-grade.
+    return SchematicParser(incremental=False).parse(path)
+
+
+def parse_board_netlist(path: str | Path) -> Netlist:
+    """Read footprints and pad nets from a .kicad_pcb file without pcbnew."""
+    from . import sexpr
+
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(path)
 
     footprints: List[FootprintData] = []
     nets: Dict[str, NetData] = {}
 
-    current_ref: str | None = None
-    current_val: str | None = None
-    current_fp: str | None = None
-
-    with path.open("r", encoding="utf-8") as fh:
-        for raw in fh:
-            line = raw.strip()
-
-            # Detect start of a symbol block
-            if line.startswith("(symbol "):
-                # Reset collectors
-                current_ref = current_val = current_fp = None
-                continue
-
-            # Grab properties
-            if line.startswith("(property \"Reference\""):
-                # format: (property "Reference" "R1" ...
-                parts = line.split("\"")
-                if len(parts) >= 3:
-                    current_ref = parts[3]
-                continue
-
-            if line.startswith("(property \"Value\""):
-                parts = line.split("\"")
-                if len(parts) >= 3:
-                    current_val = parts[3]
-                continue
-
-            if line.startswith("(property \"Footprint\""):
-                parts = line.split("\"")
-                if len(parts) >= 3:
-                    current_fp = parts[3]
-                continue
-
-            # End of symbol – look for closing paren at start of line
-            if line == ")":
-                if current_ref and current_fp:
-                    footprints.append(
-                        FootprintData(
-                            ref=current_ref,
-                            value=current_val or "",
-                            lib_id=current_fp,
-                        )
-                    )
-                current_ref = current_val = current_fp = None
-
-            # Simple net assignment parsing: (pinref part R1 pin 1)
-            if line.startswith("(wire") or line.startswith("(junction"):
-                # collect nets is beyond this lightweight parser scope
-                continue
-
-            if line.startswith("(net "):
-                # (net 0 "GND")
-                parts = line.split("\"")
-                if len(parts) >= 2:
-                    net_name = parts[1]
-                    nets[net_name] = NetData(name=net_name)
+    for element in sexpr.iter_file_elements(path):
+        kind = element[0]
+        if kind == "net" and len(element) > 2 and element[2]:
+            nets.setdefault(element[2], NetData(name=element[2]))
+        elif kind in ("footprint", "module") and len(element) > 1:
+            props = sexpr.properties(element)
+            texts = {child[1]: child[2] for child in sexpr.find_all(element, "fp_text") if len(child) > 2}
+            footprint = FootprintData(
+                ref=props.get("Reference", texts.get("reference", "")),
+                value=props.get("Value", texts.get("value", "")),
+                lib_id=element[1],
+            )
+            for pad in sexpr.find_all(element, "pad"):
+                net = sexpr.find(pad, "net")
+                net_name = net[-1] if net is not None and len(net) > 1 else ""
+                if not net_name or not isinstance(net_name, str):
+                    continue
+                footprint.pad_connections.append(PadConnection(pad_name=pad[1], net_name=net_name))
+                nets.setdefault(net_name, NetData(name=net_name)).connected_pads.append(
+                    f"{footprint.ref}-{pad[1]}"
+                )
+            footprints.append(footprint)
 
     return Netlist(footprints=footprints, nets=list(nets.values()))
 
@@ -191,6 +306,8 @@ __all__ = [
     "FootprintData",
     "NetData",
     "Netlist",
+    "NetlistIndex",
     "parse_schematic",
+    "parse_board_netlist",
     "parse_json_netlist",
 ] 
@@ -0,0 +1,658 @@
+"""Hierarchical KiCad schematic reader with connectivity extraction.
+
+Every sheet file is streamed once with ``sexpr.iter_file_elements`` and
+reduced to a ``SheetData``: the placed symbols with their absolute pin
+positions, the child sheets with their sheet pins, and the sheet's local
+connectivity (wires, junctions, labels and pins merged with a union-find).
+Sheet data depends only on the file contents, so ``SchematicParser`` keeps
+it between calls in incremental mode and re-reads only sheets whose
+modification time or size changed. Building the ``Netlist`` then walks the
+sheet instances and merges local groups through labels, power symbols and
+sheet pins with a second union-find, which is cheap next to parsing.
+
+Connectivity rules follow KiCad: items connect where their connection points
+coincide, wires connect mid-segment only at junctions, labels attach
+anywhere along a wire, local labels join within a sheet instance, global
+labels and power symbols join across the design, and hierarchical labels
+join the matching sheet pin in the parent sheet. Buses are not expanded.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from ..utils.union_find import UnionFind
+from . import sexpr
+
+if TYPE_CHECKING:
+    from .parser import Netlist
+
+logger = logging.getLogger(__name__)
+
+# Connection points are compared on a 0.1 um grid (KiCad stores 4 decimals in mm)
+_GRID = 10000.0
+
+Point = Tuple[int, int]
+
+
+def _point(x: float, y: float) -> Point:
+    return int(round(x * _GRID)), int(round(y * _GRID))
+
+
+# ---------------------------------------------------------------------------
+# Sheet data
+# ---------------------------------------------------------------------------
+
+@dataclass
+class LibPin:
+    """Pin of a library symbol, in library coordinates (Y up)."""
+
+    number: str
+    name: str
+    x: float
+    y: float
+    electrical_type: str
+    hidden: bool
+    unit: int = 0  # 0 = common to all units
+    body_style: int = 0  # 0 = common to all body styles
+
+
+@dataclass
+class LibSymbol:
+    """Library symbol embedded in a schematic's ``lib_symbols``."""
+
+    lib_id: str
+    pins: List[LibPin] = field(default_factory=list)
+    power: bool = False
+    extends: Optional[str] = None
+
+
+@dataclass
+class PlacedPin:
+    number: str
+    name: str
+    point: Point
+    electrical_type: str
+    hidden: bool
+
+
+@dataclass
+class PlacedSymbol:
+    """Symbol instance placed on a sheet."""
+
+    uuid: str
+    lib_id: str
+    reference: str
+    value: str
+    footprint: str
+    unit: int
+    power: bool
+    pins: List[PlacedPin] = field(default_factory=list)
+    instances: Dict[str, Tuple[str, int]] = field(default_factory=dict)  # path -> (reference, unit)
+
+
+@dataclass
+class ChildSheet:
+    """Sheet symbol referencing a sub-sheet file."""
+
+    uuid: str
+    name: str
+    file: str
+    pins: List[Tuple[str, Point]] = field(default_factory=list)
+
+
+@dataclass
+class SheetData:
+    """Parsed contents and local connectivity of one schematic file."""
+
+    path: Path
+    uuid: str
+    mtime_ns: int
+    size: int
+    symbols: List[PlacedSymbol] = field(default_factory=list)
+    children: List[ChildSheet] = field(default_factory=list)
+    # KiCad 6 keeps instance references in the root file
+    symbol_instances: Dict[str, Tuple[str, int]] = field(default_factory=dict)
+    # Local connectivity: group id of every symbol pin and named items per group
+    group_count: int = 0
+    pin_groups: List[List[int]] = field(default_factory=list)  # [symbol][pin] -> group
+    local_labels: Dict[int, Set[str]] = field(default_factory=dict)
+    global_labels: Dict[int, Set[str]] = field(default_factory=dict)
+    hierarchical_labels: Dict[int, Set[str]] = field(default_factory=dict)
+    sheet_pins: List[Tuple[int, int, str]] = field(default_factory=list)  # (group, child, pin name)
+
+
+def _parse_lib_symbol(element: list) -> LibSymbol:
+    """Reduce a ``lib_symbols`` entry to its pins."""
+    symbol = LibSymbol(
+        lib_id=element[1] if len(element) > 1 else "",
+        power=sexpr.find(element, "power") is not None,
+        extends=sexpr.value(element, "extends"),
+    )
+    for unit_element in sexpr.find_all(element, "symbol"):
+        unit, body_style = 0, 0
+        name = unit_element[1] if len(unit_element) > 1 else ""
+        parts = name.rsplit("_", 2)
+        if len(parts) == 3 and parts[1].isdigit() and parts[2].isdigit():
+            unit, body_style = int(parts[1]), int(parts[2])
+        for pin in sexpr.find_all(unit_element, "pin"):
+            x, y, _ = sexpr.position(pin)
+            symbol.pins.append(LibPin(
+                number=sexpr.value(pin, "number", "") or "",
+                name=sexpr.value(pin, "name", "") or "",
+                x=x,
+                y=y,
+                electrical_type=pin[1] if len(pin) > 1 and isinstance(pin[1], str) else "",
+                hidden=sexpr.has_flag(pin, "hide"),
+                unit=unit,
+                body_style=body_style,
+            ))
+    return symbol
+
+
+def _pin_transform(angle: float, mirror: Optional[str]):
+    """Map library pin offsets (Y up) to sheet offsets (Y down)."""
+    radians = math.radians(angle)
+    cos_a, sin_a = round(math.cos(radians), 12), round(math.sin(radians), 12)
+
+    def transform(px: float, py: float) -> Tuple[float, float]:
+        vx, vy = px, -py
+        rx, ry = vx * cos_a + vy * sin_a, -vx * sin_a + vy * cos_a
+        if mirror == "x":
+            ry = -ry
+        elif mirror == "y":
+            rx = -rx
+        return rx, ry
+
+    return transform
+
+
+def _parse_instances(element: list) -> Dict[str, Tuple[str, int]]:
+    """Read ``(instances (project "p" (path "/..." (reference "R1") (unit 1))))``."""
+    result = {}
+    instances = sexpr.find(element, "instances")
+    if instances is None:
+        return result
+    for project in sexpr.find_all(instances, "project"):
+        for path in sexpr.find_all(project, "path"):
+            if len(path) > 1:
+                unit = sexpr.value(path, "unit")
+                result[path[1]] = (sexpr.value(path, "reference", "") or "",
+                                   int(unit) if unit and unit.isdigit() else 0)
+    return result
+
+
+def _resolve_lib_symbol(lib_symbols: Dict[str, LibSymbol], lib_id: str) -> Optional[LibSymbol]:
+    symbol = lib_symbols.get(lib_id)
+    if symbol is not None and symbol.extends and not symbol.pins:
+        prefix = lib_id.split(":", 1)[0] + ":" if ":" in lib_id else ""
+        parent = lib_symbols.get(prefix + symbol.extends) or lib_symbols.get(symbol.extends)
+        if parent is not None:
+            return LibSymbol(lib_id=lib_id, pins=parent.pins, power=symbol.power or parent.power)
+    return symbol
+
+
+def read_sheet(path: Path) -> SheetData:
+    """Parse one schematic file and compute its local connectivity.
+
+    Args:
+        path: ``.kicad_sch`` file
+
+    Returns:
+        Sheet data
+    """
+    stat = path.stat()
+    sheet = SheetData(path=path, uuid="", mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+    lib_symbols: Dict[str, LibSymbol] = {}
+    wires: List[Tuple[Point, Point]] = []
+    junctions: List[Point] = []
+    labels: List[Tuple[str, str, Point]] = []  # (kind, text, point)
+
+    for element in sexpr.iter_file_elements(path, expand=("lib_symbols",)):
+        kind = element[0]
+        if kind == "lib_symbols":
+            lib_symbol = _parse_lib_symbol(element[1])
+            lib_symbols[lib_symbol.lib_id] = lib_symbol
+        elif kind == "uuid" and len(element) > 1:
+            sheet.uuid = element[1]
+        elif kind == "symbol":
+            sheet.symbols.append(_place_symbol(element, lib_symbols))
+        elif kind == "wire":
+            pts = sexpr.find(element, "pts")
+            xy = [child for child in (pts or []) if isinstance(child, list) and child[0] == "xy"]
+            for start, end in zip(xy, xy[1:]):
+                wires.append((_point(float(start[1]), float(start[2])),
+                              _point(float(end[1]), float(end[2]))))
+        elif kind == "junction":
+            x, y, _ = sexpr.position(element)
+            junctions.append(_point(x, y))
+        elif kind in ("label", "global_label", "hierarchical_label"):
+            x, y, _ = sexpr.position(element)
+            if len(element) > 1 and isinstance(element[1], str):
+                labels.append((kind, element[1], _point(x, y)))
+        elif kind == "sheet":
+            props = sexpr.properties(element)
+            child = ChildSheet(
+                uuid=sexpr.value(element, "uuid", "") or "",
+                name=props.get("Sheetname", props.get("Sheet name", "")),
+                file=props.get("Sheetfile", props.get("Sheet file", "")),
+            )
+            for pin in sexpr.find_all(element, "pin"):
+                x, y, _ = sexpr.position(pin)
+                if len(pin) > 1 and isinstance(pin[1], str):
+                    child.pins.append((pin[1], _point(x, y)))
+            sheet.children.append(child)
+        elif kind == "symbol_instances":
+            for path_element in sexpr.find_all(element, "path"):
+                unit = sexpr.value(path_element, "unit")
+                sheet.symbol_instances[path_element[1]] = (
+                    sexpr.value(path_element, "reference", "") or "",
+                    int(unit) if unit and unit.isdigit() else 0,
+                )
+
+    _connect_sheet(sheet, wires, junctions, labels)
+    return sheet
+
+
+def _place_symbol(element: list, lib_symbols: Dict[str, LibSymbol]) -> PlacedSymbol:
+    """Create a placed symbol with absolute pin positions."""
+    props = sexpr.properties(element)
+    lib_id = sexpr.value(element, "lib_id", "") or ""
+    unit_value = sexpr.value(element, "unit", "1") or "1"
+    body_value = (sexpr.value(element, "convert", None)
+                  or sexpr.value(element, "body_style", "1") or "1")
+    unit = int(unit_value) if unit_value.isdigit() else 1
+    body_style = int(body_value) if body_value.isdigit() else 1
+    lib_symbol = _resolve_lib_symbol(lib_symbols, lib_id)
+
+    symbol = PlacedSymbol(
+        uuid=sexpr.value(element, "uuid", "") or "",
+        lib_id=lib_id,
+        reference=props.get("Reference", ""),
+        value=props.get("Value", ""),
+        footprint=props.get("Footprint", ""),
+        unit=unit,
+        power=bool(lib_symbol and lib_symbol.power),
+        instances=_parse_instances(element),
+    )
+    if lib_symbol is None:
+        logger.warning("Library symbol %s not found in schematic", lib_id)
+        return symbol
+
+    x, y, angle = sexpr.position(element)
+    transform = _pin_transform(angle, sexpr.value(element, "mirror"))
+    for pin in lib_symbol.pins:
+        if pin.unit not in (0, unit) or pin.body_style not in (0, body_style):
+            continue
+        dx, dy = transform(pin.x, pin.y)
+        symbol.pins.append(PlacedPin(pin.number, pin.name, _point(x + dx, y + dy),
+                                     pin.electrical_type, pin.hidden))
+    return symbol
+
+
+def _connect_sheet(sheet: SheetData, wires: List[Tuple[Point, Point]], junctions: List[Point],
+                   labels: List[Tuple[str, str, Point]]) -> None:
+    """Group the sheet's pins, labels and sheet pins into local nets."""
+    uf = UnionFind()
+    at_point: Dict[Point, List[int]] = defaultdict(list)
+
+    wire_nodes = []
+    for start, end in wires:
+        node = uf.add()
+        wire_nodes.append(node)
+        at_point[start].append(node)
+        at_point[end].append(node)
+
+    pin_nodes: List[List[int]] = []
+    for symbol in sheet.symbols:
+        nodes = []
+        for pin in symbol.pins:
+            node = uf.add()
+            nodes.append(node)
+            at_point[pin.point].append(node)
+        pin_nodes.append(nodes)
+
+    label_nodes = []
+    for _, _, point in labels:
+        node = uf.add()
+        label_nodes.append(node)
+        at_point[point].append(node)
+
+    sheet_pin_nodes = []
+    for child_index, child in enumerate(sheet.children):
+        for name, point in child.pins:
+            node = uf.add()
+            sheet_pin_nodes.append((node, child_index, name))
+            at_point[point].append(node)
+
+    # Items sharing a connection point
+    for nodes in at_point.values():
+        for node in nodes[1:]:
+            uf.union(nodes[0], node)
+
+    # Junctions and labels also attach to the interior of wires
+    interior_points = set(junctions) | {point for _, _, point in labels}
+    for point in junctions:
+        at_point.setdefault(point, [])
+    _attach_to_wires(uf, wires, wire_nodes, interior_points, at_point)
+
+    # Compact union-find roots into group ids
+    group_ids: Dict[int, int] = {}
+
+    def group(node: int) -> int:
+        root = uf.find(node)
+        if root not in group_ids:
+            group_ids[root] = len(group_ids)
+        return group_ids[root]
+
+    sheet.pin_groups = [[group(node) for node in nodes] for nodes in pin_nodes]
+    for (kind, text, _), node in zip(labels, label_nodes):
+        target = {"label": sheet.local_labels, "global_label": sheet.global_labels,
+                  "hierarchical_label": sheet.hierarchical_labels}[kind]
+        target.setdefault(group(node), set()).add(text)
+    for symbol, groups in zip(sheet.symbols, sheet.pin_groups):
+        for pin, pin_group in zip(symbol.pins, groups):
+            if symbol.power:
+                # Power symbols name a global net (value field, or pin name on older files)
+                sheet.global_labels.setdefault(pin_group, set()).add(symbol.value or pin.name)
+            elif pin.hidden and pin.electrical_type == "power_in" and pin.name:
+                # Hidden power pins join the global net of their name
+                sheet.global_labels.setdefault(pin_group, set()).add(pin.name)
+    sheet.sheet_pins = [(group(node), child_index, name)
+                        for node, child_index, name in sheet_pin_nodes]
+    sheet.group_count = len(group_ids)
+
+
+def _attach_to_wires(uf: UnionFind, wires: List[Tuple[Point, Point]], wire_nodes: List[int],
+                     points: Set[Point], at_point: Dict[Point, List[int]]) -> None:
+    """Union points lying strictly inside wire segments with those wires."""
+    if not points or not wires:
+        return
+    by_row: Dict[int, List[int]] = defaultdict(list)
+    by_column: Dict[int, List[int]] = defaultdict(list)
+    for x, y in points:
+        by_row[y].append(x)
+        by_column[x].append(y)
+    for values in by_row.values():
+        values.sort()
+    for values in by_column.values():
+        values.sort()
+
+    for (start, end), wire_node in zip(wires, wire_nodes):
+        (x0, y0), (x1, y1) = start, end
+        if y0 == y1:
+            row = by_row.get(y0)
+            if row:
+                lo, hi = min(x0, x1), max(x0, x1)
+                for x in row[bisect_right(row, lo):bisect_left(row, hi)]:
+                    _union_point(uf, wire_node, at_point, (x, y0))
+        elif x0 == x1:
+            column = by_column.get(x0)
+            if column:
+                lo, hi = min(y0, y1), max(y0, y1)
+                for y in column[bisect_right(column, lo):bisect_left(column, hi)]:
+                    _union_point(uf, wire_node, at_point, (x0, y))
+        else:
+            dx, dy = x1 - x0, y1 - y0
+            for point in points:
+                px, py = point
+                if (px - x0) * dy != (py - y0) * dx or point in (start, end):
+                    continue
+                if min(x0, x1) <= px <= max(x0, x1) and min(y0, y1) <= py <= max(y0, y1):
+                    _union_point(uf, wire_node, at_point, point)
+
+
+def _union_point(uf: UnionFind, wire_node: int, at_point: Dict[Point, List[int]],
+                 point: Point) -> None:
+    nodes = at_point.get(point)
+    if nodes:
+        uf.union(wire_node, nodes[0])
+    else:
+        # A bare junction: remember the wire so other wires through it connect
+        at_point[point] = [wire_node]
+
+
+# ---------------------------------------------------------------------------
+# Hierarchy
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SheetInstance:
+    """One use of a sheet file in the hierarchy."""
+
+    sheet: SheetData
+    uuid_path: List[str]  # sheet symbol uuids from the root
+    name_path: str  # "/" for the root, "/Amp/Left/" for nested sheets
+    parent: Optional[int] = None
+    child_index: Optional[int] = None  # index of the sheet symbol in the parent
+    offset: int = 0  # first global group id
+
+
+class SchematicParser:
+    """Parse hierarchical schematics into a ``Netlist``.
+
+    With ``incremental=True`` parsed sheets are kept between calls and only
+    sheets whose file changed are read again.
+    """
+
+    def __init__(self, incremental: bool = True):
+        self.incremental = incremental
+        self._sheets: Dict[Path, SheetData] = {}
+        self.last_stats: Dict[str, float] = {}
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """Drop cached sheet data for one file, or for all files."""
+        if path is None:
+            self._sheets.clear()
+        else:
+            self._sheets.pop(Path(path).resolve(), None)
+
+    def parse(self, path) -> "Netlist":
+        """Parse a root schematic and its sub-sheets.
+
+        Args:
+            path: Root ``.kicad_sch`` file
+
+        Returns:
+            Netlist with footprints, pad connections and nets
+        """
+        start_time = time.perf_counter()
+        root_path = Path(path).resolve()
+        if not root_path.exists():
+            raise FileNotFoundError(path)
+
+        self.last_stats = {"sheets": 0, "parsed": 0, "reused": 0}
+        instances = self._instances(root_path)
+        netlist = self._build_netlist(instances)
+        self.last_stats["instances"] = len(instances)
+        self.last_stats["seconds"] = time.perf_counter() - start_time
+        return netlist
+
+    def _load(self, path: Path) -> SheetData:
+        cached = self._sheets.get(path)
+        if cached is not None:
+            stat = path.stat()
+            if stat.st_mtime_ns == cached.mtime_ns and stat.st_size == cached.size:
+                self.last_stats["reused"] += 1
+                return cached
+        sheet = read_sheet(path)
+        self.last_stats["parsed"] += 1
+        if self.incremental:
+            self._sheets[path] = sheet
+        return sheet
+
+    def _instances(self, root_path: Path) -> List[SheetInstance]:
+        """Expand the sheet hierarchy into instances, depth first."""
+        loaded: Dict[Path, SheetData] = {}
+
+        def load(path: Path) -> SheetData:
+            if path not in loaded:
+                loaded[path] = self._load(path)
+            return loaded[path]
+
+        instances = [SheetInstance(sheet=load(root_path), uuid_path=[], name_path="/")]
+        stack = [(0, (root_path,))]
+        while stack:
+            index, ancestors = stack.pop()
+            instance = instances[index]
+            for child_index, child in enumerate(instance.sheet.children):
+                child_path = (instance.sheet.path.parent / child.file).resolve()
+                if child_path in ancestors:
+                    logger.error("Recursive sheet reference to %s", child_path)
+                    continue
+                if not child_path.exists():
+                    logger.error("Sub-sheet %s not found", child_path)
+                    continue
+                instances.append(SheetInstance(
+                    sheet=load(child_path),
+                    uuid_path=instance.uuid_path + [child.uuid],
+                    name_path=f"{instance.name_path}{child.name or child_path.stem}/",
+                    parent=index,
+                    child_index=child_index,
+                ))
+                stack.append((len(instances) - 1, ancestors + (child_path,)))
+        self.last_stats["sheets"] = len(loaded)
+        return instances
+
+    def _build_netlist(self, instances: List[SheetInstance]) -> "Netlist":
+        from .parser import FootprintData, NetData, Netlist, PadConnection
+
+        offset = 0
+        for instance in instances:
+            instance.offset = offset
+            offset += instance.sheet.group_count
+        uf = UnionFind(offset)
+
+        # Global labels and power nets join across the design
+        global_roots: Dict[str, int] = {}
+        # group -> (priority, depth, name)
+        names: Dict[int, List[Tuple[int, int, str]]] = defaultdict(list)
+        children_of: Dict[Tuple[int, int], int] = {
+            (instance.parent, instance.child_index): index
+            for index, instance in enumerate(instances) if instance.parent is not None
+        }
+        for index, instance in enumerate(instances):
+            sheet = instance.sheet
+            depth = len(instance.uuid_path)
+            for local_group, labels in sheet.global_labels.items():
+                node = instance.offset + local_group
+                for label in labels:
+                    names[node].append((0, 0, label))
+                    if label in global_roots:
+                        uf.union(global_roots[label], node)
+                    else:
+                        global_roots[label] = node
+
+            local_roots: Dict[str, int] = {}
+            for local_group, labels in sheet.local_labels.items():
+                node = instance.offset + local_group
+                for label in labels:
+                    name = label if depth == 0 else f"{instance.name_path}{label}"
+                    names[node].append((1, depth, name))
+                    if label in local_roots:
+                        uf.union(local_roots[label], node)
+                    else:
+                        local_roots[label] = node
+
+            for local_group, labels in sheet.hierarchical_labels.items():
+                node = instance.offset + local_group
+                for label in labels:
+                    names[node].append((2, depth, f"{instance.name_path}{label}"))
+
+            # Sheet pins join the child's hierarchical labels of the same name
+            for local_group, child_index, pin_name in sheet.sheet_pins:
+                child = children_of.get((index, child_index))
+                if child is None:
+                    continue
+                child_instance = instances[child]
+                for child_group, labels in child_instance.sheet.hierarchical_labels.items():
+                    if pin_name in labels:
+                        uf.union(instance.offset + local_group, child_instance.offset + child_group)
+
+        # Footprints and pins
+        root_sheet = instances[0].sheet
+        root_uuid = root_sheet.uuid
+        footprints: Dict[str, FootprintData] = {}
+        net_pins: Dict[int, List[Tuple[str, str]]] = defaultdict(list)
+        for instance in instances:
+            sheet = instance.sheet
+            path7 = "/" + "/".join([root_uuid] + instance.uuid_path) if root_uuid else None
+            path6 = "".join(f"/{uuid}" for uuid in instance.uuid_path)
+            for symbol, groups in zip(sheet.symbols, sheet.pin_groups):
+                if symbol.power:
+                    continue
+                reference = symbol.reference
+                if path7 and path7 in symbol.instances:
+                    reference = symbol.instances[path7][0] or reference
+                elif f"{path6}/{symbol.uuid}" in root_sheet.symbol_instances:
+                    reference = (root_sheet.symbol_instances[f"{path6}/{symbol.uuid}"][0]
+                                 or reference)
+                elif len(symbol.instances) == 1:
+                    reference = next(iter(symbol.instances.values()))[0] or reference
+                if not reference or reference.startswith("#"):
+                    continue
+
+                footprint = footprints.get(reference)
+                if footprint is None and symbol.footprint:
+                    footprint = FootprintData(ref=reference, value=symbol.value,
+                                              lib_id=symbol.footprint)
+                    footprints[reference] = footprint
+                known_pads = ({pc.pad_name for pc in footprint.pad_connections}
+                              if footprint else set())
+                for pin, local_group in zip(symbol.pins, groups):
+                    root = uf.find(instance.offset + local_group)
+                    if pin.number in known_pads:
+                        continue
+                    known_pads.add(pin.number)
+                    net_pins[root].append((reference, pin.number))
+                    if footprint is not None:
+                        footprint.pad_connections.append(
+                            PadConnection(pad_name=pin.number, net_name=""))
+
+        # Name every net that has pins
+        root_names: Dict[int, List[Tuple[int, int, str]]] = defaultdict(list)
+        for node, candidates in names.items():
+            root_names[uf.find(node)].extend(candidates)
+
+        net_names: Dict[int, str] = {}
+        used: Set[str] = set()
+        for root, pins in net_pins.items():
+            candidates = root_names.get(root)
+            if candidates:
+                name = min(candidates)[2]
+            else:
+                ref, pad = min(pins, key=_pad_sort_key)
+                name = f"Net-({ref}-Pad{pad})"
+            if name in used:
+                name = f"{name}_{len(used)}"
+            used.add(name)
+            net_names[root] = name
+
+        nets = []
+        pad_net: Dict[Tuple[str, str], str] = {}
+        for root, pins in net_pins.items():
+            pins.sort(key=_pad_sort_key)
+            name = net_names[root]
+            nets.append(NetData(name=name, connected_pads=[f"{ref}-{pad}" for ref, pad in pins]))
+            for pin in pins:
+                pad_net[pin] = name
+        for footprint in footprints.values():
+            for connection in footprint.pad_connections:
+                connection.net_name = pad_net.get((footprint.ref, connection.pad_name), "")
+        nets.sort(key=lambda net: net.name)
+        return Netlist(footprints=list(footprints.values()), nets=nets)
+
+
+def _pad_sort_key(pin: Tuple[str, str]) -> Tuple:
+    """Natural sort key for (reference, pad) pairs, e.g. R2 before R10."""
+    def natural(text: str) -> Tuple:
+        head = text.rstrip("0123456789")
+        tail = text[len(head):]
+        return head, int(tail) if tail else -1, text
+    return natural(pin[0]), natural(pin[1])
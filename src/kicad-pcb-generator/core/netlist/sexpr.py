@@ -0,0 +1,220 @@
+"""Streaming S-expression reader for KiCad files.
+
+KiCad schematics and boards are single S-expressions that can run to tens of
+megabytes. ``iter_tokens`` tokenizes a file in fixed-size chunks and
+``iter_elements`` materializes one top-level item (symbol, wire, footprint,
+...) at a time as nested lists, so memory stays bounded by the largest item
+rather than by the file.
+
+Elements are plain lists: ``["wire", ["pts", ["xy", "10", "20"], ...], ...]``.
+Quoted strings and bare atoms are both returned as ``str``.
+"""
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import IO, Iterable, Iterator, List, Optional, Sequence, Union
+
+OPEN = object()
+CLOSE = object()
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_TOKEN_RE = re.compile(r'\s*(?:(\()|(\))|"((?:[^"\\]|\\.)*)"|([^\s()"]+))', re.S)
+_WHITESPACE_RE = re.compile(r"\s*")
+_ESCAPE_RE = re.compile(r"\\(.)", re.S)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r"}
+
+Element = List[Union[str, "Element"]]
+
+
+class SExpressionError(ValueError):
+    """Raised for malformed S-expression input."""
+
+
+def _unescape(text: str) -> str:
+    if "\\" not in text:
+        return text
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), text)
+
+
+def iter_tokens(stream: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[object]:
+    """Tokenize a text stream.
+
+    Args:
+        stream: Text stream
+        chunk_size: Number of characters read at a time
+
+    Yields:
+        ``OPEN``, ``CLOSE`` or atom/string values
+    """
+    buffer = ""
+    eof = False
+    match_token = _TOKEN_RE.match
+    while not eof:
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+        pos = 0
+        end = len(buffer)
+        while pos < end:
+            match = match_token(buffer, pos)
+            if match is None:
+                if _WHITESPACE_RE.match(buffer, pos).end() == end:
+                    pos = end
+                    break
+                if eof:
+                    raise SExpressionError(f"Unterminated string near: {buffer[pos:pos + 40]!r}")
+                break  # Partial string; wait for more input
+            if match.group(1) is not None:
+                yield OPEN
+            elif match.group(2) is not None:
+                yield CLOSE
+            else:
+                if match.end() == end and not eof:
+                    break  # The atom may continue in the next chunk
+                string = match.group(3)
+                yield _unescape(string) if string is not None else match.group(4)
+            pos = match.end()
+        buffer = buffer[pos:]
+
+
+def _build(tokens: Iterator[object], head: Optional[str] = None) -> Element:
+    """Build one list after its opening parenthesis (and ``head``) has been consumed."""
+    stack: List[Element] = [[] if head is None else [head]]
+    for token in tokens:
+        if token is OPEN:
+            stack.append([])
+        elif token is CLOSE:
+            element = stack.pop()
+            if not stack:
+                return element
+            stack[-1].append(element)
+        else:
+            stack[-1].append(token)
+    raise SExpressionError("Unexpected end of input")
+
+
+def iter_elements(stream: IO[str],
+                  expand: Iterable[str] = (),
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Element]:
+    """Yield the children of the root expression one at a time.
+
+    Args:
+        stream: Text stream holding one root expression, e.g. ``(kicad_sch ...)``
+        expand: Top-level item names whose children are yielded one by one
+            instead of as a single element (e.g. ``lib_symbols``); each of
+            them is yielded as ``[name, child]``
+        chunk_size: Number of characters read at a time
+
+    Yields:
+        Top-level elements as nested lists
+    """
+    expand = set(expand)
+    tokens = iter_tokens(stream, chunk_size)
+    if next(tokens, None) is not OPEN:
+        raise SExpressionError("Expected '(' at start of input")
+    root = next(tokens, None)
+    if not isinstance(root, str):
+        raise SExpressionError("Expected a root expression name")
+    yield [root]
+
+    for token in tokens:
+        if token is CLOSE:
+            return
+        if token is not OPEN:
+            continue  # Bare atoms directly under the root
+        name = next(tokens, None)
+        if name is OPEN or name is CLOSE or name is None:
+            raise SExpressionError("Expected an expression name")
+        if name not in expand:
+            yield _build(tokens, name)
+            continue
+        for inner in tokens:
+            if inner is CLOSE:
+                break
+            if inner is OPEN:
+                yield [name, _build(tokens)]
+    raise SExpressionError("Unexpected end of input")
+
+
+def iter_file_elements(path: Union[str, Path], expand: Iterable[str] = (),
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Element]:
+    """Yield the top-level elements of a KiCad file (see ``iter_elements``)."""
+    with Path(path).open("r", encoding="utf-8") as fh:
+        yield from iter_elements(fh, expand=expand, chunk_size=chunk_size)
+
+
+def parse(text: str) -> Element:
+    """Parse a complete S-expression string into nested lists."""
+    tokens = iter_tokens(_StringStream(text))
+    if next(tokens, None) is not OPEN:
+        raise SExpressionError("Expected '(' at start of input")
+    return _build(tokens)
+
+
+class _StringStream:
+    def __init__(self, text: str):
+        self._text = text
+        self._pos = 0
+
+    def read(self, size: int) -> str:
+        chunk = self._text[self._pos:self._pos + size]
+        self._pos += len(chunk)
+        return chunk
+
+
+# ---------------------------------------------------------------------------
+# Element helpers
+# ---------------------------------------------------------------------------
+
+def find(element: Sequence, name: str) -> Optional[Element]:
+    """First child list named ``name``."""
+    for child in element:
+        if isinstance(child, list) and child and child[0] == name:
+            return child
+    return None
+
+
+def find_all(element: Sequence, name: str) -> Iterator[Element]:
+    """All child lists named ``name``."""
+    for child in element:
+        if isinstance(child, list) and child and child[0] == name:
+            yield child
+
+
+def value(element: Sequence, name: str, default: Optional[str] = None) -> Optional[str]:
+    """First atom of the child list named ``name``."""
+    child = find(element, name)
+    if child is None or len(child) < 2 or isinstance(child[1], list):
+        return default
+    return child[1]
+
+
+def properties(element: Sequence) -> dict:
+    """``(property "Name" "Value" ...)`` children as a dictionary."""
+    result = {}
+    for child in find_all(element, "property"):
+        if len(child) >= 3 and isinstance(child[1], str) and isinstance(child[2], str):
+            result[child[1]] = child[2]
+    return result
+
+
+def position(element: Sequence) -> tuple:
+    """``(at x y [angle])`` of an element as floats (angle defaults to 0)."""
+    at = find(element, "at")
+    if at is None:
+        return 0.0, 0.0, 0.0
+    numbers = [float(v) for v in at[1:4] if isinstance(v, str)]
+    numbers += [0.0] * (3 - len(numbers))
+    return numbers[0], numbers[1], numbers[2]
+
+
+def has_flag(element: Sequence, flag: str) -> bool:
+    """Whether a bare atom or ``(flag yes)`` child is present."""
+    for child in element[1:]:
+        if child == flag:
+            return True
+        if isinstance(child, list) and child and child[0] == flag:
+            return len(child) < 2 or child[1] != "no"
+    return False
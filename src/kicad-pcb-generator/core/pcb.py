@@ -28,6 +28,9 @@ from ..layout.layout_optimizer import LayoutOptimizer, LayoutConstraints
 # AudioRouter integration
 from ..audio.routing.audio_router import AudioRouter
 
+# Pipeline stage spans
+from .performance.profiling import span
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -446,10 +449,12 @@ class PCBGenerator(BaseValidator):
             output_path.mkdir(parents=True, exist_ok=True)
             
             # Generate PCB files
-            gen_result = self._generate_pcb_files(project_config, config, output_path, netlist=netlist)
+            with span("generate_pcb_files", project=project_name):
+                gen_result = self._generate_pcb_files(project_config, config, output_path, netlist=netlist)
             
             # Validate the generated PCB
-            validation_result = self._validate_generated_pcb(output_path, project_config.name)
+            with span("validate_generated_pcb", project=project_name):
+                validation_result = self._validate_generated_pcb(output_path, project_config.name)
             
             # Combine results
             final_result = PCBGenerationResult(
@@ -540,118 +545,125 @@ class PCBGenerator(BaseValidator):
     ) -> PCBGenerationResult:
         """Generate PCB files."""
         try:
-            board = pcbnew.BOARD()
-
-            # Set board dimensions
-            board_width = pcbnew.FromMM(config.board_size[0])
-            board_height = pcbnew.FromMM(config.board_size[1])
-            
-            # Create board outline
-            outline = [
-                pcbnew.VECTOR2I(0, 0),
-                pcbnew.VECTOR2I(board_width, 0),
-                pcbnew.VECTOR2I(board_width, board_height),
-                pcbnew.VECTOR2I(0, board_height),
-                pcbnew.VECTOR2I(0, 0)
-            ]
-            for i in range(len(outline) - 1):
-                segment = pcbnew.PCB_SHAPE(board, pcbnew.SHAPE_T_SEGMENT)
-                segment.SetStart(outline[i])
-                segment.SetEnd(outline[i+1])
-                segment.SetLayer(pcbnew.Edge_Cuts)
-                segment.SetWidth(pcbnew.FromMM(0.15))
-                board.Add(segment)
+            with span("board_outline", width_mm=config.board_size[0], height_mm=config.board_size[1]):
+                board = pcbnew.BOARD()
+
+                # Set board dimensions
+                board_width = pcbnew.FromMM(config.board_size[0])
+                board_height = pcbnew.FromMM(config.board_size[1])
+            
+                # Create board outline
+                outline = [
+                    pcbnew.VECTOR2I(0, 0),
+                    pcbnew.VECTOR2I(board_width, 0),
+                    pcbnew.VECTOR2I(board_width, board_height),
+                    pcbnew.VECTOR2I(0, board_height),
+                    pcbnew.VECTOR2I(0, 0)
+                ]
+                for i in range(len(outline) - 1):
+                    segment = pcbnew.PCB_SHAPE(board, pcbnew.SHAPE_T_SEGMENT)
+                    segment.SetStart(outline[i])
+                    segment.SetEnd(outline[i+1])
+                    segment.SetLayer(pcbnew.Edge_Cuts)
+                    segment.SetWidth(pcbnew.FromMM(0.15))
+                    board.Add(segment)
             
             # ------------------------------------------------------------------
             # 2.  Instantiate footprints from netlist (if provided)
             # ------------------------------------------------------------------
-            if netlist is not None and netlist.footprints:
-                instantiate_footprints(board, netlist)
-
-            # Instantiate and configure layer stack-up
-            try:
-                layer_manager = LayerManager(board)
-                if config.stackup:
-                    for item in config.stackup:
-                        try:
-                            layer_id = item.get("layer_id") if "layer_id" in item else layer_manager.board.GetLayerID(item["name"]) if hasattr(layer_manager.board, "GetLayerID") else None
-                            if layer_id is None:
-                                self.logger.warning("Unknown layer id/name in stackup item %s", item)
-                                continue
-
-                            layer_type = LayerType(item.get("type", "signal")) if isinstance(item.get("type"), str) else LayerType(item.get("type", LayerType.SIGNAL))
-                            lp = LayerProperties(
-                                name=item.get("name", f"Layer_{layer_id}"),
-                                type=layer_type,
-                                copper_weight=item.get("copper_weight", 1.0),
-                                dielectric_constant=item.get("dielectric_constant", 4.5),
-                                loss_tangent=item.get("loss_tangent", 0.02),
-                                thickness=item.get("thickness", 0.035),
-                                min_trace_width=item.get("min_trace_width", config.min_trace_width),
-                                min_clearance=item.get("min_clearance", config.min_clearance),
-                            )
-
-                            layer_manager.set_layer_properties(layer_id, lp)
-                        except Exception as lp_exc:
-                            self.logger.warning("Failed to apply stackup layer %s: %s", item, lp_exc)
-                else:
-                    layer_manager.optimize_for_audio()
-            except Exception as exc:
-                logger.warning("LayerManager configuration skipped: %s", exc)
+            with span("footprint_instantiation"):
+                if netlist is not None and netlist.footprints:
+                    instantiate_footprints(board, netlist)
+
+            with span("layer_setup"):
+                # Instantiate and configure layer stack-up
+                try:
+                    layer_manager = LayerManager(board)
+                    if config.stackup:
+                        for item in config.stackup:
+                            try:
+                                layer_id = item.get("layer_id") if "layer_id" in item else layer_manager.board.GetLayerID(item["name"]) if hasattr(layer_manager.board, "GetLayerID") else None
+                                if layer_id is None:
+                                    self.logger.warning("Unknown layer id/name in stackup item %s", item)
+                                    continue
+
+                                layer_type = LayerType(item.get("type", "signal")) if isinstance(item.get("type"), str) else LayerType(item.get("type", LayerType.SIGNAL))
+                                lp = LayerProperties(
+                                    name=item.get("name", f"Layer_{layer_id}"),
+                                    type=layer_type,
+                                    copper_weight=item.get("copper_weight", 1.0),
+                                    dielectric_constant=item.get("dielectric_constant", 4.5),
+                                    loss_tangent=item.get("loss_tangent", 0.02),
+                                    thickness=item.get("thickness", 0.035),
+                                    min_trace_width=item.get("min_trace_width", config.min_trace_width),
+                                    min_clearance=item.get("min_clearance", config.min_clearance),
+                                )
+
+                                layer_manager.set_layer_properties(layer_id, lp)
+                            except Exception as lp_exc:
+                                self.logger.warning("Failed to apply stackup layer %s: %s", item, lp_exc)
+                    else:
+                        layer_manager.optimize_for_audio()
+                except Exception as exc:
+                    logger.warning("LayerManager configuration skipped: %s", exc)
 
             # ------------------------------------------------------------------
             # 3.  Automatic placement & initial routing (layout optimizer)
             # ------------------------------------------------------------------
-            try:
-                constraints = LayoutConstraints(
-                    min_track_width=config.min_trace_width,
-                    min_clearance=config.min_clearance,
-                    min_via_size=config.min_via_size,
-                    # Fallback values for unused fields
-                    max_component_density=0.15,
-                    max_track_density=0.5,
-                    min_thermal_pad_size=1.0,
-                    max_parallel_tracks=4,
-                    min_power_track_width=max(config.min_trace_width * 2, 0.2),
-                    max_high_speed_length=100.0,
-                )
-
-                layout_opt = LayoutOptimizer(board, constraints=constraints)
-                layout_opt.optimize_layout()
-            except Exception as exc:
-                logger.warning("Layout optimization skipped or failed: %s", exc)
+            with span("layout"):
+                try:
+                    constraints = LayoutConstraints(
+                        min_track_width=config.min_trace_width,
+                        min_clearance=config.min_clearance,
+                        min_via_size=config.min_via_size,
+                        # Fallback values for unused fields
+                        max_component_density=0.15,
+                        max_track_density=0.5,
+                        min_thermal_pad_size=1.0,
+                        max_parallel_tracks=4,
+                        min_power_track_width=max(config.min_trace_width * 2, 0.2),
+                        max_high_speed_length=100.0,
+                    )
+
+                    layout_opt = LayoutOptimizer(board, constraints=constraints)
+                    layout_opt.optimize_layout()
+                except Exception as exc:
+                    logger.warning("Layout optimization skipped or failed: %s", exc)
 
             # ------------------------------------------------------------------
             # 4.  Autorouting & Connectivity (AudioRouter)
             # ------------------------------------------------------------------
-            try:
-                router = AudioRouter(board)
-                router.optimize_audio_routing()
-                routing_issues = router.validate_routing()
-                if routing_issues:
-                    self.logger.warning("Routing validation found %d issues", len(routing_issues))
-            except Exception as exc:
-                logger.warning("Audio routing step skipped or failed: %s", exc)
+            with span("routing"):
+                try:
+                    router = AudioRouter(board)
+                    router.optimize_audio_routing()
+                    routing_issues = router.validate_routing()
+                    if routing_issues:
+                        self.logger.warning("Routing validation found %d issues", len(routing_issues))
+                except Exception as exc:
+                    logger.warning("Audio routing step skipped or failed: %s", exc)
 
             # ------------------------------------------------------------------
             # 5.  Incremental Validation (Integrated Validation Loop)
             # ------------------------------------------------------------------
-            try:
-                bvalidator = BoardValidator()
-                validation_results = bvalidator.validate_board(board)
-                issues = sum(len(v) for v in validation_results.values())
-                if issues > 0:
-                    self.logger.warning("Incremental board validation found %d issues", issues)
-            except Exception as exc:
-                logger.warning("Incremental BoardValidator step skipped or failed: %s", exc)
-
-            # Save .kicad_pcb file
-            pcb_file_path = output_path / f"{project_config.name}.kicad_pcb"
-            board.Save(str(pcb_file_path))
-
-            # Create empty .kicad_sch file as a placeholder
-            sch_file = output_path / f"{project_config.name}.kicad_sch"
-            sch_file.write_text(f"(kicad_sch (version 20211027) (generator {self.__class__.__name__}))")
+            with span("validation"):
+                try:
+                    bvalidator = BoardValidator()
+                    validation_results = bvalidator.validate_board(board)
+                    issues = sum(len(v) for v in validation_results.values())
+                    if issues > 0:
+                        self.logger.warning("Incremental board validation found %d issues", issues)
+                except Exception as exc:
+                    logger.warning("Incremental BoardValidator step skipped or failed: %s", exc)
+
+            with span("save"):
+                # Save .kicad_pcb file
+                pcb_file_path = output_path / f"{project_config.name}.kicad_pcb"
+                board.Save(str(pcb_file_path))
+
+                # Create empty .kicad_sch file as a placeholder
+                sch_file = output_path / f"{project_config.name}.kicad_sch"
+                sch_file.write_text(f"(kicad_sch (version 20211027) (generator {self.__class__.__name__}))")
 
             return PCBGenerationResult(
                 success=True,
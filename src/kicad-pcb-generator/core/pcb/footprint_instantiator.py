@@ -46,7 +46,10 @@ def instantiate_footprints(board: pcbnew.BOARD, netlist: Netlist) -> None:
     later.  Pads are renamed to match the schematic pad names to preserve
     connectivity when a router is plugged in.
     """
-    for fp_data in netlist.footprints:
+    index = netlist.index
+    netcodes: Dict[int, int] = {}  # interned net id -> board net code
+
+    for fp_id, fp_data in enumerate(netlist.footprints):
         footprint = _load_footprint_from_library(fp_data.lib_id) or pcbnew.FOOTPRINT()
         footprint.SetReference(fp_data.ref)
         footprint.SetValue(fp_data.value)
@@ -70,24 +73,27 @@ def instantiate_footprints(board: pcbnew.BOARD, netlist: Netlist) -> None:
             continue  # headless env – skip pad→net linking
 
         try:
-            netcode_cache: Dict[str, int] = {}
-
-            for pad_conn in fp_data.pad_connections:
-                pad = footprint.FindPadByName(pad_conn.pad_name)
-                if pad is None:
+            pads_by_name: Dict[str, pcbnew.PAD] = {}
+            for pad in footprint.Pads():
+                pads_by_name.setdefault(pad.GetName(), pad)  # first match, as FindPadByName
+
+            for pad_id in range(index.pad_offsets[fp_id], index.pad_offsets[fp_id + 1]):
+                pad = pads_by_name.get(index.pad_names[pad_id])
+                net_id = index.pad_net_ids[pad_id]
+                if pad is None or net_id < 0:
                     continue
 
-                net_name = pad_conn.net_name
-                if net_name not in netcode_cache:
+                if net_id not in netcodes:
                     # create or fetch net
+                    net_name = index.net_names[net_id]
                     net = board.FindNet(net_name)
                     if net is None:
                         new_net = pcbnew.NETINFO_ITEM(board, net_name)
                         board.Add(new_net)
-                        netcode_cache[net_name] = new_net.GetNet()
+                        netcodes[net_id] = new_net.GetNet()
                     else:
-                        netcode_cache[net_name] = net.GetNet()
+                        netcodes[net_id] = net.GetNet()
 
-                pad.SetNetCode(netcode_cache[net_name])
+                pad.SetNetCode(netcodes[net_id])
         except Exception as exc:
             logger.warning("Failed to assign nets for footprint %s: %s", fp_data.ref, exc) 
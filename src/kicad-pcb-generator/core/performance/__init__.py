@@ -25,7 +25,8 @@ from .optimization_manager import (
     OptimizationManager,
     OptimizationConfig,
     OptimizationType,
-    OptimizationStatus
+    OptimizationStatus,
+    releases_gil
 )
 
 __all__ = [
@@ -51,5 +52,6 @@ __all__ = [
     'OptimizationManager',
     'OptimizationConfig',
     'OptimizationType',
-    'OptimizationStatus'
+    'OptimizationStatus',
+    'releases_gil'
 ] 
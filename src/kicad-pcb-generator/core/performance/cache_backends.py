@@ -0,0 +1,507 @@
+"""
+Pluggable cache backends for the optimization manager.
+
+``TieredCache`` combines an in-memory LRU bounded by bytes with a single
+sqlite file written behind by a background thread. Each value is pickled
+once: the same bytes size the memory entry and go to disk. Values that
+cannot be pickled (SWIG proxies, open handles) stay memory-only. Every
+entry belongs to a namespace, normally the cached function, and hit/miss
+counters are kept per namespace.
+"""
+import logging
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, TypedDict, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 3600.0  # seconds
+
+CacheKey = Tuple[str, str]
+
+
+class NamespaceSize(TypedDict):
+    """Entries and bytes of one namespace in one tier."""
+    entries: int
+    bytes: int
+
+
+class TierStats(TypedDict):
+    """Statistics of a memory tier."""
+    entries: int
+    bytes: int
+    max_bytes: int
+    evictions: int
+    namespaces: Dict[str, NamespaceSize]
+
+
+class DiskStats(TierStats):
+    """Statistics of a disk tier."""
+    file_bytes: int
+
+
+class NamespaceStats(TypedDict):
+    """Hit/miss counters and sizes of one namespace across tiers."""
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    sets: int
+    memory_only: int
+    hit_rate: float
+    memory_entries: int
+    memory_bytes: int
+    disk_entries: int
+    disk_bytes: int
+
+
+class TieredStats(TypedDict):
+    """Statistics of a tiered cache."""
+    memory: TierStats
+    disk: DiskStats
+    namespaces: Dict[str, NamespaceStats]
+
+
+class CacheBackend(ABC):
+    """Interface of the optimization manager's cache."""
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Get a value, or None on a miss."""
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Store a value."""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        """Remove a value."""
+
+    @abstractmethod
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Remove every value, or those of one namespace."""
+
+    @abstractmethod
+    def stats(self) -> Mapping[str, Any]:
+        """Get cache statistics."""
+
+    def close(self) -> None:
+        """Release resources; pending writes are completed."""
+
+
+class MemoryLRUCache(CacheBackend):
+    """In-memory LRU cache bounded by the pickled size of its values."""
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, ttl: float = DEFAULT_TTL):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of the cached values
+            ttl: Entry lifetime in seconds
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return None
+            if time.time() - entry[2] >= self.ttl:
+                self._remove((namespace, key))
+                return None
+            self._entries.move_to_end((namespace, key))
+            return entry[0]
+
+    def set(self, namespace: str, key: str, value: Any, size: Optional[int] = None) -> None:
+        """Store a value.
+
+        Args:
+            namespace: Entry namespace
+            key: Entry key
+            value: Value to cache
+            size: Size in bytes, if already known (e.g. the pickled length)
+        """
+        if size is None:
+            size = _value_size(value)[0]
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._remove((namespace, key))
+            self._entries[(namespace, key)] = (value, size, time.time())
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._remove((namespace, key))
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        with self._lock:
+            for entry_key in [k for k in self._entries if namespace is None or k[0] == namespace]:
+                self._remove(entry_key)
+
+    def stats(self) -> TierStats:
+        with self._lock:
+            namespaces: Dict[str, NamespaceSize] = {}
+            for (namespace, _), (_, size, _) in self._entries.items():
+                counts = namespaces.setdefault(namespace, {'entries': 0, 'bytes': 0})
+                counts['entries'] += 1
+                counts['bytes'] += size
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'evictions': self._evictions,
+                'namespaces': namespaces
+            }
+
+    def _remove(self, entry_key: CacheKey) -> None:
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+
+class SQLiteCache(CacheBackend):
+    """Disk cache in one sqlite file with asynchronous write-behind.
+
+    Writes and access-time updates are queued and applied in batches by a
+    background thread; reads see queued writes immediately. The file is
+    pruned to ``max_bytes`` by least recent access.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = 1024 * 1024 * 1024,
+        ttl: float = DEFAULT_TTL,
+        flush_interval: float = 0.5
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: sqlite database file
+            max_bytes: Maximum total size of the stored values
+            ttl: Entry lifetime in seconds
+            flush_interval: Maximum delay before queued writes are applied
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.flush_interval = flush_interval
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._db_lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._db_lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+            )
+            self._connection.commit()
+
+        # Queued writes: payload and creation time, or None for a delete. A
+        # batch stays readable in _inflight until its transaction commits.
+        self._pending: Dict[CacheKey, Optional[Tuple[bytes, float]]] = {}
+        self._inflight: Dict[CacheKey, Optional[Tuple[bytes, float]]] = {}
+        self._flush_lock = threading.Lock()
+        self._touched: Dict[CacheKey, float] = {}
+        self._pending_lock = threading.Condition()
+        self._evictions = 0
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_behind, name="cache-writer",
+                                        daemon=True)
+        self._writer.start()
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        payload = self.get_payload(namespace, key)
+        if payload is None:
+            return None
+        try:
+            return pickle.loads(payload)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {namespace}/{key}: {e}")
+            self.delete(namespace, key)
+            return None
+
+    def get_payload(self, namespace: str, key: str) -> Optional[bytes]:
+        """Get the pickled bytes of a value, or None on a miss."""
+        entry_key = (namespace, key)
+        now = time.time()
+        with self._pending_lock:
+            for queue in (self._pending, self._inflight):
+                if entry_key in queue:
+                    pending = queue[entry_key]
+                    if pending is None or now - pending[1] >= self.ttl:
+                        return None
+                    return pending[0]
+        with self._db_lock:
+            row = self._connection.execute(
+                "SELECT value, created FROM entries WHERE namespace = ? AND key = ?", entry_key
+            ).fetchone()
+        if row is None or now - row[1] >= self.ttl:
+            return None
+        with self._pending_lock:
+            self._touched[entry_key] = now
+        payload: bytes = row[0]
+        return payload
+
+    def set(self, namespace: str, key: str, value: Any, payload: Optional[bytes] = None) -> None:
+        """Queue a value for writing.
+
+        Args:
+            namespace: Entry namespace
+            key: Entry key
+            value: Value to cache
+            payload: Pickled value, if already available
+        """
+        if payload is None:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return
+        with self._pending_lock:
+            self._pending[(namespace, key)] = (payload, time.time())
+            self._pending_lock.notify()
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._pending_lock:
+            self._pending[(namespace, key)] = None
+            self._pending_lock.notify()
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        with self._flush_lock:
+            with self._pending_lock:
+                for entry_key in [k for k in self._pending
+                                  if namespace is None or k[0] == namespace]:
+                    del self._pending[entry_key]
+            with self._db_lock:
+                if namespace is None:
+                    self._connection.execute("DELETE FROM entries")
+                else:
+                    self._connection.execute(
+                        "DELETE FROM entries WHERE namespace = ?", (namespace,)
+                    )
+                self._connection.commit()
+
+    def stats(self) -> DiskStats:
+        self.flush()
+        with self._db_lock:
+            rows = self._connection.execute(
+                "SELECT namespace, COUNT(*), COALESCE(SUM(size), 0) FROM entries GROUP BY namespace"
+            ).fetchall()
+        try:
+            file_bytes = self.path.stat().st_size
+        except OSError:
+            file_bytes = 0
+        return {
+            'entries': sum(row[1] for row in rows),
+            'bytes': sum(row[2] for row in rows),
+            'file_bytes': file_bytes,
+            'max_bytes': self.max_bytes,
+            'evictions': self._evictions,
+            'namespaces': {row[0]: {'entries': row[1], 'bytes': row[2]} for row in rows}
+        }
+
+    def flush(self) -> None:
+        """Apply queued writes now."""
+        with self._flush_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+                touched, self._touched = self._touched, {}
+                self._inflight = pending
+            if pending or touched:
+                self._apply(pending, touched)
+            with self._pending_lock:
+                self._inflight = {}
+
+    def _apply(self, pending: Dict[CacheKey, Optional[Tuple[bytes, float]]],
+               touched: Dict[CacheKey, float]) -> None:
+        """Write one batch in a single transaction."""
+        writes = [(ns, key, value[0], len(value[0]), value[1], value[1])
+                  for (ns, key), value in pending.items() if value is not None]
+        deletes = [entry_key for entry_key, value in pending.items() if value is None]
+        try:
+            with self._db_lock:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO entries "
+                    "(namespace, key, value, size, created, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", writes
+                )
+                self._connection.executemany(
+                    "DELETE FROM entries WHERE namespace = ? AND key = ?", deletes
+                )
+                self._connection.executemany(
+                    "UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?",
+                    [(accessed, ns, key) for (ns, key), accessed in touched.items()]
+                )
+                self._connection.execute(
+                    "DELETE FROM entries WHERE created < ?", (time.time() - self.ttl,)
+                )
+                self._prune()
+                self._connection.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error writing cache database {self.path}: {e}")
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        with self._pending_lock:
+            self._pending_lock.notify()
+        self._writer.join()
+        self.flush()
+        with self._db_lock:
+            self._connection.close()
+
+    def _write_behind(self) -> None:
+        while True:
+            with self._pending_lock:
+                if not self._pending and not self._touched and not self._closed:
+                    self._pending_lock.wait(self.flush_interval)
+            if self._closed:
+                break
+            # Let a burst of writes accumulate into one transaction
+            time.sleep(self.flush_interval / 10)
+            self.flush()
+
+    def _prune(self) -> None:
+        """Evict least recently accessed entries beyond ``max_bytes`` (db lock held)."""
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims: List[Tuple[str, str]] = []
+        for namespace, key, size in self._connection.execute(
+                "SELECT namespace, key, size FROM entries ORDER BY accessed"):
+            if total <= self.max_bytes:
+                break
+            victims.append((namespace, key))
+            total -= size
+        self._connection.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", victims)
+        self._evictions += len(victims)
+
+
+class TieredCache(CacheBackend):
+    """Memory LRU in front of a write-behind disk cache."""
+
+    def __init__(self, memory: MemoryLRUCache, disk: Optional[SQLiteCache] = None):
+        """Initialize the cache.
+
+        Args:
+            memory: In-memory tier
+            disk: Optional disk tier
+        """
+        self.memory = memory
+        self.disk = disk
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        value = self.memory.get(namespace, key)
+        if value is not None:
+            self._count(namespace, 'memory_hits')
+            return value
+        if self.disk is not None:
+            payload = self.disk.get_payload(namespace, key)
+            if payload is not None:
+                try:
+                    value = pickle.loads(payload)
+                except Exception as e:
+                    logger.warning(f"Discarding unreadable cache entry {namespace}/{key}: {e}")
+                    self.disk.delete(namespace, key)
+                else:
+                    self.memory.set(namespace, key, value, size=len(payload))
+                    self._count(namespace, 'disk_hits')
+                    return value
+        self._count(namespace, 'misses')
+        return None
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        size, payload = _value_size(value)
+        self.memory.set(namespace, key, value, size=size)
+        if payload is None:
+            self._count(namespace, 'memory_only')
+        elif self.disk is not None:
+            self.disk.set(namespace, key, value, payload=payload)
+        self._count(namespace, 'sets')
+
+    def delete(self, namespace: str, key: str) -> None:
+        self.memory.delete(namespace, key)
+        if self.disk is not None:
+            self.disk.delete(namespace, key)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        self.memory.clear(namespace)
+        if self.disk is not None:
+            self.disk.clear(namespace)
+        with self._lock:
+            for name in [n for n in self._counters if namespace is None or n == namespace]:
+                del self._counters[name]
+
+    def stats(self) -> TieredStats:
+        memory = self.memory.stats()
+        if self.disk is not None:
+            disk = self.disk.stats()
+        else:
+            disk = {'entries': 0, 'bytes': 0, 'file_bytes': 0, 'max_bytes': 0,
+                    'evictions': 0, 'namespaces': {}}
+        with self._lock:
+            counters = {name: dict(values) for name, values in self._counters.items()}
+
+        empty: NamespaceSize = {'entries': 0, 'bytes': 0}
+        namespaces: Dict[str, NamespaceStats] = {}
+        for name in set(counters) | set(memory['namespaces']) | set(disk['namespaces']):
+            counts = counters.get(name, {})
+            hits = counts.get('memory_hits', 0) + counts.get('disk_hits', 0)
+            lookups = hits + counts.get('misses', 0)
+            in_memory = memory['namespaces'].get(name, empty)
+            on_disk = disk['namespaces'].get(name, empty)
+            namespaces[name] = {
+                'memory_hits': counts.get('memory_hits', 0),
+                'disk_hits': counts.get('disk_hits', 0),
+                'misses': counts.get('misses', 0),
+                'sets': counts.get('sets', 0),
+                'memory_only': counts.get('memory_only', 0),
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'memory_entries': in_memory['entries'],
+                'memory_bytes': in_memory['bytes'],
+                'disk_entries': on_disk['entries'],
+                'disk_bytes': on_disk['bytes']
+            }
+        return {'memory': memory, 'disk': disk, 'namespaces': namespaces}
+
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
+
+    def _count(self, namespace: str, name: str) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(namespace, {})
+            counters[name] = counters.get(name, 0) + 1
+
+
+def _value_size(value: Any) -> Tuple[int, Optional[bytes]]:
+    """Pickled size and bytes of a value; shallow size and None if unpicklable."""
+    try:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return sys.getsizeof(value), None
+    return len(payload), payload
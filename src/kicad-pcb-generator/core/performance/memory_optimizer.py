@@ -165,10 +165,20 @@ class MemoryOptimizer(BaseManager[MemoryMetrics]):
         """Set baseline memory usage."""
         process = psutil.Process()
         self._baseline_memory = process.memory_info().rss
-        self._baseline_objects = len(gc.get_objects())
+        self._baseline_objects = self._object_count()
         
         self.logger.debug(f"Memory baseline set: {self._baseline_memory / (1024*1024):.2f}MB")
     
+    @staticmethod
+    def _object_count() -> int:
+        """Cheap live-object estimate for periodic monitoring.
+        
+        ``len(gc.get_objects())`` builds a list of every tracked object and
+        takes tens of milliseconds on large sessions; the interpreter's
+        allocated-block count is O(1) and tracks the same growth.
+        """
+        return sys.getallocatedblocks()
+    
     def _monitor_memory(self, interval: float) -> None:
         """Monitor memory usage.
         
@@ -181,7 +191,7 @@ class MemoryOptimizer(BaseManager[MemoryMetrics]):
             try:
                 # Collect current memory metrics
                 current_memory = process.memory_info().rss
-                current_objects = len(gc.get_objects())
+                current_objects = self._object_count()
                 gc_collections = gc.get_count()
                 
                 # Create metrics
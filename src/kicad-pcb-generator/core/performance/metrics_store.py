@@ -0,0 +1,350 @@
+"""
+Append-only columnar store for performance metrics.
+
+Recent measurements live in memory as NumPy columns sorted by
+(component, timestamp), so a component/time-range query is two binary
+searches instead of a scan. Appends go to a small unsorted tail that is
+merged in on the next query or when it grows past ``compact_threshold``;
+the merge also evicts the oldest rows beyond ``capacity``.
+
+Every measurement is appended to a line-delimited JSON segment,
+``<directory>/<component>/<YYYYMMDD_HH>.jsonl``, one per component and
+hour. Queries reaching back past the in-memory window, including into
+earlier sessions, read only the segments overlapping the requested range.
+"""
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_FORMAT = "%Y%m%d_%H"
+SEGMENT_SPAN = timedelta(hours=1)
+SEGMENT_SUFFIX = ".jsonl"
+
+NUMERIC_COLUMNS = ("execution_time", "memory_usage", "cpu_usage")
+
+_MICROSECONDS = 1_000_000
+
+
+def to_microseconds(timestamp: datetime) -> int:
+    """Epoch microseconds of a timestamp (naive timestamps are local time)."""
+    return int(round(timestamp.timestamp() * _MICROSECONDS))
+
+
+def from_microseconds(value: int) -> datetime:
+    """Local naive timestamp of epoch microseconds."""
+    seconds, micros = divmod(int(value), _MICROSECONDS)
+    return datetime.fromtimestamp(seconds) + timedelta(microseconds=micros)
+
+
+class MetricsStore:
+    """Ring-buffered columnar metrics with time-partitioned segment files."""
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        capacity: int = 100_000,
+        compact_threshold: int = 4096,
+        flush_threshold: int = 256,
+        flush_interval: float = 5.0
+    ):
+        """Initialize the store.
+
+        Args:
+            directory: Directory of the segment files
+            capacity: Maximum number of measurements kept in memory
+            compact_threshold: Tail length that triggers a merge
+            flush_threshold: Buffered lines that trigger a disk write
+            flush_interval: Maximum age in seconds of buffered lines
+        """
+        self.directory = Path(directory)
+        self.capacity = capacity
+        self.compact_threshold = compact_threshold
+        self.flush_threshold = flush_threshold
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+
+        self._components: List[str] = []
+        self._component_codes: Dict[str, int] = {}
+        self._operations: List[str] = []
+        self._operation_codes: Dict[str, int] = {}
+
+        self._columns = self._empty_columns()
+        self._tail: List[Tuple[int, int, int, float, float, float, Dict[str, Any]]] = []
+        # Everything at or before this time (epoch us) is only on disk; segments
+        # left by earlier sessions are treated as evicted
+        self._horizon: Optional[int] = None
+        if self.directory.is_dir() and next(self.directory.glob(f"*/*{SEGMENT_SUFFIX}"), None):
+            self._horizon = to_microseconds(datetime.now())
+
+        self._pending: Dict[Path, List[str]] = {}
+        self._pending_count = 0
+        self._pending_since = 0.0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._columns["timestamp"]) + len(self._tail)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def append(
+        self,
+        component_id: str,
+        operation: str,
+        timestamp: datetime,
+        execution_time: float,
+        memory_usage: float,
+        cpu_usage: float,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Append one measurement."""
+        metadata = metadata or {}
+        line = json.dumps({
+            'component_id': component_id,
+            'operation': operation,
+            'execution_time': execution_time,
+            'memory_usage': memory_usage,
+            'cpu_usage': cpu_usage,
+            'timestamp': timestamp.isoformat(),
+            'metadata': metadata
+        }, default=str)
+        segment_name = f"{timestamp.strftime(SEGMENT_FORMAT)}{SEGMENT_SUFFIX}"
+        segment = self.directory / component_id / segment_name
+
+        with self._lock:
+            self._tail.append((
+                to_microseconds(timestamp),
+                self._intern(component_id, self._components, self._component_codes),
+                self._intern(operation, self._operations, self._operation_codes),
+                float(execution_time), float(memory_usage), float(cpu_usage),
+                metadata
+            ))
+            if not self._pending_count:
+                self._pending_since = time.monotonic()
+            self._pending.setdefault(segment, []).append(line)
+            self._pending_count += 1
+
+            if len(self._tail) >= self.compact_threshold:
+                self.compact()
+            if (self._pending_count >= self.flush_threshold
+                    or time.monotonic() - self._pending_since >= self.flush_interval):
+                self.flush()
+
+    def flush(self) -> None:
+        """Write buffered measurements to their segment files."""
+        with self._lock:
+            pending, self._pending, self._pending_count = self._pending, {}, 0
+            for segment, lines in pending.items():
+                try:
+                    segment.parent.mkdir(parents=True, exist_ok=True)
+                    with open(segment, 'a', encoding='utf-8') as f:
+                        f.write("\n".join(lines) + "\n")
+                except OSError as e:
+                    logger.error(f"Error writing metrics segment {segment}: {e}")
+
+    def compact(self) -> None:
+        """Merge the tail into the sorted columns and evict beyond capacity."""
+        with self._lock:
+            if not self._tail:
+                return
+            tail = list(zip(*self._tail))
+            self._tail = []
+            dtypes = [("timestamp", np.int64), ("component", np.int32), ("operation", np.int32)]
+            dtypes += [(name, float) for name in NUMERIC_COLUMNS]
+            columns = {
+                name: np.concatenate([self._columns[name], np.array(tail[offset], dtype=dtype)])
+                for offset, (name, dtype) in enumerate(dtypes)
+            }
+
+            metadata = np.empty(len(tail[6]), dtype=object)
+            metadata[:] = tail[6]
+            columns["metadata"] = np.concatenate([self._columns["metadata"], metadata])
+
+            if self._horizon is not None:
+                # Late arrivals older than the memory window only live on disk
+                keep = columns["timestamp"] > self._horizon
+                columns = {name: values[keep] for name, values in columns.items()}
+
+            excess = len(columns["timestamp"]) - self.capacity
+            if excess > 0:
+                cutoff = int(np.partition(columns["timestamp"], excess - 1)[excess - 1])
+                self._horizon = cutoff if self._horizon is None else max(self._horizon, cutoff)
+                keep = columns["timestamp"] > cutoff
+                columns = {name: values[keep] for name, values in columns.items()}
+
+            order = np.lexsort((columns["timestamp"], columns["component"]))
+            self._columns = {name: values[order] for name, values in columns.items()}
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def select(
+        self,
+        component_id: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> Dict[str, np.ndarray]:
+        """Measurements in a component and time range, in time order.
+
+        Args:
+            component_id: Optional component ID to filter by
+            start_time: Optional inclusive start time
+            end_time: Optional inclusive end time
+
+        Returns:
+            Columns ``timestamp`` (epoch microseconds), ``component_id``,
+            ``operation``, ``execution_time``, ``memory_usage``,
+            ``cpu_usage`` and ``metadata``
+        """
+        start = to_microseconds(start_time) if start_time else None
+        end = to_microseconds(end_time) if end_time else None
+        with self._lock:
+            self.compact()
+            columns = self._select_memory(component_id, start, end)
+            if self._horizon is not None and (start is None or start <= self._horizon):
+                self.flush()
+                older_end = self._horizon if end is None else min(end, self._horizon)
+                older = self._select_disk(component_id, start, older_end)
+                columns = {name: np.concatenate([older[name], columns[name]]) for name in columns}
+
+        order = np.argsort(columns["timestamp"], kind="stable")
+        return {name: values[order] for name, values in columns.items()}
+
+    def _select_memory(self, component_id: Optional[str], start: Optional[int],
+                       end: Optional[int]) -> Dict[str, np.ndarray]:
+        timestamps = self._columns["timestamp"]
+        if component_id is not None:
+            code = self._component_codes.get(component_id)
+            if code is None:
+                return self._decode(self._empty_columns())
+            lo = int(np.searchsorted(self._columns["component"], code, side="left"))
+            hi = int(np.searchsorted(self._columns["component"], code, side="right"))
+            if start is not None:
+                lo += int(np.searchsorted(timestamps[lo:hi], start, side="left"))
+            if end is not None:
+                hi = lo + int(np.searchsorted(timestamps[lo:hi], end, side="right"))
+            selection: Any = slice(lo, hi)
+        else:
+            mask = np.ones(len(timestamps), dtype=bool)
+            if start is not None:
+                mask &= timestamps >= start
+            if end is not None:
+                mask &= timestamps <= end
+            selection = mask
+        return self._decode({name: values[selection] for name, values in self._columns.items()})
+
+    def _select_disk(self, component_id: Optional[str], start: Optional[int],
+                     end: int) -> Dict[str, np.ndarray]:
+        """Read evicted measurements from the overlapping segment files."""
+        if component_id is not None:
+            directories = [self.directory / component_id]
+        else:
+            directories = [path for path in self.directory.iterdir() if path.is_dir()] \
+                if self.directory.is_dir() else []
+
+        records = []
+        for directory in directories:
+            for segment in sorted(directory.glob(f"*{SEGMENT_SUFFIX}")):
+                try:
+                    segment_start = datetime.strptime(segment.stem, SEGMENT_FORMAT)
+                except ValueError:
+                    continue
+                if to_microseconds(segment_start) > end:
+                    continue
+                if start is not None and to_microseconds(segment_start + SEGMENT_SPAN) <= start:
+                    continue
+                try:
+                    with open(segment, encoding='utf-8') as f:
+                        for line in f:
+                            if not line.strip():
+                                continue
+                            record = json.loads(line)
+                            timestamp = to_microseconds(datetime.fromisoformat(record['timestamp']))
+                            if timestamp <= end and (start is None or timestamp >= start):
+                                records.append((timestamp, record))
+                except (OSError, ValueError, KeyError) as e:
+                    logger.error(f"Error reading metrics segment {segment}: {e}")
+
+        columns: Dict[str, np.ndarray] = {
+            "timestamp": np.array([t for t, _ in records], dtype=np.int64),
+            "component_id": np.array([r['component_id'] for _, r in records], dtype=object),
+            "operation": np.array([r['operation'] for _, r in records], dtype=object),
+        }
+        for name in NUMERIC_COLUMNS:
+            columns[name] = np.array([r[name] for _, r in records], dtype=float)
+        metadata = np.empty(len(records), dtype=object)
+        metadata[:] = [r.get('metadata', {}) for _, r in records]
+        columns["metadata"] = metadata
+        return columns
+
+    def _decode(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Replace interned codes with names."""
+        decoded = dict(columns)
+        decoded["component_id"] = np.array(self._components, dtype=object)[columns["component"]] \
+            if self._components else np.empty(0, dtype=object)
+        decoded["operation"] = np.array(self._operations, dtype=object)[columns["operation"]] \
+            if self._operations else np.empty(0, dtype=object)
+        del decoded["component"]
+        return decoded
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def clear(self, component_id: Optional[str] = None) -> None:
+        """Delete measurements from memory and disk.
+
+        Args:
+            component_id: Optional component ID; all components if omitted
+        """
+        with self._lock:
+            self.compact()
+            if component_id is None:
+                self._columns = self._empty_columns()
+                self._horizon = None
+                self._pending, self._pending_count = {}, 0
+                directories = [path for path in self.directory.iterdir() if path.is_dir()] \
+                    if self.directory.is_dir() else []
+            else:
+                code = self._component_codes.get(component_id)
+                if code is not None:
+                    keep = self._columns["component"] != code
+                    self._columns = {name: values[keep] for name, values in self._columns.items()}
+                component_dir = self.directory / component_id
+                for segment in [path for path in self._pending if path.parent == component_dir]:
+                    self._pending_count -= len(self._pending.pop(segment))
+                directories = [component_dir]
+
+            for directory in directories:
+                for segment in directory.glob(f"*{SEGMENT_SUFFIX}"):
+                    try:
+                        segment.unlink()
+                    except OSError as e:
+                        logger.error(f"Error deleting metrics segment {segment}: {e}")
+
+    @staticmethod
+    def _intern(name: str, names: List[str], codes: Dict[str, int]) -> int:
+        code = codes.get(name)
+        if code is None:
+            code = codes[name] = len(names)
+            names.append(name)
+        return code
+
+    @staticmethod
+    def _empty_columns() -> Dict[str, np.ndarray]:
+        columns = {
+            "timestamp": np.empty(0, dtype=np.int64),
+            "component": np.empty(0, dtype=np.int32),
+            "operation": np.empty(0, dtype=np.int32),
+            "metadata": np.empty(0, dtype=object)
+        }
+        for name in NUMERIC_COLUMNS:
+            columns[name] = np.empty(0, dtype=float)
+        return columns
@@ -3,21 +3,25 @@
 import time
 import threading
 import functools
+import gc
+import math
+import pickle
 import weakref
-from typing import Dict, List, Optional, Any, Callable, TypeVar, Generic
+from typing import Dict, List, Optional, Any, Callable, Iterable, Sequence, TypeVar
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 import logging
 import json
-import pickle
 from pathlib import Path
-import hashlib
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import multiprocessing
 
+from ..base.analysis_cache import fingerprint
 from ..base.base_manager import BaseManager
 from ..base.results.manager_result import ManagerResult, ManagerOperation, ManagerStatus
+from .cache_backends import CacheBackend, MemoryLRUCache, SQLiteCache, TieredCache
 
 
 class OptimizationType(Enum):
@@ -67,6 +71,44 @@ class OptimizationResult:
 
 
 T = TypeVar('T')
+R = TypeVar('R')
+
+
+def releases_gil(func: Callable[..., T]) -> Callable[..., T]:
+    """Mark a function whose work runs outside the GIL (numpy, scipy, I/O).
+
+    ``parallel_map`` runs marked functions on threads; unmarked ones go to
+    worker processes when they and their inputs can be pickled.
+    """
+    setattr(func, "releases_gil", True)
+    return func
+
+
+# Consecutive process pool failures after which parallel_map stops using it
+MAX_PROCESS_POOL_RESTARTS = 3
+
+
+class _TaskNotLoadable(Exception):
+    """A worker process could not unpickle a ``parallel_map`` task."""
+
+
+def _run_chunk(func: Callable[[Any], R], chunk: Sequence[Any]) -> List[R]:
+    """Apply ``func`` to one chunk of items (module level so it pickles)."""
+    return [func(item) for item in chunk]
+
+
+def _run_pickled_chunk(payload: bytes) -> List[Any]:
+    """Unpickle and run one chunk in a worker process.
+
+    Unpickling failures (e.g. a function defined after the workers forked)
+    are reported as ``_TaskNotLoadable`` so they are not confused with
+    exceptions raised by the function itself.
+    """
+    try:
+        func, chunk = pickle.loads(payload)
+    except Exception as e:
+        raise _TaskNotLoadable(f"{type(e).__name__}: {e}") from None
+    return _run_chunk(func, chunk)
 
 
 class OptimizationManager(BaseManager[OptimizationConfig]):
@@ -82,7 +124,9 @@ class OptimizationManager(BaseManager[OptimizationConfig]):
         cache_dir: Optional[str] = None,
         max_workers: int = None,
         enable_parallelization: bool = True,
-        enable_caching: bool = True
+        enable_caching: bool = True,
+        cache_backend: Optional[CacheBackend] = None,
+        memory_cache_bytes: int = 256 * 1024 * 1024
     ):
         """Initialize the optimization manager.
         
@@ -92,6 +136,9 @@ class OptimizationManager(BaseManager[OptimizationConfig]):
             max_workers: Maximum number of worker threads/processes
             enable_parallelization: Enable parallel processing
             enable_caching: Enable caching optimizations
+            cache_backend: Cache implementation; defaults to a memory LRU in
+                front of ``cache_dir/cache.sqlite3``
+            memory_cache_bytes: Size bound of the default memory tier
         """
         super().__init__()
         self.logger = logger or logging.getLogger(__name__)
@@ -108,9 +155,10 @@ class OptimizationManager(BaseManager[OptimizationConfig]):
         self._optimization_results: Dict[str, OptimizationResult] = {}
         
         # Caching system
-        self._cache: Dict[str, Any] = {}
-        self._cache_timestamps: Dict[str, float] = {}
-        self._cache_metadata: Dict[str, Dict[str, Any]] = {}
+        self._cache_backend = cache_backend or TieredCache(
+            MemoryLRUCache(max_bytes=memory_cache_bytes),
+            SQLiteCache(self.cache_dir / "cache.sqlite3")
+        )
         
         # Thread and process pools
         self._thread_pool: Optional[ThreadPoolExecutor] = None
@@ -120,6 +168,13 @@ class OptimizationManager(BaseManager[OptimizationConfig]):
         self._performance_history: List[Dict[str, Any]] = []
         self._optimization_stats: Dict[str, Dict[str, Any]] = {}
         
+        # Set inside parallel_map workers so nested calls run inline
+        self._worker_state = threading.local()
+        self._gc_lock = threading.Lock()
+        self._gc_paused = 0
+        self._gc_calls = 0
+        self._process_pool_failures = 0
+        
         # Initialize pools
         if enable_parallelization:
             self._initialize_pools()
@@ -199,8 +254,10 @@ class OptimizationManager(BaseManager[OptimizationConfig]):
             self.logger.error(f"Error registering optimization {config.optimization_id}: {e}")
             return ManagerResult[OptimizationConfig](
                 success=False,
-                error_message=f"Failed to register optimization: {e}",
-                data=None
+                operation=ManagerOperation.CREATE,
+                status=ManagerStatus.FAILED,
+                message=f"Failed to register optimization: {e}",
+                errors=[str(e)]
             )
     
     def get_optimization(self, optimization_id: str) -> Optional[OptimizationConfig]:
@@ -294,13 +351,17 @@ class OptimizationManager(BaseManager[OptimizationConfig]):
         Returns:
             Cached function
         """
+        namespace = f"{func.__module__}.{func.__qualname__}"
+        
         @functools.wraps(func)
         def cached_func(*args, **kwargs):
             # Generate cache key
             key = cache_key or self._generate_cache_key(func, args, kwargs)
+            if key is None:
+                return func(*args, **kwargs)
             
             # Check cache
-            cached_result = self._get_cache(key)
+            cached_result = self._get_cache(key, namespace)
             if cached_result is not None:
                 self.logger.debug(f"Cache hit for function {func.__name__}")
                 return cached_result
@@ -309,7 +370,7 @@ class OptimizationManager(BaseManager[OptimizationConfig]):
             result = func(*args, **kwargs)
             
             # Cache result
-            self._set_cache(key, result)
+            self._set_cache(key, result, namespace)
             
             return result
         
@@ -325,17 +386,200 @@ class OptimizationManager(BaseManager[OptimizationConfig]):
             Parallelized function
         """
         @functools.wraps(func)
-        def parallel_func(*args, **kwargs):
-            # Check if we have a thread pool
-            if self._thread_pool is None:
-                return func(*args, **kwargs)
-            
-            # Submit to thread pool
-            future = self._thread_pool.submit(func, *args, **kwargs)
-            return future.result()
+        def parallel_func(*args: Any, **kwargs: Any) -> T:
+            # A single call gains nothing from a pool hop
+            return func(*args, **kwargs)
         
+        # ``[f(x) for x in items]`` becomes ``f.map(items)``
+        setattr(parallel_func, "map", functools.partial(self.parallel_map, func))
         return parallel_func
     
+    def parallel_map(
+        self,
+        func: Callable[[Any], R],
+        items: Iterable[Any],
+        chunk_size: Optional[int] = None,
+        use_threads: Optional[bool] = None,
+        reduce: Optional[Callable[[Any, R], Any]] = None,
+        initial: Any = None
+    ) -> Any:
+        """Apply a function to every item, split into chunks across workers.
+        
+        Work that releases the GIL (see ``releases_gil``) runs on the thread
+        pool. Pure-Python work runs on the process pool when ``func`` and the
+        items can be pickled, and on threads otherwise. Results always come
+        back in input order, so the output does not depend on scheduling.
+        
+        An exception raised by ``func`` propagates and no chunk is retried.
+        Chunks a worker process could not load, or lost because the pool
+        broke, are run on threads instead; a broken pool is replaced.
+        
+        Args:
+            func: Function applied to each item
+            items: Items to process (nets, footprints, frequencies, ...)
+            chunk_size: Items per task; defaults to about four chunks per
+                worker, capped by the ``analysis_parallelization`` chunk size
+            use_threads: Force threads (True) or processes (False)
+            reduce: Optional ``reduce(accumulator, result)`` folded over the
+                results in input order
+            initial: Initial accumulator for ``reduce``; the first result
+                is used if omitted
+            
+        Returns:
+            List of results in input order, or the reduced value
+        """
+        items = list(items)
+        start_time = time.perf_counter()
+        executor = "serial"
+        
+        config = self._optimizations.get("analysis_parallelization")
+        parallel = (
+            self.enable_parallelization
+            and (config is None or config.enabled)
+            and len(items) > 1
+            and not getattr(self._worker_state, "active", False)
+        )
+        
+        if parallel:
+            max_workers = config.max_workers if config else self.max_workers
+            if chunk_size is None:
+                chunk_size = math.ceil(len(items) / (max_workers * 4))
+                if config:
+                    chunk_size = min(chunk_size, config.parameters.get("chunk_size", chunk_size))
+            chunk_size = max(1, chunk_size)
+            chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+            chunk_results: List[Optional[List[Any]]] = [None] * len(chunks)
+            
+            if use_threads is None:
+                use_threads = getattr(func, "releases_gil", False)
+            
+            if not use_threads and self._process_pool is not None:
+                payloads = self._pickle_chunks(func, chunks)
+                if payloads is not None:
+                    chunk_results = self._map_processes(payloads)
+                    executor = "process"
+            
+            missing = [index for index, result in enumerate(chunk_results) if result is None]
+            if missing and self._thread_pool is not None:
+                futures = {
+                    index: self._thread_pool.submit(self._run_thread_chunk, func, chunks[index])
+                    for index in missing
+                }
+                try:
+                    for index, future in futures.items():
+                        chunk_results[index] = future.result()
+                except BaseException:
+                    for future in futures.values():
+                        future.cancel()
+                    raise
+                if executor == "serial":
+                    executor = "thread"
+            
+            results = []
+            for index, chunk_result in enumerate(chunk_results):
+                if chunk_result is None:
+                    chunk_result = _run_chunk(func, chunks[index])
+                results.extend(chunk_result)
+        else:
+            results = _run_chunk(func, items)
+        
+        self._record_parallel_stats(executor, len(items), time.perf_counter() - start_time)
+        
+        if reduce is None:
+            return results
+        if initial is None:
+            return functools.reduce(reduce, results)
+        return functools.reduce(reduce, results, initial)
+    
+    def _run_thread_chunk(self, func: Callable[[Any], R], chunk: Sequence[Any]) -> List[R]:
+        """Run a chunk on a pool thread, keeping nested ``parallel_map`` calls inline."""
+        self._worker_state.active = True
+        try:
+            return _run_chunk(func, chunk)
+        finally:
+            self._worker_state.active = False
+    
+    def _pickle_chunks(self, func: Callable, chunks: List[List[Any]]) -> Optional[List[bytes]]:
+        """Pickle each chunk with the function for the process pool.
+        
+        Returns:
+            One payload per chunk, or None if anything cannot be pickled
+        """
+        try:
+            return [
+                pickle.dumps((func, chunk), protocol=pickle.HIGHEST_PROTOCOL)
+                for chunk in chunks
+            ]
+        except Exception as e:
+            self.logger.debug(f"Cannot send {getattr(func, '__name__', func)} to processes: {e}")
+            return None
+    
+    def _map_processes(self, payloads: List[bytes]) -> List[Optional[List[Any]]]:
+        """Run pickled chunks on the process pool.
+        
+        Returns:
+            Results per chunk; None for chunks that did not run in a worker
+        """
+        results: List[Optional[List[Any]]] = [None] * len(payloads)
+        pool = self._process_pool
+        if pool is None:
+            return results
+        try:
+            futures = [
+                pool.submit(_run_pickled_chunk, payload)
+                for payload in payloads
+            ]
+        except (BrokenProcessPool, RuntimeError) as e:
+            self.logger.warning(f"Process pool unavailable, using threads: {e}")
+            self._replace_process_pool()
+            return results
+        
+        broken = False
+        try:
+            for index, future in enumerate(futures):
+                try:
+                    results[index] = future.result()
+                except _TaskNotLoadable as e:
+                    self.logger.debug(f"Worker could not load task, using threads: {e}")
+                except BrokenProcessPool as e:
+                    if not broken:
+                        self.logger.warning(
+                            f"Process pool broke, re-running lost chunks on threads: {e}"
+                        )
+                    broken = True
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        
+        if broken:
+            self._replace_process_pool()
+        else:
+            self._process_pool_failures = 0
+        return results
+    
+    def _replace_process_pool(self) -> None:
+        """Replace a broken process pool, or give up after repeated failures."""
+        pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        self._process_pool_failures += 1
+        if self._process_pool_failures >= MAX_PROCESS_POOL_RESTARTS:
+            self.logger.warning("Process pool keeps failing; parallel_map will use threads only")
+            return
+        try:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        except Exception as e:
+            self.logger.warning(f"Failed to recreate process pool: {e}")
+    
+    def _record_parallel_stats(self, executor: str, item_count: int, elapsed: float) -> None:
+        """Accumulate per-executor ``parallel_map`` statistics."""
+        stats = self._optimization_stats.setdefault("parallel_map", {})
+        entry = stats.setdefault(executor, {"calls": 0, "items": 0, "total_time": 0.0})
+        entry["calls"] += 1
+        entry["items"] += item_count
+        entry["total_time"] += elapsed
+    
     def _apply_memory_optimization(self, func: Callable[..., T]) -> Callable[..., T]:
         """Apply memory optimization to a function.
         
@@ -345,174 +589,93 @@ class OptimizationManager(BaseManager[OptimizationConfig]):
         Returns:
             Memory-optimized function
         """
+        config = self._optimizations.get("memory_optimization")
+        gc_threshold = config.parameters.get("gc_threshold", 1000) if config else 1000
+        
         @functools.wraps(func)
-        def memory_optimized_func(*args, **kwargs):
-            import gc
-            
-            # Collect garbage before execution
-            gc.collect()
-            
-            # Execute function
-            result = func(*args, **kwargs)
-            
-            # Collect garbage after execution
-            gc.collect()
-            
-            return result
+        def memory_optimized_func(*args: Any, **kwargs: Any) -> T:
+            # Pause the cyclic collector while the call allocates, instead of
+            # forcing two full collections around every call
+            with self._gc_lock:
+                if self._gc_paused == 0 and gc.isenabled():
+                    gc.disable()
+                    self._gc_paused = 1
+                elif self._gc_paused:
+                    self._gc_paused += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._gc_lock:
+                    self._gc_calls += 1
+                    collect = self._gc_calls % gc_threshold == 0
+                    if self._gc_paused:
+                        self._gc_paused -= 1
+                        if self._gc_paused == 0:
+                            gc.enable()
+                if collect:
+                    gc.collect()
         
         return memory_optimized_func
     
-    def _generate_cache_key(self, func: Callable, args: tuple, kwargs: dict) -> str:
+    def _generate_cache_key(self, func: Callable, args: tuple, kwargs: dict) -> Optional[str]:
         """Generate cache key for function call.
         
+        Arguments are fingerprinted by content: dataclasses field by field,
+        board snapshots by their content hash, arrays by their bytes.
+        
         Args:
             func: Function
             args: Function arguments
             kwargs: Function keyword arguments
             
         Returns:
-            Cache key
+            Cache key, or None if an argument has no stable fingerprint
+            (e.g. a SWIG board object) and the call must not be cached
         """
-        # Create key components
-        key_components = [
-            func.__name__,
-            func.__module__,
-            str(args),
-            str(sorted(kwargs.items()))
-        ]
-        
-        # Generate hash
-        key_string = "|".join(key_components)
-        return hashlib.sha256(key_string.encode()).hexdigest()
+        try:
+            return fingerprint(func.__module__, func.__qualname__, args, kwargs, strict=True)
+        except Exception as e:
+            self.logger.debug(f"Not caching call to {func.__name__}: {e}")
+            return None
     
-    def _get_cache(self, key: str) -> Optional[Any]:
+    def _get_cache(self, key: str, namespace: str = "default") -> Optional[Any]:
         """Get value from cache.
         
         Args:
             key: Cache key
+            namespace: Cache namespace
             
         Returns:
             Cached value or None
         """
         try:
-            # Check memory cache
-            if key in self._cache:
-                timestamp = self._cache_timestamps.get(key, 0)
-                if time.time() - timestamp < 3600:  # 1 hour TTL
-                    return self._cache[key]
-                else:
-                    # Remove expired cache entry
-                    self._cache.pop(key, None)
-                    self._cache_timestamps.pop(key, None)
-            
-            # Check disk cache
-            cache_file = self.cache_dir / f"{key}.cache"
-            if cache_file.exists():
-                try:
-                    with open(cache_file, 'rb') as f:
-                        cached_data = pickle.load(f)
-                    
-                    # Check TTL
-                    if time.time() - cached_data.get('timestamp', 0) < 3600:
-                        # Load into memory cache
-                        self._cache[key] = cached_data['value']
-                        self._cache_timestamps[key] = cached_data['timestamp']
-                        return cached_data['value']
-                    else:
-                        # Remove expired cache file
-                        cache_file.unlink()
-                except Exception as e:
-                    self.logger.warning(f"Error loading cache file {key}: {e}")
-                    cache_file.unlink()
-            
-            return None
-            
+            return self._cache_backend.get(namespace, key)
         except Exception as e:
             self.logger.error(f"Error getting cache for key {key}: {e}")
             return None
     
-    def _set_cache(self, key: str, value: Any) -> None:
+    def _set_cache(self, key: str, value: Any, namespace: str = "default") -> None:
         """Set value in cache.
         
         Args:
             key: Cache key
             value: Value to cache
+            namespace: Cache namespace
         """
         try:
-            # Store in memory cache
-            self._cache[key] = value
-            self._cache_timestamps[key] = time.time()
-            
-            # Store metadata
-            self._cache_metadata[key] = {
-                'size': len(pickle.dumps(value)),
-                'created_at': time.time()
-            }
-            
-            # Store in disk cache
-            cache_file = self.cache_dir / f"{key}.cache"
-            cached_data = {
-                'value': value,
-                'timestamp': time.time(),
-                'metadata': self._cache_metadata[key]
-            }
-            
-            with open(cache_file, 'wb') as f:
-                pickle.dump(cached_data, f)
-            
-            # Clean up old cache entries if needed
-            self._cleanup_cache()
-            
+            self._cache_backend.set(namespace, key, value)
         except Exception as e:
             self.logger.error(f"Error setting cache for key {key}: {e}")
     
-    def _cleanup_cache(self) -> None:
-        """Clean up old cache entries."""
-        try:
-            current_time = time.time()
-            
-            # Clean memory cache
-            expired_keys = [
-                key for key, timestamp in self._cache_timestamps.items()
-                if current_time - timestamp > 3600  # 1 hour
-            ]
-            
-            for key in expired_keys:
-                self._cache.pop(key, None)
-                self._cache_timestamps.pop(key, None)
-                self._cache_metadata.pop(key, None)
-            
-            # Clean disk cache
-            for cache_file in self.cache_dir.glob("*.cache"):
-                try:
-                    if cache_file.stat().st_mtime < current_time - 3600:
-                        cache_file.unlink()
-                except Exception as e:
-                    self.logger.warning(f"Error cleaning up cache file {cache_file}: {e}")
-            
-            if expired_keys:
-                self.logger.debug(f"Cleaned up {len(expired_keys)} cache entries")
-                
-        except Exception as e:
-            self.logger.error(f"Error during cache cleanup: {e}")
-    
-    def clear_cache(self) -> None:
-        """Clear all cache entries."""
+    def clear_cache(self, namespace: Optional[str] = None) -> None:
+        """Clear cache entries.
+        
+        Args:
+            namespace: Optional namespace to clear; all entries if omitted
+        """
         try:
-            # Clear memory cache
-            self._cache.clear()
-            self._cache_timestamps.clear()
-            self._cache_metadata.clear()
-            
-            # Clear disk cache
-            for cache_file in self.cache_dir.glob("*.cache"):
-                try:
-                    cache_file.unlink()
-                except Exception as e:
-                    self.logger.warning(f"Error removing cache file {cache_file}: {e}")
-            
+            self._cache_backend.clear(namespace)
             self.logger.info("Cache cleared")
-            
         except Exception as e:
             self.logger.error(f"Error clearing cache: {e}")
     
@@ -520,26 +683,25 @@ class OptimizationManager(BaseManager[OptimizationConfig]):
         """Get cache statistics.
         
         Returns:
-            Cache statistics dictionary
+            Cache statistics dictionary, with per-namespace hit rates and
+            sizes under ``namespaces``
         """
         try:
-            # Calculate memory cache stats
-            memory_size = sum(
-                metadata.get('size', 0) 
-                for metadata in self._cache_metadata.values()
-            )
-            
-            # Calculate disk cache stats
-            disk_files = list(self.cache_dir.glob("*.cache"))
-            disk_size = sum(f.stat().st_size for f in disk_files)
-            
+            stats = self._cache_backend.stats()
+            memory = stats.get('memory', {})
+            disk = stats.get('disk', {})
+            memory_size = memory.get('bytes', 0)
+            disk_size = disk.get('file_bytes', disk.get('bytes', 0))
             return {
-                'memory_entries': len(self._cache),
+                'memory_entries': memory.get('entries', 0),
                 'memory_size_mb': memory_size / (1024 * 1024),
-                'disk_entries': len(disk_files),
+                'memory_evictions': memory.get('evictions', 0),
+                'disk_entries': disk.get('entries', 0),
                 'disk_size_mb': disk_size / (1024 * 1024),
+                'disk_evictions': disk.get('evictions', 0),
                 'total_size_mb': (memory_size + disk_size) / (1024 * 1024),
-                'cache_dir': str(self.cache_dir)
+                'cache_dir': str(self.cache_dir),
+                'namespaces': stats.get('namespaces', {})
             }
             
         except Exception as e:
@@ -563,12 +725,45 @@ class OptimizationManager(BaseManager[OptimizationConfig]):
             'pool_stats': {
                 'max_workers': self.max_workers,
                 'thread_pool_active': self._thread_pool is not None,
-                'process_pool_active': self._process_pool is not None
+                'process_pool_active': self._process_pool is not None,
+                'parallel_map': self._optimization_stats.get('parallel_map', {})
             },
             'performance_history': len(self._performance_history),
             'optimization_results': len(self._optimization_results)
         }
     
+    def _validate_data(self, data: OptimizationConfig) -> ManagerResult:
+        """Validate an optimization configuration before storage.
+        
+        Args:
+            data: Configuration to validate
+            
+        Returns:
+            Validation result
+        """
+        errors = []
+        if not data.optimization_id:
+            errors.append("Optimization ID cannot be empty")
+        if data.max_workers < 1:
+            errors.append("max_workers must be at least 1")
+        if data.cache_size < 0 or data.cache_ttl < 0:
+            errors.append("cache_size and cache_ttl cannot be negative")
+        
+        if errors:
+            return ManagerResult(
+                success=False,
+                operation=ManagerOperation.VALIDATE,
+                status=ManagerStatus.FAILED,
+                message="Optimization configuration validation failed",
+                errors=errors
+            )
+        return ManagerResult(
+            success=True,
+            operation=ManagerOperation.VALIDATE,
+            status=ManagerStatus.SUCCESS,
+            message="Optimization configuration validation successful"
+        )
+    
     def _cleanup_item(self, key: str) -> None:
         """Clean up resources for an optimization configuration.
         
@@ -582,9 +777,19 @@ class OptimizationManager(BaseManager[OptimizationConfig]):
         """Clear cache after data changes."""
         super()._clear_cache()
     
-    def __del__(self):
+    def close(self) -> None:
+        """Shut down the worker pools and flush the cache."""
+        if getattr(self, '_cache_backend', None):
+            self._cache_backend.close()
+        thread_pool = getattr(self, '_thread_pool', None)
+        if thread_pool is not None:
+            thread_pool.shutdown(wait=True)
+            self._thread_pool = None
+        process_pool = getattr(self, '_process_pool', None)
+        if process_pool is not None:
+            process_pool.shutdown(wait=True)
+            self._process_pool = None
+    
+    def __del__(self) -> None:
         """Cleanup when the manager is destroyed."""
-        if self._thread_pool:
-            self._thread_pool.shutdown(wait=True)
-        if self._process_pool:
-            self._process_pool.shutdown(wait=True) 
\ No newline at end of file
+        self.close() 
\ No newline at end of file
@@ -8,14 +8,17 @@ from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
-import json
 import os
 from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from pathlib import Path
 
+import numpy as np
+
 from ..base.base_manager import BaseManager
 from ..base.results.manager_result import ManagerResult, ManagerOperation, ManagerStatus
+from .metrics_store import MetricsStore, from_microseconds
+from .profiling import span
 
 @dataclass
 class PerformanceMetrics:
@@ -48,14 +51,17 @@ class PerformanceSeverity(Enum):
 class PerformanceManager(BaseManager[PerformanceMetrics]):
     """Manages performance monitoring and optimization for the KiCad PCB Generator.
     
-    Now inherits from BaseManager for standardized CRUD operations on PerformanceMetrics objects.
+    Inherits from BaseManager for validation; measurements themselves go to a
+    MetricsStore (in-memory columns plus hourly segment files) so that long
+    monitoring sessions keep bounded memory and fast range queries.
     """
     
     def __init__(
         self,
         logger: Optional[logging.Logger] = None,
         max_workers: int = 4,
-        metrics_dir: str = "performance_metrics"
+        metrics_dir: str = "performance_metrics",
+        memory_capacity: int = 100_000
     ):
         """Initialize the performance manager.
         
@@ -63,6 +69,7 @@ class PerformanceManager(BaseManager[PerformanceMetrics]):
             logger: Optional logger instance
             max_workers: Maximum number of worker threads
             metrics_dir: Directory to store performance metrics
+            memory_capacity: Maximum number of measurements kept in memory
         """
         super().__init__()
         self.logger = logger or logging.getLogger(__name__)
@@ -81,6 +88,7 @@ class PerformanceManager(BaseManager[PerformanceMetrics]):
         
         # Create metrics directory if it doesn't exist
         self.metrics_dir.mkdir(parents=True, exist_ok=True)
+        self._store = MetricsStore(self.metrics_dir, capacity=memory_capacity)
         
         # Performance thresholds
         self.thresholds = {
@@ -124,6 +132,7 @@ class PerformanceManager(BaseManager[PerformanceMetrics]):
         if self._monitor_thread:
             self._monitor_thread.join()
             self._monitor_thread = None
+        self._store.flush()
     
     def _monitor_performance(self, interval: float) -> None:
         """Monitor system performance.
@@ -279,7 +288,8 @@ class PerformanceManager(BaseManager[PerformanceMetrics]):
         start_cpu = psutil.Process().cpu_percent()
         
         try:
-            result = func(*args, **kwargs)
+            with span(f"{component_id}.{operation}", category="measure"):
+                result = func(*args, **kwargs)
             
             end_time = time.time()
             end_memory = psutil.Process().memory_info().rss
@@ -340,51 +350,23 @@ class PerformanceManager(BaseManager[PerformanceMetrics]):
             metrics: Performance metrics to store
         """
         try:
-            # Use BaseManager's create method with composite key
-            key = f"{metrics.component_id}:{metrics.operation}:{metrics.timestamp.isoformat()}"
-            result = self.create(key, metrics)
-            
-            if result.success:
-                # Save to disk
-                self._save_metrics(metrics)
-            else:
-                self.logger.error(f"Failed to store metrics: {result.message}")
-                
-        except Exception as e:
-            self.logger.error(f"Error storing metrics: {e}")
-    
-    def _save_metrics(self, metrics: PerformanceMetrics) -> None:
-        """Save metrics to disk.
-        
-        Args:
-            metrics: Metrics to save
-        """
-        try:
-            # Create component directory
-            component_dir = self.metrics_dir / metrics.component_id
-            component_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Create filename with timestamp
-            timestamp_str = metrics.timestamp.strftime("%Y%m%d_%H%M%S_%f")
-            filename = f"{metrics.operation}_{timestamp_str}.json"
-            filepath = component_dir / filename
+            validation_result = self._validate_data(metrics)
+            if not validation_result.success:
+                self.logger.error(f"Failed to store metrics: {validation_result.message}")
+                return
             
-            # Convert to dict for JSON serialization
-            metrics_data = {
-                'component_id': metrics.component_id,
-                'operation': metrics.operation,
-                'execution_time': metrics.execution_time,
-                'memory_usage': metrics.memory_usage,
-                'cpu_usage': metrics.cpu_usage,
-                'timestamp': metrics.timestamp.isoformat(),
-                'metadata': metrics.metadata
-            }
+            self._store.append(
+                metrics.component_id,
+                metrics.operation,
+                metrics.timestamp,
+                metrics.execution_time,
+                metrics.memory_usage,
+                metrics.cpu_usage,
+                metrics.metadata
+            )
             
-            with open(filepath, 'w') as f:
-                json.dump(metrics_data, f, indent=2)
-                
         except Exception as e:
-            self.logger.error(f"Error saving metrics to disk: {e}")
+            self.logger.error(f"Error storing metrics: {e}")
     
     def get_metrics(
         self,
@@ -400,27 +382,29 @@ class PerformanceManager(BaseManager[PerformanceMetrics]):
             end_time: Optional end time to filter by
             
         Returns:
-            List of performance metrics
+            List of performance metrics, oldest first
         """
-        result = self.list_all()
-        if not result.success:
-            return []
-        
-        metrics = result.data
-        
-        # Filter by component ID
-        if component_id:
-            metrics = [m for m in metrics if m.component_id == component_id]
-        
-        # Filter by time range
-        if start_time:
-            metrics = [m for m in metrics if m.timestamp >= start_time]
-        
-        if end_time:
-            metrics = [m for m in metrics if m.timestamp <= end_time]
-        
-        # Sort by timestamp
-        return sorted(metrics, key=lambda m: m.timestamp)
+        return self._to_metrics(self._store.select(component_id or None, start_time, end_time))
+    
+    @staticmethod
+    def _to_metrics(columns: Dict[str, np.ndarray]) -> List[PerformanceMetrics]:
+        """Build metric objects from store columns."""
+        return [
+            PerformanceMetrics(
+                component_id=component_id,
+                operation=operation,
+                execution_time=execution_time,
+                memory_usage=memory_usage,
+                cpu_usage=cpu_usage,
+                timestamp=from_microseconds(timestamp),
+                metadata=metadata
+            )
+            for timestamp, component_id, operation, execution_time, memory_usage, cpu_usage, metadata in zip(
+                columns["timestamp"].tolist(), columns["component_id"], columns["operation"],
+                columns["execution_time"].tolist(), columns["memory_usage"].tolist(),
+                columns["cpu_usage"].tolist(), columns["metadata"]
+            )
+        ]
     
     def generate_report(
         self,
@@ -438,7 +422,8 @@ class PerformanceManager(BaseManager[PerformanceMetrics]):
         Returns:
             Performance report
         """
-        metrics = self.get_metrics(component_id, start_time, end_time)
+        columns = self._store.select(component_id, start_time, end_time)
+        metrics = self._to_metrics(columns)
         
         if not metrics:
             return PerformanceReport(
@@ -451,30 +436,20 @@ class PerformanceManager(BaseManager[PerformanceMetrics]):
             )
         
         # Calculate summary statistics
-        execution_times = [m.execution_time for m in metrics]
-        memory_usages = [m.memory_usage for m in metrics]
-        cpu_usages = [m.cpu_usage for m in metrics]
-        
-        summary = {
-            'total_operations': len(metrics),
-            'avg_execution_time': sum(execution_times) / len(execution_times),
-            'max_execution_time': max(execution_times),
-            'min_execution_time': min(execution_times),
-            'avg_memory_usage': sum(memory_usages) / len(memory_usages),
-            'max_memory_usage': max(memory_usages),
-            'min_memory_usage': min(memory_usages),
-            'avg_cpu_usage': sum(cpu_usages) / len(cpu_usages),
-            'max_cpu_usage': max(cpu_usages),
-            'min_cpu_usage': min(cpu_usages)
-        }
+        summary: Dict[str, float] = {'total_operations': len(metrics)}
+        for name in ('execution_time', 'memory_usage', 'cpu_usage'):
+            values = columns[name]
+            summary[f'avg_{name}'] = float(values.mean())
+            summary[f'max_{name}'] = float(values.max())
+            summary[f'min_{name}'] = float(values.min())
         
         # Generate recommendations
         recommendations = self._generate_recommendations(metrics, summary)
         
         return PerformanceReport(
             component_id=component_id,
-            start_time=start_time or min(m.timestamp for m in metrics),
-            end_time=end_time or max(m.timestamp for m in metrics),
+            start_time=start_time or metrics[0].timestamp,
+            end_time=end_time or metrics[-1].timestamp,
             metrics=metrics,
             summary=summary,
             recommendations=recommendations
@@ -552,18 +527,7 @@ class PerformanceManager(BaseManager[PerformanceMetrics]):
         Args:
             component_id: Optional component ID to clear metrics for
         """
-        if component_id:
-            # Clear specific component metrics
-            keys_to_delete = []
-            for key in self._items.keys():
-                if key.startswith(f"{component_id}:"):
-                    keys_to_delete.append(key)
-            
-            for key in keys_to_delete:
-                self.delete(key)
-        else:
-            # Clear all metrics
-            self.clear_all()
+        self._store.clear(component_id or None)
     
     def clear_reports(self, component_id: Optional[str] = None) -> None:
         """Clear performance reports.
@@ -659,26 +623,6 @@ class PerformanceManager(BaseManager[PerformanceMetrics]):
                 errors=[str(e)]
             )
     
-    def _cleanup_item(self, key: str) -> None:
-        """Clean up resources for performance metrics.
-        
-        Args:
-            key: Performance metrics key to clean up
-        """
-        # Remove from disk if it exists
-        try:
-            component_id, operation, timestamp_str = key.split(':', 2)
-            component_dir = self.metrics_dir / component_id
-            timestamp = datetime.fromisoformat(timestamp_str)
-            timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S_%f")
-            filename = f"{operation}_{timestamp_str}.json"
-            filepath = component_dir / filename
-            
-            if filepath.exists():
-                filepath.unlink()
-        except Exception as e:
-            self.logger.error(f"Error cleaning up metrics file: {e}")
-    
     def _clear_cache(self) -> None:
         """Clear cache after data changes."""
         # Clear the cache - no additional disk operations needed
@@ -687,5 +631,7 @@ class PerformanceManager(BaseManager[PerformanceMetrics]):
     def __del__(self):
         """Cleanup when the manager is destroyed."""
         self.stop_monitoring()
+        if hasattr(self, '_store'):
+            self._store.flush()
         if hasattr(self, 'executor'):
             self.executor.shutdown(wait=True) 
\ No newline at end of file
@@ -0,0 +1,338 @@
+"""
+Low-overhead instrumentation for the generation pipeline.
+
+Code marks stages with named spans::
+
+    with span("routing", nets=len(nets)):
+        router.optimize_audio_routing()
+
+Spans cost one attribute check while the profiler is off. When it is on,
+each span records its start and duration with ``perf_counter_ns``. An
+optional sampling thread also snapshots every thread's Python stack at a
+fixed interval. Both can be exported as Chrome trace JSON (chrome://tracing,
+Perfetto) and as collapsed stacks for flamegraph.pl or speedscope.
+"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """A completed, timed region of code."""
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    stack: Tuple[str, ...]
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+class _NullSpan:
+    """Context manager used while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _ActiveSpan:
+    """Context manager timing one span."""
+
+    __slots__ = ("_profiler", "_name", "_category", "_args", "_start", "_stack")
+
+    def __init__(self, profiler: "Profiler", name: str, category: str, args: Dict[str, Any]):
+        self._profiler = profiler
+        self._name = name
+        self._category = category
+        self._args = args
+
+    def __enter__(self) -> "_ActiveSpan":
+        self._stack = self._profiler._push(self._name)
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        duration = time.perf_counter_ns() - self._start
+        self._profiler._pop(Span(
+            name=self._name,
+            category=self._category,
+            start_ns=self._start,
+            duration_ns=duration,
+            thread_id=threading.get_ident(),
+            stack=self._stack,
+            args=self._args
+        ))
+
+
+class SamplingProfiler:
+    """Periodically records the Python stack of every thread."""
+
+    def __init__(self, profiler: "Profiler", interval: float = 0.005, max_depth: int = 128,
+                 max_samples: int = 200_000):
+        """Initialize the sampler.
+
+        Args:
+            profiler: Profiler whose open spans prefix the sampled stacks
+            interval: Sampling interval in seconds
+            max_depth: Maximum number of frames recorded per stack
+            max_samples: Number of timed samples kept for trace export
+        """
+        self.profiler = profiler
+        self.interval = interval
+        self.max_depth = max_depth
+        self.counts: Counter = Counter()
+        self.samples: Deque[Tuple[int, int, Tuple[str, ...]]] = deque(maxlen=max_samples)
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._running = False
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        thread_names: Dict[int, str] = {}
+        while self._running:
+            now = time.perf_counter_ns()
+            frames = sys._current_frames()
+            if any(thread_id not in thread_names for thread_id in frames):
+                thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in frames.items():
+                if thread_id == own_id:
+                    continue
+                stack = (thread_names.get(thread_id, str(thread_id)),
+                         *self.profiler.open_spans(thread_id), *self._frame_stack(frame))
+                self.counts[stack] += 1
+                self.samples.append((now, thread_id, stack))
+            del frames
+            time.sleep(self.interval)
+
+    def _frame_stack(self, frame: Any) -> List[str]:
+        names = []
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            location = f"{os.path.basename(code.co_filename)}:{code.co_firstlineno}"
+            names.append(f"{code.co_name} ({location})")
+            frame = frame.f_back
+        names.reverse()
+        return names
+
+
+class Profiler:
+    """Collects pipeline spans and optional stack samples."""
+
+    def __init__(self, max_spans: int = 200_000):
+        """Initialize the profiler (disabled until ``start``).
+
+        Args:
+            max_spans: Number of completed spans kept; older ones are dropped
+        """
+        self.enabled = False
+        self.max_spans = max_spans
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._open: Dict[int, List[str]] = {}
+        self._sampler: Optional[SamplingProfiler] = None
+        self._lock = threading.Lock()
+
+    def start(self, sample_interval: Optional[float] = None) -> None:
+        """Start recording spans.
+
+        Args:
+            sample_interval: Also sample stacks at this interval in seconds
+        """
+        self.enabled = True
+        if sample_interval:
+            if self._sampler is None:
+                self._sampler = SamplingProfiler(self)
+            self._sampler.interval = sample_interval
+            self._sampler.start()
+
+    def stop(self) -> None:
+        """Stop recording; collected data stays available for export."""
+        self.enabled = False
+        if self._sampler:
+            self._sampler.stop()
+
+    def reset(self) -> None:
+        """Discard collected spans and samples."""
+        with self._lock:
+            self._spans.clear()
+        if self._sampler:
+            self._sampler.counts.clear()
+            self._sampler.samples.clear()
+
+    def span(self, name: str, category: str = "pipeline", **args: Any) -> Any:
+        """Context manager timing a named region.
+
+        Args:
+            name: Span name
+            category: Span category shown in trace viewers
+            **args: Extra values attached to the span
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _ActiveSpan(self, name, category, args)
+
+    def profiled(self, name: Optional[str] = None, category: str = "pipeline") -> Callable:
+        """Decorator wrapping every call of a function in a span."""
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _ActiveSpan(self, span_name, category, {}):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def open_spans(self, thread_id: int) -> Tuple[str, ...]:
+        """Names of the spans currently open on a thread, outermost first."""
+        return tuple(self._open.get(thread_id, ()))
+
+    @property
+    def spans(self) -> List[Span]:
+        """Completed spans in completion order."""
+        with self._lock:
+            return list(self._spans)
+
+    def _push(self, name: str) -> Tuple[str, ...]:
+        stack = self._open.setdefault(threading.get_ident(), [])
+        stack.append(name)
+        return tuple(stack)
+
+    def _pop(self, span: Span) -> None:
+        stack = self._open.get(span.thread_id)
+        if stack:
+            stack.pop()
+        with self._lock:
+            self._spans.append(span)
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+    def stage_totals(self) -> Dict[str, float]:
+        """Total seconds spent per span name."""
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration_ns / 1e9
+        return totals
+
+    def collapsed_stacks(self) -> Dict[str, int]:
+        """Flamegraph input: ``frame;frame;frame`` to weight.
+
+        With stack samples, weights are sample counts. Otherwise they are
+        span self-times in microseconds.
+        """
+        if self._sampler and self._sampler.counts:
+            return {";".join(stack): count for stack, count in self._sampler.counts.items()}
+
+        totals: Dict[Tuple[str, ...], int] = {}
+        for span in self.spans:
+            totals[span.stack] = totals.get(span.stack, 0) + span.duration_ns
+        self_times = dict(totals)
+        for stack, total in totals.items():
+            if len(stack) > 1 and stack[:-1] in self_times:
+                self_times[stack[:-1]] -= total
+        return {";".join(stack): max(0, value) // 1000
+                for stack, value in self_times.items() if value > 0}
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Trace Event Format document with spans and stack samples."""
+        pid = os.getpid()
+        starts = [span.start_ns for span in self.spans]
+        if self._sampler and self._sampler.samples:
+            starts.append(self._sampler.samples[0][0])
+        origin = min(starts, default=0)
+        events: List[Dict[str, Any]] = []
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id in {span.thread_id for span in self.spans}:
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id,
+                           "args": {"name": thread_names.get(thread_id, str(thread_id))}})
+        for span in self.spans:
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start_ns - origin) / 1000.0,
+                "dur": span.duration_ns / 1000.0,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {key: (value if isinstance(value, (bool, int, float, str)) or value is None
+                               else repr(value))
+                         for key, value in span.args.items()}
+
+            })
+        trace: Dict[str, Any] = {"traceEvents": events, "displayTimeUnit": "ms"}
+
+        if self._sampler and self._sampler.samples:
+            frame_ids: Dict[Tuple[str, ...], int] = {}
+            stack_frames: Dict[str, Dict[str, Any]] = {}
+            samples = []
+            for timestamp, thread_id, stack in list(self._sampler.samples):
+                for depth in range(1, len(stack) + 1):
+                    prefix = stack[:depth]
+                    if prefix not in frame_ids:
+                        frame_ids[prefix] = len(frame_ids)
+                        node = {"name": prefix[-1], "category": "python"}
+                        if depth > 1:
+                            node["parent"] = str(frame_ids[prefix[:-1]])
+                        stack_frames[str(frame_ids[prefix])] = node
+                samples.append({"cpu": 0, "tid": thread_id, "ts": (timestamp - origin) / 1000.0,
+                                "name": "sample", "sf": str(frame_ids[stack]), "weight": 1})
+            trace["stackFrames"] = stack_frames
+            trace["samples"] = samples
+        return trace
+
+    def write_chrome_trace(self, path: Union[str, Path]) -> None:
+        """Write ``chrome_trace()`` as JSON."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+
+    def write_flamegraph(self, path: Union[str, Path]) -> None:
+        """Write ``collapsed_stacks()`` in the folded-stack text format."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, weight in sorted(self.collapsed_stacks().items()):
+                f.write(f"{stack} {weight}\n")
+
+
+# Process-wide profiler used by the pipeline instrumentation
+profiler = Profiler()
+
+
+def span(name: str, category: str = "pipeline", **args: Any) -> Any:
+    """Time a named region with the process-wide profiler."""
+    if not profiler.enabled:
+        return _NULL_SPAN
+    return _ActiveSpan(profiler, name, category, args)
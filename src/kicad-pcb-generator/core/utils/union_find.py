@@ -0,0 +1,39 @@
+"""Disjoint-set forest shared by the connectivity and loop analyses."""
+from typing import List
+
+
+class UnionFind:
+    """Disjoint sets over integer ids with path halving and union by size."""
+
+    def __init__(self, size: int = 0):
+        self.parent: List[int] = list(range(size))
+        self.size: List[int] = [1] * size
+
+    def add(self) -> int:
+        """Add a new singleton set and return its id."""
+        self.parent.append(len(self.parent))
+        self.size.append(1)
+        return len(self.parent) - 1
+
+    def find(self, item: int) -> int:
+        """Return the representative of the set containing ``item``."""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets of two ids.
+
+        Returns:
+            False if they were already in the same set
+        """
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return True
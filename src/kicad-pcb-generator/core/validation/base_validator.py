@@ -28,6 +28,7 @@ from .validation_results import (
     ManufacturingValidationResult
 )
 from ...utils.config.settings import Settings
+from ..board.spatial_index import BoardSpatialIndex, ITEM_TRACK, ITEM_FOOTPRINT
 from ...utils.validation import (
     ValidationRule,
     ValidationRuleType
@@ -36,6 +37,9 @@ from ...utils.validation import (
 class BaseValidator:
     """Base class for PCB validators."""
     
+    # Only tracks within this distance (mm) are considered parallel neighbours
+    PARALLEL_TRACK_WINDOW = 5.0
+    
     def __init__(self, logger: Optional[Logger] = None):
         """Initialize the validator.
         
@@ -198,6 +202,7 @@ class BaseValidator:
 
             # Get board edges
             board_edges = board.GetBoardEdgesBoundingBox()
+            footprint_index = BoardSpatialIndex.from_board(board, kinds=(ITEM_FOOTPRINT,))
 
             # Check each component
             for footprint in board.GetFootprints():
@@ -213,7 +218,12 @@ class BaseValidator:
                     ))
 
                 # Check for overlapping components
-                for other in board.GetFootprints():
+                nearby = footprint_index.query_point(
+                    pos.x/1e6, pos.y/1e6, footprint_index.max_half_width(ITEM_FOOTPRINT),
+                    kinds=(ITEM_FOOTPRINT,)
+                )
+                for other_item, _ in nearby:
+                    other = other_item.obj
                     if other != footprint and footprint.HitTest(other.GetPosition()):
                         results.append(self._create_result(
                             category=ValidationCategory.COMPONENT_PLACEMENT,
@@ -637,6 +647,7 @@ class BaseValidator:
             max_reflection = signal_rules.get('max_reflection', 0.1)
             min_impedance = signal_rules.get('min_impedance', 45.0)
             max_impedance = signal_rules.get('max_impedance', 55.0)
+            track_index = BoardSpatialIndex.from_board(board, kinds=(ITEM_TRACK,))
 
             # Check each track
             for track in board.GetTracks():
@@ -727,7 +738,7 @@ class BaseValidator:
                     ))
 
                 # Check for parallel tracks
-                parallel_tracks = self._find_parallel_tracks(track, board)
+                parallel_tracks = self._find_parallel_tracks(track, board, track_index)
                 if len(parallel_tracks) > 2:  # Maximum 2 parallel tracks
                     results.append(self._create_result(
                         category=ValidationCategory.SIGNAL,
@@ -829,18 +840,23 @@ class BaseValidator:
             self.logger.debug(f"Unexpected error in impedance calculation: {str(e)}")
             return None
 
-    def _find_parallel_tracks(self, track: pcbnew.TRACK, board: pcbnew.BOARD) -> List[pcbnew.TRACK]:
+    def _find_parallel_tracks(self, track: pcbnew.TRACK, board: pcbnew.BOARD,
+                              spatial_index: Optional[BoardSpatialIndex] = None) -> List[pcbnew.TRACK]:
         """Find parallel tracks.
         
         Args:
             track: Track to find parallels for
             board: Board object
+            spatial_index: Optional prebuilt track index; built from the board if omitted
             
         Returns:
-            List of parallel tracks
+            List of parallel tracks within PARALLEL_TRACK_WINDOW
         """
         parallel_tracks = []
         try:
+            if spatial_index is None:
+                spatial_index = BoardSpatialIndex.from_board(board, kinds=(ITEM_TRACK,))
+            
             # Get track properties
             start = track.GetStart()
             end = track.GetEnd()
@@ -851,8 +867,13 @@ class BaseValidator:
             dy = end.y - start.y
             angle = math.atan2(dy, dx)
             
-            # Find parallel tracks
-            for other in board.GetTracks():
+            # Find parallel tracks among same-layer neighbours
+            nearby = spatial_index.query_segment(
+                start.x/1e6, start.y/1e6, end.x/1e6, end.y/1e6,
+                self.PARALLEL_TRACK_WINDOW, layer=layer, kinds=(ITEM_TRACK,)
+            )
+            for other_item, _ in nearby:
+                other = other_item.obj
                 if other != track and other.IsTrack() and other.GetLayer() == layer:
                     other_start = other.GetStart()
                     other_end = other.GetEnd()
@@ -1125,6 +1146,7 @@ class BaseValidator:
 
             # Check for high-speed signals
             high_speed_nets = ["USB", "HDMI", "PCIe", "LVDS", "DDR"]
+            track_index: Optional[BoardSpatialIndex] = None
             for net in board.GetNetsByName().values():
                 if any(signal in net.GetNetname() for signal in high_speed_nets):
                     # Check for ground plane under high-speed signals
@@ -1146,15 +1168,20 @@ class BaseValidator:
                             ))
 
                     # Check for return path
+                    if track_index is None:
+                        track_index = BoardSpatialIndex.from_board(board, kinds=(ITEM_TRACK,))
                     has_return_path = False
                     for track in net.GetTracks():
                         if not track.IsTrack():
                             continue
-                        for other in board.GetTracks():
+                        start = track.GetStart()
+                        nearby = track_index.query_point(start.x/1e6, start.y/1e6, 0.2, kinds=(ITEM_TRACK,))
+                        for other_item, _ in nearby:
+                            other = other_item.obj
                             if not other.IsTrack() or other == track:
                                 continue
                             if other.GetNetname() == "GND":
-                                if track.GetStart().Distance(other.GetStart()) < 0.2e6:  # 0.2mm
+                                if start.Distance(other.GetStart()) < 0.2e6:  # 0.2mm
                                     has_return_path = True
                                     break
                         if not has_return_path:
@@ -1243,6 +1270,7 @@ class BaseValidator:
 
             # Get component positions
             positions = self._get_component_positions(board)
+            footprint_index = BoardSpatialIndex.from_board(board, kinds=(ITEM_FOOTPRINT,))
             
             # Check each component
             for footprint in board.GetFootprints():
@@ -1339,7 +1367,7 @@ class BaseValidator:
                 
                 # Manufacturing validation
                 # Check placement clearance
-                clearance = self._get_component_clearance(footprint)
+                clearance = self._get_component_clearance(footprint, footprint_index)
                 if clearance and clearance < 0.5:
                     results.append(self._create_result(
                         category=ValidationCategory.MANUFACTURING,
@@ -1359,8 +1387,14 @@ class BaseValidator:
                     ))
                 
                 # Check for overlapping components
-                for other in board.GetFootprints():
-                    if other != footprint and other.HitTest(footprint.GetPosition()):
+                pos = footprint.GetPosition()
+                nearby = footprint_index.query_point(
+                    pos.x/1e6, pos.y/1e6, footprint_index.max_half_width(ITEM_FOOTPRINT),
+                    kinds=(ITEM_FOOTPRINT,)
+                )
+                for other_item, _ in nearby:
+                    other = other_item.obj
+                    if other != footprint and other.HitTest(pos):
                         results.append(self._create_result(
                             category=ValidationCategory.COMPONENTS,
                             message=f"Component {ref} overlaps with {other.GetReference()}",
@@ -1464,27 +1498,29 @@ class BaseValidator:
         except Exception:
             return None
 
-    def _get_component_clearance(self, footprint: pcbnew.FOOTPRINT) -> Optional[float]:
+    def _get_component_clearance(self, footprint: pcbnew.FOOTPRINT,
+                                 spatial_index: Optional[BoardSpatialIndex] = None) -> Optional[float]:
         """Calculate component clearance.
         
         Args:
             footprint: Component footprint
+            spatial_index: Optional prebuilt footprint index; built from the board if omitted
             
         Returns:
             Minimum clearance in mm if found, None otherwise
         """
         try:
-            board = pcbnew.GetBoard()
-            if not board:
-                return None
-            
-            min_clearance = float('inf')
-            for other in board.GetFootprints():
-                if other != footprint:
-                    distance = footprint.GetPosition().Distance(other.GetPosition()) / 1e6
-                    min_clearance = min(min_clearance, distance)
+            if spatial_index is None:
+                board = pcbnew.GetBoard()
+                if not board:
+                    return None
+                spatial_index = BoardSpatialIndex.from_board(board, kinds=(ITEM_FOOTPRINT,))
             
-            return min_clearance if min_clearance != float('inf') else None
+            pos = footprint.GetPosition()
+            nearest = spatial_index.nearest(
+                pos.x/1e6, pos.y/1e6, kinds=(ITEM_FOOTPRINT,), exclude=footprint
+            )
+            return nearest[1] if nearest else None
         except Exception:
             return None
 
@@ -0,0 +1,273 @@
+"""Board change tracking for incremental validation.
+
+``BoardChangeTracker`` keeps a content hash for every board item and, on each
+update, reports which items were added, modified or removed since the last
+scan. When KiCad exposes board listeners the tracker only rescans after a
+notification (or after a long safety interval), so an idle board costs no
+SWIG traffic at all.
+"""
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+
+from ..board.snapshot import BoardSnapshot
+
+logger = logging.getLogger(__name__)
+
+# Item kinds reported in a BoardChange
+CHANGE_TRACKS = "tracks"
+CHANGE_VIAS = "vias"
+CHANGE_FOOTPRINTS = "footprints"
+CHANGE_ZONES = "zones"
+CHANGE_BOARD = "board"  # outline, layer stack and design settings
+
+ALL_CHANGE_KINDS = frozenset({
+    CHANGE_TRACKS, CHANGE_VIAS, CHANGE_FOOTPRINTS, CHANGE_ZONES, CHANGE_BOARD
+})
+
+
+@dataclass
+class BoardChange:
+    """Dirty set between two board scans.
+
+    ``changed[kind]`` holds the keys of items that were added or modified and
+    ``removed[kind]`` the keys of items that were deleted or whose previous
+    version is no longer valid. Tracks, vias and zones are keyed by their
+    content, so a moved track shows up as one removed and one changed key.
+    Footprints are keyed by reference.
+    """
+    changed: Dict[str, Set[Hashable]] = field(default_factory=dict)
+    removed: Dict[str, Set[Hashable]] = field(default_factory=dict)
+    full: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether nothing changed."""
+        return not self.full and not any(self.changed.values()) and not any(self.removed.values())
+
+    @property
+    def kinds(self) -> Set[str]:
+        """Item kinds with at least one dirty item."""
+        if self.full:
+            return set(ALL_CHANGE_KINDS)
+        return {k for k, v in self.changed.items() if v} | {k for k, v in self.removed.items() if v}
+
+    def touches(self, kinds: Optional[Set[str]]) -> bool:
+        """Whether any of ``kinds`` has dirty items; None means any kind."""
+        if kinds is None:
+            return not self.is_empty
+        return bool(self.kinds & set(kinds))
+
+    def changed_keys(self, kind: str) -> Set[Hashable]:
+        """Keys of added or modified items of a kind."""
+        return self.changed.get(kind, set())
+
+    def stale_keys(self, kind: str) -> Set[Hashable]:
+        """Keys whose cached results must be dropped (changed or removed)."""
+        return self.changed.get(kind, set()) | self.removed.get(kind, set())
+
+
+def track_key(snapshot: BoardSnapshot, row: int) -> Hashable:
+    """Content key of a snapshot track row."""
+    t = snapshot.tracks
+    return (int(t.start_x[row]), int(t.start_y[row]), int(t.end_x[row]), int(t.end_y[row]),
+            int(t.width[row]), int(t.layer[row]), snapshot.net_names[t.net[row]])
+
+
+def via_key(snapshot: BoardSnapshot, row: int) -> Hashable:
+    """Content key of a snapshot via row."""
+    v = snapshot.vias
+    return (int(v.x[row]), int(v.y[row]), int(v.width[row]), int(v.drill[row]),
+            snapshot.net_names[v.net[row]])
+
+
+class BoardChangeTracker:
+    """Computes per-item dirty sets between board scans."""
+
+    def __init__(self, rescan_interval: float = 10.0):
+        """Initialize the tracker.
+
+        Args:
+            rescan_interval: Seconds between safety rescans while a board
+                listener is attached and reports no changes
+        """
+        self.rescan_interval = rescan_interval
+        self.snapshot: Optional[BoardSnapshot] = None
+        self._board: Any = None
+        self._hashes: Dict[str, Dict[Hashable, int]] = {}
+        self._dirty = True
+        self._listener: Any = None
+        self._last_scan = 0.0
+
+    def attach(self, board: Any, on_change: Optional[Callable[[], None]] = None) -> bool:
+        """Register a KiCad board listener that marks the tracker dirty.
+
+        Args:
+            board: KiCad board object
+            on_change: Optional callback invoked on every notification
+
+        Returns:
+            True if a listener was attached
+        """
+        self.detach()
+        self._board = board
+        self._dirty = True
+
+        def notify() -> None:
+            self.mark_dirty()
+            if on_change is not None:
+                on_change()
+
+        listener = _create_board_listener(notify)
+        if listener is None:
+            return False
+        try:
+            board.AddListener(listener)
+            self._listener = listener
+            return True
+        except Exception as e:
+            logger.debug(f"Board listeners unavailable, falling back to hashing: {e}")
+            return False
+
+    def detach(self) -> None:
+        """Remove the board listener, if any."""
+        if self._listener is not None and self._board is not None:
+            try:
+                self._board.RemoveListener(self._listener)
+            except Exception as e:
+                logger.debug(f"Error removing board listener: {e}")
+        self._listener = None
+
+    def mark_dirty(self) -> None:
+        """Force the next update to rescan the board."""
+        self._dirty = True
+
+    def reset(self) -> None:
+        """Forget all item hashes so the next update reports a full change."""
+        self.snapshot = None
+        self._hashes = {}
+        self._dirty = True
+
+    def update(self, board: Any) -> BoardChange:
+        """Rescan the board if needed and return what changed.
+
+        Args:
+            board: KiCad board object
+
+        Returns:
+            Dirty set since the previous update
+        """
+        if board is not self._board:
+            self.detach()
+            self._board = board
+            self.reset()
+
+        now = time.time()
+        if (self._listener is not None and not self._dirty and self._hashes
+                and now - self._last_scan < self.rescan_interval):
+            return BoardChange()
+
+        self._dirty = False
+        self._last_scan = now
+        snapshot = BoardSnapshot.from_board(board)
+        hashes = self._hash_items(snapshot)
+
+        if not self._hashes:
+            change = BoardChange(
+                changed={kind: set(items) for kind, items in hashes.items()},
+                full=True
+            )
+        else:
+            change = BoardChange()
+            for kind, items in hashes.items():
+                previous = self._hashes.get(kind, {})
+                change.changed[kind] = {
+                    key for key, digest in items.items() if previous.get(key) != digest
+                }
+                change.removed[kind] = {
+                    key for key, digest in previous.items() if items.get(key) != digest
+                }
+
+        self.snapshot = snapshot
+        self._hashes = hashes
+        return change
+
+    @staticmethod
+    def _hash_items(snapshot: BoardSnapshot) -> Dict[str, Dict[Hashable, int]]:
+        """Compute a content hash for every item in a snapshot."""
+        names = snapshot.net_names
+        hashes: Dict[str, Dict[Hashable, int]] = {}
+
+        # Content-keyed items: the key is the content, so the hash is constant
+        hashes[CHANGE_TRACKS] = {track_key(snapshot, i): 0 for i in range(len(snapshot.tracks))}
+        hashes[CHANGE_VIAS] = {via_key(snapshot, i): 0 for i in range(len(snapshot.vias))}
+        z = snapshot.zones
+        hashes[CHANGE_ZONES] = {
+            (int(z.left[i]), int(z.top[i]), int(z.right[i]), int(z.bottom[i]),
+             int(z.layer[i]), names[z.net[i]], float(z.area[i])): 0
+            for i in range(len(z))
+        }
+
+        # Footprints are keyed by reference and hashed with their pads
+        f = snapshot.footprints
+        p = snapshot.pads
+        footprints: Dict[Hashable, int] = {}
+        for i, ref in enumerate(f.reference):
+            start, end = int(f.pad_offset[i]), int(f.pad_offset[i + 1])
+            footprints[ref] = hash((
+                int(f.x[i]), int(f.y[i]), float(f.orientation[i]), int(f.layer[i]), f.value[i],
+                p.x[start:end].tobytes(), p.y[start:end].tobytes(),
+                p.size_x[start:end].tobytes(), p.size_y[start:end].tobytes(),
+                tuple(names[n] for n in p.net[start:end].tolist())
+            ))
+        hashes[CHANGE_FOOTPRINTS] = footprints
+
+        hashes[CHANGE_BOARD] = {
+            "board": hash((
+                snapshot.board_box,
+                tuple(sorted(snapshot.layer_names.items())),
+                repr(sorted(snapshot.design_rules.items()))
+            ))
+        }
+        return hashes
+
+
+def _create_board_listener(callback: Callable[[], None]) -> Any:
+    """Create a pcbnew BOARD_LISTENER forwarding every event to ``callback``."""
+    try:
+        import pcbnew
+        base = pcbnew.BOARD_LISTENER
+    except (ImportError, AttributeError):
+        return None
+
+    class _Listener(base):
+        def OnBoardItemAdded(self, board, item):
+            callback()
+
+        def OnBoardItemsAdded(self, board, items):
+            callback()
+
+        def OnBoardItemRemoved(self, board, item):
+            callback()
+
+        def OnBoardItemsRemoved(self, board, items):
+            callback()
+
+        def OnBoardItemChanged(self, board, item):
+            callback()
+
+        def OnBoardItemsChanged(self, board, items):
+            callback()
+
+        def OnBoardNetSettingsChanged(self, board):
+            callback()
+
+        def OnBoardHighlightNetChanged(self, board):
+            pass
+
+    try:
+        return _Listener()
+    except Exception as e:
+        logger.debug(f"Could not create board listener: {e}")
+        return None
@@ -12,6 +12,7 @@ from enum import Enum
 import pcbnew
 
 from .base_validator import ValidationCategory, ValidationResult
+from ..board.spatial_index import BoardSpatialIndex, ITEM_FOOTPRINT
 
 class EnhancedValidationCategory(Enum):
     """Additional categories for enhanced validation."""
@@ -238,6 +239,7 @@ class EnhancedFeaturesMixin:
         
         try:
             # Check for manufacturing optimization opportunities
+            footprint_index = BoardSpatialIndex.from_board(board, kinds=(ITEM_FOOTPRINT,))
             for footprint in board.GetFootprints():
                 # Check component orientation
                 if footprint.GetOrientation() % 90 != 0:
@@ -251,14 +253,13 @@ class EnhancedFeaturesMixin:
                     ))
                 
                 # Check for proper component spacing
-                for other in board.GetFootprints():
+                pos1 = footprint.GetPosition()
+                nearby = footprint_index.query_point(pos1.x/1e6, pos1.y/1e6, 0.5, kinds=(ITEM_FOOTPRINT,))
+                for item, distance in nearby:
+                    other = item.obj
                     if other == footprint:
                         continue
                     
-                    pos1 = footprint.GetPosition()
-                    pos2 = other.GetPosition()
-                    distance = ((pos1.x - pos2.x) ** 2 + (pos1.y - pos2.y) ** 2) ** 0.5 / 1e6
-                    
                     if distance < 0.5:  # Components too close
                         results[ValidationCategory.GENERAL].append(EnhancedValidationResult(
                             category=ValidationCategory.GENERAL,
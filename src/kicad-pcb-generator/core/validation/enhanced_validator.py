@@ -12,6 +12,7 @@ import pcbnew
 
 from ..board.validator import BoardValidator, ValidationCategory, ValidationResult
 from .enhanced_features import EnhancedFeaturesMixin
+from ..board.spatial_index import BoardSpatialIndex, ITEM_FOOTPRINT
 
 class EnhancedValidationCategory(Enum):
     """Additional categories for enhanced validation."""
@@ -278,6 +279,7 @@ class EnhancedValidator(BoardValidator, EnhancedFeaturesMixin):
         
         try:
             # Check for manufacturing optimization opportunities
+            footprint_index = BoardSpatialIndex.from_board(board, kinds=(ITEM_FOOTPRINT,))
             for footprint in board.GetFootprints():
                 # Check component orientation
                 if footprint.GetOrientation() % 90 != 0:
@@ -291,14 +293,13 @@ class EnhancedValidator(BoardValidator, EnhancedFeaturesMixin):
                     ))
                 
                 # Check for proper component spacing
-                for other in board.GetFootprints():
+                pos1 = footprint.GetPosition()
+                nearby = footprint_index.query_point(pos1.x/1e6, pos1.y/1e6, 0.5, kinds=(ITEM_FOOTPRINT,))
+                for item, distance in nearby:
+                    other = item.obj
                     if other == footprint:
                         continue
                     
-                    pos1 = footprint.GetPosition()
-                    pos2 = other.GetPosition()
-                    distance = ((pos1.x - pos2.x) ** 2 + (pos1.y - pos2.y) ** 2) ** 0.5 / 1e6
-                    
                     if distance < 0.5:  # Components too close
                         results[ValidationCategory.GENERAL].append(EnhancedValidationResult(
                             category=EnhancedValidationCategory.MANUFACTURING_OPTIMIZATION,
@@ -7,8 +7,9 @@ from enum import Enum
 import threading
 import time
 import math
+import numpy as np
 from functools import lru_cache
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from ..utils.config.settings import Settings
 from ..utils.logging.logger import Logger
 from ..core.validation.cache_manager import CacheManager
@@ -19,6 +20,17 @@ from ..core.validation.validation_results import (
 )
 from ..core.validation.validation_result_factory import ValidationResultFactory
 from ..core.utils.pcb_utils import PCBUtils
+from ..board.snapshot import BoardSnapshot
+from ..board.spatial_index import BoardSpatialIndex, ALL_LAYERS, ITEM_TRACK, ITEM_FOOTPRINT
+from .change_tracker import (
+    BoardChange,
+    BoardChangeTracker,
+    CHANGE_TRACKS,
+    CHANGE_VIAS,
+    CHANGE_FOOTPRINTS,
+    CHANGE_BOARD,
+    track_key
+)
 from ..core.validation.validation_rule import ValidationRule, RuleType
 from ..utils.error_handling import (
     handle_validation_error,
@@ -48,14 +60,31 @@ class ValidationType(Enum):
 class RealTimeValidator(BaseValidator, CommonValidatorMixin):
     """Real-time validator for PCB design."""
     
+    # Board item kinds each rule reads; None means the rule depends on everything
+    RULE_INPUTS: Dict[str, Optional[Set[str]]] = {
+        "check_design_rules": {CHANGE_TRACKS, CHANGE_VIAS, CHANGE_BOARD},
+        "check_audio_rules": None,
+        "check_manufacturing": {CHANGE_FOOTPRINTS, CHANGE_BOARD},
+        "check_cost": {CHANGE_FOOTPRINTS, CHANGE_BOARD},
+    }
+    
     def __init__(self):
         super().__init__()
         self._validation_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-        self._validation_lock = threading.Lock()
+        # Serializes passes and direct validate() calls over the shared caches
+        self._validation_lock = threading.RLock()
         self._executor = ThreadPoolExecutor(max_workers=4)
         self._last_board_state: Optional[Dict[str, Any]] = None
+        # Snapshot and change of the incremental pass a worker thread runs a rule for
+        self._pass_state = threading.local()
         self._validation_interval = 1.0  # seconds
+        
+        # Incremental validation state
+        self._change_tracker = BoardChangeTracker()
+        self._change_event = threading.Event()
+        self._rule_results: Dict[str, ValidationResult] = {}
+        self._pair_violations: Dict[str, Dict[frozenset, Dict[str, Any]]] = {}
         self._audio_validator = AudioValidator()
         self._register_default_rules()
 
@@ -88,6 +117,7 @@ class RealTimeValidator(BaseValidator, CommonValidatorMixin):
             return
 
         self._stop_event.clear()
+        self._change_tracker.attach(board, self._change_event.set)
         self._validation_thread = threading.Thread(
             target=self._validation_loop,
             args=(board,),
@@ -98,29 +128,171 @@ class RealTimeValidator(BaseValidator, CommonValidatorMixin):
     def stop_validation(self) -> None:
         """Stop real-time validation."""
         self._stop_event.set()
+        self._change_event.set()
         if self._validation_thread is not None:
             self._validation_thread.join()
             self._validation_thread = None
+        self._change_tracker.detach()
+
+    def notify_board_changed(self) -> None:
+        """Tell the validator the board was edited so it rescans immediately."""
+        self._change_tracker.mark_dirty()
+        self._change_event.set()
 
     def _validation_loop(self, board: Any) -> None:
-        """Main validation loop."""
-        last_validation_time = 0
-        min_validation_interval = 0.5  # Minimum time between validations
+        """Main validation loop.
         
+        Sleeps until a board listener (or ``notify_board_changed``) reports an
+        edit, or the validation interval elapses. Each wake-up computes the
+        per-item dirty set and only re-runs the rules that read dirty items.
+        """
         while not self._stop_event.is_set():
-            current_time = time.time()
+            with self._validation_lock:
+                change = self._change_tracker.update(board)
+                if not change.is_empty:
+                    self.validate_incremental(board, change)
+            
+            self._change_event.wait(self._validation_interval)
+            self._change_event.clear()
+
+    def validate_incremental(self, board: Any, change: BoardChange) -> ValidationResult:
+        """Re-run the rules affected by a change and merge with cached results.
+        
+        Args:
+            board: KiCad board object
+            change: Dirty set from the change tracker
+            
+        Returns:
+            Merged validation result of all enabled rules
+        """
+        with self._validation_lock:
+            snapshot = self._change_tracker.snapshot
+            pending = None if change.full else change
+            futures = {}
+            for rule_name in self._validation_order:
+                if not self.is_check_enabled(rule_name):
+                    self._rule_results.pop(rule_name, None)
+                    continue
+                inputs = self.RULE_INPUTS.get(rule_name)
+                if rule_name in self._rule_results and not change.touches(inputs):
+                    continue
+                rule_func = self._validation_rules[rule_name]
+                futures[rule_name] = self._executor.submit(
+                    self._run_pass_rule, rule_func, board, snapshot, pending
+                )
             
-            # Only check for changes if enough time has passed
-            if current_time - last_validation_time >= min_validation_interval:
-                with self._validation_lock:
-                    current_state = self._get_board_state(board)
-                    if self._has_board_changed(current_state):
-                        self._last_board_state = current_state
-                        self.validate(board)
-                        last_validation_time = current_time
+            for rule_name, future in futures.items():
+                try:
+                    self._rule_results[rule_name] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error in incremental rule {rule_name}: {str(e)}")
+                    self._rule_results.pop(rule_name, None)
             
-            # Sleep for a shorter interval to be more responsive
-            time.sleep(min(self._validation_interval, 0.1))
+            return self._merge_rule_results(list(self._rule_results.values()))
+
+    def _run_pass_rule(self, rule_func: Callable, board: Any, snapshot: Optional[BoardSnapshot],
+                       change: Optional[BoardChange]) -> Any:
+        """Run a rule with the pass snapshot and change visible to its thread only."""
+        state = self._pass_state
+        state.snapshot, state.change = snapshot, change
+        try:
+            return rule_func(board)
+        finally:
+            state.snapshot, state.change = None, None
+
+    def _merge_rule_results(self, rule_results: List[Any]) -> ValidationResult:
+        """Merge the issues of several rule results into one result."""
+        result = ValidationResult()
+        for rule_result in rule_results:
+            if isinstance(rule_result, ValidationResult):
+                for issue in rule_result.issues:
+                    result.add_issue(
+                        message=issue.message,
+                        severity=issue.severity,
+                        category=issue.category,
+                        location=issue.location,
+                        details=issue.details,
+                        suggestion=issue.suggestion,
+                        documentation_ref=issue.documentation_ref
+                    )
+        return result
+
+    def _get_snapshot(self, board: Any) -> BoardSnapshot:
+        """Get the snapshot of the incremental pass this thread runs a rule for.
+
+        Outside ``validate_incremental`` the board may have been edited since
+        the tracker's last scan, so a fresh snapshot is extracted.
+        """
+        snapshot = getattr(self._pass_state, "snapshot", None)
+        if snapshot is not None:
+            return snapshot
+        return BoardSnapshot.from_board(board)
+
+    def _update_pair_violations(self, name: str, kind: str, keys: List[Any],
+                                index: BoardSpatialIndex, item_kind: str, distance: float,
+                                make_violation: Callable[[int, int, float], Optional[Dict[str, Any]]]
+                                ) -> List[Dict[str, Any]]:
+        """Maintain cached violations of a pairwise proximity rule.
+        
+        Without a pending change every pair closer than ``distance`` is
+        re-evaluated. With a pending change only pairs involving dirty items
+        are dropped and re-evaluated against their neighbourhood.
+        
+        Args:
+            name: Cache name of the rule
+            kind: Change kind of the items (e.g. ``tracks``)
+            keys: Change-tracker key of every snapshot row
+            index: Spatial index whose item rows match ``keys``
+            item_kind: Spatial index item kind
+            distance: Proximity threshold in mm
+            make_violation: Builds the violation for rows (a, b) at a distance,
+                or returns None if the pair is acceptable
+            
+        Returns:
+            Current violations
+        """
+        # A rule that never completed a full pass has nothing to update
+        change = getattr(self._pass_state, "change", None) if name in self._pair_violations else None
+        cache = self._pair_violations.setdefault(name, {})
+        try:
+            return self._refresh_pair_violations(cache, change, kind, keys, index,
+                                                 item_kind, distance, make_violation)
+        except Exception:
+            # Drop the partially updated cache so the next pass starts over
+            self._pair_violations.pop(name, None)
+            raise
+
+    @staticmethod
+    def _refresh_pair_violations(cache: Dict[frozenset, Dict[str, Any]],
+                                 change: Optional[BoardChange], kind: str, keys: List[Any],
+                                 index: BoardSpatialIndex, item_kind: str, distance: float,
+                                 make_violation: Callable[[int, int, float], Optional[Dict[str, Any]]]
+                                 ) -> List[Dict[str, Any]]:
+        """Recompute all cached pair violations, or only those touching dirty items."""
+        if change is None:
+            cache.clear()
+            for a, b, d in index.close_pairs(distance, kinds=(item_kind,), same_layer=False):
+                violation = make_violation(a.row, b.row, d)
+                if violation is not None:
+                    cache[frozenset((keys[a.row], keys[b.row]))] = violation
+            return list(cache.values())
+        
+        stale = change.stale_keys(kind)
+        for pair in [pair for pair in cache if pair & stale]:
+            del cache[pair]
+        
+        dirty = change.changed_keys(kind)
+        for item in index.items:
+            if item.kind != item_kind or keys[item.row] not in dirty:
+                continue
+            for other, d in index.query_segment(item.x1, item.y1, item.x2, item.y2, distance,
+                                                kinds=(item_kind,)):
+                if other.row == item.row or d >= distance:
+                    continue
+                violation = make_violation(min(item.row, other.row), max(item.row, other.row), d)
+                if violation is not None:
+                    cache[frozenset((keys[item.row], keys[other.row]))] = violation
+        return list(cache.values())
 
     def _get_board_state(self, board: pcbnew.BOARD) -> Dict[str, Any]:
         """Get the current state of the board.
@@ -132,82 +304,61 @@ class RealTimeValidator(BaseValidator, CommonValidatorMixin):
             Dictionary containing board state information
         """
         try:
-            # Get component positions (cached)
-            component_positions = self._get_component_positions(board)
-            
-            # Get board dimensions (cached)
-            board_box = self._get_board_box(board)
-            
-            # Get track information with optimized collection
-            tracks = []
-            board_tracks = board.GetTracks()
-            for track in board_tracks:
-                if track.IsTrack():
-                    # Cache track properties to avoid repeated API calls
-                    net_name = track.GetNetname()
-                    layer_name = board.GetLayerName(track.GetLayer())
-                    width = track.GetWidth()
-                    start_pos = track.GetStart()
-                    end_pos = track.GetEnd()
-                    
-                    tracks.append({
-                        'net': net_name,
-                        'layer': layer_name,
-                        'width': width,
-                        'start': (start_pos.x, start_pos.y),
-                        'end': (end_pos.x, end_pos.y)
-                    })
-            
-            # Get via information with optimized collection
-            vias = []
-            board_vias = board.GetVias()
-            for via in board_vias:
-                # Cache via properties
-                net_name = via.GetNetname()
-                position = via.GetPosition()
-                width = via.GetWidth()
-                drill = via.GetDrill()
-                
-                vias.append({
-                    'net': net_name,
-                    'position': (position.x, position.y),
+            # Extract the board once; everything below reads plain arrays
+            snapshot = BoardSnapshot.from_board(board)
+            names = snapshot.net_names
+            layer_names = snapshot.layer_names
+            
+            footprints = snapshot.footprints
+            component_positions = {
+                ref: (int(footprints.x[i]) / 1e6, int(footprints.y[i]) / 1e6)  # Convert to mm
+                for i, ref in enumerate(footprints.reference) if ref
+            }
+            board_box = snapshot.board_size
+            
+            t = snapshot.tracks
+            tracks = [
+                {
+                    'net': names[net],
+                    'layer': layer_names.get(layer, str(layer)),
+                    'width': width,
+                    'start': (sx, sy),
+                    'end': (ex, ey)
+                }
+                for net, layer, width, sx, sy, ex, ey in zip(
+                    t.net.tolist(), t.layer.tolist(), t.width.tolist(),
+                    t.start_x.tolist(), t.start_y.tolist(), t.end_x.tolist(), t.end_y.tolist()
+                )
+            ]
+            
+            v = snapshot.vias
+            vias = [
+                {
+                    'net': names[net],
+                    'position': (x, y),
                     'width': width,
                     'drill': drill
-                })
-            
-            # Get zone information with optimized collection
-            zones = []
-            board_zones = board.Zones()
-            for zone in board_zones:
-                # Cache zone properties
-                net_name = zone.GetNetname()
-                layer_name = board.GetLayerName(zone.GetLayer())
-                area = zone.GetArea()
-                
-                zones.append({
-                    'net': net_name,
-                    'layer': layer_name,
+                }
+                for net, x, y, width, drill in zip(
+                    v.net.tolist(), v.x.tolist(), v.y.tolist(), v.width.tolist(), v.drill.tolist()
+                )
+            ]
+            
+            z = snapshot.zones
+            zones = [
+                {
+                    'net': names[net],
+                    'layer': layer_names.get(layer, str(layer)),
                     'area': area
-                })
-            
-            # Get design rules (cached)
-            settings = board.GetDesignSettings()
-            design_rules = {
-                'min_track_width': settings.GetTrackWidth(),
-                'min_clearance': settings.GetMinClearance(),
-                'via_diameter': settings.GetViasDimensions(),
-                'via_drill': settings.GetViasDrill()
-            }
+                }
+                for net, layer, area in zip(z.net.tolist(), z.layer.tolist(), z.area.tolist())
+            ]
             
-            # Get layer information
-            layers = []
-            for layer_id in range(pcbnew.PCB_LAYER_ID_COUNT):
-                if board.IsLayerEnabled(layer_id):
-                    layers.append({
-                        'id': layer_id,
-                        'name': board.GetLayerName(layer_id),
-                        'enabled': True
-                    })
+            design_rules = snapshot.design_rules
+            layers = [
+                {'id': layer_id, 'name': name, 'enabled': True}
+                for layer_id, name in sorted(layer_names.items())
+            ]
             
             return {
                 'components': component_positions,
@@ -340,8 +491,27 @@ class RealTimeValidator(BaseValidator, CommonValidatorMixin):
         height = (box.GetHeight() / 1e6)  # Convert to mm
         return (width, height)
 
-    def validate(self, board: Any) -> ValidationResult:
-        """Validate the PCB board."""
+    def validate(self, board: Any = None) -> ValidationResult:
+        """Validate the PCB board.
+
+        Waits for an incremental pass in progress, since both update the
+        cached pair violations.
+
+        Args:
+            board: KiCad board object; defaults to ``pcbnew.GetBoard()``
+
+        Returns:
+            Issues of every enabled rule
+        """
+        if board is None:
+            board = pcbnew.GetBoard()
+            if not board:
+                return ValidationResult()
+        with self._validation_lock:
+            return self._validate_all(board)
+
+    def _validate_all(self, board: Any) -> ValidationResult:
+        """Run every enabled rule on a fresh snapshot and collect the issues."""
         result = ValidationResult()
         
         # Run all registered rules in parallel
@@ -404,16 +574,43 @@ class RealTimeValidator(BaseValidator, CommonValidatorMixin):
                 min_via_drill = drc_config.get('min_via_drill', min_via_drill)
                 min_hole_size = drc_config.get('min_hole_size', min_hole_size)
             
+            snapshot = self._get_snapshot(board)
+            tracks = snapshot.tracks
+            vias = snapshot.vias
+            
+            # Clearances are maintained incrementally so the pair cache stays
+            # current even when an earlier check reports first
+            keys = [track_key(snapshot, i) for i in range(len(tracks))]
+            start_index = BoardSpatialIndex(cell_size=max(min_clearance, 0.05) * 4)
+            for i in range(len(tracks)):
+                x, y = tracks.start_x[i] / 1e6, tracks.start_y[i] / 1e6
+                start_index.add(ITEM_TRACK, ALL_LAYERS, x, y, x, y, row=i)
+            
+            def clearance_violation(a: int, b: int, distance: float) -> Optional[Dict[str, Any]]:
+                # Skip if same net
+                if tracks.net[a] == tracks.net[b]:
+                    return None
+                return {
+                    'distance': distance,
+                    'position': (tracks.start_x[a] / 1e6, tracks.start_y[a] / 1e6),
+                    'net1': snapshot.net_name(tracks.net[a]),
+                    'net2': snapshot.net_name(tracks.net[b])
+                }
+            
+            clearance_violations = self._update_pair_violations(
+                "clearance", CHANGE_TRACKS, keys, start_index, ITEM_TRACK,
+                min_clearance, clearance_violation
+            )
+            
             # Check track widths
-            thin_tracks = []
-            for track in board.GetTracks():
-                if track.IsTrack():
-                    track_width = track.GetWidth() / 1e6  # Convert to mm
-                    if track_width < min_track_width:
-                        thin_tracks.append({
-                            'width': track_width,
-                            'position': (track.GetStart().x / 1e6, track.GetStart().y / 1e6)
-                        })
+            widths = tracks.width / 1e6  # Convert to mm
+            thin_tracks = [
+                {
+                    'width': float(widths[i]),
+                    'position': (tracks.start_x[i] / 1e6, tracks.start_y[i] / 1e6)
+                }
+                for i in np.flatnonzero(widths < min_track_width)
+            ]
             
             if thin_tracks:
                 return self._result_factory.create_result(
@@ -427,17 +624,16 @@ class RealTimeValidator(BaseValidator, CommonValidatorMixin):
                 )
             
             # Check via sizes
-            small_vias = []
-            for via in board.GetVias():
-                via_width = via.GetWidth() / 1e6  # Convert to mm
-                via_drill = via.GetDrill() / 1e6  # Convert to mm
-                
-                if via_width < min_via_size or via_drill < min_via_drill:
-                    small_vias.append({
-                        'width': via_width,
-                        'drill': via_drill,
-                        'position': (via.GetPosition().x / 1e6, via.GetPosition().y / 1e6)
-                    })
+            via_widths = vias.width / 1e6  # Convert to mm
+            via_drills = vias.drill / 1e6  # Convert to mm
+            small_vias = [
+                {
+                    'width': float(via_widths[i]),
+                    'drill': float(via_drills[i]),
+                    'position': (vias.x[i] / 1e6, vias.y[i] / 1e6)
+                }
+                for i in np.flatnonzero((via_widths < min_via_size) | (via_drills < min_via_drill))
+            ]
             
             if small_vias:
                 return self._result_factory.create_result(
@@ -451,36 +647,6 @@ class RealTimeValidator(BaseValidator, CommonValidatorMixin):
                     }
                 )
             
-            # Check clearances
-            clearance_violations = []
-            for track1 in board.GetTracks():
-                if not track1.IsTrack():
-                    continue
-                    
-                for track2 in board.GetTracks():
-                    if track1 == track2 or not track2.IsTrack():
-                        continue
-                    
-                    # Skip if same net
-                    if track1.GetNetname() == track2.GetNetname():
-                        continue
-                    
-                    # Calculate clearance (simplified)
-                    pos1 = track1.GetStart()
-                    pos2 = track2.GetStart()
-                    distance = math.sqrt(
-                        ((pos1.x - pos2.x) / 1e6) ** 2 +
-                        ((pos1.y - pos2.y) / 1e6) ** 2
-                    )
-                    
-                    if distance < min_clearance:
-                        clearance_violations.append({
-                            'distance': distance,
-                            'position': (pos1.x / 1e6, pos1.y / 1e6),
-                            'net1': track1.GetNetname(),
-                            'net2': track2.GetNetname()
-                        })
-            
             if clearance_violations:
                 return self._result_factory.create_result(
                     category=ValidationCategory.DESIGN_RULES,
@@ -522,28 +688,25 @@ class RealTimeValidator(BaseValidator, CommonValidatorMixin):
     def _check_manufacturing(self, board: Any) -> ValidationResult:
         """Check manufacturing requirements."""
         try:
-            # Check component spacing
-            spacing_violations = []
-            for footprint1 in board.GetFootprints():
-                for footprint2 in board.GetFootprints():
-                    if footprint1 == footprint2:
-                        continue
-                    
-                    pos1 = footprint1.GetPosition()
-                    pos2 = footprint2.GetPosition()
-                    distance = math.sqrt(
-                        ((pos1.x - pos2.x) / 1e6) ** 2 +
-                        ((pos1.y - pos2.y) / 1e6) ** 2
-                    )
-                    
-                    min_spacing = 0.5  # 0.5mm minimum spacing
-                    if distance < min_spacing:
-                        spacing_violations.append({
-                            'distance': distance,
-                            'component1': footprint1.GetReference(),
-                            'component2': footprint2.GetReference(),
-                            'position': (pos1.x / 1e6, pos1.y / 1e6)
-                        })
+            snapshot = self._get_snapshot(board)
+            footprints = snapshot.footprints
+            
+            # Check component spacing around dirty footprints only
+            min_spacing = 0.5  # 0.5mm minimum spacing
+            
+            def spacing_violation(a: int, b: int, distance: float) -> Dict[str, Any]:
+                return {
+                    'distance': distance,
+                    'component1': footprints.reference[a],
+                    'component2': footprints.reference[b],
+                    'position': (footprints.x[a] / 1e6, footprints.y[a] / 1e6)
+                }
+            
+            spacing_violations = self._update_pair_violations(
+                "spacing", CHANGE_FOOTPRINTS, footprints.reference,
+                snapshot.spatial_index(kinds=(ITEM_FOOTPRINT,)), ITEM_FOOTPRINT,
+                min_spacing, spacing_violation
+            )
             
             if spacing_violations:
                 return self._result_factory.create_result(
@@ -557,24 +720,20 @@ class RealTimeValidator(BaseValidator, CommonValidatorMixin):
                 )
             
             # Check board edge clearance
-            edge_violations = []
-            board_box = board.GetBoardEdgesBoundingBox()
-            board_width = board_box.GetWidth() / 1e6
-            board_height = board_box.GetHeight() / 1e6
-            
-            for footprint in board.GetFootprints():
-                pos = footprint.GetPosition()
-                x = pos.x / 1e6
-                y = pos.y / 1e6
-                
-                min_edge_clearance = 2.0  # 2mm minimum edge clearance
-                if (x < min_edge_clearance or x > board_width - min_edge_clearance or
-                    y < min_edge_clearance or y > board_height - min_edge_clearance):
-                    edge_violations.append({
-                        'component': footprint.GetReference(),
-                        'position': (x, y),
-                        'edge_clearance': min(x, y, board_width - x, board_height - y)
-                    })
+            board_width, board_height = snapshot.board_size
+            min_edge_clearance = 2.0  # 2mm minimum edge clearance
+            xs = footprints.x / 1e6
+            ys = footprints.y / 1e6
+            near_edge = ((xs < min_edge_clearance) | (xs > board_width - min_edge_clearance) |
+                         (ys < min_edge_clearance) | (ys > board_height - min_edge_clearance))
+            edge_violations = [
+                {
+                    'component': footprints.reference[i],
+                    'position': (float(xs[i]), float(ys[i])),
+                    'edge_clearance': float(min(xs[i], ys[i], board_width - xs[i], board_height - ys[i]))
+                }
+                for i in np.flatnonzero(near_edge)
+            ]
             
             if edge_violations:
                 return self._result_factory.create_result(
@@ -613,9 +772,11 @@ class RealTimeValidator(BaseValidator, CommonValidatorMixin):
     def _check_cost(self, board: Any) -> ValidationResult:
         """Check cost optimization opportunities."""
         try:
+            snapshot = self._get_snapshot(board)
+            
             # Calculate board area
-            board_box = board.GetBoardEdgesBoundingBox()
-            board_area = (board_box.GetWidth() * board_box.GetHeight()) / 1e12  # Convert to mm²
+            board_width, board_height = snapshot.board_size
+            board_area = board_width * board_height  # mm²
             
             # Check board size
             if board_area > 10000:  # More than 100cm²
@@ -630,7 +791,7 @@ class RealTimeValidator(BaseValidator, CommonValidatorMixin):
                 )
             
             # Check layer count
-            layer_count = len([layer for layer in range(pcbnew.PCB_LAYER_ID_COUNT) if board.IsLayerEnabled(layer)])
+            layer_count = len(snapshot.layer_names)
             if layer_count > 4:  # More than 4 layers
                 return self._result_factory.create_result(
                     category=ValidationCategory.COST,
@@ -643,7 +804,7 @@ class RealTimeValidator(BaseValidator, CommonValidatorMixin):
                 )
             
             # Check hole count
-            hole_count = len([pad for pad in board.GetPads() if pad.GetAttribute() == pcbnew.PAD_ATTRIB_PTH])
+            hole_count = int(np.count_nonzero(snapshot.pads.is_pth))
             if hole_count > 1000:  # More than 1000 holes
                 return self._result_factory.create_result(
                     category=ValidationCategory.COST,
@@ -773,53 +934,6 @@ class RealTimeValidator(BaseValidator, CommonValidatorMixin):
         self._cache_manager.cache_results(board_state, results)
         self._last_cache_update = time.time()
 
-    def validate(self) -> List[ValidationResult]:
-        """Perform validation in parallel.
-        
-        Returns:
-            List of validation results
-        """
-        try:
-            board = pcbnew.GetBoard()
-            if not board:
-                return []
-            
-            # Get enabled validation types
-            enabled_types = [
-                validation_type.value
-                for validation_type in ValidationType
-                if self.is_rule_enabled(validation_type.value)
-            ]
-            
-            # Create thread pool
-            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-                # Submit validation tasks
-                future_to_type = {
-                    executor.submit(self._validation_tasks[validation_type]): validation_type
-                    for validation_type in enabled_types
-                }
-                
-                # Collect results
-                results = []
-                for future in as_completed(future_to_type):
-                    validation_type = future_to_type[future]
-                    try:
-                        validation_results = future.result()
-                        results.extend(validation_results)
-                    except Exception as e:
-                        self.logger.error(f"Error in {validation_type} validation: {str(e)}")
-                        results.append(self._result_factory.create_result(
-                            category=ValidationCategory(validation_type),
-                            message=f"Validation error: {str(e)}",
-                            severity=ValidationSeverity.ERROR
-                        ))
-            
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"Error in validation: {str(e)}")
-            return []
-
     @handle_validation_error(logger=Logger(__name__), category="design_rules")
     def _validate_design_rules(self) -> List[ValidationResult]:
         """Validate design rules with optimized DRC engine usage.
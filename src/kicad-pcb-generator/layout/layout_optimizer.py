@@ -11,6 +11,9 @@ from ..core.base.results.optimization_result import OptimizationResult, Optimiza
 from ..ai.design_assistant import DesignAssistant
 from ..ai.component_selector import ComponentSelector, ComponentSpec, ComponentCategory
 from ..config.layout_config import LayoutConfig
+from ..core.board.spatial_index import BoardSpatialIndex, ITEM_TRACK, ITEM_FOOTPRINT, ALL_LAYERS
+from ..core.board.congestion_map import CongestionMap
+from .placement_engine import PlacementEngine, PlacementProblem, PlacementResult
 
 if TYPE_CHECKING:
     import pcbnew
@@ -107,6 +110,16 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
         self._pad_cache: Dict[str, List[pcbnew.PAD]] = {}
         self._zone_cache: Dict[str, List[pcbnew.ZONE]] = {}
         
+        # Placement engine limits and last result
+        self.placement_time_limit = 10.0  # seconds
+        self.placement_moves_per_component = 200
+        self.last_placement_result: Optional[PlacementResult] = None
+        
+        # Routing congestion map
+        self.congestion_grid_size = 10.0  # mm
+        self.congestion_track_threshold = 5  # tracks per cell
+        self.congestion_map: Optional[CongestionMap] = None
+        
         # Initialize optimization items
         self._initialize_optimization_items()
     
@@ -357,8 +370,6 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
             self._get_power_planes.cache_clear()
             self._get_component_positions.cache_clear()
             self._extract_design_data.cache_clear()
-            self._calculate_optimal_position.cache_clear()
-            self._evaluate_position.cache_clear()
             
             # Get AI recommendations
             design_data = self._extract_design_data()
@@ -481,7 +492,13 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
             raise
     
     def _optimize_component_placement(self) -> None:
-        """Optimize component placement."""
+        """Optimize component placement.
+        
+        All footprints are placed together by the netlist-driven
+        ``PlacementEngine``: components are grouped by type for their spacing
+        and orientation constraints, ordered by importance, and then seeded,
+        legalized and annealed to minimize net-weighted wirelength.
+        """
         try:
             # Get all footprints
             footprints = self.board.GetFootprints()
@@ -489,14 +506,96 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
             # Group components by type
             component_groups = self._group_components(footprints)
             
-            # Optimize each group
+            # Order components by importance within their group and apply
+            # the preferred orientation before measuring their size
+            ordered = []
+            constraints_by_ref = {}
             for group_type, group in component_groups.items():
-                self._optimize_component_group(group_type, group)
+                constraints = self._get_placement_constraints(group_type)
+                for component in self._sort_components_by_importance(group):
+                    component.SetOrientationDegrees(constraints['preferred_orientation'])
+                    ordered.append(component)
+                    constraints_by_ref[component.GetReference()] = constraints
+            
+            if not ordered:
+                return
+            
+            problem = self._build_placement_problem(ordered, constraints_by_ref)
+            engine = PlacementEngine(problem)
+            result = engine.run(
+                time_limit=self.placement_time_limit,
+                moves_per_component=self.placement_moves_per_component
+            )
+            self.last_placement_result = result
+            
+            for component in ordered:
+                reference = component.GetReference()
+                x, y = result.positions[reference]
+                self._place_component(
+                    component,
+                    constraints_by_ref[reference],
+                    pcbnew.VECTOR2I(int(round(x * 1e6)), int(round(y * 1e6)))
+                )
+            
+            if result.unplaced:
+                self.logger.warning(f"No free placement site for: {', '.join(result.unplaced)}")
             
         except Exception as e:
             self.logger.error(f"Error optimizing component placement: {str(e)}")
             raise
     
+    def _build_placement_problem(
+        self,
+        footprints: List[pcbnew.FOOTPRINT],
+        constraints_by_ref: Dict[str, Dict[str, Any]]
+    ) -> PlacementProblem:
+        """Build the placement problem for a set of footprints.
+        
+        Args:
+            footprints: Footprints in placement priority order
+            constraints_by_ref: Placement constraints per reference
+            
+        Returns:
+            Placement problem
+        """
+        # Keep power plane anchors clear by the largest clearance in use
+        clearance = max(
+            (c['power_plane_clearance'] for c in constraints_by_ref.values()),
+            default=0.0
+        )
+        keepouts = [
+            (pos.x / 1e6 - clearance, pos.y / 1e6 - clearance,
+             pos.x / 1e6 + clearance, pos.y / 1e6 + clearance)
+            for pos in self._get_power_planes()
+        ] if clearance > 0 else []
+        
+        return PlacementProblem.from_board(
+            self.board,
+            footprints=footprints,
+            spacing={ref: c['min_spacing'] for ref, c in constraints_by_ref.items()},
+            net_weight=self._placement_net_weight,
+            keepouts=keepouts
+        )
+    
+    @staticmethod
+    def _placement_net_weight(net_name: str, component_count: int) -> float:
+        """Weight of a net in the placement wirelength.
+        
+        Power nets are left to the planes, high-speed nets pull harder.
+        
+        Args:
+            net_name: Net name
+            component_count: Number of components on the net
+            
+        Returns:
+            Net weight (0 ignores the net)
+        """
+        if net_name.startswith(("PWR", "GND", "/PWR", "/GND")):
+            return 0.0
+        if net_name.startswith(("HS", "/HS")):
+            return 2.0
+        return 1.0
+    
     def _group_components(self, footprints: List[pcbnew.FOOTPRINT]) -> Dict[str, List[pcbnew.FOOTPRINT]]:
         """Group components by type.
         
@@ -518,32 +617,6 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
         
         return groups
     
-    def _optimize_component_group(
-        self,
-        group_type: str,
-        components: List[pcbnew.FOOTPRINT]
-    ) -> None:
-        """Optimize placement of a component group.
-        
-        Args:
-            group_type: Type of components in the group
-            components: List of components to optimize
-        """
-        try:
-            # Get placement constraints for this group
-            constraints = self._get_placement_constraints(group_type)
-            
-            # Sort components by importance
-            sorted_components = self._sort_components_by_importance(components)
-            
-            # Place components
-            for component in sorted_components:
-                self._place_component(component, constraints)
-            
-        except Exception as e:
-            self.logger.error(f"Error optimizing component group: {str(e)}")
-            raise
-    
     def _get_placement_constraints(self, group_type: str) -> Dict[str, Any]:
         """Get placement constraints for a component group.
         
@@ -608,27 +681,27 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
     def _place_component(
         self,
         component: pcbnew.FOOTPRINT,
-        constraints: Dict[str, Any]
+        constraints: Dict[str, Any],
+        position: Optional[pcbnew.VECTOR2I] = None
     ) -> None:
         """Place a component according to constraints.
         
         Args:
             component: Component to place
             constraints: Placement constraints
+            position: Position to use; searched with
+                ``_calculate_optimal_position`` if not given
         """
         try:
-            # Get current position
-            current_pos = component.GetPosition()
+            # Set orientation first so the search sees the final footprint size
+            component.SetOrientationDegrees(constraints['preferred_orientation'])
             
             # Calculate new position
-            new_pos = self._calculate_optimal_position(component, constraints)
+            new_pos = position if position is not None else self._calculate_optimal_position(component, constraints)
             
             # Move component
             component.SetPosition(new_pos)
             
-            # Set orientation
-            component.SetOrientationDegrees(constraints['preferred_orientation'])
-            
             # Update component positions cache
             if self._component_positions is not None:
                 self._component_positions[component.GetReference()] = new_pos
@@ -637,7 +710,6 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
             self.logger.error(f"Error placing component: {str(e)}")
             raise
     
-    @lru_cache(maxsize=256)
     def _calculate_optimal_position(
         self,
         component: pcbnew.FOOTPRINT,
@@ -663,7 +735,8 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
             available_area = self._calculate_available_area(
                 board_box,
                 component_box,
-                constraints
+                constraints,
+                exclude_ref=component.GetReference()
             )
             
             # Find best position in available area
@@ -683,7 +756,8 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
         self,
         board_box: pcbnew.BOX2I,
         component_box: pcbnew.BOX2I,
-        constraints: Dict[str, Any]
+        constraints: Dict[str, Any],
+        exclude_ref: Optional[str] = None
     ) -> List[Tuple[pcbnew.VECTOR2I, pcbnew.VECTOR2I]]:
         """Calculate available area for component placement.
         
@@ -691,6 +765,8 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
             board_box: Board boundaries
             component_box: Component boundaries
             constraints: Placement constraints
+            exclude_ref: Reference of the component being placed, whose own
+                position is not an exclusion zone
             
         Returns:
             List of available areas (start, end)
@@ -698,30 +774,29 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
         try:
             # Get all placed components
             component_positions = self._get_component_positions()
+            spacing = int(constraints['min_spacing'] * 1e6)
             
             # Calculate exclusion zones
             exclusion_zones = []
             for ref, pos in component_positions.items():
+                if ref == exclude_ref:
+                    continue
                 # Add spacing around component
                 exclusion_zones.append((
-                    pos - pcbnew.VECTOR2I(
-                        int(constraints['min_spacing'] * 1e6),
-                        int(constraints['min_spacing'] * 1e6)
-                    ),
-                    pos + pcbnew.VECTOR2I(
-                        int(constraints['min_spacing'] * 1e6),
-                        int(constraints['min_spacing'] * 1e6)
-                    )
+                    pos - pcbnew.VECTOR2I(spacing, spacing),
+                    pos + pcbnew.VECTOR2I(spacing, spacing)
                 ))
             
-            # Calculate available areas
-            available_areas = []
-            current_area = (board_box.GetPosition(), board_box.GetEnd())
-            
+            # Subtract every exclusion zone from the remaining areas
+            available_areas = [(board_box.GetPosition(), board_box.GetEnd())]
             for zone in exclusion_zones:
-                # Split current area around exclusion zone
-                new_areas = self._split_area_around_zone(current_area, zone)
-                available_areas.extend(new_areas)
+                available_areas = [
+                    piece
+                    for area in available_areas
+                    for piece in self._split_area_around_zone(area, zone)
+                ]
+                if not available_areas:
+                    break
             
             return available_areas
             
@@ -736,6 +811,10 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
     ) -> List[Tuple[pcbnew.VECTOR2I, pcbnew.VECTOR2I]]:
         """Split area around exclusion zone.
         
+        The part of the area outside the zone is returned as up to four
+        non-overlapping rectangles: full-width bands above and below the
+        zone and the left and right pieces between them.
+        
         Args:
             area: Area to split
             zone: Exclusion zone
@@ -743,8 +822,28 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
         Returns:
             List of available areas
         """
-        # Simplified area splitting - in practice, you would need more sophisticated algorithms
-        return [area]
+        (ax0, ay0), (ax1, ay1) = (area[0].x, area[0].y), (area[1].x, area[1].y)
+        zx0, zy0 = max(zone[0].x, ax0), max(zone[0].y, ay0)
+        zx1, zy1 = min(zone[1].x, ax1), min(zone[1].y, ay1)
+        
+        # No overlap: the area is unchanged
+        if zx0 >= zx1 or zy0 >= zy1:
+            return [area]
+        
+        pieces = []
+        if zy0 > ay0:
+            pieces.append((ax0, ay0, ax1, zy0))
+        if zy1 < ay1:
+            pieces.append((ax0, zy1, ax1, ay1))
+        if zx0 > ax0:
+            pieces.append((ax0, zy0, zx0, zy1))
+        if zx1 < ax1:
+            pieces.append((zx1, zy0, ax1, zy1))
+        
+        return [
+            (pcbnew.VECTOR2I(x0, y0), pcbnew.VECTOR2I(x1, y1))
+            for x0, y0, x1, y1 in pieces
+        ]
     
     def _find_best_position(
         self,
@@ -754,6 +853,11 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
     ) -> pcbnew.VECTOR2I:
         """Find the best position for a component.
         
+        Every other footprint stays fixed. The component is scored at every
+        free site of the placement engine's occupancy bitmap by the
+        wirelength of its nets, and the cheapest site inside the available
+        areas wins.
+        
         Args:
             component: Component to position
             available_areas: List of available areas
@@ -763,76 +867,34 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
             Best position
         """
         try:
-            best_pos = None
-            best_score = float('-inf')
-            
-            for area in available_areas:
-                # Try positions in a grid
-                step = int(constraints['min_spacing'] * 1e6)
-                for x in range(area[0].x, area[1].x, step):
-                    for y in range(area[0].y, area[1].y, step):
-                        pos = pcbnew.VECTOR2I(x, y)
-                        score = self._evaluate_position(component, pos, constraints)
-                        
-                        if score > best_score:
-                            best_score = score
-                            best_pos = pos
-            
-            return best_pos or available_areas[0][0]
-            
-        except Exception as e:
-            self.logger.error(f"Error finding best position: {str(e)}")
-            raise
-    
-    @lru_cache(maxsize=1024)
-    def _evaluate_position(
-        self,
-        component: pcbnew.FOOTPRINT,
-        position: pcbnew.VECTOR2I,
-        constraints: Dict[str, Any]
-    ) -> float:
-        """Evaluate a position for a component.
-        
-        Args:
-            component: Component to evaluate
-            position: Position to evaluate
-            constraints: Placement constraints
-            
-        Returns:
-            Position score
-        """
-        try:
-            score = 0.0
-            
-            # Check distance to power plane
-            power_planes = self._get_power_planes()
-            for plane_pos in power_planes:
-                distance = position.Distance(plane_pos)
-                if distance < constraints['power_plane_clearance'] * 1e6:
-                    score -= 1.0
-            
-            # Check distance to other components
-            component_positions = self._get_component_positions()
-            for other_pos in component_positions.values():
-                distance = position.Distance(other_pos)
-                if distance < constraints['min_spacing'] * 1e6:
-                    score -= 1.0
-            
-            # Check distance to board edge
-            board_box = self._get_board_box()
-            edge_distance = min(
-                position.x - board_box.GetPosition().x,
-                board_box.GetEnd().x - position.x,
-                position.y - board_box.GetPosition().y,
-                board_box.GetEnd().y - position.y
+            reference = component.GetReference()
+            footprints = list(self.board.GetFootprints())
+            problem = self._build_placement_problem(
+                footprints,
+                {fp.GetReference(): constraints for fp in footprints}
             )
-            if edge_distance < constraints['min_spacing'] * 1e6:
-                score -= 1.0
-            
-            return score
+            if reference not in problem.references:
+                return component.GetPosition()
+            
+            index = problem.references.index(reference)
+            problem.fixed[:] = True
+            problem.fixed[index] = False
+            engine = PlacementEngine(problem)
+            engine.legalize(problem.x, problem.y)
+            
+            areas = [
+                (start.x / 1e6, start.y / 1e6, end.x / 1e6, end.y / 1e6)
+                for start, end in available_areas
+            ] if available_areas else None
+            best = engine.best_site(index, areas)
+            if best is None and areas is not None:
+                best = engine.best_site(index)
+            if best is None:
+                return component.GetPosition()
+            return pcbnew.VECTOR2I(int(round(best[0] * 1e6)), int(round(best[1] * 1e6)))
             
         except Exception as e:
-            self.logger.error(f"Error evaluating position: {str(e)}")
+            self.logger.error(f"Error finding best position: {str(e)}")
             raise
     
     def _optimize_routing(self) -> None:
@@ -1178,6 +1240,9 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
     def _identify_congestion_areas(self, tracks: List[pcbnew.TRACK]) -> List[Dict[str, Any]]:
         """Identify areas of routing congestion.
         
+        Tracks are rasterized into the congestion map, which is kept between
+        calls and only updated for tracks that were added, moved or removed.
+        
         Args:
             tracks: List of tracks to analyze
             
@@ -1185,32 +1250,12 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
             List of congestion areas
         """
         try:
-            congestion_areas = []
+            congestion_map = self._get_congestion_map(tracks)
             
-            # Analyze track density in different areas
-            board_box = self._get_board_box()
-            grid_size = 10.0  # 10mm grid
-            
-            for x in range(int(board_box.GetPosition().x), int(board_box.GetEnd().x), int(grid_size * 1e6)):
-                for y in range(int(board_box.GetPosition().y), int(board_box.GetEnd().y), int(grid_size * 1e6)):
-                    area_tracks = []
-                    
-                    for track in tracks:
-                        if not track.IsTrack():
-                            continue
-                        
-                        # Check if track passes through this area
-                        if self._track_in_area(track, x, y, grid_size):
-                            area_tracks.append(track)
-                    
-                    # Check if area is congested
-                    if len(area_tracks) > 5:  # More than 5 tracks in 10mm area
-                        congestion_areas.append({
-                            "x": x / 1e6,
-                            "y": y / 1e6,
-                            "track_count": len(area_tracks),
-                            "severity": "high" if len(area_tracks) > 10 else "medium"
-                        })
+            congestion_areas = []
+            for area in congestion_map.hotspots(self.congestion_track_threshold):
+                area["severity"] = "high" if area["track_count"] > 2 * self.congestion_track_threshold else "medium"
+                congestion_areas.append(area)
             
             return congestion_areas
             
@@ -1218,38 +1263,24 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
             self.logger.error(f"Error identifying congestion areas: {str(e)}")
             return []
     
-    def _track_in_area(self, track: pcbnew.TRACK, area_x: int, area_y: int, grid_size: float) -> bool:
-        """Check if a track passes through a specific area.
+    def _get_congestion_map(self, tracks: Optional[List[pcbnew.TRACK]] = None) -> CongestionMap:
+        """Get the congestion map, synchronized with the given tracks.
         
         Args:
-            track: Track to check
-            area_x: Area x coordinate
-            area_y: Area y coordinate
-            grid_size: Grid size in mm
+            tracks: Current tracks; the board's tracks if None
             
         Returns:
-            True if track passes through the area
+            Congestion map at ``congestion_grid_size`` resolution
         """
-        try:
-            start = track.GetStart()
-            end = track.GetEnd()
-            
-            # Check if track endpoints are in area
-            if (area_x <= start.x <= area_x + grid_size * 1e6 and
-                area_y <= start.y <= area_y + grid_size * 1e6):
-                return True
-            
-            if (area_x <= end.x <= area_x + grid_size * 1e6 and
-                area_y <= end.y <= area_y + grid_size * 1e6):
-                return True
-            
-            # Check if track passes through area (simplified)
-            # This is a basic check - in practice, you'd need more sophisticated intersection detection
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"Error checking track area: {str(e)}")
-            return False
+        if self.congestion_map is None or self.congestion_map.cell_size != self.congestion_grid_size:
+            board_box = self._get_board_box()
+            self.congestion_map = CongestionMap(
+                (board_box.GetPosition().x / 1e6, board_box.GetPosition().y / 1e6,
+                 board_box.GetEnd().x / 1e6, board_box.GetEnd().y / 1e6),
+                cell_size=self.congestion_grid_size
+            )
+        self.congestion_map.sync_tracks(self.board.GetTracks() if tracks is None else tracks)
+        return self.congestion_map
     
     def _calculate_optimal_track_length(self, track: pcbnew.TRACK) -> float:
         """Calculate optimal track length.
@@ -1725,23 +1756,24 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
         try:
             crosstalk_issues = []
             
-            for i, track1 in enumerate(tracks):
-                if not track1.IsTrack():
-                    continue
-                    
-                for track2 in tracks[i+1:]:
-                    if not track2.IsTrack():
-                        continue
-                    
-                    # Check if tracks are parallel and close
-                    if self._tracks_parallel_and_close(track1, track2):
-                        crosstalk_issues.append({
-                            "track1": track1,
-                            "track2": track2,
-                            "net1": track1.GetNetname(),
-                            "net2": track2.GetNetname(),
-                            "distance": self._calculate_min_distance_between_tracks(track1, track2)
-                        })
+            index = BoardSpatialIndex()
+            for track in tracks:
+                if track.IsTrack():
+                    index.add_track(track)
+            
+            # Only pairs within the 0.5mm closeness limit can qualify
+            for item1, item2, _ in index.close_pairs(0.5, kinds=(ITEM_TRACK,), same_layer=False):
+                track1, track2 = item1.obj, item2.obj
+                
+                # Check if tracks are parallel and close
+                if self._tracks_parallel_and_close(track1, track2):
+                    crosstalk_issues.append({
+                        "track1": track1,
+                        "track2": track2,
+                        "net1": track1.GetNetname(),
+                        "net2": track2.GetNetname(),
+                        "distance": self._calculate_min_distance_between_tracks(track1, track2)
+                    })
             
             return crosstalk_issues
             
@@ -2213,6 +2245,12 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
             # Group components by proximity and power dissipation
             high_power_components = thermal_analysis["high_power_components"]
             
+            index = BoardSpatialIndex(cell_size=20.0)
+            for comp in high_power_components:
+                pos = comp["position"]
+                index.add(ITEM_FOOTPRINT, ALL_LAYERS, pos.x / 1e6, pos.y / 1e6,
+                          pos.x / 1e6, pos.y / 1e6, obj=comp)
+            
             for i, comp1 in enumerate(high_power_components):
                 zone = {
                     "center": comp1["position"],
@@ -2222,8 +2260,12 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
                 }
                 
                 # Find nearby high-power components
-                for comp2 in high_power_components[i+1:]:
-                    distance = comp1["position"].Distance(comp2["position"]) / 1e6  # Convert to mm
+                pos1 = comp1["position"]
+                nearby = index.query_point(pos1.x / 1e6, pos1.y / 1e6, 20.0, kinds=(ITEM_FOOTPRINT,))
+                for item, distance in sorted(nearby, key=lambda pair: pair[0].index):
+                    if item.index <= i:
+                        continue
+                    comp2 = item.obj
                     
                     if distance < 20.0:  # Within 20mm
                         zone["components"].append(comp2["component"])
@@ -2299,13 +2341,12 @@ class LayoutOptimizer(BaseOptimizer[LayoutOptimizationItem]):
         self._track_cache.clear()
         self._pad_cache.clear()
         self._zone_cache.clear()
+        self.congestion_map = None
         
         # Clear memoization caches from functools.lru_cache
         self._get_board_box.cache_clear()
         self._get_power_planes.cache_clear()
         self._get_component_positions.cache_clear()
         self._extract_design_data.cache_clear()
-        self._calculate_optimal_position.cache_clear()
-        self._evaluate_position.cache_clear()
         
         self.logger.info("Layout optimizer caches cleared.")
@@ -0,0 +1,794 @@
+"""Netlist-driven placement engine.
+
+Components are placed to minimize net-weighted half-perimeter wirelength
+(HPWL). Placement runs in three phases:
+
+1. A force-directed seed pulls every movable component towards the centroid
+   of the nets it belongs to (star model), anchored lightly to its current
+   position.
+2. Legalization snaps components onto a placement grid in priority order,
+   taking the nearest free site in an occupancy bitmap, so no two components
+   (inflated by their spacing) overlap.
+3. Simulated annealing refines the legal placement with displacement and
+   swap moves. Only the nets touching the moved components are re-evaluated,
+   and the occupancy bitmap keeps every accepted move legal.
+
+Runtime is bounded by a move budget and a wall-clock limit. All lengths are
+in mm.
+"""
+
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Rect = Tuple[float, float, float, float]  # (min_x, min_y, max_x, max_y) in mm
+
+_NM_PER_MM = 1e6
+
+
+@dataclass
+class PlacementNet:
+    """A net as the set of components it connects."""
+    members: List[int]
+    weight: float = 1.0
+    name: str = ""
+
+
+@dataclass
+class PlacementProblem:
+    """Components, connectivity and placement region.
+
+    ``x``/``y`` are the current bounding-box centers and ``width``/``height``
+    the bounding-box sizes inflated by the component spacing. ``offset_x``/
+    ``offset_y`` give the footprint anchor relative to the bounding-box
+    center, so results can be returned as footprint positions.
+    """
+    references: List[str]
+    x: np.ndarray
+    y: np.ndarray
+    width: np.ndarray
+    height: np.ndarray
+    bounds: Rect
+    nets: List[PlacementNet] = field(default_factory=list)
+    fixed: Optional[np.ndarray] = None
+    offset_x: Optional[np.ndarray] = None
+    offset_y: Optional[np.ndarray] = None
+    keepouts: List[Rect] = field(default_factory=list)
+    objects: List[Any] = field(default_factory=list)
+
+    def __post_init__(self):
+        n = len(self.references)
+        self.x = np.asarray(self.x, dtype=float)
+        self.y = np.asarray(self.y, dtype=float)
+        self.width = np.asarray(self.width, dtype=float)
+        self.height = np.asarray(self.height, dtype=float)
+        self.fixed = (np.zeros(n, dtype=bool) if self.fixed is None
+                      else np.asarray(self.fixed, dtype=bool))
+        self.offset_x = (np.zeros(n) if self.offset_x is None
+                         else np.asarray(self.offset_x, dtype=float))
+        self.offset_y = (np.zeros(n) if self.offset_y is None
+                         else np.asarray(self.offset_y, dtype=float))
+
+    def __len__(self) -> int:
+        return len(self.references)
+
+    @classmethod
+    def from_board(cls,
+                   board: Any,
+                   footprints: Optional[Iterable[Any]] = None,
+                   spacing: Optional[Dict[str, float]] = None,
+                   default_spacing: float = 1.0,
+                   net_weight: Optional[Callable[[str, int], float]] = None,
+                   max_net_degree: int = 64,
+                   keepouts: Sequence[Rect] = ()) -> "PlacementProblem":
+        """Build a placement problem from a KiCad board.
+
+        Args:
+            board: KiCad board object
+            footprints: Footprints in placement priority order; defaults to
+                all footprints of the board
+            spacing: Minimum spacing per reference in mm
+            default_spacing: Spacing for references missing from ``spacing``
+            net_weight: Maps (net name, component count) to a weight; nets
+                weighted 0 are ignored
+            max_net_degree: Nets connecting more components than this (power
+                and ground) are ignored
+            keepouts: Rectangles no component may overlap
+
+        Returns:
+            Placement problem
+        """
+        footprints = list(board.GetFootprints() if footprints is None else footprints)
+        spacing = spacing or {}
+
+        references, objects, rows = [], [], []
+        fixed = []
+        members_by_net: Dict[str, List[int]] = {}
+        for footprint in footprints:
+            try:
+                reference = footprint.GetReference()
+                position = footprint.GetPosition()
+                bbox = footprint.GetBoundingBox()
+                center = bbox.GetCenter()
+                gap = spacing.get(reference, default_spacing)
+                rows.append((
+                    center.x / _NM_PER_MM,
+                    center.y / _NM_PER_MM,
+                    bbox.GetWidth() / _NM_PER_MM + gap,
+                    bbox.GetHeight() / _NM_PER_MM + gap,
+                    (position.x - center.x) / _NM_PER_MM,
+                    (position.y - center.y) / _NM_PER_MM
+                ))
+            except Exception as e:
+                logger.error(f"Error reading footprint for placement: {str(e)}")
+                continue
+
+            index = len(references)
+            references.append(reference)
+            objects.append(footprint)
+            try:
+                fixed.append(bool(footprint.IsLocked()))
+            except Exception:
+                fixed.append(False)
+            try:
+                for pad in footprint.Pads():
+                    net_name = pad.GetNetname()
+                    if not net_name:
+                        continue
+                    members = members_by_net.setdefault(net_name, [])
+                    if not members or members[-1] != index:
+                        members.append(index)
+            except Exception as e:
+                logger.error(f"Error reading pads of {reference}: {str(e)}")
+
+        nets = []
+        for name, members in members_by_net.items():
+            if len(members) < 2 or len(members) > max_net_degree:
+                continue
+            weight = net_weight(name, len(members)) if net_weight is not None else 1.0
+            if weight > 0:
+                nets.append(PlacementNet(members=members, weight=weight, name=name))
+
+        data = np.array(rows, dtype=float).reshape(-1, 6)
+        return cls(
+            references=references,
+            x=data[:, 0],
+            y=data[:, 1],
+            width=data[:, 2],
+            height=data[:, 3],
+            bounds=_board_bounds(board, data),
+            nets=nets,
+            fixed=np.array(fixed, dtype=bool),
+            offset_x=data[:, 4],
+            offset_y=data[:, 5],
+            keepouts=list(keepouts),
+            objects=objects
+        )
+
+
+@dataclass
+class PlacementResult:
+    """Outcome of a placement run."""
+    positions: Dict[str, Tuple[float, float]]  # footprint anchor positions in mm
+    initial_wirelength: float
+    seed_wirelength: float
+    final_wirelength: float
+    unplaced: List[str] = field(default_factory=list)
+    moves: int = 0
+    accepted: int = 0
+    temperature_steps: int = 0
+    seconds: float = 0.0
+
+    @property
+    def improvement(self) -> float:
+        """Relative wirelength reduction against the initial placement."""
+        if self.initial_wirelength <= 0:
+            return 0.0
+        return 1.0 - self.final_wirelength / self.initial_wirelength
+
+
+class PlacementEngine:
+    """Force-directed seeding, bitmap legalization and simulated annealing."""
+
+    def __init__(self,
+                 problem: PlacementProblem,
+                 grid_size: Optional[float] = None,
+                 max_grid_cells: int = 4_000_000,
+                 seed: int = 0):
+        """Initialize the engine.
+
+        Args:
+            problem: Placement problem
+            grid_size: Placement grid pitch in mm; defaults to half the
+                smallest component spacing box, at least 0.25 mm
+            max_grid_cells: Upper bound on the occupancy bitmap size; the
+                pitch is coarsened to stay below it
+            seed: Random seed for the annealer
+        """
+        self.problem = problem
+        self._rng = random.Random(seed)
+
+        min_x, min_y, max_x, max_y = problem.bounds
+        extent_x = max(max_x - min_x, 1e-3)
+        extent_y = max(max_y - min_y, 1e-3)
+        if grid_size is None:
+            sizes = np.concatenate((problem.width, problem.height))
+            grid_size = max(0.25, float(sizes.min()) / 2) if sizes.size else 1.0
+        grid_size = max(grid_size, math.sqrt(extent_x * extent_y / max_grid_cells))
+        self.grid_size = grid_size
+        self.cols = max(1, int(extent_x // grid_size))
+        self.rows = max(1, int(extent_y // grid_size))
+
+        n = len(problem)
+        self._w = np.maximum(1, np.ceil(problem.width / grid_size - 1e-9)).astype(int).tolist()
+        self._h = np.maximum(1, np.ceil(problem.height / grid_size - 1e-9)).astype(int).tolist()
+        self._col = [0] * n
+        self._row = [0] * n
+        self._cx = problem.x.tolist()
+        self._cy = problem.y.tolist()
+        self._placed = [False] * n
+        self._movable = [i for i in range(n) if not problem.fixed[i]]
+
+        self._net_members = [net.members for net in problem.nets]
+        self._net_weight = [float(net.weight) for net in problem.nets]
+        self._component_nets: List[List[int]] = [[] for _ in range(n)]
+        for net_index, members in enumerate(self._net_members):
+            for member in members:
+                self._component_nets[member].append(net_index)
+        self._net_cost: List[float] = []
+
+        # Occupancy counts every blockage; the owner map records which movable
+        # component covers a cell so moves onto it become swaps
+        self._occupancy = np.zeros((self.rows, self.cols), dtype=np.int16)
+        self._owner = np.full((self.rows, self.cols), -1, dtype=np.int32)
+        self._undo_moves: List[Tuple[int, Tuple[int, int]]] = []
+        self._undo_costs: List[Tuple[int, float]] = []
+        self._reserve_keepouts()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def wirelength(self, x: Optional[Sequence[float]] = None,
+                   y: Optional[Sequence[float]] = None) -> float:
+        """Net-weighted HPWL of a placement (the current one by default)."""
+        x = self._cx if x is None else x
+        y = self._cy if y is None else y
+        return sum(self._hpwl(net, x, y) for net in range(len(self._net_members)))
+
+    def run(self,
+            seed_iterations: int = 30,
+            time_limit: float = 10.0,
+            moves_per_component: int = 200,
+            max_moves: Optional[int] = None) -> PlacementResult:
+        """Place all movable components.
+
+        Args:
+            seed_iterations: Force-directed iterations
+            time_limit: Wall-clock limit for the whole run in seconds
+            moves_per_component: Annealing move budget per movable component
+            max_moves: Absolute annealing move budget; overrides
+                ``moves_per_component``
+
+        Returns:
+            Placement result
+        """
+        start = time.perf_counter()
+        deadline = start + time_limit
+        initial = self.wirelength()
+
+        seed_x, seed_y = self.force_directed_seed(seed_iterations)
+        seed_wirelength = self.wirelength(seed_x, seed_y)
+        unplaced = self.legalize(seed_x, seed_y)
+
+        budget = max_moves if max_moves is not None else moves_per_component * len(self._movable)
+        moves, accepted, steps = self.anneal(budget, deadline)
+
+        result = PlacementResult(
+            positions=self.positions(),
+            initial_wirelength=initial,
+            seed_wirelength=seed_wirelength,
+            final_wirelength=self.wirelength(),
+            unplaced=[self.problem.references[i] for i in unplaced],
+            moves=moves,
+            accepted=accepted,
+            temperature_steps=steps,
+            seconds=time.perf_counter() - start
+        )
+        logger.info(
+            f"Placed {len(self._movable)} components: HPWL {initial:.1f} -> "
+            f"{result.final_wirelength:.1f} mm in {result.seconds:.2f}s "
+            f"({moves} moves, {accepted} accepted)"
+        )
+        return result
+
+    def positions(self) -> Dict[str, Tuple[float, float]]:
+        """Footprint anchor positions of all components in mm."""
+        problem = self.problem
+        return {
+            reference: (self._cx[i] + problem.offset_x[i], self._cy[i] + problem.offset_y[i])
+            for i, reference in enumerate(problem.references)
+        }
+
+    def force_directed_seed(self, iterations: int = 30,
+                            anchor_weight: float = 0.1,
+                            target_density: float = 0.3) -> Tuple[List[float], List[float]]:
+        """Pull movable components towards the centroids of their nets.
+
+        Net forces alone collapse connected components onto a few points, so
+        the result is spread afterwards: every movable component keeps its
+        rank along each axis, and the ranks are mapped evenly onto a region
+        sized for ``target_density``.
+
+        Args:
+            iterations: Number of Jacobi iterations
+            anchor_weight: Weight of the spring to each component's current
+                position, relative to a net of weight 1
+            target_density: Fraction of the spread region covered by
+                components
+
+        Returns:
+            Seed center coordinates (x, y)
+        """
+        problem = self.problem
+        x = problem.x.copy()
+        y = problem.y.copy()
+        if not self._net_members or not self._movable:
+            return x.tolist(), y.tolist()
+
+        pin_component = np.fromiter((m for members in self._net_members for m in members),
+                                    dtype=np.intp)
+        degree = np.array([len(members) for members in self._net_members], dtype=np.intp)
+        starts = np.concatenate(([0], np.cumsum(degree)[:-1]))
+        pin_net = np.repeat(np.arange(len(degree)), degree)
+        weight = np.array(self._net_weight, dtype=float)
+
+        pull = np.zeros(len(problem))
+        np.add.at(pull, pin_component, weight[pin_net])
+        pull += anchor_weight
+        movable = ~problem.fixed
+        min_x, min_y, max_x, max_y = problem.bounds
+        half_w = problem.width / 2
+        half_h = problem.height / 2
+
+        for _ in range(iterations):
+            centroid_x = np.add.reduceat(x[pin_component], starts) / degree
+            centroid_y = np.add.reduceat(y[pin_component], starts) / degree
+            target_x = np.full(len(problem), 0.0)
+            target_y = np.full(len(problem), 0.0)
+            np.add.at(target_x, pin_component, (weight * centroid_x)[pin_net])
+            np.add.at(target_y, pin_component, (weight * centroid_y)[pin_net])
+            target_x = (target_x + anchor_weight * problem.x) / pull
+            target_y = (target_y + anchor_weight * problem.y) / pull
+            x = np.where(movable, np.clip(target_x, min_x + half_w,
+                                          np.maximum(min_x + half_w, max_x - half_w)), x)
+            y = np.where(movable, np.clip(target_y, min_y + half_h,
+                                          np.maximum(min_y + half_h, max_y - half_h)), y)
+
+        x[movable], y[movable] = self._spread(x[movable], y[movable], target_density)
+        return x.tolist(), y.tolist()
+
+    def _spread(self, x: np.ndarray, y: np.ndarray,
+                target_density: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Map coordinate ranks evenly onto a region around their centroid."""
+        count = len(x)
+        if count < 2:
+            return x, y
+        problem = self.problem
+        min_x, min_y, max_x, max_y = problem.bounds
+        board_w, board_h = max_x - min_x, max_y - min_y
+        movable = ~problem.fixed
+        area = float((problem.width[movable] * problem.height[movable]).sum()) / target_density
+        region_w = min(board_w, math.sqrt(area * board_w / max(board_h, 1e-9)))
+        region_h = min(board_h, area / max(region_w, 1e-9))
+        center_x = min(max(float(x.mean()), min_x + region_w / 2), max_x - region_w / 2)
+        center_y = min(max(float(y.mean()), min_y + region_h / 2), max_y - region_h / 2)
+
+        rank_x = (np.argsort(np.argsort(x, kind="stable"), kind="stable") + 0.5) / count
+        rank_y = (np.argsort(np.argsort(y, kind="stable"), kind="stable") + 0.5) / count
+        return center_x + (rank_x - 0.5) * region_w, center_y + (rank_y - 0.5) * region_h
+
+    def legalize(self, x: Sequence[float], y: Sequence[float]) -> List[int]:
+        """Snap components onto free grid sites nearest to the given centers.
+
+        Fixed components are reserved first at their current position; movable
+        components follow in problem order, which is their priority.
+
+        Args:
+            x: Target center x per component
+            y: Target center y per component
+
+        Returns:
+            Indices of components that found no free site; they keep their
+            current position
+        """
+        problem = self.problem
+        self._occupancy[:] = 0
+        self._owner[:] = -1
+        self._placed = [False] * len(problem)
+        self._reserve_keepouts()
+
+        for i in range(len(problem)):
+            if problem.fixed[i]:
+                self._cx[i], self._cy[i] = float(problem.x[i]), float(problem.y[i])
+                self._mark_rect(*self._component_rect(i), 1)
+
+        unplaced = []
+        for i in self._movable:
+            site = self.nearest_free_site(i, x[i], y[i])
+            if site is None:
+                unplaced.append(i)
+                self._cx[i], self._cy[i] = float(problem.x[i]), float(problem.y[i])
+                continue
+            self._occupy(i, *site)
+
+        self._net_cost = [self._hpwl(net) for net in range(len(self._net_members))]
+        return unplaced
+
+    def nearest_free_site(self, index: int, x: float, y: float) -> Optional[Tuple[int, int]]:
+        """Find the free grid site nearest to a center position.
+
+        Args:
+            index: Component index
+            x: Desired center x in mm
+            y: Desired center y in mm
+
+        Returns:
+            (row, col) of the site origin, or None if the component fits nowhere
+        """
+        h, w = self._h[index], self._w[index]
+        if h > self.rows or w > self.cols:
+            return None
+        row, col = self._site_for_center(index, x, y)
+        radius = max(4, h, w)
+        while True:
+            r0, r1 = max(0, row - radius), min(self.rows - h, row + radius)
+            c0, c1 = max(0, col - radius), min(self.cols - w, col + radius)
+            free = self._free_origins(h, w, r0, r1 + 1, c0, c1 + 1)
+            rows, cols = np.nonzero(free)
+            if rows.size:
+                distance = (rows + r0 - row) ** 2 + (cols + c0 - col) ** 2
+                best = int(np.argmin(distance))
+                return int(rows[best]) + r0, int(cols[best]) + c0
+            if r0 == 0 and c0 == 0 and r1 == self.rows - h and c1 == self.cols - w:
+                return None
+            radius *= 2
+
+    def best_site(self, index: int,
+                  areas: Optional[Sequence[Rect]] = None) -> Optional[Tuple[float, float]]:
+        """Find the free site minimizing the wirelength of one component.
+
+        All other components stay where they are. Every free site is scored
+        at once against the bounding boxes of the component's nets.
+
+        Args:
+            index: Component index
+            areas: Rectangles the component center must lie in; the whole
+                board if None
+
+        Returns:
+            Footprint anchor position in mm, or None if no site is free
+        """
+        problem = self.problem
+        h, w = self._h[index], self._w[index]
+        if h > self.rows or w > self.cols:
+            return None
+        if self._placed[index]:
+            self._mark_rect(*self._cells(index), -1)
+        try:
+            free = self._free_origins(h, w, 0, self.rows - h + 1, 0, self.cols - w + 1)
+        finally:
+            if self._placed[index]:
+                self._mark_rect(*self._cells(index), 1)
+
+        min_x, min_y = problem.bounds[0], problem.bounds[1]
+        centers_x = min_x + (np.arange(free.shape[1]) + w / 2) * self.grid_size
+        centers_y = min_y + (np.arange(free.shape[0]) + h / 2) * self.grid_size
+        if areas is not None:
+            inside = np.zeros_like(free)
+            for ax0, ay0, ax1, ay1 in areas:
+                in_x = (centers_x >= ax0) & (centers_x <= ax1)
+                in_y = (centers_y >= ay0) & (centers_y <= ay1)
+                inside |= in_y[:, None] & in_x[None, :]
+            free &= inside
+        if not free.any():
+            return None
+
+        cost_x = np.zeros(centers_x.shape)
+        cost_y = np.zeros(centers_y.shape)
+        for net in self._component_nets[index]:
+            others = [m for m in self._net_members[net] if m != index]
+            if not others:
+                continue
+            xs = [self._cx[m] for m in others]
+            ys = [self._cy[m] for m in others]
+            weight = self._net_weight[net]
+            cost_x += weight * (np.maximum(max(xs), centers_x) - np.minimum(min(xs), centers_x))
+            cost_y += weight * (np.maximum(max(ys), centers_y) - np.minimum(min(ys), centers_y))
+        cost = cost_y[:, None] + cost_x[None, :]
+        # Prefer the site closest to the current position among equal costs
+        cost += 1e-6 * (np.abs(centers_y - self._cy[index])[:, None]
+                        + np.abs(centers_x - self._cx[index])[None, :])
+        cost[~free] = np.inf
+        row, col = np.unravel_index(int(np.argmin(cost)), cost.shape)
+        return (float(centers_x[col] + problem.offset_x[index]),
+                float(centers_y[row] + problem.offset_y[index]))
+
+    def anneal(self, max_moves: int, deadline: Optional[float] = None,
+               min_window: int = 1) -> Tuple[int, int, int]:
+        """Refine a legal placement by simulated annealing.
+
+        Uses an adaptive schedule: the cooling rate and the move window both
+        follow the acceptance rate of the previous temperature step.
+
+        Args:
+            max_moves: Move budget
+            deadline: ``time.perf_counter()`` value at which to stop
+            min_window: Smallest displacement window in grid cells
+
+        Returns:
+            (moves tried, moves accepted, temperature steps)
+        """
+        movable = [i for i in self._movable if self._placed[i]]
+        if len(movable) < 1 or not self._net_members or max_moves <= 0:
+            return 0, 0, 0
+        if not self._net_cost:
+            self._net_cost = [self._hpwl(net) for net in range(len(self._net_members))]
+
+        rng = self._rng
+        moves_per_step = max(len(movable), 50)
+        # The placement is already legal and close to its seed, so start with
+        # a window of a few component pitches rather than the whole board
+        pitch = math.sqrt(self.rows * self.cols / len(movable))
+        window = int(min(max(self.rows, self.cols), max(min_window, 4 * pitch)))
+        temperature = self._initial_temperature(movable, window, min(moves_per_step, 200))
+        stop_temperature = 0.005 * sum(self._net_cost) / max(1, len(self._net_cost))
+
+        moves = accepted = steps = 0
+        while moves < max_moves and temperature > stop_temperature:
+            step_accepted = step_legal = 0
+            step_moves = min(moves_per_step, max_moves - moves)
+            for _ in range(step_moves):
+                delta = self._try_move(rng.choice(movable), window)
+                if delta is None:
+                    continue
+                step_legal += 1
+                if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+                    step_accepted += 1
+                else:
+                    self._undo()
+            moves += step_moves
+            accepted += step_accepted
+            steps += 1
+
+            rate = step_accepted / step_legal if step_legal else 0.0
+            if rate > 0.96:
+                temperature *= 0.5
+            elif rate > 0.8:
+                temperature *= 0.9
+            elif rate > 0.15:
+                temperature *= 0.95
+            else:
+                temperature *= 0.8
+            window = int(min(max(self.rows, self.cols),
+                             max(min_window, window * (1 - 0.44 + rate))))
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        # Finish with a greedy pass at the smallest window
+        greedy_moves = min(moves_per_step, max(0, max_moves - moves))
+        for _ in range(greedy_moves):
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            delta = self._try_move(rng.choice(movable), min_window)
+            moves += 1
+            if delta is None:
+                continue
+            if delta < 0:
+                accepted += 1
+            else:
+                self._undo()
+        return moves, accepted, steps
+
+    # ------------------------------------------------------------------
+    # Moves
+    # ------------------------------------------------------------------
+
+    def _try_move(self, i: int, window: int) -> Optional[float]:
+        """Apply a random legal move and return its cost delta (None if illegal).
+
+        A target site is drawn within ``window`` cells; if another movable
+        component owns it the two are swapped, otherwise ``i`` is displaced.
+        """
+        rng = self._rng
+        row, col = self._clamp_site(i, self._row[i] + rng.randint(-window, window),
+                                    self._col[i] + rng.randint(-window, window))
+        if row == self._row[i] and col == self._col[i]:
+            return None
+        j = int(self._owner[row + self._h[i] // 2, col + self._w[i] // 2])
+        if j == i:
+            return None
+        if j >= 0:
+            return self._try_swap(i, j)
+        return self._try_displace(i, row, col)
+
+    def _try_displace(self, i: int, row: int, col: int) -> Optional[float]:
+        old = (self._row[i], self._col[i])
+        self._release(i)
+        if not self._is_free(i, row, col):
+            self._occupy(i, *old)
+            return None
+        self._occupy(i, row, col)
+        self._undo_moves = [(i, old)]
+        return self._update_costs(self._component_nets[i])
+
+    def _try_swap(self, i: int, j: int) -> Optional[float]:
+        old_i = (self._row[i], self._col[i])
+        old_j = (self._row[j], self._col[j])
+        # Swap the centers, not the origins, so unequal sizes stay aligned
+        new_i = self._clamp_site(i, old_j[0] + (self._h[j] - self._h[i]) // 2,
+                                 old_j[1] + (self._w[j] - self._w[i]) // 2)
+        new_j = self._clamp_site(j, old_i[0] + (self._h[i] - self._h[j]) // 2,
+                                 old_i[1] + (self._w[i] - self._w[j]) // 2)
+        self._release(i)
+        self._release(j)
+        if self._is_free(i, *new_i):
+            self._occupy(i, *new_i)
+            if self._is_free(j, *new_j):
+                self._occupy(j, *new_j)
+                self._undo_moves = [(i, old_i), (j, old_j)]
+                nets = self._component_nets[i] + [n for n in self._component_nets[j]
+                                                  if n not in self._component_nets[i]]
+                return self._update_costs(nets)
+            self._release(i)
+        self._occupy(i, *old_i)
+        self._occupy(j, *old_j)
+        return None
+
+    def _update_costs(self, nets: List[int]) -> float:
+        """Re-evaluate only the nets touched by a move."""
+        delta = 0.0
+        self._undo_costs = []
+        for net in nets:
+            cost = self._hpwl(net)
+            self._undo_costs.append((net, self._net_cost[net]))
+            delta += cost - self._net_cost[net]
+            self._net_cost[net] = cost
+        return delta
+
+    def _undo(self) -> None:
+        """Revert the last applied move."""
+        for i, _ in self._undo_moves:
+            self._release(i)
+        for i, (row, col) in self._undo_moves:
+            self._occupy(i, row, col)
+        for net, cost in self._undo_costs:
+            self._net_cost[net] = cost
+
+    def _initial_temperature(self, movable: List[int], window: int, samples: int,
+                             uphill_acceptance: float = 0.2) -> float:
+        """Pick a starting temperature from sampled move deltas.
+
+        The temperature accepts an average uphill move with probability
+        ``uphill_acceptance``, which refines a constructive placement without
+        scrambling it.
+        """
+        uphill = []
+        for _ in range(samples):
+            delta = self._try_move(self._rng.choice(movable), window)
+            if delta is not None:
+                if delta > 0:
+                    uphill.append(delta)
+                self._undo()
+        if not uphill:
+            return 1e-6
+        return -float(np.mean(uphill)) / math.log(uphill_acceptance)
+
+    # ------------------------------------------------------------------
+    # Geometry and bitmap helpers
+    # ------------------------------------------------------------------
+
+    def _hpwl(self, net: int, x: Optional[Sequence[float]] = None,
+              y: Optional[Sequence[float]] = None) -> float:
+        x = self._cx if x is None else x
+        y = self._cy if y is None else y
+        members = self._net_members[net]
+        xs = [x[m] for m in members]
+        ys = [y[m] for m in members]
+        return self._net_weight[net] * (max(xs) - min(xs) + max(ys) - min(ys))
+
+    def _site_for_center(self, index: int, x: float, y: float) -> Tuple[int, int]:
+        min_x, min_y = self.problem.bounds[0], self.problem.bounds[1]
+        col = int(round((x - min_x) / self.grid_size - self._w[index] / 2))
+        row = int(round((y - min_y) / self.grid_size - self._h[index] / 2))
+        return self._clamp_site(index, row, col)
+
+    def _clamp_site(self, index: int, row: int, col: int) -> Tuple[int, int]:
+        return (min(max(row, 0), self.rows - self._h[index]),
+                min(max(col, 0), self.cols - self._w[index]))
+
+    def _cells(self, index: int) -> Tuple[int, int, int, int]:
+        return (self._row[index], self._row[index] + self._h[index],
+                self._col[index], self._col[index] + self._w[index])
+
+    def _is_free(self, index: int, row: int, col: int) -> bool:
+        return not self._occupancy[row:row + self._h[index], col:col + self._w[index]].any()
+
+    def _occupy(self, index: int, row: int, col: int) -> None:
+
+        min_x, min_y = self.problem.bounds[0], self.problem.bounds[1]
+        self._row[index], self._col[index] = row, col
+        self._cx[index] = min_x + (col + self._w[index] / 2) * self.grid_size
+        self._cy[index] = min_y + (row + self._h[index] / 2) * self.grid_size
+        self._occupancy[row:row + self._h[index], col:col + self._w[index]] += 1
+        self._owner[row:row + self._h[index], col:col + self._w[index]] = index
+        self._placed[index] = True
+
+    def _release(self, index: int) -> None:
+        row, col = self._row[index], self._col[index]
+        self._occupancy[row:row + self._h[index], col:col + self._w[index]] -= 1
+        self._owner[row:row + self._h[index], col:col + self._w[index]] = -1
+        self._placed[index] = False
+
+    def _component_rect(self, index: int) -> Tuple[int, int, int, int]:
+        """Cells covered by a component at its problem position (fixed components)."""
+        problem = self.problem
+        return self._rect_cells((problem.x[index] - problem.width[index] / 2,
+                                 problem.y[index] - problem.height[index] / 2,
+                                 problem.x[index] + problem.width[index] / 2,
+                                 problem.y[index] + problem.height[index] / 2))
+
+    def _rect_cells(self, rect: Rect) -> Tuple[int, int, int, int]:
+        min_x, min_y = self.problem.bounds[0], self.problem.bounds[1]
+        c0 = int(math.floor((rect[0] - min_x) / self.grid_size))
+        r0 = int(math.floor((rect[1] - min_y) / self.grid_size))
+        c1 = int(math.ceil((rect[2] - min_x) / self.grid_size))
+        r1 = int(math.ceil((rect[3] - min_y) / self.grid_size))
+        return (min(max(r0, 0), self.rows), min(max(r1, 0), self.rows),
+                min(max(c0, 0), self.cols), min(max(c1, 0), self.cols))
+
+    def _mark_rect(self, r0: int, r1: int, c0: int, c1: int, amount: int) -> None:
+        if r1 > r0 and c1 > c0:
+            self._occupancy[r0:r1, c0:c1] += amount
+
+    def _reserve_keepouts(self) -> None:
+        for rect in self.problem.keepouts:
+            self._mark_rect(*self._rect_cells(rect), 1)
+
+    def _free_origins(self, h: int, w: int, r0: int, r1: int, c0: int, c1: int) -> np.ndarray:
+        """Which origins in rows [r0, r1) and cols [c0, c1) have an h x w free block.
+
+        Uses a summed-area table of the occupancy window, so every origin is
+        tested in constant time.
+        """
+        if r1 <= r0 or c1 <= c0:
+            return np.zeros((0, 0), dtype=bool)
+        window = self._occupancy[r0:r1 + h - 1, c0:c1 + w - 1] > 0
+        table = np.zeros((window.shape[0] + 1, window.shape[1] + 1), dtype=np.int32)
+        np.cumsum(np.cumsum(window, axis=0), axis=1, out=table[1:, 1:])
+        blocked = table[h:, w:] - table[:-h, w:] - table[h:, :-w] + table[:-h, :-w]
+        return blocked == 0
+
+
+def _board_bounds(board: Any, data: np.ndarray) -> Rect:
+    """Board outline bounds, or the footprint extents if there is no outline."""
+    try:
+        box = board.GetBoardEdgesBoundingBox()
+        width, height = box.GetWidth(), box.GetHeight()
+        if width > 0 and height > 0:
+            left, top = box.GetX(), box.GetY()
+            return (left / _NM_PER_MM, top / _NM_PER_MM,
+                    (left + width) / _NM_PER_MM, (top + height) / _NM_PER_MM)
+    except Exception as e:
+        logger.warning(f"Error reading board outline for placement: {str(e)}")
+    if not len(data):
+        return (0.0, 0.0, 100.0, 100.0)
+    return (float((data[:, 0] - data[:, 2] / 2).min()), float((data[:, 1] - data[:, 3] / 2).min()),
+            float((data[:, 0] + data[:, 2] / 2).max()), float((data[:, 1] + data[:, 3] / 2).max()))
@@ -20,7 +20,8 @@ def _dummy_netlist() -> Netlist:
 
 @pytest.mark.performance
 def test_generate_pcb_performance(tmp_path: Path):
-    pm = ProjectManager()
+    # Keep the generated project out of the working tree
+    pm = ProjectManager(base_path=str(tmp_path))
     project_name = "perf_project"
     pm.create_project(name=project_name, template="basic_audio_amp", description="Perf test", author="tester")
 
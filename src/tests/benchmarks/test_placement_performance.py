@@ -0,0 +1,46 @@
+"""
+Performance benchmarks for the placement engine.
+"""
+
+import random
+import time
+
+import pytest
+
+from kicad_pcb_generator.layout.placement_engine import (
+    PlacementEngine,
+    PlacementNet,
+    PlacementProblem,
+)
+
+
+def make_problem(count: int = 1000, seed: int = 7) -> PlacementProblem:
+    """Random footprints on a 200 x 200 mm board with local multi-pin nets."""
+    rng = random.Random(seed)
+    nets = []
+    for i in range(count):
+        members = sorted({i} | {rng.randrange(max(0, i - 20), min(count, i + 20)) for _ in range(2)})
+        if len(members) > 1:
+            nets.append(PlacementNet(members=members))
+    return PlacementProblem(
+        references=[f"U{i + 1}" for i in range(count)],
+        x=[rng.uniform(5, 195) for _ in range(count)],
+        y=[rng.uniform(5, 195) for _ in range(count)],
+        width=[rng.choice((1.6, 2.0, 3.0, 5.0)) for _ in range(count)],
+        height=[rng.choice((0.8, 1.25, 2.0, 5.0)) for _ in range(count)],
+        bounds=(0.0, 0.0, 200.0, 200.0),
+        nets=nets
+    )
+
+
+@pytest.mark.performance
+def test_place_1000_footprints():
+    problem = make_problem()
+
+    start = time.perf_counter()
+    result = PlacementEngine(problem).run(time_limit=20.0)
+    duration = time.perf_counter() - start
+
+    assert result.unplaced == []
+    assert result.final_wirelength < result.initial_wirelength
+    assert duration < 30, f"Placement too slow: {duration:.2f}s"
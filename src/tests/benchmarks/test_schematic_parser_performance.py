@@ -0,0 +1,100 @@
+"""
+Performance benchmarks for the streaming schematic parser.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from kicad_pcb_generator.core.netlist.parser import parse_schematic
+from kicad_pcb_generator.core.netlist.schematic import SchematicParser
+
+LIB_SYMBOLS = """  (lib_symbols
+    (symbol "Device:R" (pin_numbers hide) (in_bom yes) (on_board yes)
+      (symbol "R_1_1"
+        (pin passive line (at 0 3.81 270) (length 1.27)
+          (name "~" (effects (font (size 1.27 1.27))))
+          (number "1" (effects (font (size 1.27 1.27))))
+        )
+        (pin passive line (at 0 -3.81 90) (length 1.27)
+          (name "~" (effects (font (size 1.27 1.27))))
+          (number "2" (effects (font (size 1.27 1.27))))
+        )
+      )
+    )
+  )
+"""
+
+SYMBOL = """  (symbol (lib_id "Device:R") (at {x} {y} 0) (unit 1)
+    (in_bom yes) (on_board yes)
+    (uuid "{ref}")
+    (property "Reference" "{ref}" (at {x} {y} 0)
+      (effects (font (size 1.27 1.27)))
+    )
+    (property "Value" "10k" (at {x} {y} 0)
+      (effects (font (size 1.27 1.27)))
+    )
+    (property "Footprint" "Resistor_SMD:R_0603" (at {x} {y} 0)
+      (effects (font (size 1.27 1.27)) hide)
+    )
+    (pin "1" (uuid "{ref}-1"))
+    (pin "2" (uuid "{ref}-2"))
+  )
+  (wire (pts (xy {x} {y2}) (xy {x} {y3}))
+    (stroke (width 0) (type default))
+  )
+  (label "N{net}" (at {x} {y3} 0)
+    (effects (font (size 1.27 1.27)))
+  )
+"""
+
+
+def write_schematic(path: Path, lines: int = 50000) -> int:
+    """Write a flat schematic of chained resistors with at least ``lines`` lines."""
+    parts = ['(kicad_sch (version 20230121) (generator eeschema)\n  (uuid "root")\n', LIB_SYMBOLS]
+    count = 0
+    total = LIB_SYMBOLS.count("\n") + 2
+    per_symbol = SYMBOL.count("\n")
+    while total < lines:
+        x, y = 25.4 * (count % 100), 25.4 * (count // 100)
+        parts.append(SYMBOL.format(ref=f"R{count + 1}", x=x, y=y, y2=round(y + 3.81, 4),
+                                   y3=round(y + 10.16, 4), net=count // 2))
+        count += 1
+        total += per_symbol
+    parts.append(")\n")
+    path.write_text("".join(parts))
+    return count
+
+
+@pytest.mark.performance
+def test_parse_50k_line_schematic(tmp_path: Path):
+    path = tmp_path / "large.kicad_sch"
+    symbols = write_schematic(path)
+
+    start = time.perf_counter()
+    netlist = parse_schematic(path)
+    duration = time.perf_counter() - start
+
+    assert len(netlist.footprints) == symbols
+    # Pairs of resistors share a label, so every labelled net has two pads
+    assert len(netlist.get_net("N0").connected_pads) == 2
+    assert duration < 10, f"Schematic parsing too slow: {duration:.2f}s"
+
+
+@pytest.mark.performance
+def test_incremental_reparse_is_faster(tmp_path: Path):
+    path = tmp_path / "large.kicad_sch"
+    write_schematic(path)
+
+    parser = SchematicParser()
+    start = time.perf_counter()
+    parser.parse(path)
+    full = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parser.parse(path)
+    cached = time.perf_counter() - start
+
+    assert parser.last_stats["reused"] == 1
+    assert cached < full / 2, f"Unchanged re-parse not faster: {cached:.2f}s vs {full:.2f}s"
@@ -228,3 +228,33 @@ def test_component_manager_validation(temp_dir):
         layer="F.Cu"
     )
     assert manager.add_component(component) 
+
+def test_component_manager_bulk_load(temp_dir):
+    """Test that stored components load in one batch with lazy cache invalidation."""
+    components = [
+        ComponentData(id=f"R{i}", type="resistor", value="10k", footprint="R_0805_2012Metric")
+        for i in range(2000)
+    ]
+    with open(temp_dir / "components.json", "w") as f:
+        json.dump([c.to_dict() for c in components], f)
+    
+    # Loading bumps the generation once, not once per component
+    manager = ComponentManager(str(temp_dir))
+    assert manager.count() == 2000
+    assert manager.generation == 1
+    
+    manager.set_cache("resistor_count", 2000)
+    result = manager.bulk_delete(["R0", "R1", "missing"])
+    assert result.success
+    assert result.affected_items == 2
+    assert result.errors == ["Key not found: missing"]
+    assert manager.generation == 2
+    assert manager.get_cache("resistor_count") is None
+    
+    # Duplicates within a batch and against stored items are rejected
+    result = manager.bulk_create([("R0", components[0]), ("R0", components[0]), ("R5", components[5])])
+    assert result.item_ids == ["R0"]
+    assert result.errors == ["Duplicate key: R0", "Duplicate key: R5"]
+    
+    with open(temp_dir / "components.json", "r") as f:
+        assert len(json.load(f)) == 1999
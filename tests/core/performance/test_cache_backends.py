@@ -0,0 +1,127 @@
+"""Tests for the tiered cache backends."""
+
+import shutil
+import tempfile
+import threading
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+
+from kicad_pcb_generator.core.base.analysis_cache import fingerprint
+from kicad_pcb_generator.core.performance.cache_backends import (
+    MemoryLRUCache,
+    SQLiteCache,
+    TieredCache,
+)
+
+
+@dataclass
+class _Params:
+    width: float
+    layers: tuple
+
+
+class TestCacheBackends(unittest.TestCase):
+    """Test cases for the memory, sqlite and tiered caches."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.db_path = Path(self.test_dir) / "cache.sqlite3"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.test_dir)
+
+    def test_memory_lru_is_bounded_by_bytes(self):
+        """Test that the least recently used entries are evicted first."""
+        cache = MemoryLRUCache(max_bytes=300)
+        cache.set("a", "1", "x", size=100)
+        cache.set("a", "2", "y", size=100)
+        cache.set("b", "3", "z", size=100)
+        self.assertEqual(cache.get("a", "1"), "x")
+        cache.set("b", "4", "w", size=100)
+
+        self.assertIsNone(cache.get("a", "2"))
+        self.assertEqual(cache.get("a", "1"), "x")
+        stats = cache.stats()
+        self.assertLessEqual(stats['bytes'], 300)
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['namespaces']['b']['entries'], 2)
+
+    def test_sqlite_write_behind(self):
+        """Test that queued writes are visible at once and persist."""
+        disk = SQLiteCache(self.db_path, flush_interval=60.0)
+        for i in range(100):
+            disk.set("drc", str(i), {"value": i})
+        # Not flushed yet, still served from the write queue
+        self.assertEqual(disk.get("drc", "42"), {"value": 42})
+        disk.delete("drc", "0")
+        disk.close()
+
+        reopened = SQLiteCache(self.db_path)
+        self.assertEqual(reopened.get("drc", "99"), {"value": 99})
+        self.assertIsNone(reopened.get("drc", "0"))
+        self.assertEqual(reopened.stats()['entries'], 99)
+        reopened.clear("drc")
+        self.assertEqual(reopened.stats()['entries'], 0)
+        reopened.close()
+
+    def test_sqlite_concurrent_readers_and_writer(self):
+        """Test that reads never miss an entry while it is being flushed."""
+        disk = SQLiteCache(self.db_path, flush_interval=0.001)
+        misses = []
+
+        def work(offset):
+            for i in range(200):
+                key = str(offset + i)
+                disk.set("ns", key, i)
+                if disk.get("ns", key) != i:
+                    misses.append(key)
+
+        threads = [threading.Thread(target=work, args=(n * 1000,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(misses, [])
+        self.assertEqual(disk.stats()['entries'], 800)
+        disk.close()
+
+    def test_tiered_promotion_and_namespace_stats(self):
+        """Test disk hits are promoted to memory and counted per namespace."""
+        first = TieredCache(MemoryLRUCache(), SQLiteCache(self.db_path))
+        first.set("routing", "k", [1, 2, 3])
+        first.close()
+
+        cache = TieredCache(MemoryLRUCache(), SQLiteCache(self.db_path))
+        self.assertEqual(cache.get("routing", "k"), [1, 2, 3])
+        self.assertEqual(cache.get("routing", "k"), [1, 2, 3])
+        self.assertIsNone(cache.get("routing", "missing"))
+        # Lambdas cannot be pickled; they stay in memory only
+        func = lambda: None
+        cache.set("funcs", "f", func)
+        self.assertIs(cache.get("funcs", "f"), func)
+
+        stats = cache.stats()['namespaces']
+        self.assertEqual(stats['routing']['disk_hits'], 1)
+        self.assertEqual(stats['routing']['memory_hits'], 1)
+        self.assertEqual(stats['routing']['misses'], 1)
+        self.assertAlmostEqual(stats['routing']['hit_rate'], 2 / 3)
+        self.assertEqual(stats['routing']['memory_entries'], 1)
+        self.assertEqual(stats['funcs']['memory_only'], 1)
+        self.assertEqual(stats['funcs']['disk_entries'], 0)
+        cache.close()
+
+    def test_strict_fingerprint(self):
+        """Test that dataclasses hash by value and unknown objects are rejected."""
+        self.assertEqual(fingerprint(_Params(0.2, (1, 2)), strict=True),
+                         fingerprint(_Params(0.2, (1, 2)), strict=True))
+        self.assertNotEqual(fingerprint(_Params(0.2, (1, 2)), strict=True),
+                            fingerprint(_Params(0.3, (1, 2)), strict=True))
+        with self.assertRaises(TypeError):
+            fingerprint(object(), strict=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
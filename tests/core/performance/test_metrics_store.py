@@ -0,0 +1,74 @@
+"""Tests for the columnar MetricsStore."""
+
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from kicad_pcb_generator.core.performance.metrics_store import MetricsStore, from_microseconds
+
+
+class TestMetricsStore(unittest.TestCase):
+    """Test cases for the MetricsStore class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.start = datetime(2024, 5, 1, 9, 0, 0)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.test_dir)
+
+    def _fill(self, store, count, components=("system", "router")):
+        """Append one measurement per second, alternating components."""
+        for i in range(count):
+            store.append(components[i % len(components)], "op", self.start + timedelta(seconds=i),
+                         i * 0.001, 1024.0 * i, 10.0, {"i": i})
+
+    def test_range_queries(self):
+        """Test component and time-range selection in time order."""
+        store = MetricsStore(self.test_dir, compact_threshold=64)
+        # Out-of-order arrivals land in the right place
+        self._fill(store, 1000)
+        store.append("router", "late", self.start - timedelta(seconds=5), 0.5, 0.0, 1.0)
+
+        columns = store.select("router", self.start + timedelta(seconds=100), self.start + timedelta(seconds=199))
+        self.assertEqual(len(columns["timestamp"]), 50)
+        self.assertTrue(np.all(np.diff(columns["timestamp"]) > 0))
+        self.assertTrue(all(c == "router" for c in columns["component_id"]))
+        self.assertEqual(from_microseconds(columns["timestamp"][0]), self.start + timedelta(seconds=101))
+        self.assertEqual(columns["metadata"][0], {"i": 101})
+
+        everything = store.select()
+        self.assertEqual(len(everything["timestamp"]), 1001)
+        self.assertEqual(everything["operation"][0], "late")
+        self.assertEqual(len(store.select("unknown")["timestamp"]), 0)
+
+    def test_bounded_memory_reads_evicted_segments(self):
+        """Test that evicted measurements are still served from disk."""
+        store = MetricsStore(self.test_dir, capacity=500, compact_threshold=100)
+        self._fill(store, 4000)
+        store.compact()
+        self.assertLessEqual(len(store), 500)
+
+        # Spans two hourly segments, mostly evicted from memory
+        columns = store.select("system", self.start + timedelta(seconds=3000), self.start + timedelta(seconds=3999))
+        self.assertEqual(len(columns["timestamp"]), 500)
+        self.assertTrue(np.all(np.diff(columns["timestamp"]) == 2_000_000))
+        np.testing.assert_allclose(columns["memory_usage"][:2], [3072000.0, 3074048.0])
+        self.assertEqual(len(store.select("router")["timestamp"]), 2000)
+
+        # A new session reads earlier segments
+        store.flush()
+        reopened = MetricsStore(self.test_dir)
+        self.assertEqual(len(reopened.select()["timestamp"]), 4000)
+        store.clear("router")
+        self.assertEqual(len(store.select("router")["timestamp"]), 0)
+        self.assertEqual(len(store.select("system")["timestamp"]), 2000)
+
+
+if __name__ == '__main__':
+    unittest.main()
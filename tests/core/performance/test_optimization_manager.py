@@ -0,0 +1,184 @@
+"""Tests for OptimizationManager.parallel_map and the memory optimization."""
+
+import functools
+import gc
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from kicad_pcb_generator.core.performance.optimization_manager import (
+    OptimizationManager,
+    OptimizationType,
+)
+
+
+def _square(x):
+    return x * x
+
+
+def _add(total, value):
+    return total + value
+
+
+def _record(path, x):
+    """Append the item to a file so runs in any process can be counted."""
+    with open(path, 'a') as f:
+        f.write(f"{x}\n")
+    if x == 3:
+        raise TypeError("bad item")
+    return x
+
+
+def _die_in_worker(x):
+    """Kill worker processes; succeed when run in the parent."""
+    if multiprocessing.current_process().name != 'MainProcess':
+        os._exit(1)
+    return x + 1
+
+
+class TestParallelMap(unittest.TestCase):
+    """Test cases for OptimizationManager.parallel_map."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.manager = OptimizationManager(cache_dir=self.test_dir, max_workers=2)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.manager.close()
+        shutil.rmtree(self.test_dir)
+
+    def _calls(self, executor):
+        stats = self.manager._optimization_stats.get("parallel_map", {})
+        return stats.get(executor, {}).get("calls", 0)
+
+    def test_results_keep_input_order(self):
+        """Test that results come back in input order on every executor."""
+        items = list(range(50))
+        expected = [x * x for x in items]
+        self.assertEqual(self.manager.parallel_map(_square, items, chunk_size=3), expected)
+        self.assertEqual(
+            self.manager.parallel_map(_square, items, chunk_size=3, use_threads=True), expected
+        )
+        self.assertEqual(self._calls("process"), 1)
+        self.assertEqual(self._calls("thread"), 1)
+
+    def test_reduce(self):
+        """Test folding results with and without an initial value."""
+        items = list(range(10))
+        self.assertEqual(self.manager.parallel_map(_square, items, reduce=_add), 285)
+        self.assertEqual(
+            self.manager.parallel_map(_square, items, reduce=_add, initial=15), 300
+        )
+        self.assertEqual(
+            self.manager.parallel_map(str, items, chunk_size=2, reduce=_add), "0123456789"
+        )
+
+    def test_nested_calls_run_inline(self):
+        """Test that parallel_map inside a worker thread does not use the pools."""
+        def outer(x):
+            return sum(self.manager.parallel_map(_square, range(x)))
+
+        results = self.manager.parallel_map(outer, [3, 4, 5], chunk_size=1)
+        self.assertEqual(results, [5, 14, 30])
+        self.assertEqual(self._calls("thread"), 1)
+        self.assertEqual(self._calls("serial"), 3)
+
+    def test_worker_exception_propagates_without_retry(self):
+        """Test that an exception from func is raised and no item runs twice."""
+        path = os.path.join(self.test_dir, "calls.txt")
+        func = functools.partial(_record, path)
+        for use_threads in (False, True):
+            open(path, 'w').close()
+            with self.assertRaises(TypeError):
+                self.manager.parallel_map(func, range(6), chunk_size=1, use_threads=use_threads)
+            with open(path) as f:
+                calls = f.read().split()
+            self.assertEqual(len(calls), len(set(calls)))
+            self.assertIn("3", calls)
+        self.assertEqual(self.manager._process_pool_failures, 0)
+
+    def test_function_unknown_to_workers_uses_threads(self):
+        """Test that a task the workers cannot load falls back to threads."""
+        # Start the workers, then define a function they have never seen
+        self.manager.parallel_map(_square, range(4), chunk_size=1)
+        pool = self.manager._process_pool
+        module = sys.modules[__name__]
+
+        def late(x):
+            return x - 1
+        late.__qualname__ = late.__name__ = "_late"
+        late.__module__ = __name__
+        module._late = late
+        try:
+            self.assertEqual(self.manager.parallel_map(late, range(4), chunk_size=1),
+                             [-1, 0, 1, 2])
+        finally:
+            del module._late
+        self.assertIs(self.manager._process_pool, pool)
+
+    def test_broken_pool_is_replaced(self):
+        """Test that lost chunks are re-run and a new pool is started."""
+        pool = self.manager._process_pool
+        results = self.manager.parallel_map(_die_in_worker, range(4), chunk_size=1)
+        self.assertEqual(results, [1, 2, 3, 4])
+        self.assertIsNotNone(self.manager._process_pool)
+        self.assertIsNot(self.manager._process_pool, pool)
+        self.assertEqual(self.manager._process_pool_failures, 1)
+
+        self.assertEqual(self.manager.parallel_map(_square, range(4), chunk_size=1), [0, 1, 4, 9])
+        self.assertEqual(self._calls("process"), 2)
+        self.assertEqual(self.manager._process_pool_failures, 0)
+
+
+class TestMemoryOptimization(unittest.TestCase):
+    """Test cases for the memory optimization wrapper."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.manager = OptimizationManager(cache_dir=self.test_dir,
+                                           enable_parallelization=False)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.manager.close()
+        shutil.rmtree(self.test_dir)
+
+    def test_gc_paused_during_call(self):
+        """Test that the collector is off inside the call and restored after."""
+        self.assertTrue(gc.isenabled())
+        func = self.manager.optimize_function(gc.isenabled, OptimizationType.MEMORY)
+        self.assertFalse(func())
+        self.assertTrue(gc.isenabled())
+
+    def test_nested_calls_keep_gc_paused(self):
+        """Test that a nested call does not re-enable the collector early."""
+        inner = self.manager.optimize_function(gc.isenabled, OptimizationType.MEMORY)
+
+        def body():
+            inner()
+            return gc.isenabled()
+
+        outer = self.manager.optimize_function(body, OptimizationType.MEMORY)
+        self.assertFalse(outer())
+        self.assertTrue(gc.isenabled())
+
+    def test_collects_every_threshold_calls(self):
+        """Test that a collection runs once every ``gc_threshold`` calls."""
+        config = self.manager._optimizations["memory_optimization"]
+        config.parameters["gc_threshold"] = 3
+        func = self.manager.optimize_function(_square, OptimizationType.MEMORY)
+        with patch.object(gc, "collect") as collect:
+            for i in range(7):
+                self.assertEqual(func(i), i * i)
+        self.assertEqual(collect.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
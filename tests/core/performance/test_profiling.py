@@ -0,0 +1,81 @@
+"""Tests for pipeline spans and profile export."""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from kicad_pcb_generator.core.performance.profiling import Profiler
+
+
+def _busy(seconds):
+    """Spin for a while so samples land in this frame."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestProfiler(unittest.TestCase):
+    """Test cases for the Profiler class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.profiler = Profiler()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.profiler.stop()
+        shutil.rmtree(self.test_dir)
+
+    def test_disabled_spans_record_nothing(self):
+        """Test that spans are free no-ops until the profiler starts."""
+        with self.profiler.span("layout"):
+            pass
+        self.assertEqual(self.profiler.spans, [])
+
+    def test_nested_spans_and_exports(self):
+        """Test span nesting, Chrome trace events and span self-times."""
+        self.profiler.start()
+        with self.profiler.span("generate", project="amp"):
+            with self.profiler.span("layout"):
+                time.sleep(0.02)
+            with self.profiler.span("routing"):
+                time.sleep(0.01)
+        self.profiler.stop()
+
+        spans = {span.name: span for span in self.profiler.spans}
+        self.assertEqual(spans["layout"].stack, ("generate", "layout"))
+        self.assertGreaterEqual(spans["layout"].duration_ns, 20_000_000)
+
+        trace_path = os.path.join(self.test_dir, "trace.json")
+        self.profiler.write_chrome_trace(trace_path)
+        with open(trace_path) as f:
+            trace = json.load(f)
+        events = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+        self.assertEqual(events["generate"]["args"], {"project": "amp"})
+        self.assertLessEqual(events["generate"]["ts"], events["layout"]["ts"])
+        self.assertGreaterEqual(events["generate"]["dur"], events["layout"]["dur"] + events["routing"]["dur"])
+
+        stacks = self.profiler.collapsed_stacks()
+        self.assertGreaterEqual(stacks["generate;layout"], 20_000)
+        self.assertLess(stacks["generate"], stacks["generate;layout"])
+
+    def test_sampling(self):
+        """Test that stack samples are attributed to the open span."""
+        self.profiler.start(sample_interval=0.001)
+        with self.profiler.span("routing"):
+            _busy(0.2)
+        self.profiler.stop()
+
+        stacks = self.profiler.collapsed_stacks()
+        self.assertTrue(any(";routing;" in stack and "_busy" in stack for stack in stacks))
+        trace = self.profiler.chrome_trace()
+        self.assertGreater(len(trace["samples"]), 0)
+        self.assertTrue(all(sample["sf"] in trace["stackFrames"] for sample in trace["samples"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Unit tests for BoardChangeTracker."""
+import unittest
+from unittest.mock import Mock
+
+from kicad_pcb_generator.core.validation.change_tracker import (
+    BoardChangeTracker,
+    CHANGE_TRACKS,
+    CHANGE_FOOTPRINTS,
+    CHANGE_BOARD
+)
+
+
+def _point(x, y):
+    return Mock(x=x, y=y)
+
+
+def _mock_track(x1, y1, x2, y2, net="SIG"):
+    track = Mock()
+    track.GetStart.return_value = _point(x1, y1)
+    track.GetEnd.return_value = _point(x2, y2)
+    track.GetLayer.return_value = 0
+    track.GetWidth.return_value = 200000
+    track.GetNetname.return_value = net
+    return track
+
+
+def _mock_footprint(ref, x, y):
+    footprint = Mock()
+    footprint.GetReference.return_value = ref
+    footprint.GetValue.return_value = "10k"
+    footprint.GetPosition.return_value = _point(x, y)
+    footprint.GetOrientationDegrees.return_value = 0.0
+    footprint.GetLayer.return_value = 0
+    footprint.Pads.return_value = []
+    return footprint
+
+
+class TestBoardChangeTracker(unittest.TestCase):
+    """Test cases for BoardChangeTracker."""
+
+    def setUp(self):
+        self.tracker = BoardChangeTracker()
+        self.board = Mock()
+        self.tracks = [_mock_track(0, 0, 1000000, 0), _mock_track(0, 500000, 1000000, 500000)]
+        self.footprints = [_mock_footprint("R1", 0, 0), _mock_footprint("R2", 5000000, 0)]
+        self.board.GetTracks.return_value = self.tracks
+        self.board.GetVias.return_value = []
+        self.board.GetFootprints.return_value = self.footprints
+        self.board.Zones.return_value = []
+
+    def test_first_update_is_full(self):
+        """Test that the first scan reports every item."""
+        change = self.tracker.update(self.board)
+        self.assertTrue(change.full)
+        self.assertEqual(change.changed_keys(CHANGE_FOOTPRINTS), {"R1", "R2"})
+        self.assertEqual(len(change.changed_keys(CHANGE_TRACKS)), 2)
+
+    def test_idle_board_is_empty(self):
+        """Test that an unchanged board produces an empty change."""
+        self.tracker.update(self.board)
+        change = self.tracker.update(self.board)
+        self.assertTrue(change.is_empty)
+        self.assertFalse(change.touches(None))
+
+    def test_moved_footprint(self):
+        """Test that moving one footprint only dirties that footprint."""
+        self.tracker.update(self.board)
+        self.footprints[1].GetPosition.return_value = _point(6000000, 0)
+
+        change = self.tracker.update(self.board)
+        self.assertEqual(change.kinds, {CHANGE_FOOTPRINTS})
+        self.assertEqual(change.changed_keys(CHANGE_FOOTPRINTS), {"R2"})
+        self.assertEqual(change.stale_keys(CHANGE_FOOTPRINTS), {"R2"})
+        self.assertTrue(change.touches({CHANGE_FOOTPRINTS, CHANGE_BOARD}))
+        self.assertFalse(change.touches({CHANGE_TRACKS}))
+
+    def test_moved_track(self):
+        """Test that a moved track is reported as removed and added content."""
+        self.tracker.update(self.board)
+        self.tracks[0].GetEnd.return_value = _point(2000000, 0)
+
+        change = self.tracker.update(self.board)
+        self.assertEqual(len(change.changed_keys(CHANGE_TRACKS)), 1)
+        self.assertEqual(len(change.removed[CHANGE_TRACKS]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
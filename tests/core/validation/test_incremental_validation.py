@@ -0,0 +1,168 @@
+"""Unit tests for incremental real-time validation."""
+import threading
+import unittest
+from unittest.mock import Mock
+
+from kicad_pcb_generator.core.validation.real_time_validator import RealTimeValidator
+from kicad_pcb_generator.core.validation.base_validator import ValidationResult
+
+
+def _point(x, y):
+    return Mock(x=x, y=y)
+
+
+def _mock_track(x1, y1, x2, y2, net="SIG"):
+    track = Mock()
+    track.GetStart.return_value = _point(x1, y1)
+    track.GetEnd.return_value = _point(x2, y2)
+    track.GetLayer.return_value = 0
+    track.GetWidth.return_value = 200000
+    track.GetNetname.return_value = net
+    return track
+
+
+def _mock_footprint(ref, x, y):
+    footprint = Mock()
+    footprint.GetReference.return_value = ref
+    footprint.GetValue.return_value = "10k"
+    footprint.GetPosition.return_value = _point(x, y)
+    footprint.GetOrientationDegrees.return_value = 0.0
+    footprint.GetLayer.return_value = 0
+    footprint.Pads.return_value = []
+    return footprint
+
+
+class TestIncrementalValidation(unittest.TestCase):
+    """Test cases for validate_incremental and the pair violation cache."""
+
+    def setUp(self):
+        self.validator = RealTimeValidator()
+        self.validator.disable_rule("check_audio_rules")
+        self.board = Mock()
+        self.tracks = [
+            _mock_track(0, 0, 10000000, 0, net="A"),
+            _mock_track(0, 50000, 10000000, 50000, net="B"),
+            _mock_track(0, 5000000, 10000000, 5000000, net="C"),
+        ]
+        self.footprints = [
+            _mock_footprint("R1", 10000000, 10000000),
+            _mock_footprint("R2", 10200000, 10000000),
+            _mock_footprint("R3", 30000000, 10000000),
+        ]
+        self.board.GetTracks.return_value = self.tracks
+        self.board.GetVias.return_value = []
+        self.board.GetFootprints.return_value = self.footprints
+        self.board.Zones.return_value = []
+        self.board.GetBoardEdgesBoundingBox.side_effect = AttributeError
+
+    def tearDown(self):
+        self.validator.cleanup()
+
+    def _scan(self):
+        change = self.validator._change_tracker.update(self.board)
+        return change, self.validator.validate_incremental(self.board, change)
+
+    def _pairs(self, name, field_a, field_b):
+        return {frozenset((v[field_a], v[field_b]))
+                for v in self.validator._pair_violations[name].values()}
+
+    def test_only_affected_rules_rerun(self):
+        """Test that a footprint move does not re-run the track rules."""
+        rules = self.validator._validation_rules
+        for name in ("check_design_rules", "check_manufacturing"):
+            rules[name] = Mock(wraps=rules[name])
+        self._scan()
+        self.assertEqual(rules["check_design_rules"].call_count, 1)
+        self.assertEqual(rules["check_manufacturing"].call_count, 1)
+
+        change, _ = self._scan()
+        self.assertTrue(change.is_empty)
+        self.assertEqual(rules["check_manufacturing"].call_count, 1)
+
+        self.footprints[2].GetPosition.return_value = _point(31000000, 10000000)
+        self._scan()
+        self.assertEqual(rules["check_design_rules"].call_count, 1)
+        self.assertEqual(rules["check_manufacturing"].call_count, 2)
+
+    def test_pair_cache_follows_edits(self):
+        """Test that cached pair violations are updated around dirty items."""
+        self._scan()
+        self.assertEqual(self._pairs("spacing", "component1", "component2"),
+                         {frozenset(("R1", "R2"))})
+        self.assertEqual(self._pairs("clearance", "net1", "net2"), {frozenset(("A", "B"))})
+
+        # R3 moves next to R2, R1 moves away
+        self.footprints[2].GetPosition.return_value = _point(10600000, 10000000)
+        self.footprints[0].GetPosition.return_value = _point(0, 10000000)
+        # Track C moves next to B
+        self.tracks[2].GetStart.return_value = _point(0, 120000)
+        self.tracks[2].GetEnd.return_value = _point(10000000, 120000)
+        self._scan()
+        self.assertEqual(self._pairs("spacing", "component1", "component2"),
+                         {frozenset(("R2", "R3"))})
+        self.assertEqual(self._pairs("clearance", "net1", "net2"),
+                         {frozenset(("A", "B")), frozenset(("B", "C"))})
+
+        # The incremental result matches a pass from scratch
+        fresh = RealTimeValidator()
+        fresh.disable_rule("check_audio_rules")
+        fresh._change_tracker.update(self.board)
+        fresh.validate_incremental(self.board, fresh._change_tracker.update(self.board))
+        self.assertEqual(
+            {name: set(map(frozenset, cache)) for name, cache in fresh._pair_violations.items()},
+            {name: set(map(frozenset, cache))
+             for name, cache in self.validator._pair_violations.items()}
+        )
+        fresh.cleanup()
+
+    def test_direct_check_sees_edits(self):
+        """Test that a rule called outside a pass does not reuse the pass snapshot."""
+        self._scan()
+        self.footprints[2].GetPosition.return_value = _point(10600000, 10000000)
+
+        self.validator._check_manufacturing(self.board)
+        self.assertEqual(self._pairs("spacing", "component1", "component2"),
+                         {frozenset(("R1", "R2")), frozenset(("R2", "R3"))})
+
+    def test_pass_state_is_per_thread(self):
+        """Test that only the pass's rule threads see its snapshot."""
+        rules = self.validator._validation_rules
+        original = rules["check_cost"]
+        seen = {}
+
+        def probe(board):
+            seen["rule"] = self.validator._get_snapshot(board)
+            other = threading.Thread(
+                target=lambda: seen.__setitem__("other", self.validator._get_snapshot(board))
+            )
+            other.start()
+            other.join()
+            return original(board)
+
+        rules["check_cost"] = probe
+        self._scan()
+        self.assertIs(seen["rule"], self.validator._change_tracker.snapshot)
+        self.assertIsNot(seen["other"], seen["rule"])
+
+    def test_validate_waits_for_pass(self):
+        """Test that a direct validate() does not run during a pass."""
+        results = []
+        caller = threading.Thread(
+            target=lambda: results.append(self.validator.validate(self.board))
+        )
+        self.validator._validation_lock.acquire()
+        try:
+            caller.start()
+            caller.join(0.2)
+            self.assertTrue(caller.is_alive())
+            self.assertEqual(results, [])
+        finally:
+            self.validator._validation_lock.release()
+        caller.join()
+        self.assertFalse(caller.is_alive())
+        self.assertEqual(len(results), 1)
+        self.assertIsInstance(results[0], ValidationResult)
+
+
+if __name__ == '__main__':
+    unittest.main()
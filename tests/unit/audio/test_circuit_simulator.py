@@ -128,5 +128,97 @@ class TestCircuitSimulator(unittest.TestCase):
         self.assertFalse(os.path.exists(test_file))
         self.assertFalse(os.path.exists(self.test_dir))
 
+def _rc_circuit():
+    """Build a 1 kΩ / 100 nF low-pass driven at IN."""
+    return {
+        "components": {
+            "R1": {"value": "1k", "pads": [{"number": "1", "net": "IN"}, {"number": "2", "net": "OUT"}]},
+            "C1": {"value": "100nF", "pads": [{"number": "1", "net": "OUT"}, {"number": "2", "net": "GND"}]}
+        },
+        "nets": {"IN": {}, "OUT": {}, "GND": {}}
+    }
+
+class TestACSimulation(unittest.TestCase):
+    """Test cases for the AC excitation of boards without a V1 net."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        patcher = patch.object(CircuitSimulator, "_create_circuit", side_effect=_rc_circuit)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.simulator = CircuitSimulator(Mock())
+
+    def test_input_net_is_resolved(self):
+        """Test that the AC source defaults to the input net."""
+        result = self.simulator.run_simulation(SimulationType.AC, start_frequency=10.0,
+                                               stop_frequency=100000.0, num_points=20)
+        self.assertTrue(result.success)
+        self.assertEqual(result.metadata["parameters"]["ac_source"], "IN")
+        magnitude = np.asarray(result.data["magnitude_response"]["OUT"])
+        self.assertAlmostEqual(magnitude[0], 1.0, places=2)
+        self.assertLess(magnitude[-1], magnitude[0])
+        self.assertIn("IN_to_OUT", result.data["transfer_functions"])
+
+    def test_missing_source_fails(self):
+        """Test that an AC source that is not a net fails instead of driving nothing."""
+        result = self.simulator.run_simulation(SimulationType.AC, ac_source="V1")
+        self.assertFalse(result.success)
+        self.assertIn("V1", result.error_message)
+
+class TestTransientSimulation(unittest.TestCase):
+    """Test cases for transient results and their caching."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        patcher = patch.object(CircuitSimulator, "_create_circuit", side_effect=_rc_circuit)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.test_dir)
+
+    def test_waveforms_are_arrays(self):
+        """Test that transient waveforms are returned as NumPy arrays."""
+        simulator = CircuitSimulator(Mock(), cache_dir=self.test_dir)
+        result = simulator.run_simulation(SimulationType.TRANSIENT, input_source="IN",
+                                          stop_time=1e-4, time_step=1e-6)
+        self.assertTrue(result.success)
+        self.assertIsInstance(result.data["time"], np.ndarray)
+        self.assertIsInstance(result.data["voltages"]["OUT"], np.ndarray)
+
+        # A fresh simulator reads the same arrays back from disk
+        cached = CircuitSimulator(Mock(), cache_dir=self.test_dir).run_simulation(
+            SimulationType.TRANSIENT, input_source="IN", stop_time=1e-4, time_step=1e-6)
+        np.testing.assert_array_equal(cached.data["voltages"]["OUT"], result.data["voltages"]["OUT"])
+
+    def test_large_results_are_not_cached(self):
+        """Test that results over the cache budgets are skipped, not encoded."""
+        simulator = CircuitSimulator(Mock(), cache_bytes=1024)
+        result = simulator.run_simulation(SimulationType.TRANSIENT, input_source="IN",
+                                          stop_time=1e-3, time_step=1e-6)
+        self.assertTrue(result.success)
+        self.assertEqual(len(simulator.results_cache), 0)
+
+    def test_transient_engines_are_bounded(self):
+        """Test that only the most recently used transient engines are kept."""
+        from kicad_pcb_generator.audio.simulation import circuit_simulator
+        simulator = CircuitSimulator(Mock())
+        for i in range(circuit_simulator.MAX_TRANSIENT_ENGINES + 3):
+            simulator.run_simulation(SimulationType.TRANSIENT, input_source="IN",
+                                     stop_time=1e-5, time_step=1e-6, rtol=1e-3 * (i + 1),
+                                     adaptive=True)
+        self.assertEqual(len(simulator._transient_engines),
+                         circuit_simulator.MAX_TRANSIENT_ENGINES)
+
+    def test_mna_systems_are_bounded(self):
+        """Test that only the most recently used MNA systems are kept."""
+        from kicad_pcb_generator.audio.simulation import circuit_simulator
+        simulator = CircuitSimulator(Mock())
+        for i in range(circuit_simulator.MAX_MNA_SYSTEMS + 3):
+            simulator.run_simulation(SimulationType.DC, voltage_sources={"IN": float(i)})
+        self.assertEqual(len(simulator._mna_systems), circuit_simulator.MAX_MNA_SYSTEMS)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
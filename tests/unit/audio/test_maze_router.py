@@ -0,0 +1,116 @@
+"""Unit tests for the maze router."""
+import unittest
+from dataclasses import dataclass, field
+from typing import List
+
+import numpy as np
+
+from kicad_pcb_generator.audio.routing.maze_router import (
+    BLOCKED,
+    MazeRouter,
+    RoutingGrid,
+    RoutingNet,
+    RoutingPin,
+)
+
+TOP, BOTTOM = 0, 31
+
+
+@dataclass
+class Rules:
+    """Stand-in for the audio router's RoutingConstraints."""
+    min_width: float = 0.3
+    min_clearance: float = 0.3
+    preferred_layer: int = TOP
+    avoid_layers: List[int] = field(default_factory=list)
+
+
+def pin(x, y, layers=(TOP, BOTTOM)):
+    return RoutingPin(x, y, tuple(layers), 0.4, 0.4)
+
+
+class TestMazeRouter(unittest.TestCase):
+    """Test cases for MazeRouter."""
+
+    def setUp(self):
+        self.grid = RoutingGrid((0.0, 0.0, 30.0, 20.0), [TOP, BOTTOM], pitch=0.25)
+
+    def test_routes_around_obstacle(self):
+        """Test that a connection detours around a wall on its layer."""
+        self.grid.add_rect((14.0, 0.0, 16.0, 17.0), layers=[TOP])
+        self.grid.add_rect((14.0, 0.0, 16.0, 20.0), layers=[BOTTOM])
+        router = MazeRouter(self.grid, window_margin=20.0)
+
+        path = router.route_connection((5.0, 5.0), (25.0, 5.0), Rules(), layers=[TOP])
+
+        self.assertIsNotNone(path)
+        self.assertEqual(path.vias, [])
+        self.assertGreater(max(y for _, y, _ in path.points), 17.0)
+        self.assertGreater(path.length, 20.0)
+
+    def test_via_penalty_and_avoided_layers(self):
+        """Test that avoided layers are only used when they pay off."""
+        router = MazeRouter(self.grid, window_margin=5.0)
+        path = router.route_connection((5.0, 5.0), (25.0, 5.0), Rules(avoid_layers=[BOTTOM]))
+        self.assertTrue(all(layer == TOP for _, _, layer in path.points))
+
+        # Blocked on top, the route has to change layers through vias
+        self.grid.add_rect((14.0, 0.0, 16.0, 20.0), layers=[TOP])
+        path = router.route_connection((5.0, 15.0), (25.0, 15.0), Rules(avoid_layers=[BOTTOM]),
+                                       layers=[TOP])
+        self.assertEqual(len(path.vias), 2)
+
+    def test_rip_up_and_reroute(self):
+        """Test that crossing nets end up without shared or too-close copper."""
+        nets = [
+            RoutingNet(f"N{i}", [pin(3.0, 4.0 + 3 * i), pin(27.0, 16.0 - 3 * i)], Rules(), net_id=i + 1)
+            for i in range(4)
+        ]
+        for net in nets:
+            for p in net.pins:
+                self.grid.add_rect((p.x - 0.4, p.y - 0.4, p.x + 0.4, p.y + 0.4), net_id=net.net_id)
+        router = MazeRouter(self.grid, max_workers=1)
+
+        result = router.route_nets(nets)
+
+        self.assertTrue(result.success, f"failed={result.failed} conflicting={result.conflicting}")
+        self.assertTrue(all(route.paths for route in result.routes.values()))
+        self.assertGreaterEqual(sum(route.via_count for route in result.routes.values()), 2)
+
+        # Ripping up every net empties the usage plane again
+        for net in nets:
+            router.rip_up(net.name)
+        self.assertEqual(int(self.grid.usage.sum()), 0)
+
+    def test_multi_pin_net_and_pad_obstacles(self):
+        """Test that all pins of a net connect and unconnected pads stay untouched."""
+        self.grid.add_rect((14.5, 9.5, 15.5, 10.5), net_id=BLOCKED)
+        net = RoutingNet("GND", [pin(5.0, 10.0), pin(25.0, 10.0), pin(15.0, 3.0), pin(15.0, 17.0)],
+                         Rules(), net_id=7)
+        router = MazeRouter(self.grid)
+
+        result = router.route_nets([net], parallel=False)
+
+        route = result.routes["GND"]
+        self.assertTrue(route.success)
+        self.assertEqual(len(route.paths), 3)
+        blocked = self.grid.fixed == BLOCKED
+        self.assertEqual(int(np.count_nonzero(self.grid.usage[blocked])), 0)
+
+    def test_connection_leaves_its_own_pads(self):
+        """Test that a connection may start inside its own net's pad copper."""
+        for x in (5.0, 25.0):
+            self.grid.add_rect((x - 0.5, 4.5, x + 0.5, 5.5), layers=[TOP], net_id=5)
+        router = MazeRouter(self.grid)
+
+        # The pads are foreign copper to an anonymous connection
+        self.assertIsNone(router.route_connection((5.0, 5.0), (25.0, 5.0), Rules(), layers=[TOP]))
+
+        path = router.route_connection((5.0, 5.0), (25.0, 5.0), Rules(), name="SIG", net_id=5,
+                                       layers=[TOP])
+        self.assertIsNotNone(path)
+        self.assertEqual(path.vias, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
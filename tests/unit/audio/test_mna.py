@@ -0,0 +1,202 @@
+"""Unit tests for the sparse MNA solver."""
+import unittest
+
+import numpy as np
+
+from kicad_pcb_generator.audio.simulation.mna import (
+    BOLTZMANN,
+    OPAMP_SINGLE_PADS,
+    build_system,
+    opamp_channel_pads,
+    parse_value,
+    resolve_input_net,
+    supply_voltage
+)
+
+
+def _circuit(components, nets):
+    """Build a circuit dictionary from (ref, value, [nets]) tuples."""
+    return {
+        "components": {
+            ref: {
+                "value": value,
+                "pads": [{"number": str(i), "net": net} for i, net in enumerate(pads, start=1)]
+            }
+            for ref, value, pads in components
+        },
+        "nets": {net: {} for net in nets}
+    }
+
+
+class TestMNAHelpers(unittest.TestCase):
+    """Test cases for value and net helpers."""
+
+    def test_parse_value(self):
+        """Test component value parsing."""
+        self.assertAlmostEqual(parse_value("2k2"), 2200.0)
+        self.assertAlmostEqual(parse_value("4R7"), 4.7)
+        self.assertAlmostEqual(parse_value("1Meg"), 1e6)
+        self.assertAlmostEqual(parse_value("100nF"), 100e-9)
+
+    def test_supply_voltage(self):
+        """Test supply net voltage detection."""
+        self.assertEqual(supply_voltage("+15V"), 15.0)
+        self.assertEqual(supply_voltage("-15V"), -15.0)
+        self.assertAlmostEqual(supply_voltage("+3V3"), 3.3)
+        self.assertIsNone(supply_voltage("OUT"))
+        self.assertEqual(supply_voltage("VCC"), 5.0)
+        self.assertEqual(supply_voltage("+VDD"), 5.0)
+        self.assertEqual(supply_voltage("V-"), -5.0)
+
+    def test_signal_nets_are_not_supplies(self):
+        """Test that signal nets with a leading sign are not treated as rails."""
+        for net in ("+IN", "+BIAS", "-IN", "V-IN", "VOUT"):
+            self.assertIsNone(supply_voltage(net), net)
+
+        # +IN keeps its AC signal instead of being clamped to a 5 V source
+        circuit = _circuit(
+            [("R1", "1k", ["IN", "+IN"]), ("R2", "1k", ["+IN", "GND"])],
+            ["IN", "+IN", "GND"]
+        )
+        system = build_system(circuit, ac_source="IN")
+        solution = system.solve_ac([1000.0])
+        self.assertAlmostEqual(float(np.abs(system.voltage(solution, "+IN"))[0]), 0.5, places=6)
+
+    def test_resolve_input_net(self):
+        """Test input net resolution without a V1 net."""
+        circuit = _circuit(
+            [("R1", "1k", ["/AUDIO_IN", "OUT"]), ("C1", "100nF", ["OUT", "GND"])],
+            ["+15V", "OUT", "/AUDIO_IN", "GND"]
+        )
+        self.assertEqual(resolve_input_net(circuit), "/AUDIO_IN")
+        self.assertEqual(resolve_input_net(circuit, "OUT"), "OUT")
+        with self.assertRaises(ValueError):
+            resolve_input_net(circuit, "V1")
+
+        # Without an input-like name the first connector signal pin is used
+        circuit = _circuit(
+            [("J1", "Jack", ["GND", "TIP"]), ("R1", "1k", ["TIP", "OUT"])],
+            ["OUT", "TIP", "GND"]
+        )
+        self.assertEqual(resolve_input_net(circuit), "TIP")
+
+        circuit = _circuit([("R1", "1k", ["A", "B"])], ["A", "B"])
+        with self.assertRaises(ValueError):
+            resolve_input_net(circuit)
+
+    def test_missing_ac_source_fails(self):
+        """Test that an AC source that is not a net is rejected."""
+        circuit = _circuit([("R1", "1k", ["IN", "OUT"])], ["IN", "OUT", "GND"])
+        with self.assertRaises(ValueError):
+            build_system(circuit, ac_source="V1")
+
+
+class TestMNASystem(unittest.TestCase):
+    """Test cases for MNASystem."""
+
+    def setUp(self):
+        self.divider = _circuit(
+            [("R1", "10k", ["VCC", "OUT"]), ("R2", "10k", ["OUT", "GND"])],
+            ["VCC", "OUT", "GND"]
+        )
+
+    def test_dc_divider(self):
+        """Test the operating point of a resistive divider."""
+        system = build_system(self.divider, voltage_sources={"VCC": 15.0})
+        x = system.solve_dc()
+        self.assertAlmostEqual(float(system.voltage(x, "OUT")), 7.5)
+        self.assertEqual(system.voltage(x, "GND"), 0.0)
+        np.testing.assert_allclose(system.resistor_currents(x), [7.5e-4, 7.5e-4])
+
+    def test_ac_lowpass(self):
+        """Test that an RC low-pass is -3 dB at its corner frequency."""
+        circuit = _circuit(
+            [("R1", "1k", ["IN", "OUT"]), ("C1", "159.155nF", ["OUT", "GND"])],
+            ["IN", "OUT", "GND"]
+        )
+        system = build_system(circuit, ac_source="IN")
+        solution = system.solve_ac([10.0, 1000.0, 100000.0])
+        magnitude = np.abs(system.voltage(solution, "OUT"))
+        self.assertAlmostEqual(magnitude[0], 1.0, places=3)
+        self.assertAlmostEqual(magnitude[1], 1 / np.sqrt(2), places=3)
+        self.assertLess(magnitude[2], 0.02)
+
+    def test_voltages_sweep(self):
+        """Test that voltages stacks nets along the first axis."""
+        circuit = _circuit(
+            [("R1", "1k", ["IN", "OUT"]), ("C1", "159.155nF", ["OUT", "GND"])],
+            ["IN", "OUT", "GND"]
+        )
+        system = build_system(circuit, ac_source="IN")
+        solution = system.solve_ac([10.0, 1000.0, 100000.0])
+        voltages = system.voltages(solution, ["IN", "OUT", "GND"])
+        self.assertEqual(voltages.shape, (3, 3))
+        np.testing.assert_allclose(voltages[1], system.voltage(solution, "OUT"))
+        np.testing.assert_allclose(voltages[2], 0.0)
+
+    def test_impedance_and_noise(self):
+        """Test node impedance and thermal noise of a divider output."""
+        system = build_system(self.divider)
+        frequencies = [100.0, 1000.0]
+        impedance = system.node_impedance(frequencies, nodes=["OUT"])
+        np.testing.assert_allclose(np.abs(impedance[:, 0]), 5000.0)
+
+        noise = system.thermal_noise(frequencies, temperature=300.0, nodes=["OUT"])
+        np.testing.assert_allclose(noise[:, 0], np.sqrt(4 * BOLTZMANN * 300.0 * 5000.0))
+
+    def test_opamp_buffer(self):
+        """Test that an op-amp follower tracks its input."""
+        circuit = _circuit(
+            [("U1", "TL072", ["OUT", "OUT", "IN", "-15V", "", "", "", "+15V"]),
+             ("R1", "10k", ["OUT", "GND"])],
+            ["IN", "OUT", "+15V", "-15V", "GND"]
+        )
+        system = build_system(circuit, voltage_sources={"IN": 1.0})
+        x = system.solve_dc()
+        self.assertAlmostEqual(float(system.voltage(x, "OUT")), 1.0, places=3)
+
+    def test_single_opamp_pinout(self):
+        """Test that single op-amps use pin 6 as the output."""
+        self.assertEqual(opamp_channel_pads("OPA134PA"), OPAMP_SINGLE_PADS)
+        self.assertEqual(opamp_channel_pads("NE5534"), OPAMP_SINGLE_PADS)
+        self.assertNotEqual(opamp_channel_pads("OPA2134"), OPAMP_SINGLE_PADS)
+        self.assertNotEqual(opamp_channel_pads("NE5532"), OPAMP_SINGLE_PADS)
+
+        # Offset trim pins 1 and 5 are connected; they must not form a channel
+        circuit = _circuit(
+            [("U1", "OPA134", ["TRIM", "OUT", "IN", "-15V", "TRIM", "OUT", "+15V", ""]),
+             ("R1", "10k", ["OUT", "GND"])],
+            ["IN", "OUT", "TRIM", "+15V", "-15V", "GND"]
+        )
+        system = build_system(circuit, voltage_sources={"IN": 1.0})
+        opamps = [e for e in system.elements if e.kind == "OPAMP"]
+        self.assertEqual([e.nodes for e in opamps], [("OUT", "OUT", "IN")])
+        x = system.solve_dc()
+        self.assertAlmostEqual(float(system.voltage(x, "OUT")), 1.0, places=3)
+
+    def test_per_point_solves_match_sweep(self):
+        """Test that per-frequency impedance matches the batched AC sweep."""
+        circuit = _circuit(
+            [("R1", "1k", ["IN", "OUT"]), ("C1", "100nF", ["OUT", "GND"]),
+             ("R2", "10k", ["OUT", "GND"])],
+            ["IN", "OUT", "GND"]
+        )
+        system = build_system(circuit)
+        frequencies = np.logspace(1, 5, 9)
+        impedance = system.node_impedance(frequencies, chunk=1)
+
+        # Driving-point impedance is the response to a unit current injection
+        for column, node in enumerate(system.nodes):
+            b = np.zeros(system.size, dtype=complex)
+            b[system.node_index[node]] = 1.0
+            expected = system.solve_ac(frequencies, b=b)[:, system.node_index[node]]
+            np.testing.assert_allclose(impedance[:, column], expected)
+
+        # Batched and single-node noise agree
+        noise = system.thermal_noise(frequencies, chunk=1)
+        out = system.thermal_noise(frequencies, nodes=["OUT"])
+        np.testing.assert_allclose(noise[:, system.node_index["OUT"]], out[:, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""Unit tests for the simulation result cache."""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+
+from kicad_pcb_generator.audio.simulation.result_cache import (
+    SimulationCache, content_key, decode_value, encode_value, estimate_size
+)
+
+
+class TestContentKey(unittest.TestCase):
+    """Test cases for content keys."""
+
+    def test_normalized_parameters(self):
+        """Test that equivalent parameters produce the same key."""
+        circuit = {"components": {"R1": {"value": "10k"}}, "nets": {"GND": {}}}
+        self.assertEqual(
+            content_key("ac", circuit, {"num_points": 100, "frequencies": np.array([1.0, 2.0])}),
+            content_key("ac", circuit, {"frequencies": [1, 2], "num_points": 100.0})
+        )
+
+    def test_circuit_content(self):
+        """Test that editing the circuit changes the key."""
+        before = {"components": {"R1": {"value": "10k"}}}
+        after = {"components": {"R1": {"value": "22k"}}}
+        self.assertNotEqual(content_key("dc", before, {}), content_key("dc", after, {}))
+
+
+class TestSimulationCache(unittest.TestCase):
+    """Test cases for SimulationCache."""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_hits_and_misses(self):
+        """Test hit and miss counters."""
+        cache = SimulationCache()
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", {"value": 1})
+        self.assertEqual(cache.get("a"), {"value": 1})
+
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_lru_by_count(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = SimulationCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_lru_by_bytes(self):
+        """Test that the byte budget bounds the memory tier."""
+        cache = SimulationCache(max_bytes=100)
+        cache.put("a", "x" * 40)
+        cache.put("b", "y" * 40)
+        self.assertEqual(len(cache), 2)
+        cache.put("c", "z" * 40)
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn("a", cache)
+        self.assertLessEqual(cache.size_bytes, 100)
+
+    def test_disk_tier(self):
+        """Test that results survive in the disk tier."""
+        cache = SimulationCache(cache_dir=self.cache_dir)
+        cache.put("a", {"magnitude": np.array([1.0, 0.5])})
+
+        fresh = SimulationCache(cache_dir=self.cache_dir)
+        cached = fresh.get("a")
+        np.testing.assert_array_equal(cached["magnitude"], np.array([1.0, 0.5]))
+        self.assertEqual(fresh.stats()["disk_hits"], 1)
+        self.assertIn("a", fresh)
+
+        fresh.clear(disk=True)
+        self.assertIsNone(SimulationCache(cache_dir=self.cache_dir).get("a"))
+
+    def test_disk_round_trip_keeps_types(self):
+        """Test that disk hits decode to the shapes that were stored."""
+        value = {
+            "time": np.linspace(0.0, 1.0, 7),
+            "matrix": np.arange(6, dtype=np.int32).reshape(2, 3),
+            "response": np.array([1 + 2j, 0.5j]),
+            "point": (1.0, "x"),
+            "impedance": 3 - 4j,
+            "by_index": {1: "a", 2: "b"}
+        }
+        decoded = decode_value(encode_value(value))
+        self.assertEqual(decoded["matrix"].dtype, np.int32)
+        self.assertEqual(decoded["matrix"].shape, (2, 3))
+        np.testing.assert_array_equal(decoded["time"], value["time"])
+        np.testing.assert_array_equal(decoded["response"], value["response"])
+        self.assertEqual(decoded["point"], (1.0, "x"))
+        self.assertEqual(decoded["impedance"], 3 - 4j)
+        self.assertEqual(decoded["by_index"], {1: "a", 2: "b"})
+
+        SimulationCache(cache_dir=self.cache_dir).put("a", value)
+        cached = SimulationCache(cache_dir=self.cache_dir).get("a")
+        np.testing.assert_array_equal(cached["time"], value["time"])
+        self.assertEqual(cached["point"], (1.0, "x"))
+
+    def test_oversized_values_are_not_encoded(self):
+        """Test that values too large for every tier skip encoding."""
+        encode = Mock(side_effect=encode_value)
+        cache = SimulationCache(max_bytes=1000, cache_dir=self.cache_dir,
+                                max_disk_bytes=2000, encode=encode)
+        large = {"samples": np.zeros(10000)}
+        self.assertGreater(estimate_size(large), 2000)
+        cache.put("large", large)
+        encode.assert_not_called()
+        self.assertNotIn("large", cache)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+        cache.put("small", {"samples": np.zeros(4)})
+        encode.assert_called_once()
+        self.assertIn("small", cache)
+
+    def test_disk_pruned_by_running_total(self):
+        """Test that the disk tier stays within budget, dropping old entries."""
+        payload = {"samples": np.arange(100.0)}
+        entry_size = SimulationCache(max_disk_bytes=10 ** 9, cache_dir=self.cache_dir)
+        entry_size.put("probe", payload)
+        size = entry_size._disk_bytes
+        entry_size.clear(disk=True)
+        self.assertEqual(entry_size._disk_bytes, 0)
+
+        cache = SimulationCache(cache_dir=self.cache_dir, max_disk_bytes=3 * size)
+        for i in range(5):
+            cache.put(str(i), payload)
+            os.utime(os.path.join(self.cache_dir, f"{i}.json"), (i, i))
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ["2.json", "3.json", "4.json"])
+        self.assertEqual(cache._disk_bytes, 3 * size)
+        self.assertEqual(SimulationCache(cache_dir=self.cache_dir)._disk_bytes, 3 * size)
+
+
+if __name__ == '__main__':
+    unittest.main()
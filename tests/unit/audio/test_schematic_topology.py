@@ -0,0 +1,80 @@
+"""Unit tests for schematic topology signal-path analysis."""
+import unittest
+
+from kicad_pcb_generator.audio.analysis.schematic_topology import SchematicTopologyAnalyzer
+
+
+def _component(ref, value, nets, position=(0.0, 0.0)):
+    """Build a schematic component dictionary."""
+    return {"reference": ref, "value": value, "position": position, "nets": nets}
+
+
+class TestSignalPaths(unittest.TestCase):
+    """Test cases for input-to-output signal path tracing."""
+
+    def setUp(self):
+        self.analyzer = SchematicTopologyAnalyzer()
+
+    def test_paths_from_inputs_to_outputs(self):
+        """Test that paths run from input jacks to output jacks over signal nets only."""
+        components = [
+            _component("J1", "Jack", ["AUDIO_IN", "GND"]),
+            _component("C1", "1u", ["AUDIO_IN", "N1"]),
+            _component("R1", "100k", ["N1", "GND"]),
+            _component("U1", "TL072", ["N1", "FB", "BUF", "+15V", "-15V"]),
+            _component("R2", "1k", ["BUF", "N3"]),
+            _component("J2", "Jack", ["AUDIO_OUT", "N3", "GND"]),
+            _component("J3", "Jack", ["CV_IN", "FB"]),
+        ]
+        analysis = self.analyzer.analyze_schematic({"components": components})
+
+        paths = {(p.start_component, p.end_component): p for p in analysis.signal_paths}
+        self.assertEqual(set(paths), {("J1", "J2"), ("J3", "J2")})
+        self.assertEqual(paths[("J1", "J2")].path_components, ["J1", "C1", "U1", "R2", "J2"])
+        self.assertEqual(paths[("J1", "J2")].path_nets, ["AUDIO_IN", "N1", "BUF", "N3"])
+        self.assertEqual(paths[("J1", "J2")].signal_type, "audio")
+
+        # Ground and supply nets do not make every part a neighbour
+        self.assertEqual(analysis.component_dependencies["J1"], ["C1"])
+        self.assertNotIn("J2", analysis.component_dependencies["R1"])
+
+    def test_control_voltage_paths(self):
+        """Test that CV nets are signals, not supplies, and carry paths."""
+        for net in ("CV-IN", "/CV-OUT", "SV+", "V-OCT"):
+            self.assertFalse(self.analyzer._is_power_net(net), net)
+        for net in ("GND", "/AGND", "VCC", "+VDD", "V+", "V-", "+15V", "-12V"):
+            self.assertTrue(self.analyzer._is_power_net(net), net)
+
+        components = [
+            _component("J1", "Jack", ["CV-IN", "GND"]),
+            _component("R1", "100k", ["CV-IN", "SV+"]),
+            _component("R2", "10k", ["SV+", "/CV-OUT", "V-"]),
+            _component("J2", "Jack", ["/CV-OUT", "GND"]),
+        ]
+        analysis = self.analyzer.analyze_schematic({"components": components})
+
+        paths = {(p.start_component, p.end_component): p for p in analysis.signal_paths}
+        self.assertEqual(set(paths), {("J1", "J2")})
+        self.assertEqual(paths[("J1", "J2")].path_components, ["J1", "R1", "R2", "J2"])
+        self.assertEqual(paths[("J1", "J2")].path_nets, ["CV-IN", "SV+", "/CV-OUT"])
+
+    def test_high_fanout_module(self):
+        """Test a 500-part module with shared ground stays linear in size."""
+        components = []
+        for channel in range(20):
+            components.append(_component(f"J{2 * channel + 1}", "Jack", [f"IN{channel}", "GND"]))
+            previous = f"IN{channel}"
+            for k in range(23):
+                components.append(_component(f"R{channel * 100 + k}", "10k",
+                                             [previous, f"N{channel}_{k}", "GND"]))
+                previous = f"N{channel}_{k}"
+            components.append(_component(f"J{2 * channel + 2}", "Jack", [previous, f"OUT{channel}", "GND"]))
+
+        analysis = self.analyzer.analyze_schematic({"components": components})
+        self.assertEqual(len(analysis.components), 500)
+        self.assertEqual(len(analysis.signal_paths), 20)
+        self.assertTrue(all(len(p.path_components) == 25 for p in analysis.signal_paths))
+
+
+if __name__ == "__main__":
+    unittest.main()
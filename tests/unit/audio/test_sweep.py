@@ -0,0 +1,94 @@
+"""Unit tests for parameter sweeps and Monte-Carlo tolerance analysis."""
+import unittest
+
+import numpy as np
+
+from kicad_pcb_generator.audio.simulation.mna import build_system
+from kicad_pcb_generator.audio.simulation.sweep import SweepEngine, build_samples, evaluate, run_sweep
+
+
+def _circuit(components, nets):
+    """Build a circuit dictionary from (ref, value, [nets]) tuples."""
+    return {
+        "components": {
+            ref: {
+                "value": value,
+                "pads": [{"number": str(i), "net": net} for i, net in enumerate(pads, start=1)]
+            }
+            for ref, value, pads in components
+        },
+        "nets": {net: {} for net in nets}
+    }
+
+
+PREAMP = _circuit(
+    [("C1", "1uF", ["IN", "N1"]), ("R1", "100k", ["N1", "GND"]),
+     ("U1", "NE5532", ["OUT", "FB", "N1", "-15V", "", "", "", "+15V"]),
+     ("R2", "10k", ["OUT", "FB"]), ("R3", "1k", ["FB", "N2"]), ("C2", "47uF", ["N2", "GND"]),
+     ("C3", "100pF", ["OUT", "FB"])],
+    ["IN", "N1", "OUT", "FB", "N2", "GND", "+15V", "-15V"]
+)
+
+FREQUENCIES = np.geomspace(20.0, 80000.0, 60)
+
+
+class TestSweepEngine(unittest.TestCase):
+    """Test cases for SweepEngine."""
+
+    def test_dense_batches_match_rebuilt_systems(self):
+        """Test batched stamp updates against systems rebuilt per sample."""
+        system = build_system(PREAMP, ac_source="IN")
+        parameters, values = build_samples({"R2": 1e4, "R3": 1e3, "C2": 47e-6, "C3": 1e-10},
+                                           distributions={"R2": 0.05, "R3": 0.05, "C2": 0.2, "C3": 0.1},
+                                           n_samples=8, seed=2)
+        dense = SweepEngine(system, parameters)
+        sparse = SweepEngine(system, parameters, dense_limit=0)
+        self.assertTrue(dense.dense)
+        np.testing.assert_allclose(dense.solve_ac(values, FREQUENCIES), sparse.solve_ac(values, FREQUENCIES),
+                                   rtol=1e-9, atol=1e-12)
+
+        divider = build_system(_circuit([("R1", "10k", ["VCC", "OUT"]), ("R2", "10k", ["OUT", "GND"])],
+                                        ["VCC", "OUT", "GND"]), voltage_sources={"VCC": 10.0})
+        engine = SweepEngine(divider, ["R2", "V_VCC"])
+        metrics = evaluate(engine, np.array([[10e3, 10.0], [30e3, 10.0], [10e3, 4.0]]), "dc", ["OUT"])
+        np.testing.assert_allclose(metrics["V(OUT)"], [5.0, 7.5, 2.0])
+
+
+class TestRunSweep(unittest.TestCase):
+    """Test cases for run_sweep."""
+
+    def setUp(self):
+        self.system = build_system(PREAMP, ac_source="IN")
+
+    def test_parameter_grid(self):
+        """Test that a grid covers every combination and tracks the stage gain."""
+        result = run_sweep(self.system, "ac", ["OUT"], param_grid={"R2": ["10k", "22k"], "R3": [1000, 470]},
+                           frequencies=FREQUENCIES)
+        np.testing.assert_allclose(result.values, [[1e4, 1e3], [1e4, 470], [2.2e4, 1e3], [2.2e4, 470]])
+        gain = 10 ** (result.metrics["gain_db(OUT)"] / 20)
+        np.testing.assert_allclose(gain, 1 + result.values[:, 0] / result.values[:, 1], rtol=1e-2)
+        self.assertAlmostEqual(result.nominal["gain_db(OUT)"], result.metrics["gain_db(OUT)"][0])
+
+    def test_monte_carlo_summary_and_yield(self):
+        """Test statistics, worst case and yield of a tolerance run."""
+        result = run_sweep(self.system, "ac", ["OUT"], distributions={"R2": 0.05, "R3": ("uniform", 0.05)},
+                           n_samples=500, frequencies=FREQUENCIES, seed=4,
+                           specs={"gain_db(OUT)": (20.5, 21.1), "bandwidth(OUT)": (20000.0, None)})
+        self.assertEqual(result.n_samples, 500)
+        self.assertTrue(np.all(np.abs(result.values[:, 0] / 1e4 - 1) <= 0.05 + 1e-12))
+
+        gain = result.summary["gain_db(OUT)"]
+        self.assertLess(gain["percentiles"]["p5"], gain["nominal"])
+        self.assertGreater(gain["percentiles"]["p95"], gain["nominal"])
+        worst = result.metrics["gain_db(OUT)"][gain["worst_case"]["sample"]]
+        self.assertEqual(np.abs(result.metrics["gain_db(OUT)"] - gain["nominal"]).max(), abs(worst - gain["nominal"]))
+
+        expected = np.mean((result.metrics["gain_db(OUT)"] >= 20.5) & (result.metrics["gain_db(OUT)"] <= 21.1)
+                           & (result.metrics["bandwidth(OUT)"] >= 20000.0))
+        self.assertAlmostEqual(result.yield_fraction, expected)
+        self.assertGreater(result.yield_fraction, 0.0)
+        self.assertLess(result.yield_fraction, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Unit tests for the transient integration engine."""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from kicad_pcb_generator.audio.simulation.mna import build_system
+from kicad_pcb_generator.audio.simulation.transient import TransientEngine, input_waveform
+
+TAU = 1e-4
+
+
+def _rc_lowpass():
+    """Build a 1 kΩ / 100 nF low-pass driven at IN."""
+    circuit = {
+        "components": {
+            "R1": {"value": "1k", "pads": [{"number": "1", "net": "IN"}, {"number": "2", "net": "OUT"}]},
+            "C1": {"value": "100nF", "pads": [{"number": "1", "net": "OUT"}, {"number": "2", "net": "GND"}]}
+        },
+        "nets": {"IN": {}, "OUT": {}, "GND": {}}
+    }
+    return build_system(circuit, ac_source="IN")
+
+
+def _ramp(t):
+    return np.asarray(t) / TAU
+
+
+def _ramp_response(t):
+    return (t - TAU * (1 - np.exp(-t / TAU))) / TAU
+
+
+class TestTransientEngine(unittest.TestCase):
+    """Test cases for TransientEngine."""
+
+    def setUp(self):
+        self.system = _rc_lowpass()
+
+    def test_fixed_step_methods(self):
+        """Test both integrators against the exact RC ramp and step responses."""
+        for method, tolerance in (("trapezoidal", 1e-5), ("gear2", 5e-5)):
+            engine = TransientEngine(self.system, method=method)
+            result = engine.run(1e-3, 1e-6, input_signal=_ramp)
+            self.assertEqual(result.values.shape, (1001, len(result.columns)))
+            np.testing.assert_allclose(result.column("OUT"), _ramp_response(result.time), atol=tolerance)
+            self.assertLessEqual(result.factorizations, 2)
+
+            result = engine.run(1e-3, 1e-6, input_signal=input_waveform("step"))
+            np.testing.assert_allclose(result.column("OUT"), 1 - np.exp(-result.time / TAU), atol=1e-2)
+            self.assertEqual(result.factorizations, 0)
+
+    def test_adaptive_steps(self):
+        """Test that adaptive runs take far fewer steps at similar accuracy."""
+        for method in ("trapezoidal", "gear2"):
+            engine = TransientEngine(self.system, method=method, rtol=1e-4, atol=1e-7)
+            result = engine.run(1e-3, 1e-6, input_signal=_ramp, adaptive=True, max_step=1e-4)
+            self.assertLess(result.steps, 200)
+            np.testing.assert_allclose(result.column("OUT"), _ramp_response(result.time), atol=2e-3)
+
+    def test_sine_steady_state(self):
+        """Test the steady-state amplitude of a 1 kHz sine through the low-pass."""
+        engine = TransientEngine(self.system)
+        result = engine.run(10e-3, 1e-6, input_signal=input_waveform("sine"))
+        expected = 1 / np.sqrt(1 + (2 * np.pi * 1e3 * TAU) ** 2)
+        self.assertAlmostEqual(float(result.column("OUT")[-2000:].max()), expected, places=4)
+
+    def test_streaming_to_file(self):
+        """Test that chunked output to a .npy file matches the in-memory run."""
+        engine = TransientEngine(self.system)
+        in_memory = engine.run(2e-3, 1e-6, input_signal=input_waveform("square"))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "transient.npy")
+            streamed = engine.run(2e-3, 1e-6, input_signal=input_waveform("square"),
+                                  output_file=path, chunk_size=97)
+            np.testing.assert_allclose(np.load(path), in_memory.values)
+            self.assertEqual(streamed.output_file, path)
+            del streamed
+
+
+if __name__ == "__main__":
+    unittest.main()
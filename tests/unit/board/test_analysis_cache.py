@@ -0,0 +1,197 @@
+"""Unit tests for the persistent analysis cache."""
+import os
+import tempfile
+import time
+import unittest
+from dataclasses import dataclass
+from unittest.mock import Mock
+
+import numpy as np
+
+from kicad_pcb_generator.core.base.analysis_cache import (
+    NO_ANALYSIS_CACHE,
+    AnalysisCache,
+    cached_analysis,
+    configure_analysis_cache,
+)
+from kicad_pcb_generator.core.base.base_analyzer import BaseAnalyzer
+from kicad_pcb_generator.core.base.results.analysis_result import AnalysisResult, AnalysisType
+
+
+def _point(x, y):
+    return Mock(x=int(x * 1e6), y=int(y * 1e6))
+
+
+def _bounding_box(left, top, right, bottom):
+    return Mock(**{f"Get{name}.return_value": int(value * 1e6) for name, value in
+                   (("Left", left), ("Top", top), ("Right", right), ("Bottom", bottom))})
+
+
+def _mock_board(track_end=3.0, fpid="Resistor_SMD:R_0603", courtyard=2.0):
+    """Create a mock board with one track and one footprint."""
+    track = Mock()
+    track.GetStart.return_value = _point(0, 0)
+    track.GetEnd.return_value = _point(track_end, 0)
+    track.GetLayer.return_value = 0
+    track.GetWidth.return_value = int(0.2 * 1e6)
+    track.GetNetname.return_value = "SIG"
+    footprint = Mock()
+    footprint.GetReference.return_value = "R1"
+    footprint.GetValue.return_value = "10k"
+    footprint.GetPosition.return_value = _point(1, 1)
+    footprint.GetOrientationDegrees.return_value = 0.0
+    footprint.GetLayer.return_value = 0
+    footprint.Pads.return_value = []
+    footprint.GetFPID.return_value.GetUniStringLibId.return_value = fpid
+    footprint.GetBoundingBox.return_value = _bounding_box(0, 0, courtyard, courtyard)
+    board = Mock()
+    board.GetTracks.return_value = [track]
+    board.GetVias.return_value = []
+    board.GetFootprints.return_value = [footprint]
+    board.Zones.return_value = []
+    board.GetCopperLayerCount.return_value = 2
+    board.GetLayerName.side_effect = lambda layer: f"L{layer}"
+    return board
+
+
+@dataclass
+class _Config:
+    frequency: float = 1000.0
+
+
+class _CountingAnalyzer(BaseAnalyzer[Mock]):
+    """Analyzer that counts how often it actually runs."""
+
+    def __init__(self, cache, config=None):
+        super().__init__()
+        self.analysis_cache = cache
+        self.config = config or _Config()
+        self.runs = 0
+
+    @cached_analysis(version="1")
+    def analyze_board(self, board):
+        self.runs += 1
+        return AnalysisResult(
+            success=True,
+            analysis_type=AnalysisType.CROSSTALK_ANALYSIS,
+            data={"R1": {"coupling": np.linspace(0.0, 1.0, 5), "peak": 0.5}},
+            metrics={"pairs": 1}
+        )
+
+    def _perform_analysis(self, target, analysis_type):
+        return self.analyze_board(target)
+
+    def _validate_target(self, target):
+        return AnalysisResult(success=True)
+
+
+class TestAnalysisCache(unittest.TestCase):
+    """Test cases for AnalysisCache."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.cache = AnalysisCache(self._directory.name)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_round_trip(self):
+        """Test that results with arrays come back without pickle."""
+        result = AnalysisResult(success=True,
+                                data={"matrix": np.eye(3), "gain": 1.5 + 2j, "nets": ["A", "B"]},
+                                warnings=["close"])
+        self.assertTrue(self.cache.put("k", result))
+        loaded = self.cache.get("k")
+        self.assertIsInstance(loaded, AnalysisResult)
+        np.testing.assert_array_equal(loaded.data["matrix"], np.eye(3))
+        self.assertEqual(loaded.data["gain"], 1.5 + 2j)
+        self.assertEqual(loaded.data["nets"], ["A", "B"])
+        self.assertEqual(loaded.warnings, ["close"])
+        self.assertEqual(loaded.timestamp, result.timestamp)
+
+        # Values that cannot be restored exactly are not stored
+        self.assertFalse(self.cache.put("obj", {"config": _Config()}))
+        self.assertIsNone(self.cache.get("obj"))
+
+    def test_size_bound_evicts_least_recently_used(self):
+        """Test that the oldest unused entries are pruned first."""
+        data = {"values": np.zeros(1000)}
+        for key in ("a", "b"):
+            self.cache.put(key, data)
+        entry_size = os.path.getsize(os.path.join(self.cache.cache_dir, "a.npz"))
+        self.cache.max_bytes = 2 * entry_size + entry_size // 2
+        past = time.time() - 100
+        os.utime(os.path.join(self.cache.cache_dir, "a.npz"), (past, past))
+        os.utime(os.path.join(self.cache.cache_dir, "b.npz"), (past - 10, past - 10))
+        self.cache.get("b")  # b becomes the most recently used
+
+        self.cache.put("c", data)
+        self.assertIsNone(self.cache.get("a"))
+        self.assertIsNotNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("c"))
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+
+class TestCachedAnalysis(unittest.TestCase):
+    """Test cases for the cached_analysis decorator."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.cache = AnalysisCache(self._directory.name)
+        # The CLI enables the shared cache; do not depend on test order
+        configure_analysis_cache(enabled=False)
+
+    def tearDown(self):
+        configure_analysis_cache(enabled=False)
+        self._directory.cleanup()
+
+    def test_hits_on_unchanged_board(self):
+        """Test hits across analyzer instances and misses after edits or config changes."""
+        first = _CountingAnalyzer(self.cache)
+        result = first.analyze_board(_mock_board())
+        self.assertEqual(first.runs, 1)
+
+        second = _CountingAnalyzer(self.cache)
+        cached = second.analyze_board(_mock_board())
+        self.assertEqual(second.runs, 0)
+        np.testing.assert_array_equal(cached.data["R1"]["coupling"], result.data["R1"]["coupling"])
+        self.assertEqual(cached.metrics, {"pairs": 1})
+
+        second.analyze_board(_mock_board(track_end=4.0))
+        self.assertEqual(second.runs, 1)
+        _CountingAnalyzer(self.cache, _Config(frequency=10e3)).analyze_board(_mock_board())
+        self.assertEqual(self.cache.stats()["entries"], 3)
+
+    def test_footprint_library_and_outline_change_key(self):
+        """Test that swapping a footprint or resizing it misses the cache."""
+        analyzer = _CountingAnalyzer(self.cache)
+        analyzer.analyze_board(_mock_board())
+        analyzer.analyze_board(_mock_board(fpid="Resistor_SMD:R_1206"))
+        analyzer.analyze_board(_mock_board(courtyard=4.0))
+        self.assertEqual(analyzer.runs, 3)
+        analyzer.analyze_board(_mock_board())
+        self.assertEqual(analyzer.runs, 3)
+
+    def test_shared_cache_and_opt_out(self):
+        """Test that None uses the shared cache and NO_ANALYSIS_CACHE opts out."""
+        configure_analysis_cache(os.path.join(self._directory.name, "shared"))
+        shared = _CountingAnalyzer(None)
+        shared.analyze_board(_mock_board())
+        shared.analyze_board(_mock_board())
+        self.assertEqual(shared.runs, 1)
+
+        opted_out = _CountingAnalyzer(NO_ANALYSIS_CACHE)
+        opted_out.analyze_board(_mock_board())
+        opted_out.analyze_board(_mock_board())
+        self.assertEqual(opted_out.runs, 2)
+
+    def test_disabled_without_cache(self):
+        """Test that analyzers without a cache always run."""
+        analyzer = _CountingAnalyzer(None)
+        analyzer.analyze_board(_mock_board())
+        analyzer.analyze_board(_mock_board())
+        self.assertEqual(analyzer.runs, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Unit tests for the rasterized congestion map."""
+import random
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+
+from kicad_pcb_generator.core.board.congestion_map import CongestionMap
+
+
+def _mock_track(x1, y1, x2, y2, layer=0, width=0.2, uuid=None):
+    """Create a mock track with coordinates in mm."""
+    track = Mock()
+    track.GetStart.return_value = Mock(x=int(x1 * 1e6), y=int(y1 * 1e6))
+    track.GetEnd.return_value = Mock(x=int(x2 * 1e6), y=int(y2 * 1e6))
+    track.GetLayer.return_value = layer
+    track.GetWidth.return_value = int(width * 1e6)
+    track.IsTrack.return_value = True
+    track.Type.return_value = "track"
+    if uuid is not None:
+        track.m_Uuid.AsString.return_value = uuid
+    return track
+
+
+class TestCongestionMap(unittest.TestCase):
+    """Test cases for CongestionMap."""
+
+    def test_long_track_counts_every_crossed_cell(self):
+        """Test that a track crossing cells without an endpoint in them is counted."""
+        congestion = CongestionMap((0, 0, 100, 100), cell_size=10.0)
+        congestion.add_segment("diag", 5, 5, 95, 95, 0.2, 0)
+
+        counts = congestion.counts()
+        self.assertEqual(int(counts.sum()), 10)
+        self.assertTrue(all(counts[i, i] == 1 for i in range(10)))
+        self.assertAlmostEqual(congestion.occupancy.sum(), 90 * np.sqrt(2) * 0.2)
+
+    def test_lengths_match_sampled_segment(self):
+        """Test per-cell lengths against dense sampling along random segments."""
+        rng = random.Random(7)
+        for _ in range(50):
+            x1, y1, x2, y2 = (rng.uniform(-5, 55) for _ in range(4))
+            congestion = CongestionMap((0, 0, 50, 50), cell_size=3.0)
+            congestion.add_segment(0, x1, y1, x2, y2, 1.0, 0)
+
+            t = (np.arange(20000) + 0.5) / 20000
+            xs, ys = x1 + t * (x2 - x1), y1 + t * (y2 - y1)
+            inside = (xs >= 0) & (xs < congestion.cols * 3.0) & (ys >= 0) & (ys < congestion.rows * 3.0)
+            expected = np.zeros((congestion.rows, congestion.cols))
+            np.add.at(expected, ((ys[inside] // 3).astype(int), (xs[inside] // 3).astype(int)),
+                      np.hypot(x2 - x1, y2 - y1) / t.size)
+            np.testing.assert_allclose(congestion.occupancy[0], expected, atol=0.01)
+
+    def test_per_layer_planes(self):
+        """Test that occupancy is accumulated per layer."""
+        congestion = CongestionMap((0, 0, 20, 20), cell_size=10.0)
+        congestion.add_segment("top", 1, 1, 9, 1, 0.5, 0)
+        congestion.add_segment("bottom", 1, 2, 9, 2, 0.5, 31)
+
+        self.assertEqual(congestion.layers, [0, 31])
+        self.assertEqual(int(congestion.counts(0)[0, 0]), 1)
+        self.assertEqual(int(congestion.counts(31)[0, 0]), 1)
+        self.assertEqual(int(congestion.counts()[0, 0]), 2)
+        self.assertEqual(int(congestion.counts(5).sum()), 0)
+
+    def test_sync_tracks_updates_incrementally(self):
+        """Test that moved and removed tracks are updated in place."""
+        congestion = CongestionMap((0, 0, 100, 100), cell_size=10.0)
+        a = _mock_track(5, 5, 95, 5, uuid="a")
+        b = _mock_track(5, 15, 95, 15, uuid="b")
+        self.assertEqual(congestion.sync_tracks([a, b]), 2)
+        self.assertEqual(congestion.sync_tracks([a, b]), 0)
+
+        moved = _mock_track(5, 55, 95, 55, uuid="b")
+        self.assertEqual(congestion.sync_tracks([a, moved]), 1)
+        counts = congestion.counts()
+        self.assertEqual(int(counts[1].sum()), 0)
+        self.assertEqual(int(counts[5].sum()), 10)
+
+        self.assertEqual(congestion.sync_tracks([moved]), 1)
+        self.assertEqual(int(congestion.counts()[0].sum()), 0)
+        self.assertEqual(len(congestion), 1)
+
+    def test_hotspots_and_sample(self):
+        """Test hotspot reporting and cost field sampling."""
+        congestion = CongestionMap((0, 0, 50, 50), cell_size=10.0)
+        for i in range(7):
+            congestion.add_segment(i, 0, 20.5 + i, 50, 20.5 + i, 1.0, 0)
+
+        hotspots = congestion.hotspots(5)
+        self.assertEqual(len(hotspots), 5)
+        self.assertEqual({h["y"] for h in hotspots}, {20.0})
+        self.assertTrue(all(h["track_count"] == 7 for h in hotspots))
+
+        costs = congestion.sample([25.0, 25.0, -10.0], [25.0, 5.0, 25.0])
+        self.assertAlmostEqual(float(costs[0]), 70.0 / 100.0 / 0.5, places=5)
+        self.assertEqual(float(costs[1]), 0.0)
+        self.assertEqual(float(costs[2]), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
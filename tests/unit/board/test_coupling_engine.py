@@ -0,0 +1,72 @@
+"""Unit tests for the coupling-matrix engine."""
+import unittest
+
+import numpy as np
+
+from kicad_pcb_generator.core.analysis.coupling_engine import (
+    CouplingMatrixEngine,
+    FootprintGeometry,
+    band_center_frequencies
+)
+
+
+def _geometry(points):
+    """Build geometry for 1 x 2 mm footprints at the given (x, y) mm positions."""
+    points = np.asarray(points, dtype=float)
+    return FootprintGeometry(
+        references=[f"U{i + 1}" for i in range(len(points))],
+        values=[""] * len(points),
+        footprint_names=[""] * len(points),
+        x=points[:, 0],
+        y=points[:, 1],
+        width=np.ones(len(points)),
+        height=np.full(len(points), 2.0)
+    )
+
+
+class TestCouplingMatrixEngine(unittest.TestCase):
+    """Test cases for CouplingMatrixEngine."""
+
+    def setUp(self):
+        self.engine = CouplingMatrixEngine(_geometry([(0, 0), (3, 4), (20, 0), (0, 0)]))
+
+    def test_pairs_match_brute_force(self):
+        """Test that cutoff pairs match an all-pairs walk."""
+        rng = np.random.default_rng(1)
+        engine = CouplingMatrixEngine(_geometry(rng.uniform(0, 50, size=(60, 2))))
+        pairs = engine.pairs(8.0)
+        found = set(zip(pairs.i.tolist(), pairs.j.tolist()))
+
+        x, y = engine.geometry.x, engine.geometry.y
+        expected = {
+            (a, b) for a in range(60) for b in range(60)
+            if a != b and np.hypot(x[a] - x[b], y[a] - y[b]) < 8.0
+        }
+        self.assertEqual(found, expected)
+
+    def test_coincident_pairs(self):
+        """Test that coincident footprints can be left out."""
+        self.assertEqual(len(self.engine.pairs(10.0)), 6)
+        pairs = self.engine.pairs(10.0, include_coincident=False)
+        self.assertEqual(len(pairs), 4)
+        self.assertTrue(np.all(pairs.distance > 0))
+
+    def test_reductions(self):
+        """Test per-component sums, maxima and neighbour maps."""
+        pairs = self.engine.pairs(10.0, include_coincident=False)
+        values = 1.0 / pairs.distance
+        np.testing.assert_allclose(self.engine.sum_by_component(pairs, values), [0.2, 0.4, 0.0, 0.2])
+        stacked = self.engine.max_by_component(pairs, np.vstack((values, 2 * values)))
+        np.testing.assert_allclose(stacked[1], [0.4, 0.4, 0.0, 0.4])
+        self.assertEqual(self.engine.neighbour_values(pairs, values)[1], {"U1": 0.2, "U4": 0.2})
+        self.assertEqual(self.engine.index_of("U3"), 2)
+        self.assertEqual(self.engine.index_of("R1"), -1)
+
+    def test_band_centers(self):
+        """Test geometric band center frequencies."""
+        np.testing.assert_allclose(band_center_frequencies([(20, 20000), (10, 1000)]),
+                                   [np.sqrt(20 * 20000), 100.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
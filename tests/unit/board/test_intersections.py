@@ -0,0 +1,84 @@
+"""Unit tests for segment intersection and copper loop detection."""
+import random
+import unittest
+
+import numpy as np
+
+from kicad_pcb_generator.core.board.intersections import (
+    find_loops,
+    segment_intersections,
+    segments_intersect
+)
+
+
+class TestSegmentIntersections(unittest.TestCase):
+    """Test cases for segment_intersections."""
+
+    def test_matches_brute_force(self):
+        """Test the bucketed search against an all-pairs exact test."""
+        rng = random.Random(3)
+        for _ in range(20):
+            segments = []
+            for _ in range(rng.randint(2, 120)):
+                x, y = rng.randint(0, 40), rng.randint(0, 40)
+                if rng.random() < 0.5:
+                    segments.append((x, y, x + rng.randint(-8, 8), y))
+                else:
+                    segments.append((x, y, rng.randint(0, 40), rng.randint(0, 40)))
+            coords = np.array(segments)
+            layers = np.array([rng.randint(0, 1) for _ in segments])
+
+            found = segment_intersections(coords[:, 0], coords[:, 1], coords[:, 2], coords[:, 3],
+                                          layers=layers, include_shared_endpoints=True,
+                                          cell_size=rng.choice([None, 3, 50]))
+            expected = {(i, j) for i in range(len(segments)) for j in range(i + 1, len(segments))
+                        if layers[i] == layers[j] and segments_intersect(segments[i], segments[j])}
+            self.assertEqual(set(map(tuple, found.tolist())), expected)
+
+    def test_bounding_box_overlap_is_not_a_crossing(self):
+        """Test that parallel diagonal tracks with overlapping boxes do not cross."""
+        found = segment_intersections([0, 0], [0, 1_000_000], [10_000_000, 10_000_000], [10_000_000, 11_000_000])
+        self.assertEqual(len(found), 0)
+
+    def test_shared_endpoints_and_nets(self):
+        """Test that connected segments and same-net crossings are skipped."""
+        x1, y1, x2, y2 = [0, 10, 0, 0], [0, 0, 0, -5], [10, 20, 10, 20], [0, 0, 0, 5]
+        found = segment_intersections(x1, y1, x2, y2)
+        # 0-1 only touch at an endpoint; 0-2 overlap; 3 crosses 0 and 2 and touches 1
+        self.assertEqual(found.tolist(), [[0, 2], [0, 3], [1, 3], [2, 3]])
+
+        found = segment_intersections(x1, y1, x2, y2, nets=[1, 1, 1, 2])
+        self.assertEqual(found.tolist(), [[0, 3], [1, 3], [2, 3]])
+
+
+class TestFindLoops(unittest.TestCase):
+    """Test cases for find_loops."""
+
+    def test_closed_and_open_paths(self):
+        """Test a square loop against the same path left open."""
+        square = [(0, 0, 10, 0, 0), (10, 0, 10, 10, 0), (10, 10, 0, 10, 0), (0, 10, 0, 0, 0)]
+        self.assertEqual(find_loops(square).loop_count, 1)
+        self.assertEqual(find_loops(square[:3]).loop_count, 0)
+
+    def test_t_junctions_vias_and_zones(self):
+        """Test loops closed through a T-junction, vias between layers and a zone."""
+        tracks = [(0, 0, 20, 0, 0), (10, 0, 10, 10, 0), (10, 10, 20, 10, 31), (20, 10, 20, 0, 31)]
+        self.assertEqual(find_loops(tracks).loop_count, 0)
+        report = find_loops(tracks, vias=[(20, 0, 1), (10, 10, 1)])
+        self.assertEqual(report.loop_count, 1)
+        self.assertEqual(report.closing_edges[0][0], "via")
+
+        stub = [(0, 0, 10, 0, 0), (10, 0, 10, 5, 0)]
+        self.assertEqual(find_loops(stub, zones=[(0, -1, -1, 11, 1)]).loop_count, 1)
+        self.assertEqual(find_loops(stub, zones=[(31, -1, -1, 11, 1)]).loop_count, 0)
+
+    def test_long_chain_does_not_recurse(self):
+        """Test a ground net far deeper than the recursion limit."""
+        chain = [(i, 0, i + 1, 0, 0) for i in range(20000)]
+        chain.append((20000, 0, 0, 0, 31))
+        self.assertEqual(find_loops(chain).loop_count, 0)
+        self.assertEqual(find_loops(chain, vias=[(0, 0, 0), (20000, 0, 0)]).loop_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Unit tests for running AnalysisManager families in worker processes."""
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock, Mock, patch
+
+from kicad_pcb_generator.analysis import analysis_manager
+from kicad_pcb_generator.analysis.analysis_manager import ANALYSIS_FAMILIES, AnalysisManager
+from kicad_pcb_generator.config.analysis_manager_config import AnalysisManagerConfig
+from kicad_pcb_generator.core.board.snapshot import BoardSnapshot
+
+
+def _point(x, y):
+    return Mock(x=int(x * 1e6), y=int(y * 1e6))
+
+
+def _mock_track(x1, y1, x2, y2, width=0.2, net="SIG"):
+    """Create a mock track with coordinates in mm."""
+    track = Mock()
+    track.GetStart.return_value = _point(x1, y1)
+    track.GetEnd.return_value = _point(x2, y2)
+    track.GetLayer.return_value = 0
+    track.GetWidth.return_value = int(width * 1e6)
+    track.GetNetname.return_value = net
+    return track
+
+
+def _mock_board():
+    """Create a mock board with parallel signal and power tracks."""
+    footprint = Mock()
+    footprint.GetReference.return_value = "U1"
+    footprint.GetValue.return_value = "OPA1612"
+    footprint.GetPosition.return_value = _point(5, 5)
+    footprint.GetOrientationDegrees.return_value = 0.0
+    footprint.GetLayer.return_value = 0
+    footprint.Pads.return_value = []
+    board = Mock()
+    board.GetTracks.return_value = [
+        _mock_track(0, 0, 80, 0, net="AUDIO_IN"),
+        _mock_track(0, 0.5, 80, 0.5, net="AUDIO_OUT"),
+        _mock_track(0, 10, 120, 10, width=0.3, net="VCC"),
+    ]
+    board.GetVias.return_value = []
+    board.GetFootprints.return_value = [footprint]
+    board.Zones.return_value = []
+    board.GetCopperLayerCount.return_value = 2
+    return board
+
+
+class TestParallelAnalysis(unittest.TestCase):
+    """Test cases for AnalysisManager.run_all_analysis(parallel=True)."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        snapshot = BoardSnapshot.from_board(_mock_board())
+        config = AnalysisManagerConfig()
+        configs = {
+            "signal_config": config.get_signal_integrity_config(),
+            "thermal_config": config.get_thermal_config(),
+            "emi_config": config.get_emi_config(),
+            "power_config": config.get_power_distribution_config(),
+            "audio_config": config.get_audio_performance_config(),
+            "units_config": config.get_units_config()
+        }
+        self.assertEqual(set(configs), set(analysis_manager._CONFIG_ATTRIBUTES))
+        self.manager = AnalysisManager._for_snapshot(snapshot, configs)
+        self.serial = self.manager.run_all_analysis()
+
+        # The comparisons below are only meaningful if families produce findings
+        succeeded = [
+            analysis_type for analysis_type, results in self.serial.items()
+            if results and all(result.severity != "error" for result in results)
+        ]
+        self.assertTrue(succeeded, f"every analysis family failed: {self.serial}")
+
+    def test_process_pool_matches_serial(self):
+        """Test that worker processes return the serial results."""
+        with patch.object(analysis_manager, "ProcessPoolExecutor",
+                          wraps=analysis_manager.ProcessPoolExecutor) as pool:
+            results = self.manager.run_all_analysis(parallel=True, max_workers=2)
+
+        pool.assert_called_once()
+        self.assertEqual(pool.call_args.kwargs["max_workers"], 2)
+        self.assertIs(pool.call_args.kwargs["initializer"], analysis_manager._init_analysis_worker)
+        self.assertEqual(list(results), list(ANALYSIS_FAMILIES))
+        self.assertEqual(results, self.serial)
+
+    def test_broken_pool_falls_back_to_serial(self):
+        """Test that a pool whose workers die falls back to the serial path."""
+        pool = MagicMock()
+        future = pool.__enter__.return_value.submit.return_value
+        future.result.side_effect = BrokenProcessPool("worker died")
+        with patch.object(analysis_manager, "ProcessPoolExecutor", return_value=pool):
+            results = self.manager.run_all_analysis(parallel=True)
+        self.assertEqual(results, self.serial)
+
+    def test_pool_start_failure_falls_back_to_serial(self):
+        """Test that an OSError starting the pool falls back to the serial path."""
+        with patch.object(analysis_manager, "ProcessPoolExecutor", side_effect=OSError("no fork")):
+            results = self.manager.run_all_analysis(parallel=True)
+        self.assertEqual(results, self.serial)
+
+    def test_unpicklable_state_runs_serially(self):
+        """Test that config sections that cannot be pickled skip the pool."""
+        self.manager.units_config = lambda value: value
+        with patch.object(analysis_manager, "ProcessPoolExecutor") as pool:
+            results = self.manager.run_all_analysis(parallel=True)
+        pool.assert_not_called()
+        self.assertEqual(results, self.serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
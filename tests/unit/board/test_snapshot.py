@@ -0,0 +1,137 @@
+"""Unit tests for the board snapshot."""
+import pickle
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+
+from kicad_pcb_generator.core.board.snapshot import BoardSnapshot
+from kicad_pcb_generator.core.board.spatial_index import ITEM_TRACK, ITEM_FOOTPRINT
+
+
+def _point(x, y):
+    return Mock(x=int(x * 1e6), y=int(y * 1e6))
+
+
+def _mock_track(x1, y1, x2, y2, layer=0, width=0.2, net="SIG"):
+    """Create a mock track with coordinates in mm."""
+    track = Mock()
+    track.GetStart.return_value = _point(x1, y1)
+    track.GetEnd.return_value = _point(x2, y2)
+    track.GetLayer.return_value = layer
+    track.GetWidth.return_value = int(width * 1e6)
+    track.GetNetname.return_value = net
+    return track
+
+
+def _mock_footprint(ref, x, y, pads):
+    """Create a mock footprint with (net, size_mm) pads."""
+    footprint = Mock()
+    footprint.GetReference.return_value = ref
+    footprint.GetValue.return_value = "10k"
+    footprint.GetPosition.return_value = _point(x, y)
+    footprint.GetOrientationDegrees.return_value = 90.0
+    footprint.GetLayer.return_value = 0
+    pad_mocks = []
+    for number, (net, size) in enumerate(pads, start=1):
+        pad = Mock()
+        pad.GetPosition.return_value = _point(x, y)
+        pad.GetSize.return_value = _point(size, size)
+        pad.GetNetname.return_value = net
+        pad.GetNumber.return_value = str(number)
+        pad.GetShape.return_value = 1
+        pad_mocks.append(pad)
+    footprint.Pads.return_value = pad_mocks
+    return footprint
+
+
+def _mock_board():
+    board = Mock()
+    board.GetTracks.return_value = [
+        _mock_track(0, 0, 3, 4, net="GND"),
+        _mock_track(10, 0, 20, 0, layer=31, width=0.5, net="VCC"),
+    ]
+    via = Mock()
+    via.GetPosition.return_value = _point(3, 4)
+    via.GetWidth.return_value = int(0.6 * 1e6)
+    via.GetDrill.return_value = int(0.3 * 1e6)
+    via.GetLayer.return_value = 0
+    via.GetNetname.return_value = "GND"
+    board.GetVias.return_value = [via]
+    board.GetFootprints.return_value = [
+        _mock_footprint("R1", 0, 0, [("GND", 1.0), ("SIG", 1.0)]),
+        _mock_footprint("U1", 5, 0, [("VCC", 3.0)]),
+    ]
+    board.Zones.return_value = []
+    board.GetCopperLayerCount.return_value = 2
+    return board
+
+
+class TestBoardSnapshot(unittest.TestCase):
+    """Test cases for BoardSnapshot."""
+
+    def setUp(self):
+        self.snapshot = BoardSnapshot.from_board(_mock_board())
+
+    def test_tracks(self):
+        """Test track arrays and derived lengths."""
+        tracks = self.snapshot.tracks
+        self.assertEqual(len(tracks), 2)
+        self.assertEqual(tracks.end_x.tolist(), [3000000, 20000000])
+        self.assertEqual(tracks.layer.tolist(), [0, 31])
+        np.testing.assert_allclose(self.snapshot.track_lengths_mm(), [5.0, 10.0])
+
+    def test_net_interning(self):
+        """Test that all item kinds share interned net ids."""
+        gnd = self.snapshot.net_id("GND")
+        self.assertGreater(gnd, 0)
+        self.assertEqual(self.snapshot.tracks.net[0], gnd)
+        self.assertEqual(self.snapshot.vias.net[0], gnd)
+        self.assertEqual(self.snapshot.pads.net[0], gnd)
+        self.assertEqual(self.snapshot.net_name(gnd), "GND")
+        self.assertEqual(self.snapshot.net_id("MISSING"), -1)
+
+        power = np.isin(self.snapshot.tracks.net, self.snapshot.net_ids_with_prefix(("VCC", "GND")))
+        self.assertTrue(power.all())
+
+    def test_footprint_pads(self):
+        """Test footprint to pad offsets and per-footprint pad sizes."""
+        footprints = self.snapshot.footprints
+        self.assertEqual(footprints.reference, ["R1", "U1"])
+        self.assertEqual(footprints.pad_offset.tolist(), [0, 2, 3])
+        self.assertEqual(self.snapshot.pads.number, ["1", "2", "1"])
+        self.assertEqual(self.snapshot.footprint_pad_max_size().tolist(), [1000000, 3000000])
+        self.assertEqual(self.snapshot.footprint_index("U1"), 1)
+
+    def test_footprint_boxes_fall_back_to_pads(self):
+        """Test that footprints without a usable bounding box span their pads."""
+        footprints = self.snapshot.footprints
+        self.assertEqual(footprints.left.tolist(), [-500000, 3500000])
+        self.assertEqual(footprints.right.tolist(), [500000, 6500000])
+        self.assertEqual(footprints.top.tolist(), [-500000, -1500000])
+        self.assertEqual(footprints.fpid, ["", ""])
+
+    def test_spatial_index(self):
+        """Test building a spatial index from the snapshot."""
+        index = self.snapshot.spatial_index(kinds=(ITEM_TRACK, ITEM_FOOTPRINT))
+        self.assertIs(index, self.snapshot.spatial_index(kinds=(ITEM_FOOTPRINT, ITEM_TRACK)))
+        found = index.query_point(5.0, 0.0, 0.5, kinds=(ITEM_FOOTPRINT,))
+        self.assertEqual([item.row for item, _ in found], [1])
+        self.assertEqual(index.items[1].net, "VCC")
+
+    def test_pickle_round_trip(self):
+        """Test that a snapshot can be sent to worker processes."""
+        board = _mock_board()
+        board.GetDesignSettings.return_value.GetViasDimensions.return_value = Mock()
+        snapshot = BoardSnapshot.from_board(board, keep_objects=True)
+        snapshot.spatial_index()
+
+        restored = pickle.loads(pickle.dumps(snapshot))
+        self.assertIsNone(restored.tracks.objects)
+        self.assertEqual(restored.tracks.end_x.tolist(), [3000000, 20000000])
+        self.assertEqual(restored.net_id("VCC"), snapshot.net_id("VCC"))
+        self.assertNotIn("via_diameter", restored.design_rules)
+
+
+if __name__ == '__main__':
+    unittest.main()
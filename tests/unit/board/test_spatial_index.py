@@ -0,0 +1,132 @@
+"""Unit tests for the board spatial index."""
+import math
+import random
+import unittest
+from unittest.mock import Mock
+
+from kicad_pcb_generator.core.board.spatial_index import (
+    BoardSpatialIndex,
+    ALL_LAYERS,
+    ITEM_TRACK,
+    ITEM_FOOTPRINT,
+    segment_distance
+)
+
+
+def _mock_track(x1, y1, x2, y2, layer=0, width=0.2, net="SIG"):
+    """Create a mock track with coordinates in mm."""
+    track = Mock()
+    track.GetStart.return_value = Mock(x=int(x1 * 1e6), y=int(y1 * 1e6))
+    track.GetEnd.return_value = Mock(x=int(x2 * 1e6), y=int(y2 * 1e6))
+    track.GetLayer.return_value = layer
+    track.GetWidth.return_value = int(width * 1e6)
+    track.GetNetname.return_value = net
+    return track
+
+
+def _mock_box(left, top, right, bottom):
+    """Create a mock bounding box with edges in nm."""
+    return Mock(GetLeft=Mock(return_value=left), GetTop=Mock(return_value=top),
+                GetRight=Mock(return_value=right), GetBottom=Mock(return_value=bottom))
+
+
+class TestBoardSpatialIndex(unittest.TestCase):
+    """Test cases for BoardSpatialIndex."""
+
+    def test_segment_distance(self):
+        """Test segment distance for crossing, parallel and collinear segments."""
+        self.assertEqual(segment_distance(0, 0, 10, 10, 0, 10, 10, 0), 0.0)
+        self.assertAlmostEqual(segment_distance(0, 0, 10, 0, 0, 1, 10, 1), 1.0)
+        self.assertAlmostEqual(segment_distance(0, 0, 1, 0, 3, 0, 4, 0), 2.0)
+
+    def test_query_segment_respects_layer(self):
+        """Test that queries only return items on the requested layer."""
+        index = BoardSpatialIndex(cell_size=1.0)
+        near_same = index.add_track(_mock_track(0, 1, 10, 1, layer=0))
+        index.add_track(_mock_track(0, 1, 10, 1, layer=31))
+        index.add_track(_mock_track(0, 50, 10, 50, layer=0))
+
+        found = index.query_segment(0, 0, 10, 0, 2.0, layer=0, kinds=(ITEM_TRACK,))
+        self.assertEqual([item.index for item, _ in found], [near_same.index])
+
+        found_all_layers = index.query_segment(0, 0, 10, 0, 2.0, kinds=(ITEM_TRACK,))
+        self.assertEqual(len(found_all_layers), 2)
+
+    def test_all_layer_items_match_any_layer(self):
+        """Test that items on ALL_LAYERS are found by single-layer queries."""
+        index = BoardSpatialIndex()
+        index.add(ITEM_FOOTPRINT, ALL_LAYERS, 5.0, 5.0, 5.0, 5.0)
+        found = index.query_point(5.5, 5.0, 1.0, layer=0)
+        self.assertEqual(len(found), 1)
+        self.assertAlmostEqual(found[0][1], 0.5)
+
+    def test_close_pairs_matches_brute_force(self):
+        """Test close_pairs against an all-pairs scan."""
+        rng = random.Random(42)
+        index = BoardSpatialIndex(cell_size=2.0)
+        for _ in range(200):
+            x, y = rng.uniform(0, 100), rng.uniform(0, 100)
+            index.add(ITEM_TRACK, rng.choice([0, 31]), x, y,
+                      x + rng.uniform(-5, 5), y + rng.uniform(-5, 5))
+
+        expected = set()
+        items = index.items
+        for i, a in enumerate(items):
+            for b in items[i + 1:]:
+                if a.layer != b.layer:
+                    continue
+                d = segment_distance(a.x1, a.y1, a.x2, a.y2, b.x1, b.y1, b.x2, b.y2)
+                if d < 1.5:
+                    expected.add((a.index, b.index))
+
+        actual = {(a.index, b.index) for a, b, _ in index.close_pairs(1.5)}
+        self.assertEqual(actual, expected)
+
+    def test_nearest(self):
+        """Test nearest-neighbour lookup with exclusion."""
+        index = BoardSpatialIndex(cell_size=1.0)
+        first = Mock()
+        second = Mock()
+        index.add(ITEM_FOOTPRINT, ALL_LAYERS, 0.0, 0.0, 0.0, 0.0, obj=first)
+        index.add(ITEM_FOOTPRINT, ALL_LAYERS, 30.0, 40.0, 30.0, 40.0, obj=second)
+
+        item, distance = index.nearest(0.0, 0.0, kinds=(ITEM_FOOTPRINT,), exclude=first)
+        self.assertIs(item.obj, second)
+        self.assertAlmostEqual(distance, 50.0)
+        self.assertIsNone(BoardSpatialIndex().nearest(0.0, 0.0))
+
+    def test_from_board(self):
+        """Test building an index from a board."""
+        board = Mock()
+        track = _mock_track(0, 0, 10, 0)
+        footprint = Mock()
+        footprint.GetPosition.return_value = Mock(x=0, y=0)
+        footprint.GetBoundingBox.return_value = _mock_box(-1e6, 0, 1e6, 0)
+        board.GetTracks.return_value = [track]
+        board.GetFootprints.return_value = [footprint]
+
+        index = BoardSpatialIndex.from_board(board, kinds=(ITEM_TRACK, ITEM_FOOTPRINT))
+        self.assertEqual(len(index), 2)
+        self.assertAlmostEqual(index.get_item(track).half_width, 0.1)
+        self.assertAlmostEqual(index.max_half_width(ITEM_FOOTPRINT), 1.0)
+
+    def test_off_centre_footprint_radius(self):
+        """Test that a footprint anchored at a corner reaches anchors inside its box."""
+        board = Mock()
+        connector = Mock()
+        connector.GetPosition.return_value = Mock(x=0, y=0)
+        connector.GetBoundingBox.return_value = _mock_box(0, 0, 10e6, 6e6)
+        inside = Mock()
+        inside.GetPosition.return_value = Mock(x=9e6, y=5e6)
+        inside.GetBoundingBox.return_value = _mock_box(8.5e6, 4.5e6, 9.5e6, 5.5e6)
+        board.GetFootprints.return_value = [connector, inside]
+
+        index = BoardSpatialIndex.from_board(board, kinds=(ITEM_FOOTPRINT,))
+        self.assertAlmostEqual(index.get_item(connector).half_width, math.hypot(10.0, 6.0))
+        nearby = index.query_point(0.0, 0.0, index.max_half_width(ITEM_FOOTPRINT),
+                                   kinds=(ITEM_FOOTPRINT,))
+        self.assertIn(inside, [item.obj for item, _ in nearby])
+
+
+if __name__ == '__main__':
+    unittest.main()
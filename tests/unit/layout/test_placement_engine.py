@@ -0,0 +1,103 @@
+"""Unit tests for the placement engine."""
+import itertools
+import random
+import unittest
+
+from kicad_pcb_generator.layout.placement_engine import (
+    PlacementEngine,
+    PlacementNet,
+    PlacementProblem,
+)
+
+
+def make_chain(count: int, size: float = 2.0, board: float = 60.0, seed: int = 1) -> PlacementProblem:
+    """Components scattered at random, connected in a chain."""
+    rng = random.Random(seed)
+    return PlacementProblem(
+        references=[f"R{i + 1}" for i in range(count)],
+        x=[rng.uniform(size, board - size) for _ in range(count)],
+        y=[rng.uniform(size, board - size) for _ in range(count)],
+        width=[size] * count,
+        height=[size] * count,
+        bounds=(0.0, 0.0, board, board),
+        nets=[PlacementNet(members=[i, i + 1], name=f"N{i}") for i in range(count - 1)]
+    )
+
+
+def rects(problem: PlacementProblem, positions):
+    for i, reference in enumerate(problem.references):
+        x, y = positions[reference]
+        yield (x - problem.width[i] / 2, y - problem.height[i] / 2,
+               x + problem.width[i] / 2, y + problem.height[i] / 2)
+
+
+def overlaps(a, b) -> bool:
+    eps = 1e-9
+    return a[0] < b[2] - eps and b[0] < a[2] - eps and a[1] < b[3] - eps and b[1] < a[3] - eps
+
+
+class TestPlacementEngine(unittest.TestCase):
+    """Test cases for PlacementEngine."""
+
+    def test_legal_placement(self):
+        """Test that placed components stay on the board without overlapping."""
+        problem = make_chain(40)
+        result = PlacementEngine(problem, grid_size=0.5).run(time_limit=5.0)
+
+        self.assertEqual(result.unplaced, [])
+        boxes = list(rects(problem, result.positions))
+        for box in boxes:
+            self.assertGreaterEqual(box[0], 0.0)
+            self.assertGreaterEqual(box[1], 0.0)
+            self.assertLessEqual(box[2], 60.0)
+            self.assertLessEqual(box[3], 60.0)
+        for a, b in itertools.combinations(boxes, 2):
+            self.assertFalse(overlaps(a, b))
+
+    def test_wirelength_reduced(self):
+        """Test that seeding and annealing shorten a scattered chain."""
+        problem = make_chain(40)
+        result = PlacementEngine(problem, grid_size=0.5).run(time_limit=5.0)
+
+        self.assertLess(result.final_wirelength, result.initial_wirelength * 0.5)
+        self.assertGreater(result.accepted, 0)
+        self.assertLessEqual(result.moves, 200 * 40 + 50)
+
+    def test_fixed_components_and_keepouts(self):
+        """Test that fixed components keep their position and keepouts stay empty."""
+        problem = make_chain(20)
+        problem.fixed[0] = True
+        problem.keepouts = [(20.0, 20.0, 40.0, 40.0)]
+        fixed_position = (problem.x[0], problem.y[0])
+        result = PlacementEngine(problem, grid_size=0.5).run(time_limit=5.0)
+
+        self.assertEqual(result.positions["R1"], fixed_position)
+        for box in list(rects(problem, result.positions))[1:]:
+            self.assertFalse(overlaps(box, problem.keepouts[0]))
+
+    def test_best_site(self):
+        """Test that a single component is placed next to its neighbours."""
+        problem = PlacementProblem(
+            references=["U1", "R1", "C1"],
+            x=[10.0, 50.0, 90.0],
+            y=[50.0, 50.0, 90.0],
+            width=[4.0, 2.0, 2.0],
+            height=[4.0, 2.0, 2.0],
+            bounds=(0.0, 0.0, 100.0, 100.0),
+            nets=[PlacementNet(members=[0, 1])],
+            fixed=[True, False, True]
+        )
+        engine = PlacementEngine(problem, grid_size=0.5)
+        engine.legalize(problem.x, problem.y)
+
+        x, y = engine.best_site(1)
+        self.assertLess(abs(x - 10.0), 4.0)
+        self.assertLess(abs(y - 50.0), 4.0)
+
+        # Restricted to an area, the site closest to U1 inside it wins
+        x, y = engine.best_site(1, areas=[(60.0, 0.0, 100.0, 100.0)])
+        self.assertAlmostEqual(x, 61.0, delta=1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Unit tests for the manufacturing job queue."""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from kicad_pcb_generator.core.manufacturing.job_queue import JobQueue, file_fingerprint
+
+
+class TestJobQueue(unittest.TestCase):
+    """Test cases for JobQueue."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.state_file = os.path.join(self.temp_dir, "jobs.json")
+        self.board = os.path.join(self.temp_dir, "board.kicad_pcb")
+        with open(self.board, "w") as f:
+            f.write("(kicad_pcb (version 20211123))")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _job(self, name):
+        """Create a job body that writes one output file."""
+        def run(report_progress):
+            path = os.path.join(self.temp_dir, f"{name}.gbr")
+            with open(path, "w") as f:
+                f.write(name)
+            report_progress(0.5)
+            return {"gerber": path}
+        return run
+
+    def test_runs_jobs_and_reports_status(self):
+        """Test that jobs run on the pool and report every status change."""
+        seen = []
+        lock = threading.Lock()
+
+        def on_status(record):
+            with lock:
+                seen.append((record.job_id, record.status))
+
+        queue = JobQueue(max_workers=2, status_callback=on_status)
+        for name in ("a", "b", "c"):
+            queue.submit(name, "output", self._job(name))
+        records = queue.wait()
+        queue.shutdown()
+
+        self.assertEqual({record.status for record in records.values()}, {"completed"})
+        self.assertEqual(records["a"].progress, 1.0)
+        for name in ("a", "b", "c"):
+            statuses = [status for job_id, status in seen if job_id == name]
+            self.assertEqual(statuses[0], "queued")
+            self.assertIn("processing", statuses)
+            self.assertEqual(statuses[-1], "completed")
+
+    def test_failed_job(self):
+        """Test that an exception marks the job failed."""
+        def fail(report_progress):
+            raise RuntimeError("kikit exited with 1")
+
+        queue = JobQueue()
+        record = queue.submit("bad", "panelization", fail).result()
+        queue.shutdown()
+        self.assertEqual(record.status, "failed")
+        self.assertIn("kikit", record.error_message)
+
+    def test_skips_unchanged_inputs(self):
+        """Test that unchanged fingerprints are skipped across runs."""
+        fingerprint = file_fingerprint(self.board, {"gerber_format": "RS274X"})
+        queue = JobQueue(state_file=self.state_file)
+        queue.submit("a", "output", self._job("a"), fingerprint=fingerprint).result()
+        queue.shutdown()
+
+        fresh = JobQueue(state_file=self.state_file)
+        record = fresh.submit("a", "output", self._job("a"), fingerprint=fingerprint).result()
+        self.assertEqual(record.status, "skipped")
+        self.assertTrue(record.result["gerber"].endswith("a.gbr"))
+
+        with open(self.board, "a") as f:
+            f.write("\n")
+        changed = file_fingerprint(self.board, {"gerber_format": "RS274X"})
+        self.assertNotEqual(changed, fingerprint)
+        record = fresh.submit("a", "output", self._job("a"), fingerprint=changed).result()
+        fresh.shutdown()
+        self.assertEqual(record.status, "completed")
+
+    def test_missing_outputs_are_regenerated(self):
+        """Test that deleted output files force a rerun."""
+        fingerprint = file_fingerprint(self.board)
+        queue = JobQueue()
+        record = queue.submit("a", "output", self._job("a"), fingerprint=fingerprint).result()
+        os.remove(record.result["gerber"])
+        record = queue.submit("a", "output", self._job("a"), fingerprint=fingerprint).result()
+        queue.shutdown()
+        self.assertEqual(record.status, "completed")
+        self.assertEqual(record.attempts, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
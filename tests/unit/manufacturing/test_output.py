@@ -56,6 +56,37 @@ class TestOutputManager(unittest.TestCase):
         self.assertIsInstance(result, dict)
         self.assertTrue(all(os.path.exists(path) for path in result.values()))
 
+    def test_stage_timings(self):
+        """Test that the pipeline loads the board once and times each stage."""
+        config = OutputConfig(
+            generate_gerber=True,
+            generate_bom=True,
+            generate_pick_and_place=True,
+            output_directory=self.temp_dir
+        )
+        
+        self.manager.generate_output(self.test_board, config)
+        
+        timings = self.manager.last_stage_timings
+        self.assertIn("load_board", timings)
+        self.assertIn("total", timings)
+        report = self.manager.get_stage_report()
+        self.assertGreaterEqual(report["total"]["speedup"], 1.0)
+        for name in ("bom", "pick_and_place"):
+            if name in report:
+                self.assertGreaterEqual(report[name]["separate_load_seconds"], report[name]["seconds"])
+
+    def test_stage_timings_argument(self):
+        """Test that timings passed in by a job are not shared through the manager."""
+        config = OutputConfig(generate_bom=True, output_directory=self.temp_dir)
+        self.manager.last_stage_timings = {}
+        
+        timings = {}
+        self.manager.generate_output(self.test_board, config, stage_timings=timings)
+        
+        self.assertIn("total", timings)
+        self.assertEqual(self.manager.last_stage_timings, {})
+
     def test_generate_gerber_files(self):
         """Test Gerber file generation."""
         result = self.manager._generate_gerber_files(self.test_board, self.temp_dir)
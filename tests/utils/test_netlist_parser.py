@@ -1,3 +1,4 @@
+import io
 import json
 from pathlib import Path
 
@@ -5,9 +6,14 @@ import pytest
 
 from kicad_pcb_generator.core.netlist.parser import (
     parse_json_netlist,
+    parse_schematic,
     FootprintData,
+    NetData,
+    Netlist,
     PadConnection,
 )
+from kicad_pcb_generator.core.netlist.schematic import SchematicParser
+from kicad_pcb_generator.core.netlist.sexpr import iter_elements
 
 
 @pytest.fixture()
@@ -50,3 +56,168 @@ def test_parse_json_netlist(tmp_netlist_file: Path):
 
     # Ensure nets parsed
     assert netlist.get_net("GND").connected_pads == ["C1-2"] 
+
+
+_LIB_SYMBOLS = """
+  (lib_symbols
+    (symbol "Device:R" (pin_numbers hide) (in_bom yes) (on_board yes)
+      (symbol "R_0_1" (rectangle (start -1.016 -2.54) (end 1.016 2.54)))
+      (symbol "R_1_1"
+        (pin passive line (at 0 3.81 270) (length 1.27) (name "~" (effects (font (size 1.27 1.27)))) (number "1" (effects (font (size 1.27 1.27)))))
+        (pin passive line (at 0 -3.81 90) (length 1.27) (name "~" (effects (font (size 1.27 1.27)))) (number "2" (effects (font (size 1.27 1.27)))))
+      )
+    )
+    (symbol "power:GND" (power) (pin_names (offset 0)) (in_bom yes) (on_board yes)
+      (property "Value" "GND" (at 0 -3.81 0))
+      (symbol "GND_1_1"
+        (pin power_in line (at 0 0 270) (length 0) hide (name "GND" (effects (font (size 1.27 1.27)))) (number "1"))
+      )
+    )
+  )
+"""
+
+
+def _resistor(ref, x, y, angle=0, instances=""):
+    return f"""
+  (symbol (lib_id "Device:R") (at {x} {y} {angle}) (unit 1) (in_bom yes) (on_board yes)
+    (uuid "{ref}-uuid")
+    (property "Reference" "{ref}" (at 0 0 0))
+    (property "Value" "10k" (at 0 0 0))
+    (property "Footprint" "Resistor_SMD:R_0603" (at 0 0 0))
+    (pin "1" (uuid "a")) (pin "2" (uuid "b"))
+    {instances}
+  )"""
+
+
+def _gnd(x, y, ref="#PWR01"):
+    return f"""
+  (symbol (lib_id "power:GND") (at {x} {y} 0) (unit 1)
+    (property "Reference" "{ref}" (at 0 0 0)) (property "Value" "GND" (at 0 0 0)))"""
+
+
+def _wire(x1, y1, x2, y2):
+    return f"\n  (wire (pts (xy {x1} {y1}) (xy {x2} {y2})) (stroke (width 0) (type default)))"
+
+
+@pytest.fixture()
+def hierarchical_schematic(tmp_path: Path) -> Path:
+    root = tmp_path / "root.kicad_sch"
+    root.write_text(
+        '(kicad_sch (version 20230121) (generator eeschema)\n  (uuid "root-uuid")\n'
+        + _LIB_SYMBOLS
+        + _resistor("R1", 100, 100)
+        + _resistor("R2", 120, 100, angle=90)
+        + _gnd(100, 110)
+        + _wire(100, 103.81, 100, 110)
+        + _wire(100, 90, 100, 96.19)
+        + _wire(110, 100, 116.19, 100)
+        + _wire(123.81, 100, 130, 100)
+        + '\n  (label "IN" (at 100 90 0))\n  (label "IN" (at 113 100 0))'
+        + """
+  (sheet (at 130 95) (size 20 10) (uuid "s1")
+    (property "Sheetname" "AmpL" (at 0 0 0)) (property "Sheetfile" "amp.kicad_sch" (at 0 0 0))
+    (pin "OUT" input (at 130 100 180)))
+  (sheet (at 130 125) (size 20 10) (uuid "s2")
+    (property "Sheetname" "AmpR" (at 0 0 0)) (property "Sheetfile" "amp.kicad_sch" (at 0 0 0))
+    (pin "OUT" input (at 130 130 180)))
+)"""
+    )
+    instances = ('(instances (project "p" (path "/root-uuid/s1" (reference "R10") (unit 1))'
+                 ' (path "/root-uuid/s2" (reference "R11") (unit 1))))')
+    (tmp_path / "amp.kicad_sch").write_text(
+        '(kicad_sch (version 20230121) (generator eeschema)\n  (uuid "amp-uuid")\n'
+        + _LIB_SYMBOLS
+        + _resistor("R10", 60, 53.81, instances=instances)
+        + _gnd(60, 57.62, ref="#PWR02")
+        + _wire(50, 50, 70, 50)
+        + '\n  (junction (at 60 50) (diameter 0))'
+        + '\n  (hierarchical_label "OUT" input (at 50 50 180))\n)'
+    )
+    return root
+
+
+def test_parse_schematic_connectivity(hierarchical_schematic: Path):
+    netlist = parse_schematic(hierarchical_schematic)
+
+    assert sorted(fp.ref for fp in netlist.footprints) == ["R1", "R10", "R11", "R2"]
+    assert netlist.footprint_by_ref("R2").lib_id == "Resistor_SMD:R_0603"
+
+    assert netlist.get_net("IN").connected_pads == ["R1-1", "R2-1"]
+    assert netlist.get_net("GND").connected_pads == ["R1-2", "R10-2", "R11-2"]
+    # The sheet pin joins the parent wire to the hierarchical label in AmpL only
+    assert netlist.get_net("/AmpL/OUT").connected_pads == ["R2-2", "R10-1"]
+    assert netlist.get_net("/AmpR/OUT").connected_pads == ["R11-1"]
+
+    r2_pads = {pc.pad_name: pc.net_name for pc in netlist.footprint_by_ref("R2").pad_connections}
+    assert r2_pads == {"1": "IN", "2": "/AmpL/OUT"}
+
+
+def test_incremental_reparse(hierarchical_schematic: Path):
+    parser = SchematicParser()
+    parser.parse(hierarchical_schematic)
+    assert parser.last_stats["parsed"] == 2
+
+    netlist = parser.parse(hierarchical_schematic)
+    assert parser.last_stats["parsed"] == 0
+    assert parser.last_stats["reused"] == 2
+    assert netlist.get_net("GND") is not None
+
+    amp = hierarchical_schematic.parent / "amp.kicad_sch"
+    amp.write_text(amp.read_text().replace('(junction (at 60 50) (diameter 0))', ''))
+    netlist = parser.parse(hierarchical_schematic)
+    assert parser.last_stats["parsed"] == 1
+    # Without the junction R10 pin 1 no longer touches the wire
+    assert netlist.get_net("/AmpL/OUT").connected_pads == ["R2-2"]
+
+
+def test_sexpr_chunk_boundaries():
+    text = '(kicad_sch (label "a \\"quoted\\" (label)" (at 1.5 2 0)) (wire (pts (xy 1 2) (xy 3 4))))'
+    expected = list(iter_elements(io.StringIO(text)))
+    for chunk_size in (1, 2, 5, 13):
+        assert list(iter_elements(io.StringIO(text), chunk_size=chunk_size)) == expected
+    assert expected[1] == ["label", 'a "quoted" (label)', ["at", "1.5", "2", "0"]]
+
+
+def _chain(count):
+    """Resistors R1..Rn chained N0-R1-N1-R2-N2 ..."""
+    return [
+        FootprintData(
+            ref=f"R{i + 1}",
+            value="10k",
+            lib_id="Device:R_0603",
+            pad_connections=[PadConnection("1", f"N{i}"), PadConnection("2", f"N{i + 1}")],
+        )
+        for i in range(count)
+    ]
+
+
+def test_netlist_index_lookups():
+    netlist = Netlist.from_footprints(_chain(1000))  # 2,000 pads
+
+    assert len(netlist.nets) == 1001
+    assert netlist.get_net("N5").connected_pads == ["R5-2", "R6-1"]
+    assert netlist.footprint_by_ref("R999").pad_connections[1].net_name == "N999"
+    assert netlist.net_of_pad("R10", "2") == "N10"
+    assert netlist.pads_of_net("N10") == [("R10", "2"), ("R11", "1")]
+    assert netlist.net_id("N0") == 0
+    assert netlist.get_net("missing") is None
+    assert netlist.footprint_by_ref("missing") is None
+
+    index = netlist.index
+    first = index.pad_offsets[2]
+    assert list(index.pad_net_ids[first:index.pad_offsets[3]]) == [netlist.net_id("N2"), netlist.net_id("N3")]
+
+
+def test_netlist_index_tracks_list_changes():
+    netlist = Netlist.from_footprints(_chain(2))
+    assert netlist.footprint_by_ref("R3") is None
+
+    netlist.footprints.append(FootprintData("R3", "1k", "Device:R_0603", [PadConnection("1", "N2")]))
+    netlist.nets.append(NetData(name="EXTRA"))
+    assert netlist.footprint_by_ref("R3").value == "1k"
+    assert netlist.pads_of_net("N2") == [("R2", "2"), ("R3", "1")]
+    assert netlist.get_net("EXTRA") is netlist.nets[-1]
+
+    netlist.footprints[0].pad_connections[0].net_name = "IN"
+    netlist.invalidate_index()
+    assert netlist.net_of_pad("R1", "1") == "IN"